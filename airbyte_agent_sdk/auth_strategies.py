@@ -286,10 +286,12 @@ class TokenRefreshResult:
         tokens: Dictionary containing access_token, refresh_token, token_type
         extracted_values: Optional dictionary of values extracted from token response
             for server variable substitution (e.g., instance_url for Salesforce)
+        expires_in: Access token lifetime in seconds, if the token endpoint reported it
     """
 
     tokens: dict[str, str]
     extracted_values: dict[str, str] | None = None
+    expires_in: float | None = None
 
 
 class AuthStrategy(ABC):
@@ -1130,7 +1132,14 @@ class OAuth2TokenRefresher:
             if extracted:
                 extracted_values = extracted
 
-        return TokenRefreshResult(tokens=tokens, extracted_values=extracted_values)
+        expires_in: float | None = None
+        try:
+            if response_data.get("expires_in") is not None:
+                expires_in = float(response_data["expires_in"])
+        except (TypeError, ValueError):
+            logger.debug("Ignoring non-numeric 'expires_in' in token response")
+
+        return TokenRefreshResult(tokens=tokens, extracted_values=extracted_values, expires_in=expires_in)
 
 
 class AuthStrategyFactory:
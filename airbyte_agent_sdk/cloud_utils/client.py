@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from datetime import datetime, timedelta
+from collections.abc import Mapping
 from typing import Any
 
 import httpx
 
+from airbyte_agent_sdk.constants import DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_KEEPALIVE_CONNECTIONS
 from airbyte_agent_sdk.errors import ConnectorAmbiguityError, ConnectorNotFoundError
 from airbyte_agent_sdk.http.exceptions import (
     AuthenticationError,
@@ -15,6 +17,16 @@ from airbyte_agent_sdk.http.exceptions import (
     HTTPStatusError,
     RateLimitError,
 )
+from airbyte_agent_sdk.http_client import retry_after_seconds, retry_delay
+from airbyte_agent_sdk.schema.extensions import RetryConfig
+from airbyte_agent_sdk.token_manager import TokenGrant, TokenManager
+from airbyte_agent_sdk.types import Action
+
+# Actions that only read, so resending one the server may already have processed is harmless
+_READ_ACTIONS = frozenset({Action.GET, Action.LIST, Action.API_SEARCH, Action.DOWNLOAD})
+
+# Errors raised before the request was sent, so no action can have been processed
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
 
 
 def _raise_with_body(response: httpx.Response) -> None:
@@ -125,6 +137,9 @@ class AirbyteCloudClient:
         client_id: str,
         client_secret: str,
         organization_id: str | None = None,
+        retry_config: RetryConfig | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     ):
         """Initialize AirbyteCloudClient.
 
@@ -132,6 +147,11 @@ class AirbyteCloudClient:
             client_id: Airbyte client ID for authentication
             client_secret: Airbyte client secret for authentication
             organization_id: Optional Airbyte organization ID for multi-org request routing
+            retry_config: Retry configuration for connector execution requests, with the
+                same semantics as the local HTTPClient (429/5xx, timeouts, network errors).
+                If None, uses default RetryConfig.
+            max_connections: Maximum number of concurrent connections to the cloud API
+            max_keepalive_connections: Maximum number of idle connections kept open for reuse
         """
         self._client_id = client_id
         self._client_secret = client_secret
@@ -142,12 +162,15 @@ class AirbyteCloudClient:
         # intended for end-user SDKs — only for local development and testing.
         self.API_BASE_URL = os.environ.get("SDK_DEV_ADP_API_HOST", "").rstrip("/") or self.DEFAULT_API_BASE_URL
 
-        # Token cache (instance-level)
-        self._cached_token: str | None = None
-        self._token_expires_at: datetime | None = None
+        # Token cache (instance-level): concurrent callers share one token request,
+        # and the token is renewed in the background shortly before it expires
+        self.token_manager = TokenManager(self._fetch_bearer_token, expiry_margin=60.0, name="Airbyte Cloud token")
+        self.retry_config = retry_config or RetryConfig()
+        self.retry_count = 0
         self._http_client = httpx.AsyncClient(
             timeout=httpx.Timeout(300.0),  # 5 minute timeout
             follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
         )
 
     def _build_headers(self, token: str | None = None) -> dict[str, str]:
@@ -166,7 +189,7 @@ class AirbyteCloudClient:
 
         Caches the token and only requests a new one when the cached token
         is expired or missing. Adds a 60-second buffer before expiration
-        to avoid edge cases.
+        to avoid edge cases. Concurrent callers share a single token request.
 
         Returns:
             Bearer token string
@@ -179,15 +202,12 @@ class AirbyteCloudClient:
             token = await client.get_bearer_token()
             # Use token in Authorization header: f"Bearer {token}"
         """
-        # Check if we have a cached token that hasn't expired
-        if self._cached_token and self._token_expires_at:
-            # Add 60 second buffer before expiration to avoid edge cases
-            now = datetime.now()
-            if now < self._token_expires_at:
-                # Token is still valid, return cached version
-                return self._cached_token
-
-        # Token is missing or expired, fetch a new one
+        token = await self.token_manager.get()
+        assert token is not None  # _fetch_bearer_token always returns a grant or raises
+        return token
+
+    async def _fetch_bearer_token(self) -> TokenGrant:
+        """Request a new application token (TokenManager fetch function)."""
         url = f"{self.API_BASE_URL}/api/v1/account/applications/token"
         request_body = {
             "client_id": self._client_id,
@@ -204,14 +224,9 @@ class AirbyteCloudClient:
 
         data = response.json()
         access_token = data["access_token"]
-        expires_in = 15 * 60  # default 15 min expiry time * 60 seconds
+        expires_in = data.get("expires_in") or 15 * 60  # default 15 min expiry time * 60 seconds
 
-        # Calculate expiration time with 60 second buffer
-        expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
-        self._cached_token = access_token
-        self._token_expires_at = expires_at
-
-        return access_token
+        return TokenGrant(value=access_token, expires_in=float(expires_in))
 
     async def get_connector_id(
         self,
@@ -483,6 +498,13 @@ class AirbyteCloudClient:
     ) -> dict[str, Any]:
         """Execute a connector operation.
 
+        Transient failures (retryable status codes, timeouts, network errors) are
+        retried according to ``retry_config``. Other actions (create, update,
+        delete, ...) may have been applied even if the call failed, so they are
+        only retried when the failure proves the server did not process them:
+        the request could not be sent, or the API answered 429, or 503 with a
+        Retry-After header.
+
         Args:
             connector_id: Connector UUID (source ID)
             entity: Entity name (e.g., "customers", "invoices")
@@ -507,20 +529,75 @@ class AirbyteCloudClient:
                 params={"limit": 10}
             )
         """
-        token = await self.get_bearer_token()
         url = f"{self.API_BASE_URL}/api/v1/integrations/connectors/{connector_id}/execute"
-        headers = self._build_headers(token=token)
         request_body = {
             "entity": entity,
             "action": action,
             "params": params,
         }
 
-        response = await self._http_client.post(url, json=request_body, headers=headers)
+        response = await self._post_with_retries(url, request_body, idempotent=action in _READ_ACTIONS)
         _raise_with_body(response)
 
         return response.json()
 
+    async def _post_with_retries(self, url: str, request_body: dict[str, Any], *, idempotent: bool) -> httpx.Response:
+        """POST an authenticated request, retrying per ``retry_config``.
+
+        Retries retryable status codes (honouring Retry-After), timeouts and network
+        errors with exponential backoff. A 401 refreshes the bearer token once and
+        resends without counting as an attempt.
+
+        Args:
+            url: Request URL
+            request_body: JSON body
+            idempotent: Whether the request is safe to resend after it may have
+                been processed. If not, only failures that prove it was not
+                (connection errors, 429, 503 with Retry-After) are retried.
+
+        Returns:
+            The final response, which may still be an error response
+        """
+        token_refreshed = False
+        attempt = 0
+        while True:
+            token = await self.get_bearer_token()
+            try:
+                response = await self._http_client.post(url, json=request_body, headers=self._build_headers(token=token))
+            except httpx.TimeoutException as e:
+                if not self.retry_config.retry_on_timeout or attempt >= self.retry_config.max_attempts - 1:
+                    raise
+                if not idempotent and not isinstance(e, _NOT_SENT_ERRORS):
+                    raise
+                response_headers: Mapping[str, str] = {}
+            except httpx.NetworkError as e:
+                if not self.retry_config.retry_on_network_error or attempt >= self.retry_config.max_attempts - 1:
+                    raise
+                if not idempotent and not isinstance(e, _NOT_SENT_ERRORS):
+                    raise
+                response_headers = {}
+            else:
+                if response.status_code == 401 and not token_refreshed:
+                    # The cached token may have been revoked or expired early
+                    token_refreshed = True
+                    await self.token_manager.refresh(stale=token)
+                    continue
+                if response.status_code not in self.retry_config.retry_on_status_codes or attempt >= self.retry_config.max_attempts - 1:
+                    return response
+                if not idempotent and not self._rejected_unprocessed(response):
+                    return response
+                response_headers = response.headers
+
+            await asyncio.sleep(retry_delay(self.retry_config, attempt, response_headers))
+            self.retry_count += 1
+            attempt += 1
+
+    def _rejected_unprocessed(self, response: httpx.Response) -> bool:
+        """Whether an error response shows the request was turned away before being processed."""
+        if response.status_code == 429:
+            return True
+        return response.status_code == 503 and retry_after_seconds(self.retry_config, response.headers) is not None
+
     async def ask_workspace(self, workspace_name: str, prompt: str) -> dict[str, Any]:
         """Ask a natural-language question across all connectors in a workspace.
 
@@ -806,4 +883,5 @@ class AirbyteCloudClient:
 
         Call this when you're done using the client to clean up resources.
         """
+        await self.token_manager.aclose()
         await self._http_client.aclose()
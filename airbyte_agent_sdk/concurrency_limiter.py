@@ -0,0 +1,201 @@
+"""Adaptive concurrency limiting for HTTP clients.
+
+An ``AdaptiveConcurrencyLimiter`` caps how many requests a client has on the
+wire and tunes that cap with AIMD (additive increase, multiplicative decrease),
+the same control loop TCP uses for its congestion window:
+
+- every successful response while the window is full grows the limit by
+  ``1 / limit``, i.e. by one request per window's worth of successes;
+- a throttling response (429, 503) or a timeout multiplies the limit by
+  ``backoff_ratio``, at most once per window: responses to requests sent
+  before the last decrease don't shrink it again;
+- the p95 latency of recent successes is compared to a baseline of healthy
+  p95s, and a p95 above ``latency_tolerance`` times the baseline is treated
+  as a throttling signal.
+
+Requests over the limit wait in FIFO order. The window, queue depth and
+adjustment counts are available from ``get_stats()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+_LATENCY_CHECK_SAMPLES = 20
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter for one or more HTTP clients.
+
+    Bound to the event loop it is first used on.
+
+    Args:
+        initial_limit: Concurrent requests allowed before any feedback
+        min_limit: Lower bound for the limit
+        max_limit: Upper bound for the limit, or None for no bound. The limit
+            only grows while the window is full, and each client sending
+            through the limiter keeps at most its ``max_connections`` requests
+            in flight, so the limit stays within what the clients can send.
+        backoff_ratio: Factor applied to the limit on a throttling signal
+        latency_tolerance: p95 latency, as a multiple of the healthy baseline,
+            above which the limit is decreased
+        latency_window: Number of recent successful request latencies the p95 is
+            computed over
+        overload_status_codes: Status codes treated as throttling signals
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_window: int = 100,
+        overload_status_codes: frozenset[int] = frozenset({429, 503}),
+    ):
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.overload_status_codes = overload_status_codes
+        self._limit = float(max(initial_limit, min_limit))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latencies: deque[float] = deque(maxlen=max(latency_window, _LATENCY_CHECK_SAMPLES))
+        self._samples_since_check = 0
+        self._p95: float | None = None
+        self._baseline_p95: float | None = None
+        self._last_decrease = 0.0
+
+        self.increases = 0
+        self.decreases = 0
+        self.queued_count = 0
+        self.total_queue_delay = 0.0
+        self.max_queue_depth = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> float:
+        """Wait for a slot. Returns the monotonic send time to pass to ``release``."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return time.monotonic()
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued_count += 1
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        queued_at = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled; pass it on
+                self._in_flight -= 1
+                self._wake_waiters()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        now = time.monotonic()
+        self.total_queue_delay += now - queued_at
+        return now
+
+    def release(self, started_at: float, *, ok: bool, overloaded: bool = False) -> None:
+        """Return a slot and feed the request's outcome into the limit.
+
+        Args:
+            started_at: Value returned by ``acquire``
+            ok: The request succeeded; its latency is sampled
+            overloaded: The API signalled overload (throttling status or timeout)
+        """
+        saturated = self._in_flight >= self.limit or bool(self._waiters)
+        self._in_flight -= 1
+        now = time.monotonic()
+        if overloaded:
+            self._decrease(started_at, now)
+        elif ok:
+            self._latencies.append(now - started_at)
+            self._samples_since_check += 1
+            if self._samples_since_check >= _LATENCY_CHECK_SAMPLES and self._latency_degraded():
+                self._decrease(started_at, now)
+            elif saturated:
+                self._increase()
+        self._wake_waiters()
+
+    def _increase(self) -> None:
+        previous = self.limit
+        self._limit += 1.0 / self._limit
+        if self.max_limit is not None:
+            self._limit = min(self._limit, float(self.max_limit))
+        if self.limit > previous:
+            self.increases += 1
+
+    def _decrease(self, started_at: float, now: float) -> None:
+        # Requests sent before the last decrease were admitted under the old limit
+        if started_at < self._last_decrease:
+            return
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        self._last_decrease = now
+        self.decreases += 1
+        # Latencies observed under the old limit say nothing about the new one
+        self._latencies.clear()
+        self._samples_since_check = 0
+
+    def _latency_degraded(self) -> bool:
+        """Recompute the p95 and compare it to the healthy baseline."""
+        self._samples_since_check = 0
+        ordered = sorted(self._latencies)
+        p95 = ordered[int(0.95 * (len(ordered) - 1))]
+        self._p95 = p95
+        if self._baseline_p95 is None:
+            self._baseline_p95 = p95
+            return False
+        if p95 > self._baseline_p95 * self.latency_tolerance:
+            return True
+        # Follow the healthy p95 down immediately and up very slowly, so a latency
+        # that creeps up as the limit grows still registers against the baseline
+        self._baseline_p95 = min(p95, 0.99 * self._baseline_p95 + 0.01 * p95)
+        return False
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get limiter statistics as a dictionary."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": len(self._waiters),
+            "max_queue_depth": self.max_queue_depth,
+            "queued_count": self.queued_count,
+            "total_queue_delay": self.total_queue_delay,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "p95_latency": self._p95,
+            "baseline_p95_latency": self._baseline_p95,
+        }
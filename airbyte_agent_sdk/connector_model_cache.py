@@ -0,0 +1,157 @@
+"""On-disk cache of converted ConnectorModel objects.
+
+Converting a connector.yaml into a ConnectorModel (YAML parsing, $ref
+resolution, OpenAPI conversion) takes from hundreds of milliseconds to several
+seconds for the larger specs. The result only depends on the YAML content and
+the SDK code that converts it, so it is cached on disk, keyed by a hash of both.
+Editing the YAML, upgrading the SDK, or changing the model/loader source (in a
+development checkout the version string does not change) produces a new key.
+
+Cache entries are plain JSON: the model's fields, plus the typed OpenAPI spec
+and example questions that ConnectorModel holds as `Any`. Loading validates
+them back into the pydantic models, so a cache entry is data only and never
+executes code, and a tampered or stale entry fails validation and is dropped.
+
+Environment variables:
+    AIRBYTE_CONNECTOR_MODEL_CACHE: Set to "false", "0" or "no" to disable the cache.
+    AIRBYTE_CONNECTOR_MODEL_CACHE_DIR: Override the cache directory
+        (default: ~/.airbyte/connector-sdk/cache/connector-models).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+from airbyte_agent_sdk.constants import SDK_VERSION
+
+from .schema.base import ExampleQuestions
+from .schema.connector import OpenAPIConnector
+from .types import ConnectorModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".airbyte" / "connector-sdk" / "cache" / "connector-models"
+
+# Bump when the cache entry layout changes
+_CACHE_FORMAT_VERSION = "2"
+
+_SDK_DIR = Path(__file__).parent
+
+
+@lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    """Hash of the modules that define and build ConnectorModel."""
+    digest = hashlib.sha256()
+    for path in [_SDK_DIR / "types.py", _SDK_DIR / "connector_model_loader.py", *sorted((_SDK_DIR / "schema").glob("*.py"))]:
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(path.name.encode())
+    return digest.hexdigest()
+
+
+def get_cache_dir() -> Path | None:
+    """Return the cache directory, or None when the cache is disabled."""
+    if os.getenv("AIRBYTE_CONNECTOR_MODEL_CACHE", "").lower() in ("false", "0", "no"):
+        return None
+    override = os.getenv("AIRBYTE_CONNECTOR_MODEL_CACHE_DIR")
+    return Path(override) if override else DEFAULT_CACHE_DIR
+
+
+def cache_key(content: bytes) -> str:
+    """Return the cache key for a connector definition's raw bytes."""
+    digest = hashlib.sha256()
+    for part in (
+        _CACHE_FORMAT_VERSION,
+        SDK_VERSION,
+        _code_fingerprint(),
+        pydantic.VERSION,
+        f"{sys.version_info.major}.{sys.version_info.minor}",
+    ):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def _to_json(model: ConnectorModel) -> bytes:
+    def dump(value: Any) -> Any:
+        return value.model_dump(mode="json", by_alias=True, round_trip=True) if value is not None else None
+
+    return json.dumps(
+        {
+            "model": model.model_dump(mode="json", round_trip=True, exclude={"openapi_spec", "example_questions"}),
+            "openapi_spec": dump(model.openapi_spec),
+            "example_questions": dump(model.example_questions),
+        },
+        separators=(",", ":"),
+    ).encode()
+
+
+def _from_json(data: bytes) -> ConnectorModel:
+    entry = json.loads(data)
+    model = ConnectorModel.model_validate(entry["model"])
+    if entry["openapi_spec"] is not None:
+        model.openapi_spec = OpenAPIConnector.model_validate(entry["openapi_spec"])
+    if entry["example_questions"] is not None:
+        model.example_questions = ExampleQuestions.model_validate(entry["example_questions"])
+    return model
+
+
+def load_cached_model(content: bytes) -> ConnectorModel | None:
+    """Return the cached ConnectorModel for this definition, or None on a miss.
+
+    Unreadable or corrupt entries are treated as misses and removed.
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    path = cache_dir / f"{cache_key(content)}.json"
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        return _from_json(data)
+    except Exception as e:
+        logger.debug(f"Could not read connector model cache entry {path}: {e}")
+    try:
+        path.unlink()
+    except OSError:
+        pass
+    return None
+
+
+def store_cached_model(content: bytes, model: ConnectorModel) -> None:
+    """Write a ConnectorModel to the cache. Failures are logged and ignored."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return
+    path = cache_dir / f"{cache_key(content)}.json"
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        data = _to_json(model)
+        # Atomic write so concurrent loaders never see a partial entry (mkstemp files are owner-only)
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+    except Exception as e:
+        logger.debug(f"Could not write connector model cache entry {path}: {e}")
@@ -14,6 +14,7 @@ from airbyte_agent_sdk.constants import (
     OPENAPI_VERSION_PREFIX,
 )
 
+from .connector_model_cache import load_cached_model, store_cached_model
 from .schema import OpenAPIConnector
 from .schema.components import GraphQLBodyConfig, RequestBody
 from .schema.security import AuthConfigFieldSpec, AuthConfigSpec
@@ -534,6 +535,9 @@ def convert_openapi_to_connector_model(spec: OpenAPIConnector) -> ConnectorModel
             # Extract x-airbyte-no-pagination justification (list-action opt-out)
             no_pagination = getattr(operation, "x_airbyte_no_pagination", None)
 
+            # Extract x-airbyte-pagination strategy (list-action page following)
+            pagination = getattr(operation, "x_airbyte_pagination", None)
+
             # Extract preferred_for_check flag
             preferred_for_check = getattr(operation, "x_airbyte_preferred_for_check", None) or False
 
@@ -567,6 +571,7 @@ def convert_openapi_to_connector_model(spec: OpenAPIConnector) -> ConnectorModel
                 file_field=file_field,
                 untested=untested,
                 no_pagination=no_pagination,
+                pagination=pagination,
                 preferred_for_check=preferred_for_check,
                 upload_file_param=upload_file_param,
                 no_content_response=has_no_content_response,
@@ -587,9 +592,10 @@ def convert_openapi_to_connector_model(spec: OpenAPIConnector) -> ConnectorModel
     for entity_name, endpoints_dict in entities_map.items():
         actions = list(endpoints_dict.keys())
 
-        # Get schema, stream_name, and ai_hints from components if available
+        # Get schema, stream_name, cache_ttl, and ai_hints from components if available
         schema = None
         entity_stream_name = None
+        entity_cache_ttl = None
         entity_ai_hints = None
         if spec.components:
             # Look for a schema matching the entity name
@@ -597,6 +603,7 @@ def convert_openapi_to_connector_model(spec: OpenAPIConnector) -> ConnectorModel
                 if schema_def.x_airbyte_entity_name == entity_name or schema_name.lower() == entity_name.lower():
                     schema = schema_def.model_dump(by_alias=True)
                     entity_stream_name = schema_def.x_airbyte_stream_name
+                    entity_cache_ttl = schema_def.x_airbyte_cache_ttl
                     if schema_def.x_airbyte_ai_hints is not None:
                         entity_ai_hints = schema_def.x_airbyte_ai_hints.model_dump(by_alias=True)
                     break
@@ -604,6 +611,7 @@ def convert_openapi_to_connector_model(spec: OpenAPIConnector) -> ConnectorModel
         entity = EntityDefinition(
             name=entity_name,
             stream_name=entity_stream_name,
+            cache_ttl=entity_cache_ttl,
             actions=actions,
             endpoints=endpoints_dict,
             schema=schema,
@@ -638,6 +646,7 @@ def convert_openapi_to_connector_model(spec: OpenAPIConnector) -> ConnectorModel
         entities=entities,
         openapi_spec=spec,
         retry_config=retry_config,
+        rate_limit=spec.info.x_airbyte_rate_limit,
         search_field_paths=search_field_paths,
         example_questions=example_questions,
         server_variable_defaults=server_variable_defaults,
@@ -1101,13 +1110,17 @@ def _parse_security_scheme_to_option(scheme_name: str, scheme: Any) -> AuthOptio
     )
 
 
-def load_connector_model(definition_path: str | Path) -> ConnectorModel:
+def load_connector_model(definition_path: str | Path, *, use_cache: bool = True) -> ConnectorModel:
     """Load connector model from YAML definition file.
 
-    Loads an OpenAPI 3.1 connector definition from a YAML file.
+    Loads an OpenAPI 3.1 connector definition from a YAML file. Converted
+    models are cached on disk keyed by a hash of the file content, so repeated
+    loads of an unchanged definition skip parsing and conversion entirely
+    (see ``connector_model_cache``).
 
     Args:
         definition_path: Path to connector.yaml file
+        use_cache: Read and populate the on-disk model cache
 
     Returns:
         Parsed ConnectorModel
@@ -1121,10 +1134,19 @@ def load_connector_model(definition_path: str | Path) -> ConnectorModel:
     if not definition_path.exists():
         raise FileNotFoundError(f"Connector definition not found: {definition_path}")
 
+    try:
+        content = definition_path.read_bytes()
+    except Exception as e:
+        raise ConnectorModelLoaderError(f"Error reading definition file {definition_path}: {e}")
+
+    if use_cache:
+        cached = load_cached_model(content)
+        if cached is not None:
+            return cached
+
     # Load YAML with error handling
     try:
-        with open(definition_path) as f:
-            raw_definition = yaml.safe_load(f)
+        raw_definition = yaml.safe_load(content)
     except yaml.YAMLError as e:
         raise InvalidYAMLError(f"Invalid YAML syntax in {definition_path}: {e}")
     except Exception as e:
@@ -1137,4 +1159,7 @@ def load_connector_model(definition_path: str | Path) -> ConnectorModel:
         raise ValueError("Invalid connector.yaml: missing 'openapi' key. Only OpenAPI 3.1 format is supported.")
 
     spec = parse_openapi_spec(raw_definition)
-    return convert_openapi_to_connector_model(spec)
+    model = convert_openapi_to_connector_model(spec)
+    if use_cache:
+        store_cached_model(content, model)
+    return model
@@ -21,6 +21,7 @@ from airbyte_agent_sdk.schema.security import (
 )
 from airbyte_agent_sdk.schema.extensions import (
     EntityRelationshipConfig,
+    PaginationConfig,
 )
 from airbyte_agent_sdk.schema.base import (
     ExampleQuestions,
@@ -113,6 +114,7 @@ AirtableConnectorModel: ConnectorModel = ConnectorModel(
                     },
                     record_extractor='$.bases',
                     meta_extractor={'offset': '$.offset'},
+                    pagination=PaginationConfig(strategy='cursor', param='offset', next_field='offset'),
                 ),
             },
             entity_schema={
@@ -410,6 +412,7 @@ AirtableConnectorModel: ConnectorModel = ConnectorModel(
                     },
                     record_extractor='$.records',
                     meta_extractor={'offset': '$.offset'},
+                    pagination=PaginationConfig(strategy='cursor', param='offset', next_field='offset', limit_param='pageSize'),
                 ),
                 Action.GET: EndpointDefinition(
                     method='GET',
@@ -24,7 +24,7 @@ class AirtableAuthConfig(BaseModel):
 
 class Base(BaseModel):
     """An Airtable base (workspace)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -32,14 +32,14 @@ class Base(BaseModel):
 
 class BasesList(BaseModel):
     """Paginated list of bases"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bases: list[Base] | None = Field(default=None)
     offset: str | None = Field(default=None)
 
 class View(BaseModel):
     """A view in a table"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -47,7 +47,7 @@ class View(BaseModel):
 
 class TableField(BaseModel):
     """A field (column) in a table"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -56,7 +56,7 @@ class TableField(BaseModel):
 
 class Table(BaseModel):
     """A table within an Airtable base"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -66,13 +66,13 @@ class Table(BaseModel):
 
 class TablesList(BaseModel):
     """List of tables in a base"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     tables: list[Table] | None = Field(default=None)
 
 class Record(BaseModel):
     """A record (row) in an Airtable table"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     created_time: str | None = Field(default=None, alias="createdTime")
@@ -80,7 +80,7 @@ class Record(BaseModel):
 
 class RecordsList(BaseModel):
     """Paginated list of records"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     records: list[Record] | None = Field(default=None)
     offset: str | None = Field(default=None)
@@ -90,13 +90,13 @@ class RecordsList(BaseModel):
 
 class BasesListResultMeta(BaseModel):
     """Metadata for bases.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     offset: str | None = Field(default=None)
 
 class RecordsListResultMeta(BaseModel):
     """Metadata for records.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     offset: str | None = Field(default=None)
 
@@ -153,7 +153,7 @@ D = TypeVar('D')
 
 class BasesSearchData(BaseModel):
     """Search result data for bases entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the base"""
@@ -165,7 +165,7 @@ class BasesSearchData(BaseModel):
 
 class TablesSearchData(BaseModel):
     """Search result data for tables entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the table"""
@@ -183,7 +183,7 @@ class TablesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -195,7 +195,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
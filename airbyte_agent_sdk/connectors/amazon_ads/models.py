@@ -31,7 +31,7 @@ class Profile(BaseModel):
     """An advertising profile represents an advertiser's account in a specific marketplace.
 Profiles are used to scope API calls and manage advertising campaigns.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     profile_id: int | None = Field(default=None, alias="profileId")
     country_code: str | None = Field(default=None, alias="countryCode")
@@ -42,7 +42,7 @@ Profiles are used to scope API calls and manage advertising campaigns.
 
 class AccountInfo(BaseModel):
     """Information about the advertiser's account associated with a profile"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     marketplace_string_id: str | None = Field(default=None, alias="marketplaceStringId")
     id: str | None = Field(default=None)
@@ -55,7 +55,7 @@ class Portfolio(BaseModel):
     """A portfolio is a container for grouping campaigns together for organizational
 and budget management purposes.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     portfolio_id: Any | None = Field(default=None, alias="portfolioId")
     name: str | None = Field(default=None)
@@ -68,7 +68,7 @@ and budget management purposes.
 
 class PortfolioBudget(BaseModel):
     """Budget configuration for a portfolio"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: float | None = Field(default=None)
     currency_code: str | None = Field(default=None, alias="currencyCode")
@@ -81,7 +81,7 @@ class SponsoredProductCampaign(BaseModel):
 Campaigns contain ad groups, which contain ads and targeting settings.
 Note: The list endpoint (v3) and get endpoint (v2) return slightly different field formats.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     campaign_id: Any | None = Field(default=None, alias="campaignId")
     portfolio_id: Any | None = Field(default=None, alias="portfolioId")
@@ -103,7 +103,7 @@ Note: The list endpoint (v3) and get endpoint (v2) return slightly different fie
 
 class DynamicBiddingPlacementbiddingItem(BaseModel):
     """Nested schema for DynamicBidding.placementBidding_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     placement: str | None | None = Field(default=None, description="The placement type")
     """The placement type"""
@@ -112,14 +112,14 @@ class DynamicBiddingPlacementbiddingItem(BaseModel):
 
 class DynamicBidding(BaseModel):
     """Dynamic bidding settings for a campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     placement_bidding: list[DynamicBiddingPlacementbiddingItem] | None = Field(default=None, alias="placementBidding")
     strategy: str | None = Field(default=None)
 
 class CampaignBudget(BaseModel):
     """Budget configuration for a campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     budget_type: str | None = Field(default=None, alias="budgetType")
     budget: float | None = Field(default=None)
@@ -128,7 +128,7 @@ class SponsoredProductAdGroup(BaseModel):
     """An ad group within a Sponsored Products campaign. Ad groups contain ads and targeting
 settings and have a default bid that applies to all ads in the group.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_group_id: Any | None = Field(default=None, alias="adGroupId")
     campaign_id: Any | None = Field(default=None, alias="campaignId")
@@ -141,7 +141,7 @@ class SponsoredProductKeyword(BaseModel):
     """A keyword within a Sponsored Products ad group. Keywords are used in manual targeting
 campaigns to match shopper search queries.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     keyword_id: Any | None = Field(default=None, alias="keywordId")
     campaign_id: Any | None = Field(default=None, alias="campaignId")
@@ -156,7 +156,7 @@ class SponsoredProductProductAd(BaseModel):
     """A product ad within a Sponsored Products ad group. Product ads associate an
 advertised product (identified by ASIN or SKU) with an ad group.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_id: Any | None = Field(default=None, alias="adId")
     campaign_id: Any | None = Field(default=None, alias="campaignId")
@@ -168,7 +168,7 @@ advertised product (identified by ASIN or SKU) with an ad group.
 
 class SponsoredProductTargetExpressionItem(BaseModel):
     """Nested schema for SponsoredProductTarget.expression_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type", description="The expression type")
     """The expression type"""
@@ -177,7 +177,7 @@ class SponsoredProductTargetExpressionItem(BaseModel):
 
 class SponsoredProductTargetResolvedexpressionItem(BaseModel):
     """Nested schema for SponsoredProductTarget.resolvedExpression_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type", description="The resolved expression type")
     """The resolved expression type"""
@@ -188,7 +188,7 @@ class SponsoredProductTarget(BaseModel):
     """A targeting clause within a Sponsored Products ad group. Targeting clauses define
 product or category targeting for the ad group.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     target_id: Any | None = Field(default=None, alias="targetId")
     campaign_id: Any | None = Field(default=None, alias="campaignId")
@@ -204,7 +204,7 @@ class SponsoredProductNegativeKeyword(BaseModel):
     """A negative keyword within a Sponsored Products ad group. Negative keywords prevent
 ads from showing for specific search terms.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     keyword_id: Any | None = Field(default=None, alias="keywordId")
     campaign_id: Any | None = Field(default=None, alias="campaignId")
@@ -216,7 +216,7 @@ ads from showing for specific search terms.
 
 class SponsoredProductNegativeTargetResolvedexpressionItem(BaseModel):
     """Nested schema for SponsoredProductNegativeTarget.resolvedExpression_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type", description="The resolved expression type")
     """The resolved expression type"""
@@ -225,7 +225,7 @@ class SponsoredProductNegativeTargetResolvedexpressionItem(BaseModel):
 
 class SponsoredProductNegativeTargetExpressionItem(BaseModel):
     """Nested schema for SponsoredProductNegativeTarget.expression_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type", description="The expression type")
     """The expression type"""
@@ -236,7 +236,7 @@ class SponsoredProductNegativeTarget(BaseModel):
     """A negative targeting clause within a Sponsored Products ad group. Negative targeting
 clauses exclude specific products or categories from targeting.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     target_id: Any | None = Field(default=None, alias="targetId")
     campaign_id: Any | None = Field(default=None, alias="campaignId")
@@ -251,7 +251,7 @@ class SponsoredBrandsCampaign(BaseModel):
     """A Sponsored Brands campaign. Sponsored Brands campaigns help drive discovery and sales
 with creative ad experiences that appear in shopping results.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     campaign_id: Any | None = Field(default=None, alias="campaignId")
     name: str | None = Field(default=None)
@@ -273,7 +273,7 @@ class SponsoredBrandsAdGroup(BaseModel):
     """An ad group within a Sponsored Brands campaign. Ad groups organize ads and targeting
 within a campaign.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_group_id: Any | None = Field(default=None, alias="adGroupId")
     campaign_id: Any | None = Field(default=None, alias="campaignId")
@@ -287,61 +287,61 @@ within a campaign.
 
 class PortfoliosListResultMeta(BaseModel):
     """Metadata for portfolios.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class SponsoredProductCampaignsListResultMeta(BaseModel):
     """Metadata for sponsored_product_campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class SponsoredProductAdGroupsListResultMeta(BaseModel):
     """Metadata for sponsored_product_ad_groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class SponsoredProductKeywordsListResultMeta(BaseModel):
     """Metadata for sponsored_product_keywords.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class SponsoredProductProductAdsListResultMeta(BaseModel):
     """Metadata for sponsored_product_product_ads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class SponsoredProductTargetsListResultMeta(BaseModel):
     """Metadata for sponsored_product_targets.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class SponsoredProductNegativeKeywordsListResultMeta(BaseModel):
     """Metadata for sponsored_product_negative_keywords.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class SponsoredProductNegativeTargetsListResultMeta(BaseModel):
     """Metadata for sponsored_product_negative_targets.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class SponsoredBrandsCampaignsListResultMeta(BaseModel):
     """Metadata for sponsored_brands_campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class SponsoredBrandsAdGroupsListResultMeta(BaseModel):
     """Metadata for sponsored_brands_ad_groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
@@ -398,7 +398,7 @@ D = TypeVar('D')
 
 class ProfilesSearchData(BaseModel):
     """Search result data for profiles entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account_info: dict[str, Any] | None = None
     """"""
@@ -418,7 +418,7 @@ class ProfilesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -430,7 +430,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -41,13 +41,13 @@ class AmazonSellerPartnerReplicationConfig(BaseModel):
 
 class OrderAutomatedshippingsettings(BaseModel):
     """Automated shipping settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_automated_shipping_settings: bool | None = Field(default=None, alias="HasAutomatedShippingSettings")
 
 class OrderShippingaddress(BaseModel):
     """Shipping address for the order"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     city: str | None = Field(default=None, alias="City")
     state_or_region: str | None = Field(default=None, alias="StateOrRegion")
@@ -56,7 +56,7 @@ class OrderShippingaddress(BaseModel):
 
 class OrderDefaultshipfromlocationaddress(BaseModel):
     """Default ship-from address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, alias="Name")
     address_line1: str | None = Field(default=None, alias="AddressLine1")
@@ -67,14 +67,14 @@ class OrderDefaultshipfromlocationaddress(BaseModel):
 
 class OrderOrdertotal(BaseModel):
     """Total amount of the order"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class Order(BaseModel):
     """Amazon order object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amazon_order_id: str = Field(alias="AmazonOrderId")
     seller_order_id: str | None = Field(default=None, alias="SellerOrderId")
@@ -112,7 +112,7 @@ class Order(BaseModel):
 
 class OrdersListPayload(BaseModel):
     """Nested schema for OrdersList.payload"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     orders: list[Order] | None = Field(default=None, alias="Orders")
     next_token: str | None = Field(default=None, alias="NextToken", description="Pagination token for next page")
@@ -120,116 +120,116 @@ class OrdersListPayload(BaseModel):
 
 class OrdersList(BaseModel):
     """Paginated list of orders"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     payload: OrdersListPayload | None = Field(default=None)
 
 class OrderItemBuyerrequestedcancel(BaseModel):
     """Buyer cancellation request information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     is_buyer_requested_cancel: str | None = Field(default=None, alias="IsBuyerRequestedCancel")
     buyer_cancel_reason: str | None = Field(default=None, alias="BuyerCancelReason")
 
 class OrderItemItemtax(BaseModel):
     """Item tax"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemPointsgrantedPointsmonetaryvalue(BaseModel):
     """Nested schema for OrderItemPointsgranted.PointsMonetaryValue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemPointsgranted(BaseModel):
     """Points granted for the purchase"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     points_number: int | None = Field(default=None, alias="PointsNumber")
     points_monetary_value: OrderItemPointsgrantedPointsmonetaryvalue | None = Field(default=None, alias="PointsMonetaryValue")
 
 class OrderItemPromotiondiscount(BaseModel):
     """Promotion discount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemItemprice(BaseModel):
     """Item price"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemCodfeediscount(BaseModel):
     """Cash on delivery fee discount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemProductinfo(BaseModel):
     """Product information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     number_of_items: str | None = Field(default=None, alias="NumberOfItems")
 
 class OrderItemTaxcollection(BaseModel):
     """Tax collection information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     model: str | None = Field(default=None, alias="Model")
     responsible_party: str | None = Field(default=None, alias="ResponsibleParty")
 
 class OrderItemCodfee(BaseModel):
     """Cash on delivery fee"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemPromotiondiscounttax(BaseModel):
     """Promotion discount tax"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemShippingtax(BaseModel):
     """Shipping tax"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemShippingdiscounttax(BaseModel):
     """Shipping discount tax"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemBuyerinfoBuyercustomizedinfo(BaseModel):
     """Nested schema for OrderItemBuyerinfo.BuyerCustomizedInfo"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     customized_url: str | None = Field(default=None, alias="CustomizedURL")
 
 class OrderItemBuyerinfoGiftwrapprice(BaseModel):
     """Nested schema for OrderItemBuyerinfo.GiftWrapPrice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemBuyerinfo(BaseModel):
     """Buyer information for the item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     buyer_customized_info: OrderItemBuyerinfoBuyercustomizedinfo | None = Field(default=None, alias="BuyerCustomizedInfo")
     gift_message_text: str | None = Field(default=None, alias="GiftMessageText")
@@ -238,21 +238,21 @@ class OrderItemBuyerinfo(BaseModel):
 
 class OrderItemShippingprice(BaseModel):
     """Shipping price"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItemShippingdiscount(BaseModel):
     """Shipping discount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     amount: str | None = Field(default=None, alias="Amount")
 
 class OrderItem(BaseModel):
     """Amazon order item object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     order_item_id: str = Field(alias="OrderItemId")
     amazon_order_id: str | None = Field(default=None, alias="AmazonOrderId")
@@ -290,7 +290,7 @@ class OrderItem(BaseModel):
 
 class OrderItemsListPayload(BaseModel):
     """Nested schema for OrderItemsList.payload"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amazon_order_id: str | None = Field(default=None, alias="AmazonOrderId")
     order_items: list[OrderItem] | None = Field(default=None, alias="OrderItems")
@@ -298,34 +298,34 @@ class OrderItemsListPayload(BaseModel):
 
 class OrderItemsList(BaseModel):
     """Paginated list of order items"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     payload: OrderItemsListPayload | None = Field(default=None)
 
 class FinancialEventGroupBeginningbalance(BaseModel):
     """Beginning balance"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     currency_amount: float | None = Field(default=None, alias="CurrencyAmount")
 
 class FinancialEventGroupConvertedtotal(BaseModel):
     """Converted total"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     currency_amount: float | None = Field(default=None, alias="CurrencyAmount")
 
 class FinancialEventGroupOriginaltotal(BaseModel):
     """Original total in seller's currency"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     currency_amount: float | None = Field(default=None, alias="CurrencyAmount")
 
 class FinancialEventGroup(BaseModel):
     """A financial event group"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     financial_event_group_id: str = Field(alias="FinancialEventGroupId")
     processing_status: str | None = Field(default=None, alias="ProcessingStatus")
@@ -341,47 +341,47 @@ class FinancialEventGroup(BaseModel):
 
 class FinancialEventGroupListPayload(BaseModel):
     """Nested schema for FinancialEventGroupList.payload"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     financial_event_group_list: list[FinancialEventGroup] | None = Field(default=None, alias="FinancialEventGroupList")
     next_token: str | None = Field(default=None, alias="NextToken")
 
 class FinancialEventGroupList(BaseModel):
     """Paginated list of financial event groups"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     payload: FinancialEventGroupListPayload | None = Field(default=None)
 
 class FinancialEventsServicefeeeventlistItemFeelistItemFeeamount(BaseModel):
     """Nested schema for FinancialEventsServicefeeeventlistItemFeelistItem.FeeAmount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     currency_amount: float | None = Field(default=None, alias="CurrencyAmount")
 
 class FinancialEventsServicefeeeventlistItemFeelistItem(BaseModel):
     """Nested schema for FinancialEventsServicefeeeventlistItem.FeeList_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     fee_type: str | None = Field(default=None, alias="FeeType")
     fee_amount: FinancialEventsServicefeeeventlistItemFeelistItemFeeamount | None = Field(default=None, alias="FeeAmount")
 
 class FinancialEventsServicefeeeventlistItem(BaseModel):
     """Nested schema for FinancialEvents.ServiceFeeEventList_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     fee_list: list[FinancialEventsServicefeeeventlistItemFeelistItem] | None = Field(default=None, alias="FeeList")
 
 class FinancialEventsDebtrecoveryeventlistItemChargeinstrumentlistItemAmount(BaseModel):
     """Nested schema for FinancialEventsDebtrecoveryeventlistItemChargeinstrumentlistItem.Amount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     currency_amount: float | None = Field(default=None, alias="CurrencyAmount")
 
 class FinancialEventsDebtrecoveryeventlistItemChargeinstrumentlistItem(BaseModel):
     """Nested schema for FinancialEventsDebtrecoveryeventlistItem.ChargeInstrumentList_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     description: str | None = Field(default=None, alias="Description")
     tail: str | None = Field(default=None, alias="Tail")
@@ -389,28 +389,28 @@ class FinancialEventsDebtrecoveryeventlistItemChargeinstrumentlistItem(BaseModel
 
 class FinancialEventsDebtrecoveryeventlistItemRecoveryamount(BaseModel):
     """Nested schema for FinancialEventsDebtrecoveryeventlistItem.RecoveryAmount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     currency_amount: float | None = Field(default=None, alias="CurrencyAmount")
 
 class FinancialEventsDebtrecoveryeventlistItemDebtrecoveryitemlistItemOriginalamount(BaseModel):
     """Nested schema for FinancialEventsDebtrecoveryeventlistItemDebtrecoveryitemlistItem.OriginalAmount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     currency_amount: float | None = Field(default=None, alias="CurrencyAmount")
 
 class FinancialEventsDebtrecoveryeventlistItemDebtrecoveryitemlistItemRecoveryamount(BaseModel):
     """Nested schema for FinancialEventsDebtrecoveryeventlistItemDebtrecoveryitemlistItem.RecoveryAmount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="CurrencyCode")
     currency_amount: float | None = Field(default=None, alias="CurrencyAmount")
 
 class FinancialEventsDebtrecoveryeventlistItemDebtrecoveryitemlistItem(BaseModel):
     """Nested schema for FinancialEventsDebtrecoveryeventlistItem.DebtRecoveryItemList_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     recovery_amount: FinancialEventsDebtrecoveryeventlistItemDebtrecoveryitemlistItemRecoveryamount | None = Field(default=None, alias="RecoveryAmount")
     original_amount: FinancialEventsDebtrecoveryeventlistItemDebtrecoveryitemlistItemOriginalamount | None = Field(default=None, alias="OriginalAmount")
@@ -419,7 +419,7 @@ class FinancialEventsDebtrecoveryeventlistItemDebtrecoveryitemlistItem(BaseModel
 
 class FinancialEventsDebtrecoveryeventlistItem(BaseModel):
     """Nested schema for FinancialEvents.DebtRecoveryEventList_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     debt_recovery_type: str | None = Field(default=None, alias="DebtRecoveryType")
     recovery_amount: FinancialEventsDebtrecoveryeventlistItemRecoveryamount | None = Field(default=None, alias="RecoveryAmount")
@@ -428,7 +428,7 @@ class FinancialEventsDebtrecoveryeventlistItem(BaseModel):
 
 class FinancialEvents(BaseModel):
     """A collection of financial events grouped by type"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     shipment_event_list: list[dict[str, Any]] | None = Field(default=None, alias="ShipmentEventList")
     shipment_settle_event_list: list[dict[str, Any]] | None = Field(default=None, alias="ShipmentSettleEventList")
@@ -468,27 +468,27 @@ class FinancialEvents(BaseModel):
 
 class FinancialEventsResponsePayload(BaseModel):
     """Nested schema for FinancialEventsResponse.payload"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     financial_events: FinancialEvents | None = Field(default=None, alias="FinancialEvents")
     next_token: str | None = Field(default=None, alias="NextToken")
 
 class FinancialEventsResponse(BaseModel):
     """Response wrapper for financial events"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     payload: FinancialEventsResponsePayload | None = Field(default=None)
 
 class CatalogItemSummariesItemBrowseclassification(BaseModel):
     """Nested schema for CatalogItemSummariesItem.browseClassification"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     display_name: str | None = Field(default=None, alias="displayName")
     classification_id: str | None = Field(default=None, alias="classificationId")
 
 class CatalogItemSummariesItem(BaseModel):
     """Nested schema for CatalogItem.summaries_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     marketplace_id: str | None = Field(default=None, alias="marketplaceId")
     adult_product: bool | None = Field(default=None, alias="adultProduct")
@@ -511,7 +511,7 @@ class CatalogItemSummariesItem(BaseModel):
 
 class CatalogItem(BaseModel):
     """Amazon catalog item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     asin: str
     attributes: dict[str, Any] | None = Field(default=None)
@@ -527,14 +527,14 @@ class CatalogItem(BaseModel):
 
 class CatalogItemsListPagination(BaseModel):
     """Nested schema for CatalogItemsList.pagination"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None, alias="nextToken")
     previous_token: str | None = Field(default=None, alias="previousToken")
 
 class CatalogItemsListRefinementsClassificationsItem(BaseModel):
     """Nested schema for CatalogItemsListRefinements.classifications_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     number_of_results: int | None = Field(default=None, alias="numberOfResults")
     display_name: str | None = Field(default=None, alias="displayName")
@@ -542,21 +542,21 @@ class CatalogItemsListRefinementsClassificationsItem(BaseModel):
 
 class CatalogItemsListRefinementsBrandsItem(BaseModel):
     """Nested schema for CatalogItemsListRefinements.brands_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     number_of_results: int | None = Field(default=None, alias="numberOfResults")
     brand_name: str | None = Field(default=None, alias="brandName")
 
 class CatalogItemsListRefinements(BaseModel):
     """Nested schema for CatalogItemsList.refinements"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     brands: list[CatalogItemsListRefinementsBrandsItem] | None = Field(default=None)
     classifications: list[CatalogItemsListRefinementsClassificationsItem] | None = Field(default=None)
 
 class CatalogItemsList(BaseModel):
     """Catalog items search results"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     number_of_results: int | None = Field(default=None, alias="numberOfResults")
     pagination: CatalogItemsListPagination | None = Field(default=None)
@@ -565,7 +565,7 @@ class CatalogItemsList(BaseModel):
 
 class Report(BaseModel):
     """Amazon SP-API report"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     report_id: str = Field(alias="reportId")
     report_type: str | None = Field(default=None, alias="reportType")
@@ -581,7 +581,7 @@ class Report(BaseModel):
 
 class ReportsList(BaseModel):
     """Paginated list of reports"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reports: list[Report] | None = Field(default=None)
     next_token: str | None = Field(default=None, alias="nextToken")
@@ -591,38 +591,38 @@ class ReportsList(BaseModel):
 
 class OrdersListResultMeta(BaseModel):
     """Metadata for orders.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class OrderItemsListResultMeta(BaseModel):
     """Metadata for order_items.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class ListFinancialEventGroupsListResultMeta(BaseModel):
     """Metadata for list_financial_event_groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class ListFinancialEventsListResultMeta(BaseModel):
     """Metadata for list_financial_events.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
 class CatalogItemsListResultMeta(BaseModel):
     """Metadata for catalog_items.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
     number_of_results: int | None = Field(default=None)
 
 class ReportsListResultMeta(BaseModel):
     """Metadata for reports.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_token: str | None = Field(default=None)
 
@@ -679,7 +679,7 @@ D = TypeVar('D')
 
 class OrdersSearchData(BaseModel):
     """Search result data for orders entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     amazon_order_id: str | None = None
     """Unique identifier for the Amazon order"""
@@ -753,7 +753,7 @@ class OrdersSearchData(BaseModel):
 
 class OrderItemsSearchData(BaseModel):
     """Search result data for order_items entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     asin: str | None = None
     """Amazon Standard Identification Number of the product"""
@@ -833,7 +833,7 @@ class OrderItemsSearchData(BaseModel):
 
 class ListFinancialEventGroupsSearchData(BaseModel):
     """Search result data for list_financial_event_groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account_tail: str | None = None
     """The last digits of the account number"""
@@ -861,7 +861,7 @@ class ListFinancialEventGroupsSearchData(BaseModel):
 
 class ListFinancialEventsSearchData(BaseModel):
     """Search result data for list_financial_events entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     adhoc_disbursement_event_list: list[Any] | None = None
     """List of adhoc disbursement events"""
@@ -939,7 +939,7 @@ class ListFinancialEventsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -951,7 +951,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -39,7 +39,7 @@ class AmplitudeReplicationConfig(BaseModel):
 
 class Annotation(BaseModel):
     """A chart annotation object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     date: str | None = Field(default=None)
@@ -48,7 +48,7 @@ class Annotation(BaseModel):
 
 class AnnotationV3Category(BaseModel):
     """The annotation category"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None, description="Category ID")
     """Category ID"""
@@ -57,7 +57,7 @@ class AnnotationV3Category(BaseModel):
 
 class AnnotationV3(BaseModel):
     """A chart annotation object (v3 API format)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     start: str | None = Field(default=None)
@@ -69,19 +69,19 @@ class AnnotationV3(BaseModel):
 
 class AnnotationsList(BaseModel):
     """List of annotations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Annotation] | None = Field(default=None)
 
 class AnnotationGetResponse(BaseModel):
     """Single annotation response"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: AnnotationV3 | None = Field(default=None)
 
 class Cohort(BaseModel):
     """A user cohort object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     app_id: int | None = Field(default=None, alias="appId")
     archived: bool | None = Field(default=None)
@@ -117,19 +117,19 @@ class Cohort(BaseModel):
 
 class CohortGetResponse(BaseModel):
     """Single cohort response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cohort: Cohort | None = Field(default=None)
 
 class CohortsList(BaseModel):
     """List of cohorts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cohorts: list[Cohort] | None = Field(default=None)
 
 class EventType(BaseModel):
     """An event type definition with weekly totals"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     autohidden: bool | None = Field(default=None)
     clusters_hidden: bool | None = Field(default=None)
@@ -149,19 +149,19 @@ class EventType(BaseModel):
 
 class EventsListResponse(BaseModel):
     """List of event types"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[EventType] | None = Field(default=None)
 
 class ActiveUsersDataSeriesmetaItem(BaseModel):
     """Nested schema for ActiveUsersData.seriesMeta_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     segment_index: int | None = Field(default=None, alias="segmentIndex")
 
 class ActiveUsersData(BaseModel):
     """Active or new user count data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     series: list[list[float]] | None = Field(default=None)
     series_collapsed: list[list[float]] | None = Field(default=None, alias="seriesCollapsed")
@@ -171,27 +171,27 @@ class ActiveUsersData(BaseModel):
 
 class ActiveUsersResponse(BaseModel):
     """Active users response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: ActiveUsersData | None = Field(default=None)
 
 class AverageSessionLengthDataSeriesmetaItem(BaseModel):
     """Nested schema for AverageSessionLengthData.seriesMeta_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     segment_index: int | None = Field(default=None, alias="segmentIndex")
     session_index: int | None = Field(default=None, alias="sessionIndex")
 
 class AverageSessionLengthDataSeriescollapsedItemItem(BaseModel):
     """Nested schema for AverageSessionLengthData.seriesCollapsed_item_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     set_id: str | None = Field(default=None, alias="setId")
     value: float | None = Field(default=None)
 
 class AverageSessionLengthData(BaseModel):
     """Average session length data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     series: list[list[float]] | None = Field(default=None)
     series_collapsed: list[list[AverageSessionLengthDataSeriescollapsedItemItem]] | None = Field(default=None, alias="seriesCollapsed")
@@ -200,7 +200,7 @@ class AverageSessionLengthData(BaseModel):
 
 class AverageSessionLengthResponse(BaseModel):
     """Average session length response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: AverageSessionLengthData | None = Field(default=None)
 
@@ -260,7 +260,7 @@ D = TypeVar('D')
 
 class AnnotationsSearchData(BaseModel):
     """Search result data for annotations entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     date: str | None = None
     """The date when the annotation was made"""
@@ -274,7 +274,7 @@ class AnnotationsSearchData(BaseModel):
 
 class CohortsSearchData(BaseModel):
     """Search result data for cohorts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     app_id: int | None = None
     """The unique identifier of the application"""
@@ -332,7 +332,7 @@ class CohortsSearchData(BaseModel):
 
 class EventsListSearchData(BaseModel):
     """Search result data for events_list entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     autohidden: bool | None = None
     """Whether the event is auto-hidden"""
@@ -366,7 +366,7 @@ class EventsListSearchData(BaseModel):
 
 class ActiveUsersSearchData(BaseModel):
     """Search result data for active_users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     date: str | None = None
     """The date for which the active user data is reported"""
@@ -376,7 +376,7 @@ class ActiveUsersSearchData(BaseModel):
 
 class AverageSessionLengthSearchData(BaseModel):
     """Search result data for average_session_length entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     date: str | None = None
     """The date on which the session occurred"""
@@ -388,7 +388,7 @@ class AverageSessionLengthSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -400,7 +400,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -41,14 +41,14 @@ AsanaAuthConfig = AsanaOauth2AuthConfig | AsanaPersonalAccessTokenAuthConfig
 
 class TaskCompactCreatedBy(BaseModel):
     """User who created the task"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
 
 class TaskCompact(BaseModel):
     """Compact task object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -58,19 +58,19 @@ class TaskCompact(BaseModel):
 
 class Task(BaseModel):
     """Full task object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
 
 class TaskResponse(BaseModel):
     """Task response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Task | None = Field(default=None)
 
 class TasksListNextPage(BaseModel):
     """Nested schema for TasksList.next_page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     offset: str | None = Field(default=None)
     path: str | None = Field(default=None)
@@ -78,14 +78,14 @@ class TasksListNextPage(BaseModel):
 
 class TasksList(BaseModel):
     """Paginated list of tasks containing compact task objects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[TaskCompact] | None = Field(default=None)
     next_page: TasksListNextPage | None = Field(default=None)
 
 class ProjectCompact(BaseModel):
     """Compact project object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -93,7 +93,7 @@ class ProjectCompact(BaseModel):
 
 class ProjectWorkspace(BaseModel):
     """Nested schema for Project.workspace"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -101,7 +101,7 @@ class ProjectWorkspace(BaseModel):
 
 class ProjectFollowersItem(BaseModel):
     """Nested schema for Project.followers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -109,7 +109,7 @@ class ProjectFollowersItem(BaseModel):
 
 class ProjectCurrentStatusUpdate(BaseModel):
     """Nested schema for Project.current_status_update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -118,7 +118,7 @@ class ProjectCurrentStatusUpdate(BaseModel):
 
 class ProjectTeam(BaseModel):
     """Nested schema for Project.team"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -126,7 +126,7 @@ class ProjectTeam(BaseModel):
 
 class ProjectOwner(BaseModel):
     """Nested schema for Project.owner"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -134,7 +134,7 @@ class ProjectOwner(BaseModel):
 
 class ProjectCurrentStatusAuthor(BaseModel):
     """Nested schema for ProjectCurrentStatus.author"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -142,7 +142,7 @@ class ProjectCurrentStatusAuthor(BaseModel):
 
 class ProjectCurrentStatusCreatedBy(BaseModel):
     """Nested schema for ProjectCurrentStatus.created_by"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -150,7 +150,7 @@ class ProjectCurrentStatusCreatedBy(BaseModel):
 
 class ProjectCurrentStatus(BaseModel):
     """Nested schema for Project.current_status"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     author: ProjectCurrentStatusAuthor | None = Field(default=None)
@@ -164,7 +164,7 @@ class ProjectCurrentStatus(BaseModel):
 
 class ProjectMembersItem(BaseModel):
     """Nested schema for Project.members_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -172,7 +172,7 @@ class ProjectMembersItem(BaseModel):
 
 class ProjectCompletedBy(BaseModel):
     """Nested schema for Project.completed_by"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -180,7 +180,7 @@ class ProjectCompletedBy(BaseModel):
 
 class Project(BaseModel):
     """Full project object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     archived: bool | None = Field(default=None)
@@ -215,13 +215,13 @@ class Project(BaseModel):
 
 class ProjectResponse(BaseModel):
     """Project response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Project | None = Field(default=None)
 
 class ProjectsListNextPage(BaseModel):
     """Nested schema for ProjectsList.next_page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     offset: str | None = Field(default=None)
     path: str | None = Field(default=None)
@@ -229,14 +229,14 @@ class ProjectsListNextPage(BaseModel):
 
 class ProjectsList(BaseModel):
     """Paginated list of projects containing compact project objects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[ProjectCompact] | None = Field(default=None)
     next_page: ProjectsListNextPage | None = Field(default=None)
 
 class WorkspaceCompact(BaseModel):
     """Compact workspace object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -244,7 +244,7 @@ class WorkspaceCompact(BaseModel):
 
 class Workspace(BaseModel):
     """Full workspace object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -254,13 +254,13 @@ class Workspace(BaseModel):
 
 class WorkspaceResponse(BaseModel):
     """Workspace response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Workspace | None = Field(default=None)
 
 class WorkspacesListNextPage(BaseModel):
     """Nested schema for WorkspacesList.next_page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     offset: str | None = Field(default=None)
     path: str | None = Field(default=None)
@@ -268,14 +268,14 @@ class WorkspacesListNextPage(BaseModel):
 
 class WorkspacesList(BaseModel):
     """Paginated list of workspaces containing compact workspace objects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[WorkspaceCompact] | None = Field(default=None)
     next_page: WorkspacesListNextPage | None = Field(default=None)
 
 class UserCompact(BaseModel):
     """Compact user object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -283,7 +283,7 @@ class UserCompact(BaseModel):
 
 class UserWorkspacesItem(BaseModel):
     """Nested schema for User.workspaces_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -291,7 +291,7 @@ class UserWorkspacesItem(BaseModel):
 
 class User(BaseModel):
     """Full user object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     email: str | None = Field(default=None)
@@ -302,13 +302,13 @@ class User(BaseModel):
 
 class UserResponse(BaseModel):
     """User response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: User | None = Field(default=None)
 
 class UsersListNextPage(BaseModel):
     """Nested schema for UsersList.next_page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     offset: str | None = Field(default=None)
     path: str | None = Field(default=None)
@@ -316,14 +316,14 @@ class UsersListNextPage(BaseModel):
 
 class UsersList(BaseModel):
     """Paginated list of users containing compact user objects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[UserCompact] | None = Field(default=None)
     next_page: UsersListNextPage | None = Field(default=None)
 
 class TeamCompact(BaseModel):
     """Compact team object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -331,7 +331,7 @@ class TeamCompact(BaseModel):
 
 class TeamOrganization(BaseModel):
     """Nested schema for Team.organization"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -339,7 +339,7 @@ class TeamOrganization(BaseModel):
 
 class Team(BaseModel):
     """Full team object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -349,13 +349,13 @@ class Team(BaseModel):
 
 class TeamResponse(BaseModel):
     """Team response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Team | None = Field(default=None)
 
 class TeamsListNextPage(BaseModel):
     """Nested schema for TeamsList.next_page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     offset: str | None = Field(default=None)
     path: str | None = Field(default=None)
@@ -363,14 +363,14 @@ class TeamsListNextPage(BaseModel):
 
 class TeamsList(BaseModel):
     """Paginated list of teams containing compact team objects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[TeamCompact] | None = Field(default=None)
     next_page: TeamsListNextPage | None = Field(default=None)
 
 class AttachmentCompact(BaseModel):
     """Compact attachment object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -379,7 +379,7 @@ class AttachmentCompact(BaseModel):
 
 class AttachmentParent(BaseModel):
     """The parent object this attachment is attached to"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -389,7 +389,7 @@ class AttachmentParent(BaseModel):
 
 class Attachment(BaseModel):
     """Full attachment object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -405,13 +405,13 @@ class Attachment(BaseModel):
 
 class AttachmentResponse(BaseModel):
     """Attachment response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Attachment | None = Field(default=None)
 
 class AttachmentsListNextPage(BaseModel):
     """Nested schema for AttachmentsList.next_page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     offset: str | None = Field(default=None)
     path: str | None = Field(default=None)
@@ -419,14 +419,14 @@ class AttachmentsListNextPage(BaseModel):
 
 class AttachmentsList(BaseModel):
     """Paginated list of attachments containing compact attachment objects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[AttachmentCompact] | None = Field(default=None)
     next_page: AttachmentsListNextPage | None = Field(default=None)
 
 class TagCompact(BaseModel):
     """Compact tag object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -434,7 +434,7 @@ class TagCompact(BaseModel):
 
 class TagWorkspace(BaseModel):
     """Nested schema for Tag.workspace"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -442,7 +442,7 @@ class TagWorkspace(BaseModel):
 
 class Tag(BaseModel):
     """Full tag object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -456,13 +456,13 @@ class Tag(BaseModel):
 
 class TagResponse(BaseModel):
     """Tag response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Tag | None = Field(default=None)
 
 class TagsListNextPage(BaseModel):
     """Nested schema for TagsList.next_page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     offset: str | None = Field(default=None)
     path: str | None = Field(default=None)
@@ -470,14 +470,14 @@ class TagsListNextPage(BaseModel):
 
 class TagsList(BaseModel):
     """Paginated list of tags containing compact tag objects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[TagCompact] | None = Field(default=None)
     next_page: TagsListNextPage | None = Field(default=None)
 
 class SectionCompact(BaseModel):
     """Compact section object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -485,7 +485,7 @@ class SectionCompact(BaseModel):
 
 class SectionProject(BaseModel):
     """Nested schema for Section.project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -493,7 +493,7 @@ class SectionProject(BaseModel):
 
 class Section(BaseModel):
     """Full section object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -503,13 +503,13 @@ class Section(BaseModel):
 
 class SectionResponse(BaseModel):
     """Section response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Section | None = Field(default=None)
 
 class SectionsListNextPage(BaseModel):
     """Nested schema for SectionsList.next_page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     offset: str | None = Field(default=None)
     path: str | None = Field(default=None)
@@ -517,14 +517,14 @@ class SectionsListNextPage(BaseModel):
 
 class SectionsList(BaseModel):
     """Paginated list of sections containing compact section objects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[SectionCompact] | None = Field(default=None)
     next_page: SectionsListNextPage | None = Field(default=None)
 
 class SectionCreateParamsData(BaseModel):
     """Nested schema for SectionCreateParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str = Field(description="The name of the section (this is displayed as the column header in board view)")
     """The name of the section (this is displayed as the column header in board view)"""
@@ -535,26 +535,26 @@ class SectionCreateParamsData(BaseModel):
 
 class SectionCreateParams(BaseModel):
     """Parameters for creating a new section in a project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: SectionCreateParamsData
 
 class SectionUpdateParamsData(BaseModel):
     """Nested schema for SectionUpdateParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="The new name of the section")
     """The new name of the section"""
 
 class SectionUpdateParams(BaseModel):
     """Parameters for updating an existing section"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: SectionUpdateParamsData
 
 class SectionAddTaskParamsData(BaseModel):
     """Nested schema for SectionAddTaskParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     task: str = Field(description="The GID of the task to add to this section")
     """The GID of the task to add to this section"""
@@ -565,13 +565,13 @@ class SectionAddTaskParamsData(BaseModel):
 
 class SectionAddTaskParams(BaseModel):
     """Parameters for adding a task to a section"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: SectionAddTaskParamsData
 
 class TagCreateParamsData(BaseModel):
     """Nested schema for TagCreateParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str = Field(description="Name of the tag")
     """Name of the tag"""
@@ -582,13 +582,13 @@ class TagCreateParamsData(BaseModel):
 
 class TagCreateParams(BaseModel):
     """Parameters for creating a new tag in a workspace"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: TagCreateParamsData
 
 class TagUpdateParamsData(BaseModel):
     """Nested schema for TagUpdateParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="Name of the tag")
     """Name of the tag"""
@@ -599,39 +599,39 @@ class TagUpdateParamsData(BaseModel):
 
 class TagUpdateParams(BaseModel):
     """Parameters for updating an existing tag"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: TagUpdateParamsData
 
 class TaskAddTagParamsData(BaseModel):
     """Nested schema for TaskAddTagParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     tag: str = Field(description="The GID of the tag to add to the task")
     """The GID of the tag to add to the task"""
 
 class TaskAddTagParams(BaseModel):
     """Parameters for adding a tag to a task"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: TaskAddTagParamsData
 
 class TaskRemoveTagParamsData(BaseModel):
     """Nested schema for TaskRemoveTagParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     tag: str = Field(description="The GID of the tag to remove from the task")
     """The GID of the tag to remove from the task"""
 
 class TaskRemoveTagParams(BaseModel):
     """Parameters for removing a tag from a task"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: TaskRemoveTagParamsData
 
 class TaskCreateParamsData(BaseModel):
     """Nested schema for TaskCreateParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str = Field(description="Name of the task")
     """Name of the task"""
@@ -664,13 +664,13 @@ class TaskCreateParamsData(BaseModel):
 
 class TaskCreateParams(BaseModel):
     """Parameters for creating a new task"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: TaskCreateParamsData
 
 class TaskUpdateParamsData(BaseModel):
     """Nested schema for TaskUpdateParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="Name of the task")
     """Name of the task"""
@@ -691,13 +691,13 @@ class TaskUpdateParamsData(BaseModel):
 
 class TaskUpdateParams(BaseModel):
     """Parameters for updating an existing task"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: TaskUpdateParamsData
 
 class ProjectCreateParamsData(BaseModel):
     """Nested schema for ProjectCreateParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str = Field(description="Name of the project")
     """Name of the project"""
@@ -724,13 +724,13 @@ class ProjectCreateParamsData(BaseModel):
 
 class ProjectCreateParams(BaseModel):
     """Parameters for creating a new project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: ProjectCreateParamsData
 
 class ProjectUpdateParamsData(BaseModel):
     """Nested schema for ProjectUpdateParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="Name of the project")
     """Name of the project"""
@@ -751,13 +751,13 @@ class ProjectUpdateParamsData(BaseModel):
 
 class ProjectUpdateParams(BaseModel):
     """Parameters for updating an existing project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: ProjectUpdateParamsData
 
 class StoryCreateParamsData(BaseModel):
     """Nested schema for StoryCreateParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     text: str = Field(description="The plain text body of the comment")
     """The plain text body of the comment"""
@@ -768,13 +768,13 @@ class StoryCreateParamsData(BaseModel):
 
 class StoryCreateParams(BaseModel):
     """Parameters for creating a comment (story) on a task"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: StoryCreateParamsData
 
 class StoryTarget(BaseModel):
     """Nested schema for Story.target"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -782,7 +782,7 @@ class StoryTarget(BaseModel):
 
 class StoryCreatedBy(BaseModel):
     """Nested schema for Story.created_by"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -790,7 +790,7 @@ class StoryCreatedBy(BaseModel):
 
 class Story(BaseModel):
     """A story represents an activity associated with an object in Asana"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     gid: str | None = Field(default=None)
     resource_type: str | None = Field(default=None)
@@ -805,26 +805,26 @@ class Story(BaseModel):
 
 class StoryResponse(BaseModel):
     """Story response wrapper"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Story | None = Field(default=None)
 
 class EmptyResponse(BaseModel):
     """Empty response returned by delete operations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: dict[str, Any] | None = Field(default=None)
 
 class WorkspaceAddUserParamsData(BaseModel):
     """Nested schema for WorkspaceAddUserParams.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user: str = Field(description="A user GID or email address to add to the workspace")
     """A user GID or email address to add to the workspace"""
 
 class WorkspaceAddUserParams(BaseModel):
     """Parameters for adding a user to a workspace or organization"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: WorkspaceAddUserParamsData
 
@@ -833,127 +833,127 @@ class WorkspaceAddUserParams(BaseModel):
 
 class TasksListResultMeta(BaseModel):
     """Metadata for tasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class ProjectTasksListResultMeta(BaseModel):
     """Metadata for project_tasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class WorkspaceTaskSearchListResultMeta(BaseModel):
     """Metadata for workspace_task_search.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class ProjectsListResultMeta(BaseModel):
     """Metadata for projects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class TaskProjectsListResultMeta(BaseModel):
     """Metadata for task_projects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class TeamProjectsListResultMeta(BaseModel):
     """Metadata for team_projects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class WorkspaceProjectsListResultMeta(BaseModel):
     """Metadata for workspace_projects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class WorkspacesListResultMeta(BaseModel):
     """Metadata for workspaces.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class WorkspaceUsersListResultMeta(BaseModel):
     """Metadata for workspace_users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class TeamUsersListResultMeta(BaseModel):
     """Metadata for team_users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class WorkspaceTeamsListResultMeta(BaseModel):
     """Metadata for workspace_teams.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class UserTeamsListResultMeta(BaseModel):
     """Metadata for user_teams.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class AttachmentsListResultMeta(BaseModel):
     """Metadata for attachments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class WorkspaceTagsListResultMeta(BaseModel):
     """Metadata for workspace_tags.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class TagTasksListResultMeta(BaseModel):
     """Metadata for tag_tasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class ProjectSectionsListResultMeta(BaseModel):
     """Metadata for project_sections.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class SectionTasksListResultMeta(BaseModel):
     """Metadata for section_tasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class TaskSubtasksListResultMeta(BaseModel):
     """Metadata for task_subtasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class TaskDependenciesListResultMeta(BaseModel):
     """Metadata for task_dependencies.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
 class TaskDependentsListResultMeta(BaseModel):
     """Metadata for task_dependents.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: dict[str, Any] | None = Field(default=None)
 
@@ -1010,7 +1010,7 @@ D = TypeVar('D')
 
 class AttachmentsSearchData(BaseModel):
     """Search result data for attachments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     connected_to_app: bool | None = None
     """"""
@@ -1040,7 +1040,7 @@ class AttachmentsSearchData(BaseModel):
 
 class ProjectsSearchData(BaseModel):
     """Search result data for projects entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     archived: bool | None = None
     """"""
@@ -1096,7 +1096,7 @@ class ProjectsSearchData(BaseModel):
 
 class SectionsSearchData(BaseModel):
     """Search result data for sections entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """"""
@@ -1112,7 +1112,7 @@ class SectionsSearchData(BaseModel):
 
 class TagsSearchData(BaseModel):
     """Search result data for tags entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     color: str | None = None
     """"""
@@ -1132,7 +1132,7 @@ class TagsSearchData(BaseModel):
 
 class TasksSearchData(BaseModel):
     """Search result data for tasks entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     actual_time_minutes: int | None = None
     """The actual time spent on the task in minutes"""
@@ -1210,7 +1210,7 @@ class TasksSearchData(BaseModel):
 
 class TeamsSearchData(BaseModel):
     """Search result data for teams entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     description: str | None = None
     """"""
@@ -1230,7 +1230,7 @@ class TeamsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     email: str | None = None
     """"""
@@ -1248,7 +1248,7 @@ class UsersSearchData(BaseModel):
 
 class WorkspacesSearchData(BaseModel):
     """Search result data for workspaces entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     email_domains: list[Any] | None = None
     """"""
@@ -1266,7 +1266,7 @@ class WorkspacesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1278,7 +1278,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
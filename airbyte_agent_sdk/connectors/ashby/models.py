@@ -34,7 +34,7 @@ class AshbyReplicationConfig(BaseModel):
 
 class CandidatePhonenumbersItem(BaseModel):
     """Nested schema for Candidate.phoneNumbers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     value: str | None | None = Field(default=None)
     type_: str | None | None = Field(default=None, alias="type")
@@ -42,14 +42,14 @@ class CandidatePhonenumbersItem(BaseModel):
 
 class CandidateSociallinksItem(BaseModel):
     """Nested schema for Candidate.socialLinks_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     url: str | None | None = Field(default=None)
 
 class CandidateEmailaddressesItem(BaseModel):
     """Nested schema for Candidate.emailAddresses_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     value: str | None | None = Field(default=None)
     type_: str | None | None = Field(default=None, alias="type")
@@ -57,7 +57,7 @@ class CandidateEmailaddressesItem(BaseModel):
 
 class CandidateTagsItem(BaseModel):
     """Nested schema for Candidate.tags_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     title: str | None | None = Field(default=None)
@@ -65,7 +65,7 @@ class CandidateTagsItem(BaseModel):
 
 class Candidate(BaseModel):
     """Candidate object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     created_at: str | None = Field(default=None, alias="createdAt")
@@ -85,7 +85,7 @@ class Candidate(BaseModel):
 
 class ApplicationHiringteamItem(BaseModel):
     """Nested schema for Application.hiringTeam_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user_id: str | None | None = Field(default=None, alias="userId")
     first_name: str | None | None = Field(default=None, alias="firstName")
@@ -95,7 +95,7 @@ class ApplicationHiringteamItem(BaseModel):
 
 class Application(BaseModel):
     """Application object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     created_at: str | None = Field(default=None, alias="createdAt")
@@ -116,7 +116,7 @@ class Application(BaseModel):
 
 class JobCustomfieldsItem(BaseModel):
     """Nested schema for Job.customFields_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     is_private: bool | None | None = Field(default=None, alias="isPrivate")
@@ -126,7 +126,7 @@ class JobCustomfieldsItem(BaseModel):
 
 class JobHiringteamItem(BaseModel):
     """Nested schema for Job.hiringTeam_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user_id: str | None | None = Field(default=None, alias="userId")
     first_name: str | None | None = Field(default=None, alias="firstName")
@@ -136,7 +136,7 @@ class JobHiringteamItem(BaseModel):
 
 class Job(BaseModel):
     """Job object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     title: str | None = Field(default=None)
@@ -160,7 +160,7 @@ class Job(BaseModel):
 
 class Department(BaseModel):
     """Department object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -173,7 +173,7 @@ class Department(BaseModel):
 
 class Location(BaseModel):
     """Location object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -188,7 +188,7 @@ class Location(BaseModel):
 
 class User(BaseModel):
     """User object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     first_name: str | None = Field(default=None, alias="firstName")
@@ -200,7 +200,7 @@ class User(BaseModel):
 
 class JobPosting(BaseModel):
     """Job posting object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     title: str | None = Field(default=None)
@@ -223,7 +223,7 @@ class JobPosting(BaseModel):
 
 class Source(BaseModel):
     """Candidate source object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     title: str | None = Field(default=None)
@@ -232,7 +232,7 @@ class Source(BaseModel):
 
 class ArchiveReason(BaseModel):
     """Archive reason object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     text: str | None = Field(default=None)
@@ -241,7 +241,7 @@ class ArchiveReason(BaseModel):
 
 class CandidateTag(BaseModel):
     """Candidate tag object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     title: str | None = Field(default=None)
@@ -249,7 +249,7 @@ class CandidateTag(BaseModel):
 
 class CustomField(BaseModel):
     """Custom field definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     title: str | None = Field(default=None)
@@ -260,7 +260,7 @@ class CustomField(BaseModel):
 
 class FeedbackFormDefinition(BaseModel):
     """Feedback form definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     organization_id: str | None = Field(default=None, alias="organizationId")
@@ -275,84 +275,84 @@ class FeedbackFormDefinition(BaseModel):
 
 class CandidatesListResultMeta(BaseModel):
     """Metadata for candidates.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class ApplicationsListResultMeta(BaseModel):
     """Metadata for applications.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class JobsListResultMeta(BaseModel):
     """Metadata for jobs.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class DepartmentsListResultMeta(BaseModel):
     """Metadata for departments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class LocationsListResultMeta(BaseModel):
     """Metadata for locations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class JobPostingsListResultMeta(BaseModel):
     """Metadata for job_postings.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class SourcesListResultMeta(BaseModel):
     """Metadata for sources.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class ArchiveReasonsListResultMeta(BaseModel):
     """Metadata for archive_reasons.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class CandidateTagsListResultMeta(BaseModel):
     """Metadata for candidate_tags.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class CustomFieldsListResultMeta(BaseModel):
     """Metadata for custom_fields.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class FeedbackFormDefinitionsListResultMeta(BaseModel):
     """Metadata for feedback_form_definitions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
@@ -410,7 +410,7 @@ D = TypeVar('D')
 
 class ApplicationsSearchData(BaseModel):
     """Search result data for applications entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the application"""
@@ -426,7 +426,7 @@ class ApplicationsSearchData(BaseModel):
 
 class CandidatesSearchData(BaseModel):
     """Search result data for candidates entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the candidate"""
@@ -442,7 +442,7 @@ class CandidatesSearchData(BaseModel):
 
 class JobPostingsSearchData(BaseModel):
     """Search result data for job_postings entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the job posting"""
@@ -458,7 +458,7 @@ class JobPostingsSearchData(BaseModel):
 
 class JobsSearchData(BaseModel):
     """Search result data for jobs entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the job"""
@@ -474,7 +474,7 @@ class JobsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the user"""
@@ -490,7 +490,7 @@ class UsersSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -502,7 +502,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -34,7 +34,7 @@ class ChargebeeReplicationConfig(BaseModel):
 
 class Customer(BaseModel):
     """Chargebee customer object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     first_name: str | None = Field(default=None)
@@ -102,20 +102,20 @@ class Customer(BaseModel):
 
 class CustomerListListItem(BaseModel):
     """Nested schema for CustomerList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     customer: Customer | None = Field(default=None)
 
 class CustomerList(BaseModel):
     """Paginated list of customers"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[CustomerListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class Subscription(BaseModel):
     """Chargebee subscription object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     customer_id: str | None = Field(default=None)
@@ -186,20 +186,20 @@ class Subscription(BaseModel):
 
 class SubscriptionListListItem(BaseModel):
     """Nested schema for SubscriptionList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     subscription: Subscription | None = Field(default=None)
 
 class SubscriptionList(BaseModel):
     """Paginated list of subscriptions"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[SubscriptionListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class Invoice(BaseModel):
     """Chargebee invoice object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     customer_id: str | None = Field(default=None)
@@ -262,20 +262,20 @@ class Invoice(BaseModel):
 
 class InvoiceListListItem(BaseModel):
     """Nested schema for InvoiceList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     invoice: Invoice | None = Field(default=None)
 
 class InvoiceList(BaseModel):
     """Paginated list of invoices"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[InvoiceListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class CreditNote(BaseModel):
     """Chargebee credit note object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     customer_id: str | None = Field(default=None)
@@ -325,20 +325,20 @@ class CreditNote(BaseModel):
 
 class CreditNoteListListItem(BaseModel):
     """Nested schema for CreditNoteList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     credit_note: CreditNote | None = Field(default=None)
 
 class CreditNoteList(BaseModel):
     """Paginated list of credit notes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[CreditNoteListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class Coupon(BaseModel):
     """Chargebee coupon object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -374,20 +374,20 @@ class Coupon(BaseModel):
 
 class CouponListListItem(BaseModel):
     """Nested schema for CouponList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     coupon: Coupon | None = Field(default=None)
 
 class CouponList(BaseModel):
     """Paginated list of coupons"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[CouponListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class Transaction(BaseModel):
     """Chargebee transaction object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     customer_id: str | None = Field(default=None)
@@ -439,20 +439,20 @@ class Transaction(BaseModel):
 
 class TransactionListListItem(BaseModel):
     """Nested schema for TransactionList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     transaction: Transaction | None = Field(default=None)
 
 class TransactionList(BaseModel):
     """Paginated list of transactions"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[TransactionListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class Event(BaseModel):
     """Chargebee event object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     occurred_at: int | None = Field(default=None)
@@ -468,20 +468,20 @@ class Event(BaseModel):
 
 class EventListListItem(BaseModel):
     """Nested schema for EventList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     event: Event | None = Field(default=None)
 
 class EventList(BaseModel):
     """Paginated list of events"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[EventListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class Order(BaseModel):
     """Chargebee order object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     document_number: str | None = Field(default=None)
@@ -544,20 +544,20 @@ class Order(BaseModel):
 
 class OrderListListItem(BaseModel):
     """Nested schema for OrderList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     order: Order | None = Field(default=None)
 
 class OrderList(BaseModel):
     """Paginated list of orders"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[OrderListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class Item(BaseModel):
     """Chargebee item object (Product Catalog 2.0)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -592,20 +592,20 @@ class Item(BaseModel):
 
 class ItemListListItem(BaseModel):
     """Nested schema for ItemList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     item: Item | None = Field(default=None)
 
 class ItemList(BaseModel):
     """Paginated list of items"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[ItemListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class ItemPrice(BaseModel):
     """Chargebee item price object (Product Catalog 2.0)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -649,20 +649,20 @@ class ItemPrice(BaseModel):
 
 class ItemPriceListListItem(BaseModel):
     """Nested schema for ItemPriceList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     item_price: ItemPrice | None = Field(default=None)
 
 class ItemPriceList(BaseModel):
     """Paginated list of item prices"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[ItemPriceListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class PaymentSource(BaseModel):
     """Chargebee payment source object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     customer_id: str | None = Field(default=None)
@@ -689,80 +689,80 @@ class PaymentSource(BaseModel):
 
 class PaymentSourceListListItem(BaseModel):
     """Nested schema for PaymentSourceList.list_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     payment_source: PaymentSource | None = Field(default=None)
 
 class PaymentSourceList(BaseModel):
     """Paginated list of payment sources"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_: list[PaymentSourceListListItem] | None = Field(default=None, alias="list")
     next_offset: str | None = Field(default=None)
 
 class CustomerWrapper(BaseModel):
     """CustomerWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     customer: Customer | None = Field(default=None)
 
 class SubscriptionWrapper(BaseModel):
     """SubscriptionWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     subscription: Subscription | None = Field(default=None)
 
 class InvoiceWrapper(BaseModel):
     """InvoiceWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     invoice: Invoice | None = Field(default=None)
 
 class CreditNoteWrapper(BaseModel):
     """CreditNoteWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     credit_note: CreditNote | None = Field(default=None)
 
 class CouponWrapper(BaseModel):
     """CouponWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     coupon: Coupon | None = Field(default=None)
 
 class TransactionWrapper(BaseModel):
     """TransactionWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     transaction: Transaction | None = Field(default=None)
 
 class EventWrapper(BaseModel):
     """EventWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     event: Event | None = Field(default=None)
 
 class OrderWrapper(BaseModel):
     """OrderWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     order: Order | None = Field(default=None)
 
 class ItemWrapper(BaseModel):
     """ItemWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     item: Item | None = Field(default=None)
 
 class ItemPriceWrapper(BaseModel):
     """ItemPriceWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     item_price: ItemPrice | None = Field(default=None)
 
 class PaymentSourceWrapper(BaseModel):
     """PaymentSourceWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     payment_source: PaymentSource | None = Field(default=None)
 
@@ -771,67 +771,67 @@ class PaymentSourceWrapper(BaseModel):
 
 class CustomerListResultMeta(BaseModel):
     """Metadata for customer.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
 class SubscriptionListResultMeta(BaseModel):
     """Metadata for subscription.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
 class InvoiceListResultMeta(BaseModel):
     """Metadata for invoice.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
 class CreditNoteListResultMeta(BaseModel):
     """Metadata for credit_note.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
 class CouponListResultMeta(BaseModel):
     """Metadata for coupon.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
 class TransactionListResultMeta(BaseModel):
     """Metadata for transaction.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
 class EventListResultMeta(BaseModel):
     """Metadata for event.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
 class OrderListResultMeta(BaseModel):
     """Metadata for order.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
 class ItemListResultMeta(BaseModel):
     """Metadata for item.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
 class ItemPriceListResultMeta(BaseModel):
     """Metadata for item_price.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
 class PaymentSourceListResultMeta(BaseModel):
     """Metadata for payment_source.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: str | None = Field(default=None)
 
@@ -888,7 +888,7 @@ D = TypeVar('D')
 
 class SubscriptionSearchData(BaseModel):
     """Search result data for subscription entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     activated_at: int | None = None
     """The date and time when the subscription was activated."""
@@ -1046,7 +1046,7 @@ class SubscriptionSearchData(BaseModel):
 
 class CustomerSearchData(BaseModel):
     """Search result data for customer entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     allow_direct_debit: bool | None = None
     """Indicates if direct debit is allowed for the customer."""
@@ -1178,7 +1178,7 @@ class CustomerSearchData(BaseModel):
 
 class InvoiceSearchData(BaseModel):
     """Search result data for invoice entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     adjustment_credit_notes: list[Any] | None = None
     """Details of adjustment credit notes applied to the invoice"""
@@ -1322,7 +1322,7 @@ class InvoiceSearchData(BaseModel):
 
 class CreditNoteSearchData(BaseModel):
     """Search result data for credit_note entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     allocations: list[Any] | None = None
     """Details of allocations associated with the credit note"""
@@ -1426,7 +1426,7 @@ class CreditNoteSearchData(BaseModel):
 
 class CouponSearchData(BaseModel):
     """Search result data for coupon entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     apply_discount_on: str | None = None
     """Determines where the discount is applied on (e.g. subtotal, total)."""
@@ -1488,7 +1488,7 @@ class CouponSearchData(BaseModel):
 
 class TransactionSearchData(BaseModel):
     """Search result data for transaction entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     amount: int | None = None
     """The total amount of the transaction."""
@@ -1604,7 +1604,7 @@ class TransactionSearchData(BaseModel):
 
 class EventSearchData(BaseModel):
     """Search result data for event entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     api_version: str | None = None
     """The version of the Chargebee API being used to fetch the event data."""
@@ -1632,7 +1632,7 @@ class EventSearchData(BaseModel):
 
 class OrderSearchData(BaseModel):
     """Search result data for order entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     amount_adjusted: int | None = None
     """Adjusted amount for the order."""
@@ -1758,7 +1758,7 @@ class OrderSearchData(BaseModel):
 
 class PaymentSourceSearchData(BaseModel):
     """Search result data for payment_source entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     amazon_payment: dict[str, Any] | None = None
     """Data related to Amazon Pay payment source"""
@@ -1808,7 +1808,7 @@ class PaymentSourceSearchData(BaseModel):
 
 class ItemSearchData(BaseModel):
     """Search result data for item entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     applicable_items: list[Any] | None = None
     """Items associated with the item"""
@@ -1866,7 +1866,7 @@ class ItemSearchData(BaseModel):
 
 class ItemPriceSearchData(BaseModel):
     """Search result data for item_price entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     accounting_detail: dict[str, Any] | None = None
     """Details related to accounting such as cost, revenue, expenses, etc."""
@@ -1948,7 +1948,7 @@ class ItemPriceSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1960,7 +1960,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
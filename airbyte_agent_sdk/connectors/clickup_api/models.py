@@ -24,7 +24,7 @@ class ClickupApiAuthConfig(BaseModel):
 
 class User(BaseModel):
     """User type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     username: str | None = Field(default=None)
@@ -38,13 +38,13 @@ class User(BaseModel):
 
 class UserResponse(BaseModel):
     """UserResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user: User | None = Field(default=None)
 
 class TeamMembersItemUser(BaseModel):
     """Member user details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None, description="User ID")
     """User ID"""
@@ -75,14 +75,14 @@ class TeamMembersItemUser(BaseModel):
 
 class TeamMembersItem(BaseModel):
     """Nested schema for Team.members_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user: TeamMembersItemUser | None = Field(default=None, description="Member user details")
     """Member user details"""
 
 class Team(BaseModel):
     """Team type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -92,13 +92,13 @@ class Team(BaseModel):
 
 class TeamsListResponse(BaseModel):
     """TeamsListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     teams: list[Team] | None = Field(default=None)
 
 class SpaceStatusesItem(BaseModel):
     """Nested schema for Space.statuses_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Status ID")
     """Status ID"""
@@ -113,7 +113,7 @@ class SpaceStatusesItem(BaseModel):
 
 class SpaceFeaturesTimeTracking(BaseModel):
     """Time tracking feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether time tracking is enabled")
     """Whether time tracking is enabled"""
@@ -126,28 +126,28 @@ class SpaceFeaturesTimeTracking(BaseModel):
 
 class SpaceFeaturesTags(BaseModel):
     """Tags feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether tags are enabled")
     """Whether tags are enabled"""
 
 class SpaceFeaturesMilestones(BaseModel):
     """Milestones feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether milestones are enabled")
     """Whether milestones are enabled"""
 
 class SpaceFeaturesEmails(BaseModel):
     """Emails feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether emails are enabled")
     """Whether emails are enabled"""
 
 class SpaceFeaturesCheckUnresolved(BaseModel):
     """Check unresolved feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether check unresolved is enabled")
     """Whether check unresolved is enabled"""
@@ -160,42 +160,42 @@ class SpaceFeaturesCheckUnresolved(BaseModel):
 
 class SpaceFeaturesStatusPies(BaseModel):
     """Status pies feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether status pies are enabled")
     """Whether status pies are enabled"""
 
 class SpaceFeaturesRemapDependencies(BaseModel):
     """Remap dependencies feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether remap dependencies is enabled")
     """Whether remap dependencies is enabled"""
 
 class SpaceFeaturesCustomItems(BaseModel):
     """Custom items feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether custom items are enabled")
     """Whether custom items are enabled"""
 
 class SpaceFeaturesDependencyWarning(BaseModel):
     """Dependency warning feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether dependency warnings are enabled")
     """Whether dependency warnings are enabled"""
 
 class SpaceFeaturesPoints(BaseModel):
     """Points feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether points are enabled")
     """Whether points are enabled"""
 
 class SpaceFeaturesTimeEstimates(BaseModel):
     """Time estimates feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether time estimates are enabled")
     """Whether time estimates are enabled"""
@@ -206,7 +206,7 @@ class SpaceFeaturesTimeEstimates(BaseModel):
 
 class SpaceFeaturesDueDates(BaseModel):
     """Due dates feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether due dates are enabled")
     """Whether due dates are enabled"""
@@ -219,35 +219,35 @@ class SpaceFeaturesDueDates(BaseModel):
 
 class SpaceFeaturesRescheduleClosedDependencies(BaseModel):
     """Reschedule closed dependencies settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether rescheduling closed dependencies is enabled")
     """Whether rescheduling closed dependencies is enabled"""
 
 class SpaceFeaturesMultipleAssignees(BaseModel):
     """Multiple assignees feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether multiple assignees are enabled")
     """Whether multiple assignees are enabled"""
 
 class SpaceFeaturesSprints(BaseModel):
     """Sprints feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether sprints are enabled")
     """Whether sprints are enabled"""
 
 class SpaceFeaturesCustomFields(BaseModel):
     """Custom fields feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether custom fields are enabled")
     """Whether custom fields are enabled"""
 
 class SpaceFeaturesPrioritiesPrioritiesItem(BaseModel):
     """Nested schema for SpaceFeaturesPriorities.priorities_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     color: str | None = Field(default=None, description="Priority color hex code")
     """Priority color hex code"""
@@ -260,7 +260,7 @@ class SpaceFeaturesPrioritiesPrioritiesItem(BaseModel):
 
 class SpaceFeaturesPriorities(BaseModel):
     """Priorities feature settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether priorities are enabled")
     """Whether priorities are enabled"""
@@ -269,7 +269,7 @@ class SpaceFeaturesPriorities(BaseModel):
 
 class SpaceFeaturesDependencyEnforcement(BaseModel):
     """Dependency enforcement settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enforcement_enabled: bool | None = Field(default=None, description="Whether enforcement is enabled")
     """Whether enforcement is enabled"""
@@ -278,7 +278,7 @@ class SpaceFeaturesDependencyEnforcement(BaseModel):
 
 class SpaceFeatures(BaseModel):
     """Feature flags for the space"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     due_dates: SpaceFeaturesDueDates | None = Field(default=None, description="Due dates feature settings")
     """Due dates feature settings"""
@@ -323,7 +323,7 @@ class SpaceFeatures(BaseModel):
 
 class Space(BaseModel):
     """Space type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -338,13 +338,13 @@ class Space(BaseModel):
 
 class SpacesListResponse(BaseModel):
     """SpacesListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     spaces: list[Space] | None = Field(default=None)
 
 class FolderListsItemStatusesItem(BaseModel):
     """Nested schema for FolderListsItem.statuses_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Status ID")
     """Status ID"""
@@ -361,7 +361,7 @@ class FolderListsItemStatusesItem(BaseModel):
 
 class FolderListsItem(BaseModel):
     """Nested schema for Folder.lists_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="List ID")
     """List ID"""
@@ -396,7 +396,7 @@ class FolderListsItem(BaseModel):
 
 class FolderSpace(BaseModel):
     """Parent space reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Space ID")
     """Space ID"""
@@ -407,7 +407,7 @@ class FolderSpace(BaseModel):
 
 class FolderStatusesItem(BaseModel):
     """Nested schema for Folder.statuses_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Status ID")
     """Status ID"""
@@ -422,7 +422,7 @@ class FolderStatusesItem(BaseModel):
 
 class Folder(BaseModel):
     """Folder type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -439,13 +439,13 @@ class Folder(BaseModel):
 
 class FoldersListResponse(BaseModel):
     """FoldersListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     folders: list[Folder] | None = Field(default=None)
 
 class ListFolder(BaseModel):
     """Parent folder reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Folder ID")
     """Folder ID"""
@@ -458,7 +458,7 @@ class ListFolder(BaseModel):
 
 class ListSpace(BaseModel):
     """Parent space reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Space ID")
     """Space ID"""
@@ -469,7 +469,7 @@ class ListSpace(BaseModel):
 
 class ListStatusesItem(BaseModel):
     """Nested schema for List.statuses_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Status ID")
     """Status ID"""
@@ -486,7 +486,7 @@ class ListStatusesItem(BaseModel):
 
 class List(BaseModel):
     """List type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -509,13 +509,13 @@ class List(BaseModel):
 
 class ListsListResponse(BaseModel):
     """ListsListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     lists: list[List] | None = Field(default=None)
 
 class TaskWatchersItem(BaseModel):
     """Nested schema for Task.watchers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None, description="Watcher user ID")
     """Watcher user ID"""
@@ -532,7 +532,7 @@ class TaskWatchersItem(BaseModel):
 
 class TaskStatus(BaseModel):
     """Task status"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Status ID")
     """Status ID"""
@@ -547,7 +547,7 @@ class TaskStatus(BaseModel):
 
 class TaskCreator(BaseModel):
     """Task creator"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None, description="Creator user ID")
     """Creator user ID"""
@@ -562,7 +562,7 @@ class TaskCreator(BaseModel):
 
 class Task(BaseModel):
     """Task type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     custom_id: str | None = Field(default=None)
@@ -607,14 +607,14 @@ class Task(BaseModel):
 
 class TasksListResponse(BaseModel):
     """TasksListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     tasks: list[Task] | None = Field(default=None)
     last_page: bool | None = Field(default=None)
 
 class Comment(BaseModel):
     """Comment type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     comment: list[dict[str, Any]] | None = Field(default=None)
@@ -628,13 +628,13 @@ class Comment(BaseModel):
 
 class CommentsListResponse(BaseModel):
     """CommentsListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     comments: list[Comment] | None = Field(default=None)
 
 class CommentCreateParams(BaseModel):
     """CommentCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     comment_text: str
     assignee: int | None = Field(default=None)
@@ -642,7 +642,7 @@ class CommentCreateParams(BaseModel):
 
 class CommentCreateResponse(BaseModel):
     """CommentCreateResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     hist_id: str | None = Field(default=None)
@@ -651,7 +651,7 @@ class CommentCreateResponse(BaseModel):
 
 class CommentUpdateParams(BaseModel):
     """CommentUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     comment_text: str | None = Field(default=None)
     assignee: int | None = Field(default=None)
@@ -659,13 +659,13 @@ class CommentUpdateParams(BaseModel):
 
 class CommentUpdateResponse(BaseModel):
     """CommentUpdateResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     pass
 
 class Goal(BaseModel):
     """Goal type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     pretty_id: str | None = Field(default=None)
@@ -689,20 +689,20 @@ class Goal(BaseModel):
 
 class GoalsListResponse(BaseModel):
     """GoalsListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     goals: list[Goal] | None = Field(default=None)
     folders: list[dict[str, Any]] | None = Field(default=None)
 
 class GoalResponse(BaseModel):
     """GoalResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     goal: Goal | None = Field(default=None)
 
 class ViewParent(BaseModel):
     """Parent reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: Any | None = Field(default=None, description="Parent entity ID")
     """Parent entity ID"""
@@ -711,7 +711,7 @@ class ViewParent(BaseModel):
 
 class View(BaseModel):
     """View type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -736,7 +736,7 @@ class View(BaseModel):
 
 class ViewsListResponse(BaseModel):
     """ViewsListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     views: list[View] | None = Field(default=None)
     required_views: dict[str, Any] | None = Field(default=None)
@@ -744,13 +744,13 @@ class ViewsListResponse(BaseModel):
 
 class ViewResponse(BaseModel):
     """ViewResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     view: View | None = Field(default=None)
 
 class TimeEntry(BaseModel):
     """TimeEntry type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     task: dict[str, Any] | None = Field(default=None)
@@ -766,19 +766,19 @@ class TimeEntry(BaseModel):
 
 class TimeEntriesListResponse(BaseModel):
     """TimeEntriesListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[TimeEntry] | None = Field(default=None)
 
 class TimeEntryResponse(BaseModel):
     """TimeEntryResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: TimeEntry | None = Field(default=None)
 
 class Member(BaseModel):
     """Member type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     username: str | None = Field(default=None)
@@ -789,13 +789,13 @@ class Member(BaseModel):
 
 class MembersListResponse(BaseModel):
     """MembersListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     members: list[Member] | None = Field(default=None)
 
 class Doc(BaseModel):
     """Doc type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -811,7 +811,7 @@ class Doc(BaseModel):
 
 class DocsListResponse(BaseModel):
     """DocsListResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     docs: list[Doc] | None = Field(default=None)
     next_cursor: str | None = Field(default=None)
@@ -821,25 +821,25 @@ class DocsListResponse(BaseModel):
 
 class TasksListResultMeta(BaseModel):
     """Metadata for tasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     last_page: bool | None = Field(default=None)
 
 class TasksApiSearchResultMeta(BaseModel):
     """Metadata for tasks.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     last_page: bool | None = Field(default=None)
 
 class ViewTasksListResultMeta(BaseModel):
     """Metadata for view_tasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     last_page: bool | None = Field(default=None)
 
 class DocsListResultMeta(BaseModel):
     """Metadata for docs.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
@@ -896,7 +896,7 @@ D = TypeVar('D')
 
 class UserSearchData(BaseModel):
     """Search result data for user entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the user"""
@@ -906,7 +906,7 @@ class UserSearchData(BaseModel):
 
 class TeamsSearchData(BaseModel):
     """Search result data for teams entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the team (workspace)"""
@@ -916,7 +916,7 @@ class TeamsSearchData(BaseModel):
 
 class SpacesSearchData(BaseModel):
     """Search result data for spaces entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the space"""
@@ -928,7 +928,7 @@ class SpacesSearchData(BaseModel):
 
 class FoldersSearchData(BaseModel):
     """Search result data for folders entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the folder"""
@@ -942,7 +942,7 @@ class FoldersSearchData(BaseModel):
 
 class ListsSearchData(BaseModel):
     """Search result data for lists entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the list"""
@@ -962,7 +962,7 @@ class ListsSearchData(BaseModel):
 
 class TasksSearchData(BaseModel):
     """Search result data for tasks entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the task"""
@@ -986,7 +986,7 @@ class TasksSearchData(BaseModel):
 
 class CommentsSearchData(BaseModel):
     """Search result data for comments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the comment"""
@@ -1000,7 +1000,7 @@ class CommentsSearchData(BaseModel):
 
 class GoalsSearchData(BaseModel):
     """Search result data for goals entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the goal"""
@@ -1026,7 +1026,7 @@ class GoalsSearchData(BaseModel):
 
 class TimeTrackingSearchData(BaseModel):
     """Search result data for time_tracking entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     time: float | None = None
     """Total tracked time in milliseconds"""
@@ -1038,7 +1038,7 @@ class TimeTrackingSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1050,7 +1050,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -26,7 +26,7 @@ class ConfluenceAuthConfig(BaseModel):
 
 class SpaceLinks(BaseModel):
     """Links related to the space"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     webui: str | None = Field(default=None, description="Web UI link")
     """Web UI link"""
@@ -35,7 +35,7 @@ class SpaceLinks(BaseModel):
 
 class Space(BaseModel):
     """Confluence space object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     key: str | None = Field(default=None)
@@ -53,7 +53,7 @@ class Space(BaseModel):
 
 class SpacesListLinks(BaseModel):
     """Nested schema for SpacesList._links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None, description="URL for the next page of results")
     """URL for the next page of results"""
@@ -62,14 +62,14 @@ class SpacesListLinks(BaseModel):
 
 class SpacesList(BaseModel):
     """Paginated list of spaces"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Space] | None = Field(default=None)
     links: SpacesListLinks | None = Field(default=None, alias="_links")
 
 class PageLinks(BaseModel):
     """Links related to the page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     webui: str | None = Field(default=None, description="Web UI link")
     """Web UI link"""
@@ -84,7 +84,7 @@ class PageLinks(BaseModel):
 
 class PageVersion(BaseModel):
     """Version information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created_at: str | None = Field(default=None, alias="createdAt", description="Version creation timestamp")
     """Version creation timestamp"""
@@ -101,7 +101,7 @@ class PageVersion(BaseModel):
 
 class PageBody(BaseModel):
     """Page body content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     storage: dict[str, Any] | None = Field(default=None, description="Storage format body")
     """Storage format body"""
@@ -110,7 +110,7 @@ class PageBody(BaseModel):
 
 class Page(BaseModel):
     """Confluence page object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     status: str | None = Field(default=None)
@@ -129,7 +129,7 @@ class Page(BaseModel):
 
 class PagesListLinks(BaseModel):
     """Nested schema for PagesList._links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None, description="URL for the next page of results")
     """URL for the next page of results"""
@@ -138,14 +138,14 @@ class PagesListLinks(BaseModel):
 
 class PagesList(BaseModel):
     """Paginated list of pages"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Page] | None = Field(default=None)
     links: PagesListLinks | None = Field(default=None, alias="_links")
 
 class BlogPostVersion(BaseModel):
     """Version information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created_at: str | None = Field(default=None, alias="createdAt", description="Version creation timestamp")
     """Version creation timestamp"""
@@ -162,7 +162,7 @@ class BlogPostVersion(BaseModel):
 
 class BlogPostLinks(BaseModel):
     """Links related to the blog post"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     webui: str | None = Field(default=None, description="Web UI link")
     """Web UI link"""
@@ -177,7 +177,7 @@ class BlogPostLinks(BaseModel):
 
 class BlogPostBody(BaseModel):
     """Blog post body content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     storage: dict[str, Any] | None = Field(default=None, description="Storage format body")
     """Storage format body"""
@@ -186,7 +186,7 @@ class BlogPostBody(BaseModel):
 
 class BlogPost(BaseModel):
     """Confluence blog post object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     status: str | None = Field(default=None)
@@ -200,7 +200,7 @@ class BlogPost(BaseModel):
 
 class BlogPostsListLinks(BaseModel):
     """Nested schema for BlogPostsList._links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None, description="URL for the next page of results")
     """URL for the next page of results"""
@@ -209,21 +209,21 @@ class BlogPostsListLinks(BaseModel):
 
 class BlogPostsList(BaseModel):
     """Paginated list of blog posts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[BlogPost] | None = Field(default=None)
     links: BlogPostsListLinks | None = Field(default=None, alias="_links")
 
 class GroupLinks(BaseModel):
     """Links related to the group"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None, description="Self link")
     """Self link"""
 
 class Group(BaseModel):
     """Confluence group object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -235,7 +235,7 @@ class Group(BaseModel):
 
 class GroupsListLinks(BaseModel):
     """Nested schema for GroupsList._links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     base: str | None = Field(default=None)
     context: str | None = Field(default=None)
@@ -244,7 +244,7 @@ class GroupsListLinks(BaseModel):
 
 class GroupsList(BaseModel):
     """Paginated list of groups"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Group] | None = Field(default=None)
     start: int | None = Field(default=None)
@@ -254,7 +254,7 @@ class GroupsList(BaseModel):
 
 class AuditRecordAffectedobject(BaseModel):
     """Object affected by the audit event"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="Name of the affected object")
     """Name of the affected object"""
@@ -263,7 +263,7 @@ class AuditRecordAffectedobject(BaseModel):
 
 class AuditRecordAssociatedobjectsItem(BaseModel):
     """Nested schema for AuditRecord.associatedObjects_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="Name of the associated object")
     """Name of the associated object"""
@@ -272,7 +272,7 @@ class AuditRecordAssociatedobjectsItem(BaseModel):
 
 class AuditRecordAuthor(BaseModel):
     """User who triggered the audit event"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Author type")
     """Author type"""
@@ -291,7 +291,7 @@ class AuditRecordAuthor(BaseModel):
 
 class AuditRecord(BaseModel):
     """Confluence audit record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     author: AuditRecordAuthor | None = Field(default=None)
     remote_address: str | None = Field(default=None, alias="remoteAddress")
@@ -307,7 +307,7 @@ class AuditRecord(BaseModel):
 
 class AuditRecordsListLinks(BaseModel):
     """Nested schema for AuditRecordsList._links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     base: str | None = Field(default=None)
     context: str | None = Field(default=None)
@@ -316,7 +316,7 @@ class AuditRecordsListLinks(BaseModel):
 
 class AuditRecordsList(BaseModel):
     """Paginated list of audit records"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[AuditRecord] | None = Field(default=None)
     start: int | None = Field(default=None)
@@ -329,25 +329,25 @@ class AuditRecordsList(BaseModel):
 
 class SpacesListResultMeta(BaseModel):
     """Metadata for spaces.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class PagesListResultMeta(BaseModel):
     """Metadata for pages.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class BlogPostsListResultMeta(BaseModel):
     """Metadata for blog_posts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class GroupsListResultMeta(BaseModel):
     """Metadata for groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
     start: int | None = Field(default=None)
@@ -356,7 +356,7 @@ class GroupsListResultMeta(BaseModel):
 
 class AuditListResultMeta(BaseModel):
     """Metadata for audit.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
     start: int | None = Field(default=None)
@@ -416,7 +416,7 @@ D = TypeVar('D')
 
 class AuditSearchData(BaseModel):
     """Search result data for audit entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     affected_object: dict[str, Any] | None = None
     """The object that was affected by the audit event."""
@@ -444,7 +444,7 @@ class AuditSearchData(BaseModel):
 
 class BlogPostsSearchData(BaseModel):
     """Search result data for blog_posts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     links: dict[str, Any] | None = None
     """Links related to the blog post"""
@@ -468,7 +468,7 @@ class BlogPostsSearchData(BaseModel):
 
 class GroupsSearchData(BaseModel):
     """Search result data for groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     links: dict[str, Any] | None = None
     """Links related to the group"""
@@ -482,7 +482,7 @@ class GroupsSearchData(BaseModel):
 
 class PagesSearchData(BaseModel):
     """Search result data for pages entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     links: dict[str, Any] | None = None
     """Links related to the page"""
@@ -516,7 +516,7 @@ class PagesSearchData(BaseModel):
 
 class SpacesSearchData(BaseModel):
     """Search result data for spaces entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     links: dict[str, Any] | None = None
     """Links related to the space"""
@@ -546,7 +546,7 @@ class SpacesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -558,7 +558,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
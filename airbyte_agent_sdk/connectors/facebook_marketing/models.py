@@ -49,14 +49,14 @@ class FacebookMarketingReplicationConfig(BaseModel):
 
 class CurrentUser(BaseModel):
     """Current Facebook user associated with the access token"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
 
 class IssueInfo(BaseModel):
     """IssueInfo type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     error_code: str | None = Field(default=None)
     error_message: str | None = Field(default=None)
@@ -66,7 +66,7 @@ class IssueInfo(BaseModel):
 
 class AdLabel(BaseModel):
     """AdLabel type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -75,7 +75,7 @@ class AdLabel(BaseModel):
 
 class Campaign(BaseModel):
     """Facebook Ad Campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -105,7 +105,7 @@ class Campaign(BaseModel):
 
 class PagingCursors(BaseModel):
     """Nested schema for Paging.cursors"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     before: str | None | None = Field(default=None, description="Cursor for previous page")
     """Cursor for previous page"""
@@ -114,7 +114,7 @@ class PagingCursors(BaseModel):
 
 class Paging(BaseModel):
     """Paging type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursors: PagingCursors | None = Field(default=None)
     next: str | None = Field(default=None)
@@ -122,14 +122,14 @@ class Paging(BaseModel):
 
 class CampaignsList(BaseModel):
     """CampaignsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Campaign] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
 
 class AdSet(BaseModel):
     """Facebook Ad Set"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -154,14 +154,14 @@ class AdSet(BaseModel):
 
 class AdSetsList(BaseModel):
     """AdSetsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[AdSet] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
 
 class Recommendation(BaseModel):
     """Recommendation type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     blame_field: str | None = Field(default=None)
     code: int | None = Field(default=None)
@@ -172,7 +172,7 @@ class Recommendation(BaseModel):
 
 class Ad(BaseModel):
     """Facebook Ad"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -197,14 +197,14 @@ class Ad(BaseModel):
 
 class AdsList(BaseModel):
     """AdsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Ad] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
 
 class AdCreative(BaseModel):
     """Facebook Ad Creative"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -226,14 +226,14 @@ class AdCreative(BaseModel):
 
 class AdCreativesList(BaseModel):
     """AdCreativesList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[AdCreative] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
 
 class AdsActionStats(BaseModel):
     """Action statistics for Facebook ads"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     action_type: str | None = Field(default=None)
     action_destination: str | None = Field(default=None)
@@ -248,7 +248,7 @@ class AdsActionStats(BaseModel):
 
 class AdsInsight(BaseModel):
     """Facebook Ads Insight"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_id: str | None = Field(default=None)
     account_name: str | None = Field(default=None)
@@ -272,14 +272,14 @@ class AdsInsight(BaseModel):
 
 class AdsInsightsList(BaseModel):
     """AdsInsightsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[AdsInsight] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
 
 class AdAccount(BaseModel):
     """Facebook Ad Account"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     account_id: str | None = Field(default=None)
@@ -317,14 +317,14 @@ class AdAccount(BaseModel):
 
 class BusinessRef(BaseModel):
     """Reference to a Facebook Business"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
 
 class AdAccountListItem(BaseModel):
     """Facebook Ad Account in list response"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     account_id: str | None = Field(default=None)
@@ -344,14 +344,14 @@ class AdAccountListItem(BaseModel):
 
 class AdAccountsList(BaseModel):
     """List of Facebook Ad Accounts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[AdAccountListItem] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
 
 class DataSource(BaseModel):
     """DataSource type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     source_type: str | None = Field(default=None)
@@ -359,7 +359,7 @@ class DataSource(BaseModel):
 
 class CustomConversion(BaseModel):
     """Facebook Custom Conversion"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -381,14 +381,14 @@ class CustomConversion(BaseModel):
 
 class CustomConversionsList(BaseModel):
     """CustomConversionsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[CustomConversion] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
 
 class Image(BaseModel):
     """Image type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -410,14 +410,14 @@ class Image(BaseModel):
 
 class ImagesList(BaseModel):
     """ImagesList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Image] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
 
 class VideoFormat(BaseModel):
     """VideoFormat type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     filter: str | None = Field(default=None)
     embed_html: str | None = Field(default=None)
@@ -427,7 +427,7 @@ class VideoFormat(BaseModel):
 
 class Video(BaseModel):
     """Video type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     title: str | None = Field(default=None)
@@ -462,14 +462,14 @@ class Video(BaseModel):
 
 class VideosList(BaseModel):
     """VideosList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Video] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
 
 class PixelOwnerBusiness(BaseModel):
     """Business that owns the pixel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="Owner business ID")
     """Owner business ID"""
@@ -478,7 +478,7 @@ class PixelOwnerBusiness(BaseModel):
 
 class PixelOwnerAdAccount(BaseModel):
     """Ad account that owns the pixel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_id: str | None | None = Field(default=None, description="Owner ad account ID")
     """Owner ad account ID"""
@@ -487,7 +487,7 @@ class PixelOwnerAdAccount(BaseModel):
 
 class PixelCreator(BaseModel):
     """User who created the pixel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="Creator user ID")
     """Creator user ID"""
@@ -496,7 +496,7 @@ class PixelCreator(BaseModel):
 
 class Pixel(BaseModel):
     """Facebook Ads Pixel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -514,14 +514,14 @@ class Pixel(BaseModel):
 
 class PixelsList(BaseModel):
     """PixelsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Pixel] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
 
 class PixelStatDataItem(BaseModel):
     """Nested schema for PixelStat.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     timestamp: str | None | None = Field(default=None, description="Timestamp for the data point")
     """Timestamp for the data point"""
@@ -530,7 +530,7 @@ class PixelStatDataItem(BaseModel):
 
 class PixelStat(BaseModel):
     """Facebook Pixel event stat entry showing event counts and quality metrics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[PixelStatDataItem] | None = Field(default=None)
     event: str | None = Field(default=None)
@@ -542,13 +542,13 @@ class PixelStat(BaseModel):
 
 class PixelStatsList(BaseModel):
     """PixelStatsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[PixelStat] | None = Field(default=None)
 
 class BidInfo(BaseModel):
     """BidInfo type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     clicks: int | None = Field(default=None, alias="CLICKS")
     actions: int | None = Field(default=None, alias="ACTIONS")
@@ -558,13 +558,13 @@ class BidInfo(BaseModel):
 
 class BidConstraints(BaseModel):
     """BidConstraints type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     roas_average_floor: int | None = Field(default=None)
 
 class LearningStageInfo(BaseModel):
     """LearningStageInfo type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     status: str | None = Field(default=None)
     conversions: int | None = Field(default=None)
@@ -573,7 +573,7 @@ class LearningStageInfo(BaseModel):
 
 class PromotedObject(BaseModel):
     """PromotedObject type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     custom_event_type: str | None = Field(default=None)
     pixel_id: str | None = Field(default=None)
@@ -586,14 +586,14 @@ class PromotedObject(BaseModel):
 
 class AdCreativeRef(BaseModel):
     """AdCreativeRef type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     creative_id: str | None = Field(default=None)
 
 class CampaignCreateParams(BaseModel):
     """Parameters for creating a new campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     objective: str
@@ -606,13 +606,13 @@ class CampaignCreateParams(BaseModel):
 
 class CampaignCreateResponse(BaseModel):
     """Response from creating a campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
 
 class CampaignUpdateParams(BaseModel):
     """Parameters for updating a campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     status: str | None = Field(default=None)
@@ -623,13 +623,13 @@ class CampaignUpdateParams(BaseModel):
 
 class UpdateResponse(BaseModel):
     """Generic response from update operations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     success: bool | None = Field(default=None)
 
 class AdSetCreateParams(BaseModel):
     """Parameters for creating a new ad set"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     campaign_id: str
@@ -645,13 +645,13 @@ class AdSetCreateParams(BaseModel):
 
 class AdSetCreateResponse(BaseModel):
     """Response from creating an ad set"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
 
 class AdSetUpdateParams(BaseModel):
     """Parameters for updating an ad set"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     status: str | None = Field(default=None)
@@ -664,7 +664,7 @@ class AdSetUpdateParams(BaseModel):
 
 class AdCreateParams(BaseModel):
     """Parameters for creating a new ad. Note - requires a Facebook Page to be connected to the ad account."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     adset_id: str
@@ -675,13 +675,13 @@ class AdCreateParams(BaseModel):
 
 class AdCreateResponse(BaseModel):
     """Response from creating an ad"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
 
 class AdUpdateParams(BaseModel):
     """Parameters for updating an ad"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     status: str | None = Field(default=None)
@@ -691,7 +691,7 @@ class AdUpdateParams(BaseModel):
 
 class AdLibraryAdEstimatedAudienceSize(BaseModel):
     """Estimated audience size range"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     lower_bound: int | None | None = Field(default=None, description="Lower bound of the estimated audience size")
     """Lower bound of the estimated audience size"""
@@ -700,7 +700,7 @@ class AdLibraryAdEstimatedAudienceSize(BaseModel):
 
 class AdLibraryAdSpend(BaseModel):
     """Amount spent on the ad as a range"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     lower_bound: int | None | None = Field(default=None, description="Lower bound of spend")
     """Lower bound of spend"""
@@ -709,7 +709,7 @@ class AdLibraryAdSpend(BaseModel):
 
 class AdLibraryAdImpressions(BaseModel):
     """Number of impressions as a range"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     lower_bound: int | None | None = Field(default=None, description="Lower bound of impressions")
     """Lower bound of impressions"""
@@ -718,7 +718,7 @@ class AdLibraryAdImpressions(BaseModel):
 
 class AdLibraryAdDeliveryByRegionItem(BaseModel):
     """Nested schema for AdLibraryAd.delivery_by_region_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     region: str | None | None = Field(default=None, description="Region name")
     """Region name"""
@@ -727,7 +727,7 @@ class AdLibraryAdDeliveryByRegionItem(BaseModel):
 
 class AdLibraryAdDemographicDistributionItem(BaseModel):
     """Nested schema for AdLibraryAd.demographic_distribution_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     age: str | None | None = Field(default=None, description="Age range")
     """Age range"""
@@ -738,7 +738,7 @@ class AdLibraryAdDemographicDistributionItem(BaseModel):
 
 class AdLibraryAd(BaseModel):
     """An archived ad from the Facebook Ad Library, containing ad creative content, delivery information, spend data, and demographic reach breakdowns."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     ad_creation_time: str | None = Field(default=None)
@@ -771,7 +771,7 @@ class AdLibraryAd(BaseModel):
 
 class AdLibraryList(BaseModel):
     """AdLibraryList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[AdLibraryAd] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
@@ -781,67 +781,67 @@ class AdLibraryList(BaseModel):
 
 class AdAccountsListResultMeta(BaseModel):
     """Metadata for ad_accounts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
 class AdSetsListResultMeta(BaseModel):
     """Metadata for ad_sets.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
 class AdsListResultMeta(BaseModel):
     """Metadata for ads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
 class AdCreativesListResultMeta(BaseModel):
     """Metadata for ad_creatives.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
 class AdsInsightsListResultMeta(BaseModel):
     """Metadata for ads_insights.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
 class CustomConversionsListResultMeta(BaseModel):
     """Metadata for custom_conversions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
 class ImagesListResultMeta(BaseModel):
     """Metadata for images.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
 class VideosListResultMeta(BaseModel):
     """Metadata for videos.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
 class PixelsListResultMeta(BaseModel):
     """Metadata for pixels.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
 class AdLibraryListResultMeta(BaseModel):
     """Metadata for ad_library.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
 
@@ -898,7 +898,7 @@ D = TypeVar('D')
 
 class CampaignsSearchData(BaseModel):
     """Search result data for campaigns entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Campaign ID"""
@@ -930,7 +930,7 @@ class CampaignsSearchData(BaseModel):
 
 class AdSetsSearchData(BaseModel):
     """Search result data for ad_sets entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Ad Set ID"""
@@ -964,7 +964,7 @@ class AdSetsSearchData(BaseModel):
 
 class AdsSearchData(BaseModel):
     """Search result data for ads entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Ad ID"""
@@ -988,7 +988,7 @@ class AdsSearchData(BaseModel):
 
 class AdCreativesSearchData(BaseModel):
     """Search result data for ad_creatives entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Ad Creative ID"""
@@ -1014,7 +1014,7 @@ class AdCreativesSearchData(BaseModel):
 
 class AdsInsightsSearchData(BaseModel):
     """Search result data for ads_insights entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account_id: str | None = None
     """Ad account ID"""
@@ -1058,7 +1058,7 @@ class AdsInsightsSearchData(BaseModel):
 
 class AdAccountSearchData(BaseModel):
     """Search result data for ad_account entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Ad account ID"""
@@ -1086,7 +1086,7 @@ class AdAccountSearchData(BaseModel):
 
 class AdAccountsSearchData(BaseModel):
     """Search result data for ad_accounts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Ad account ID"""
@@ -1114,7 +1114,7 @@ class AdAccountsSearchData(BaseModel):
 
 class CustomConversionsSearchData(BaseModel):
     """Search result data for custom_conversions entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Custom Conversion ID"""
@@ -1138,7 +1138,7 @@ class CustomConversionsSearchData(BaseModel):
 
 class ImagesSearchData(BaseModel):
     """Search result data for images entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Image ID"""
@@ -1166,7 +1166,7 @@ class ImagesSearchData(BaseModel):
 
 class VideosSearchData(BaseModel):
     """Search result data for videos entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Video ID"""
@@ -1194,7 +1194,7 @@ class VideosSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1206,7 +1206,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -24,7 +24,7 @@ class FreshdeskAuthConfig(BaseModel):
 
 class Ticket(BaseModel):
     """A Freshdesk support ticket"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     subject: str | None = Field(default=None)
@@ -68,7 +68,7 @@ class Ticket(BaseModel):
 
 class Contact(BaseModel):
     """A Freshdesk contact (customer)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -105,7 +105,7 @@ class Contact(BaseModel):
 
 class AgentContact(BaseModel):
     """Contact details of the agent"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     active: bool | None | None = Field(default=None, description="Whether the contact is active")
     """Whether the contact is active"""
@@ -132,7 +132,7 @@ class AgentContact(BaseModel):
 
 class Agent(BaseModel):
     """A Freshdesk agent"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     available: bool | None = Field(default=None)
@@ -160,7 +160,7 @@ class Agent(BaseModel):
 
 class Group(BaseModel):
     """A Freshdesk group"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -178,7 +178,7 @@ class Group(BaseModel):
 
 class Company(BaseModel):
     """A Freshdesk company"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -197,7 +197,7 @@ class Company(BaseModel):
 
 class Role(BaseModel):
     """A Freshdesk role"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -209,7 +209,7 @@ class Role(BaseModel):
 
 class SatisfactionRating(BaseModel):
     """A Freshdesk satisfaction rating"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     survey_id: int | None = Field(default=None)
@@ -224,7 +224,7 @@ class SatisfactionRating(BaseModel):
 
 class SurveyQuestionsItem(BaseModel):
     """Nested schema for Survey.questions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="Question ID")
     """Question ID"""
@@ -235,7 +235,7 @@ class SurveyQuestionsItem(BaseModel):
 
 class Survey(BaseModel):
     """A Freshdesk survey"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     title: str | None = Field(default=None)
@@ -246,7 +246,7 @@ class Survey(BaseModel):
 
 class TimeEntry(BaseModel):
     """A Freshdesk time entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     agent_id: int | None = Field(default=None)
@@ -264,7 +264,7 @@ class TimeEntry(BaseModel):
 
 class TicketField(BaseModel):
     """A Freshdesk ticket field definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -291,61 +291,61 @@ class TicketField(BaseModel):
 
 class TicketsListResultMeta(BaseModel):
     """Metadata for tickets.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ContactsListResultMeta(BaseModel):
     """Metadata for contacts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class AgentsListResultMeta(BaseModel):
     """Metadata for agents.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class GroupsListResultMeta(BaseModel):
     """Metadata for groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class CompaniesListResultMeta(BaseModel):
     """Metadata for companies.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class RolesListResultMeta(BaseModel):
     """Metadata for roles.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class SatisfactionRatingsListResultMeta(BaseModel):
     """Metadata for satisfaction_ratings.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class SurveysListResultMeta(BaseModel):
     """Metadata for surveys.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class TimeEntriesListResultMeta(BaseModel):
     """Metadata for time_entries.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class TicketFieldsListResultMeta(BaseModel):
     """Metadata for ticket_fields.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
@@ -402,7 +402,7 @@ D = TypeVar('D')
 
 class TicketsSearchData(BaseModel):
     """Search result data for tickets entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique ticket ID"""
@@ -476,7 +476,7 @@ class TicketsSearchData(BaseModel):
 
 class AgentsSearchData(BaseModel):
     """Search result data for agents entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique agent ID"""
@@ -504,7 +504,7 @@ class AgentsSearchData(BaseModel):
 
 class GroupsSearchData(BaseModel):
     """Search result data for groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique group ID"""
@@ -532,7 +532,7 @@ class GroupsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -544,7 +544,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
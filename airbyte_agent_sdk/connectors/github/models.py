@@ -44,7 +44,7 @@ class GithubReplicationConfig(BaseModel):
 
 class IssueCreateParams(BaseModel):
     """IssueCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str
     body: str | None = Field(default=None)
@@ -54,7 +54,7 @@ class IssueCreateParams(BaseModel):
 
 class IssueResponseAssigneesItem(BaseModel):
     """Nested schema for IssueResponse.assignees_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     login: str | None = Field(default=None)
     id: int | None = Field(default=None)
@@ -67,7 +67,7 @@ class IssueResponseAssigneesItem(BaseModel):
 
 class IssueResponseLabelsItem(BaseModel):
     """Nested schema for IssueResponse.labels_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     node_id: str | None = Field(default=None)
@@ -79,7 +79,7 @@ class IssueResponseLabelsItem(BaseModel):
 
 class IssueResponseAssignee(BaseModel):
     """Primary user assigned to this issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     login: str | None = Field(default=None)
     id: int | None = Field(default=None)
@@ -92,7 +92,7 @@ class IssueResponseAssignee(BaseModel):
 
 class IssueResponseReactions(BaseModel):
     """Reaction counts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     url: str | None = Field(default=None)
     total_count: int | None = Field(default=None)
@@ -107,7 +107,7 @@ class IssueResponseReactions(BaseModel):
 
 class IssueResponseIssueDependenciesSummary(BaseModel):
     """Summary of issue dependencies"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     blocked_by: int | None = Field(default=None)
     blocking: int | None = Field(default=None)
@@ -116,7 +116,7 @@ class IssueResponseIssueDependenciesSummary(BaseModel):
 
 class IssueResponseSubIssuesSummary(BaseModel):
     """Summary of sub-issues"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total: int | None = Field(default=None)
     completed: int | None = Field(default=None)
@@ -124,7 +124,7 @@ class IssueResponseSubIssuesSummary(BaseModel):
 
 class IssueResponseUser(BaseModel):
     """The user who created the issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     login: str | None = Field(default=None)
     id: int | None = Field(default=None)
@@ -137,7 +137,7 @@ class IssueResponseUser(BaseModel):
 
 class IssueResponse(BaseModel):
     """IssueResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     node_id: str | None = Field(default=None)
@@ -176,7 +176,7 @@ class IssueResponse(BaseModel):
 
 class IssueUpdateParams(BaseModel):
     """IssueUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str | None = Field(default=None)
     body: str | None = Field(default=None)
@@ -188,13 +188,13 @@ class IssueUpdateParams(BaseModel):
 
 class CommentCreateParams(BaseModel):
     """CommentCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     body: str
 
 class CommentResponseReactions(BaseModel):
     """Reaction counts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     url: str | None = Field(default=None)
     total_count: int | None = Field(default=None)
@@ -209,7 +209,7 @@ class CommentResponseReactions(BaseModel):
 
 class CommentResponseUser(BaseModel):
     """The user who created the comment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     login: str | None = Field(default=None)
     id: int | None = Field(default=None)
@@ -222,7 +222,7 @@ class CommentResponseUser(BaseModel):
 
 class CommentResponse(BaseModel):
     """CommentResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     node_id: str | None = Field(default=None)
@@ -239,7 +239,7 @@ class CommentResponse(BaseModel):
 
 class PullRequestCreateParams(BaseModel):
     """PullRequestCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str
     head: str
@@ -250,7 +250,7 @@ class PullRequestCreateParams(BaseModel):
 
 class PullRequestResponseBase(BaseModel):
     """The base branch"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     label: str | None = Field(default=None)
     ref: str | None = Field(default=None)
@@ -258,7 +258,7 @@ class PullRequestResponseBase(BaseModel):
 
 class PullRequestResponseLabelsItem(BaseModel):
     """Nested schema for PullRequestResponse.labels_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     node_id: str | None = Field(default=None)
@@ -270,7 +270,7 @@ class PullRequestResponseLabelsItem(BaseModel):
 
 class PullRequestResponseUser(BaseModel):
     """The user who created the pull request"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     login: str | None = Field(default=None)
     id: int | None = Field(default=None)
@@ -283,7 +283,7 @@ class PullRequestResponseUser(BaseModel):
 
 class PullRequestResponseAssigneesItem(BaseModel):
     """Nested schema for PullRequestResponse.assignees_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     login: str | None = Field(default=None)
     id: int | None = Field(default=None)
@@ -296,7 +296,7 @@ class PullRequestResponseAssigneesItem(BaseModel):
 
 class PullRequestResponseHead(BaseModel):
     """The head branch"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     label: str | None = Field(default=None)
     ref: str | None = Field(default=None)
@@ -304,7 +304,7 @@ class PullRequestResponseHead(BaseModel):
 
 class PullRequestResponse(BaseModel):
     """PullRequestResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     node_id: str | None = Field(default=None)
@@ -343,14 +343,14 @@ class PullRequestResponse(BaseModel):
 
 class RepositoriesListResultMeta(BaseModel):
     """Metadata for repositories.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class RepositoriesApiSearchResultMeta(BaseModel):
     """Metadata for repositories.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
@@ -358,42 +358,42 @@ class RepositoriesApiSearchResultMeta(BaseModel):
 
 class OrgRepositoriesListResultMeta(BaseModel):
     """Metadata for org_repositories.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class BranchesListResultMeta(BaseModel):
     """Metadata for branches.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class CommitsListResultMeta(BaseModel):
     """Metadata for commits.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class ReleasesListResultMeta(BaseModel):
     """Metadata for releases.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class IssuesListResultMeta(BaseModel):
     """Metadata for issues.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class IssuesApiSearchResultMeta(BaseModel):
     """Metadata for issues.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
@@ -401,14 +401,14 @@ class IssuesApiSearchResultMeta(BaseModel):
 
 class PullRequestsListResultMeta(BaseModel):
     """Metadata for pull_requests.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class PullRequestsApiSearchResultMeta(BaseModel):
     """Metadata for pull_requests.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
@@ -416,56 +416,56 @@ class PullRequestsApiSearchResultMeta(BaseModel):
 
 class ReviewsListResultMeta(BaseModel):
     """Metadata for reviews.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class CommentsListResultMeta(BaseModel):
     """Metadata for comments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class PrCommentsListResultMeta(BaseModel):
     """Metadata for pr_comments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class LabelsListResultMeta(BaseModel):
     """Metadata for labels.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class MilestonesListResultMeta(BaseModel):
     """Metadata for milestones.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class OrganizationsListResultMeta(BaseModel):
     """Metadata for organizations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class UsersApiSearchResultMeta(BaseModel):
     """Metadata for users.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
@@ -473,56 +473,56 @@ class UsersApiSearchResultMeta(BaseModel):
 
 class TeamsListResultMeta(BaseModel):
     """Metadata for teams.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class TagsListResultMeta(BaseModel):
     """Metadata for tags.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class StargazersListResultMeta(BaseModel):
     """Metadata for stargazers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class ViewerRepositoriesListResultMeta(BaseModel):
     """Metadata for viewer_repositories.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class ProjectsListResultMeta(BaseModel):
     """Metadata for projects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class ProjectItemsListResultMeta(BaseModel):
     """Metadata for project_items.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class DiscussionsListResultMeta(BaseModel):
     """Metadata for discussions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
 
 class DiscussionsApiSearchResultMeta(BaseModel):
     """Metadata for discussions.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None)
     end_cursor: str | None = Field(default=None)
@@ -581,7 +581,7 @@ D = TypeVar('D')
 
 class BranchesSearchData(BaseModel):
     """Search result data for branches entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     name: str | None = None
     """Branch name (e.g. `main`, `feature/foo`)"""
@@ -591,7 +591,7 @@ class BranchesSearchData(BaseModel):
 
 class CommentsSearchData(BaseModel):
     """Search result data for comments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the comment"""
@@ -611,7 +611,7 @@ class CommentsSearchData(BaseModel):
 
 class CommitsSearchData(BaseModel):
     """Search result data for commits entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     oid: str | None = None
     """Full Git commit SHA"""
@@ -637,25 +637,25 @@ class CommitsSearchData(BaseModel):
 
 class DirectoryContentSearchData(BaseModel):
     """Search result data for directory_content entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 
 class DiscussionsSearchData(BaseModel):
     """Search result data for discussions entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 
 class FileContentSearchData(BaseModel):
     """Search result data for file_content entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 
 class IssuesSearchData(BaseModel):
     """Search result data for issues entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the issue"""
@@ -683,7 +683,7 @@ class IssuesSearchData(BaseModel):
 
 class LabelsSearchData(BaseModel):
     """Search result data for labels entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the label"""
@@ -701,7 +701,7 @@ class LabelsSearchData(BaseModel):
 
 class MilestonesSearchData(BaseModel):
     """Search result data for milestones entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the milestone"""
@@ -727,7 +727,7 @@ class MilestonesSearchData(BaseModel):
 
 class OrganizationsSearchData(BaseModel):
     """Search result data for organizations entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the organization"""
@@ -751,25 +751,25 @@ class OrganizationsSearchData(BaseModel):
 
 class OrgRepositoriesSearchData(BaseModel):
     """Search result data for org_repositories entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 
 class PrCommentsSearchData(BaseModel):
     """Search result data for pr_comments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 
 class ProjectItemsSearchData(BaseModel):
     """Search result data for project_items entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 
 class ProjectsSearchData(BaseModel):
     """Search result data for projects entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the project"""
@@ -793,7 +793,7 @@ class ProjectsSearchData(BaseModel):
 
 class PullRequestsSearchData(BaseModel):
     """Search result data for pull_requests entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the pull request"""
@@ -827,7 +827,7 @@ class PullRequestsSearchData(BaseModel):
 
 class ReleasesSearchData(BaseModel):
     """Search result data for releases entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the release"""
@@ -853,7 +853,7 @@ class ReleasesSearchData(BaseModel):
 
 class RepositoriesSearchData(BaseModel):
     """Search result data for repositories entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the repository"""
@@ -885,7 +885,7 @@ class RepositoriesSearchData(BaseModel):
 
 class ReviewsSearchData(BaseModel):
     """Search result data for reviews entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the review"""
@@ -907,7 +907,7 @@ class ReviewsSearchData(BaseModel):
 
 class StargazersSearchData(BaseModel):
     """Search result data for stargazers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     starred_at: str | None = None
     """ISO 8601 timestamp when the user starred the repository"""
@@ -915,7 +915,7 @@ class StargazersSearchData(BaseModel):
 
 class TagsSearchData(BaseModel):
     """Search result data for tags entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     name: str | None = None
     """Tag name (e.g. `v1.2.3`)"""
@@ -925,7 +925,7 @@ class TagsSearchData(BaseModel):
 
 class TeamsSearchData(BaseModel):
     """Search result data for teams entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the team"""
@@ -949,7 +949,7 @@ class TeamsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """GraphQL node ID of the user"""
@@ -977,13 +977,13 @@ class UsersSearchData(BaseModel):
 
 class ViewerSearchData(BaseModel):
     """Search result data for viewer entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 
 class ViewerRepositoriesSearchData(BaseModel):
     """Search result data for viewer_repositories entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 
@@ -991,7 +991,7 @@ class ViewerRepositoriesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1003,7 +1003,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
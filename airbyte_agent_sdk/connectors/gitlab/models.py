@@ -51,7 +51,7 @@ class GitlabReplicationConfig(BaseModel):
 
 class Project(BaseModel):
     """GitLab project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -177,7 +177,7 @@ class Project(BaseModel):
 
 class Issue(BaseModel):
     """GitLab issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     iid: int | None = Field(default=None)
@@ -226,7 +226,7 @@ class Issue(BaseModel):
 
 class MergeRequest(BaseModel):
     """GitLab merge request"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     iid: int | None = Field(default=None)
@@ -293,7 +293,7 @@ class MergeRequest(BaseModel):
 
 class User(BaseModel):
     """GitLab user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     username: str | None = Field(default=None)
@@ -306,7 +306,7 @@ class User(BaseModel):
 
 class CommitStats(BaseModel):
     """Commit stats"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     additions: int | None = Field(default=None, description="Lines added")
     """Lines added"""
@@ -317,7 +317,7 @@ class CommitStats(BaseModel):
 
 class Commit(BaseModel):
     """GitLab commit"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     short_id: str | None = Field(default=None)
@@ -338,7 +338,7 @@ class Commit(BaseModel):
 
 class Group(BaseModel):
     """GitLab group"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -393,7 +393,7 @@ class Group(BaseModel):
 
 class Branch(BaseModel):
     """GitLab branch"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     merged: bool | None = Field(default=None)
@@ -407,7 +407,7 @@ class Branch(BaseModel):
 
 class Pipeline(BaseModel):
     """GitLab CI/CD pipeline"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     iid: int | None = Field(default=None)
@@ -423,7 +423,7 @@ class Pipeline(BaseModel):
 
 class Member(BaseModel):
     """GitLab group or project member"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     username: str | None = Field(default=None)
@@ -441,7 +441,7 @@ class Member(BaseModel):
 
 class Release(BaseModel):
     """GitLab release"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     tag_name: str | None = Field(default=None)
@@ -460,7 +460,7 @@ class Release(BaseModel):
 
 class Tag(BaseModel):
     """GitLab repository tag"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     message: str | None = Field(default=None)
@@ -472,7 +472,7 @@ class Tag(BaseModel):
 
 class Milestone(BaseModel):
     """GitLab milestone"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     iid: int | None = Field(default=None)
@@ -493,85 +493,85 @@ class Milestone(BaseModel):
 
 class ProjectsListResultMeta(BaseModel):
     """Metadata for projects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class IssuesListResultMeta(BaseModel):
     """Metadata for issues.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class MergeRequestsListResultMeta(BaseModel):
     """Metadata for merge_requests.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class CommitsListResultMeta(BaseModel):
     """Metadata for commits.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class GroupsListResultMeta(BaseModel):
     """Metadata for groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class BranchesListResultMeta(BaseModel):
     """Metadata for branches.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class PipelinesListResultMeta(BaseModel):
     """Metadata for pipelines.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class GroupMembersListResultMeta(BaseModel):
     """Metadata for group_members.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ProjectMembersListResultMeta(BaseModel):
     """Metadata for project_members.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ReleasesListResultMeta(BaseModel):
     """Metadata for releases.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class TagsListResultMeta(BaseModel):
     """Metadata for tags.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class GroupMilestonesListResultMeta(BaseModel):
     """Metadata for group_milestones.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ProjectMilestonesListResultMeta(BaseModel):
     """Metadata for project_milestones.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
@@ -628,7 +628,7 @@ D = TypeVar('D')
 
 class ProjectsSearchData(BaseModel):
     """Search result data for projects entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """ID of the project"""
@@ -792,7 +792,7 @@ class ProjectsSearchData(BaseModel):
 
 class IssuesSearchData(BaseModel):
     """Search result data for issues entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """ID of the issue"""
@@ -872,7 +872,7 @@ class IssuesSearchData(BaseModel):
 
 class MergeRequestsSearchData(BaseModel):
     """Search result data for merge_requests entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """ID of the merge request"""
@@ -978,7 +978,7 @@ class MergeRequestsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """ID of the user"""
@@ -998,7 +998,7 @@ class UsersSearchData(BaseModel):
 
 class CommitsSearchData(BaseModel):
     """Search result data for commits entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     project_id: int | None = None
     """ID of the project the commit belongs to"""
@@ -1036,7 +1036,7 @@ class CommitsSearchData(BaseModel):
 
 class GroupsSearchData(BaseModel):
     """Search result data for groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """ID of the group"""
@@ -1092,7 +1092,7 @@ class GroupsSearchData(BaseModel):
 
 class BranchesSearchData(BaseModel):
     """Search result data for branches entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     project_id: int | None = None
     """ID of the project the branch belongs to"""
@@ -1120,7 +1120,7 @@ class BranchesSearchData(BaseModel):
 
 class PipelinesSearchData(BaseModel):
     """Search result data for pipelines entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """ID of the pipeline"""
@@ -1148,7 +1148,7 @@ class PipelinesSearchData(BaseModel):
 
 class GroupMembersSearchData(BaseModel):
     """Search result data for group_members entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     group_id: int | None = None
     """ID of the group"""
@@ -1180,7 +1180,7 @@ class GroupMembersSearchData(BaseModel):
 
 class ProjectMembersSearchData(BaseModel):
     """Search result data for project_members entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     project_id: int | None = None
     """ID of the project"""
@@ -1212,7 +1212,7 @@ class ProjectMembersSearchData(BaseModel):
 
 class ReleasesSearchData(BaseModel):
     """Search result data for releases entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     name: str | None = None
     """Name of the release"""
@@ -1252,7 +1252,7 @@ class ReleasesSearchData(BaseModel):
 
 class TagsSearchData(BaseModel):
     """Search result data for tags entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     name: str | None = None
     """Name of the tag"""
@@ -1274,7 +1274,7 @@ class TagsSearchData(BaseModel):
 
 class GroupMilestonesSearchData(BaseModel):
     """Search result data for group_milestones entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """ID of the milestone"""
@@ -1304,7 +1304,7 @@ class GroupMilestonesSearchData(BaseModel):
 
 class ProjectMilestonesSearchData(BaseModel):
     """Search result data for project_milestones entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """ID of the milestone"""
@@ -1336,7 +1336,7 @@ class ProjectMilestonesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1348,7 +1348,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
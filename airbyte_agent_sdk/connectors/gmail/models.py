@@ -41,7 +41,7 @@ class GmailReplicationConfig(BaseModel):
 
 class Profile(BaseModel):
     """Gmail user profile information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email_address: str | None = Field(default=None, alias="emailAddress")
     messages_total: int | None = Field(default=None, alias="messagesTotal")
@@ -50,14 +50,14 @@ class Profile(BaseModel):
 
 class MessageHeader(BaseModel):
     """A single email header key-value pair"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     value: str | None = Field(default=None)
 
 class MessagePartBody(BaseModel):
     """The body data of a MIME message part"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     attachment_id: str | None = Field(default=None, alias="attachmentId")
     size: int | None = Field(default=None)
@@ -65,7 +65,7 @@ class MessagePartBody(BaseModel):
 
 class MessagePart(BaseModel):
     """A single MIME message part"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     part_id: str | None = Field(default=None, alias="partId")
     mime_type: str | None = Field(default=None, alias="mimeType")
@@ -76,7 +76,7 @@ class MessagePart(BaseModel):
 
 class Message(BaseModel):
     """A Gmail email message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     thread_id: str | None = Field(default=None, alias="threadId")
@@ -90,14 +90,14 @@ class Message(BaseModel):
 
 class MessageRef(BaseModel):
     """A lightweight reference to a message (used in list responses)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     thread_id: str | None = Field(default=None, alias="threadId")
 
 class MessagesListResponse(BaseModel):
     """Response from listing messages"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     messages: list[MessageRef] | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -105,14 +105,14 @@ class MessagesListResponse(BaseModel):
 
 class LabelColor(BaseModel):
     """The color to assign to a label"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     text_color: str | None = Field(default=None, alias="textColor")
     background_color: str | None = Field(default=None, alias="backgroundColor")
 
 class Label(BaseModel):
     """A Gmail label used to organize messages and threads"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -127,27 +127,27 @@ class Label(BaseModel):
 
 class LabelsListResponse(BaseModel):
     """Response from listing labels"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     labels: list[Label] | None = Field(default=None)
 
 class DraftRef(BaseModel):
     """A lightweight reference to a draft (used in list responses)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     message: Any | None = Field(default=None)
 
 class Draft(BaseModel):
     """A Gmail draft message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     message: Any | None = Field(default=None)
 
 class DraftsListResponse(BaseModel):
     """Response from listing drafts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     drafts: list[DraftRef] | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -155,7 +155,7 @@ class DraftsListResponse(BaseModel):
 
 class ThreadRef(BaseModel):
     """A lightweight reference to a thread (used in list responses)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     snippet: str | None = Field(default=None)
@@ -163,7 +163,7 @@ class ThreadRef(BaseModel):
 
 class Thread(BaseModel):
     """A Gmail thread (email conversation)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     snippet: str | None = Field(default=None)
@@ -172,7 +172,7 @@ class Thread(BaseModel):
 
 class ThreadsListResponse(BaseModel):
     """Response from listing threads"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     threads: list[ThreadRef] | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -180,21 +180,21 @@ class ThreadsListResponse(BaseModel):
 
 class MessageSendParams(BaseModel):
     """Parameters for sending a message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     raw: str
     thread_id: str | None = Field(default=None, alias="threadId")
 
 class MessageModifyParams(BaseModel):
     """Parameters for modifying message labels"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     add_label_ids: list[str] | None = Field(default=None, alias="addLabelIds")
     remove_label_ids: list[str] | None = Field(default=None, alias="removeLabelIds")
 
 class LabelCreateParamsColor(BaseModel):
     """The color to assign to the label"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     text_color: str | None = Field(default=None, alias="textColor", description="The text color of the label as a hex string (#RRGGBB)")
     """The text color of the label as a hex string (#RRGGBB)"""
@@ -203,7 +203,7 @@ class LabelCreateParamsColor(BaseModel):
 
 class LabelCreateParams(BaseModel):
     """Parameters for creating a label"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     message_list_visibility: str | None = Field(default=None, alias="messageListVisibility")
@@ -212,7 +212,7 @@ class LabelCreateParams(BaseModel):
 
 class LabelUpdateParamsColor(BaseModel):
     """The color to assign to the label"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     text_color: str | None = Field(default=None, alias="textColor", description="The text color of the label as a hex string (#RRGGBB)")
     """The text color of the label as a hex string (#RRGGBB)"""
@@ -221,7 +221,7 @@ class LabelUpdateParamsColor(BaseModel):
 
 class LabelUpdateParams(BaseModel):
     """Parameters for updating a label"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -231,7 +231,7 @@ class LabelUpdateParams(BaseModel):
 
 class DraftCreateParamsMessage(BaseModel):
     """The draft message content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     raw: str = Field(description="The draft message in RFC 2822 format, base64url encoded")
     """The draft message in RFC 2822 format, base64url encoded"""
@@ -240,13 +240,13 @@ class DraftCreateParamsMessage(BaseModel):
 
 class DraftCreateParams(BaseModel):
     """Parameters for creating or updating a draft"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     message: DraftCreateParamsMessage
 
 class DraftSendParams(BaseModel):
     """Parameters for sending an existing draft"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
 
@@ -255,21 +255,21 @@ class DraftSendParams(BaseModel):
 
 class MessagesListResultMeta(BaseModel):
     """Metadata for messages.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
     result_size_estimate: int | None = Field(default=None, alias="resultSizeEstimate")
 
 class DraftsListResultMeta(BaseModel):
     """Metadata for drafts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
     result_size_estimate: int | None = Field(default=None, alias="resultSizeEstimate")
 
 class ThreadsListResultMeta(BaseModel):
     """Metadata for threads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
     result_size_estimate: int | None = Field(default=None, alias="resultSizeEstimate")
@@ -327,7 +327,7 @@ D = TypeVar('D')
 
 class ProfileSearchData(BaseModel):
     """Search result data for profile entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     email_address: str | None = None
     """Email address of the authenticated Gmail account"""
@@ -341,7 +341,7 @@ class ProfileSearchData(BaseModel):
 
 class MessagesSearchData(BaseModel):
     """Search result data for messages entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the message"""
@@ -351,7 +351,7 @@ class MessagesSearchData(BaseModel):
 
 class LabelsSearchData(BaseModel):
     """Search result data for labels entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the label"""
@@ -367,7 +367,7 @@ class LabelsSearchData(BaseModel):
 
 class DraftsSearchData(BaseModel):
     """Search result data for drafts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the draft"""
@@ -377,7 +377,7 @@ class DraftsSearchData(BaseModel):
 
 class ThreadsSearchData(BaseModel):
     """Search result data for threads entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the thread"""
@@ -391,7 +391,7 @@ class ThreadsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -403,7 +403,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -43,7 +43,7 @@ GongAuthConfig = GongOauth20AuthenticationAuthConfig | GongAccessKeyAuthenticati
 
 class PaginationRecords(BaseModel):
     """Pagination metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_records: int | None = Field(default=None, alias="totalRecords")
     current_page_size: int | None = Field(default=None, alias="currentPageSize")
@@ -52,7 +52,7 @@ class PaginationRecords(BaseModel):
 
 class UserSettings(BaseModel):
     """User settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     web_conferences_recorded: bool | None = Field(default=None, alias="webConferencesRecorded")
     prevent_web_conference_recording: bool | None = Field(default=None, alias="preventWebConferenceRecording")
@@ -64,14 +64,14 @@ class UserSettings(BaseModel):
 
 class UserSpokenlanguagesItem(BaseModel):
     """Nested schema for User.spokenLanguages_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     language: str | None = Field(default=None)
     primary: bool | None = Field(default=None)
 
 class User(BaseModel):
     """User object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     email_address: str | None = Field(default=None, alias="emailAddress")
@@ -92,7 +92,7 @@ class User(BaseModel):
 
 class UsersResponse(BaseModel):
     """Response containing list of users"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     users: list[User] | None = Field(default=None)
     records: PaginationRecords | None = Field(default=None)
@@ -100,14 +100,14 @@ class UsersResponse(BaseModel):
 
 class UserResponse(BaseModel):
     """Response containing single user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user: User | None = Field(default=None)
     request_id: str | None = Field(default=None, alias="requestId")
 
 class Call(BaseModel):
     """Call object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     url: str | None = Field(default=None)
@@ -132,7 +132,7 @@ class Call(BaseModel):
 
 class CallsResponse(BaseModel):
     """Response containing list of calls"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     calls: list[Call] | None = Field(default=None)
     records: PaginationRecords | None = Field(default=None)
@@ -140,14 +140,14 @@ class CallsResponse(BaseModel):
 
 class CallResponse(BaseModel):
     """Response containing single call"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     call: Call | None = Field(default=None)
     request_id: str | None = Field(default=None, alias="requestId")
 
 class Workspace(BaseModel):
     """Workspace object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     workspace_id: str | None = Field(default=None, alias="workspaceId")
@@ -156,14 +156,14 @@ class Workspace(BaseModel):
 
 class WorkspacesResponse(BaseModel):
     """Response containing list of workspaces"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     workspaces: list[Workspace] | None = Field(default=None)
     request_id: str | None = Field(default=None, alias="requestId")
 
 class CallTranscriptTranscriptItemSentencesItem(BaseModel):
     """Nested schema for CallTranscriptTranscriptItem.sentences_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start: int | None = Field(default=None, description="Start time in seconds")
     """Start time in seconds"""
@@ -174,7 +174,7 @@ class CallTranscriptTranscriptItemSentencesItem(BaseModel):
 
 class CallTranscriptTranscriptItem(BaseModel):
     """Nested schema for CallTranscript.transcript_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     speaker_id: str | None = Field(default=None, alias="speakerId", description="Speaker identifier")
     """Speaker identifier"""
@@ -184,14 +184,14 @@ class CallTranscriptTranscriptItem(BaseModel):
 
 class CallTranscript(BaseModel):
     """Call transcript object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     call_id: str | None = Field(default=None, alias="callId")
     transcript: list[CallTranscriptTranscriptItem] | None = Field(default=None)
 
 class TranscriptsResponse(BaseModel):
     """Response containing call transcripts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     call_transcripts: list[CallTranscript] | None = Field(default=None, alias="callTranscripts")
     records: PaginationRecords | None = Field(default=None)
@@ -199,7 +199,7 @@ class TranscriptsResponse(BaseModel):
 
 class ExtensiveCallInteractionInteractionstatsItem(BaseModel):
     """Nested schema for ExtensiveCallInteraction.interactionStats_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="Stat name")
     """Stat name"""
@@ -208,21 +208,21 @@ class ExtensiveCallInteractionInteractionstatsItem(BaseModel):
 
 class ExtensiveCallInteractionQuestions(BaseModel):
     """Nested schema for ExtensiveCallInteraction.questions"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     company_count: int | None = Field(default=None, alias="companyCount")
     non_company_count: int | None = Field(default=None, alias="nonCompanyCount")
 
 class ExtensiveCallInteraction(BaseModel):
     """Interaction statistics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     interaction_stats: list[ExtensiveCallInteractionInteractionstatsItem] | None = Field(default=None, alias="interactionStats")
     questions: ExtensiveCallInteractionQuestions | None = Field(default=None)
 
 class ExtensiveCallPartiesItemContextItemObjectsItemFieldsItem(BaseModel):
     """Nested schema for ExtensiveCallPartiesItemContextItemObjectsItem.fields_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="Field name")
     """Field name"""
@@ -231,7 +231,7 @@ class ExtensiveCallPartiesItemContextItemObjectsItemFieldsItem(BaseModel):
 
 class ExtensiveCallPartiesItemContextItemObjectsItem(BaseModel):
     """Nested schema for ExtensiveCallPartiesItemContextItem.objects_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_type: str | None = Field(default=None, alias="objectType", description="CRM object type (Account, Contact, Opportunity, Lead)")
     """CRM object type (Account, Contact, Opportunity, Lead)"""
@@ -242,7 +242,7 @@ class ExtensiveCallPartiesItemContextItemObjectsItem(BaseModel):
 
 class ExtensiveCallPartiesItemContextItem(BaseModel):
     """Nested schema for ExtensiveCallPartiesItem.context_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     system: str | None = Field(default=None, description="CRM system name (e.g., Salesforce, HubSpot)")
     """CRM system name (e.g., Salesforce, HubSpot)"""
@@ -251,7 +251,7 @@ class ExtensiveCallPartiesItemContextItem(BaseModel):
 
 class ExtensiveCallPartiesItem(BaseModel):
     """Nested schema for ExtensiveCall.parties_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Party ID")
     """Party ID"""
@@ -276,7 +276,7 @@ class ExtensiveCallPartiesItem(BaseModel):
 
 class ExtensiveCallMetadata(BaseModel):
     """Call metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Unique call identifier")
     """Unique call identifier"""
@@ -321,7 +321,7 @@ class ExtensiveCallMetadata(BaseModel):
 
 class ExtensiveCallContentTrackersItem(BaseModel):
     """Nested schema for ExtensiveCallContent.trackers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -331,14 +331,14 @@ class ExtensiveCallContentTrackersItem(BaseModel):
 
 class ExtensiveCallContentTopicsItem(BaseModel):
     """Nested schema for ExtensiveCallContent.topics_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     duration: float | None = Field(default=None)
 
 class ExtensiveCallContent(BaseModel):
     """Content data including topics and trackers"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     topics: list[ExtensiveCallContentTopicsItem] | None = Field(default=None)
     trackers: list[ExtensiveCallContentTrackersItem] | None = Field(default=None)
@@ -346,20 +346,20 @@ class ExtensiveCallContent(BaseModel):
 
 class ExtensiveCallMedia(BaseModel):
     """Media URLs"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     audio_url: str | None = Field(default=None, alias="audioUrl")
     video_url: str | None = Field(default=None, alias="videoUrl")
 
 class ExtensiveCallCollaboration(BaseModel):
     """Collaboration data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     public_comments: list[dict[str, Any]] | None = Field(default=None, alias="publicComments")
 
 class ExtensiveCall(BaseModel):
     """Detailed call object with extended information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     meta_data: ExtensiveCallMetadata | None = Field(default=None, alias="metaData")
     parties: list[ExtensiveCallPartiesItem] | None = Field(default=None)
@@ -370,7 +370,7 @@ class ExtensiveCall(BaseModel):
 
 class ExtensiveCallsResponse(BaseModel):
     """Response containing detailed call data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     calls: list[ExtensiveCall] | None = Field(default=None)
     records: PaginationRecords | None = Field(default=None)
@@ -378,7 +378,7 @@ class ExtensiveCallsResponse(BaseModel):
 
 class UserAggregateActivityStats(BaseModel):
     """Aggregated activity statistics for a user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     calls_as_host: int | None = Field(default=None, alias="callsAsHost")
     calls_gave_feedback: int | None = Field(default=None, alias="callsGaveFeedback")
@@ -398,7 +398,7 @@ class UserAggregateActivityStats(BaseModel):
 
 class UserAggregateActivity(BaseModel):
     """User with aggregated activity statistics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user_id: str | None = Field(default=None, alias="userId")
     user_email_address: str | None = Field(default=None, alias="userEmailAddress")
@@ -406,7 +406,7 @@ class UserAggregateActivity(BaseModel):
 
 class ActivityAggregateResponse(BaseModel):
     """Response containing aggregated activity statistics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     request_id: str | None = Field(default=None, alias="requestId")
     records: PaginationRecords | None = Field(default=None)
@@ -417,7 +417,7 @@ class ActivityAggregateResponse(BaseModel):
 
 class DailyActivityStats(BaseModel):
     """Daily activity statistics with call IDs"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     calls_as_host: list[str] | None = Field(default=None, alias="callsAsHost")
     calls_gave_feedback: list[str] | None = Field(default=None, alias="callsGaveFeedback")
@@ -439,7 +439,7 @@ class DailyActivityStats(BaseModel):
 
 class UserDetailedActivity(BaseModel):
     """User with detailed daily activity statistics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user_id: str | None = Field(default=None, alias="userId")
     user_email_address: str | None = Field(default=None, alias="userEmailAddress")
@@ -447,7 +447,7 @@ class UserDetailedActivity(BaseModel):
 
 class ActivityDayByDayResponse(BaseModel):
     """Response containing daily activity statistics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     request_id: str | None = Field(default=None, alias="requestId")
     records: PaginationRecords | None = Field(default=None)
@@ -455,14 +455,14 @@ class ActivityDayByDayResponse(BaseModel):
 
 class PersonInteractionStat(BaseModel):
     """Individual interaction statistic"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     value: float | None = Field(default=None)
 
 class UserInteractionStats(BaseModel):
     """User with interaction statistics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user_id: str | None = Field(default=None, alias="userId")
     user_email_address: str | None = Field(default=None, alias="userEmailAddress")
@@ -470,7 +470,7 @@ class UserInteractionStats(BaseModel):
 
 class InteractionStatsResponse(BaseModel):
     """Response containing interaction statistics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     request_id: str | None = Field(default=None, alias="requestId")
     records: PaginationRecords | None = Field(default=None)
@@ -481,7 +481,7 @@ class InteractionStatsResponse(BaseModel):
 
 class ScorecardQuestionAnsweroptionsItem(BaseModel):
     """Nested schema for ScorecardQuestion.answerOptions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     option_id: str | None = Field(default=None, alias="optionId")
     option_text: str | None = Field(default=None, alias="optionText")
@@ -489,7 +489,7 @@ class ScorecardQuestionAnsweroptionsItem(BaseModel):
 
 class ScorecardQuestion(BaseModel):
     """A question within a scorecard"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     question_id: str | None = Field(default=None, alias="questionId")
     question_revision_id: str | None = Field(default=None, alias="questionRevisionId")
@@ -507,7 +507,7 @@ class ScorecardQuestion(BaseModel):
 
 class Scorecard(BaseModel):
     """Scorecard configuration"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     scorecard_id: str | None = Field(default=None, alias="scorecardId")
     scorecard_name: str | None = Field(default=None, alias="scorecardName")
@@ -521,14 +521,14 @@ class Scorecard(BaseModel):
 
 class ScorecardsResponse(BaseModel):
     """Response containing list of scorecards"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     request_id: str | None = Field(default=None, alias="requestId")
     scorecards: list[Scorecard] | None = Field(default=None)
 
 class TrackerLanguagekeywordsItem(BaseModel):
     """Nested schema for Tracker.languageKeywords_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     language: str | None = Field(default=None, description="Language code")
     """Language code"""
@@ -539,7 +539,7 @@ class TrackerLanguagekeywordsItem(BaseModel):
 
 class Tracker(BaseModel):
     """Keyword tracker configuration"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     tracker_id: str | None = Field(default=None, alias="trackerId")
     tracker_name: str | None = Field(default=None, alias="trackerName")
@@ -559,14 +559,14 @@ class Tracker(BaseModel):
 
 class TrackersResponse(BaseModel):
     """Response containing list of trackers"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     request_id: str | None = Field(default=None, alias="requestId")
     keyword_trackers: list[Tracker] | None = Field(default=None, alias="keywordTrackers")
 
 class LibraryFolder(BaseModel):
     """Library folder structure"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -576,14 +576,14 @@ class LibraryFolder(BaseModel):
 
 class LibraryFoldersResponse(BaseModel):
     """Response containing library folder structure"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     request_id: str | None = Field(default=None, alias="requestId")
     folders: list[LibraryFolder] | None = Field(default=None)
 
 class FolderCall(BaseModel):
     """Call within a library folder"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     call_id: str | None = Field(default=None, alias="callId")
     title: str | None = Field(default=None)
@@ -594,7 +594,7 @@ class FolderCall(BaseModel):
 
 class FolderContentResponse(BaseModel):
     """Response containing calls in a folder"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     request_id: str | None = Field(default=None, alias="requestId")
     id: str | None = Field(default=None)
@@ -606,7 +606,7 @@ class FolderContentResponse(BaseModel):
 
 class CoachingMetrics(BaseModel):
     """Coaching metrics for a user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     calls_listened: int | None = Field(default=None, alias="callsListened")
     calls_attended: int | None = Field(default=None, alias="callsAttended")
@@ -616,7 +616,7 @@ class CoachingMetrics(BaseModel):
 
 class CoachingData(BaseModel):
     """Coaching data for a user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user_id: str | None = Field(default=None, alias="userId")
     user_email_address: str | None = Field(default=None, alias="userEmailAddress")
@@ -626,7 +626,7 @@ class CoachingData(BaseModel):
 
 class CoachingResponse(BaseModel):
     """Response containing coaching metrics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     request_id: str | None = Field(default=None, alias="requestId")
     coaching_data: list[CoachingData] | None = Field(default=None, alias="coachingData")
@@ -635,7 +635,7 @@ class CoachingResponse(BaseModel):
 
 class AnsweredScorecardAnswer(BaseModel):
     """An answer to a scorecard question"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     question_id: str | None = Field(default=None, alias="questionId")
     question_revision_id: str | None = Field(default=None, alias="questionRevisionId")
@@ -648,7 +648,7 @@ class AnsweredScorecardAnswer(BaseModel):
 
 class AnsweredScorecard(BaseModel):
     """A completed scorecard"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     answered_scorecard_id: str | None = Field(default=None, alias="answeredScorecardId")
     scorecard_id: str | None = Field(default=None, alias="scorecardId")
@@ -668,7 +668,7 @@ class AnsweredScorecard(BaseModel):
 
 class AnsweredScorecardsResponse(BaseModel):
     """Response containing answered scorecards"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     request_id: str | None = Field(default=None, alias="requestId")
     answered_scorecards: list[AnsweredScorecard] | None = Field(default=None, alias="answeredScorecards")
@@ -679,7 +679,7 @@ class AnsweredScorecardsResponse(BaseModel):
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     total_records: int | None = Field(default=None)
@@ -687,7 +687,7 @@ class UsersListResultMeta(BaseModel):
 
 class CallsListResultMeta(BaseModel):
     """Metadata for calls.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     total_records: int | None = Field(default=None)
@@ -695,7 +695,7 @@ class CallsListResultMeta(BaseModel):
 
 class CallsExtensiveListResultMeta(BaseModel):
     """Metadata for calls_extensive.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     total_records: int | None = Field(default=None)
@@ -703,7 +703,7 @@ class CallsExtensiveListResultMeta(BaseModel):
 
 class CallTranscriptsListResultMeta(BaseModel):
     """Metadata for call_transcripts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     total_records: int | None = Field(default=None)
@@ -711,7 +711,7 @@ class CallTranscriptsListResultMeta(BaseModel):
 
 class StatsActivityAggregateListResultMeta(BaseModel):
     """Metadata for stats_activity_aggregate.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     total_records: int | None = Field(default=None)
@@ -719,7 +719,7 @@ class StatsActivityAggregateListResultMeta(BaseModel):
 
 class StatsActivityDayByDayListResultMeta(BaseModel):
     """Metadata for stats_activity_day_by_day.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     total_records: int | None = Field(default=None)
@@ -727,7 +727,7 @@ class StatsActivityDayByDayListResultMeta(BaseModel):
 
 class StatsInteractionListResultMeta(BaseModel):
     """Metadata for stats_interaction.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     total_records: int | None = Field(default=None)
@@ -735,7 +735,7 @@ class StatsInteractionListResultMeta(BaseModel):
 
 class LibraryFolderContentListResultMeta(BaseModel):
     """Metadata for library_folder_content.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     total_records: int | None = Field(default=None)
@@ -743,7 +743,7 @@ class LibraryFolderContentListResultMeta(BaseModel):
 
 class StatsActivityScorecardsListResultMeta(BaseModel):
     """Metadata for stats_activity_scorecards.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     total_records: int | None = Field(default=None)
@@ -802,7 +802,7 @@ D = TypeVar('D')
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active: bool | None = None
     """Indicates if the user is currently active or not"""
@@ -840,7 +840,7 @@ class UsersSearchData(BaseModel):
 
 class CallsSearchData(BaseModel):
     """Search result data for calls entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     calendar_event_id: str | None = None
     """Unique identifier for the calendar event associated with the call."""
@@ -886,7 +886,7 @@ class CallsSearchData(BaseModel):
 
 class CallsExtensiveSearchData(BaseModel):
     """Search result data for calls_extensive entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the call (from metaData.id)."""
@@ -910,7 +910,7 @@ class CallsExtensiveSearchData(BaseModel):
 
 class SettingsScorecardsSearchData(BaseModel):
     """Search result data for settings_scorecards entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created: str | None = None
     """The timestamp when the scorecard was created"""
@@ -932,7 +932,7 @@ class SettingsScorecardsSearchData(BaseModel):
 
 class StatsActivityScorecardsSearchData(BaseModel):
     """Search result data for stats_activity_scorecards entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     answered_scorecard_id: str | None = None
     """Unique identifier for the answered scorecard instance."""
@@ -960,7 +960,7 @@ class StatsActivityScorecardsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -972,7 +972,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -45,27 +45,27 @@ class GoogleAdsReplicationConfig(BaseModel):
 
 class AccessibleCustomer(BaseModel):
     """An accessible customer derived from a resource name via x-airbyte-record-transform"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     customer_id: str | None = Field(default=None)
     resource_name: str | None = Field(default=None)
 
 class AccessibleCustomersList(BaseModel):
     """List of accessible customer resource names"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     resource_names: list[AccessibleCustomer] | None = Field(default=None, alias="resourceNames")
 
 class AccountCustomerConversiontrackingsetting(BaseModel):
     """Nested schema for AccountCustomer.conversionTrackingSetting"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     conversion_tracking_id: str | None = Field(default=None, alias="conversionTrackingId")
     cross_account_conversion_tracking_id: str | None = Field(default=None, alias="crossAccountConversionTrackingId")
 
 class AccountCustomerCallreportingsetting(BaseModel):
     """Nested schema for AccountCustomer.callReportingSetting"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     call_conversion_action: str | None = Field(default=None, alias="callConversionAction")
     call_conversion_reporting_enabled: bool | None = Field(default=None, alias="callConversionReportingEnabled")
@@ -73,13 +73,13 @@ class AccountCustomerCallreportingsetting(BaseModel):
 
 class AccountCustomerRemarketingsetting(BaseModel):
     """Nested schema for AccountCustomer.remarketingSetting"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     google_global_site_tag: str | None = Field(default=None, alias="googleGlobalSiteTag")
 
 class AccountCustomer(BaseModel):
     """Nested schema for Account.customer"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     auto_tagging_enabled: bool | None = Field(default=None, alias="autoTaggingEnabled", description="Whether auto-tagging is enabled")
     """Whether auto-tagging is enabled"""
@@ -107,13 +107,13 @@ class AccountCustomer(BaseModel):
 
 class Account(BaseModel):
     """Google Ads customer account"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     customer: AccountCustomer | None = Field(default=None)
 
 class AccountSearchResponse(BaseModel):
     """Search response containing account data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Account] | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -122,7 +122,7 @@ class AccountSearchResponse(BaseModel):
 
 class CampaignMetrics(BaseModel):
     """Nested schema for Campaign.metrics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     clicks: str | None = Field(default=None)
     ctr: float | None = Field(default=None)
@@ -136,7 +136,7 @@ class CampaignMetrics(BaseModel):
 
 class CampaignCampaignNetworksettings(BaseModel):
     """Nested schema for CampaignCampaign.networkSettings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     target_google_search: bool | None = Field(default=None, alias="targetGoogleSearch")
     target_search_network: bool | None = Field(default=None, alias="targetSearchNetwork")
@@ -145,7 +145,7 @@ class CampaignCampaignNetworksettings(BaseModel):
 
 class CampaignCampaign(BaseModel):
     """Nested schema for Campaign.campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Campaign ID")
     """Campaign ID"""
@@ -171,7 +171,7 @@ class CampaignCampaign(BaseModel):
 
 class CampaignCampaignbudget(BaseModel):
     """Nested schema for Campaign.campaignBudget"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     resource_name: str | None = Field(default=None, alias="resourceName", description="Resource name of the campaign budget")
     """Resource name of the campaign budget"""
@@ -180,14 +180,14 @@ class CampaignCampaignbudget(BaseModel):
 
 class CampaignSegments(BaseModel):
     """Nested schema for Campaign.segments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date: str | None = Field(default=None, description="Date in YYYY-MM-DD format")
     """Date in YYYY-MM-DD format"""
 
 class Campaign(BaseModel):
     """Google Ads campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     campaign: CampaignCampaign | None = Field(default=None)
     campaign_budget: CampaignCampaignbudget | None = Field(default=None, alias="campaignBudget")
@@ -196,7 +196,7 @@ class Campaign(BaseModel):
 
 class CampaignSearchResponse(BaseModel):
     """Search response containing campaign data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Campaign] | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -205,19 +205,19 @@ class CampaignSearchResponse(BaseModel):
 
 class AdGroupMetrics(BaseModel):
     """Nested schema for AdGroup.metrics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cost_micros: str | None = Field(default=None, alias="costMicros")
 
 class AdGroupSegments(BaseModel):
     """Nested schema for AdGroup.segments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date: str | None = Field(default=None)
 
 class AdGroupAdgroup(BaseModel):
     """Nested schema for AdGroup.adGroup"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Ad group ID")
     """Ad group ID"""
@@ -244,7 +244,7 @@ class AdGroupAdgroup(BaseModel):
 
 class AdGroupCampaign(BaseModel):
     """Nested schema for AdGroup.campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Parent campaign ID")
     """Parent campaign ID"""
@@ -253,7 +253,7 @@ class AdGroupCampaign(BaseModel):
 
 class AdGroup(BaseModel):
     """Google Ads ad group"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     campaign: AdGroupCampaign | None = Field(default=None)
     ad_group: AdGroupAdgroup | None = Field(default=None, alias="adGroup")
@@ -262,7 +262,7 @@ class AdGroup(BaseModel):
 
 class AdGroupSearchResponse(BaseModel):
     """Search response containing ad group data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[AdGroup] | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -271,7 +271,7 @@ class AdGroupSearchResponse(BaseModel):
 
 class AdGroupAdAdgroupadAd(BaseModel):
     """Nested schema for AdGroupAdAdgroupad.ad"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Ad ID")
     """Ad ID"""
@@ -286,14 +286,14 @@ class AdGroupAdAdgroupadAd(BaseModel):
 
 class AdGroupAdAdgroupadPolicysummary(BaseModel):
     """Nested schema for AdGroupAdAdgroupad.policySummary"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     approval_status: str | None = Field(default=None, alias="approvalStatus")
     review_status: str | None = Field(default=None, alias="reviewStatus")
 
 class AdGroupAdAdgroupad(BaseModel):
     """Nested schema for AdGroupAd.adGroupAd"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad: AdGroupAdAdgroupadAd | None = Field(default=None)
     status: str | None = Field(default=None)
@@ -305,13 +305,13 @@ class AdGroupAdAdgroupad(BaseModel):
 
 class AdGroupAdSegments(BaseModel):
     """Nested schema for AdGroupAd.segments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date: str | None = Field(default=None)
 
 class AdGroupAdAdgroup(BaseModel):
     """Nested schema for AdGroupAd.adGroup"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Parent ad group ID")
     """Parent ad group ID"""
@@ -320,7 +320,7 @@ class AdGroupAdAdgroup(BaseModel):
 
 class AdGroupAd(BaseModel):
     """Google Ads ad group ad"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_group: AdGroupAdAdgroup | None = Field(default=None, alias="adGroup")
     ad_group_ad: AdGroupAdAdgroupad | None = Field(default=None, alias="adGroupAd")
@@ -328,7 +328,7 @@ class AdGroupAd(BaseModel):
 
 class AdGroupAdSearchResponse(BaseModel):
     """Search response containing ad group ad data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[AdGroupAd] | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -337,7 +337,7 @@ class AdGroupAdSearchResponse(BaseModel):
 
 class CampaignLabelLabel(BaseModel):
     """Nested schema for CampaignLabel.label"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -345,7 +345,7 @@ class CampaignLabelLabel(BaseModel):
 
 class CampaignLabelCampaignlabel(BaseModel):
     """Nested schema for CampaignLabel.campaignLabel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     campaign: str | None = Field(default=None)
     label: str | None = Field(default=None)
@@ -353,13 +353,13 @@ class CampaignLabelCampaignlabel(BaseModel):
 
 class CampaignLabelCampaign(BaseModel):
     """Nested schema for CampaignLabel.campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
 
 class CampaignLabel(BaseModel):
     """Campaign label association"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     campaign: CampaignLabelCampaign | None = Field(default=None)
     campaign_label: CampaignLabelCampaignlabel | None = Field(default=None, alias="campaignLabel")
@@ -367,7 +367,7 @@ class CampaignLabel(BaseModel):
 
 class CampaignLabelSearchResponse(BaseModel):
     """Search response containing campaign label data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[CampaignLabel] | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -376,13 +376,13 @@ class CampaignLabelSearchResponse(BaseModel):
 
 class AdGroupLabelAdgroup(BaseModel):
     """Nested schema for AdGroupLabel.adGroup"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
 
 class AdGroupLabelLabel(BaseModel):
     """Nested schema for AdGroupLabel.label"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -390,7 +390,7 @@ class AdGroupLabelLabel(BaseModel):
 
 class AdGroupLabelAdgrouplabel(BaseModel):
     """Nested schema for AdGroupLabel.adGroupLabel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_group: str | None = Field(default=None, alias="adGroup")
     label: str | None = Field(default=None)
@@ -398,7 +398,7 @@ class AdGroupLabelAdgrouplabel(BaseModel):
 
 class AdGroupLabel(BaseModel):
     """Ad group label association"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_group: AdGroupLabelAdgroup | None = Field(default=None, alias="adGroup")
     ad_group_label: AdGroupLabelAdgrouplabel | None = Field(default=None, alias="adGroupLabel")
@@ -406,7 +406,7 @@ class AdGroupLabel(BaseModel):
 
 class AdGroupLabelSearchResponse(BaseModel):
     """Search response containing ad group label data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[AdGroupLabel] | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -415,7 +415,7 @@ class AdGroupLabelSearchResponse(BaseModel):
 
 class AdGroupAdLabelAdgroupadlabel(BaseModel):
     """Nested schema for AdGroupAdLabel.adGroupAdLabel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_group_ad: str | None = Field(default=None, alias="adGroupAd")
     label: str | None = Field(default=None)
@@ -423,7 +423,7 @@ class AdGroupAdLabelAdgroupadlabel(BaseModel):
 
 class AdGroupAdLabelLabel(BaseModel):
     """Nested schema for AdGroupAdLabel.label"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -431,19 +431,19 @@ class AdGroupAdLabelLabel(BaseModel):
 
 class AdGroupAdLabelAdgroupadAd(BaseModel):
     """Nested schema for AdGroupAdLabelAdgroupad.ad"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
 
 class AdGroupAdLabelAdgroupad(BaseModel):
     """Nested schema for AdGroupAdLabel.adGroupAd"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad: AdGroupAdLabelAdgroupadAd | None = Field(default=None)
 
 class AdGroupAdLabel(BaseModel):
     """Ad group ad label association"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_group_ad: AdGroupAdLabelAdgroupad | None = Field(default=None, alias="adGroupAd")
     ad_group_ad_label: AdGroupAdLabelAdgroupadlabel | None = Field(default=None, alias="adGroupAdLabel")
@@ -451,7 +451,7 @@ class AdGroupAdLabel(BaseModel):
 
 class AdGroupAdLabelSearchResponse(BaseModel):
     """Search response containing ad group ad label data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[AdGroupAdLabel] | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -460,7 +460,7 @@ class AdGroupAdLabelSearchResponse(BaseModel):
 
 class CampaignMutateRequestOperationsItemUpdate(BaseModel):
     """Campaign fields to update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     resource_name: str = Field(alias="resourceName", description="Resource name of the campaign to update (e.g., customers/1234567890/campaigns/111222333)")
     """Resource name of the campaign to update (e.g., customers/1234567890/campaigns/111222333)"""
@@ -471,7 +471,7 @@ class CampaignMutateRequestOperationsItemUpdate(BaseModel):
 
 class CampaignMutateRequestOperationsItem(BaseModel):
     """Nested schema for CampaignMutateRequest.operations_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     update_mask: str | None = Field(default=None, alias="updateMask", description="Comma-separated list of field paths to update (e.g., name,status)")
     """Comma-separated list of field paths to update (e.g., name,status)"""
@@ -480,26 +480,26 @@ class CampaignMutateRequestOperationsItem(BaseModel):
 
 class CampaignMutateRequest(BaseModel):
     """Request to mutate (update) campaigns"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     operations: list[CampaignMutateRequestOperationsItem]
 
 class CampaignMutateResponseResultsItem(BaseModel):
     """Nested schema for CampaignMutateResponse.results_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     resource_name: str | None = Field(default=None, alias="resourceName", description="Resource name of the mutated campaign")
     """Resource name of the mutated campaign"""
 
 class CampaignMutateResponse(BaseModel):
     """Response from campaign mutate operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[CampaignMutateResponseResultsItem] | None = Field(default=None)
 
 class AdGroupMutateRequestOperationsItemUpdate(BaseModel):
     """Ad group fields to update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     resource_name: str = Field(alias="resourceName", description="Resource name of the ad group to update (e.g., customers/1234567890/adGroups/111222333)")
     """Resource name of the ad group to update (e.g., customers/1234567890/adGroups/111222333)"""
@@ -512,7 +512,7 @@ class AdGroupMutateRequestOperationsItemUpdate(BaseModel):
 
 class AdGroupMutateRequestOperationsItem(BaseModel):
     """Nested schema for AdGroupMutateRequest.operations_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     update_mask: str | None = Field(default=None, alias="updateMask", description="Comma-separated list of field paths to update (e.g., name,status,cpcBidMicros)")
     """Comma-separated list of field paths to update (e.g., name,status,cpcBidMicros)"""
@@ -521,26 +521,26 @@ class AdGroupMutateRequestOperationsItem(BaseModel):
 
 class AdGroupMutateRequest(BaseModel):
     """Request to mutate (update) ad groups"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     operations: list[AdGroupMutateRequestOperationsItem]
 
 class AdGroupMutateResponseResultsItem(BaseModel):
     """Nested schema for AdGroupMutateResponse.results_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     resource_name: str | None = Field(default=None, alias="resourceName", description="Resource name of the mutated ad group")
     """Resource name of the mutated ad group"""
 
 class AdGroupMutateResponse(BaseModel):
     """Response from ad group mutate operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[AdGroupMutateResponseResultsItem] | None = Field(default=None)
 
 class LabelMutateRequestOperationsItemCreateTextlabel(BaseModel):
     """Text label styling"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     background_color: str | None = Field(default=None, alias="backgroundColor", description="Background color in hex format (e.g., #FF0000)")
     """Background color in hex format (e.g., #FF0000)"""
@@ -549,7 +549,7 @@ class LabelMutateRequestOperationsItemCreateTextlabel(BaseModel):
 
 class LabelMutateRequestOperationsItemCreate(BaseModel):
     """Label to create"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str = Field(description="Name for the new label")
     """Name for the new label"""
@@ -560,33 +560,33 @@ class LabelMutateRequestOperationsItemCreate(BaseModel):
 
 class LabelMutateRequestOperationsItem(BaseModel):
     """Nested schema for LabelMutateRequest.operations_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     create: LabelMutateRequestOperationsItemCreate | None = Field(default=None, description="Label to create")
     """Label to create"""
 
 class LabelMutateRequest(BaseModel):
     """Request to create labels"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     operations: list[LabelMutateRequestOperationsItem]
 
 class LabelMutateResponseResultsItem(BaseModel):
     """Nested schema for LabelMutateResponse.results_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     resource_name: str | None = Field(default=None, alias="resourceName", description="Resource name of the created label")
     """Resource name of the created label"""
 
 class LabelMutateResponse(BaseModel):
     """Response from label mutate operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[LabelMutateResponseResultsItem] | None = Field(default=None)
 
 class CampaignLabelMutateRequestOperationsItemCreate(BaseModel):
     """Campaign label association to create"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     campaign: str = Field(description="Resource name of the campaign (e.g., customers/1234567890/campaigns/111222333)")
     """Resource name of the campaign (e.g., customers/1234567890/campaigns/111222333)"""
@@ -595,33 +595,33 @@ class CampaignLabelMutateRequestOperationsItemCreate(BaseModel):
 
 class CampaignLabelMutateRequestOperationsItem(BaseModel):
     """Nested schema for CampaignLabelMutateRequest.operations_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     create: CampaignLabelMutateRequestOperationsItemCreate | None = Field(default=None, description="Campaign label association to create")
     """Campaign label association to create"""
 
 class CampaignLabelMutateRequest(BaseModel):
     """Request to create campaign-label associations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     operations: list[CampaignLabelMutateRequestOperationsItem]
 
 class CampaignLabelMutateResponseResultsItem(BaseModel):
     """Nested schema for CampaignLabelMutateResponse.results_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     resource_name: str | None = Field(default=None, alias="resourceName", description="Resource name of the created campaign label association")
     """Resource name of the created campaign label association"""
 
 class CampaignLabelMutateResponse(BaseModel):
     """Response from campaign label mutate operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[CampaignLabelMutateResponseResultsItem] | None = Field(default=None)
 
 class AdGroupLabelMutateRequestOperationsItemCreate(BaseModel):
     """Ad group label association to create"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_group: str = Field(alias="adGroup", description="Resource name of the ad group (e.g., customers/1234567890/adGroups/111222333)")
     """Resource name of the ad group (e.g., customers/1234567890/adGroups/111222333)"""
@@ -630,27 +630,27 @@ class AdGroupLabelMutateRequestOperationsItemCreate(BaseModel):
 
 class AdGroupLabelMutateRequestOperationsItem(BaseModel):
     """Nested schema for AdGroupLabelMutateRequest.operations_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     create: AdGroupLabelMutateRequestOperationsItemCreate | None = Field(default=None, description="Ad group label association to create")
     """Ad group label association to create"""
 
 class AdGroupLabelMutateRequest(BaseModel):
     """Request to create ad group-label associations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     operations: list[AdGroupLabelMutateRequestOperationsItem]
 
 class AdGroupLabelMutateResponseResultsItem(BaseModel):
     """Nested schema for AdGroupLabelMutateResponse.results_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     resource_name: str | None = Field(default=None, alias="resourceName", description="Resource name of the created ad group label association")
     """Resource name of the created ad group label association"""
 
 class AdGroupLabelMutateResponse(BaseModel):
     """Response from ad group label mutate operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[AdGroupLabelMutateResponseResultsItem] | None = Field(default=None)
 
@@ -659,43 +659,43 @@ class AdGroupLabelMutateResponse(BaseModel):
 
 class AccountsListResultMeta(BaseModel):
     """Metadata for accounts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None)
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None)
 
 class AdGroupsListResultMeta(BaseModel):
     """Metadata for ad_groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None)
 
 class AdGroupAdsListResultMeta(BaseModel):
     """Metadata for ad_group_ads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None)
 
 class CampaignLabelsListResultMeta(BaseModel):
     """Metadata for campaign_labels.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None)
 
 class AdGroupLabelsListResultMeta(BaseModel):
     """Metadata for ad_group_labels.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None)
 
 class AdGroupAdLabelsListResultMeta(BaseModel):
     """Metadata for ad_group_ad_labels.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None)
 
@@ -752,7 +752,7 @@ D = TypeVar('D')
 
 class AccountsSearchData(BaseModel):
     """Search result data for accounts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     customer_auto_tagging_enabled: bool | None = None
     """Whether auto-tagging is enabled for the account"""
@@ -800,7 +800,7 @@ class AccountsSearchData(BaseModel):
 
 class CampaignsSearchData(BaseModel):
     """Search result data for campaigns entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     campaign_id: int | None = None
     """Campaign ID"""
@@ -866,7 +866,7 @@ class CampaignsSearchData(BaseModel):
 
 class AdGroupsSearchData(BaseModel):
     """Search result data for ad_groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     campaign_id: int | None = None
     """Parent campaign ID"""
@@ -916,7 +916,7 @@ class AdGroupsSearchData(BaseModel):
 
 class AdGroupAdsSearchData(BaseModel):
     """Search result data for ad_group_ads entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_group_id: int | None = None
     """Parent ad group ID"""
@@ -958,7 +958,7 @@ class AdGroupAdsSearchData(BaseModel):
 
 class CampaignLabelsSearchData(BaseModel):
     """Search result data for campaign_labels entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     campaign_id: int | None = None
     """Campaign ID"""
@@ -974,7 +974,7 @@ class CampaignLabelsSearchData(BaseModel):
 
 class AdGroupLabelsSearchData(BaseModel):
     """Search result data for ad_group_labels entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_group_id: int | None = None
     """Ad group ID"""
@@ -990,7 +990,7 @@ class AdGroupLabelsSearchData(BaseModel):
 
 class AdGroupAdLabelsSearchData(BaseModel):
     """Search result data for ad_group_ad_labels entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_group_ad_ad_id: int | None = None
     """Ad ID"""
@@ -1008,7 +1008,7 @@ class AdGroupAdLabelsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1020,7 +1020,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -38,39 +38,39 @@ class GoogleAnalyticsDataApiReplicationConfig(BaseModel):
 
 class DimensionValue(BaseModel):
     """DimensionValue type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     value: str | None = Field(default=None)
 
 class MetricValue(BaseModel):
     """MetricValue type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     value: str | None = Field(default=None)
 
 class Row(BaseModel):
     """Row type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     dimension_values: list[DimensionValue] | None = Field(default=None, alias="dimensionValues")
     metric_values: list[MetricValue] | None = Field(default=None, alias="metricValues")
 
 class DimensionHeader(BaseModel):
     """DimensionHeader type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class MetricHeader(BaseModel):
     """MetricHeader type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     type_: str | None = Field(default=None, alias="type")
 
 class RunReportResponseMetadata(BaseModel):
     """Nested schema for RunReportResponse.metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None, alias="currencyCode", description="The currency code used in this report")
     """The currency code used in this report"""
@@ -79,49 +79,49 @@ class RunReportResponseMetadata(BaseModel):
 
 class RunReportResponsePropertyquotaTokensperhour(BaseModel):
     """Nested schema for RunReportResponsePropertyquota.tokensPerHour"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     consumed: int | None = Field(default=None)
     remaining: int | None = Field(default=None)
 
 class RunReportResponsePropertyquotaTokensperprojectperhour(BaseModel):
     """Nested schema for RunReportResponsePropertyquota.tokensPerProjectPerHour"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     consumed: int | None = Field(default=None)
     remaining: int | None = Field(default=None)
 
 class RunReportResponsePropertyquotaTokensperday(BaseModel):
     """Nested schema for RunReportResponsePropertyquota.tokensPerDay"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     consumed: int | None = Field(default=None)
     remaining: int | None = Field(default=None)
 
 class RunReportResponsePropertyquotaConcurrentrequests(BaseModel):
     """Nested schema for RunReportResponsePropertyquota.concurrentRequests"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     consumed: int | None = Field(default=None)
     remaining: int | None = Field(default=None)
 
 class RunReportResponsePropertyquotaServererrorsperprojectperhour(BaseModel):
     """Nested schema for RunReportResponsePropertyquota.serverErrorsPerProjectPerHour"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     consumed: int | None = Field(default=None)
     remaining: int | None = Field(default=None)
 
 class RunReportResponsePropertyquotaPotentiallythresholdedrequestsperhour(BaseModel):
     """Nested schema for RunReportResponsePropertyquota.potentiallyThresholdedRequestsPerHour"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     consumed: int | None = Field(default=None)
     remaining: int | None = Field(default=None)
 
 class RunReportResponsePropertyquota(BaseModel):
     """Quota status for this Analytics property"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     tokens_per_day: RunReportResponsePropertyquotaTokensperday | None = Field(default=None, alias="tokensPerDay")
     tokens_per_hour: RunReportResponsePropertyquotaTokensperhour | None = Field(default=None, alias="tokensPerHour")
@@ -132,7 +132,7 @@ class RunReportResponsePropertyquota(BaseModel):
 
 class RunReportResponse(BaseModel):
     """Response from the runReport endpoint"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     dimension_headers: list[DimensionHeader] | None = Field(default=None, alias="dimensionHeaders")
     metric_headers: list[MetricHeader] | None = Field(default=None, alias="metricHeaders")
@@ -144,13 +144,13 @@ class RunReportResponse(BaseModel):
 
 class WebsiteOverviewRequestMetricsItem(BaseModel):
     """Nested schema for WebsiteOverviewRequest.metrics_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class WebsiteOverviewRequestDaterangesItem(BaseModel):
     """Nested schema for WebsiteOverviewRequest.dateRanges_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str | None = Field(default=None, alias="startDate", description="Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)")
     """Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)"""
@@ -159,13 +159,13 @@ class WebsiteOverviewRequestDaterangesItem(BaseModel):
 
 class WebsiteOverviewRequestDimensionsItem(BaseModel):
     """Nested schema for WebsiteOverviewRequest.dimensions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class WebsiteOverviewRequest(BaseModel):
     """Request body for website overview report"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date_ranges: list[WebsiteOverviewRequestDaterangesItem] | None = Field(default=None, alias="dateRanges")
     dimensions: list[WebsiteOverviewRequestDimensionsItem] | None = Field(default=None)
@@ -176,7 +176,7 @@ class WebsiteOverviewRequest(BaseModel):
 
 class DailyActiveUsersRequestDaterangesItem(BaseModel):
     """Nested schema for DailyActiveUsersRequest.dateRanges_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str | None = Field(default=None, alias="startDate", description="Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)")
     """Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)"""
@@ -185,19 +185,19 @@ class DailyActiveUsersRequestDaterangesItem(BaseModel):
 
 class DailyActiveUsersRequestDimensionsItem(BaseModel):
     """Nested schema for DailyActiveUsersRequest.dimensions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class DailyActiveUsersRequestMetricsItem(BaseModel):
     """Nested schema for DailyActiveUsersRequest.metrics_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class DailyActiveUsersRequest(BaseModel):
     """Request body for daily active users report"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date_ranges: list[DailyActiveUsersRequestDaterangesItem] | None = Field(default=None, alias="dateRanges")
     dimensions: list[DailyActiveUsersRequestDimensionsItem] | None = Field(default=None)
@@ -208,19 +208,19 @@ class DailyActiveUsersRequest(BaseModel):
 
 class WeeklyActiveUsersRequestMetricsItem(BaseModel):
     """Nested schema for WeeklyActiveUsersRequest.metrics_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class WeeklyActiveUsersRequestDimensionsItem(BaseModel):
     """Nested schema for WeeklyActiveUsersRequest.dimensions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class WeeklyActiveUsersRequestDaterangesItem(BaseModel):
     """Nested schema for WeeklyActiveUsersRequest.dateRanges_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str | None = Field(default=None, alias="startDate", description="Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)")
     """Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)"""
@@ -229,7 +229,7 @@ class WeeklyActiveUsersRequestDaterangesItem(BaseModel):
 
 class WeeklyActiveUsersRequest(BaseModel):
     """Request body for weekly active users report"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date_ranges: list[WeeklyActiveUsersRequestDaterangesItem] | None = Field(default=None, alias="dateRanges")
     dimensions: list[WeeklyActiveUsersRequestDimensionsItem] | None = Field(default=None)
@@ -240,7 +240,7 @@ class WeeklyActiveUsersRequest(BaseModel):
 
 class FourWeeklyActiveUsersRequestDaterangesItem(BaseModel):
     """Nested schema for FourWeeklyActiveUsersRequest.dateRanges_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str | None = Field(default=None, alias="startDate", description="Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)")
     """Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)"""
@@ -249,19 +249,19 @@ class FourWeeklyActiveUsersRequestDaterangesItem(BaseModel):
 
 class FourWeeklyActiveUsersRequestDimensionsItem(BaseModel):
     """Nested schema for FourWeeklyActiveUsersRequest.dimensions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class FourWeeklyActiveUsersRequestMetricsItem(BaseModel):
     """Nested schema for FourWeeklyActiveUsersRequest.metrics_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class FourWeeklyActiveUsersRequest(BaseModel):
     """Request body for four-weekly active users report"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date_ranges: list[FourWeeklyActiveUsersRequestDaterangesItem] | None = Field(default=None, alias="dateRanges")
     dimensions: list[FourWeeklyActiveUsersRequestDimensionsItem] | None = Field(default=None)
@@ -272,7 +272,7 @@ class FourWeeklyActiveUsersRequest(BaseModel):
 
 class TrafficSourcesRequestDaterangesItem(BaseModel):
     """Nested schema for TrafficSourcesRequest.dateRanges_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str | None = Field(default=None, alias="startDate", description="Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)")
     """Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)"""
@@ -281,19 +281,19 @@ class TrafficSourcesRequestDaterangesItem(BaseModel):
 
 class TrafficSourcesRequestDimensionsItem(BaseModel):
     """Nested schema for TrafficSourcesRequest.dimensions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class TrafficSourcesRequestMetricsItem(BaseModel):
     """Nested schema for TrafficSourcesRequest.metrics_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class TrafficSourcesRequest(BaseModel):
     """Request body for traffic sources report"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date_ranges: list[TrafficSourcesRequestDaterangesItem] | None = Field(default=None, alias="dateRanges")
     dimensions: list[TrafficSourcesRequestDimensionsItem] | None = Field(default=None)
@@ -304,7 +304,7 @@ class TrafficSourcesRequest(BaseModel):
 
 class PagesRequestDaterangesItem(BaseModel):
     """Nested schema for PagesRequest.dateRanges_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str | None = Field(default=None, alias="startDate", description="Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)")
     """Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)"""
@@ -313,19 +313,19 @@ class PagesRequestDaterangesItem(BaseModel):
 
 class PagesRequestDimensionsItem(BaseModel):
     """Nested schema for PagesRequest.dimensions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class PagesRequestMetricsItem(BaseModel):
     """Nested schema for PagesRequest.metrics_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class PagesRequest(BaseModel):
     """Request body for pages report"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date_ranges: list[PagesRequestDaterangesItem] | None = Field(default=None, alias="dateRanges")
     dimensions: list[PagesRequestDimensionsItem] | None = Field(default=None)
@@ -336,7 +336,7 @@ class PagesRequest(BaseModel):
 
 class DevicesRequestDaterangesItem(BaseModel):
     """Nested schema for DevicesRequest.dateRanges_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str | None = Field(default=None, alias="startDate", description="Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)")
     """Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)"""
@@ -345,19 +345,19 @@ class DevicesRequestDaterangesItem(BaseModel):
 
 class DevicesRequestMetricsItem(BaseModel):
     """Nested schema for DevicesRequest.metrics_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class DevicesRequestDimensionsItem(BaseModel):
     """Nested schema for DevicesRequest.dimensions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class DevicesRequest(BaseModel):
     """Request body for devices report"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date_ranges: list[DevicesRequestDaterangesItem] | None = Field(default=None, alias="dateRanges")
     dimensions: list[DevicesRequestDimensionsItem] | None = Field(default=None)
@@ -368,19 +368,19 @@ class DevicesRequest(BaseModel):
 
 class LocationsRequestMetricsItem(BaseModel):
     """Nested schema for LocationsRequest.metrics_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class LocationsRequestDimensionsItem(BaseModel):
     """Nested schema for LocationsRequest.dimensions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class LocationsRequestDaterangesItem(BaseModel):
     """Nested schema for LocationsRequest.dateRanges_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str | None = Field(default=None, alias="startDate", description="Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)")
     """Start date in YYYY-MM-DD format or relative (e.g., 30daysAgo)"""
@@ -389,7 +389,7 @@ class LocationsRequestDaterangesItem(BaseModel):
 
 class LocationsRequest(BaseModel):
     """Request body for locations report"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date_ranges: list[LocationsRequestDaterangesItem] | None = Field(default=None, alias="dateRanges")
     dimensions: list[LocationsRequestDimensionsItem] | None = Field(default=None)
@@ -403,49 +403,49 @@ class LocationsRequest(BaseModel):
 
 class WebsiteOverviewListResultMeta(BaseModel):
     """Metadata for website_overview.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     row_count: int | None = Field(default=None)
 
 class DailyActiveUsersListResultMeta(BaseModel):
     """Metadata for daily_active_users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     row_count: int | None = Field(default=None)
 
 class WeeklyActiveUsersListResultMeta(BaseModel):
     """Metadata for weekly_active_users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     row_count: int | None = Field(default=None)
 
 class FourWeeklyActiveUsersListResultMeta(BaseModel):
     """Metadata for four_weekly_active_users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     row_count: int | None = Field(default=None)
 
 class TrafficSourcesListResultMeta(BaseModel):
     """Metadata for traffic_sources.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     row_count: int | None = Field(default=None)
 
 class PagesListResultMeta(BaseModel):
     """Metadata for pages.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     row_count: int | None = Field(default=None)
 
 class DevicesListResultMeta(BaseModel):
     """Metadata for devices.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     row_count: int | None = Field(default=None)
 
 class LocationsListResultMeta(BaseModel):
     """Metadata for locations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     row_count: int | None = Field(default=None)
 
@@ -502,7 +502,7 @@ D = TypeVar('D')
 
 class WebsiteOverviewSearchData(BaseModel):
     """Search result data for website_overview entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     average_session_duration: float | None = None
     """Average duration of sessions in seconds"""
@@ -532,7 +532,7 @@ class WebsiteOverviewSearchData(BaseModel):
 
 class DailyActiveUsersSearchData(BaseModel):
     """Search result data for daily_active_users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active1_day_users: int | None = None
     """Number of distinct users active in the last 1 day"""
@@ -548,7 +548,7 @@ class DailyActiveUsersSearchData(BaseModel):
 
 class WeeklyActiveUsersSearchData(BaseModel):
     """Search result data for weekly_active_users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active7_day_users: int | None = None
     """Number of distinct users active in the last 7 days"""
@@ -564,7 +564,7 @@ class WeeklyActiveUsersSearchData(BaseModel):
 
 class FourWeeklyActiveUsersSearchData(BaseModel):
     """Search result data for four_weekly_active_users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active28_day_users: int | None = None
     """Number of distinct users active in the last 28 days"""
@@ -580,7 +580,7 @@ class FourWeeklyActiveUsersSearchData(BaseModel):
 
 class TrafficSourcesSearchData(BaseModel):
     """Search result data for traffic_sources entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     average_session_duration: float | None = None
     """Average duration of sessions in seconds"""
@@ -614,7 +614,7 @@ class TrafficSourcesSearchData(BaseModel):
 
 class PagesSearchData(BaseModel):
     """Search result data for pages entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     bounce_rate: float | None = None
     """Percentage of sessions that were single-page with no interaction"""
@@ -636,7 +636,7 @@ class PagesSearchData(BaseModel):
 
 class DevicesSearchData(BaseModel):
     """Search result data for devices entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     average_session_duration: float | None = None
     """Average duration of sessions in seconds"""
@@ -672,7 +672,7 @@ class DevicesSearchData(BaseModel):
 
 class LocationsSearchData(BaseModel):
     """Search result data for locations entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     average_session_duration: float | None = None
     """Average duration of sessions in seconds"""
@@ -710,7 +710,7 @@ class LocationsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -722,7 +722,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -43,7 +43,7 @@ class GoogleDriveReplicationConfig(BaseModel):
 
 class User(BaseModel):
     """Information about a Drive user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     display_name: str | None = Field(default=None, alias="displayName")
@@ -54,7 +54,7 @@ class User(BaseModel):
 
 class FileImagemediametadataLocation(BaseModel):
     """Nested schema for FileImagemediametadata.location"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     latitude: float | None | None = Field(default=None)
     longitude: float | None | None = Field(default=None)
@@ -62,7 +62,7 @@ class FileImagemediametadataLocation(BaseModel):
 
 class FileImagemediametadata(BaseModel):
     """Additional metadata about image media"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     width: int | None | None = Field(default=None)
     height: int | None | None = Field(default=None)
@@ -88,7 +88,7 @@ class FileImagemediametadata(BaseModel):
 
 class FileCapabilities(BaseModel):
     """Capabilities the current user has on this file"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     can_edit: bool | None | None = Field(default=None, alias="canEdit")
     can_comment: bool | None | None = Field(default=None, alias="canComment")
@@ -105,20 +105,20 @@ class FileCapabilities(BaseModel):
 
 class FileLabelinfo(BaseModel):
     """An overview of the labels on the file"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     labels: list[dict[str, Any]] | None | None = Field(default=None)
 
 class FileLinksharemetadata(BaseModel):
     """Contains details about the link URLs"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     security_update_eligible: bool | None | None = Field(default=None, alias="securityUpdateEligible")
     security_update_enabled: bool | None | None = Field(default=None, alias="securityUpdateEnabled")
 
 class FileContentrestrictionsItem(BaseModel):
     """Nested schema for File.contentRestrictions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     read_only: bool | None | None = Field(default=None, alias="readOnly")
     reason: str | None | None = Field(default=None)
@@ -128,7 +128,7 @@ class FileContentrestrictionsItem(BaseModel):
 
 class FileVideomediametadata(BaseModel):
     """Additional metadata about video media"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     width: int | None | None = Field(default=None)
     height: int | None | None = Field(default=None)
@@ -136,7 +136,7 @@ class FileVideomediametadata(BaseModel):
 
 class FileShortcutdetails(BaseModel):
     """Shortcut file details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     target_id: str | None | None = Field(default=None, alias="targetId")
     target_mime_type: str | None | None = Field(default=None, alias="targetMimeType")
@@ -144,7 +144,7 @@ class FileShortcutdetails(BaseModel):
 
 class File(BaseModel):
     """The metadata for a file"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -207,7 +207,7 @@ class File(BaseModel):
 
 class FilesListResponse(BaseModel):
     """A list of files"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -216,7 +216,7 @@ class FilesListResponse(BaseModel):
 
 class FileCreateParams(BaseModel):
     """Parameters for creating a new file or folder"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     mime_type: str | None = Field(default=None, alias="mimeType")
@@ -225,7 +225,7 @@ class FileCreateParams(BaseModel):
 
 class FileUpdateParams(BaseModel):
     """Parameters for updating file metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     description: str | None = Field(default=None)
@@ -233,7 +233,7 @@ class FileUpdateParams(BaseModel):
 
 class FileUploadParams(BaseModel):
     """Parameters for uploading a file with content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     file_content: str
@@ -244,7 +244,7 @@ class FileUploadParams(BaseModel):
 
 class DriveBackgroundimagefile(BaseModel):
     """An image file and cropping parameters for the background image"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     x_coordinate: float | None | None = Field(default=None, alias="xCoordinate")
@@ -253,7 +253,7 @@ class DriveBackgroundimagefile(BaseModel):
 
 class DriveCapabilities(BaseModel):
     """Capabilities the current user has on this shared drive"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     can_add_children: bool | None | None = Field(default=None, alias="canAddChildren")
     can_comment: bool | None | None = Field(default=None, alias="canComment")
@@ -278,7 +278,7 @@ class DriveCapabilities(BaseModel):
 
 class DriveRestrictions(BaseModel):
     """A set of restrictions that apply to this shared drive"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     copy_requires_writer_permission: bool | None | None = Field(default=None, alias="copyRequiresWriterPermission")
     domain_users_only: bool | None | None = Field(default=None, alias="domainUsersOnly")
@@ -288,7 +288,7 @@ class DriveRestrictions(BaseModel):
 
 class Drive(BaseModel):
     """Representation of a shared drive"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -305,7 +305,7 @@ class Drive(BaseModel):
 
 class DrivesListResponse(BaseModel):
     """A list of shared drives"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -313,7 +313,7 @@ class DrivesListResponse(BaseModel):
 
 class PermissionTeamdrivepermissiondetailsItem(BaseModel):
     """Nested schema for Permission.teamDrivePermissionDetails_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     team_drive_permission_type: str | None | None = Field(default=None, alias="teamDrivePermissionType")
     role: str | None | None = Field(default=None)
@@ -322,7 +322,7 @@ class PermissionTeamdrivepermissiondetailsItem(BaseModel):
 
 class PermissionPermissiondetailsItem(BaseModel):
     """Nested schema for Permission.permissionDetails_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     permission_type: str | None | None = Field(default=None, alias="permissionType")
     role: str | None | None = Field(default=None)
@@ -331,7 +331,7 @@ class PermissionPermissiondetailsItem(BaseModel):
 
 class Permission(BaseModel):
     """A permission for a file"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -351,7 +351,7 @@ class Permission(BaseModel):
 
 class PermissionsListResponse(BaseModel):
     """A list of permissions for a file"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -359,7 +359,7 @@ class PermissionsListResponse(BaseModel):
 
 class Reply(BaseModel):
     """A reply to a comment on a file"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -373,14 +373,14 @@ class Reply(BaseModel):
 
 class CommentQuotedfilecontent(BaseModel):
     """The file content to which the comment refers"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     mime_type: str | None | None = Field(default=None, alias="mimeType")
     value: str | None | None = Field(default=None)
 
 class Comment(BaseModel):
     """A comment on a file"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -399,7 +399,7 @@ class Comment(BaseModel):
 
 class CommentsListResponse(BaseModel):
     """A list of comments on a file"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -407,7 +407,7 @@ class CommentsListResponse(BaseModel):
 
 class RepliesListResponse(BaseModel):
     """A list of replies to a comment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -415,7 +415,7 @@ class RepliesListResponse(BaseModel):
 
 class Revision(BaseModel):
     """The metadata for a revision to a file"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -434,7 +434,7 @@ class Revision(BaseModel):
 
 class RevisionsListResponse(BaseModel):
     """A list of revisions of a file"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -442,7 +442,7 @@ class RevisionsListResponse(BaseModel):
 
 class Change(BaseModel):
     """A change to a file or shared drive"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     removed: bool | None = Field(default=None)
@@ -456,7 +456,7 @@ class Change(BaseModel):
 
 class ChangesListResponse(BaseModel):
     """A list of changes for a user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
@@ -465,14 +465,14 @@ class ChangesListResponse(BaseModel):
 
 class StartPageToken(BaseModel):
     """The starting page token for listing changes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     start_page_token: str | None = Field(default=None, alias="startPageToken")
 
 class AboutTeamdrivethemesItem(BaseModel):
     """Nested schema for About.teamDriveThemes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     background_image_link: str | None | None = Field(default=None, alias="backgroundImageLink")
@@ -480,7 +480,7 @@ class AboutTeamdrivethemesItem(BaseModel):
 
 class AboutStoragequota(BaseModel):
     """The user's storage quota limits and usage"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     limit: str | None | None = Field(default=None, description="The usage limit, if applicable")
     """The usage limit, if applicable"""
@@ -493,7 +493,7 @@ class AboutStoragequota(BaseModel):
 
 class AboutDrivethemesItem(BaseModel):
     """Nested schema for About.driveThemes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     background_image_link: str | None | None = Field(default=None, alias="backgroundImageLink")
@@ -501,7 +501,7 @@ class AboutDrivethemesItem(BaseModel):
 
 class About(BaseModel):
     """Information about the user, the user's Drive, and system capabilities"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     kind: str | None = Field(default=None)
     user: Any | None = Field(default=None)
@@ -522,44 +522,44 @@ class About(BaseModel):
 
 class FilesListResultMeta(BaseModel):
     """Metadata for files.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
     incomplete_search: bool | None = Field(default=None, alias="incompleteSearch")
 
 class DrivesListResultMeta(BaseModel):
     """Metadata for drives.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class PermissionsListResultMeta(BaseModel):
     """Metadata for permissions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class CommentsListResultMeta(BaseModel):
     """Metadata for comments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class RepliesListResultMeta(BaseModel):
     """Metadata for replies.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class RevisionsListResultMeta(BaseModel):
     """Metadata for revisions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class ChangesListResultMeta(BaseModel):
     """Metadata for changes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
     new_start_page_token: str | None = Field(default=None, alias="newStartPageToken")
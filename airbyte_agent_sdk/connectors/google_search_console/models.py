@@ -43,20 +43,20 @@ class GoogleSearchConsoleReplicationConfig(BaseModel):
 
 class Site(BaseModel):
     """A Search Console site resource."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     site_url: str | None = Field(default=None, alias="siteUrl")
     permission_level: str | None = Field(default=None, alias="permissionLevel")
 
 class SitesList(BaseModel):
     """Response containing a list of sites."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     site_entry: list[Site] | None = Field(default=None, alias="siteEntry")
 
 class SitemapContent(BaseModel):
     """Information about a specific content type in a sitemap."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     submitted: str | None = Field(default=None)
@@ -64,7 +64,7 @@ class SitemapContent(BaseModel):
 
 class Sitemap(BaseModel):
     """A sitemap resource with details about a submitted sitemap."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     path: str | None = Field(default=None)
     last_submitted: str | None = Field(default=None, alias="lastSubmitted")
@@ -78,13 +78,13 @@ class Sitemap(BaseModel):
 
 class SitemapsList(BaseModel):
     """Response containing a list of sitemaps."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     sitemap: list[Sitemap] | None = Field(default=None)
 
 class SearchAnalyticsByDateRequest(BaseModel):
     """Request body for search analytics query grouped by date."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str = Field(alias="startDate")
     end_date: str = Field(alias="endDate")
@@ -97,7 +97,7 @@ class SearchAnalyticsByDateRequest(BaseModel):
 
 class SearchAnalyticsByCountryRequest(BaseModel):
     """Request body for search analytics query grouped by date and country."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str = Field(alias="startDate")
     end_date: str = Field(alias="endDate")
@@ -110,7 +110,7 @@ class SearchAnalyticsByCountryRequest(BaseModel):
 
 class SearchAnalyticsByDeviceRequest(BaseModel):
     """Request body for search analytics query grouped by date and device."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str = Field(alias="startDate")
     end_date: str = Field(alias="endDate")
@@ -123,7 +123,7 @@ class SearchAnalyticsByDeviceRequest(BaseModel):
 
 class SearchAnalyticsByPageRequest(BaseModel):
     """Request body for search analytics query grouped by date and page."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str = Field(alias="startDate")
     end_date: str = Field(alias="endDate")
@@ -136,7 +136,7 @@ class SearchAnalyticsByPageRequest(BaseModel):
 
 class SearchAnalyticsByQueryRequest(BaseModel):
     """Request body for search analytics query grouped by date and query."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str = Field(alias="startDate")
     end_date: str = Field(alias="endDate")
@@ -149,7 +149,7 @@ class SearchAnalyticsByQueryRequest(BaseModel):
 
 class SearchAnalyticsAllFieldsRequest(BaseModel):
     """Request body for search analytics query grouped by all dimensions."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_date: str = Field(alias="startDate")
     end_date: str = Field(alias="endDate")
@@ -162,7 +162,7 @@ class SearchAnalyticsAllFieldsRequest(BaseModel):
 
 class SearchAnalyticsRow(BaseModel):
     """A row of search analytics data."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     keys: list[str] | None = Field(default=None)
     clicks: float | None = Field(default=None)
@@ -172,7 +172,7 @@ class SearchAnalyticsRow(BaseModel):
 
 class SearchAnalyticsResponse(BaseModel):
     """Response containing search analytics data."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rows: list[SearchAnalyticsRow] | None = Field(default=None)
     response_aggregation_type: str | None = Field(default=None, alias="responseAggregationType")
@@ -182,37 +182,37 @@ class SearchAnalyticsResponse(BaseModel):
 
 class SearchAnalyticsByDateListResultMeta(BaseModel):
     """Metadata for search_analytics_by_date.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     response_aggregation_type: str | None = Field(default=None)
 
 class SearchAnalyticsByCountryListResultMeta(BaseModel):
     """Metadata for search_analytics_by_country.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     response_aggregation_type: str | None = Field(default=None)
 
 class SearchAnalyticsByDeviceListResultMeta(BaseModel):
     """Metadata for search_analytics_by_device.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     response_aggregation_type: str | None = Field(default=None)
 
 class SearchAnalyticsByPageListResultMeta(BaseModel):
     """Metadata for search_analytics_by_page.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     response_aggregation_type: str | None = Field(default=None)
 
 class SearchAnalyticsByQueryListResultMeta(BaseModel):
     """Metadata for search_analytics_by_query.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     response_aggregation_type: str | None = Field(default=None)
 
 class SearchAnalyticsAllFieldsListResultMeta(BaseModel):
     """Metadata for search_analytics_all_fields.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     response_aggregation_type: str | None = Field(default=None)
 
@@ -269,7 +269,7 @@ D = TypeVar('D')
 
 class SitesSearchData(BaseModel):
     """Search result data for sites entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     permission_level: str | None = None
     """The user's permission level for the site (owner, full, restricted, etc.)"""
@@ -279,7 +279,7 @@ class SitesSearchData(BaseModel):
 
 class SitemapsSearchData(BaseModel):
     """Search result data for sitemaps entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     contents: list[Any] | None = None
     """Data related to the sitemap contents"""
@@ -303,7 +303,7 @@ class SitemapsSearchData(BaseModel):
 
 class SearchAnalyticsAllFieldsSearchData(BaseModel):
     """Search result data for search_analytics_all_fields entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     clicks: int | None = None
     """The number of times users clicked on the search result for a specific query"""
@@ -331,7 +331,7 @@ class SearchAnalyticsAllFieldsSearchData(BaseModel):
 
 class SearchAnalyticsByCountrySearchData(BaseModel):
     """Search result data for search_analytics_by_country entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     clicks: int | None = None
     """The number of times users clicked on the search result for a specific country"""
@@ -353,7 +353,7 @@ class SearchAnalyticsByCountrySearchData(BaseModel):
 
 class SearchAnalyticsByDateSearchData(BaseModel):
     """Search result data for search_analytics_by_date entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     clicks: int | None = None
     """The total number of clicks on the specific date"""
@@ -373,7 +373,7 @@ class SearchAnalyticsByDateSearchData(BaseModel):
 
 class SearchAnalyticsByDeviceSearchData(BaseModel):
     """Search result data for search_analytics_by_device entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     clicks: int | None = None
     """The total number of clicks by device type"""
@@ -395,7 +395,7 @@ class SearchAnalyticsByDeviceSearchData(BaseModel):
 
 class SearchAnalyticsByPageSearchData(BaseModel):
     """Search result data for search_analytics_by_page entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     clicks: int | None = None
     """The number of clicks for a specific page"""
@@ -417,7 +417,7 @@ class SearchAnalyticsByPageSearchData(BaseModel):
 
 class SearchAnalyticsByQuerySearchData(BaseModel):
     """Search result data for search_analytics_by_query entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     clicks: int | None = None
     """The number of clicks for the specific query"""
@@ -441,7 +441,7 @@ class SearchAnalyticsByQuerySearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -453,7 +453,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
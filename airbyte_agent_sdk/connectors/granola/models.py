@@ -24,27 +24,27 @@ class GranolaAuthConfig(BaseModel):
 
 class Owner(BaseModel):
     """The owner of the note"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     email: str | None = Field(default=None)
 
 class Attendee(BaseModel):
     """A meeting attendee"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     email: str | None = Field(default=None)
 
 class CalendarEventInvitee(BaseModel):
     """A calendar event invitee"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email: str | None = Field(default=None)
 
 class CalendarEvent(BaseModel):
     """Associated calendar event details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     event_title: str | None = Field(default=None)
     invitees: list[CalendarEventInvitee] | None = Field(default=None)
@@ -55,7 +55,7 @@ class CalendarEvent(BaseModel):
 
 class FolderMembership(BaseModel):
     """Folder the note belongs to"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -63,13 +63,13 @@ class FolderMembership(BaseModel):
 
 class TranscriptSpeaker(BaseModel):
     """Speaker information in transcript"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     source: str | None = Field(default=None)
 
 class TranscriptEntry(BaseModel):
     """A single transcript entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     speaker: Any | None = Field(default=None)
     text: str | None = Field(default=None)
@@ -78,7 +78,7 @@ class TranscriptEntry(BaseModel):
 
 class Note(BaseModel):
     """A Granola meeting note"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     object_: str | None = Field(default=None, alias="object")
@@ -95,7 +95,7 @@ class Note(BaseModel):
 
 class NotesList(BaseModel):
     """Paginated list of notes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     notes: list[Note] | None = Field(default=None)
     has_more: bool | None = Field(default=None, alias="hasMore")
@@ -106,7 +106,7 @@ class NotesList(BaseModel):
 
 class NotesListResultMeta(BaseModel):
     """Metadata for notes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
@@ -164,7 +164,7 @@ D = TypeVar('D')
 
 class NotesSearchData(BaseModel):
     """Search result data for notes entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """The unique identifier of the note."""
@@ -196,7 +196,7 @@ class NotesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -208,7 +208,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -24,7 +24,7 @@ class GreenhouseAuthConfig(BaseModel):
 
 class Attachment(BaseModel):
     """File attachment (resume, cover letter, etc.)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     filename: str | None = Field(default=None)
     url: str | None = Field(default=None)
@@ -33,7 +33,7 @@ class Attachment(BaseModel):
 
 class Candidate(BaseModel):
     """Greenhouse candidate object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     first_name: str | None = Field(default=None)
@@ -60,7 +60,7 @@ class Candidate(BaseModel):
 
 class Application(BaseModel):
     """Greenhouse application object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     candidate_id: int | None = Field(default=None)
@@ -86,7 +86,7 @@ class Application(BaseModel):
 
 class Job(BaseModel):
     """Greenhouse job object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -106,7 +106,7 @@ class Job(BaseModel):
 
 class Offer(BaseModel):
     """Greenhouse offer object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     version: int | None = Field(default=None)
@@ -124,7 +124,7 @@ class Offer(BaseModel):
 
 class User(BaseModel):
     """Greenhouse user object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -143,7 +143,7 @@ class User(BaseModel):
 
 class Department(BaseModel):
     """Greenhouse department object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -155,7 +155,7 @@ class Department(BaseModel):
 
 class Office(BaseModel):
     """Greenhouse office object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -169,7 +169,7 @@ class Office(BaseModel):
 
 class JobPost(BaseModel):
     """Greenhouse job post object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     title: str | None = Field(default=None)
@@ -189,7 +189,7 @@ class JobPost(BaseModel):
 
 class Source(BaseModel):
     """Greenhouse source object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -197,7 +197,7 @@ class Source(BaseModel):
 
 class ScheduledInterview(BaseModel):
     """Greenhouse scheduled interview object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     application_id: int | None = Field(default=None)
@@ -218,61 +218,61 @@ class ScheduledInterview(BaseModel):
 
 class CandidatesListResultMeta(BaseModel):
     """Metadata for candidates.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ApplicationsListResultMeta(BaseModel):
     """Metadata for applications.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class JobsListResultMeta(BaseModel):
     """Metadata for jobs.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class OffersListResultMeta(BaseModel):
     """Metadata for offers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class DepartmentsListResultMeta(BaseModel):
     """Metadata for departments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class OfficesListResultMeta(BaseModel):
     """Metadata for offices.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class JobPostsListResultMeta(BaseModel):
     """Metadata for job_posts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class SourcesListResultMeta(BaseModel):
     """Metadata for sources.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ScheduledInterviewsListResultMeta(BaseModel):
     """Metadata for scheduled_interviews.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
@@ -329,7 +329,7 @@ D = TypeVar('D')
 
 class ApplicationsSearchData(BaseModel):
     """Search result data for applications entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     answers: list[Any] | None = None
     """Answers provided in the application."""
@@ -375,7 +375,7 @@ class ApplicationsSearchData(BaseModel):
 
 class CandidatesSearchData(BaseModel):
     """Search result data for candidates entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     addresses: list[Any] | None = None
     """Candidate's addresses"""
@@ -433,7 +433,7 @@ class CandidatesSearchData(BaseModel):
 
 class DepartmentsSearchData(BaseModel):
     """Search result data for departments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     child_department_external_ids: list[Any] | None = None
     """External IDs of child departments associated with this department."""
@@ -453,7 +453,7 @@ class DepartmentsSearchData(BaseModel):
 
 class JobPostsSearchData(BaseModel):
     """Search result data for job_posts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active: bool | None = None
     """Flag indicating if the job post is active or not."""
@@ -489,7 +489,7 @@ class JobPostsSearchData(BaseModel):
 
 class JobsSearchData(BaseModel):
     """Search result data for jobs entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     closed_at: str | None = None
     """The date and time the job was closed"""
@@ -531,7 +531,7 @@ class JobsSearchData(BaseModel):
 
 class OffersSearchData(BaseModel):
     """Search result data for offers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     application_id: int | None = None
     """Unique identifier for the application associated with the offer"""
@@ -565,7 +565,7 @@ class OffersSearchData(BaseModel):
 
 class OfficesSearchData(BaseModel):
     """Search result data for offices entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     child_ids: list[Any] | None = None
     """IDs of child offices associated with this office"""
@@ -589,7 +589,7 @@ class OfficesSearchData(BaseModel):
 
 class SourcesSearchData(BaseModel):
     """Search result data for sources entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """The unique identifier for the source."""
@@ -601,7 +601,7 @@ class SourcesSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """The date and time when the user account was created."""
@@ -637,7 +637,7 @@ class UsersSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -649,7 +649,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -52,7 +52,7 @@ class HarvestReplicationConfig(BaseModel):
 
 class PaginationLinks(BaseModel):
     """Pagination links for navigating result pages"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first: str | None = Field(default=None)
     previous: str | None = Field(default=None)
@@ -61,7 +61,7 @@ class PaginationLinks(BaseModel):
 
 class User(BaseModel):
     """A Harvest user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     first_name: str | None = Field(default=None)
@@ -88,7 +88,7 @@ class User(BaseModel):
 
 class UsersList(BaseModel):
     """Paginated list of users"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     users: list[User] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -101,7 +101,7 @@ class UsersList(BaseModel):
 
 class Client(BaseModel):
     """A Harvest client"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -114,7 +114,7 @@ class Client(BaseModel):
 
 class ClientsList(BaseModel):
     """Paginated list of clients"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     clients: list[Client] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -127,7 +127,7 @@ class ClientsList(BaseModel):
 
 class ContactClient(BaseModel):
     """The client associated with this contact"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="Client ID")
     """Client ID"""
@@ -136,7 +136,7 @@ class ContactClient(BaseModel):
 
 class Contact(BaseModel):
     """A Harvest contact associated with a client"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     title: str | None = Field(default=None)
@@ -152,7 +152,7 @@ class Contact(BaseModel):
 
 class ContactsList(BaseModel):
     """Paginated list of contacts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     contacts: list[Contact] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -165,7 +165,7 @@ class ContactsList(BaseModel):
 
 class Company(BaseModel):
     """The Harvest company/account information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     base_uri: str | None = Field(default=None)
     full_domain: str | None = Field(default=None)
@@ -194,7 +194,7 @@ class Company(BaseModel):
 
 class ProjectClient(BaseModel):
     """The client associated with the project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="Client ID")
     """Client ID"""
@@ -205,7 +205,7 @@ class ProjectClient(BaseModel):
 
 class Project(BaseModel):
     """A Harvest project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -234,7 +234,7 @@ class Project(BaseModel):
 
 class ProjectsList(BaseModel):
     """Paginated list of projects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     projects: list[Project] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -247,7 +247,7 @@ class ProjectsList(BaseModel):
 
 class Task(BaseModel):
     """A Harvest task"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -260,7 +260,7 @@ class Task(BaseModel):
 
 class TasksList(BaseModel):
     """Paginated list of tasks"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     tasks: list[Task] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -273,7 +273,7 @@ class TasksList(BaseModel):
 
 class TimeEntryProject(BaseModel):
     """The project associated with the time entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="Project ID")
     """Project ID"""
@@ -282,7 +282,7 @@ class TimeEntryProject(BaseModel):
 
 class TimeEntryClient(BaseModel):
     """The client associated with the time entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="Client ID")
     """Client ID"""
@@ -291,7 +291,7 @@ class TimeEntryClient(BaseModel):
 
 class TimeEntryInvoice(BaseModel):
     """The invoice associated with the time entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="Invoice ID")
     """Invoice ID"""
@@ -300,7 +300,7 @@ class TimeEntryInvoice(BaseModel):
 
 class TimeEntryTask(BaseModel):
     """The task associated with the time entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="Task ID")
     """Task ID"""
@@ -309,7 +309,7 @@ class TimeEntryTask(BaseModel):
 
 class TimeEntryUser(BaseModel):
     """The user associated with the time entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="User ID")
     """User ID"""
@@ -318,7 +318,7 @@ class TimeEntryUser(BaseModel):
 
 class TimeEntry(BaseModel):
     """A Harvest time entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     spent_date: str | None = Field(default=None)
@@ -353,7 +353,7 @@ class TimeEntry(BaseModel):
 
 class TimeEntriesList(BaseModel):
     """Paginated list of time entries"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     time_entries: list[TimeEntry] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -366,7 +366,7 @@ class TimeEntriesList(BaseModel):
 
 class Invoice(BaseModel):
     """A Harvest invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     client_key: str | None = Field(default=None)
@@ -405,7 +405,7 @@ class Invoice(BaseModel):
 
 class InvoicesList(BaseModel):
     """Paginated list of invoices"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     invoices: list[Invoice] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -418,7 +418,7 @@ class InvoicesList(BaseModel):
 
 class InvoiceItemCategory(BaseModel):
     """A Harvest invoice item category"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -429,7 +429,7 @@ class InvoiceItemCategory(BaseModel):
 
 class InvoiceItemCategoriesList(BaseModel):
     """Paginated list of invoice item categories"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     invoice_item_categories: list[InvoiceItemCategory] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -442,7 +442,7 @@ class InvoiceItemCategoriesList(BaseModel):
 
 class Estimate(BaseModel):
     """A Harvest estimate"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     client_key: str | None = Field(default=None)
@@ -471,7 +471,7 @@ class Estimate(BaseModel):
 
 class EstimatesList(BaseModel):
     """Paginated list of estimates"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     estimates: list[Estimate] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -484,7 +484,7 @@ class EstimatesList(BaseModel):
 
 class EstimateItemCategory(BaseModel):
     """A Harvest estimate item category"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -493,7 +493,7 @@ class EstimateItemCategory(BaseModel):
 
 class EstimateItemCategoriesList(BaseModel):
     """Paginated list of estimate item categories"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     estimate_item_categories: list[EstimateItemCategory] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -506,7 +506,7 @@ class EstimateItemCategoriesList(BaseModel):
 
 class Expense(BaseModel):
     """A Harvest expense"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     notes: str | None = Field(default=None)
@@ -532,7 +532,7 @@ class Expense(BaseModel):
 
 class ExpensesList(BaseModel):
     """Paginated list of expenses"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     expenses: list[Expense] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -545,7 +545,7 @@ class ExpensesList(BaseModel):
 
 class ExpenseCategory(BaseModel):
     """A Harvest expense category"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -557,7 +557,7 @@ class ExpenseCategory(BaseModel):
 
 class ExpenseCategoriesList(BaseModel):
     """Paginated list of expense categories"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     expense_categories: list[ExpenseCategory] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -570,7 +570,7 @@ class ExpenseCategoriesList(BaseModel):
 
 class Role(BaseModel):
     """A Harvest role"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -580,7 +580,7 @@ class Role(BaseModel):
 
 class RolesList(BaseModel):
     """Paginated list of roles"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     roles: list[Role] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -593,7 +593,7 @@ class RolesList(BaseModel):
 
 class UserAssignmentProject(BaseModel):
     """The project associated with the assignment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="Project ID")
     """Project ID"""
@@ -604,7 +604,7 @@ class UserAssignmentProject(BaseModel):
 
 class UserAssignmentUser(BaseModel):
     """The user associated with the assignment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="User ID")
     """User ID"""
@@ -613,7 +613,7 @@ class UserAssignmentUser(BaseModel):
 
 class UserAssignment(BaseModel):
     """A Harvest user assignment linking a user to a project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     is_project_manager: bool | None = Field(default=None)
@@ -628,7 +628,7 @@ class UserAssignment(BaseModel):
 
 class UserAssignmentsList(BaseModel):
     """Paginated list of user assignments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user_assignments: list[UserAssignment] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -641,7 +641,7 @@ class UserAssignmentsList(BaseModel):
 
 class TaskAssignmentTask(BaseModel):
     """The task associated with the assignment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="Task ID")
     """Task ID"""
@@ -650,7 +650,7 @@ class TaskAssignmentTask(BaseModel):
 
 class TaskAssignmentProject(BaseModel):
     """The project associated with the assignment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="Project ID")
     """Project ID"""
@@ -661,7 +661,7 @@ class TaskAssignmentProject(BaseModel):
 
 class TaskAssignment(BaseModel):
     """A Harvest task assignment linking a task to a project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     billable: bool | None = Field(default=None)
@@ -675,7 +675,7 @@ class TaskAssignment(BaseModel):
 
 class TaskAssignmentsList(BaseModel):
     """Paginated list of task assignments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     task_assignments: list[TaskAssignment] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -688,7 +688,7 @@ class TaskAssignmentsList(BaseModel):
 
 class TimeProject(BaseModel):
     """A time report entry grouped by project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     project_id: int | None = Field(default=None)
     project_name: str | None = Field(default=None)
@@ -701,7 +701,7 @@ class TimeProject(BaseModel):
 
 class TimeProjectsList(BaseModel):
     """Paginated list of time report entries by project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[TimeProject] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -714,7 +714,7 @@ class TimeProjectsList(BaseModel):
 
 class TimeTask(BaseModel):
     """A time report entry grouped by task"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     task_id: int | None = Field(default=None)
     task_name: str | None = Field(default=None)
@@ -725,7 +725,7 @@ class TimeTask(BaseModel):
 
 class TimeTasksList(BaseModel):
     """Paginated list of time report entries by task"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[TimeTask] | None = Field(default=None)
     per_page: int | None = Field(default=None)
@@ -741,103 +741,103 @@ class TimeTasksList(BaseModel):
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class ClientsListResultMeta(BaseModel):
     """Metadata for clients.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class ContactsListResultMeta(BaseModel):
     """Metadata for contacts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class ProjectsListResultMeta(BaseModel):
     """Metadata for projects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class TasksListResultMeta(BaseModel):
     """Metadata for tasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class TimeEntriesListResultMeta(BaseModel):
     """Metadata for time_entries.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class InvoicesListResultMeta(BaseModel):
     """Metadata for invoices.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class InvoiceItemCategoriesListResultMeta(BaseModel):
     """Metadata for invoice_item_categories.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class EstimatesListResultMeta(BaseModel):
     """Metadata for estimates.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class EstimateItemCategoriesListResultMeta(BaseModel):
     """Metadata for estimate_item_categories.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class ExpensesListResultMeta(BaseModel):
     """Metadata for expenses.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class ExpenseCategoriesListResultMeta(BaseModel):
     """Metadata for expense_categories.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class RolesListResultMeta(BaseModel):
     """Metadata for roles.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class UserAssignmentsListResultMeta(BaseModel):
     """Metadata for user_assignments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class TaskAssignmentsListResultMeta(BaseModel):
     """Metadata for task_assignments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class TimeProjectsListResultMeta(BaseModel):
     """Metadata for time_projects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class TimeTasksListResultMeta(BaseModel):
     """Metadata for time_tasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
@@ -894,7 +894,7 @@ D = TypeVar('D')
 
 class ClientsSearchData(BaseModel):
     """Search result data for clients entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     address: str | None = None
     """The client's postal address"""
@@ -914,7 +914,7 @@ class ClientsSearchData(BaseModel):
 
 class CompanySearchData(BaseModel):
     """Search result data for company entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     base_uri: str | None = None
     """The base URI"""
@@ -934,7 +934,7 @@ class CompanySearchData(BaseModel):
 
 class ContactsSearchData(BaseModel):
     """Search result data for contacts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     client: dict[str, Any] | None = None
     """Client associated with the contact"""
@@ -956,7 +956,7 @@ class ContactsSearchData(BaseModel):
 
 class EstimateItemCategoriesSearchData(BaseModel):
     """Search result data for estimate_item_categories entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """When created"""
@@ -970,7 +970,7 @@ class EstimateItemCategoriesSearchData(BaseModel):
 
 class EstimatesSearchData(BaseModel):
     """Search result data for estimates entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     amount: float | None = None
     """Total amount"""
@@ -996,7 +996,7 @@ class EstimatesSearchData(BaseModel):
 
 class ExpenseCategoriesSearchData(BaseModel):
     """Search result data for expense_categories entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """When created"""
@@ -1016,7 +1016,7 @@ class ExpenseCategoriesSearchData(BaseModel):
 
 class ExpensesSearchData(BaseModel):
     """Search result data for expenses entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     billable: bool | None = None
     """Whether billable"""
@@ -1046,7 +1046,7 @@ class ExpensesSearchData(BaseModel):
 
 class InvoiceItemCategoriesSearchData(BaseModel):
     """Search result data for invoice_item_categories entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """When created"""
@@ -1064,7 +1064,7 @@ class InvoiceItemCategoriesSearchData(BaseModel):
 
 class InvoicesSearchData(BaseModel):
     """Search result data for invoices entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     amount: float | None = None
     """Total amount"""
@@ -1094,7 +1094,7 @@ class InvoicesSearchData(BaseModel):
 
 class ProjectsSearchData(BaseModel):
     """Search result data for projects entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     budget: float | None = None
     """Budget amount"""
@@ -1122,7 +1122,7 @@ class ProjectsSearchData(BaseModel):
 
 class RolesSearchData(BaseModel):
     """Search result data for roles entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """When created"""
@@ -1138,7 +1138,7 @@ class RolesSearchData(BaseModel):
 
 class TaskAssignmentsSearchData(BaseModel):
     """Search result data for task_assignments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     billable: bool | None = None
     """Whether billable"""
@@ -1160,7 +1160,7 @@ class TaskAssignmentsSearchData(BaseModel):
 
 class TasksSearchData(BaseModel):
     """Search result data for tasks entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     billable_by_default: bool | None = None
     """Whether billable by default"""
@@ -1180,7 +1180,7 @@ class TasksSearchData(BaseModel):
 
 class TimeEntriesSearchData(BaseModel):
     """Search result data for time_entries entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     billable: bool | None = None
     """Whether billable"""
@@ -1210,7 +1210,7 @@ class TimeEntriesSearchData(BaseModel):
 
 class TimeProjectsSearchData(BaseModel):
     """Search result data for time_projects entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     billable_amount: float | None = None
     """Total billable amount"""
@@ -1232,7 +1232,7 @@ class TimeProjectsSearchData(BaseModel):
 
 class TimeTasksSearchData(BaseModel):
     """Search result data for time_tasks entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     billable_amount: float | None = None
     """Total billable amount"""
@@ -1250,7 +1250,7 @@ class TimeTasksSearchData(BaseModel):
 
 class UserAssignmentsSearchData(BaseModel):
     """Search result data for user_assignments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     budget: float | None = None
     """Budget"""
@@ -1274,7 +1274,7 @@ class UserAssignmentsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     avatar_url: str | None = None
     """Avatar URL"""
@@ -1312,7 +1312,7 @@ class UsersSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1324,7 +1324,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
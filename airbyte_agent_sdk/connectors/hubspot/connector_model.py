@@ -22,6 +22,7 @@ from airbyte_agent_sdk.schema.security import (
 )
 from airbyte_agent_sdk.schema.extensions import (
     EntityRelationshipConfig,
+    RateLimitConfig,
 )
 from airbyte_agent_sdk.schema.base import (
     ExampleQuestions,
@@ -3042,6 +3043,13 @@ HubspotConnectorModel: ConnectorModel = ConnectorModel(
             ],
         ),
     ],
+    rate_limit=RateLimitConfig(
+        requests=110,
+        period_seconds=10.0,
+        remaining_header='X-HubSpot-RateLimit-Remaining',
+        reset_header='X-HubSpot-RateLimit-Interval-Milliseconds',
+        reset_format='milliseconds',
+    ),
     search_field_paths={
         'companies': [
             'archived',
@@ -53,7 +53,7 @@ class HubspotOAuthCredentials(BaseModel):
 
 class ContactProperties(BaseModel):
     """Contact properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     createdate: str | None | None = Field(default=None)
     email: str | None | None = Field(default=None)
@@ -64,7 +64,7 @@ class ContactProperties(BaseModel):
 
 class Contact(BaseModel):
     """HubSpot contact object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     properties: ContactProperties | None = Field(default=None)
@@ -79,7 +79,7 @@ class Contact(BaseModel):
 
 class PagingNext(BaseModel):
     """Nested schema for Paging.next"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None, description="Cursor for next page")
     """Cursor for next page"""
@@ -88,13 +88,13 @@ class PagingNext(BaseModel):
 
 class Paging(BaseModel):
     """Pagination information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: PagingNext | None = Field(default=None)
 
 class ContactsList(BaseModel):
     """Paginated list of contacts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Contact] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
@@ -102,7 +102,7 @@ class ContactsList(BaseModel):
 
 class CompanyProperties(BaseModel):
     """Company properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     createdate: str | None | None = Field(default=None)
     domain: str | None | None = Field(default=None)
@@ -112,7 +112,7 @@ class CompanyProperties(BaseModel):
 
 class Company(BaseModel):
     """HubSpot company object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     properties: CompanyProperties | None = Field(default=None)
@@ -127,7 +127,7 @@ class Company(BaseModel):
 
 class CompaniesList(BaseModel):
     """Paginated list of companies"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Company] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
@@ -135,7 +135,7 @@ class CompaniesList(BaseModel):
 
 class DealProperties(BaseModel):
     """Deal properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: str | None | None = Field(default=None)
     closedate: str | None | None = Field(default=None)
@@ -148,7 +148,7 @@ class DealProperties(BaseModel):
 
 class Deal(BaseModel):
     """HubSpot deal object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     properties: DealProperties | None = Field(default=None)
@@ -163,7 +163,7 @@ class Deal(BaseModel):
 
 class DealsList(BaseModel):
     """Paginated list of deals"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Deal] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
@@ -171,7 +171,7 @@ class DealsList(BaseModel):
 
 class TicketProperties(BaseModel):
     """Ticket properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     content: str | None | None = Field(default=None)
     createdate: str | None | None = Field(default=None)
@@ -185,7 +185,7 @@ class TicketProperties(BaseModel):
 
 class Ticket(BaseModel):
     """HubSpot ticket object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     properties: TicketProperties | None = Field(default=None)
@@ -200,7 +200,7 @@ class Ticket(BaseModel):
 
 class TicketsList(BaseModel):
     """Paginated list of tickets"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Ticket] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
@@ -208,14 +208,14 @@ class TicketsList(BaseModel):
 
 class SchemaLabels(BaseModel):
     """Display labels"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     singular: str | None = Field(default=None)
     plural: str | None = Field(default=None)
 
 class SchemaAssociationsItem(BaseModel):
     """Nested schema for Schema.associations_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     from_object_type_id: str | None = Field(default=None, alias="fromObjectTypeId")
     to_object_type_id: str | None = Field(default=None, alias="toObjectTypeId")
@@ -232,7 +232,7 @@ class SchemaAssociationsItem(BaseModel):
 
 class SchemaPropertiesItemModificationmetadata(BaseModel):
     """Nested schema for SchemaPropertiesItem.modificationMetadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     archivable: bool | None = Field(default=None)
     read_only_definition: bool | None = Field(default=None, alias="readOnlyDefinition")
@@ -241,7 +241,7 @@ class SchemaPropertiesItemModificationmetadata(BaseModel):
 
 class SchemaPropertiesItem(BaseModel):
     """Nested schema for Schema.properties_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     label: str | None = Field(default=None)
@@ -268,7 +268,7 @@ class SchemaPropertiesItem(BaseModel):
 
 class Schema(BaseModel):
     """Custom object schema definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -293,13 +293,13 @@ class Schema(BaseModel):
 
 class SchemasList(BaseModel):
     """List of custom object schemas"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Schema] | None = Field(default=None)
 
 class CRMObjectProperties(BaseModel):
     """Object properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     hs_createdate: str | None | None = Field(default=None)
     hs_lastmodifieddate: str | None | None = Field(default=None)
@@ -307,7 +307,7 @@ class CRMObjectProperties(BaseModel):
 
 class CRMObject(BaseModel):
     """Generic HubSpot CRM object (for custom objects)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     properties: CRMObjectProperties | None = Field(default=None)
@@ -322,7 +322,7 @@ class CRMObject(BaseModel):
 
 class ObjectsList(BaseModel):
     """Paginated list of generic CRM objects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[CRMObject] | None = Field(default=None)
     paging: Paging | None = Field(default=None)
@@ -332,14 +332,14 @@ class ObjectsList(BaseModel):
 
 class ContactsListResultMeta(BaseModel):
     """Metadata for contacts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     next_link: str | None = Field(default=None)
 
 class ContactsApiSearchResultMeta(BaseModel):
     """Metadata for contacts.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total: int | None = Field(default=None)
     next_cursor: str | None = Field(default=None)
@@ -347,14 +347,14 @@ class ContactsApiSearchResultMeta(BaseModel):
 
 class CompaniesListResultMeta(BaseModel):
     """Metadata for companies.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     next_link: str | None = Field(default=None)
 
 class CompaniesApiSearchResultMeta(BaseModel):
     """Metadata for companies.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total: int | None = Field(default=None)
     next_cursor: str | None = Field(default=None)
@@ -362,14 +362,14 @@ class CompaniesApiSearchResultMeta(BaseModel):
 
 class DealsListResultMeta(BaseModel):
     """Metadata for deals.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     next_link: str | None = Field(default=None)
 
 class DealsApiSearchResultMeta(BaseModel):
     """Metadata for deals.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total: int | None = Field(default=None)
     next_cursor: str | None = Field(default=None)
@@ -377,14 +377,14 @@ class DealsApiSearchResultMeta(BaseModel):
 
 class TicketsListResultMeta(BaseModel):
     """Metadata for tickets.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     next_link: str | None = Field(default=None)
 
 class TicketsApiSearchResultMeta(BaseModel):
     """Metadata for tickets.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total: int | None = Field(default=None)
     next_cursor: str | None = Field(default=None)
@@ -392,7 +392,7 @@ class TicketsApiSearchResultMeta(BaseModel):
 
 class ObjectsListResultMeta(BaseModel):
     """Metadata for objects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     next_link: str | None = Field(default=None)
@@ -450,7 +450,7 @@ D = TypeVar('D')
 
 class CompaniesSearchData(BaseModel):
     """Search result data for companies entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     archived: bool | None = None
     """Indicates whether the company has been deleted and moved to the recycling bin"""
@@ -468,7 +468,7 @@ class CompaniesSearchData(BaseModel):
 
 class ContactsSearchData(BaseModel):
     """Search result data for contacts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     archived: bool | None = None
     """Boolean flag indicating whether the contact has been archived or deleted."""
@@ -486,7 +486,7 @@ class ContactsSearchData(BaseModel):
 
 class DealsSearchData(BaseModel):
     """Search result data for deals entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     archived: bool | None = None
     """Indicates whether the deal has been deleted and moved to the recycling bin"""
@@ -510,7 +510,7 @@ class DealsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -522,7 +522,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -24,14 +24,14 @@ class IncidentIoAuthConfig(BaseModel):
 
 class PaginationMeta(BaseModel):
     """Cursor-based pagination metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     after: str | None = Field(default=None)
     page_size: int | None = Field(default=None)
 
 class IncidentCustomFieldEntriesItemCustomField(BaseModel):
     """Nested schema for IncidentCustomFieldEntriesItem.custom_field"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -41,14 +41,14 @@ class IncidentCustomFieldEntriesItemCustomField(BaseModel):
 
 class IncidentCustomFieldEntriesItem(BaseModel):
     """Nested schema for Incident.custom_field_entries_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     custom_field: IncidentCustomFieldEntriesItemCustomField | None | None = Field(default=None)
     values: list[Any] | None | None = Field(default=None)
 
 class IncidentIncidentRoleAssignmentsItemAssignee(BaseModel):
     """Nested schema for IncidentIncidentRoleAssignmentsItem.assignee"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -58,7 +58,7 @@ class IncidentIncidentRoleAssignmentsItemAssignee(BaseModel):
 
 class IncidentIncidentRoleAssignmentsItemRole(BaseModel):
     """Nested schema for IncidentIncidentRoleAssignmentsItem.role"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -72,14 +72,14 @@ class IncidentIncidentRoleAssignmentsItemRole(BaseModel):
 
 class IncidentIncidentRoleAssignmentsItem(BaseModel):
     """Nested schema for Incident.incident_role_assignments_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     assignee: IncidentIncidentRoleAssignmentsItemAssignee | None | None = Field(default=None)
     role: IncidentIncidentRoleAssignmentsItemRole | None | None = Field(default=None)
 
 class IncidentCreatorUser(BaseModel):
     """Nested schema for IncidentCreator.user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -89,19 +89,19 @@ class IncidentCreatorUser(BaseModel):
 
 class IncidentCreator(BaseModel):
     """The user who created the incident"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user: IncidentCreatorUser | None | None = Field(default=None)
 
 class IncidentIncidentTimestampValuesItemValue(BaseModel):
     """Nested schema for IncidentIncidentTimestampValuesItem.value"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     value: str | None | None = Field(default=None)
 
 class IncidentIncidentTimestampValuesItemIncidentTimestamp(BaseModel):
     """Nested schema for IncidentIncidentTimestampValuesItem.incident_timestamp"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -109,14 +109,14 @@ class IncidentIncidentTimestampValuesItemIncidentTimestamp(BaseModel):
 
 class IncidentIncidentTimestampValuesItem(BaseModel):
     """Nested schema for Incident.incident_timestamp_values_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     incident_timestamp: IncidentIncidentTimestampValuesItemIncidentTimestamp | None | None = Field(default=None)
     value: IncidentIncidentTimestampValuesItemValue | None | None = Field(default=None)
 
 class IncidentSeverity(BaseModel):
     """Severity of the incident"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -127,7 +127,7 @@ class IncidentSeverity(BaseModel):
 
 class IncidentIncidentType(BaseModel):
     """Type of the incident"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -140,20 +140,20 @@ class IncidentIncidentType(BaseModel):
 
 class IncidentDurationMetricsItemDurationMetric(BaseModel):
     """Nested schema for IncidentDurationMetricsItem.duration_metric"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
 
 class IncidentDurationMetricsItem(BaseModel):
     """Nested schema for Incident.duration_metrics_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     duration_metric: IncidentDurationMetricsItemDurationMetric | None | None = Field(default=None)
 
 class IncidentIncidentStatus(BaseModel):
     """Current status of the incident"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -165,7 +165,7 @@ class IncidentIncidentStatus(BaseModel):
 
 class Incident(BaseModel):
     """An incident tracked in incident.io"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -196,7 +196,7 @@ class Incident(BaseModel):
 
 class AlertAttributesItemAttribute(BaseModel):
     """Nested schema for AlertAttributesItem.attribute"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -205,7 +205,7 @@ class AlertAttributesItemAttribute(BaseModel):
 
 class AlertAttributesItemValueCatalogEntry(BaseModel):
     """Nested schema for AlertAttributesItemValue.catalog_entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -213,7 +213,7 @@ class AlertAttributesItemValueCatalogEntry(BaseModel):
 
 class AlertAttributesItemValue(BaseModel):
     """Nested schema for AlertAttributesItem.value"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     literal: str | None | None = Field(default=None)
     label: str | None | None = Field(default=None)
@@ -221,14 +221,14 @@ class AlertAttributesItemValue(BaseModel):
 
 class AlertAttributesItem(BaseModel):
     """Nested schema for Alert.attributes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     attribute: AlertAttributesItemAttribute | None | None = Field(default=None)
     value: AlertAttributesItemValue | None | None = Field(default=None)
 
 class Alert(BaseModel):
     """An alert ingested from an alert source"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     title: str | None = Field(default=None)
@@ -244,21 +244,21 @@ class Alert(BaseModel):
 
 class EscalationCreatorAlert(BaseModel):
     """Nested schema for EscalationCreator.alert"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     title: str | None | None = Field(default=None)
 
 class EscalationCreatorWorkflow(BaseModel):
     """Nested schema for EscalationCreator.workflow"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
 
 class EscalationCreatorUser(BaseModel):
     """Nested schema for EscalationCreator.user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -268,7 +268,7 @@ class EscalationCreatorUser(BaseModel):
 
 class EscalationCreator(BaseModel):
     """The creator of this escalation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     alert: EscalationCreatorAlert | None | None = Field(default=None)
     user: EscalationCreatorUser | None | None = Field(default=None)
@@ -276,7 +276,7 @@ class EscalationCreator(BaseModel):
 
 class EscalationRelatedIncidentsItem(BaseModel):
     """Nested schema for Escalation.related_incidents_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -288,7 +288,7 @@ class EscalationRelatedIncidentsItem(BaseModel):
 
 class EscalationEventsItemUsersItem(BaseModel):
     """Nested schema for EscalationEventsItem.users_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -298,7 +298,7 @@ class EscalationEventsItemUsersItem(BaseModel):
 
 class EscalationEventsItemChannelsItem(BaseModel):
     """Nested schema for EscalationEventsItem.channels_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     slack_channel_id: str | None | None = Field(default=None)
     slack_team_id: str | None | None = Field(default=None)
@@ -307,7 +307,7 @@ class EscalationEventsItemChannelsItem(BaseModel):
 
 class EscalationEventsItem(BaseModel):
     """Nested schema for Escalation.events_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     event: str | None | None = Field(default=None)
@@ -318,7 +318,7 @@ class EscalationEventsItem(BaseModel):
 
 class EscalationRelatedAlertsItem(BaseModel):
     """Nested schema for Escalation.related_alerts_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     title: str | None | None = Field(default=None)
@@ -333,13 +333,13 @@ class EscalationRelatedAlertsItem(BaseModel):
 
 class EscalationPriority(BaseModel):
     """Priority of the escalation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None | None = Field(default=None)
 
 class Escalation(BaseModel):
     """An escalation that pages people via escalation paths"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     title: str | None = Field(default=None)
@@ -355,7 +355,7 @@ class Escalation(BaseModel):
 
 class UserBaseRole(BaseModel):
     """Base role assigned to the user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -364,7 +364,7 @@ class UserBaseRole(BaseModel):
 
 class User(BaseModel):
     """A user in the incident.io organisation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -376,7 +376,7 @@ class User(BaseModel):
 
 class IncidentUpdateNewIncidentStatus(BaseModel):
     """New incident status set by this update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -388,7 +388,7 @@ class IncidentUpdateNewIncidentStatus(BaseModel):
 
 class IncidentUpdateNewSeverity(BaseModel):
     """New severity set by this update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -399,7 +399,7 @@ class IncidentUpdateNewSeverity(BaseModel):
 
 class IncidentUpdateUpdaterUser(BaseModel):
     """Nested schema for IncidentUpdateUpdater.user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -409,13 +409,13 @@ class IncidentUpdateUpdaterUser(BaseModel):
 
 class IncidentUpdateUpdater(BaseModel):
     """Who made this update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user: IncidentUpdateUpdaterUser | None | None = Field(default=None)
 
 class IncidentUpdate(BaseModel):
     """An update posted to an incident"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     incident_id: str | None = Field(default=None)
@@ -427,7 +427,7 @@ class IncidentUpdate(BaseModel):
 
 class IncidentRole(BaseModel):
     """A role that can be assigned during an incident"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -441,7 +441,7 @@ class IncidentRole(BaseModel):
 
 class IncidentStatus(BaseModel):
     """A status that an incident can be in"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -453,7 +453,7 @@ class IncidentStatus(BaseModel):
 
 class IncidentTimestamp(BaseModel):
     """A timestamp definition for incidents"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -461,7 +461,7 @@ class IncidentTimestamp(BaseModel):
 
 class Severity(BaseModel):
     """A severity level for incidents"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -472,7 +472,7 @@ class Severity(BaseModel):
 
 class CustomField(BaseModel):
     """A custom field definition for incidents"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -484,7 +484,7 @@ class CustomField(BaseModel):
 
 class CatalogTypeSchemaAttributesItem(BaseModel):
     """Nested schema for CatalogTypeSchema.attributes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -494,14 +494,14 @@ class CatalogTypeSchemaAttributesItem(BaseModel):
 
 class CatalogTypeSchema(BaseModel):
     """Schema definition for the catalog type"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     version: float | None | None = Field(default=None)
     attributes: list[CatalogTypeSchemaAttributesItem] | None | None = Field(default=None)
 
 class CatalogType(BaseModel):
     """A catalog type defining a category of catalog entries"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -523,7 +523,7 @@ class CatalogType(BaseModel):
 
 class ScheduleCurrentShiftsItem(BaseModel):
     """Nested schema for Schedule.current_shifts_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rotation_id: str | None | None = Field(default=None)
     fingerprint: str | None | None = Field(default=None)
@@ -532,21 +532,21 @@ class ScheduleCurrentShiftsItem(BaseModel):
 
 class ScheduleConfigRotationsItemLayersItem(BaseModel):
     """Nested schema for ScheduleConfigRotationsItem.layers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
 
 class ScheduleConfigRotationsItemHandoversItem(BaseModel):
     """Nested schema for ScheduleConfigRotationsItem.handovers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     interval: float | None | None = Field(default=None)
     interval_type: str | None | None = Field(default=None)
 
 class ScheduleConfigRotationsItem(BaseModel):
     """Nested schema for ScheduleConfig.rotations_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -556,13 +556,13 @@ class ScheduleConfigRotationsItem(BaseModel):
 
 class ScheduleConfig(BaseModel):
     """Schedule configuration with rotations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rotations: list[ScheduleConfigRotationsItem] | None | None = Field(default=None)
 
 class Schedule(BaseModel):
     """An on-call schedule"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -580,37 +580,37 @@ class Schedule(BaseModel):
 
 class IncidentsListResultMeta(BaseModel):
     """Metadata for incidents.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class AlertsListResultMeta(BaseModel):
     """Metadata for alerts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class EscalationsListResultMeta(BaseModel):
     """Metadata for escalations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class IncidentUpdatesListResultMeta(BaseModel):
     """Metadata for incident_updates.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class SchedulesListResultMeta(BaseModel):
     """Metadata for schedules.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
@@ -667,7 +667,7 @@ D = TypeVar('D')
 
 class IncidentsSearchData(BaseModel):
     """Search result data for incidents entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """When the incident was created"""
@@ -723,7 +723,7 @@ class IncidentsSearchData(BaseModel):
 
 class AlertsSearchData(BaseModel):
     """Search result data for alerts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     alert_source_id: str | None = None
     """ID of the alert source that generated this alert"""
@@ -751,7 +751,7 @@ class AlertsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     base_role: dict[str, Any] | None = None
     """Base role assigned to the user"""
@@ -771,7 +771,7 @@ class UsersSearchData(BaseModel):
 
 class IncidentUpdatesSearchData(BaseModel):
     """Search result data for incident_updates entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """When the update was created"""
@@ -791,7 +791,7 @@ class IncidentUpdatesSearchData(BaseModel):
 
 class IncidentRolesSearchData(BaseModel):
     """Search result data for incident_roles entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """When the role was created"""
@@ -815,7 +815,7 @@ class IncidentRolesSearchData(BaseModel):
 
 class IncidentStatusesSearchData(BaseModel):
     """Search result data for incident_statuses entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     category: str | None = None
     """Category: triage, active, post-incident, closed, etc."""
@@ -835,7 +835,7 @@ class IncidentStatusesSearchData(BaseModel):
 
 class IncidentTimestampsSearchData(BaseModel):
     """Search result data for incident_timestamps entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the timestamp"""
@@ -847,7 +847,7 @@ class IncidentTimestampsSearchData(BaseModel):
 
 class SeveritiesSearchData(BaseModel):
     """Search result data for severities entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """When the severity was created"""
@@ -865,7 +865,7 @@ class SeveritiesSearchData(BaseModel):
 
 class CustomFieldsSearchData(BaseModel):
     """Search result data for custom_fields entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """When the custom field was created"""
@@ -883,7 +883,7 @@ class CustomFieldsSearchData(BaseModel):
 
 class CatalogTypesSearchData(BaseModel):
     """Search result data for catalog_types entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     annotations: dict[str, Any] | None = None
     """Annotations metadata"""
@@ -923,7 +923,7 @@ class CatalogTypesSearchData(BaseModel):
 
 class SchedulesSearchData(BaseModel):
     """Search result data for schedules entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     annotations: dict[str, Any] | None = None
     """Annotations metadata"""
@@ -945,7 +945,7 @@ class SchedulesSearchData(BaseModel):
 
 class EscalationsSearchData(BaseModel):
     """Search result data for escalations entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """When the escalation was created"""
@@ -975,7 +975,7 @@ class EscalationsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -987,7 +987,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
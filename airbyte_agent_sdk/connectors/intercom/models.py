@@ -34,7 +34,7 @@ class IntercomReplicationConfig(BaseModel):
 
 class PagesNext(BaseModel):
     """Cursor for next page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page: int | None | None = Field(default=None, description="Next page number")
     """Next page number"""
@@ -43,7 +43,7 @@ class PagesNext(BaseModel):
 
 class Pages(BaseModel):
     """Pagination metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     page: int | None = Field(default=None)
@@ -53,7 +53,7 @@ class Pages(BaseModel):
 
 class Contact(BaseModel):
     """Contact object representing a user or lead"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -102,7 +102,7 @@ class Contact(BaseModel):
 
 class SocialProfile(BaseModel):
     """Social profile"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     name: str | None = Field(default=None)
@@ -110,14 +110,14 @@ class SocialProfile(BaseModel):
 
 class SocialProfiles(BaseModel):
     """Social profiles"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     data: list[SocialProfile] | None = Field(default=None)
 
 class Location(BaseModel):
     """Location information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     country: str | None = Field(default=None)
@@ -128,7 +128,7 @@ class Location(BaseModel):
 
 class TagReference(BaseModel):
     """Tag reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -136,14 +136,14 @@ class TagReference(BaseModel):
 
 class ContactTags(BaseModel):
     """Tags associated with contact"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     data: list[TagReference] | None = Field(default=None)
 
 class NoteReference(BaseModel):
     """Note reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -151,14 +151,14 @@ class NoteReference(BaseModel):
 
 class ContactNotes(BaseModel):
     """Notes associated with contact"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     data: list[NoteReference] | None = Field(default=None)
 
 class CompanyReference(BaseModel):
     """Company reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -166,14 +166,14 @@ class CompanyReference(BaseModel):
 
 class ContactCompanies(BaseModel):
     """Companies associated with contact"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     data: list[CompanyReference] | None = Field(default=None)
 
 class ContactsListPagesNext(BaseModel):
     """Cursor for next page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page: int | None | None = Field(default=None, description="Next page number")
     """Next page number"""
@@ -182,7 +182,7 @@ class ContactsListPagesNext(BaseModel):
 
 class ContactsListPages(BaseModel):
     """Pagination metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type", description="Type of pagination")
     """Type of pagination"""
@@ -197,7 +197,7 @@ class ContactsListPages(BaseModel):
 
 class ContactsList(BaseModel):
     """Paginated list of contacts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     data: list[Contact] | None = Field(default=None)
@@ -206,7 +206,7 @@ class ContactsList(BaseModel):
 
 class Conversation(BaseModel):
     """Conversation object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -234,7 +234,7 @@ class Conversation(BaseModel):
 
 class Tag(BaseModel):
     """Tag object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -244,14 +244,14 @@ class Tag(BaseModel):
 
 class ConversationTags(BaseModel):
     """Tags on conversation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     tags: list[Tag] | None = Field(default=None)
 
 class ConversationRating(BaseModel):
     """Conversation rating"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rating: int | None = Field(default=None)
     remark: str | None = Field(default=None)
@@ -261,21 +261,21 @@ class ConversationRating(BaseModel):
 
 class ContactReference(BaseModel):
     """Contact reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
 
 class AdminReference(BaseModel):
     """Admin reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
 
 class Attachment(BaseModel):
     """Message attachment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     name: str | None = Field(default=None)
@@ -287,7 +287,7 @@ class Attachment(BaseModel):
 
 class ConversationSource(BaseModel):
     """Conversation source"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -301,7 +301,7 @@ class ConversationSource(BaseModel):
 
 class Author(BaseModel):
     """Message author"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -310,21 +310,21 @@ class Author(BaseModel):
 
 class ConversationContacts(BaseModel):
     """Contacts in conversation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     contacts: list[ContactReference] | None = Field(default=None)
 
 class ConversationTeammates(BaseModel):
     """Teammates in conversation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     admins: list[AdminReference] | None = Field(default=None)
 
 class FirstContactReply(BaseModel):
     """First contact reply info"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created_at: int | None = Field(default=None)
     type_: str | None = Field(default=None, alias="type")
@@ -332,7 +332,7 @@ class FirstContactReply(BaseModel):
 
 class SlaApplied(BaseModel):
     """SLA applied to conversation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     sla_name: str | None = Field(default=None)
@@ -340,7 +340,7 @@ class SlaApplied(BaseModel):
 
 class ConversationStatistics(BaseModel):
     """Conversation statistics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     time_to_assignment: int | None = Field(default=None)
@@ -364,7 +364,7 @@ class ConversationStatistics(BaseModel):
 
 class ConversationPart(BaseModel):
     """Conversation part (message, note, action)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -381,7 +381,7 @@ class ConversationPart(BaseModel):
 
 class ConversationPartsReference(BaseModel):
     """Reference to conversation parts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     conversation_parts: list[ConversationPart] | None = Field(default=None)
@@ -389,7 +389,7 @@ class ConversationPartsReference(BaseModel):
 
 class ConversationsListPagesNext(BaseModel):
     """Cursor for next page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page: int | None | None = Field(default=None, description="Next page number")
     """Next page number"""
@@ -398,7 +398,7 @@ class ConversationsListPagesNext(BaseModel):
 
 class ConversationsListPages(BaseModel):
     """Pagination metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type", description="Type of pagination")
     """Type of pagination"""
@@ -413,7 +413,7 @@ class ConversationsListPages(BaseModel):
 
 class ConversationsList(BaseModel):
     """Paginated list of conversations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     conversations: list[Conversation] | None = Field(default=None)
@@ -422,7 +422,7 @@ class ConversationsList(BaseModel):
 
 class Company(BaseModel):
     """Company object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -446,7 +446,7 @@ class Company(BaseModel):
 
 class CompanyPlan(BaseModel):
     """Company plan"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -454,14 +454,14 @@ class CompanyPlan(BaseModel):
 
 class CompanyTags(BaseModel):
     """Tags on company"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     tags: list[Tag] | None = Field(default=None)
 
 class Segment(BaseModel):
     """Segment object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -473,14 +473,14 @@ class Segment(BaseModel):
 
 class CompanySegments(BaseModel):
     """Segments for company"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     segments: list[Segment] | None = Field(default=None)
 
 class CompaniesListPagesNext(BaseModel):
     """Cursor for next page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page: int | None | None = Field(default=None, description="Next page number")
     """Next page number"""
@@ -489,7 +489,7 @@ class CompaniesListPagesNext(BaseModel):
 
 class CompaniesListPages(BaseModel):
     """Pagination metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type", description="Type of pagination")
     """Type of pagination"""
@@ -504,7 +504,7 @@ class CompaniesListPages(BaseModel):
 
 class CompaniesList(BaseModel):
     """Paginated list of companies"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     data: list[Company] | None = Field(default=None)
@@ -513,7 +513,7 @@ class CompaniesList(BaseModel):
 
 class Team(BaseModel):
     """Team object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -523,21 +523,21 @@ class Team(BaseModel):
 
 class AdminPriorityLevel(BaseModel):
     """Admin priority level settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     primary_admin_ids: list[int] | None = Field(default=None)
     secondary_admin_ids: list[int] | None = Field(default=None)
 
 class TeamsList(BaseModel):
     """List of teams"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     teams: list[Team] | None = Field(default=None)
 
 class Admin(BaseModel):
     """Admin object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -553,35 +553,35 @@ class Admin(BaseModel):
 
 class Avatar(BaseModel):
     """Avatar image"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     image_url: str | None = Field(default=None)
 
 class AdminsList(BaseModel):
     """List of admins"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     admins: list[Admin] | None = Field(default=None)
 
 class TagsList(BaseModel):
     """List of tags"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     data: list[Tag] | None = Field(default=None)
 
 class SegmentsList(BaseModel):
     """List of segments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     segments: list[Segment] | None = Field(default=None)
 
 class ContactCreateParams(BaseModel):
     """ContactCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     role: str
     external_id: str | None = Field(default=None)
@@ -597,7 +597,7 @@ class ContactCreateParams(BaseModel):
 
 class ContactUpdateParams(BaseModel):
     """ContactUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     role: str | None = Field(default=None)
     external_id: str | None = Field(default=None)
@@ -613,7 +613,7 @@ class ContactUpdateParams(BaseModel):
 
 class CompanyCreateParams(BaseModel):
     """CompanyCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     company_id: str
     name: str | None = Field(default=None)
@@ -626,7 +626,7 @@ class CompanyCreateParams(BaseModel):
 
 class CompanyUpdateParams(BaseModel):
     """CompanyUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     plan: str | None = Field(default=None)
@@ -638,20 +638,20 @@ class CompanyUpdateParams(BaseModel):
 
 class TagCreateParams(BaseModel):
     """TagCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
 
 class NoteCreateParams(BaseModel):
     """NoteCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     body: str
     admin_id: str | None = Field(default=None)
 
 class Note(BaseModel):
     """Note object on a contact"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     id: str | None = Field(default=None)
@@ -662,7 +662,7 @@ class Note(BaseModel):
 
 class InternalArticleCreateParams(BaseModel):
     """InternalArticleCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str
     body: str | None = Field(default=None)
@@ -671,7 +671,7 @@ class InternalArticleCreateParams(BaseModel):
 
 class InternalArticle(BaseModel):
     """Internal article object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: Any | None = Field(default=None)
     title: str | None = Field(default=None)
@@ -687,19 +687,19 @@ class InternalArticle(BaseModel):
 
 class ContactsListResultMeta(BaseModel):
     """Metadata for contacts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
 
 class ConversationsListResultMeta(BaseModel):
     """Metadata for conversations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
 
 class CompaniesListResultMeta(BaseModel):
     """Metadata for companies.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
 
@@ -756,7 +756,7 @@ D = TypeVar('D')
 
 class CompaniesSearchData(BaseModel):
     """Search result data for companies entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     app_id: str | None = None
     """The ID of the application associated with the company"""
@@ -798,7 +798,7 @@ class CompaniesSearchData(BaseModel):
 
 class ContactsSearchData(BaseModel):
     """Search result data for contacts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     android_app_name: str | None = None
     """The name of the Android app associated with the contact."""
@@ -912,7 +912,7 @@ class ContactsSearchData(BaseModel):
 
 class ConversationsSearchData(BaseModel):
     """Search result data for conversations entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     admin_assignee_id: int | None = None
     """The ID of the administrator assigned to the conversation"""
@@ -984,7 +984,7 @@ class ConversationsSearchData(BaseModel):
 
 class TeamsSearchData(BaseModel):
     """Search result data for teams entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     admin_ids: list[Any] | None = None
     """Array of user IDs representing the admins of the team."""
@@ -1000,7 +1000,7 @@ class TeamsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1012,7 +1012,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
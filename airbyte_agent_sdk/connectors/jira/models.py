@@ -26,7 +26,7 @@ class JiraAuthConfig(BaseModel):
 
 class ProjectAvatarurls(BaseModel):
     """URLs for project avatars in different sizes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field_16x16: str | None = Field(default=None, alias="16x16")
     field_24x24: str | None = Field(default=None, alias="24x24")
@@ -35,7 +35,7 @@ class ProjectAvatarurls(BaseModel):
 
 class ProjectProjectcategory(BaseModel):
     """Project category information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -44,7 +44,7 @@ class ProjectProjectcategory(BaseModel):
 
 class ProjectIssuetypesItem(BaseModel):
     """Nested schema for Project.issueTypes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -57,7 +57,7 @@ class ProjectIssuetypesItem(BaseModel):
 
 class ProjectVersionsItem(BaseModel):
     """Nested schema for Project.versions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -74,7 +74,7 @@ class ProjectVersionsItem(BaseModel):
 
 class ProjectLeadAvatarurls(BaseModel):
     """URLs for user avatars in different sizes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field_16x16: str | None = Field(default=None, alias="16x16")
     field_24x24: str | None = Field(default=None, alias="24x24")
@@ -83,7 +83,7 @@ class ProjectLeadAvatarurls(BaseModel):
 
 class ProjectLead(BaseModel):
     """Project lead user (available with expand=lead)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     account_id: str | None = Field(default=None, alias="accountId")
@@ -95,7 +95,7 @@ class ProjectLead(BaseModel):
 
 class ProjectComponentsItem(BaseModel):
     """Nested schema for Project.components_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -105,7 +105,7 @@ class ProjectComponentsItem(BaseModel):
 
 class Project(BaseModel):
     """Jira project object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     key: str | None = Field(default=None)
@@ -132,7 +132,7 @@ class Project(BaseModel):
 
 class ProjectsList(BaseModel):
     """Paginated list of projects from search results"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     next_page: str | None = Field(default=None, alias="nextPage")
@@ -144,7 +144,7 @@ class ProjectsList(BaseModel):
 
 class IssueFieldsStatusStatuscategory(BaseModel):
     """Nested schema for IssueFieldsStatus.statusCategory"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     id: int | None = Field(default=None)
@@ -154,7 +154,7 @@ class IssueFieldsStatusStatuscategory(BaseModel):
 
 class IssueFieldsStatus(BaseModel):
     """Issue status information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     description: str | None = Field(default=None)
@@ -165,7 +165,7 @@ class IssueFieldsStatus(BaseModel):
 
 class IssueFieldsProjectProjectcategory(BaseModel):
     """Nested schema for IssueFieldsProject.projectCategory"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -174,7 +174,7 @@ class IssueFieldsProjectProjectcategory(BaseModel):
 
 class IssueFieldsProjectAvatarurls(BaseModel):
     """URLs for user avatars in different sizes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field_16x16: str | None = Field(default=None, alias="16x16")
     field_24x24: str | None = Field(default=None, alias="24x24")
@@ -183,7 +183,7 @@ class IssueFieldsProjectAvatarurls(BaseModel):
 
 class IssueFieldsProject(BaseModel):
     """Project information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -197,7 +197,7 @@ class IssueFieldsProject(BaseModel):
 
 class IssueFieldsAssigneeAvatarurls(BaseModel):
     """URLs for user avatars in different sizes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field_16x16: str | None = Field(default=None, alias="16x16")
     field_24x24: str | None = Field(default=None, alias="24x24")
@@ -206,7 +206,7 @@ class IssueFieldsAssigneeAvatarurls(BaseModel):
 
 class IssueFieldsAssignee(BaseModel):
     """Issue assignee user information (null if unassigned)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     account_id: str | None = Field(default=None, alias="accountId")
@@ -220,7 +220,7 @@ class IssueFieldsAssignee(BaseModel):
 
 class IssueFieldsIssuetype(BaseModel):
     """Issue type information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -233,7 +233,7 @@ class IssueFieldsIssuetype(BaseModel):
 
 class IssueFieldsPriority(BaseModel):
     """Issue priority information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     icon_url: str | None = Field(default=None, alias="iconUrl")
@@ -242,7 +242,7 @@ class IssueFieldsPriority(BaseModel):
 
 class IssueFieldsReporterAvatarurls(BaseModel):
     """URLs for user avatars in different sizes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field_16x16: str | None = Field(default=None, alias="16x16")
     field_24x24: str | None = Field(default=None, alias="24x24")
@@ -251,7 +251,7 @@ class IssueFieldsReporterAvatarurls(BaseModel):
 
 class IssueFieldsReporter(BaseModel):
     """Issue reporter user information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     account_id: str | None = Field(default=None, alias="accountId")
@@ -265,7 +265,7 @@ class IssueFieldsReporter(BaseModel):
 
 class IssueFields(BaseModel):
     """Issue fields (actual fields depend on 'fields' parameter in request)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     summary: str | None = Field(default=None, description="Issue summary/title")
     """Issue summary/title"""
@@ -288,7 +288,7 @@ class IssueFields(BaseModel):
 
 class Issue(BaseModel):
     """Jira issue object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     key: str | None = Field(default=None)
@@ -298,7 +298,7 @@ class Issue(BaseModel):
 
 class IssuesList(BaseModel):
     """Paginated list of issues from JQL search"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     issues: list[Issue] | None = Field(default=None)
     total: int | None = Field(default=None)
@@ -309,7 +309,7 @@ class IssuesList(BaseModel):
 
 class UserGroupsItemsItem(BaseModel):
     """Nested schema for UserGroups.items_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     group_id: str | None = Field(default=None, alias="groupId")
@@ -317,7 +317,7 @@ class UserGroupsItemsItem(BaseModel):
 
 class UserGroups(BaseModel):
     """User groups (available with expand=groups)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     size: int | None = Field(default=None, description="Number of groups")
     """Number of groups"""
@@ -326,7 +326,7 @@ class UserGroups(BaseModel):
 
 class UserApplicationrolesItemsItemGroupdetailsItem(BaseModel):
     """Nested schema for UserApplicationrolesItemsItem.groupDetails_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     group_id: str | None = Field(default=None, alias="groupId")
@@ -334,7 +334,7 @@ class UserApplicationrolesItemsItemGroupdetailsItem(BaseModel):
 
 class UserApplicationrolesItemsItemDefaultgroupsdetailsItem(BaseModel):
     """Nested schema for UserApplicationrolesItemsItem.defaultGroupsDetails_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     group_id: str | None = Field(default=None, alias="groupId")
@@ -342,7 +342,7 @@ class UserApplicationrolesItemsItemDefaultgroupsdetailsItem(BaseModel):
 
 class UserApplicationrolesItemsItem(BaseModel):
     """Nested schema for UserApplicationroles.items_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     key: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -361,7 +361,7 @@ class UserApplicationrolesItemsItem(BaseModel):
 
 class UserApplicationroles(BaseModel):
     """User application roles (available with expand=applicationRoles)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     size: int | None = Field(default=None, description="Number of application roles")
     """Number of application roles"""
@@ -370,7 +370,7 @@ class UserApplicationroles(BaseModel):
 
 class UserAvatarurls(BaseModel):
     """URLs for user avatars in different sizes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field_16x16: str | None = Field(default=None, alias="16x16")
     field_24x24: str | None = Field(default=None, alias="24x24")
@@ -379,7 +379,7 @@ class UserAvatarurls(BaseModel):
 
 class User(BaseModel):
     """Jira user object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     account_id: str | None = Field(default=None, alias="accountId")
@@ -396,7 +396,7 @@ class User(BaseModel):
 
 class IssueFieldSchema(BaseModel):
     """Schema information for the field"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Field type (e.g., string, number, array)")
     """Field type (e.g., string, number, array)"""
@@ -413,7 +413,7 @@ class IssueFieldSchema(BaseModel):
 
 class IssueField(BaseModel):
     """Jira issue field object (custom or system field)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     key: str | None = Field(default=None)
@@ -435,7 +435,7 @@ class IssueField(BaseModel):
 
 class IssueFieldSearchResults(BaseModel):
     """Paginated search results for issue fields"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     max_results: int | None = Field(default=None, alias="maxResults")
     start_at: int | None = Field(default=None, alias="startAt")
@@ -445,7 +445,7 @@ class IssueFieldSearchResults(BaseModel):
 
 class IssueCommentBodyContentItemContentItem(BaseModel):
     """Nested schema for IssueCommentBodyContentItem.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Content type (e.g., 'text')")
     """Content type (e.g., 'text')"""
@@ -454,7 +454,7 @@ class IssueCommentBodyContentItemContentItem(BaseModel):
 
 class IssueCommentBodyContentItem(BaseModel):
     """Nested schema for IssueCommentBody.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Block type (e.g., 'paragraph')")
     """Block type (e.g., 'paragraph')"""
@@ -463,7 +463,7 @@ class IssueCommentBodyContentItem(BaseModel):
 
 class IssueCommentBody(BaseModel):
     """Comment content in ADF (Atlassian Document Format)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Document type (always 'doc')")
     """Document type (always 'doc')"""
@@ -474,7 +474,7 @@ class IssueCommentBody(BaseModel):
 
 class IssueCommentUpdateauthorAvatarurls(BaseModel):
     """URLs for user avatars in different sizes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field_16x16: str | None = Field(default=None, alias="16x16")
     field_24x24: str | None = Field(default=None, alias="24x24")
@@ -483,7 +483,7 @@ class IssueCommentUpdateauthorAvatarurls(BaseModel):
 
 class IssueCommentUpdateauthor(BaseModel):
     """User who last updated the comment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     account_id: str | None = Field(default=None, alias="accountId")
@@ -497,7 +497,7 @@ class IssueCommentUpdateauthor(BaseModel):
 
 class IssueCommentVisibility(BaseModel):
     """Visibility restrictions for the comment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     value: str | None = Field(default=None)
@@ -505,7 +505,7 @@ class IssueCommentVisibility(BaseModel):
 
 class IssueCommentAuthorAvatarurls(BaseModel):
     """URLs for user avatars in different sizes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field_16x16: str | None = Field(default=None, alias="16x16")
     field_24x24: str | None = Field(default=None, alias="24x24")
@@ -514,7 +514,7 @@ class IssueCommentAuthorAvatarurls(BaseModel):
 
 class IssueCommentAuthor(BaseModel):
     """Comment author user information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     account_id: str | None = Field(default=None, alias="accountId")
@@ -528,7 +528,7 @@ class IssueCommentAuthor(BaseModel):
 
 class IssueComment(BaseModel):
     """Jira issue comment object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     self: str | None = Field(default=None)
@@ -544,7 +544,7 @@ class IssueComment(BaseModel):
 
 class IssueCommentsList(BaseModel):
     """Paginated list of issue comments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_at: int | None = Field(default=None, alias="startAt")
     max_results: int | None = Field(default=None, alias="maxResults")
@@ -553,7 +553,7 @@ class IssueCommentsList(BaseModel):
 
 class WorklogCommentContentItemContentItem(BaseModel):
     """Nested schema for WorklogCommentContentItem.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Content type (e.g., 'text')")
     """Content type (e.g., 'text')"""
@@ -562,7 +562,7 @@ class WorklogCommentContentItemContentItem(BaseModel):
 
 class WorklogCommentContentItem(BaseModel):
     """Nested schema for WorklogComment.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Block type (e.g., 'paragraph')")
     """Block type (e.g., 'paragraph')"""
@@ -571,7 +571,7 @@ class WorklogCommentContentItem(BaseModel):
 
 class WorklogComment(BaseModel):
     """Comment associated with the worklog (ADF format)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Document type (always 'doc')")
     """Document type (always 'doc')"""
@@ -582,7 +582,7 @@ class WorklogComment(BaseModel):
 
 class WorklogAuthorAvatarurls(BaseModel):
     """URLs for user avatars in different sizes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field_16x16: str | None = Field(default=None, alias="16x16")
     field_24x24: str | None = Field(default=None, alias="24x24")
@@ -591,7 +591,7 @@ class WorklogAuthorAvatarurls(BaseModel):
 
 class WorklogAuthor(BaseModel):
     """Worklog author user information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     account_id: str | None = Field(default=None, alias="accountId")
@@ -605,7 +605,7 @@ class WorklogAuthor(BaseModel):
 
 class WorklogUpdateauthorAvatarurls(BaseModel):
     """URLs for user avatars in different sizes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field_16x16: str | None = Field(default=None, alias="16x16")
     field_24x24: str | None = Field(default=None, alias="24x24")
@@ -614,7 +614,7 @@ class WorklogUpdateauthorAvatarurls(BaseModel):
 
 class WorklogUpdateauthor(BaseModel):
     """User who last updated the worklog"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     account_id: str | None = Field(default=None, alias="accountId")
@@ -628,7 +628,7 @@ class WorklogUpdateauthor(BaseModel):
 
 class WorklogVisibility(BaseModel):
     """Visibility restrictions for the worklog"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     value: str | None = Field(default=None)
@@ -636,7 +636,7 @@ class WorklogVisibility(BaseModel):
 
 class Worklog(BaseModel):
     """Jira worklog object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     self: str | None = Field(default=None)
@@ -654,7 +654,7 @@ class Worklog(BaseModel):
 
 class WorklogsList(BaseModel):
     """Paginated list of issue worklogs"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start_at: int | None = Field(default=None, alias="startAt")
     max_results: int | None = Field(default=None, alias="maxResults")
@@ -663,19 +663,19 @@ class WorklogsList(BaseModel):
 
 class IssueAssigneeParams(BaseModel):
     """Parameters for assigning an issue to a user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_id: str | None = Field(default=None, alias="accountId")
 
 class EmptyResponse(BaseModel):
     """Empty response object (returned for 204 No Content responses)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     pass
 
 class IssueCreateParamsFieldsDescriptionContentItemContentItem(BaseModel):
     """Nested schema for IssueCreateParamsFieldsDescriptionContentItem.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Content type (e.g., 'text')")
     """Content type (e.g., 'text')"""
@@ -684,7 +684,7 @@ class IssueCreateParamsFieldsDescriptionContentItemContentItem(BaseModel):
 
 class IssueCreateParamsFieldsDescriptionContentItem(BaseModel):
     """Nested schema for IssueCreateParamsFieldsDescription.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Block type (e.g., 'paragraph')")
     """Block type (e.g., 'paragraph')"""
@@ -692,7 +692,7 @@ class IssueCreateParamsFieldsDescriptionContentItem(BaseModel):
 
 class IssueCreateParamsFieldsDescription(BaseModel):
     """Issue description in Atlassian Document Format (ADF)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Document type (always 'doc')")
     """Document type (always 'doc')"""
@@ -703,7 +703,7 @@ class IssueCreateParamsFieldsDescription(BaseModel):
 
 class IssueCreateParamsFieldsIssuetype(BaseModel):
     """The type of issue (e.g., Bug, Task, Story)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Issue type ID")
     """Issue type ID"""
@@ -712,7 +712,7 @@ class IssueCreateParamsFieldsIssuetype(BaseModel):
 
 class IssueCreateParamsFieldsPriority(BaseModel):
     """Issue priority"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Priority ID")
     """Priority ID"""
@@ -721,7 +721,7 @@ class IssueCreateParamsFieldsPriority(BaseModel):
 
 class IssueCreateParamsFieldsProject(BaseModel):
     """The project to create the issue in"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Project ID")
     """Project ID"""
@@ -730,21 +730,21 @@ class IssueCreateParamsFieldsProject(BaseModel):
 
 class IssueCreateParamsFieldsAssignee(BaseModel):
     """The user to assign the issue to"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_id: str | None = Field(default=None, alias="accountId", description="The account ID of the user")
     """The account ID of the user"""
 
 class IssueCreateParamsFieldsParent(BaseModel):
     """Parent issue for subtasks"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     key: str | None = Field(default=None, description="Parent issue key")
     """Parent issue key"""
 
 class IssueCreateParamsFields(BaseModel):
     """The issue fields to set"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     project: IssueCreateParamsFieldsProject = Field(description="The project to create the issue in")
     """The project to create the issue in"""
@@ -765,14 +765,14 @@ class IssueCreateParamsFields(BaseModel):
 
 class IssueCreateParams(BaseModel):
     """Parameters for creating a new issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     fields: IssueCreateParamsFields
     update: dict[str, Any] | None = Field(default=None)
 
 class IssueCreateResponse(BaseModel):
     """Response from creating an issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     key: str | None = Field(default=None)
@@ -780,21 +780,21 @@ class IssueCreateResponse(BaseModel):
 
 class IssueUpdateParamsTransition(BaseModel):
     """Transition the issue to a new status"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="The ID of the transition to perform")
     """The ID of the transition to perform"""
 
 class IssueUpdateParamsFieldsAssignee(BaseModel):
     """The user to assign the issue to"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_id: str | None = Field(default=None, alias="accountId", description="The account ID of the user (use null to unassign)")
     """The account ID of the user (use null to unassign)"""
 
 class IssueUpdateParamsFieldsPriority(BaseModel):
     """Issue priority"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Priority ID")
     """Priority ID"""
@@ -803,7 +803,7 @@ class IssueUpdateParamsFieldsPriority(BaseModel):
 
 class IssueUpdateParamsFieldsDescriptionContentItemContentItem(BaseModel):
     """Nested schema for IssueUpdateParamsFieldsDescriptionContentItem.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Content type (e.g., 'text')")
     """Content type (e.g., 'text')"""
@@ -812,7 +812,7 @@ class IssueUpdateParamsFieldsDescriptionContentItemContentItem(BaseModel):
 
 class IssueUpdateParamsFieldsDescriptionContentItem(BaseModel):
     """Nested schema for IssueUpdateParamsFieldsDescription.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Block type (e.g., 'paragraph')")
     """Block type (e.g., 'paragraph')"""
@@ -820,7 +820,7 @@ class IssueUpdateParamsFieldsDescriptionContentItem(BaseModel):
 
 class IssueUpdateParamsFieldsDescription(BaseModel):
     """Issue description in Atlassian Document Format (ADF)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Document type (always 'doc')")
     """Document type (always 'doc')"""
@@ -831,7 +831,7 @@ class IssueUpdateParamsFieldsDescription(BaseModel):
 
 class IssueUpdateParamsFields(BaseModel):
     """The issue fields to update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     summary: str | None = Field(default=None, description="A brief summary of the issue (title)")
     """A brief summary of the issue (title)"""
@@ -846,7 +846,7 @@ class IssueUpdateParamsFields(BaseModel):
 
 class IssueUpdateParams(BaseModel):
     """Parameters for updating an issue. Only fields included are updated."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     fields: IssueUpdateParamsFields | None = Field(default=None)
     update: dict[str, Any] | None = Field(default=None)
@@ -854,7 +854,7 @@ class IssueUpdateParams(BaseModel):
 
 class CommentCreateParamsVisibility(BaseModel):
     """Restrict comment visibility to a group or role"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="The type of visibility restriction")
     """The type of visibility restriction"""
@@ -865,7 +865,7 @@ class CommentCreateParamsVisibility(BaseModel):
 
 class CommentCreateParamsBodyContentItemContentItem(BaseModel):
     """Nested schema for CommentCreateParamsBodyContentItem.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Content type (e.g., 'text')")
     """Content type (e.g., 'text')"""
@@ -874,7 +874,7 @@ class CommentCreateParamsBodyContentItemContentItem(BaseModel):
 
 class CommentCreateParamsBodyContentItem(BaseModel):
     """Nested schema for CommentCreateParamsBody.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Block type (e.g., 'paragraph')")
     """Block type (e.g., 'paragraph')"""
@@ -882,7 +882,7 @@ class CommentCreateParamsBodyContentItem(BaseModel):
 
 class CommentCreateParamsBody(BaseModel):
     """Comment content in Atlassian Document Format (ADF)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str = Field(alias="type", description="Document type (always 'doc')")
     """Document type (always 'doc')"""
@@ -893,7 +893,7 @@ class CommentCreateParamsBody(BaseModel):
 
 class CommentCreateParams(BaseModel):
     """Parameters for creating a comment on an issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     body: CommentCreateParamsBody
     visibility: CommentCreateParamsVisibility | None = Field(default=None)
@@ -901,7 +901,7 @@ class CommentCreateParams(BaseModel):
 
 class CommentUpdateParamsBodyContentItemContentItem(BaseModel):
     """Nested schema for CommentUpdateParamsBodyContentItem.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Content type (e.g., 'text')")
     """Content type (e.g., 'text')"""
@@ -910,7 +910,7 @@ class CommentUpdateParamsBodyContentItemContentItem(BaseModel):
 
 class CommentUpdateParamsBodyContentItem(BaseModel):
     """Nested schema for CommentUpdateParamsBody.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Block type (e.g., 'paragraph')")
     """Block type (e.g., 'paragraph')"""
@@ -918,7 +918,7 @@ class CommentUpdateParamsBodyContentItem(BaseModel):
 
 class CommentUpdateParamsBody(BaseModel):
     """Updated comment content in Atlassian Document Format (ADF)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str = Field(alias="type", description="Document type (always 'doc')")
     """Document type (always 'doc')"""
@@ -929,7 +929,7 @@ class CommentUpdateParamsBody(BaseModel):
 
 class CommentUpdateParamsVisibility(BaseModel):
     """Restrict comment visibility to a group or role"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="The type of visibility restriction")
     """The type of visibility restriction"""
@@ -940,14 +940,14 @@ class CommentUpdateParamsVisibility(BaseModel):
 
 class CommentUpdateParams(BaseModel):
     """Parameters for updating a comment. Only fields included are updated."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     body: CommentUpdateParamsBody
     visibility: CommentUpdateParamsVisibility | None = Field(default=None)
 
 class IssueTransitionToStatuscategory(BaseModel):
     """Nested schema for IssueTransitionTo.statusCategory"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     id: int | None = Field(default=None)
@@ -957,7 +957,7 @@ class IssueTransitionToStatuscategory(BaseModel):
 
 class IssueTransitionTo(BaseModel):
     """The target status after performing this transition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
     description: str | None = Field(default=None)
@@ -969,7 +969,7 @@ class IssueTransitionTo(BaseModel):
 
 class IssueTransition(BaseModel):
     """A workflow transition that can be performed on an issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -982,21 +982,21 @@ class IssueTransition(BaseModel):
 
 class IssueTransitionsList(BaseModel):
     """List of available transitions for an issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     expand: str | None = Field(default=None)
     transitions: list[IssueTransition] | None = Field(default=None)
 
 class IssueTransitionParamsTransition(BaseModel):
     """The transition to perform"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str = Field(description="The ID of the transition to perform. Get available transition IDs from the GET transitions endpoint.")
     """The ID of the transition to perform. Get available transition IDs from the GET transitions endpoint."""
 
 class IssueTransitionParams(BaseModel):
     """Parameters for transitioning an issue to a new status"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     transition: IssueTransitionParamsTransition
     fields: dict[str, Any] | None = Field(default=None)
@@ -1005,7 +1005,7 @@ class IssueTransitionParams(BaseModel):
 
 class WorklogCreateParamsVisibility(BaseModel):
     """Restrict worklog visibility to a group or role"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="The type of visibility restriction")
     """The type of visibility restriction"""
@@ -1016,7 +1016,7 @@ class WorklogCreateParamsVisibility(BaseModel):
 
 class WorklogCreateParamsCommentContentItemContentItem(BaseModel):
     """Nested schema for WorklogCreateParamsCommentContentItem.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Content type (e.g., 'text')")
     """Content type (e.g., 'text')"""
@@ -1025,7 +1025,7 @@ class WorklogCreateParamsCommentContentItemContentItem(BaseModel):
 
 class WorklogCreateParamsCommentContentItem(BaseModel):
     """Nested schema for WorklogCreateParamsComment.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Block type (e.g., 'paragraph')")
     """Block type (e.g., 'paragraph')"""
@@ -1033,7 +1033,7 @@ class WorklogCreateParamsCommentContentItem(BaseModel):
 
 class WorklogCreateParamsComment(BaseModel):
     """A comment about the work done in Atlassian Document Format (ADF)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="Document type (always 'doc')")
     """Document type (always 'doc')"""
@@ -1044,7 +1044,7 @@ class WorklogCreateParamsComment(BaseModel):
 
 class WorklogCreateParams(BaseModel):
     """Parameters for adding a worklog entry to an issue. Either timeSpentSeconds or timeSpent must be provided."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     time_spent_seconds: int | None = Field(default=None, alias="timeSpentSeconds")
     time_spent: str | None = Field(default=None, alias="timeSpent")
@@ -1054,7 +1054,7 @@ class WorklogCreateParams(BaseModel):
 
 class IssueLinkCreateParamsOutwardissue(BaseModel):
     """The outward issue (the issue that causes the link)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     key: str = Field(description="The issue key (e.g., PROJ-456)")
     """The issue key (e.g., PROJ-456)"""
@@ -1063,7 +1063,7 @@ class IssueLinkCreateParamsOutwardissue(BaseModel):
 
 class IssueLinkCreateParamsInwardissue(BaseModel):
     """The inward issue (the issue that is affected by the link)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     key: str = Field(description="The issue key (e.g., PROJ-123)")
     """The issue key (e.g., PROJ-123)"""
@@ -1072,7 +1072,7 @@ class IssueLinkCreateParamsInwardissue(BaseModel):
 
 class IssueLinkCreateParamsType(BaseModel):
     """The type of link (e.g., Blocks, Duplicate, Relates)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="The name of the link type (e.g., Blocks, Duplicate, Relates, Cloners)")
     """The name of the link type (e.g., Blocks, Duplicate, Relates, Cloners)"""
@@ -1085,21 +1085,21 @@ class IssueLinkCreateParamsType(BaseModel):
 
 class IssueLinkCreateParamsCommentBodyContentItemContentItem(BaseModel):
     """Nested schema for IssueLinkCreateParamsCommentBodyContentItem.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     text: str | None = Field(default=None)
 
 class IssueLinkCreateParamsCommentBodyContentItem(BaseModel):
     """Nested schema for IssueLinkCreateParamsCommentBody.content_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     content: list[IssueLinkCreateParamsCommentBodyContentItemContentItem] | None = Field(default=None)
 
 class IssueLinkCreateParamsCommentBody(BaseModel):
     """Nested schema for IssueLinkCreateParamsComment.body"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     version: int | None = Field(default=None)
@@ -1107,13 +1107,13 @@ class IssueLinkCreateParamsCommentBody(BaseModel):
 
 class IssueLinkCreateParamsComment(BaseModel):
     """A comment about the link in Atlassian Document Format (ADF)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     body: IssueLinkCreateParamsCommentBody | None = Field(default=None)
 
 class IssueLinkCreateParams(BaseModel):
     """Parameters for creating a link between two issues"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: IssueLinkCreateParamsType = Field(alias="type")
     inward_issue: IssueLinkCreateParamsInwardissue = Field(alias="inwardIssue")
@@ -1125,7 +1125,7 @@ class IssueLinkCreateParams(BaseModel):
 
 class IssuesApiSearchResultMeta(BaseModel):
     """Metadata for issues.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
     is_last: bool | None = Field(default=None, alias="isLast")
@@ -1133,14 +1133,14 @@ class IssuesApiSearchResultMeta(BaseModel):
 
 class ProjectsApiSearchResultMeta(BaseModel):
     """Metadata for projects.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None, alias="nextPage")
     total: int | None = Field(default=None)
 
 class IssueCommentsListResultMeta(BaseModel):
     """Metadata for issue_comments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: int | None = Field(default=None)
     max_results: int | None = Field(default=None)
@@ -1148,7 +1148,7 @@ class IssueCommentsListResultMeta(BaseModel):
 
 class IssueWorklogsListResultMeta(BaseModel):
     """Metadata for issue_worklogs.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_offset: int | None = Field(default=None)
     max_results: int | None = Field(default=None)
@@ -1207,7 +1207,7 @@ D = TypeVar('D')
 
 class IssuesSearchData(BaseModel):
     """Search result data for issues entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     changelog: dict[str, Any] | None = None
     """Details of changelogs associated with the issue"""
@@ -1251,7 +1251,7 @@ class IssuesSearchData(BaseModel):
 
 class ProjectsSearchData(BaseModel):
     """Search result data for projects entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     archived: bool = None
     """Whether the project is archived"""
@@ -1325,7 +1325,7 @@ class ProjectsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account_id: str = None
     """The account ID of the user, uniquely identifying the user across all Atlassian products"""
@@ -1359,7 +1359,7 @@ class UsersSearchData(BaseModel):
 
 class IssueCommentsSearchData(BaseModel):
     """Search result data for issue_comments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     author: dict[str, Any] | None = None
     """The ID of the user who created the comment"""
@@ -1389,7 +1389,7 @@ class IssueCommentsSearchData(BaseModel):
 
 class IssueFieldsSearchData(BaseModel):
     """Search result data for issue_fields entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     clause_names: list[Any] = None
     """The names that can be used to reference the field in an advanced search"""
@@ -1417,7 +1417,7 @@ class IssueFieldsSearchData(BaseModel):
 
 class IssueWorklogsSearchData(BaseModel):
     """Search result data for issue_worklogs entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     author: dict[str, Any] = None
     """Details of the user who created the worklog"""
@@ -1451,7 +1451,7 @@ class IssueWorklogsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1463,7 +1463,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
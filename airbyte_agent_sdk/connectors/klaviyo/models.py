@@ -24,7 +24,7 @@ class KlaviyoAuthConfig(BaseModel):
 
 class ProfileAttributesLocation(BaseModel):
     """Location information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     address1: str | None | None = Field(default=None)
     address2: str | None | None = Field(default=None)
@@ -38,7 +38,7 @@ class ProfileAttributesLocation(BaseModel):
 
 class ProfileAttributes(BaseModel):
     """Profile attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email: str | None | None = Field(default=None, description="Email address")
     """Email address"""
@@ -67,13 +67,13 @@ class ProfileAttributes(BaseModel):
 
 class ProfileLinks(BaseModel):
     """Related links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
 
 class Profile(BaseModel):
     """A Klaviyo profile representing a contact"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     type_: str | None = Field(default=None, alias="type")
@@ -82,7 +82,7 @@ class Profile(BaseModel):
 
 class ProfilesListLinks(BaseModel):
     """Nested schema for ProfilesList.links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
     next: str | None | None = Field(default=None)
@@ -90,14 +90,14 @@ class ProfilesListLinks(BaseModel):
 
 class ProfilesList(BaseModel):
     """Paginated list of profiles"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Profile] | None = Field(default=None)
     links: ProfilesListLinks | None = Field(default=None)
 
 class ListAttributes(BaseModel):
     """List attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None | None = Field(default=None, description="List name")
     """List name"""
@@ -110,13 +110,13 @@ class ListAttributes(BaseModel):
 
 class ListLinks(BaseModel):
     """Related links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
 
 class List(BaseModel):
     """A Klaviyo list for organizing profiles"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     type_: str | None = Field(default=None, alias="type")
@@ -125,7 +125,7 @@ class List(BaseModel):
 
 class ListsListLinks(BaseModel):
     """Nested schema for ListsList.links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
     next: str | None | None = Field(default=None)
@@ -133,20 +133,20 @@ class ListsListLinks(BaseModel):
 
 class ListsList(BaseModel):
     """Paginated list of lists"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[List] | None = Field(default=None)
     links: ListsListLinks | None = Field(default=None)
 
 class CampaignLinks(BaseModel):
     """Related links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
 
 class CampaignAttributes(BaseModel):
     """Campaign attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None | None = Field(default=None, description="Campaign name")
     """Campaign name"""
@@ -173,7 +173,7 @@ class CampaignAttributes(BaseModel):
 
 class Campaign(BaseModel):
     """A Klaviyo campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     type_: str | None = Field(default=None, alias="type")
@@ -182,7 +182,7 @@ class Campaign(BaseModel):
 
 class CampaignsListLinks(BaseModel):
     """Nested schema for CampaignsList.links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
     next: str | None | None = Field(default=None)
@@ -190,20 +190,20 @@ class CampaignsListLinks(BaseModel):
 
 class CampaignsList(BaseModel):
     """Paginated list of campaigns"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Campaign] | None = Field(default=None)
     links: CampaignsListLinks | None = Field(default=None)
 
 class EventLinks(BaseModel):
     """Related links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
 
 class EventAttributes(BaseModel):
     """Event attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     timestamp: Any | None = Field(default=None, description="Event timestamp (can be ISO string or Unix timestamp)")
     """Event timestamp (can be ISO string or Unix timestamp)"""
@@ -216,40 +216,40 @@ class EventAttributes(BaseModel):
 
 class EventRelationshipsProfileData(BaseModel):
     """Nested schema for EventRelationshipsProfile.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     id: str | None | None = Field(default=None)
 
 class EventRelationshipsProfile(BaseModel):
     """Nested schema for EventRelationships.profile"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: EventRelationshipsProfileData | None | None = Field(default=None)
 
 class EventRelationshipsMetricData(BaseModel):
     """Nested schema for EventRelationshipsMetric.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     id: str | None | None = Field(default=None)
 
 class EventRelationshipsMetric(BaseModel):
     """Nested schema for EventRelationships.metric"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: EventRelationshipsMetricData | None | None = Field(default=None)
 
 class EventRelationships(BaseModel):
     """Related resources"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     profile: EventRelationshipsProfile | None | None = Field(default=None)
     metric: EventRelationshipsMetric | None | None = Field(default=None)
 
 class Event(BaseModel):
     """A Klaviyo event representing an action taken by a profile"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     type_: str | None = Field(default=None, alias="type")
@@ -259,7 +259,7 @@ class Event(BaseModel):
 
 class EventsListLinks(BaseModel):
     """Nested schema for EventsList.links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
     next: str | None | None = Field(default=None)
@@ -267,20 +267,20 @@ class EventsListLinks(BaseModel):
 
 class EventsList(BaseModel):
     """Paginated list of events"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Event] | None = Field(default=None)
     links: EventsListLinks | None = Field(default=None)
 
 class MetricLinks(BaseModel):
     """Related links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
 
 class MetricAttributesIntegration(BaseModel):
     """Integration information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -288,7 +288,7 @@ class MetricAttributesIntegration(BaseModel):
 
 class MetricAttributes(BaseModel):
     """Metric attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None | None = Field(default=None, description="Metric name")
     """Metric name"""
@@ -301,7 +301,7 @@ class MetricAttributes(BaseModel):
 
 class Metric(BaseModel):
     """A Klaviyo metric (event type)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     type_: str | None = Field(default=None, alias="type")
@@ -310,7 +310,7 @@ class Metric(BaseModel):
 
 class MetricsListLinks(BaseModel):
     """Nested schema for MetricsList.links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
     next: str | None | None = Field(default=None)
@@ -318,14 +318,14 @@ class MetricsListLinks(BaseModel):
 
 class MetricsList(BaseModel):
     """Paginated list of metrics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Metric] | None = Field(default=None)
     links: MetricsListLinks | None = Field(default=None)
 
 class FlowAttributes(BaseModel):
     """Flow attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None | None = Field(default=None, description="Flow name")
     """Flow name"""
@@ -342,13 +342,13 @@ class FlowAttributes(BaseModel):
 
 class FlowLinks(BaseModel):
     """Related links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
 
 class Flow(BaseModel):
     """A Klaviyo flow (automated sequence)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     type_: str | None = Field(default=None, alias="type")
@@ -357,7 +357,7 @@ class Flow(BaseModel):
 
 class FlowsListLinks(BaseModel):
     """Nested schema for FlowsList.links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
     next: str | None | None = Field(default=None)
@@ -365,14 +365,14 @@ class FlowsListLinks(BaseModel):
 
 class FlowsList(BaseModel):
     """Paginated list of flows"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Flow] | None = Field(default=None)
     links: FlowsListLinks | None = Field(default=None)
 
 class TemplateAttributes(BaseModel):
     """Template attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None | None = Field(default=None, description="Template name")
     """Template name"""
@@ -389,13 +389,13 @@ class TemplateAttributes(BaseModel):
 
 class TemplateLinks(BaseModel):
     """Related links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
 
 class Template(BaseModel):
     """A Klaviyo email template"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     type_: str | None = Field(default=None, alias="type")
@@ -404,7 +404,7 @@ class Template(BaseModel):
 
 class TemplatesListLinks(BaseModel):
     """Nested schema for TemplatesList.links"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None | None = Field(default=None)
     next: str | None | None = Field(default=None)
@@ -412,7 +412,7 @@ class TemplatesListLinks(BaseModel):
 
 class TemplatesList(BaseModel):
     """Paginated list of templates"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Template] | None = Field(default=None)
     links: TemplatesListLinks | None = Field(default=None)
@@ -422,43 +422,43 @@ class TemplatesList(BaseModel):
 
 class ProfilesListResultMeta(BaseModel):
     """Metadata for profiles.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ListsListResultMeta(BaseModel):
     """Metadata for lists.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class EventsListResultMeta(BaseModel):
     """Metadata for events.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class MetricsListResultMeta(BaseModel):
     """Metadata for metrics.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class FlowsListResultMeta(BaseModel):
     """Metadata for flows.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class EmailTemplatesListResultMeta(BaseModel):
     """Metadata for email_templates.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
@@ -515,7 +515,7 @@ D = TypeVar('D')
 
 class ProfilesSearchData(BaseModel):
     """Search result data for profiles entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attributes: dict[str, Any] | None = None
     """"""
@@ -535,7 +535,7 @@ class ProfilesSearchData(BaseModel):
 
 class EventsSearchData(BaseModel):
     """Search result data for events entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attributes: dict[str, Any] | None = None
     """"""
@@ -553,7 +553,7 @@ class EventsSearchData(BaseModel):
 
 class EmailTemplatesSearchData(BaseModel):
     """Search result data for email_templates entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attributes: dict[str, Any] | None = None
     """"""
@@ -569,7 +569,7 @@ class EmailTemplatesSearchData(BaseModel):
 
 class CampaignsSearchData(BaseModel):
     """Search result data for campaigns entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attributes: dict[str, Any] | None = None
     """"""
@@ -587,7 +587,7 @@ class CampaignsSearchData(BaseModel):
 
 class FlowsSearchData(BaseModel):
     """Search result data for flows entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attributes: dict[str, Any] | None = None
     """"""
@@ -605,7 +605,7 @@ class FlowsSearchData(BaseModel):
 
 class MetricsSearchData(BaseModel):
     """Search result data for metrics entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attributes: dict[str, Any] | None = None
     """"""
@@ -623,7 +623,7 @@ class MetricsSearchData(BaseModel):
 
 class ListsSearchData(BaseModel):
     """Search result data for lists entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attributes: dict[str, Any] | None = None
     """"""
@@ -643,7 +643,7 @@ class ListsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -655,7 +655,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
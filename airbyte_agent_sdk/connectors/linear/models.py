@@ -24,7 +24,7 @@ class LinearAuthConfig(BaseModel):
 
 class Issue(BaseModel):
     """Linear issue object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     title: str
@@ -39,7 +39,7 @@ class Issue(BaseModel):
 
 class IssuesListResponseDataIssuesPageinfo(BaseModel):
     """Pagination information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage", description="Whether there are more items available")
     """Whether there are more items available"""
@@ -48,7 +48,7 @@ class IssuesListResponseDataIssuesPageinfo(BaseModel):
 
 class IssuesListResponseDataIssues(BaseModel):
     """Nested schema for IssuesListResponseData.issues"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     nodes: list[Issue] | None = Field(default=None)
     page_info: IssuesListResponseDataIssuesPageinfo | None = Field(default=None, alias="pageInfo", description="Pagination information")
@@ -56,31 +56,31 @@ class IssuesListResponseDataIssues(BaseModel):
 
 class IssuesListResponseData(BaseModel):
     """Nested schema for IssuesListResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     issues: IssuesListResponseDataIssues | None = Field(default=None)
 
 class IssuesListResponse(BaseModel):
     """GraphQL response for issues list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: IssuesListResponseData | None = Field(default=None)
 
 class IssueResponseData(BaseModel):
     """Nested schema for IssueResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     issue: Issue | None = Field(default=None)
 
 class IssueResponse(BaseModel):
     """GraphQL response for single issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: IssueResponseData | None = Field(default=None)
 
 class Project(BaseModel):
     """Linear project object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str
@@ -94,7 +94,7 @@ class Project(BaseModel):
 
 class ProjectsListResponseDataProjectsPageinfo(BaseModel):
     """Pagination information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage", description="Whether there are more items available")
     """Whether there are more items available"""
@@ -103,7 +103,7 @@ class ProjectsListResponseDataProjectsPageinfo(BaseModel):
 
 class ProjectsListResponseDataProjects(BaseModel):
     """Nested schema for ProjectsListResponseData.projects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     nodes: list[Project] | None = Field(default=None)
     page_info: ProjectsListResponseDataProjectsPageinfo | None = Field(default=None, alias="pageInfo", description="Pagination information")
@@ -111,31 +111,31 @@ class ProjectsListResponseDataProjects(BaseModel):
 
 class ProjectsListResponseData(BaseModel):
     """Nested schema for ProjectsListResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     projects: ProjectsListResponseDataProjects | None = Field(default=None)
 
 class ProjectsListResponse(BaseModel):
     """GraphQL response for projects list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: ProjectsListResponseData | None = Field(default=None)
 
 class ProjectResponseData(BaseModel):
     """Nested schema for ProjectResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     project: Project | None = Field(default=None)
 
 class ProjectResponse(BaseModel):
     """GraphQL response for single project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: ProjectResponseData | None = Field(default=None)
 
 class ProjectCreateParams(BaseModel):
     """Parameters for creating a project"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     team_ids: list[str] = Field(alias="teamIds")
@@ -149,7 +149,7 @@ class ProjectUpdateParams(BaseModel):
     """Parameters for updating a project. All fields except id are optional for partial updates.
 Use this to rename projects, change descriptions, update dates, or change the project state.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -161,38 +161,38 @@ Use this to rename projects, change descriptions, update dates, or change the pr
 
 class ProjectMutationPayload(BaseModel):
     """Project mutation result"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     success: bool | None = Field(default=None)
     project: Project | None = Field(default=None)
 
 class ProjectCreateResponseData(BaseModel):
     """Nested schema for ProjectCreateResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     project_create: ProjectMutationPayload | None = Field(default=None, alias="projectCreate")
 
 class ProjectCreateResponse(BaseModel):
     """GraphQL response for project creation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: ProjectCreateResponseData | None = Field(default=None)
 
 class ProjectUpdateResponseData(BaseModel):
     """Nested schema for ProjectUpdateResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     project_update: ProjectMutationPayload | None = Field(default=None, alias="projectUpdate")
 
 class ProjectUpdateResponse(BaseModel):
     """GraphQL response for project update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: ProjectUpdateResponseData | None = Field(default=None)
 
 class Team(BaseModel):
     """Linear team object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str
@@ -204,7 +204,7 @@ class Team(BaseModel):
 
 class TeamsListResponseDataTeamsPageinfo(BaseModel):
     """Pagination information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage", description="Whether there are more items available")
     """Whether there are more items available"""
@@ -213,7 +213,7 @@ class TeamsListResponseDataTeamsPageinfo(BaseModel):
 
 class TeamsListResponseDataTeams(BaseModel):
     """Nested schema for TeamsListResponseData.teams"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     nodes: list[Team] | None = Field(default=None)
     page_info: TeamsListResponseDataTeamsPageinfo | None = Field(default=None, alias="pageInfo", description="Pagination information")
@@ -221,31 +221,31 @@ class TeamsListResponseDataTeams(BaseModel):
 
 class TeamsListResponseData(BaseModel):
     """Nested schema for TeamsListResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     teams: TeamsListResponseDataTeams | None = Field(default=None)
 
 class TeamsListResponse(BaseModel):
     """GraphQL response for teams list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: TeamsListResponseData | None = Field(default=None)
 
 class TeamResponseData(BaseModel):
     """Nested schema for TeamResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     team: Team | None = Field(default=None)
 
 class TeamResponse(BaseModel):
     """GraphQL response for single team"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: TeamResponseData | None = Field(default=None)
 
 class WorkflowState(BaseModel):
     """Linear workflow state object representing a status in a team's workflow"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str
@@ -258,7 +258,7 @@ class WorkflowState(BaseModel):
 
 class WorkflowStatesListResponseDataWorkflowstatesPageinfo(BaseModel):
     """Pagination information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage", description="Whether there are more items available")
     """Whether there are more items available"""
@@ -267,7 +267,7 @@ class WorkflowStatesListResponseDataWorkflowstatesPageinfo(BaseModel):
 
 class WorkflowStatesListResponseDataWorkflowstates(BaseModel):
     """Nested schema for WorkflowStatesListResponseData.workflowStates"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     nodes: list[WorkflowState] | None = Field(default=None)
     page_info: WorkflowStatesListResponseDataWorkflowstatesPageinfo | None = Field(default=None, alias="pageInfo", description="Pagination information")
@@ -275,19 +275,19 @@ class WorkflowStatesListResponseDataWorkflowstates(BaseModel):
 
 class WorkflowStatesListResponseData(BaseModel):
     """Nested schema for WorkflowStatesListResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     workflow_states: WorkflowStatesListResponseDataWorkflowstates | None = Field(default=None, alias="workflowStates")
 
 class WorkflowStatesListResponse(BaseModel):
     """GraphQL response for workflow states list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: WorkflowStatesListResponseData | None = Field(default=None)
 
 class IssueCreateParams(BaseModel):
     """Parameters for creating an issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     team_id: str = Field(alias="teamId")
     title: str
@@ -302,7 +302,7 @@ To assign a user, provide assigneeId with the user's ID (get user IDs from the u
 To unassign the current user, set assigneeId to null.
 Omit assigneeId to leave the current assignee unchanged.
 """
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     title: str | None = Field(default=None)
@@ -314,7 +314,7 @@ Omit assigneeId to leave the current assignee unchanged.
 
 class IssueWithState(BaseModel):
     """Issue object with state ID and assignee ID included"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     title: str | None = Field(default=None)
@@ -328,38 +328,38 @@ class IssueWithState(BaseModel):
 
 class IssueMutationPayload(BaseModel):
     """Issue mutation result"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     success: bool | None = Field(default=None)
     issue: IssueWithState | None = Field(default=None)
 
 class IssueCreateResponseData(BaseModel):
     """Nested schema for IssueCreateResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     issue_create: IssueMutationPayload | None = Field(default=None, alias="issueCreate")
 
 class IssueCreateResponse(BaseModel):
     """GraphQL response for issue creation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: IssueCreateResponseData | None = Field(default=None)
 
 class IssueUpdateResponseData(BaseModel):
     """Nested schema for IssueUpdateResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     issue_update: IssueMutationPayload | None = Field(default=None, alias="issueUpdate")
 
 class IssueUpdateResponse(BaseModel):
     """GraphQL response for issue update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: IssueUpdateResponseData | None = Field(default=None)
 
 class User(BaseModel):
     """Linear user object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str
@@ -372,7 +372,7 @@ class User(BaseModel):
 
 class UsersListResponseDataUsersPageinfo(BaseModel):
     """Pagination information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage", description="Whether there are more items available")
     """Whether there are more items available"""
@@ -381,7 +381,7 @@ class UsersListResponseDataUsersPageinfo(BaseModel):
 
 class UsersListResponseDataUsers(BaseModel):
     """Nested schema for UsersListResponseData.users"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     nodes: list[User] | None = Field(default=None)
     page_info: UsersListResponseDataUsersPageinfo | None = Field(default=None, alias="pageInfo", description="Pagination information")
@@ -389,31 +389,31 @@ class UsersListResponseDataUsers(BaseModel):
 
 class UsersListResponseData(BaseModel):
     """Nested schema for UsersListResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     users: UsersListResponseDataUsers | None = Field(default=None)
 
 class UsersListResponse(BaseModel):
     """GraphQL response for users list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: UsersListResponseData | None = Field(default=None)
 
 class UserResponseData(BaseModel):
     """Nested schema for UserResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user: User | None = Field(default=None)
 
 class UserResponse(BaseModel):
     """GraphQL response for single user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: UserResponseData | None = Field(default=None)
 
 class Comment(BaseModel):
     """Linear comment object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     body: str
@@ -424,7 +424,7 @@ class Comment(BaseModel):
 
 class CommentsListResponseDataIssueCommentsPageinfo(BaseModel):
     """Pagination information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage", description="Whether there are more items available")
     """Whether there are more items available"""
@@ -433,7 +433,7 @@ class CommentsListResponseDataIssueCommentsPageinfo(BaseModel):
 
 class CommentsListResponseDataIssueComments(BaseModel):
     """Nested schema for CommentsListResponseDataIssue.comments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     nodes: list[Comment] | None = Field(default=None)
     page_info: CommentsListResponseDataIssueCommentsPageinfo | None = Field(default=None, alias="pageInfo", description="Pagination information")
@@ -441,76 +441,76 @@ class CommentsListResponseDataIssueComments(BaseModel):
 
 class CommentsListResponseDataIssue(BaseModel):
     """Nested schema for CommentsListResponseData.issue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     comments: CommentsListResponseDataIssueComments | None = Field(default=None)
 
 class CommentsListResponseData(BaseModel):
     """Nested schema for CommentsListResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     issue: CommentsListResponseDataIssue | None = Field(default=None)
 
 class CommentsListResponse(BaseModel):
     """GraphQL response for comments list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: CommentsListResponseData | None = Field(default=None)
 
 class CommentResponseData(BaseModel):
     """Nested schema for CommentResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     comment: Comment | None = Field(default=None)
 
 class CommentResponse(BaseModel):
     """GraphQL response for single comment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: CommentResponseData | None = Field(default=None)
 
 class CommentCreateParams(BaseModel):
     """Parameters for creating a comment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     issue_id: str = Field(alias="issueId")
     body: str
 
 class CommentUpdateParams(BaseModel):
     """Parameters for updating a comment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     body: str
 
 class CommentMutationPayload(BaseModel):
     """Comment mutation result"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     success: bool | None = Field(default=None)
     comment: Comment | None = Field(default=None)
 
 class CommentCreateResponseData(BaseModel):
     """Nested schema for CommentCreateResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     comment_create: CommentMutationPayload | None = Field(default=None, alias="commentCreate")
 
 class CommentCreateResponse(BaseModel):
     """GraphQL response for comment creation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: CommentCreateResponseData | None = Field(default=None)
 
 class CommentUpdateResponseData(BaseModel):
     """Nested schema for CommentUpdateResponse.data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     comment_update: CommentMutationPayload | None = Field(default=None, alias="commentUpdate")
 
 class CommentUpdateResponse(BaseModel):
     """GraphQL response for comment update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: CommentUpdateResponseData | None = Field(default=None)
 
@@ -519,42 +519,42 @@ class CommentUpdateResponse(BaseModel):
 
 class IssuesListResultMeta(BaseModel):
     """Metadata for issues.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage")
     end_cursor: str | None = Field(default=None, alias="endCursor")
 
 class ProjectsListResultMeta(BaseModel):
     """Metadata for projects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage")
     end_cursor: str | None = Field(default=None, alias="endCursor")
 
 class TeamsListResultMeta(BaseModel):
     """Metadata for teams.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage")
     end_cursor: str | None = Field(default=None, alias="endCursor")
 
 class WorkflowStatesListResultMeta(BaseModel):
     """Metadata for workflow_states.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage")
     end_cursor: str | None = Field(default=None, alias="endCursor")
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage")
     end_cursor: str | None = Field(default=None, alias="endCursor")
 
 class CommentsListResultMeta(BaseModel):
     """Metadata for comments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_next_page: bool | None = Field(default=None, alias="hasNextPage")
     end_cursor: str | None = Field(default=None, alias="endCursor")
@@ -612,7 +612,7 @@ D = TypeVar('D')
 
 class CommentsSearchData(BaseModel):
     """Search result data for comments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     body: str | None = None
     """"""
@@ -648,7 +648,7 @@ class CommentsSearchData(BaseModel):
 
 class IssuesSearchData(BaseModel):
     """Search result data for issues entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     added_to_cycle_at: str | None = None
     """"""
@@ -760,7 +760,7 @@ class IssuesSearchData(BaseModel):
 
 class ProjectsSearchData(BaseModel):
     """Search result data for projects entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     canceled_at: str | None = None
     """"""
@@ -846,7 +846,7 @@ class ProjectsSearchData(BaseModel):
 
 class TeamsSearchData(BaseModel):
     """Search result data for teams entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active_cycle: dict[str, Any] | None = None
     """"""
@@ -932,7 +932,7 @@ class TeamsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active: bool | None = None
     """"""
@@ -978,7 +978,7 @@ class UsersSearchData(BaseModel):
 
 class WorkflowStatesSearchData(BaseModel):
     """Search result data for workflow_states entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     color: str | None = None
     """"""
@@ -1008,7 +1008,7 @@ class WorkflowStatesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1020,7 +1020,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -38,34 +38,34 @@ class LinkedinAdsReplicationConfig(BaseModel):
 
 class AccountChangeauditstampsCreated(BaseModel):
     """Nested schema for AccountChangeauditstamps.created"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     actor: str | None | None = Field(default=None)
     time: int | None | None = Field(default=None)
 
 class AccountChangeauditstampsLastmodified(BaseModel):
     """Nested schema for AccountChangeauditstamps.lastModified"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     actor: str | None | None = Field(default=None)
     time: int | None | None = Field(default=None)
 
 class AccountChangeauditstamps(BaseModel):
     """Creation and last modification audit stamps"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created: AccountChangeauditstampsCreated | None | None = Field(default=None)
     last_modified: AccountChangeauditstampsLastmodified | None | None = Field(default=None, alias="lastModified")
 
 class AccountVersion(BaseModel):
     """Version information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     version_tag: str | None | None = Field(default=None, alias="versionTag")
 
 class Account(BaseModel):
     """LinkedIn ad account object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -85,41 +85,41 @@ class Account(BaseModel):
 
 class AccountsListMetadata(BaseModel):
     """Nested schema for AccountsList.metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class AccountsList(BaseModel):
     """Paginated list of ad accounts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     elements: list[Account] | None = Field(default=None)
     metadata: AccountsListMetadata | None = Field(default=None)
 
 class AccountUserChangeauditstampsCreated(BaseModel):
     """Nested schema for AccountUserChangeauditstamps.created"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     actor: str | None | None = Field(default=None)
     time: int | None | None = Field(default=None)
 
 class AccountUserChangeauditstampsLastmodified(BaseModel):
     """Nested schema for AccountUserChangeauditstamps.lastModified"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     actor: str | None | None = Field(default=None)
     time: int | None | None = Field(default=None)
 
 class AccountUserChangeauditstamps(BaseModel):
     """Creation and last modification audit stamps"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created: AccountUserChangeauditstampsCreated | None | None = Field(default=None)
     last_modified: AccountUserChangeauditstampsLastmodified | None | None = Field(default=None, alias="lastModified")
 
 class AccountUser(BaseModel):
     """LinkedIn ad account user object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account: str | None = Field(default=None)
     user: str | None = Field(default=None)
@@ -128,82 +128,82 @@ class AccountUser(BaseModel):
 
 class AccountUsersListMetadata(BaseModel):
     """Nested schema for AccountUsersList.metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class AccountUsersList(BaseModel):
     """Paginated list of account users"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     elements: list[AccountUser] | None = Field(default=None)
     metadata: AccountUsersListMetadata | None = Field(default=None)
 
 class CampaignDailybudget(BaseModel):
     """Daily budget configuration"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: str | None | None = Field(default=None)
     currency_code: str | None | None = Field(default=None, alias="currencyCode")
 
 class CampaignLocale(BaseModel):
     """Campaign locale settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     country: str | None | None = Field(default=None)
     language: str | None | None = Field(default=None)
 
 class CampaignChangeauditstampsCreated(BaseModel):
     """Nested schema for CampaignChangeauditstamps.created"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     actor: str | None | None = Field(default=None)
     time: int | None | None = Field(default=None)
 
 class CampaignChangeauditstampsLastmodified(BaseModel):
     """Nested schema for CampaignChangeauditstamps.lastModified"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     actor: str | None | None = Field(default=None)
     time: int | None | None = Field(default=None)
 
 class CampaignChangeauditstamps(BaseModel):
     """Creation and last modification audit stamps"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created: CampaignChangeauditstampsCreated | None | None = Field(default=None)
     last_modified: CampaignChangeauditstampsLastmodified | None | None = Field(default=None, alias="lastModified")
 
 class CampaignTotalbudget(BaseModel):
     """Total budget configuration"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: str | None | None = Field(default=None)
     currency_code: str | None | None = Field(default=None, alias="currencyCode")
 
 class CampaignVersion(BaseModel):
     """Version information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     version_tag: str | None | None = Field(default=None, alias="versionTag")
 
 class CampaignUnitcost(BaseModel):
     """Cost per unit (bid amount)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: str | None | None = Field(default=None)
     currency_code: str | None | None = Field(default=None, alias="currencyCode")
 
 class CampaignRunschedule(BaseModel):
     """Campaign run schedule"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start: int | None | None = Field(default=None)
     end: int | None | None = Field(default=None)
 
 class Campaign(BaseModel):
     """LinkedIn ad campaign object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -237,55 +237,55 @@ class Campaign(BaseModel):
 
 class CampaignsListMetadata(BaseModel):
     """Nested schema for CampaignsList.metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class CampaignsList(BaseModel):
     """Paginated list of campaigns"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     elements: list[Campaign] | None = Field(default=None)
     metadata: CampaignsListMetadata | None = Field(default=None)
 
 class CampaignGroupTotalbudget(BaseModel):
     """Total budget for the campaign group"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: str | None | None = Field(default=None)
     currency_code: str | None | None = Field(default=None, alias="currencyCode")
 
 class CampaignGroupChangeauditstampsLastmodified(BaseModel):
     """Nested schema for CampaignGroupChangeauditstamps.lastModified"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     actor: str | None | None = Field(default=None)
     time: int | None | None = Field(default=None)
 
 class CampaignGroupChangeauditstampsCreated(BaseModel):
     """Nested schema for CampaignGroupChangeauditstamps.created"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     actor: str | None | None = Field(default=None)
     time: int | None | None = Field(default=None)
 
 class CampaignGroupChangeauditstamps(BaseModel):
     """Creation and last modification audit stamps"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created: CampaignGroupChangeauditstampsCreated | None | None = Field(default=None)
     last_modified: CampaignGroupChangeauditstampsLastmodified | None | None = Field(default=None, alias="lastModified")
 
 class CampaignGroupRunschedule(BaseModel):
     """Campaign group run schedule"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start: int | None | None = Field(default=None)
     end: int | None | None = Field(default=None)
 
 class CampaignGroup(BaseModel):
     """LinkedIn ad campaign group object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -301,34 +301,34 @@ class CampaignGroup(BaseModel):
 
 class CampaignGroupsListMetadata(BaseModel):
     """Nested schema for CampaignGroupsList.metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class CampaignGroupsList(BaseModel):
     """Paginated list of campaign groups"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     elements: list[CampaignGroup] | None = Field(default=None)
     metadata: CampaignGroupsListMetadata | None = Field(default=None)
 
 class CreativeLeadgencalltoaction(BaseModel):
     """Lead generation call to action"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     destination: str | None | None = Field(default=None)
     label: str | None | None = Field(default=None)
 
 class CreativeReview(BaseModel):
     """Review status and rejection reasons"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     status: str | None | None = Field(default=None)
     rejection_reasons: list[Any] | None | None = Field(default=None, alias="rejectionReasons")
 
 class Creative(BaseModel):
     """LinkedIn ad creative object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -348,27 +348,27 @@ class Creative(BaseModel):
 
 class CreativesListMetadata(BaseModel):
     """Nested schema for CreativesList.metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class CreativesList(BaseModel):
     """Paginated list of creatives"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     elements: list[Creative] | None = Field(default=None)
     metadata: CreativesListMetadata | None = Field(default=None)
 
 class ConversionValue(BaseModel):
     """Conversion value"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: str | None | None = Field(default=None)
     currency_code: str | None | None = Field(default=None, alias="currencyCode")
 
 class Conversion(BaseModel):
     """LinkedIn ad conversion tracking rule"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -393,7 +393,7 @@ class Conversion(BaseModel):
 
 class ConversionsListPaging(BaseModel):
     """Nested schema for ConversionsList.paging"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total: int | None = Field(default=None)
     count: int | None = Field(default=None)
@@ -401,14 +401,14 @@ class ConversionsListPaging(BaseModel):
 
 class ConversionsList(BaseModel):
     """Paginated list of conversions"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     elements: list[Conversion] | None = Field(default=None)
     paging: ConversionsListPaging | None = Field(default=None)
 
 class AdAnalyticsRecordDaterangeStart(BaseModel):
     """Nested schema for AdAnalyticsRecordDaterange.start"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     year: int | None = Field(default=None)
     month: int | None = Field(default=None)
@@ -416,7 +416,7 @@ class AdAnalyticsRecordDaterangeStart(BaseModel):
 
 class AdAnalyticsRecordDaterangeEnd(BaseModel):
     """Nested schema for AdAnalyticsRecordDaterange.end"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     year: int | None = Field(default=None)
     month: int | None = Field(default=None)
@@ -424,14 +424,14 @@ class AdAnalyticsRecordDaterangeEnd(BaseModel):
 
 class AdAnalyticsRecordDaterange(BaseModel):
     """Date range for this analytics record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start: AdAnalyticsRecordDaterangeStart | None = Field(default=None)
     end: AdAnalyticsRecordDaterangeEnd | None = Field(default=None)
 
 class AdAnalyticsRecord(BaseModel):
     """Ad analytics data record with performance metrics"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     date_range: AdAnalyticsRecordDaterange | None = Field(default=None, alias="dateRange")
     pivot_values: list[str] | None = Field(default=None, alias="pivotValues")
@@ -491,14 +491,14 @@ class AdAnalyticsRecord(BaseModel):
 
 class AdAnalyticsResponsePaging(BaseModel):
     """Nested schema for AdAnalyticsResponse.paging"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     count: int | None = Field(default=None)
     start: int | None = Field(default=None)
 
 class AdAnalyticsResponse(BaseModel):
     """Ad analytics API response"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     elements: list[AdAnalyticsRecord] | None = Field(default=None)
     paging: AdAnalyticsResponsePaging | None = Field(default=None)
@@ -508,37 +508,37 @@ class AdAnalyticsResponse(BaseModel):
 
 class AccountsListResultMeta(BaseModel):
     """Metadata for accounts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class AccountUsersListResultMeta(BaseModel):
     """Metadata for account_users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class CampaignGroupsListResultMeta(BaseModel):
     """Metadata for campaign_groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class CreativesListResultMeta(BaseModel):
     """Metadata for creatives.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_token: str | None = Field(default=None, alias="nextPageToken")
 
 class ConversionsListResultMeta(BaseModel):
     """Metadata for conversions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total: int | None = Field(default=None)
 
@@ -595,7 +595,7 @@ D = TypeVar('D')
 
 class AccountsSearchData(BaseModel):
     """Search result data for accounts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique account identifier"""
@@ -629,7 +629,7 @@ class AccountsSearchData(BaseModel):
 
 class AccountUsersSearchData(BaseModel):
     """Search result data for account_users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account: str | None = None
     """Associated account URN"""
@@ -641,7 +641,7 @@ class AccountUsersSearchData(BaseModel):
 
 class CampaignsSearchData(BaseModel):
     """Search result data for campaigns entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique campaign identifier"""
@@ -695,7 +695,7 @@ class CampaignsSearchData(BaseModel):
 
 class CampaignGroupsSearchData(BaseModel):
     """Search result data for campaign_groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique campaign group identifier"""
@@ -721,7 +721,7 @@ class CampaignGroupsSearchData(BaseModel):
 
 class CreativesSearchData(BaseModel):
     """Search result data for creatives entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique creative identifier"""
@@ -753,7 +753,7 @@ class CreativesSearchData(BaseModel):
 
 class ConversionsSearchData(BaseModel):
     """Search result data for conversions entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique conversion identifier"""
@@ -787,7 +787,7 @@ class ConversionsSearchData(BaseModel):
 
 class AdCampaignAnalyticsSearchData(BaseModel):
     """Search result data for ad_campaign_analytics entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     impressions: float | None = None
     """Number of times the ad was shown"""
@@ -871,7 +871,7 @@ class AdCampaignAnalyticsSearchData(BaseModel):
 
 class AdCreativeAnalyticsSearchData(BaseModel):
     """Search result data for ad_creative_analytics entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     impressions: float | None = None
     """Number of times the ad was shown"""
@@ -957,7 +957,7 @@ class AdCreativeAnalyticsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -969,7 +969,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -24,7 +24,7 @@ class MailchimpAuthConfig(BaseModel):
 
 class Link(BaseModel):
     """A HAL-style link relating the current resource to another."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rel: str | None = Field(default=None)
     href: str | None = Field(default=None)
@@ -34,7 +34,7 @@ class Link(BaseModel):
 
 class CampaignReportSummaryEcommerce(BaseModel):
     """E-Commerce stats for a campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_orders: int | None | None = Field(default=None, description="The total orders for a campaign")
     """The total orders for a campaign"""
@@ -45,7 +45,7 @@ class CampaignReportSummaryEcommerce(BaseModel):
 
 class CampaignReportSummary(BaseModel):
     """For sent campaigns, a summary of opens, clicks, and e-commerce data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     opens: int | None | None = Field(default=None, description="The total number of opens for a campaign")
     """The total number of opens for a campaign"""
@@ -64,7 +64,7 @@ class CampaignReportSummary(BaseModel):
 
 class CampaignRecipients(BaseModel):
     """List settings for the campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_id: str | None | None = Field(default=None, description="The unique list id")
     """The unique list id"""
@@ -79,7 +79,7 @@ class CampaignRecipients(BaseModel):
 
 class CampaignTracking(BaseModel):
     """The tracking options for a campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     opens: bool | None | None = Field(default=None, description="Whether to track opens")
     """Whether to track opens"""
@@ -98,7 +98,7 @@ class CampaignTracking(BaseModel):
 
 class CampaignSettings(BaseModel):
     """The settings for your campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     subject_line: str | None | None = Field(default=None, description="The subject line for the campaign")
     """The subject line for the campaign"""
@@ -135,7 +135,7 @@ class CampaignSettings(BaseModel):
 
 class CampaignDeliveryStatus(BaseModel):
     """Updates on campaigns in the process of sending"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None | None = Field(default=None, description="Whether Campaign Delivery Status is enabled for this account and target campaign")
     """Whether Campaign Delivery Status is enabled for this account and target campaign"""
@@ -150,7 +150,7 @@ class CampaignDeliveryStatus(BaseModel):
 
 class Campaign(BaseModel):
     """A summary of an individual campaign's settings and content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     web_id: int | None = Field(default=None)
@@ -173,7 +173,7 @@ class Campaign(BaseModel):
 
 class CampaignsList(BaseModel):
     """A collection of campaigns"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     campaigns: list[Campaign] | None = Field(default=None)
@@ -181,7 +181,7 @@ class CampaignsList(BaseModel):
 
 class ListCampaignDefaults(BaseModel):
     """Default values for campaigns created for this list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     from_name: str | None | None = Field(default=None, description="The default from name for campaigns sent to this list")
     """The default from name for campaigns sent to this list"""
@@ -194,7 +194,7 @@ class ListCampaignDefaults(BaseModel):
 
 class ListContact(BaseModel):
     """Contact information displayed in campaign footers to comply with international spam laws"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     company: str | None | None = Field(default=None, description="The company name for the list")
     """The company name for the list"""
@@ -215,7 +215,7 @@ class ListContact(BaseModel):
 
 class ListStats(BaseModel):
     """Stats for the list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     member_count: int | None | None = Field(default=None, description="The number of active members in the list")
     """The number of active members in the list"""
@@ -254,7 +254,7 @@ class ListStats(BaseModel):
 
 class List(BaseModel):
     """Information about a specific list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     web_id: int | None = Field(default=None)
@@ -279,7 +279,7 @@ class List(BaseModel):
 
 class ListsList(BaseModel):
     """A collection of subscriber lists for this account"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     lists: list[List] | None = Field(default=None)
@@ -287,7 +287,7 @@ class ListsList(BaseModel):
 
 class ListMemberStatsEcommerceData(BaseModel):
     """Ecommerce stats for the list member if the list is attached to a store"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_revenue: float | None | None = Field(default=None, description="The total revenue the list member has brought in")
     """The total revenue the list member has brought in"""
@@ -298,7 +298,7 @@ class ListMemberStatsEcommerceData(BaseModel):
 
 class ListMemberStats(BaseModel):
     """Open and click rates for this subscriber"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     avg_open_rate: float | None | None = Field(default=None, description="A subscriber's average open rate")
     """A subscriber's average open rate"""
@@ -309,7 +309,7 @@ class ListMemberStats(BaseModel):
 
 class ListMemberLocation(BaseModel):
     """Subscriber location information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     latitude: float | None | None = Field(default=None, description="The location latitude")
     """The location latitude"""
@@ -328,7 +328,7 @@ class ListMemberLocation(BaseModel):
 
 class ListMemberTagsItem(BaseModel):
     """Nested schema for ListMember.tags_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="The tag id")
     """The tag id"""
@@ -337,7 +337,7 @@ class ListMemberTagsItem(BaseModel):
 
 class ListMember(BaseModel):
     """Individuals who are currently or have been previously subscribed to this list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     email_address: str | None = Field(default=None)
@@ -369,7 +369,7 @@ class ListMember(BaseModel):
 
 class ListMembersList(BaseModel):
     """Manage members of a specific Mailchimp list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     members: list[ListMember] | None = Field(default=None)
@@ -378,7 +378,7 @@ class ListMembersList(BaseModel):
 
 class ReportClicks(BaseModel):
     """An object describing the click activity for the campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     clicks_total: int | None | None = Field(default=None, description="The total number of clicks for the campaign")
     """The total number of clicks for the campaign"""
@@ -393,7 +393,7 @@ class ReportClicks(BaseModel):
 
 class ReportBounces(BaseModel):
     """An object describing the bounce summary for the campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     hard_bounces: int | None | None = Field(default=None, description="The total number of hard bounced email addresses")
     """The total number of hard bounced email addresses"""
@@ -404,7 +404,7 @@ class ReportBounces(BaseModel):
 
 class ReportListStats(BaseModel):
     """The average campaign statistics for your list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     sub_rate: float | None | None = Field(default=None, description="The average number of subscriptions per month for the list")
     """The average number of subscriptions per month for the list"""
@@ -417,14 +417,14 @@ class ReportListStats(BaseModel):
 
 class ReportDeliveryStatus(BaseModel):
     """Updates on campaigns in the process of sending"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None | None = Field(default=None, description="Whether Campaign Delivery Status is enabled for this account and target campaign")
     """Whether Campaign Delivery Status is enabled for this account and target campaign"""
 
 class ReportFacebookLikes(BaseModel):
     """An object describing campaign engagement on Facebook"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     recipient_likes: int | None | None = Field(default=None, description="The number of recipients who liked the campaign on Facebook")
     """The number of recipients who liked the campaign on Facebook"""
@@ -435,7 +435,7 @@ class ReportFacebookLikes(BaseModel):
 
 class ReportIndustryStats(BaseModel):
     """The average campaign statistics for your industry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type", description="The type of business industry associated with your account")
     """The type of business industry associated with your account"""
@@ -454,7 +454,7 @@ class ReportIndustryStats(BaseModel):
 
 class ReportOpens(BaseModel):
     """An object describing the open activity for the campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     opens_total: int | None | None = Field(default=None, description="The total number of opens for a campaign")
     """The total number of opens for a campaign"""
@@ -467,7 +467,7 @@ class ReportOpens(BaseModel):
 
 class ReportEcommerce(BaseModel):
     """E-Commerce stats for a campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_orders: int | None | None = Field(default=None, description="The total orders for a campaign")
     """The total orders for a campaign"""
@@ -478,7 +478,7 @@ class ReportEcommerce(BaseModel):
 
 class ReportForwards(BaseModel):
     """An object describing the forwards and forward activity for the campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     forwards_count: int | None | None = Field(default=None, description="How many times the campaign has been forwarded")
     """How many times the campaign has been forwarded"""
@@ -487,7 +487,7 @@ class ReportForwards(BaseModel):
 
 class Report(BaseModel):
     """Report details about a sent campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     campaign_title: str | None = Field(default=None)
@@ -514,7 +514,7 @@ class Report(BaseModel):
 
 class ReportsList(BaseModel):
     """A list of reports containing campaigns marked as Sent"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     reports: list[Report] | None = Field(default=None)
@@ -522,7 +522,7 @@ class ReportsList(BaseModel):
 
 class EmailActivityActivityItem(BaseModel):
     """Nested schema for EmailActivity.activity_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     action: str | None | None = Field(default=None, description="One of the following actions open, click, or bounce")
     """One of the following actions open, click, or bounce"""
@@ -537,7 +537,7 @@ class EmailActivityActivityItem(BaseModel):
 
 class EmailActivity(BaseModel):
     """A summary of the email activity for a campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     campaign_id: str | None = Field(default=None)
     list_id: str | None = Field(default=None)
@@ -548,7 +548,7 @@ class EmailActivity(BaseModel):
 
 class EmailActivityList(BaseModel):
     """A list of member's subscriber activity in a specific campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     emails: list[EmailActivity] | None = Field(default=None)
@@ -557,7 +557,7 @@ class EmailActivityList(BaseModel):
 
 class AutomationReportSummary(BaseModel):
     """A summary of opens and clicks for sent campaigns"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     opens: int | None | None = Field(default=None, description="The total number of opens for a campaign")
     """The total number of opens for a campaign"""
@@ -574,7 +574,7 @@ class AutomationReportSummary(BaseModel):
 
 class AutomationSettings(BaseModel):
     """The settings for the Automation workflow"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str | None | None = Field(default=None, description="The title of the Automation")
     """The title of the Automation"""
@@ -595,7 +595,7 @@ class AutomationSettings(BaseModel):
 
 class AutomationTracking(BaseModel):
     """The tracking options for the Automation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     opens: bool | None | None = Field(default=None, description="Whether to track opens")
     """Whether to track opens"""
@@ -614,7 +614,7 @@ class AutomationTracking(BaseModel):
 
 class AutomationRecipientsSegmentOpts(BaseModel):
     """An object representing all segmentation options"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     saved_segment_id: int | None | None = Field(default=None, description="The id for an existing saved segment")
     """The id for an existing saved segment"""
@@ -625,7 +625,7 @@ class AutomationRecipientsSegmentOpts(BaseModel):
 
 class AutomationRecipients(BaseModel):
     """List settings for the Automation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_id: str | None | None = Field(default=None, description="The unique list id")
     """The unique list id"""
@@ -640,7 +640,7 @@ class AutomationRecipients(BaseModel):
 
 class Automation(BaseModel):
     """A summary of an individual Automation workflow's settings and content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     create_time: str | None = Field(default=None)
@@ -654,7 +654,7 @@ class Automation(BaseModel):
 
 class AutomationsList(BaseModel):
     """A summary of the Automations for an account"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     automations: list[Automation] | None = Field(default=None)
@@ -662,14 +662,14 @@ class AutomationsList(BaseModel):
 
 class Tag(BaseModel):
     """A tag that can be assigned to a list member"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
 
 class TagsList(BaseModel):
     """A list of tags assigned to a list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     tags: list[Tag] | None = Field(default=None)
@@ -677,7 +677,7 @@ class TagsList(BaseModel):
 
 class InterestCategory(BaseModel):
     """Interest categories organize interests, which are used to group subscribers based on their preferences"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_id: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -687,7 +687,7 @@ class InterestCategory(BaseModel):
 
 class InterestCategoriesList(BaseModel):
     """Information about this list's interest categories"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     list_id: str | None = Field(default=None)
@@ -696,7 +696,7 @@ class InterestCategoriesList(BaseModel):
 
 class Interest(BaseModel):
     """Assign subscribers to interests to group them together"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     category_id: str | None = Field(default=None)
     list_id: str | None = Field(default=None)
@@ -707,7 +707,7 @@ class Interest(BaseModel):
 
 class InterestsList(BaseModel):
     """A list of interests for a specific list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     interests: list[Interest] | None = Field(default=None)
@@ -717,7 +717,7 @@ class InterestsList(BaseModel):
 
 class SegmentOptions(BaseModel):
     """The conditions of the segment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     match: str | None | None = Field(default=None, description="Match type")
     """Match type"""
@@ -726,7 +726,7 @@ class SegmentOptions(BaseModel):
 
 class Segment(BaseModel):
     """Information about a specific segment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -739,7 +739,7 @@ class Segment(BaseModel):
 
 class SegmentsList(BaseModel):
     """A list of available segments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     segments: list[Segment] | None = Field(default=None)
@@ -748,7 +748,7 @@ class SegmentsList(BaseModel):
 
 class SegmentMemberStats(BaseModel):
     """Open and click rates for this subscriber"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     avg_open_rate: float | None | None = Field(default=None, description="A subscriber's average open rate")
     """A subscriber's average open rate"""
@@ -757,7 +757,7 @@ class SegmentMemberStats(BaseModel):
 
 class SegmentMemberLocation(BaseModel):
     """Subscriber location information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     latitude: float | None | None = Field(default=None, description="The location latitude")
     """The location latitude"""
@@ -776,7 +776,7 @@ class SegmentMemberLocation(BaseModel):
 
 class SegmentMember(BaseModel):
     """Individuals who are currently or have been previously subscribed to this list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     email_address: str | None = Field(default=None)
@@ -800,7 +800,7 @@ class SegmentMember(BaseModel):
 
 class SegmentMembersList(BaseModel):
     """View members in a specific list segment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     members: list[SegmentMember] | None = Field(default=None)
@@ -808,7 +808,7 @@ class SegmentMembersList(BaseModel):
 
 class Unsubscribe(BaseModel):
     """A member who unsubscribed from a specific campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email_id: str | None = Field(default=None)
     email_address: str | None = Field(default=None)
@@ -822,7 +822,7 @@ class Unsubscribe(BaseModel):
 
 class UnsubscribesList(BaseModel):
     """A list of members who have unsubscribed from a specific campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None, alias="_links")
     unsubscribes: list[Unsubscribe] | None = Field(default=None)
@@ -834,73 +834,73 @@ class UnsubscribesList(BaseModel):
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class ListsListResultMeta(BaseModel):
     """Metadata for lists.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class ListMembersListResultMeta(BaseModel):
     """Metadata for list_members.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class ReportsListResultMeta(BaseModel):
     """Metadata for reports.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class EmailActivityListResultMeta(BaseModel):
     """Metadata for email_activity.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class AutomationsListResultMeta(BaseModel):
     """Metadata for automations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class TagsListResultMeta(BaseModel):
     """Metadata for tags.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class InterestCategoriesListResultMeta(BaseModel):
     """Metadata for interest_categories.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class InterestsListResultMeta(BaseModel):
     """Metadata for interests.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class SegmentsListResultMeta(BaseModel):
     """Metadata for segments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class SegmentMembersListResultMeta(BaseModel):
     """Metadata for segment_members.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
 class UnsubscribesListResultMeta(BaseModel):
     """Metadata for unsubscribes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     links: list[Link] | None = Field(default=None)
 
@@ -957,7 +957,7 @@ D = TypeVar('D')
 
 class CampaignsSearchData(BaseModel):
     """Search result data for campaigns entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ab_split_opts: dict[str, Any] | None = None
     """[A/B Testing](https://mailchimp.com/help/about-ab-testing-campaigns/) options for a campaign."""
@@ -1007,7 +1007,7 @@ class CampaignsSearchData(BaseModel):
 
 class EmailActivitySearchData(BaseModel):
     """Search result data for email_activity entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     action: str | None = None
     """One of the following actions: 'open', 'click', or 'bounce'"""
@@ -1033,7 +1033,7 @@ class EmailActivitySearchData(BaseModel):
 
 class ListsSearchData(BaseModel):
     """Search result data for lists entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     beamer_address: str | None = None
     """The list's Email Beamer address."""
@@ -1081,7 +1081,7 @@ class ListsSearchData(BaseModel):
 
 class ReportsSearchData(BaseModel):
     """Search result data for reports entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ab_split: dict[str, Any] | None = None
     """General stats about different groups of an A/B Split campaign. Does not return information about ..."""
@@ -1141,7 +1141,7 @@ class ReportsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1153,7 +1153,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
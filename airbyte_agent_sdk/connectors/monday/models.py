@@ -38,7 +38,7 @@ MondayAuthConfig = MondayOauth20AuthenticationAuthConfig | MondayApiTokenAuthent
 
 class User(BaseModel):
     """Monday.com user object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -68,7 +68,7 @@ class User(BaseModel):
 
 class BoardViewsItem(BaseModel):
     """Nested schema for Board.views_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -78,25 +78,25 @@ class BoardViewsItem(BaseModel):
 
 class BoardOwnersItem(BaseModel):
     """Nested schema for Board.owners_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class BoardSubscribersItem(BaseModel):
     """Nested schema for Board.subscribers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class BoardTagsItem(BaseModel):
     """Nested schema for Board.tags_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class BoardGroupsItem(BaseModel):
     """Nested schema for Board.groups_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     archived: bool | None | None = Field(default=None)
     color: str | None | None = Field(default=None)
@@ -107,19 +107,19 @@ class BoardGroupsItem(BaseModel):
 
 class BoardTopGroup(BaseModel):
     """Top group on the board"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class BoardCreator(BaseModel):
     """Board creator"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class BoardColumnsItem(BaseModel):
     """Nested schema for Board.columns_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     archived: bool | None | None = Field(default=None)
     description: str | None | None = Field(default=None)
@@ -131,7 +131,7 @@ class BoardColumnsItem(BaseModel):
 
 class BoardWorkspace(BaseModel):
     """Workspace the board belongs to"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -140,7 +140,7 @@ class BoardWorkspace(BaseModel):
 
 class Board(BaseModel):
     """Monday.com board object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -162,26 +162,26 @@ class Board(BaseModel):
 
 class ItemGroup(BaseModel):
     """Group the item belongs to"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class ItemBoard(BaseModel):
     """Board the item belongs to"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
 
 class ItemSubscribersItem(BaseModel):
     """Nested schema for Item.subscribers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class ItemColumnValuesItem(BaseModel):
     """Nested schema for Item.column_values_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     text: str | None | None = Field(default=None)
@@ -190,13 +190,13 @@ class ItemColumnValuesItem(BaseModel):
 
 class ItemParentItem(BaseModel):
     """Parent item (for subitems)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class Item(BaseModel):
     """Monday.com item object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -212,13 +212,13 @@ class Item(BaseModel):
 
 class TeamUsersItem(BaseModel):
     """Nested schema for Team.users_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class Team(BaseModel):
     """Monday.com team object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -227,7 +227,7 @@ class Team(BaseModel):
 
 class Tag(BaseModel):
     """Monday.com tag object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -235,7 +235,7 @@ class Tag(BaseModel):
 
 class UpdateRepliesItem(BaseModel):
     """Nested schema for Update.replies_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     creator_id: str | None | None = Field(default=None)
@@ -246,13 +246,13 @@ class UpdateRepliesItem(BaseModel):
 
 class UpdateAssetsItemUploadedBy(BaseModel):
     """Nested schema for UpdateAssetsItem.uploaded_by"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class UpdateAssetsItem(BaseModel):
     """Nested schema for Update.assets_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -267,7 +267,7 @@ class UpdateAssetsItem(BaseModel):
 
 class Update(BaseModel):
     """Monday.com update (comment/post) object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     body: str | None = Field(default=None)
@@ -281,53 +281,53 @@ class Update(BaseModel):
 
 class WorkspaceSettingsIcon(BaseModel):
     """Nested schema for WorkspaceSettings.icon"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     color: str | None | None = Field(default=None)
     image: str | None | None = Field(default=None)
 
 class WorkspaceSettings(BaseModel):
     """Workspace settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     icon: WorkspaceSettingsIcon | None | None = Field(default=None)
 
 class WorkspaceUsersSubscribersItem(BaseModel):
     """Nested schema for Workspace.users_subscribers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class WorkspaceOwnersSubscribersItem(BaseModel):
     """Nested schema for Workspace.owners_subscribers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
 
 class WorkspaceAccountProduct(BaseModel):
     """Account product info"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     kind: str | None | None = Field(default=None)
 
 class WorkspaceTeamsSubscribersItem(BaseModel):
     """Nested schema for Workspace.teams_subscribers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
 
 class WorkspaceTeamOwnersSubscribersItem(BaseModel):
     """Nested schema for Workspace.team_owners_subscribers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
 
 class Workspace(BaseModel):
     """Monday.com workspace object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -344,7 +344,7 @@ class Workspace(BaseModel):
 
 class ActivityLog(BaseModel):
     """Monday.com activity log entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     event: str | None = Field(default=None)
@@ -409,7 +409,7 @@ D = TypeVar('D')
 
 class ActivityLogsSearchData(BaseModel):
     """Search result data for activity_logs entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     board_id: int | None = None
     """Board ID the activity belongs to"""
@@ -433,7 +433,7 @@ class ActivityLogsSearchData(BaseModel):
 
 class BoardsSearchData(BaseModel):
     """Search result data for boards entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     board_kind: str | None = None
     """Board kind (public, private, share)"""
@@ -479,7 +479,7 @@ class BoardsSearchData(BaseModel):
 
 class ItemsSearchData(BaseModel):
     """Search result data for items entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     assets: list[Any] | None = None
     """Files attached to the item"""
@@ -513,7 +513,7 @@ class ItemsSearchData(BaseModel):
 
 class TagsSearchData(BaseModel):
     """Search result data for tags entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     color: str | None = None
     """Tag color"""
@@ -525,7 +525,7 @@ class TagsSearchData(BaseModel):
 
 class TeamsSearchData(BaseModel):
     """Search result data for teams entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique team identifier"""
@@ -539,7 +539,7 @@ class TeamsSearchData(BaseModel):
 
 class UpdatesSearchData(BaseModel):
     """Search result data for updates entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     assets: list[Any] | None = None
     """Files attached to this update"""
@@ -563,7 +563,7 @@ class UpdatesSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     birthday: str | None = None
     """User's birthday"""
@@ -619,7 +619,7 @@ class UsersSearchData(BaseModel):
 
 class WorkspacesSearchData(BaseModel):
     """Search result data for workspaces entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account_product: dict[str, Any] | None = None
     """Account product info"""
@@ -651,7 +651,7 @@ class WorkspacesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -663,7 +663,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -50,14 +50,14 @@ class NotionOAuthCredentials(BaseModel):
 
 class UserPerson(BaseModel):
     """Person-specific data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email: str | None | None = Field(default=None, description="Person's email address")
     """Person's email address"""
 
 class UserBot(BaseModel):
     """Bot-specific data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     owner: dict[str, Any] | None | None = Field(default=None, description="Bot owner information")
     """Bot owner information"""
@@ -66,7 +66,7 @@ class UserBot(BaseModel):
 
 class User(BaseModel):
     """A Notion user object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     object_: str | None = Field(default=None, alias="object")
@@ -79,7 +79,7 @@ class User(BaseModel):
 
 class UsersListResponse(BaseModel):
     """Paginated list of users"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     results: list[User] | None = Field(default=None)
@@ -91,7 +91,7 @@ class UsersListResponse(BaseModel):
 
 class RichTextAnnotations(BaseModel):
     """Text annotations (bold, italic, etc.)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bold: bool | None | None = Field(default=None)
     italic: bool | None | None = Field(default=None)
@@ -102,7 +102,7 @@ class RichTextAnnotations(BaseModel):
 
 class RichTextText(BaseModel):
     """Text content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     content: str | None | None = Field(default=None, description="Plain text content")
     """Plain text content"""
@@ -111,7 +111,7 @@ class RichTextText(BaseModel):
 
 class RichText(BaseModel):
     """A rich text object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     text: RichTextText | None = Field(default=None)
@@ -121,7 +121,7 @@ class RichText(BaseModel):
 
 class Parent(BaseModel):
     """Parent object reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     database_id: str | None = Field(default=None)
@@ -132,21 +132,21 @@ class Parent(BaseModel):
 
 class PageLastEditedBy(BaseModel):
     """User who last edited the page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None | None = Field(default=None, alias="object")
     id: str | None | None = Field(default=None)
 
 class PageCreatedBy(BaseModel):
     """User who created the page"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None | None = Field(default=None, alias="object")
     id: str | None | None = Field(default=None)
 
 class Page(BaseModel):
     """A Notion page object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     object_: str | None = Field(default=None, alias="object")
@@ -168,7 +168,7 @@ class Page(BaseModel):
 
 class PagesListResponse(BaseModel):
     """Paginated list of pages"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     results: list[Page] | None = Field(default=None)
@@ -180,21 +180,21 @@ class PagesListResponse(BaseModel):
 
 class DataSourceCreatedBy(BaseModel):
     """User who created the data source"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None | None = Field(default=None, alias="object")
     id: str | None | None = Field(default=None)
 
 class DataSourceLastEditedBy(BaseModel):
     """User who last edited the data source"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None | None = Field(default=None, alias="object")
     id: str | None | None = Field(default=None)
 
 class DataSource(BaseModel):
     """A Notion data source object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     object_: str | None = Field(default=None, alias="object")
@@ -220,7 +220,7 @@ class DataSource(BaseModel):
 
 class DataSourcesListResponse(BaseModel):
     """Paginated list of data sources"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     results: list[DataSource] | None = Field(default=None)
@@ -232,13 +232,13 @@ class DataSourcesListResponse(BaseModel):
 
 class BlockTableRow(BaseModel):
     """Table row block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cells: list[Any] | None | None = Field(default=None)
 
 class BlockToDo(BaseModel):
     """To-do block content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     checked: bool | None | None = Field(default=None)
@@ -246,19 +246,19 @@ class BlockToDo(BaseModel):
 
 class BlockChildPage(BaseModel):
     """Child page block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str | None | None = Field(default=None)
 
 class BlockTableOfContents(BaseModel):
     """Table of contents block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     color: str | None | None = Field(default=None)
 
 class BlockHeading3(BaseModel):
     """Heading 3 block content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     color: str | None | None = Field(default=None)
@@ -266,7 +266,7 @@ class BlockHeading3(BaseModel):
 
 class BlockCode(BaseModel):
     """Code block content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     caption: list[RichText] | None | None = Field(default=None)
@@ -274,41 +274,41 @@ class BlockCode(BaseModel):
 
 class BlockChildDatabase(BaseModel):
     """Child database block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str | None | None = Field(default=None)
 
 class BlockLastEditedBy(BaseModel):
     """User who last edited the block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None | None = Field(default=None, alias="object")
     id: str | None | None = Field(default=None)
 
 class BlockQuote(BaseModel):
     """Quote block content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     color: str | None | None = Field(default=None)
 
 class BlockToggle(BaseModel):
     """Toggle block content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     color: str | None | None = Field(default=None)
 
 class BlockBookmark(BaseModel):
     """Bookmark block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     caption: list[RichText] | None | None = Field(default=None)
     url: str | None | None = Field(default=None)
 
 class BlockHeading2(BaseModel):
     """Heading 2 block content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     color: str | None | None = Field(default=None)
@@ -316,21 +316,21 @@ class BlockHeading2(BaseModel):
 
 class BlockNumberedListItem(BaseModel):
     """Numbered list item content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     color: str | None | None = Field(default=None)
 
 class BlockCreatedBy(BaseModel):
     """User who created the block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None | None = Field(default=None, alias="object")
     id: str | None | None = Field(default=None)
 
 class BlockTable(BaseModel):
     """Table block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     table_width: int | None | None = Field(default=None)
     has_column_header: bool | None | None = Field(default=None)
@@ -338,20 +338,20 @@ class BlockTable(BaseModel):
 
 class BlockEquation(BaseModel):
     """Equation block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     expression: str | None | None = Field(default=None)
 
 class BlockBulletedListItem(BaseModel):
     """Bulleted list item content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     color: str | None | None = Field(default=None)
 
 class BlockHeading1(BaseModel):
     """Heading 1 block content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     color: str | None | None = Field(default=None)
@@ -359,7 +359,7 @@ class BlockHeading1(BaseModel):
 
 class BlockCallout(BaseModel):
     """Callout block content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     icon: dict[str, Any] | None | None = Field(default=None)
@@ -367,32 +367,32 @@ class BlockCallout(BaseModel):
 
 class BlockParagraph(BaseModel):
     """Paragraph block content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     rich_text: list[RichText] | None | None = Field(default=None)
     color: str | None | None = Field(default=None)
 
 class BlockLinkPreview(BaseModel):
     """Link preview block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     url: str | None | None = Field(default=None)
 
 class BlockEmbed(BaseModel):
     """Embed block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     url: str | None | None = Field(default=None)
 
 class BlockColumn(BaseModel):
     """Column block"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     width_ratio: float | None | None = Field(default=None)
 
 class Block(BaseModel):
     """A Notion block object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     object_: str | None = Field(default=None, alias="object")
@@ -441,7 +441,7 @@ class Block(BaseModel):
 
 class BlocksListResponse(BaseModel):
     """Paginated list of blocks"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     results: list[Block] | None = Field(default=None)
@@ -453,14 +453,14 @@ class BlocksListResponse(BaseModel):
 
 class CommentCreatedBy(BaseModel):
     """User who created the comment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None | None = Field(default=None, alias="object")
     id: str | None | None = Field(default=None)
 
 class Comment(BaseModel):
     """A Notion comment object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     object_: str | None = Field(default=None, alias="object")
@@ -473,7 +473,7 @@ class Comment(BaseModel):
 
 class CommentsListResponse(BaseModel):
     """Paginated list of comments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     results: list[Comment] | None = Field(default=None)
@@ -488,35 +488,35 @@ class CommentsListResponse(BaseModel):
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class PagesListResultMeta(BaseModel):
     """Metadata for pages.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class DataSourcesListResultMeta(BaseModel):
     """Metadata for data_sources.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class BlocksListResultMeta(BaseModel):
     """Metadata for blocks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class CommentsListResultMeta(BaseModel):
     """Metadata for comments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
@@ -574,7 +574,7 @@ D = TypeVar('D')
 
 class PagesSearchData(BaseModel):
     """Search result data for pages entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     archived: bool | None = None
     """Indicates whether the page is archived or not."""
@@ -608,7 +608,7 @@ class PagesSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     avatar_url: str | None = None
     """URL of the user's avatar"""
@@ -628,7 +628,7 @@ class UsersSearchData(BaseModel):
 
 class DataSourcesSearchData(BaseModel):
     """Search result data for data_sources entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     archived: bool | None = None
     """Indicates if the data source is archived or not."""
@@ -668,7 +668,7 @@ class DataSourcesSearchData(BaseModel):
 
 class BlocksSearchData(BaseModel):
     """Search result data for blocks entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     archived: bool | None = None
     """Indicates if the block is archived or not."""
@@ -760,7 +760,7 @@ class BlocksSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -772,7 +772,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
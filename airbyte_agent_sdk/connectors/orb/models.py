@@ -34,7 +34,7 @@ class OrbReplicationConfig(BaseModel):
 
 class Address(BaseModel):
     """Address object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     city: str | None = Field(default=None)
     country: str | None = Field(default=None)
@@ -45,7 +45,7 @@ class Address(BaseModel):
 
 class CustomerTaxId(BaseModel):
     """Tax identification information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type", description="The type of tax ID")
     """The type of tax ID"""
@@ -56,7 +56,7 @@ class CustomerTaxId(BaseModel):
 
 class Customer(BaseModel):
     """Customer object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     external_customer_id: str | None = Field(default=None)
@@ -76,21 +76,21 @@ class Customer(BaseModel):
 
 class PaginationMetadata(BaseModel):
     """Pagination metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
     next_cursor: str | None = Field(default=None)
 
 class CustomersList(BaseModel):
     """Paginated list of customers"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Customer] | None = Field(default=None)
     pagination_metadata: PaginationMetadata | None = Field(default=None)
 
 class SubscriptionCustomer(BaseModel):
     """The customer associated with the subscription"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="The customer ID")
     """The customer ID"""
@@ -99,7 +99,7 @@ class SubscriptionCustomer(BaseModel):
 
 class SubscriptionPlan(BaseModel):
     """The plan associated with the subscription"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="The plan ID")
     """The plan ID"""
@@ -108,7 +108,7 @@ class SubscriptionPlan(BaseModel):
 
 class Subscription(BaseModel):
     """Subscription object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     created_at: str | None = Field(default=None)
@@ -131,14 +131,14 @@ class Subscription(BaseModel):
 
 class SubscriptionsList(BaseModel):
     """Paginated list of subscriptions"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Subscription] | None = Field(default=None)
     pagination_metadata: PaginationMetadata | None = Field(default=None)
 
 class PlanProduct(BaseModel):
     """The product associated with the plan"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="The product ID")
     """The product ID"""
@@ -147,7 +147,7 @@ class PlanProduct(BaseModel):
 
 class PlanPricesItem(BaseModel):
     """Nested schema for Plan.prices_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="The unique identifier of the price")
     """The unique identifier of the price"""
@@ -162,7 +162,7 @@ class PlanPricesItem(BaseModel):
 
 class Plan(BaseModel):
     """Plan object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     created_at: str | None = Field(default=None)
@@ -185,14 +185,14 @@ class Plan(BaseModel):
 
 class PlansList(BaseModel):
     """Paginated list of plans"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Plan] | None = Field(default=None)
     pagination_metadata: PaginationMetadata | None = Field(default=None)
 
 class InvoiceCustomer(BaseModel):
     """The customer associated with the invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="The customer ID")
     """The customer ID"""
@@ -201,7 +201,7 @@ class InvoiceCustomer(BaseModel):
 
 class InvoiceLineItemsItem(BaseModel):
     """Nested schema for Invoice.line_items_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="The unique identifier of the line item")
     """The unique identifier of the line item"""
@@ -218,14 +218,14 @@ class InvoiceLineItemsItem(BaseModel):
 
 class InvoiceSubscription(BaseModel):
     """The subscription associated with the invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="The subscription ID")
     """The subscription ID"""
 
 class Invoice(BaseModel):
     """Invoice object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     created_at: str | None = Field(default=None)
@@ -264,7 +264,7 @@ class Invoice(BaseModel):
 
 class InvoicesList(BaseModel):
     """Paginated list of invoices"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Invoice] | None = Field(default=None)
     pagination_metadata: PaginationMetadata | None = Field(default=None)
@@ -274,25 +274,25 @@ class InvoicesList(BaseModel):
 
 class CustomersListResultMeta(BaseModel):
     """Metadata for customers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class SubscriptionsListResultMeta(BaseModel):
     """Metadata for subscriptions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class PlansListResultMeta(BaseModel):
     """Metadata for plans.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class InvoicesListResultMeta(BaseModel):
     """Metadata for invoices.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
@@ -349,7 +349,7 @@ D = TypeVar('D')
 
 class CustomersSearchData(BaseModel):
     """Search result data for customers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """The unique identifier of the customer"""
@@ -375,7 +375,7 @@ class CustomersSearchData(BaseModel):
 
 class SubscriptionsSearchData(BaseModel):
     """Search result data for subscriptions entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """The unique identifier of the subscription"""
@@ -391,7 +391,7 @@ class SubscriptionsSearchData(BaseModel):
 
 class PlansSearchData(BaseModel):
     """Search result data for plans entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """The unique identifier of the plan"""
@@ -409,7 +409,7 @@ class PlansSearchData(BaseModel):
 
 class InvoicesSearchData(BaseModel):
     """Search result data for invoices entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """The unique identifier of the invoice"""
@@ -447,7 +447,7 @@ class InvoicesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -459,7 +459,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
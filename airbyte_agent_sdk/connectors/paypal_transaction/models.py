@@ -41,14 +41,14 @@ class PaypalTransactionReplicationConfig(BaseModel):
 
 class Money(BaseModel):
     """Currency amount with code and value."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None)
     value: str | None = Field(default=None)
 
 class BalanceDetail(BaseModel):
     """Balance information for a single currency."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     primary: bool | None = Field(default=None)
     currency: str | None = Field(default=None)
@@ -58,7 +58,7 @@ class BalanceDetail(BaseModel):
 
 class BalancesResponse(BaseModel):
     """Balances response with account balance details."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     balances: list[BalanceDetail] | None = Field(default=None)
     account_id: str | None = Field(default=None)
@@ -67,7 +67,7 @@ class BalancesResponse(BaseModel):
 
 class PayerName(BaseModel):
     """Payer name details."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     given_name: str | None = Field(default=None)
     surname: str | None = Field(default=None)
@@ -75,7 +75,7 @@ class PayerName(BaseModel):
 
 class PayerInfo(BaseModel):
     """Information about the payer."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_id: str | None = Field(default=None)
     email_address: str | None = Field(default=None)
@@ -86,7 +86,7 @@ class PayerInfo(BaseModel):
 
 class TransactionInfo(BaseModel):
     """Detailed transaction information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     paypal_account_id: str | None = Field(default=None)
     transaction_id: str | None = Field(default=None)
@@ -109,7 +109,7 @@ class TransactionInfo(BaseModel):
 
 class ShippingAddress(BaseModel):
     """Shipping address details."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     line1: str | None = Field(default=None)
     line2: str | None = Field(default=None)
@@ -119,20 +119,20 @@ class ShippingAddress(BaseModel):
 
 class ShippingInfo(BaseModel):
     """Shipping information for the transaction."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     address: ShippingAddress | None = Field(default=None)
 
 class ItemDetailTaxAmountsItem(BaseModel):
     """Nested schema for ItemDetail.tax_amounts_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     tax_amount: Money | None = Field(default=None)
 
 class ItemDetail(BaseModel):
     """Details for a single cart item."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     item_code: str | None = Field(default=None)
     item_name: str | None = Field(default=None)
@@ -146,7 +146,7 @@ class ItemDetail(BaseModel):
 
 class CartInfo(BaseModel):
     """Cart information for the transaction."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     item_details: list[ItemDetail] | None = Field(default=None)
     tax_inclusive: bool | None = Field(default=None)
@@ -154,7 +154,7 @@ class CartInfo(BaseModel):
 
 class AuctionInfo(BaseModel):
     """Auction information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     auction_site: str | None = Field(default=None)
     auction_item_site: str | None = Field(default=None)
@@ -163,7 +163,7 @@ class AuctionInfo(BaseModel):
 
 class IncentiveDetail(BaseModel):
     """Incentive detail."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     incentive_type: str | None = Field(default=None)
     incentive_code: str | None = Field(default=None)
@@ -172,20 +172,20 @@ class IncentiveDetail(BaseModel):
 
 class IncentiveInfo(BaseModel):
     """Incentive information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     incentive_details: list[IncentiveDetail] | None = Field(default=None)
 
 class StoreInfo(BaseModel):
     """Store information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     store_id: str | None = Field(default=None)
     terminal_id: str | None = Field(default=None)
 
 class Transaction(BaseModel):
     """A single PayPal transaction with full details."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     transaction_info: TransactionInfo | None = Field(default=None)
     payer_info: PayerInfo | None = Field(default=None)
@@ -199,7 +199,7 @@ class Transaction(BaseModel):
 
 class TransactionsListLinksItem(BaseModel):
     """Nested schema for TransactionsList.links_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None = Field(default=None)
     rel: str | None = Field(default=None)
@@ -207,7 +207,7 @@ class TransactionsListLinksItem(BaseModel):
 
 class TransactionsList(BaseModel):
     """Paginated list of transactions."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     transaction_details: list[Transaction] | None = Field(default=None)
     account_number: str | None = Field(default=None)
@@ -221,7 +221,7 @@ class TransactionsList(BaseModel):
 
 class PaymentLinksItem(BaseModel):
     """Nested schema for Payment.links_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None = Field(default=None)
     rel: str | None = Field(default=None)
@@ -229,7 +229,7 @@ class PaymentLinksItem(BaseModel):
 
 class PaymentTransactionsItemAmountDetails(BaseModel):
     """Nested schema for PaymentTransactionsItemAmount.details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     subtotal: str | None = Field(default=None)
     shipping: str | None = Field(default=None)
@@ -239,7 +239,7 @@ class PaymentTransactionsItemAmountDetails(BaseModel):
 
 class PaymentTransactionsItemAmount(BaseModel):
     """Nested schema for PaymentTransactionsItem.amount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total: str | None = Field(default=None, description="Total amount.")
     """Total amount."""
@@ -249,7 +249,7 @@ class PaymentTransactionsItemAmount(BaseModel):
 
 class PaymentTransactionsItem(BaseModel):
     """Nested schema for Payment.transactions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: PaymentTransactionsItemAmount | None = Field(default=None)
     description: str | None = Field(default=None, description="Transaction description.")
@@ -258,7 +258,7 @@ class PaymentTransactionsItem(BaseModel):
 
 class PaymentPayerPayerInfo(BaseModel):
     """Nested schema for PaymentPayer.payer_info"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email: str | None = Field(default=None, description="Payer email.")
     """Payer email."""
@@ -273,7 +273,7 @@ class PaymentPayerPayerInfo(BaseModel):
 
 class PaymentPayer(BaseModel):
     """Payer information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     payment_method: str | None = Field(default=None, description="Payment method.")
     """Payment method."""
@@ -283,7 +283,7 @@ class PaymentPayer(BaseModel):
 
 class Payment(BaseModel):
     """A PayPal payment object."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     intent: str | None = Field(default=None)
@@ -297,7 +297,7 @@ class Payment(BaseModel):
 
 class PaymentsList(BaseModel):
     """List of payments."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     payments: list[Payment] | None = Field(default=None)
     count: int | None = Field(default=None)
@@ -305,14 +305,14 @@ class PaymentsList(BaseModel):
 
 class DisputeDisputedTransactionsItemSeller(BaseModel):
     """Nested schema for DisputeDisputedTransactionsItem.seller"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     merchant_id: str | None = Field(default=None, description="Seller's merchant ID.")
     """Seller's merchant ID."""
 
 class DisputeDisputedTransactionsItem(BaseModel):
     """Nested schema for Dispute.disputed_transactions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     buyer_transaction_id: str | None = Field(default=None, description="Buyer's transaction ID.")
     """Buyer's transaction ID."""
@@ -320,7 +320,7 @@ class DisputeDisputedTransactionsItem(BaseModel):
 
 class DisputeLinksItem(BaseModel):
     """Nested schema for Dispute.links_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None = Field(default=None)
     rel: str | None = Field(default=None)
@@ -328,7 +328,7 @@ class DisputeLinksItem(BaseModel):
 
 class Dispute(BaseModel):
     """A PayPal dispute object."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     dispute_id: str | None = Field(default=None)
     create_time: str | None = Field(default=None)
@@ -345,7 +345,7 @@ class Dispute(BaseModel):
 
 class DisputesListLinksItem(BaseModel):
     """Nested schema for DisputesList.links_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None = Field(default=None)
     rel: str | None = Field(default=None)
@@ -353,14 +353,14 @@ class DisputesListLinksItem(BaseModel):
 
 class DisputesList(BaseModel):
     """List of disputes."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[Dispute] | None = Field(default=None)
     links: list[DisputesListLinksItem] | None = Field(default=None)
 
 class ProductLinksItem(BaseModel):
     """Nested schema for Product.links_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None = Field(default=None)
     rel: str | None = Field(default=None)
@@ -368,7 +368,7 @@ class ProductLinksItem(BaseModel):
 
 class Product(BaseModel):
     """A PayPal catalog product (summary)."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -378,7 +378,7 @@ class Product(BaseModel):
 
 class ProductsListLinksItem(BaseModel):
     """Nested schema for ProductsList.links_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None = Field(default=None)
     rel: str | None = Field(default=None)
@@ -386,14 +386,14 @@ class ProductsListLinksItem(BaseModel):
 
 class ProductsList(BaseModel):
     """List of catalog products."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     products: list[Product] | None = Field(default=None)
     links: list[ProductsListLinksItem] | None = Field(default=None)
 
 class ProductDetailsLinksItem(BaseModel):
     """Nested schema for ProductDetails.links_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None = Field(default=None)
     rel: str | None = Field(default=None)
@@ -401,7 +401,7 @@ class ProductDetailsLinksItem(BaseModel):
 
 class ProductDetails(BaseModel):
     """Detailed catalog product information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -416,7 +416,7 @@ class ProductDetails(BaseModel):
 
 class InvoiceSearchParamsCreationDateRange(BaseModel):
     """Filter by invoice creation date range."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     start: str | None = Field(default=None, description="Start date in ISO 8601 format.")
     """Start date in ISO 8601 format."""
@@ -425,20 +425,20 @@ class InvoiceSearchParamsCreationDateRange(BaseModel):
 
 class InvoiceSearchParams(BaseModel):
     """Parameters for searching invoices."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     creation_date_range: InvoiceSearchParamsCreationDateRange | None = Field(default=None)
 
 class InvoiceConfigurationPartialPayment(BaseModel):
     """Nested schema for InvoiceConfiguration.partial_payment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     allow_partial_payment: str | None = Field(default=None)
     minimum_amount_due: Money | None = Field(default=None)
 
 class InvoiceConfiguration(BaseModel):
     """Invoice configuration."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     tax_calculated_after_discount: str | None = Field(default=None)
     tax_inclusive: str | None = Field(default=None)
@@ -448,7 +448,7 @@ class InvoiceConfiguration(BaseModel):
 
 class InvoiceLinksItem(BaseModel):
     """Nested schema for Invoice.links_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None = Field(default=None)
     rel: str | None = Field(default=None)
@@ -456,7 +456,7 @@ class InvoiceLinksItem(BaseModel):
 
 class InvoiceAmountBreakdown(BaseModel):
     """Nested schema for InvoiceAmount.breakdown"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     item_total: Money | None = Field(default=None)
     discount: dict[str, Any] | None = Field(default=None)
@@ -466,7 +466,7 @@ class InvoiceAmountBreakdown(BaseModel):
 
 class InvoiceAmount(BaseModel):
     """Total invoice amount."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency_code: str | None = Field(default=None)
     value: str | None = Field(default=None)
@@ -474,21 +474,21 @@ class InvoiceAmount(BaseModel):
 
 class InvoiceRefunds(BaseModel):
     """Refund records for this invoice."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     refund_amount: Money | None = Field(default=None)
     transactions: list[dict[str, Any]] | None = Field(default=None)
 
 class InvoicePayments(BaseModel):
     """Payment records for this invoice."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     paid_amount: Money | None = Field(default=None)
     transactions: list[dict[str, Any]] | None = Field(default=None)
 
 class InvoiceItemsItemTax(BaseModel):
     """Nested schema for InvoiceItemsItem.tax"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     percent: str | None = Field(default=None)
@@ -496,7 +496,7 @@ class InvoiceItemsItemTax(BaseModel):
 
 class InvoiceItemsItem(BaseModel):
     """Nested schema for Invoice.items_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     description: str | None = Field(default=None)
@@ -507,7 +507,7 @@ class InvoiceItemsItem(BaseModel):
 
 class InvoiceInvoicerName(BaseModel):
     """Nested schema for InvoiceInvoicer.name"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     given_name: str | None = Field(default=None)
     surname: str | None = Field(default=None)
@@ -515,7 +515,7 @@ class InvoiceInvoicerName(BaseModel):
 
 class InvoiceInvoicer(BaseModel):
     """Invoicer details."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: InvoiceInvoicerName | None = Field(default=None)
     address: dict[str, Any] | None = Field(default=None)
@@ -524,7 +524,7 @@ class InvoiceInvoicer(BaseModel):
 
 class InvoicePrimaryRecipientsItemBillingInfoName(BaseModel):
     """Nested schema for InvoicePrimaryRecipientsItemBillingInfo.name"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     given_name: str | None = Field(default=None)
     surname: str | None = Field(default=None)
@@ -532,7 +532,7 @@ class InvoicePrimaryRecipientsItemBillingInfoName(BaseModel):
 
 class InvoicePrimaryRecipientsItemBillingInfo(BaseModel):
     """Nested schema for InvoicePrimaryRecipientsItem.billing_info"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: InvoicePrimaryRecipientsItemBillingInfoName | None = Field(default=None)
     email_address: str | None = Field(default=None)
@@ -540,13 +540,13 @@ class InvoicePrimaryRecipientsItemBillingInfo(BaseModel):
 
 class InvoicePrimaryRecipientsItem(BaseModel):
     """Nested schema for Invoice.primary_recipients_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     billing_info: InvoicePrimaryRecipientsItemBillingInfo | None = Field(default=None)
 
 class InvoiceDetailMetadata(BaseModel):
     """Nested schema for InvoiceDetail.metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     create_time: str | None = Field(default=None, description="Invoice creation time.")
     """Invoice creation time."""
@@ -573,7 +573,7 @@ class InvoiceDetailMetadata(BaseModel):
 
 class InvoiceDetailPaymentTerm(BaseModel):
     """Nested schema for InvoiceDetail.payment_term"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     term_type: str | None = Field(default=None, description="Payment term type.")
     """Payment term type."""
@@ -582,7 +582,7 @@ class InvoiceDetailPaymentTerm(BaseModel):
 
 class InvoiceDetail(BaseModel):
     """Invoice detail information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None = Field(default=None, description="Reference for the invoice.")
     """Reference for the invoice."""
@@ -603,7 +603,7 @@ class InvoiceDetail(BaseModel):
 
 class Invoice(BaseModel):
     """A PayPal invoice object."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     status: str | None = Field(default=None)
@@ -621,7 +621,7 @@ class Invoice(BaseModel):
 
 class InvoicesListLinksItem(BaseModel):
     """Nested schema for InvoicesList.links_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None = Field(default=None)
     rel: str | None = Field(default=None)
@@ -629,7 +629,7 @@ class InvoicesListLinksItem(BaseModel):
 
 class InvoicesList(BaseModel):
     """Paginated list of invoices from search."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[Invoice] | None = Field(default=None)
     total_items: int | None = Field(default=None)
@@ -641,7 +641,7 @@ class InvoicesList(BaseModel):
 
 class TransactionsListResultMeta(BaseModel):
     """Metadata for transactions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_items: int | None = Field(default=None)
     total_pages: int | None = Field(default=None)
@@ -649,25 +649,25 @@ class TransactionsListResultMeta(BaseModel):
 
 class ListPaymentsListResultMeta(BaseModel):
     """Metadata for list_payments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_id: str | None = Field(default=None)
 
 class ListDisputesListResultMeta(BaseModel):
     """Metadata for list_disputes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: list[dict[str, Any]] | None = Field(default=None)
 
 class ListProductsListResultMeta(BaseModel):
     """Metadata for list_products.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: list[dict[str, Any]] | None = Field(default=None)
 
 class SearchInvoicesListResultMeta(BaseModel):
     """Metadata for search_invoices.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: list[dict[str, Any]] | None = Field(default=None)
 
@@ -724,7 +724,7 @@ D = TypeVar('D')
 
 class TransactionsSearchData(BaseModel):
     """Search result data for transactions entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     auction_info: dict[str, Any] | None = None
     """Information related to an auction"""
@@ -750,7 +750,7 @@ class TransactionsSearchData(BaseModel):
 
 class BalancesSearchData(BaseModel):
     """Search result data for balances entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account_id: str | None = None
     """The unique identifier of the account."""
@@ -764,7 +764,7 @@ class BalancesSearchData(BaseModel):
 
 class ListProductsSearchData(BaseModel):
     """Search result data for list_products entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     create_time: str | None = None
     """The time when the product was created"""
@@ -780,7 +780,7 @@ class ListProductsSearchData(BaseModel):
 
 class ShowProductDetailsSearchData(BaseModel):
     """Search result data for show_product_details entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     category: str | None = None
     """The category to which the product belongs"""
@@ -806,7 +806,7 @@ class ShowProductDetailsSearchData(BaseModel):
 
 class ListDisputesSearchData(BaseModel):
     """Search result data for list_disputes entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     create_time: str | None = None
     """The timestamp when the dispute was created."""
@@ -838,7 +838,7 @@ class ListDisputesSearchData(BaseModel):
 
 class SearchInvoicesSearchData(BaseModel):
     """Search result data for search_invoices entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     additional_recipients: list[Any] | None = None
     """List of additional recipients associated with the invoice"""
@@ -872,7 +872,7 @@ class SearchInvoicesSearchData(BaseModel):
 
 class ListPaymentsSearchData(BaseModel):
     """Search result data for list_payments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     cart: str | None = None
     """Details of the cart associated with the payment."""
@@ -898,7 +898,7 @@ class ListPaymentsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -910,7 +910,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -39,7 +39,7 @@ class PinterestReplicationConfig(BaseModel):
 
 class AdAccountOwner(BaseModel):
     """Owner details of the ad account"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None, description="Unique identifier of the owner")
     """Unique identifier of the owner"""
@@ -48,7 +48,7 @@ class AdAccountOwner(BaseModel):
 
 class AdAccount(BaseModel):
     """Pinterest ad account object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     name: str | None = Field(default=None)
@@ -61,21 +61,21 @@ class AdAccount(BaseModel):
 
 class AdAccountsList(BaseModel):
     """Paginated list of ad accounts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[AdAccount] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class BoardOwner(BaseModel):
     """Board owner details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     username: str | None | None = Field(default=None, description="Username of the board owner")
     """Username of the board owner"""
 
 class BoardMedia(BaseModel):
     """Media content for the board"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     image_cover_url: str | None | None = Field(default=None, description="Cover image URL")
     """Cover image URL"""
@@ -84,7 +84,7 @@ class BoardMedia(BaseModel):
 
 class Board(BaseModel):
     """Pinterest board object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     name: str | None = Field(default=None)
@@ -101,14 +101,14 @@ class Board(BaseModel):
 
 class BoardsList(BaseModel):
     """Paginated list of boards"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[Board] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class CampaignTrackingUrls(BaseModel):
     """Third-party tracking URLs"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     impression: list[str] | None | None = Field(default=None, description="Impression tracking URLs")
     """Impression tracking URLs"""
@@ -123,7 +123,7 @@ class CampaignTrackingUrls(BaseModel):
 
 class Campaign(BaseModel):
     """Pinterest campaign object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     ad_account_id: str | None = Field(default=None)
@@ -149,14 +149,14 @@ class Campaign(BaseModel):
 
 class CampaignsList(BaseModel):
     """Paginated list of campaigns"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[Campaign] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class AdGroupTrackingUrls(BaseModel):
     """Third-party tracking URLs"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     impression: list[str] | None | None = Field(default=None, description="Impression tracking URLs")
     """Impression tracking URLs"""
@@ -171,7 +171,7 @@ class AdGroupTrackingUrls(BaseModel):
 
 class AdGroup(BaseModel):
     """Pinterest ad group object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     ad_account_id: str | None = Field(default=None)
@@ -208,14 +208,14 @@ class AdGroup(BaseModel):
 
 class AdGroupsList(BaseModel):
     """Paginated list of ad groups"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[AdGroup] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class AdTrackingUrls(BaseModel):
     """Third-party tracking URLs"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     impression: list[str] | None | None = Field(default=None, description="Impression tracking URLs")
     """Impression tracking URLs"""
@@ -230,7 +230,7 @@ class AdTrackingUrls(BaseModel):
 
 class Ad(BaseModel):
     """Pinterest ad object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     ad_group_id: str | None = Field(default=None)
@@ -268,42 +268,42 @@ class Ad(BaseModel):
 
 class AdsList(BaseModel):
     """Paginated list of ads"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[Ad] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class BoardSection(BaseModel):
     """Pinterest board section object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     name: str | None = Field(default=None)
 
 class BoardSectionsList(BaseModel):
     """Paginated list of board sections"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[BoardSection] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class BoardPinBoardOwner(BaseModel):
     """Board owner info"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     username: str | None | None = Field(default=None, description="Username of the board owner")
     """Username of the board owner"""
 
 class BoardPinMedia(BaseModel):
     """Media content"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     media_type: str | None | None = Field(default=None, description="Type of media")
     """Type of media"""
 
 class BoardPin(BaseModel):
     """Pinterest pin on a board"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     created_at: str | None = Field(default=None)
@@ -327,14 +327,14 @@ class BoardPin(BaseModel):
 
 class BoardPinsList(BaseModel):
     """Paginated list of board pins"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[BoardPin] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class Catalog(BaseModel):
     """Pinterest catalog object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     created_at: str | None = Field(default=None)
@@ -344,14 +344,14 @@ class Catalog(BaseModel):
 
 class CatalogsList(BaseModel):
     """Paginated list of catalogs"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[Catalog] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class CatalogsFeedPreferredProcessingSchedule(BaseModel):
     """Preferred processing schedule"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     time: str | None | None = Field(default=None, description="Preferred processing time")
     """Preferred processing time"""
@@ -360,7 +360,7 @@ class CatalogsFeedPreferredProcessingSchedule(BaseModel):
 
 class CatalogsFeed(BaseModel):
     """Pinterest catalog feed object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     created_at: str | None = Field(default=None)
@@ -378,14 +378,14 @@ class CatalogsFeed(BaseModel):
 
 class CatalogsFeedsList(BaseModel):
     """Paginated list of catalog feeds"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[CatalogsFeed] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class CatalogsProductGroup(BaseModel):
     """Pinterest catalog product group object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     created_at: int | None = Field(default=None)
@@ -399,14 +399,14 @@ class CatalogsProductGroup(BaseModel):
 
 class CatalogsProductGroupsList(BaseModel):
     """Paginated list of catalog product groups"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[CatalogsProductGroup] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class AudienceRule(BaseModel):
     """Audience targeting rules"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     country: str | None | None = Field(default=None, description="Country criteria")
     """Country criteria"""
@@ -425,7 +425,7 @@ class AudienceRule(BaseModel):
 
 class Audience(BaseModel):
     """Pinterest audience object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     ad_account_id: str | None = Field(default=None)
@@ -442,14 +442,14 @@ class Audience(BaseModel):
 
 class AudiencesList(BaseModel):
     """Paginated list of audiences"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[Audience] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class ConversionTagConfigs(BaseModel):
     """Tag configurations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     aem_enabled: bool | None | None = Field(default=None, description="AEM email integration enabled")
     """AEM email integration enabled"""
@@ -468,7 +468,7 @@ class ConversionTagConfigs(BaseModel):
 
 class ConversionTag(BaseModel):
     """Pinterest conversion tag object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     ad_account_id: str | None = Field(default=None)
@@ -482,14 +482,14 @@ class ConversionTag(BaseModel):
 
 class ConversionTagsList(BaseModel):
     """Paginated list of conversion tags"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[ConversionTag] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class CustomerList(BaseModel):
     """Pinterest customer list object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     ad_account_id: str | None = Field(default=None)
@@ -504,14 +504,14 @@ class CustomerList(BaseModel):
 
 class CustomerListsList(BaseModel):
     """Paginated list of customer lists"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[CustomerList] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
 
 class Keyword(BaseModel):
     """Pinterest keyword object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None
     archived: bool | None = Field(default=None)
@@ -524,7 +524,7 @@ class Keyword(BaseModel):
 
 class KeywordsList(BaseModel):
     """Paginated list of keywords"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[Keyword] | None = Field(default=None)
     bookmark: str | None = Field(default=None)
@@ -534,85 +534,85 @@ class KeywordsList(BaseModel):
 
 class AdAccountsListResultMeta(BaseModel):
     """Metadata for ad_accounts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class BoardsListResultMeta(BaseModel):
     """Metadata for boards.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class AdGroupsListResultMeta(BaseModel):
     """Metadata for ad_groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class AdsListResultMeta(BaseModel):
     """Metadata for ads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class BoardSectionsListResultMeta(BaseModel):
     """Metadata for board_sections.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class BoardPinsListResultMeta(BaseModel):
     """Metadata for board_pins.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class CatalogsListResultMeta(BaseModel):
     """Metadata for catalogs.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class CatalogsFeedsListResultMeta(BaseModel):
     """Metadata for catalogs_feeds.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class CatalogsProductGroupsListResultMeta(BaseModel):
     """Metadata for catalogs_product_groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class AudiencesListResultMeta(BaseModel):
     """Metadata for audiences.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class ConversionTagsListResultMeta(BaseModel):
     """Metadata for conversion_tags.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class CustomerListsListResultMeta(BaseModel):
     """Metadata for customer_lists.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
 class KeywordsListResultMeta(BaseModel):
     """Metadata for keywords.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
 
@@ -669,7 +669,7 @@ D = TypeVar('D')
 
 class AdAccountsSearchData(BaseModel):
     """Search result data for ad_accounts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     country: str | None = None
     """Country associated with the ad account"""
@@ -691,7 +691,7 @@ class AdAccountsSearchData(BaseModel):
 
 class BoardsSearchData(BaseModel):
     """Search result data for boards entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     board_pins_modified_at: str | None = None
     """Timestamp when pins on the board were last modified"""
@@ -719,7 +719,7 @@ class BoardsSearchData(BaseModel):
 
 class CampaignsSearchData(BaseModel):
     """Search result data for campaigns entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_account_id: str | None = None
     """Ad account ID"""
@@ -759,7 +759,7 @@ class CampaignsSearchData(BaseModel):
 
 class AdGroupsSearchData(BaseModel):
     """Search result data for ad_groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_account_id: str | None = None
     """Ad account ID"""
@@ -815,7 +815,7 @@ class AdGroupsSearchData(BaseModel):
 
 class AdsSearchData(BaseModel):
     """Search result data for ads entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_account_id: str | None = None
     """Ad account ID"""
@@ -877,7 +877,7 @@ class AdsSearchData(BaseModel):
 
 class BoardSectionsSearchData(BaseModel):
     """Search result data for board_sections entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str | None = None
     """Unique identifier for the board section"""
@@ -887,7 +887,7 @@ class BoardSectionsSearchData(BaseModel):
 
 class BoardPinsSearchData(BaseModel):
     """Search result data for board_pins entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     alt_text: str | None = None
     """Alternate text for accessibility"""
@@ -927,7 +927,7 @@ class BoardPinsSearchData(BaseModel):
 
 class CatalogsSearchData(BaseModel):
     """Search result data for catalogs entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     catalog_type: str | None = None
     """Type of catalog"""
@@ -943,7 +943,7 @@ class CatalogsSearchData(BaseModel):
 
 class CatalogsFeedsSearchData(BaseModel):
     """Search result data for catalogs_feeds entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     catalog_type: str | None = None
     """Type of catalog"""
@@ -975,7 +975,7 @@ class CatalogsFeedsSearchData(BaseModel):
 
 class CatalogsProductGroupsSearchData(BaseModel):
     """Search result data for catalogs_product_groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: int | None = None
     """Creation timestamp (Unix seconds)"""
@@ -999,7 +999,7 @@ class CatalogsProductGroupsSearchData(BaseModel):
 
 class AudiencesSearchData(BaseModel):
     """Search result data for audiences entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_account_id: str | None = None
     """Ad account ID"""
@@ -1027,7 +1027,7 @@ class AudiencesSearchData(BaseModel):
 
 class ConversionTagsSearchData(BaseModel):
     """Search result data for conversion_tags entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_account_id: str | None = None
     """Ad account ID"""
@@ -1051,7 +1051,7 @@ class ConversionTagsSearchData(BaseModel):
 
 class CustomerListsSearchData(BaseModel):
     """Search result data for customer_lists entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_account_id: str | None = None
     """Associated ad account ID"""
@@ -1077,7 +1077,7 @@ class CustomerListsSearchData(BaseModel):
 
 class KeywordsSearchData(BaseModel):
     """Search result data for keywords entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     archived: bool | None = None
     """Whether the keyword is archived"""
@@ -1101,7 +1101,7 @@ class KeywordsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1113,7 +1113,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
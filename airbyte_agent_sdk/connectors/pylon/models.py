@@ -24,40 +24,40 @@ class PylonAuthConfig(BaseModel):
 
 class Pagination(BaseModel):
     """Pagination type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
 
 class MiniAccount(BaseModel):
     """MiniAccount type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
 
 class MiniUser(BaseModel):
     """MiniUser type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email: str | None = Field(default=None)
     id: str | None = Field(default=None)
 
 class MiniContact(BaseModel):
     """MiniContact type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email: str | None = Field(default=None)
     id: str | None = Field(default=None)
 
 class MiniTeam(BaseModel):
     """MiniTeam type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
 
 class SlackInfo(BaseModel):
     """SlackInfo type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel_id: str | None = Field(default=None)
     message_ts: str | None = Field(default=None)
@@ -65,20 +65,20 @@ class SlackInfo(BaseModel):
 
 class IssueChatWidgetInfo(BaseModel):
     """IssueChatWidgetInfo type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_url: str | None = Field(default=None)
 
 class CSATResponse(BaseModel):
     """CSATResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     comment: str | None = Field(default=None)
     score: int | None = Field(default=None)
 
 class CustomFieldValue(BaseModel):
     """CustomFieldValue type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     slug: str | None = Field(default=None)
     value: str | None = Field(default=None)
@@ -86,7 +86,7 @@ class CustomFieldValue(BaseModel):
 
 class ExternalIssue(BaseModel):
     """ExternalIssue type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     external_id: str | None = Field(default=None)
     link: str | None = Field(default=None)
@@ -94,7 +94,7 @@ class ExternalIssue(BaseModel):
 
 class Issue(BaseModel):
     """Issue type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     account: Any | None = Field(default=None)
@@ -133,7 +133,7 @@ class Issue(BaseModel):
 
 class IssuesResponse(BaseModel):
     """IssuesResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Issue] | None = Field(default=None)
     pagination: Pagination | None = Field(default=None)
@@ -141,14 +141,14 @@ class IssuesResponse(BaseModel):
 
 class IssueResponse(BaseModel):
     """IssueResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Issue | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class MessageAuthor(BaseModel):
     """MessageAuthor type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     avatar_url: str | None = Field(default=None)
     contact: Any | None = Field(default=None)
@@ -157,7 +157,7 @@ class MessageAuthor(BaseModel):
 
 class EmailMessageInfo(BaseModel):
     """EmailMessageInfo type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bcc_emails: list[str] | None = Field(default=None)
     cc_emails: list[str] | None = Field(default=None)
@@ -167,7 +167,7 @@ class EmailMessageInfo(BaseModel):
 
 class Message(BaseModel):
     """Message type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     author: Any | None = Field(default=None)
@@ -181,7 +181,7 @@ class Message(BaseModel):
 
 class MessagesResponse(BaseModel):
     """MessagesResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Message] | None = Field(default=None)
     pagination: Pagination | None = Field(default=None)
@@ -189,7 +189,7 @@ class MessagesResponse(BaseModel):
 
 class AccountChannel(BaseModel):
     """AccountChannel type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel_id: str | None = Field(default=None)
     source: str | None = Field(default=None)
@@ -197,7 +197,7 @@ class AccountChannel(BaseModel):
 
 class Account(BaseModel):
     """Account type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     channels: list[AccountChannel] | None = Field(default=None)
@@ -216,7 +216,7 @@ class Account(BaseModel):
 
 class AccountsResponse(BaseModel):
     """AccountsResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Account] | None = Field(default=None)
     pagination: Pagination | None = Field(default=None)
@@ -224,14 +224,14 @@ class AccountsResponse(BaseModel):
 
 class AccountResponse(BaseModel):
     """AccountResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Account | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class AccountCreateParams(BaseModel):
     """AccountCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     domains: list[str] | None = Field(default=None)
@@ -242,7 +242,7 @@ class AccountCreateParams(BaseModel):
 
 class AccountUpdateParams(BaseModel):
     """AccountUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     domains: list[str] | None = Field(default=None)
@@ -254,14 +254,14 @@ class AccountUpdateParams(BaseModel):
 
 class IntegrationUserId(BaseModel):
     """IntegrationUserId type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     source: str | None = Field(default=None)
 
 class Contact(BaseModel):
     """Contact type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     account: Any | None = Field(default=None)
@@ -277,7 +277,7 @@ class Contact(BaseModel):
 
 class ContactsResponse(BaseModel):
     """ContactsResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Contact] | None = Field(default=None)
     pagination: Pagination | None = Field(default=None)
@@ -285,14 +285,14 @@ class ContactsResponse(BaseModel):
 
 class ContactResponse(BaseModel):
     """ContactResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Contact | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class Team(BaseModel):
     """Team type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -300,7 +300,7 @@ class Team(BaseModel):
 
 class TeamsResponse(BaseModel):
     """TeamsResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Team] | None = Field(default=None)
     pagination: Pagination | None = Field(default=None)
@@ -308,14 +308,14 @@ class TeamsResponse(BaseModel):
 
 class TeamResponse(BaseModel):
     """TeamResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Team | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class Tag(BaseModel):
     """Tag type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     hex_color: str | None = Field(default=None)
@@ -324,7 +324,7 @@ class Tag(BaseModel):
 
 class TagsResponse(BaseModel):
     """TagsResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Tag] | None = Field(default=None)
     pagination: Pagination | None = Field(default=None)
@@ -332,14 +332,14 @@ class TagsResponse(BaseModel):
 
 class TagResponse(BaseModel):
     """TagResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Tag | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class User(BaseModel):
     """User type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     avatar_url: str | None = Field(default=None)
@@ -351,7 +351,7 @@ class User(BaseModel):
 
 class UsersResponse(BaseModel):
     """UsersResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[User] | None = Field(default=None)
     pagination: Pagination | None = Field(default=None)
@@ -359,21 +359,21 @@ class UsersResponse(BaseModel):
 
 class UserResponse(BaseModel):
     """UserResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: User | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class SelectOption(BaseModel):
     """SelectOption type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     label: str | None = Field(default=None)
     slug: str | None = Field(default=None)
 
 class NumberMetadata(BaseModel):
     """NumberMetadata type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency: str | None = Field(default=None)
     decimal_places: int | None = Field(default=None)
@@ -381,13 +381,13 @@ class NumberMetadata(BaseModel):
 
 class SelectMetadata(BaseModel):
     """SelectMetadata type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     options: list[SelectOption] | None = Field(default=None)
 
 class CustomField(BaseModel):
     """CustomField type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     created_at: str | None = Field(default=None)
@@ -406,7 +406,7 @@ class CustomField(BaseModel):
 
 class CustomFieldsResponse(BaseModel):
     """CustomFieldsResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[CustomField] | None = Field(default=None)
     pagination: Pagination | None = Field(default=None)
@@ -414,14 +414,14 @@ class CustomFieldsResponse(BaseModel):
 
 class CustomFieldResponse(BaseModel):
     """CustomFieldResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: CustomField | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class TicketFormField(BaseModel):
     """TicketFormField type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     description_html: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -430,7 +430,7 @@ class TicketFormField(BaseModel):
 
 class TicketForm(BaseModel):
     """TicketForm type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     description_html: str | None = Field(default=None)
@@ -442,7 +442,7 @@ class TicketForm(BaseModel):
 
 class TicketFormsResponse(BaseModel):
     """TicketFormsResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[TicketForm] | None = Field(default=None)
     pagination: Pagination | None = Field(default=None)
@@ -450,7 +450,7 @@ class TicketFormsResponse(BaseModel):
 
 class UserRole(BaseModel):
     """UserRole type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -458,7 +458,7 @@ class UserRole(BaseModel):
 
 class UserRolesResponse(BaseModel):
     """UserRolesResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[UserRole] | None = Field(default=None)
     pagination: Pagination | None = Field(default=None)
@@ -466,14 +466,14 @@ class UserRolesResponse(BaseModel):
 
 class MeResponse(BaseModel):
     """MeResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: User | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class IssueCreateParams(BaseModel):
     """IssueCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str
     body_html: str
@@ -487,7 +487,7 @@ class IssueCreateParams(BaseModel):
 
 class IssueUpdateParams(BaseModel):
     """IssueUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     state: str | None = Field(default=None)
     assignee_id: str | None = Field(default=None)
@@ -497,7 +497,7 @@ class IssueUpdateParams(BaseModel):
 
 class IssueNoteCreateParams(BaseModel):
     """IssueNoteCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     body_html: str
     thread_id: str | None = Field(default=None)
@@ -505,7 +505,7 @@ class IssueNoteCreateParams(BaseModel):
 
 class IssueNote(BaseModel):
     """IssueNote type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     body_html: str | None = Field(default=None)
@@ -513,34 +513,34 @@ class IssueNote(BaseModel):
 
 class IssueNoteResponse(BaseModel):
     """IssueNoteResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: IssueNote | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class IssueThreadCreateParams(BaseModel):
     """IssueThreadCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class IssueThread(BaseModel):
     """IssueThread type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
 
 class IssueThreadResponse(BaseModel):
     """IssueThreadResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: IssueThread | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class IssueReplyCreateParams(BaseModel):
     """IssueReplyCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     body_html: str
     message_id: str
@@ -550,40 +550,40 @@ class IssueReplyCreateParams(BaseModel):
 
 class IssueReplyData(BaseModel):
     """IssueReplyData type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     issue_id: str | None = Field(default=None)
 
 class IssueReplyResponse(BaseModel):
     """IssueReplyResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: IssueReplyData | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class IssueAssignParams(BaseModel):
     """IssueAssignParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     assignee_id: str | None = Field(default=None)
     team_id: str | None = Field(default=None)
 
 class IssueStatusUpdateParams(BaseModel):
     """IssueStatusUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     state: str
 
 class DeleteIssueResponse(BaseModel):
     """DeleteIssueResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     request_id: str | None = Field(default=None)
 
 class ContactCreateParams(BaseModel):
     """ContactCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     email: str | None = Field(default=None)
@@ -592,7 +592,7 @@ class ContactCreateParams(BaseModel):
 
 class ContactUpdateParams(BaseModel):
     """ContactUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     email: str | None = Field(default=None)
@@ -600,19 +600,19 @@ class ContactUpdateParams(BaseModel):
 
 class TeamCreateParams(BaseModel):
     """TeamCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class TeamUpdateParams(BaseModel):
     """TeamUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
 
 class TagCreateParams(BaseModel):
     """TagCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     value: str
     object_type: str
@@ -620,14 +620,14 @@ class TagCreateParams(BaseModel):
 
 class TagUpdateParams(BaseModel):
     """TagUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     value: str | None = Field(default=None)
     hex_color: str | None = Field(default=None)
 
 class Task(BaseModel):
     """Task type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     title: str | None = Field(default=None)
@@ -642,7 +642,7 @@ class Task(BaseModel):
 
 class TaskCreateParams(BaseModel):
     """TaskCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str
     body_html: str | None = Field(default=None)
@@ -654,7 +654,7 @@ class TaskCreateParams(BaseModel):
 
 class TaskUpdateParams(BaseModel):
     """TaskUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str | None = Field(default=None)
     body_html: str | None = Field(default=None)
@@ -663,14 +663,14 @@ class TaskUpdateParams(BaseModel):
 
 class TaskResponse(BaseModel):
     """TaskResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Task | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class Project(BaseModel):
     """Project type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -685,7 +685,7 @@ class Project(BaseModel):
 
 class ProjectCreateParams(BaseModel):
     """ProjectCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     account_id: str
@@ -695,7 +695,7 @@ class ProjectCreateParams(BaseModel):
 
 class ProjectUpdateParams(BaseModel):
     """ProjectUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     description_html: str | None = Field(default=None)
@@ -703,14 +703,14 @@ class ProjectUpdateParams(BaseModel):
 
 class ProjectResponse(BaseModel):
     """ProjectResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Project | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class Milestone(BaseModel):
     """Milestone type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -721,7 +721,7 @@ class Milestone(BaseModel):
 
 class MilestoneCreateParams(BaseModel):
     """MilestoneCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     project_id: str
@@ -729,21 +729,21 @@ class MilestoneCreateParams(BaseModel):
 
 class MilestoneUpdateParams(BaseModel):
     """MilestoneUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     due_date: str | None = Field(default=None)
 
 class MilestoneResponse(BaseModel):
     """MilestoneResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Milestone | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class Article(BaseModel):
     """Article type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     title: str | None = Field(default=None)
@@ -756,7 +756,7 @@ class Article(BaseModel):
 
 class ArticleCreateParams(BaseModel):
     """ArticleCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str
     body_html: str
@@ -766,21 +766,21 @@ class ArticleCreateParams(BaseModel):
 
 class ArticleUpdateParams(BaseModel):
     """ArticleUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str | None = Field(default=None)
     body_html: str | None = Field(default=None)
 
 class ArticleResponse(BaseModel):
     """ArticleResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Article | None = Field(default=None)
     request_id: str | None = Field(default=None)
 
 class Collection(BaseModel):
     """Collection type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     title: str | None = Field(default=None)
@@ -790,7 +790,7 @@ class Collection(BaseModel):
 
 class CollectionCreateParams(BaseModel):
     """CollectionCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str
     description: str | None = Field(default=None)
@@ -798,7 +798,7 @@ class CollectionCreateParams(BaseModel):
 
 class CollectionResponse(BaseModel):
     """CollectionResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: Collection | None = Field(default=None)
     request_id: str | None = Field(default=None)
@@ -808,70 +808,70 @@ class CollectionResponse(BaseModel):
 
 class IssuesListResultMeta(BaseModel):
     """Metadata for issues.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
 
 class MessagesListResultMeta(BaseModel):
     """Metadata for messages.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
 
 class AccountsListResultMeta(BaseModel):
     """Metadata for accounts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
 
 class ContactsListResultMeta(BaseModel):
     """Metadata for contacts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
 
 class TeamsListResultMeta(BaseModel):
     """Metadata for teams.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
 
 class TagsListResultMeta(BaseModel):
     """Metadata for tags.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
 
 class CustomFieldsListResultMeta(BaseModel):
     """Metadata for custom_fields.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
 
 class TicketFormsListResultMeta(BaseModel):
     """Metadata for ticket_forms.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
 
 class UserRolesListResultMeta(BaseModel):
     """Metadata for user_roles.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_next_page: bool | None = Field(default=None)
@@ -929,7 +929,7 @@ D = TypeVar('D')
 
 class IssuesSearchData(BaseModel):
     """Search result data for issues entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the issue"""
@@ -957,7 +957,7 @@ class IssuesSearchData(BaseModel):
 
 class MessagesSearchData(BaseModel):
     """Search result data for messages entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the message"""
@@ -973,7 +973,7 @@ class MessagesSearchData(BaseModel):
 
 class AccountsSearchData(BaseModel):
     """Search result data for accounts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the account"""
@@ -995,7 +995,7 @@ class AccountsSearchData(BaseModel):
 
 class ContactsSearchData(BaseModel):
     """Search result data for contacts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the contact"""
@@ -1011,7 +1011,7 @@ class ContactsSearchData(BaseModel):
 
 class TeamsSearchData(BaseModel):
     """Search result data for teams entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the team"""
@@ -1021,7 +1021,7 @@ class TeamsSearchData(BaseModel):
 
 class TagsSearchData(BaseModel):
     """Search result data for tags entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the tag"""
@@ -1033,7 +1033,7 @@ class TagsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the user"""
@@ -1049,7 +1049,7 @@ class UsersSearchData(BaseModel):
 
 class CustomFieldsSearchData(BaseModel):
     """Search result data for custom_fields entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the custom field"""
@@ -1069,7 +1069,7 @@ class CustomFieldsSearchData(BaseModel):
 
 class TicketFormsSearchData(BaseModel):
     """Search result data for ticket_forms entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the ticket form"""
@@ -1083,7 +1083,7 @@ class TicketFormsSearchData(BaseModel):
 
 class UserRolesSearchData(BaseModel):
     """Search result data for user_roles entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the user role"""
@@ -1097,7 +1097,7 @@ class UserRolesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1109,7 +1109,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -29,7 +29,7 @@ class SalesforceAuthConfig(BaseModel):
 
 class SObject(BaseModel):
     """Salesforce sObject metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     label: str | None = Field(default=None)
@@ -45,7 +45,7 @@ class SObject(BaseModel):
 
 class SObjectsResponse(BaseModel):
     """Response from the sobjects endpoint listing all available Salesforce objects"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     encoding: str | None = Field(default=None)
     max_batch_size: int | None = Field(default=None, alias="maxBatchSize")
@@ -53,14 +53,14 @@ class SObjectsResponse(BaseModel):
 
 class AccountAttributes(BaseModel):
     """Nested schema for Account.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class Account(BaseModel):
     """Salesforce Account object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     name: str | None = Field(default=None, alias="Name")
@@ -68,7 +68,7 @@ class Account(BaseModel):
 
 class AccountQueryResult(BaseModel):
     """SOQL query result for accounts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -77,14 +77,14 @@ class AccountQueryResult(BaseModel):
 
 class ContactAttributes(BaseModel):
     """Nested schema for Contact.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class Contact(BaseModel):
     """Salesforce Contact object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     name: str | None = Field(default=None, alias="Name")
@@ -92,7 +92,7 @@ class Contact(BaseModel):
 
 class ContactQueryResult(BaseModel):
     """SOQL query result for contacts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -101,14 +101,14 @@ class ContactQueryResult(BaseModel):
 
 class LeadAttributes(BaseModel):
     """Nested schema for Lead.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class Lead(BaseModel):
     """Salesforce Lead object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     name: str | None = Field(default=None, alias="Name")
@@ -116,7 +116,7 @@ class Lead(BaseModel):
 
 class LeadQueryResult(BaseModel):
     """SOQL query result for leads"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -125,14 +125,14 @@ class LeadQueryResult(BaseModel):
 
 class OpportunityAttributes(BaseModel):
     """Nested schema for Opportunity.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class Opportunity(BaseModel):
     """Salesforce Opportunity object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     name: str | None = Field(default=None, alias="Name")
@@ -140,7 +140,7 @@ class Opportunity(BaseModel):
 
 class OpportunityQueryResult(BaseModel):
     """SOQL query result for opportunities"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -149,14 +149,14 @@ class OpportunityQueryResult(BaseModel):
 
 class TaskAttributes(BaseModel):
     """Nested schema for Task.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class Task(BaseModel):
     """Salesforce Task object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     subject: str | None = Field(default=None, alias="Subject")
@@ -164,7 +164,7 @@ class Task(BaseModel):
 
 class TaskQueryResult(BaseModel):
     """SOQL query result for tasks"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -173,14 +173,14 @@ class TaskQueryResult(BaseModel):
 
 class EventAttributes(BaseModel):
     """Nested schema for Event.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class Event(BaseModel):
     """Salesforce Event object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     subject: str | None = Field(default=None, alias="Subject")
@@ -188,7 +188,7 @@ class Event(BaseModel):
 
 class EventQueryResult(BaseModel):
     """SOQL query result for events"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -197,14 +197,14 @@ class EventQueryResult(BaseModel):
 
 class CampaignAttributes(BaseModel):
     """Nested schema for Campaign.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class Campaign(BaseModel):
     """Salesforce Campaign object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     name: str | None = Field(default=None, alias="Name")
@@ -212,7 +212,7 @@ class Campaign(BaseModel):
 
 class CampaignQueryResult(BaseModel):
     """SOQL query result for campaigns"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -221,14 +221,14 @@ class CampaignQueryResult(BaseModel):
 
 class CaseAttributes(BaseModel):
     """Nested schema for Case.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class Case(BaseModel):
     """Salesforce Case object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     case_number: str | None = Field(default=None, alias="CaseNumber")
@@ -237,7 +237,7 @@ class Case(BaseModel):
 
 class CaseQueryResult(BaseModel):
     """SOQL query result for cases"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -246,14 +246,14 @@ class CaseQueryResult(BaseModel):
 
 class NoteAttributes(BaseModel):
     """Nested schema for Note.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class Note(BaseModel):
     """Salesforce Note object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     title: str | None = Field(default=None, alias="Title")
@@ -261,7 +261,7 @@ class Note(BaseModel):
 
 class NoteQueryResult(BaseModel):
     """SOQL query result for notes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -270,14 +270,14 @@ class NoteQueryResult(BaseModel):
 
 class ContentVersionAttributes(BaseModel):
     """Nested schema for ContentVersion.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class ContentVersion(BaseModel):
     """Salesforce ContentVersion object - represents a file version in Salesforce Files"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     title: str | None = Field(default=None, alias="Title")
@@ -290,7 +290,7 @@ class ContentVersion(BaseModel):
 
 class ContentVersionQueryResult(BaseModel):
     """SOQL query result for content versions"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -299,14 +299,14 @@ class ContentVersionQueryResult(BaseModel):
 
 class AttachmentAttributes(BaseModel):
     """Nested schema for Attachment.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class Attachment(BaseModel):
     """Salesforce Attachment object - legacy file attachment on a record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     name: str | None = Field(default=None, alias="Name")
@@ -317,7 +317,7 @@ class Attachment(BaseModel):
 
 class AttachmentQueryResult(BaseModel):
     """SOQL query result for attachments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -326,7 +326,7 @@ class AttachmentQueryResult(BaseModel):
 
 class Report(BaseModel):
     """Salesforce Report metadata from the Analytics API"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -336,7 +336,7 @@ class Report(BaseModel):
 
 class ReportResults(BaseModel):
     """Executed report results including data rows, aggregates, and metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     attributes: dict[str, Any] | None = Field(default=None)
     report_metadata: dict[str, Any] | None = Field(default=None, alias="reportMetadata")
@@ -349,14 +349,14 @@ class ReportResults(BaseModel):
 
 class UserAttributes(BaseModel):
     """Nested schema for User.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class User(BaseModel):
     """Salesforce User object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     name: str | None = Field(default=None, alias="Name")
@@ -364,7 +364,7 @@ class User(BaseModel):
 
 class UserQueryResult(BaseModel):
     """SOQL query result for users"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -373,14 +373,14 @@ class UserQueryResult(BaseModel):
 
 class OpportunityStageAttributes(BaseModel):
     """Nested schema for OpportunityStage.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class OpportunityStage(BaseModel):
     """Salesforce OpportunityStage object - uses FIELDS(STANDARD) so all standard fields are returned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     master_label: str | None = Field(default=None, alias="MasterLabel")
@@ -388,7 +388,7 @@ class OpportunityStage(BaseModel):
 
 class OpportunityStageQueryResult(BaseModel):
     """SOQL query result for opportunity stages"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -397,7 +397,7 @@ class OpportunityStageQueryResult(BaseModel):
 
 class QueryResult(BaseModel):
     """Generic SOQL query result"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_size: int | None = Field(default=None, alias="totalSize")
     done: bool | None = Field(default=None)
@@ -406,21 +406,21 @@ class QueryResult(BaseModel):
 
 class SearchResultSearchrecordsItemAttributes(BaseModel):
     """Nested schema for SearchResultSearchrecordsItem.attributes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     url: str | None = Field(default=None)
 
 class SearchResultSearchrecordsItem(BaseModel):
     """Nested schema for SearchResult.searchRecords_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, alias="Id")
     attributes: SearchResultSearchrecordsItemAttributes | None = Field(default=None)
 
 class SearchResult(BaseModel):
     """SOSL search result"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     search_records: list[SearchResultSearchrecordsItem] | None = Field(default=None, alias="searchRecords")
 
@@ -429,98 +429,98 @@ class SearchResult(BaseModel):
 
 class AccountsListResultMeta(BaseModel):
     """Metadata for accounts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class ContactsListResultMeta(BaseModel):
     """Metadata for contacts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class LeadsListResultMeta(BaseModel):
     """Metadata for leads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class OpportunitiesListResultMeta(BaseModel):
     """Metadata for opportunities.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class TasksListResultMeta(BaseModel):
     """Metadata for tasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class EventsListResultMeta(BaseModel):
     """Metadata for events.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class CasesListResultMeta(BaseModel):
     """Metadata for cases.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class NotesListResultMeta(BaseModel):
     """Metadata for notes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class ContentVersionsListResultMeta(BaseModel):
     """Metadata for content_versions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class AttachmentsListResultMeta(BaseModel):
     """Metadata for attachments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class OpportunityStagesListResultMeta(BaseModel):
     """Metadata for opportunity_stages.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
 
 class QueryListResultMeta(BaseModel):
     """Metadata for query.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     done: bool | None = Field(default=None)
     next_records_url: str | None = Field(default=None, alias="nextRecordsUrl")
@@ -578,7 +578,7 @@ D = TypeVar('D')
 
 class AccountsSearchData(BaseModel):
     """Search result data for accounts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the account record"""
@@ -644,7 +644,7 @@ class AccountsSearchData(BaseModel):
 
 class ContactsSearchData(BaseModel):
     """Search result data for contacts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the contact record"""
@@ -702,7 +702,7 @@ class ContactsSearchData(BaseModel):
 
 class LeadsSearchData(BaseModel):
     """Search result data for leads entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the lead record"""
@@ -776,7 +776,7 @@ class LeadsSearchData(BaseModel):
 
 class OpportunitiesSearchData(BaseModel):
     """Search result data for opportunities entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the opportunity record"""
@@ -834,7 +834,7 @@ class OpportunitiesSearchData(BaseModel):
 
 class TasksSearchData(BaseModel):
     """Search result data for tasks entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the task record"""
@@ -888,7 +888,7 @@ class TasksSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the user record"""
@@ -958,7 +958,7 @@ class UsersSearchData(BaseModel):
 
 class OpportunityStagesSearchData(BaseModel):
     """Search result data for opportunity_stages entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique identifier for the opportunity stage record"""
@@ -998,7 +998,7 @@ class OpportunityStagesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1010,7 +1010,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -34,7 +34,7 @@ class SendgridReplicationConfig(BaseModel):
 
 class Contact(BaseModel):
     """A SendGrid marketing contact"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     email: str | None = Field(default=None)
@@ -60,13 +60,13 @@ class Contact(BaseModel):
 
 class ContactsListMetadata(BaseModel):
     """Nested schema for ContactsList._metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None | None = Field(default=None)
 
 class ContactsList(BaseModel):
     """Response containing a list of contacts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     result: list[Contact] | None = Field(default=None)
     contact_count: int | None = Field(default=None)
@@ -74,13 +74,13 @@ class ContactsList(BaseModel):
 
 class ListMetadata(BaseModel):
     """Metadata about the list resource"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: str | None = Field(default=None)
 
 class List(BaseModel):
     """A SendGrid marketing list"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -89,26 +89,26 @@ class List(BaseModel):
 
 class ListsListMetadata(BaseModel):
     """Nested schema for ListsList._metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None | None = Field(default=None)
 
 class ListsList(BaseModel):
     """Response containing a list of marketing lists"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     result: list[List] | None = Field(default=None)
     metadata: ListsListMetadata | None = Field(default=None, alias="_metadata")
 
 class SegmentStatus(BaseModel):
     """Segment status details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     query_validation: str | None = Field(default=None)
 
 class Segment(BaseModel):
     """A SendGrid marketing segment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -123,13 +123,13 @@ class Segment(BaseModel):
 
 class SegmentsList(BaseModel):
     """Response containing a list of segments"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[Segment] | None = Field(default=None)
 
 class Campaign(BaseModel):
     """A SendGrid marketing campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -141,20 +141,20 @@ class Campaign(BaseModel):
 
 class CampaignsListMetadata(BaseModel):
     """Nested schema for CampaignsList._metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None | None = Field(default=None)
 
 class CampaignsList(BaseModel):
     """Response containing a list of campaigns"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     result: list[Campaign] | None = Field(default=None)
     metadata: CampaignsListMetadata | None = Field(default=None, alias="_metadata")
 
 class SingleSendEmailConfig(BaseModel):
     """Email configuration details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     subject: str | None | None = Field(default=None)
     html_content: str | None | None = Field(default=None)
@@ -169,7 +169,7 @@ class SingleSendEmailConfig(BaseModel):
 
 class SingleSendSendTo(BaseModel):
     """Recipients configuration"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     list_ids: list[str] | None | None = Field(default=None)
     segment_ids: list[str] | None | None = Field(default=None)
@@ -177,7 +177,7 @@ class SingleSendSendTo(BaseModel):
 
 class SingleSend(BaseModel):
     """A SendGrid single send"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -192,20 +192,20 @@ class SingleSend(BaseModel):
 
 class SingleSendsListMetadata(BaseModel):
     """Nested schema for SingleSendsList._metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None | None = Field(default=None)
 
 class SingleSendsList(BaseModel):
     """Response containing a list of single sends"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     result: list[SingleSend] | None = Field(default=None)
     metadata: SingleSendsListMetadata | None = Field(default=None, alias="_metadata")
 
 class Template(BaseModel):
     """A SendGrid transactional template"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -215,20 +215,20 @@ class Template(BaseModel):
 
 class TemplatesListMetadata(BaseModel):
     """Nested schema for TemplatesList._metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None | None = Field(default=None)
 
 class TemplatesList(BaseModel):
     """Response containing a list of templates"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     templates: list[Template] | None = Field(default=None)
     metadata: TemplatesListMetadata | None = Field(default=None, alias="_metadata")
 
 class SingleSendStatsStats(BaseModel):
     """Email statistics for the single send"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bounce_drops: int | None = Field(default=None)
     bounces: int | None = Field(default=None)
@@ -245,7 +245,7 @@ class SingleSendStatsStats(BaseModel):
 
 class SingleSendStats(BaseModel):
     """Stats for a single send"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     ab_phase: str | None = Field(default=None)
@@ -255,20 +255,20 @@ class SingleSendStats(BaseModel):
 
 class SingleSendStatsListMetadata(BaseModel):
     """Nested schema for SingleSendStatsList._metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None | None = Field(default=None)
 
 class SingleSendStatsList(BaseModel):
     """Response containing a list of single send stats"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     results: list[SingleSendStats] | None = Field(default=None)
     metadata: SingleSendStatsListMetadata | None = Field(default=None, alias="_metadata")
 
 class Bounce(BaseModel):
     """A bounced email record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created: int | None = Field(default=None)
     email: str | None = Field(default=None)
@@ -277,7 +277,7 @@ class Bounce(BaseModel):
 
 class Block(BaseModel):
     """A blocked email record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created: int | None = Field(default=None)
     email: str | None = Field(default=None)
@@ -286,7 +286,7 @@ class Block(BaseModel):
 
 class SpamReport(BaseModel):
     """A spam report record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created: int | None = Field(default=None)
     email: str | None = Field(default=None)
@@ -294,7 +294,7 @@ class SpamReport(BaseModel):
 
 class InvalidEmail(BaseModel):
     """An invalid email record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created: int | None = Field(default=None)
     email: str | None = Field(default=None)
@@ -302,14 +302,14 @@ class InvalidEmail(BaseModel):
 
 class GlobalSuppression(BaseModel):
     """A globally suppressed email address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     created: int | None = Field(default=None)
     email: str | None = Field(default=None)
 
 class SuppressionGroup(BaseModel):
     """A suppression (unsubscribe) group"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -319,7 +319,7 @@ class SuppressionGroup(BaseModel):
 
 class SuppressionGroupMember(BaseModel):
     """A member of a suppression group"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email: str | None = Field(default=None)
     group_id: int | None = Field(default=None)
@@ -331,74 +331,74 @@ class SuppressionGroupMember(BaseModel):
 
 class ContactsListResultMeta(BaseModel):
     """Metadata for contacts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
     contact_count: int | None = Field(default=None)
 
 class ListsListResultMeta(BaseModel):
     """Metadata for lists.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class SinglesendsListResultMeta(BaseModel):
     """Metadata for singlesends.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class TemplatesListResultMeta(BaseModel):
     """Metadata for templates.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class SinglesendStatsListResultMeta(BaseModel):
     """Metadata for singlesend_stats.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class BouncesListResultMeta(BaseModel):
     """Metadata for bounces.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class BlocksListResultMeta(BaseModel):
     """Metadata for blocks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class SpamReportsListResultMeta(BaseModel):
     """Metadata for spam_reports.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class InvalidEmailsListResultMeta(BaseModel):
     """Metadata for invalid_emails.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class GlobalSuppressionsListResultMeta(BaseModel):
     """Metadata for global_suppressions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class SuppressionGroupMembersListResultMeta(BaseModel):
     """Metadata for suppression_group_members.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
@@ -455,7 +455,7 @@ D = TypeVar('D')
 
 class BouncesSearchData(BaseModel):
     """Search result data for bounces entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created: int | None = None
     """Unix timestamp when the bounce occurred"""
@@ -469,7 +469,7 @@ class BouncesSearchData(BaseModel):
 
 class BlocksSearchData(BaseModel):
     """Search result data for blocks entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created: int | None = None
     """Unix timestamp when the block occurred"""
@@ -483,7 +483,7 @@ class BlocksSearchData(BaseModel):
 
 class CampaignsSearchData(BaseModel):
     """Search result data for campaigns entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     channels: list[Any] | None = None
     """Channels for this campaign"""
@@ -503,7 +503,7 @@ class CampaignsSearchData(BaseModel):
 
 class ContactsSearchData(BaseModel):
     """Search result data for contacts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     address_line_1: str | None = None
     """Address line 1"""
@@ -549,7 +549,7 @@ class ContactsSearchData(BaseModel):
 
 class GlobalSuppressionsSearchData(BaseModel):
     """Search result data for global_suppressions entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created: int | None = None
     """Unix timestamp when the global suppression was created"""
@@ -559,7 +559,7 @@ class GlobalSuppressionsSearchData(BaseModel):
 
 class InvalidEmailsSearchData(BaseModel):
     """Search result data for invalid_emails entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created: int | None = None
     """Unix timestamp when the invalid email was recorded"""
@@ -571,7 +571,7 @@ class InvalidEmailsSearchData(BaseModel):
 
 class ListsSearchData(BaseModel):
     """Search result data for lists entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     metadata: dict[str, Any] | None = None
     """Metadata about the list resource"""
@@ -585,7 +585,7 @@ class ListsSearchData(BaseModel):
 
 class SegmentsSearchData(BaseModel):
     """Search result data for segments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     contacts_count: int | None = None
     """Number of contacts in the segment"""
@@ -611,7 +611,7 @@ class SegmentsSearchData(BaseModel):
 
 class SinglesendStatsSearchData(BaseModel):
     """Search result data for singlesend_stats entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ab_phase: str | None = None
     """The A/B test phase"""
@@ -627,7 +627,7 @@ class SinglesendStatsSearchData(BaseModel):
 
 class SinglesendsSearchData(BaseModel):
     """Search result data for singlesends entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     categories: list[Any] | None = None
     """Categories associated with this single send"""
@@ -649,7 +649,7 @@ class SinglesendsSearchData(BaseModel):
 
 class SuppressionGroupMembersSearchData(BaseModel):
     """Search result data for suppression_group_members entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: int | None = None
     """Unix timestamp when the suppression was created"""
@@ -663,7 +663,7 @@ class SuppressionGroupMembersSearchData(BaseModel):
 
 class SuppressionGroupsSearchData(BaseModel):
     """Search result data for suppression_groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     description: str | None = None
     """Description of the suppression group"""
@@ -679,7 +679,7 @@ class SuppressionGroupsSearchData(BaseModel):
 
 class TemplatesSearchData(BaseModel):
     """Search result data for templates entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     generation: str | None = None
     """Template generation (legacy or dynamic)"""
@@ -697,7 +697,7 @@ class TemplatesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -709,7 +709,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
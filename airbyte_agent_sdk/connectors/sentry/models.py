@@ -36,7 +36,7 @@ class SentryReplicationConfig(BaseModel):
 
 class ProjectOrganization(BaseModel):
     """Organization this project belongs to."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -44,7 +44,7 @@ class ProjectOrganization(BaseModel):
 
 class ProjectAvatar(BaseModel):
     """Project avatar information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     avatar_type: str | None | None = Field(default=None, alias="avatarType")
     avatar_uuid: str | None | None = Field(default=None, alias="avatarUuid")
@@ -52,7 +52,7 @@ class ProjectAvatar(BaseModel):
 
 class Project(BaseModel):
     """A Sentry project (summary view from list endpoint)."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -95,7 +95,7 @@ class Project(BaseModel):
 
 class ProjectDetailTeamsItem(BaseModel):
     """Nested schema for ProjectDetail.teams_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -103,7 +103,7 @@ class ProjectDetailTeamsItem(BaseModel):
 
 class ProjectDetailOrganization(BaseModel):
     """Organization this project belongs to."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -111,7 +111,7 @@ class ProjectDetailOrganization(BaseModel):
 
 class ProjectDetailAvatar(BaseModel):
     """Project avatar information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     avatar_type: str | None | None = Field(default=None, alias="avatarType")
     avatar_uuid: str | None | None = Field(default=None, alias="avatarUuid")
@@ -119,7 +119,7 @@ class ProjectDetailAvatar(BaseModel):
 
 class ProjectDetailTeam(BaseModel):
     """Primary team for this project."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -127,7 +127,7 @@ class ProjectDetailTeam(BaseModel):
 
 class ProjectDetail(BaseModel):
     """Detailed project information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -211,7 +211,7 @@ class ProjectDetail(BaseModel):
 
 class IssueProject(BaseModel):
     """Project this issue belongs to."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -219,7 +219,7 @@ class IssueProject(BaseModel):
 
 class IssueMetadata(BaseModel):
     """Issue metadata."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str | None | None = Field(default=None)
     type_: str | None | None = Field(default=None, alias="type")
@@ -228,7 +228,7 @@ class IssueMetadata(BaseModel):
 
 class Issue(BaseModel):
     """A Sentry issue (group of similar events)."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     title: str | None = Field(default=None)
@@ -264,7 +264,7 @@ class Issue(BaseModel):
 
 class EventUser(BaseModel):
     """User associated with the event."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     email: str | None | None = Field(default=None)
@@ -274,27 +274,27 @@ class EventUser(BaseModel):
 
 class EventTagsItem(BaseModel):
     """Nested schema for Event.tags_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     key: str | None | None = Field(default=None)
     value: str | None | None = Field(default=None)
 
 class EventGroupingconfig(BaseModel):
     """Grouping configuration."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     enhancements: str | None | None = Field(default=None)
 
 class EventMetadata(BaseModel):
     """Event metadata."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str | None | None = Field(default=None)
 
 class Event(BaseModel):
     """A Sentry event (individual error occurrence)."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     event_id: str | None = Field(default=None, alias="eventID")
@@ -327,7 +327,7 @@ class Event(BaseModel):
 
 class ReleaseVersioninfoVersion(BaseModel):
     """Nested schema for ReleaseVersioninfo.version"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     raw: str | None | None = Field(default=None)
     major: int | None | None = Field(default=None)
@@ -339,7 +339,7 @@ class ReleaseVersioninfoVersion(BaseModel):
 
 class ReleaseVersioninfo(BaseModel):
     """Parsed version information."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     version: ReleaseVersioninfoVersion | None | None = Field(default=None)
     description: str | None | None = Field(default=None)
@@ -348,14 +348,14 @@ class ReleaseVersioninfo(BaseModel):
 
 class ReleaseAuthorsItem(BaseModel):
     """Nested schema for Release.authors_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None | None = Field(default=None)
     email: str | None | None = Field(default=None)
 
 class ReleaseProjectsItem(BaseModel):
     """Nested schema for Release.projects_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -366,7 +366,7 @@ class ReleaseProjectsItem(BaseModel):
 
 class Release(BaseModel):
     """A Sentry release."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     version: str | None = Field(default=None)
@@ -396,25 +396,25 @@ class Release(BaseModel):
 
 class ProjectsListResultMeta(BaseModel):
     """Metadata for projects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class IssuesListResultMeta(BaseModel):
     """Metadata for issues.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class EventsListResultMeta(BaseModel):
     """Metadata for events.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ReleasesListResultMeta(BaseModel):
     """Metadata for releases.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
@@ -471,7 +471,7 @@ D = TypeVar('D')
 
 class EventsSearchData(BaseModel):
     """Search result data for events entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     meta: dict[str, Any] | None = None
     """Meta information for data scrubbing."""
@@ -535,7 +535,7 @@ class EventsSearchData(BaseModel):
 
 class IssuesSearchData(BaseModel):
     """Search result data for issues entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     annotations: list[Any] | None = None
     """Annotations on the issue."""
@@ -603,7 +603,7 @@ class IssuesSearchData(BaseModel):
 
 class ProjectsSearchData(BaseModel):
     """Search result data for projects entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     access: list[Any] | None = None
     """List of access permissions for the authenticated user."""
@@ -661,7 +661,7 @@ class ProjectsSearchData(BaseModel):
 
 class ReleasesSearchData(BaseModel):
     """Search result data for releases entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     authors: list[Any] | None = None
     """Authors of commits in this release."""
@@ -713,7 +713,7 @@ class ReleasesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -725,7 +725,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -21,6 +21,7 @@ from airbyte_agent_sdk.schema.security import (
 )
 from airbyte_agent_sdk.schema.extensions import (
     EntityRelationshipConfig,
+    RateLimitConfig,
 )
 from airbyte_agent_sdk.schema.base import (
     ExampleQuestions,
@@ -12981,6 +12982,11 @@ ShopifyConnectorModel: ConnectorModel = ConnectorModel(
             ],
         ),
     ],
+    rate_limit=RateLimitConfig(
+        requests=2,
+        burst=40,
+        usage_header='X-Shopify-Shop-Api-Call-Limit',
+    ),
     search_field_paths={
         'abandoned_checkouts': [
             'id',
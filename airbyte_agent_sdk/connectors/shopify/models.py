@@ -24,7 +24,7 @@ class ShopifyAuthConfig(BaseModel):
 
 class CustomerAddress(BaseModel):
     """A customer address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     customer_id: int | None = Field(default=None)
@@ -46,7 +46,7 @@ class CustomerAddress(BaseModel):
 
 class Customer(BaseModel):
     """A Shopify customer"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     email: str | None = Field(default=None)
@@ -78,19 +78,19 @@ class Customer(BaseModel):
 
 class CustomerList(BaseModel):
     """CustomerList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     customers: list[Customer] | None = Field(default=None)
 
 class CustomerAddressList(BaseModel):
     """CustomerAddressList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     addresses: list[CustomerAddress] | None = Field(default=None)
 
 class MarketingConsent(BaseModel):
     """MarketingConsent type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     state: str | None = Field(default=None)
     opt_in_level: str | None = Field(default=None)
@@ -99,7 +99,7 @@ class MarketingConsent(BaseModel):
 
 class OrderAddress(BaseModel):
     """An address in an order (shipping or billing) - does not have id field"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first_name: str | None = Field(default=None)
     last_name: str | None = Field(default=None)
@@ -119,7 +119,7 @@ class OrderAddress(BaseModel):
 
 class Transaction(BaseModel):
     """An order transaction"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     order_id: int | None = Field(default=None)
@@ -148,7 +148,7 @@ class Transaction(BaseModel):
 
 class Refund(BaseModel):
     """An order refund"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     order_id: int | None = Field(default=None)
@@ -168,7 +168,7 @@ class Refund(BaseModel):
 
 class LineItem(BaseModel):
     """LineItem type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     admin_graphql_api_id: str | None = Field(default=None)
@@ -202,7 +202,7 @@ class LineItem(BaseModel):
 
 class Fulfillment(BaseModel):
     """A fulfillment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     order_id: int | None = Field(default=None)
@@ -225,7 +225,7 @@ class Fulfillment(BaseModel):
 
 class Order(BaseModel):
     """A Shopify order"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     admin_graphql_api_id: str | None = Field(default=None)
@@ -323,13 +323,13 @@ class Order(BaseModel):
 
 class OrderList(BaseModel):
     """OrderList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     orders: list[Order] | None = Field(default=None)
 
 class ProductImage(BaseModel):
     """A product image"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     product_id: int | None = Field(default=None)
@@ -345,7 +345,7 @@ class ProductImage(BaseModel):
 
 class ProductVariant(BaseModel):
     """A product variant"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     product_id: int | None = Field(default=None)
@@ -376,7 +376,7 @@ class ProductVariant(BaseModel):
 
 class Product(BaseModel):
     """A Shopify product"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     title: str | None = Field(default=None)
@@ -399,25 +399,25 @@ class Product(BaseModel):
 
 class ProductList(BaseModel):
     """ProductList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     products: list[Product] | None = Field(default=None)
 
 class ProductVariantList(BaseModel):
     """ProductVariantList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     variants: list[ProductVariant] | None = Field(default=None)
 
 class ProductImageList(BaseModel):
     """ProductImageList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     images: list[ProductImage] | None = Field(default=None)
 
 class AbandonedCheckout(BaseModel):
     """An abandoned checkout"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     token: str | None = Field(default=None)
@@ -467,13 +467,13 @@ class AbandonedCheckout(BaseModel):
 
 class AbandonedCheckoutList(BaseModel):
     """AbandonedCheckoutList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     checkouts: list[AbandonedCheckout] | None = Field(default=None)
 
 class Location(BaseModel):
     """A store location"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -497,13 +497,13 @@ class Location(BaseModel):
 
 class LocationList(BaseModel):
     """LocationList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     locations: list[Location] | None = Field(default=None)
 
 class InventoryLevel(BaseModel):
     """An inventory level"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     inventory_item_id: int | None = Field(default=None)
     location_id: int | None = Field(default=None)
@@ -513,13 +513,13 @@ class InventoryLevel(BaseModel):
 
 class InventoryLevelList(BaseModel):
     """InventoryLevelList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     inventory_levels: list[InventoryLevel] | None = Field(default=None)
 
 class InventoryItem(BaseModel):
     """An inventory item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     sku: str | None = Field(default=None)
@@ -536,13 +536,13 @@ class InventoryItem(BaseModel):
 
 class InventoryItemList(BaseModel):
     """InventoryItemList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     inventory_items: list[InventoryItem] | None = Field(default=None)
 
 class Shop(BaseModel):
     """Shop configuration"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -601,7 +601,7 @@ class Shop(BaseModel):
 
 class PriceRule(BaseModel):
     """A price rule"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     value_type: str | None = Field(default=None)
@@ -636,13 +636,13 @@ class PriceRule(BaseModel):
 
 class PriceRuleList(BaseModel):
     """PriceRuleList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     price_rules: list[PriceRule] | None = Field(default=None)
 
 class DiscountCode(BaseModel):
     """A discount code"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     price_rule_id: int | None = Field(default=None)
@@ -653,13 +653,13 @@ class DiscountCode(BaseModel):
 
 class DiscountCodeList(BaseModel):
     """DiscountCodeList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     discount_codes: list[DiscountCode] | None = Field(default=None)
 
 class CustomCollection(BaseModel):
     """A custom collection"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     handle: str | None = Field(default=None)
@@ -676,13 +676,13 @@ class CustomCollection(BaseModel):
 
 class CustomCollectionList(BaseModel):
     """CustomCollectionList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     custom_collections: list[CustomCollection] | None = Field(default=None)
 
 class SmartCollection(BaseModel):
     """A smart collection"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     handle: str | None = Field(default=None)
@@ -701,13 +701,13 @@ class SmartCollection(BaseModel):
 
 class SmartCollectionList(BaseModel):
     """SmartCollectionList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     smart_collections: list[SmartCollection] | None = Field(default=None)
 
 class Collect(BaseModel):
     """A collect (product-collection link)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     collection_id: int | None = Field(default=None)
@@ -719,13 +719,13 @@ class Collect(BaseModel):
 
 class CollectList(BaseModel):
     """CollectList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     collects: list[Collect] | None = Field(default=None)
 
 class DraftOrder(BaseModel):
     """A draft order"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     note: str | None = Field(default=None)
@@ -762,19 +762,19 @@ class DraftOrder(BaseModel):
 
 class DraftOrderList(BaseModel):
     """DraftOrderList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     draft_orders: list[DraftOrder] | None = Field(default=None)
 
 class FulfillmentList(BaseModel):
     """FulfillmentList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     fulfillments: list[Fulfillment] | None = Field(default=None)
 
 class FulfillmentOrder(BaseModel):
     """A fulfillment order"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     shop_id: int | None = Field(default=None)
@@ -797,25 +797,25 @@ class FulfillmentOrder(BaseModel):
 
 class FulfillmentOrderList(BaseModel):
     """FulfillmentOrderList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     fulfillment_orders: list[FulfillmentOrder] | None = Field(default=None)
 
 class RefundList(BaseModel):
     """RefundList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     refunds: list[Refund] | None = Field(default=None)
 
 class TransactionList(BaseModel):
     """TransactionList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     transactions: list[Transaction] | None = Field(default=None)
 
 class TenderTransaction(BaseModel):
     """A tender transaction"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     order_id: int | None = Field(default=None)
@@ -830,13 +830,13 @@ class TenderTransaction(BaseModel):
 
 class TenderTransactionList(BaseModel):
     """TenderTransactionList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     tender_transactions: list[TenderTransaction] | None = Field(default=None)
 
 class Country(BaseModel):
     """A country"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -847,13 +847,13 @@ class Country(BaseModel):
 
 class CountryList(BaseModel):
     """CountryList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     countries: list[Country] | None = Field(default=None)
 
 class Metafield(BaseModel):
     """A metafield"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     namespace: str | None = Field(default=None)
@@ -869,7 +869,7 @@ class Metafield(BaseModel):
 
 class MetafieldList(BaseModel):
     """MetafieldList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     metafields: list[Metafield] | None = Field(default=None)
 
@@ -878,187 +878,187 @@ class MetafieldList(BaseModel):
 
 class CustomersListResultMeta(BaseModel):
     """Metadata for customers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class OrdersListResultMeta(BaseModel):
     """Metadata for orders.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class ProductsListResultMeta(BaseModel):
     """Metadata for products.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class ProductVariantsListResultMeta(BaseModel):
     """Metadata for product_variants.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class ProductImagesListResultMeta(BaseModel):
     """Metadata for product_images.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class AbandonedCheckoutsListResultMeta(BaseModel):
     """Metadata for abandoned_checkouts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class LocationsListResultMeta(BaseModel):
     """Metadata for locations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class InventoryLevelsListResultMeta(BaseModel):
     """Metadata for inventory_levels.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class InventoryItemsListResultMeta(BaseModel):
     """Metadata for inventory_items.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class PriceRulesListResultMeta(BaseModel):
     """Metadata for price_rules.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class DiscountCodesListResultMeta(BaseModel):
     """Metadata for discount_codes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class CustomCollectionsListResultMeta(BaseModel):
     """Metadata for custom_collections.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class SmartCollectionsListResultMeta(BaseModel):
     """Metadata for smart_collections.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class CollectsListResultMeta(BaseModel):
     """Metadata for collects.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class DraftOrdersListResultMeta(BaseModel):
     """Metadata for draft_orders.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class FulfillmentsListResultMeta(BaseModel):
     """Metadata for fulfillments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class OrderRefundsListResultMeta(BaseModel):
     """Metadata for order_refunds.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class TransactionsListResultMeta(BaseModel):
     """Metadata for transactions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class TenderTransactionsListResultMeta(BaseModel):
     """Metadata for tender_transactions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class CountriesListResultMeta(BaseModel):
     """Metadata for countries.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class MetafieldShopsListResultMeta(BaseModel):
     """Metadata for metafield_shops.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class MetafieldCustomersListResultMeta(BaseModel):
     """Metadata for metafield_customers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class MetafieldProductsListResultMeta(BaseModel):
     """Metadata for metafield_products.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class MetafieldOrdersListResultMeta(BaseModel):
     """Metadata for metafield_orders.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class MetafieldDraftOrdersListResultMeta(BaseModel):
     """Metadata for metafield_draft_orders.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class MetafieldLocationsListResultMeta(BaseModel):
     """Metadata for metafield_locations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class MetafieldProductVariantsListResultMeta(BaseModel):
     """Metadata for metafield_product_variants.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class MetafieldSmartCollectionsListResultMeta(BaseModel):
     """Metadata for metafield_smart_collections.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class MetafieldProductImagesListResultMeta(BaseModel):
     """Metadata for metafield_product_images.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class CustomerAddressListResultMeta(BaseModel):
     """Metadata for customer_address.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
 class FulfillmentOrdersListResultMeta(BaseModel):
     """Metadata for fulfillment_orders.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_url: str | None = Field(default=None)
 
@@ -1115,7 +1115,7 @@ D = TypeVar('D')
 
 class AbandonedCheckoutsSearchData(BaseModel):
     """Search result data for abandoned_checkouts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the abandoned checkout"""
@@ -1141,7 +1141,7 @@ class AbandonedCheckoutsSearchData(BaseModel):
 
 class CollectsSearchData(BaseModel):
     """Search result data for collects entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the collect"""
@@ -1159,7 +1159,7 @@ class CollectsSearchData(BaseModel):
 
 class CountriesSearchData(BaseModel):
     """Search result data for countries entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the country tax row"""
@@ -1173,7 +1173,7 @@ class CountriesSearchData(BaseModel):
 
 class CustomCollectionsSearchData(BaseModel):
     """Search result data for custom_collections entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the custom collection"""
@@ -1193,7 +1193,7 @@ class CustomCollectionsSearchData(BaseModel):
 
 class CustomersSearchData(BaseModel):
     """Search result data for customers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the customer"""
@@ -1221,7 +1221,7 @@ class CustomersSearchData(BaseModel):
 
 class DiscountCodesSearchData(BaseModel):
     """Search result data for discount_codes entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the discount code"""
@@ -1239,7 +1239,7 @@ class DiscountCodesSearchData(BaseModel):
 
 class DraftOrdersSearchData(BaseModel):
     """Search result data for draft_orders entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the draft order"""
@@ -1265,7 +1265,7 @@ class DraftOrdersSearchData(BaseModel):
 
 class FulfillmentOrdersSearchData(BaseModel):
     """Search result data for fulfillment_orders entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the fulfillment order"""
@@ -1287,7 +1287,7 @@ class FulfillmentOrdersSearchData(BaseModel):
 
 class FulfillmentsSearchData(BaseModel):
     """Search result data for fulfillments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the fulfillment"""
@@ -1311,7 +1311,7 @@ class FulfillmentsSearchData(BaseModel):
 
 class InventoryItemsSearchData(BaseModel):
     """Search result data for inventory_items entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the inventory item"""
@@ -1331,7 +1331,7 @@ class InventoryItemsSearchData(BaseModel):
 
 class InventoryLevelsSearchData(BaseModel):
     """Search result data for inventory_levels entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     inventory_item_id: int | None = None
     """Identifier of the inventory item"""
@@ -1345,7 +1345,7 @@ class InventoryLevelsSearchData(BaseModel):
 
 class LocationsSearchData(BaseModel):
     """Search result data for locations entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the location"""
@@ -1373,7 +1373,7 @@ class LocationsSearchData(BaseModel):
 
 class MetafieldCustomersSearchData(BaseModel):
     """Search result data for metafield_customers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the metafield"""
@@ -1399,7 +1399,7 @@ class MetafieldCustomersSearchData(BaseModel):
 
 class MetafieldDraftOrdersSearchData(BaseModel):
     """Search result data for metafield_draft_orders entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the metafield"""
@@ -1425,7 +1425,7 @@ class MetafieldDraftOrdersSearchData(BaseModel):
 
 class MetafieldLocationsSearchData(BaseModel):
     """Search result data for metafield_locations entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the metafield"""
@@ -1451,7 +1451,7 @@ class MetafieldLocationsSearchData(BaseModel):
 
 class MetafieldOrdersSearchData(BaseModel):
     """Search result data for metafield_orders entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the metafield"""
@@ -1477,7 +1477,7 @@ class MetafieldOrdersSearchData(BaseModel):
 
 class MetafieldProductImagesSearchData(BaseModel):
     """Search result data for metafield_product_images entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the metafield"""
@@ -1503,7 +1503,7 @@ class MetafieldProductImagesSearchData(BaseModel):
 
 class MetafieldProductVariantsSearchData(BaseModel):
     """Search result data for metafield_product_variants entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the metafield"""
@@ -1529,7 +1529,7 @@ class MetafieldProductVariantsSearchData(BaseModel):
 
 class MetafieldProductsSearchData(BaseModel):
     """Search result data for metafield_products entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the metafield"""
@@ -1555,7 +1555,7 @@ class MetafieldProductsSearchData(BaseModel):
 
 class MetafieldShopsSearchData(BaseModel):
     """Search result data for metafield_shops entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the metafield"""
@@ -1581,7 +1581,7 @@ class MetafieldShopsSearchData(BaseModel):
 
 class MetafieldSmartCollectionsSearchData(BaseModel):
     """Search result data for metafield_smart_collections entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the metafield"""
@@ -1607,7 +1607,7 @@ class MetafieldSmartCollectionsSearchData(BaseModel):
 
 class OrderRefundsSearchData(BaseModel):
     """Search result data for order_refunds entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the refund"""
@@ -1625,7 +1625,7 @@ class OrderRefundsSearchData(BaseModel):
 
 class PriceRulesSearchData(BaseModel):
     """Search result data for price_rules entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the price rule"""
@@ -1653,7 +1653,7 @@ class PriceRulesSearchData(BaseModel):
 
 class ProductImagesSearchData(BaseModel):
     """Search result data for product_images entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the product image"""
@@ -1677,7 +1677,7 @@ class ProductImagesSearchData(BaseModel):
 
 class ProductVariantsSearchData(BaseModel):
     """Search result data for product_variants entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the product variant"""
@@ -1703,7 +1703,7 @@ class ProductVariantsSearchData(BaseModel):
 
 class ShopSearchData(BaseModel):
     """Search result data for shop entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the shop"""
@@ -1731,7 +1731,7 @@ class ShopSearchData(BaseModel):
 
 class SmartCollectionsSearchData(BaseModel):
     """Search result data for smart_collections entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the smart collection"""
@@ -1751,7 +1751,7 @@ class SmartCollectionsSearchData(BaseModel):
 
 class TenderTransactionsSearchData(BaseModel):
     """Search result data for tender_transactions entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier for the tender transaction"""
@@ -1775,7 +1775,7 @@ class TenderTransactionsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1787,7 +1787,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -53,7 +53,7 @@ class SlackReplicationConfig(BaseModel):
 
 class User(BaseModel):
     """Slack user object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     team_id: str | None = Field(default=None)
@@ -78,7 +78,7 @@ class User(BaseModel):
 
 class UserProfile(BaseModel):
     """User profile information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     title: str | None = Field(default=None)
     phone: str | None = Field(default=None)
@@ -104,13 +104,13 @@ class UserProfile(BaseModel):
 
 class ResponseMetadata(BaseModel):
     """Response metadata including pagination"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class UsersListResponse(BaseModel):
     """Response containing list of users"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     members: list[User] | None = Field(default=None)
@@ -119,14 +119,14 @@ class UsersListResponse(BaseModel):
 
 class UserResponse(BaseModel):
     """Response containing single user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     user: User | None = Field(default=None)
 
 class Channel(BaseModel):
     """Slack channel object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -162,7 +162,7 @@ class Channel(BaseModel):
 
 class ChannelTopic(BaseModel):
     """Channel topic information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     value: str | None = Field(default=None)
     creator: str | None = Field(default=None)
@@ -170,7 +170,7 @@ class ChannelTopic(BaseModel):
 
 class ChannelPurpose(BaseModel):
     """Channel purpose information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     value: str | None = Field(default=None)
     creator: str | None = Field(default=None)
@@ -178,7 +178,7 @@ class ChannelPurpose(BaseModel):
 
 class ChannelsListResponse(BaseModel):
     """Response containing list of channels"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channels: list[Channel] | None = Field(default=None)
@@ -186,14 +186,14 @@ class ChannelsListResponse(BaseModel):
 
 class ChannelResponse(BaseModel):
     """Response containing single channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channel: Channel | None = Field(default=None)
 
 class Reaction(BaseModel):
     """Message reaction"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     users: list[str] | None = Field(default=None)
@@ -201,7 +201,7 @@ class Reaction(BaseModel):
 
 class Attachment(BaseModel):
     """Message attachment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     fallback: str | None = Field(default=None)
@@ -222,7 +222,7 @@ class Attachment(BaseModel):
 
 class File(BaseModel):
     """File object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -246,7 +246,7 @@ class File(BaseModel):
 
 class Message(BaseModel):
     """Slack message object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     subtype: str | None = Field(default=None)
@@ -272,7 +272,7 @@ class Message(BaseModel):
 
 class Thread(BaseModel):
     """Slack thread reply message object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     subtype: str | None = Field(default=None)
@@ -299,14 +299,14 @@ class Thread(BaseModel):
 
 class EditedInfo(BaseModel):
     """Message edit information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user: str | None = Field(default=None)
     ts: str | None = Field(default=None)
 
 class BotProfile(BaseModel):
     """Bot profile information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     deleted: bool | None = Field(default=None)
@@ -317,7 +317,7 @@ class BotProfile(BaseModel):
 
 class MessagesListResponse(BaseModel):
     """Response containing list of messages"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     messages: list[Message] | None = Field(default=None)
@@ -327,7 +327,7 @@ class MessagesListResponse(BaseModel):
 
 class ThreadRepliesResponse(BaseModel):
     """Response containing thread replies"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     messages: list[Thread] | None = Field(default=None)
@@ -336,7 +336,7 @@ class ThreadRepliesResponse(BaseModel):
 
 class MessageCreateParams(BaseModel):
     """Parameters for creating a message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     text: str
@@ -347,7 +347,7 @@ class MessageCreateParams(BaseModel):
 
 class CreatedMessage(BaseModel):
     """A message object returned from create/update operations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     subtype: str | None = Field(default=None)
@@ -361,7 +361,7 @@ class CreatedMessage(BaseModel):
 
 class MessageCreateResponse(BaseModel):
     """Response from creating a message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channel: str | None = Field(default=None)
@@ -370,7 +370,7 @@ class MessageCreateResponse(BaseModel):
 
 class MessageUpdateParams(BaseModel):
     """Parameters for updating a message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     ts: str
@@ -378,7 +378,7 @@ class MessageUpdateParams(BaseModel):
 
 class MessageUpdateResponse(BaseModel):
     """Response from updating a message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channel: str | None = Field(default=None)
@@ -388,63 +388,63 @@ class MessageUpdateResponse(BaseModel):
 
 class ChannelCreateParams(BaseModel):
     """Parameters for creating a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     is_private: bool | None = Field(default=None)
 
 class ChannelCreateResponse(BaseModel):
     """Response from creating a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channel: Channel | None = Field(default=None)
 
 class ChannelRenameParams(BaseModel):
     """Parameters for renaming a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     name: str
 
 class ChannelRenameResponse(BaseModel):
     """Response from renaming a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channel: Channel | None = Field(default=None)
 
 class ChannelTopicParams(BaseModel):
     """Parameters for setting channel topic"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     topic: str
 
 class ChannelTopicResponse(BaseModel):
     """Response from setting channel topic"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channel: Channel | None = Field(default=None)
 
 class ChannelPurposeParams(BaseModel):
     """Parameters for setting channel purpose"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     purpose: str
 
 class ChannelPurposeResponse(BaseModel):
     """Response from setting channel purpose"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channel: Channel | None = Field(default=None)
 
 class ChannelInviteParams(BaseModel):
     """Parameters for inviting users to a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     users: str
@@ -452,14 +452,14 @@ class ChannelInviteParams(BaseModel):
 
 class ChannelInviteResponse(BaseModel):
     """Response from inviting users to a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channel: Channel | None = Field(default=None)
 
 class ReactionAddParams(BaseModel):
     """Parameters for adding a reaction"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     timestamp: str
@@ -467,13 +467,13 @@ class ReactionAddParams(BaseModel):
 
 class ReactionAddResponse(BaseModel):
     """Response from adding a reaction"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
 
 class ReactionRemoveParams(BaseModel):
     """Parameters for removing a reaction from a message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     timestamp: str
@@ -481,13 +481,13 @@ class ReactionRemoveParams(BaseModel):
 
 class ReactionRemoveResponse(BaseModel):
     """Response from removing a reaction"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
 
 class EphemeralMessageCreateParams(BaseModel):
     """Parameters for sending an ephemeral message visible only to one user"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     user: str
@@ -497,14 +497,14 @@ class EphemeralMessageCreateParams(BaseModel):
 
 class EphemeralMessageCreateResponse(BaseModel):
     """Response from sending an ephemeral message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     message_ts: str | None = Field(default=None)
 
 class ScheduledMessageCreateParams(BaseModel):
     """Parameters for scheduling a message for future delivery"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     text: str
@@ -516,7 +516,7 @@ class ScheduledMessageCreateParams(BaseModel):
 
 class ScheduledMessageCreateResponse(BaseModel):
     """Response from scheduling a message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channel: str | None = Field(default=None)
@@ -526,7 +526,7 @@ class ScheduledMessageCreateResponse(BaseModel):
 
 class ScheduledMessageContent(BaseModel):
     """Content of a scheduled message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     text: str | None = Field(default=None)
     username: str | None = Field(default=None)
@@ -542,14 +542,14 @@ class ScheduledMessageContent(BaseModel):
 
 class MessageDeleteParams(BaseModel):
     """Parameters for deleting a message. Bot tokens can only delete messages posted by the bot."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     ts: str
 
 class MessageDeleteResponse(BaseModel):
     """Response from deleting a message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     channel: str | None = Field(default=None)
@@ -557,46 +557,46 @@ class MessageDeleteResponse(BaseModel):
 
 class ChannelArchiveParams(BaseModel):
     """Parameters for archiving a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
 
 class ChannelArchiveResponse(BaseModel):
     """Response from archiving a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
 
 class ChannelKickParams(BaseModel):
     """Parameters for removing a user from a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     user: str
 
 class ChannelKickResponse(BaseModel):
     """Response from removing a user from a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     errors: dict[str, Any] | None = Field(default=None)
 
 class PinAddParams(BaseModel):
     """Parameters for pinning a message to a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel: str
     timestamp: str
 
 class PinAddResponse(BaseModel):
     """Response from pinning a message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
 
 class BookmarkAddParams(BaseModel):
     """Parameters for adding a bookmark to a channel"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     channel_id: str
     title: str
@@ -606,7 +606,7 @@ class BookmarkAddParams(BaseModel):
 
 class Bookmark(BaseModel):
     """A channel bookmark"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     channel_id: str | None = Field(default=None)
@@ -626,7 +626,7 @@ class Bookmark(BaseModel):
 
 class BookmarkAddResponse(BaseModel):
     """Response from adding a bookmark"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ok: bool | None = Field(default=None)
     bookmark: Bookmark | None = Field(default=None)
@@ -636,26 +636,26 @@ class BookmarkAddResponse(BaseModel):
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class ChannelsListResultMeta(BaseModel):
     """Metadata for channels.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
 
 class ChannelMessagesListResultMeta(BaseModel):
     """Metadata for channel_messages.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
 
 class ThreadsListResultMeta(BaseModel):
     """Metadata for threads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_cursor: str | None = Field(default=None)
     has_more: bool | None = Field(default=None)
@@ -713,7 +713,7 @@ D = TypeVar('D')
 
 class ChannelsSearchData(BaseModel):
     """Search result data for channels entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     context_team_id: str | None = None
     """The unique identifier of the team context in which the channel exists."""
@@ -781,7 +781,7 @@ class ChannelsSearchData(BaseModel):
 
 class ChannelMessagesSearchData(BaseModel):
     """Search result data for channel_messages entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     type_: str | None = None
     """Message type."""
@@ -823,7 +823,7 @@ class ChannelMessagesSearchData(BaseModel):
 
 class ThreadsSearchData(BaseModel):
     """Search result data for threads entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     type_: str | None = None
     """Message type."""
@@ -861,7 +861,7 @@ class ThreadsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     color: str | None = None
     """The color assigned to the user for visual purposes."""
@@ -915,7 +915,7 @@ class UsersSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -927,7 +927,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
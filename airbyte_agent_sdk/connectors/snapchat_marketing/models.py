@@ -38,14 +38,14 @@ class SnapchatMarketingReplicationConfig(BaseModel):
 
 class OrganizationConfigurationSettings(BaseModel):
     """Organization configuration settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     notifications_enabled: bool | None = Field(default=None, description="Whether notifications are enabled")
     """Whether notifications are enabled"""
 
 class Organization(BaseModel):
     """Snapchat organization object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -75,14 +75,14 @@ class Organization(BaseModel):
 
 class AdAccountRegulations(BaseModel):
     """Regulatory settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     restricted_delivery_signals: bool | None = Field(default=None, description="Whether restricted delivery signals are enabled")
     """Whether restricted delivery signals are enabled"""
 
 class AdAccount(BaseModel):
     """Snapchat ad account object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -103,14 +103,14 @@ class AdAccount(BaseModel):
 
 class CampaignObjectiveV2Properties(BaseModel):
     """Objective V2 properties for the campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     objective_v2_type: str | None = Field(default=None)
     is_auto_generated: bool | None = Field(default=None)
 
 class Campaign(BaseModel):
     """Snapchat campaign object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -128,7 +128,7 @@ class Campaign(BaseModel):
 
 class AdSquadSkadnetworkProperties(BaseModel):
     """SKAdNetwork properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ecid_enrollment_status: str | None = Field(default=None)
     enable_skoverlay: bool | None = Field(default=None)
@@ -136,26 +136,26 @@ class AdSquadSkadnetworkProperties(BaseModel):
 
 class AdSquadTargetingGeosItem(BaseModel):
     """Nested schema for AdSquadTargeting.geos_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     country_code: str | None = Field(default=None)
     operation: str | None = Field(default=None)
 
 class AdSquadTargetingAutoExpansionOptionsInterestExpansionOption(BaseModel):
     """Nested schema for AdSquadTargetingAutoExpansionOptions.interest_expansion_option"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None)
 
 class AdSquadTargetingAutoExpansionOptions(BaseModel):
     """Nested schema for AdSquadTargeting.auto_expansion_options"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     interest_expansion_option: AdSquadTargetingAutoExpansionOptionsInterestExpansionOption | None = Field(default=None)
 
 class AdSquadTargeting(BaseModel):
     """Targeting specification"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     regulated_content: bool | None = Field(default=None)
     geos: list[AdSquadTargetingGeosItem] | None = Field(default=None)
@@ -167,7 +167,7 @@ class AdSquadTargeting(BaseModel):
 
 class AdSquad(BaseModel):
     """Snapchat ad squad object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -200,7 +200,7 @@ class AdSquad(BaseModel):
 
 class Ad(BaseModel):
     """Snapchat ad object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -217,13 +217,13 @@ class Ad(BaseModel):
 
 class CreativeAdToPlaceProperties(BaseModel):
     """Ad-to-place properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     place_id: str | None = Field(default=None)
 
 class CreativeWebViewProperties(BaseModel):
     """Web view properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     allow_snap_javascript_sdk: bool | None = Field(default=None)
     block_preload: bool | None = Field(default=None)
@@ -233,7 +233,7 @@ class CreativeWebViewProperties(BaseModel):
 
 class Creative(BaseModel):
     """Snapchat creative object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -258,7 +258,7 @@ class Creative(BaseModel):
 
 class MediaImageMetadata(BaseModel):
     """Image-specific metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     height_px: int | None = Field(default=None)
     width_px: int | None = Field(default=None)
@@ -266,7 +266,7 @@ class MediaImageMetadata(BaseModel):
 
 class Media(BaseModel):
     """Snapchat media object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -288,7 +288,7 @@ class Media(BaseModel):
 
 class Segment(BaseModel):
     """Snapchat audience segment object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -311,49 +311,49 @@ class Segment(BaseModel):
 
 class OrganizationsListResultMeta(BaseModel):
     """Metadata for organizations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class AdaccountsListResultMeta(BaseModel):
     """Metadata for adaccounts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class AdsquadsListResultMeta(BaseModel):
     """Metadata for adsquads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class AdsListResultMeta(BaseModel):
     """Metadata for ads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class CreativesListResultMeta(BaseModel):
     """Metadata for creatives.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class MediaListResultMeta(BaseModel):
     """Metadata for media.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
 class SegmentsListResultMeta(BaseModel):
     """Metadata for segments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_link: str | None = Field(default=None)
 
@@ -410,7 +410,7 @@ D = TypeVar('D')
 
 class OrganizationsSearchData(BaseModel):
     """Search result data for organizations entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     accepted_term_version: str | None = None
     """Version of accepted terms"""
@@ -460,7 +460,7 @@ class OrganizationsSearchData(BaseModel):
 
 class AdaccountsSearchData(BaseModel):
     """Search result data for adaccounts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     advertiser_organization_id: str | None = None
     """Advertiser organization ID"""
@@ -498,7 +498,7 @@ class AdaccountsSearchData(BaseModel):
 
 class CampaignsSearchData(BaseModel):
     """Search result data for campaigns entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_account_id: str | None = None
     """Parent ad account ID"""
@@ -526,7 +526,7 @@ class CampaignsSearchData(BaseModel):
 
 class AdsquadsSearchData(BaseModel):
     """Search result data for adsquads entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     auto_bid: bool | None = None
     """Whether auto bidding is enabled"""
@@ -588,7 +588,7 @@ class AdsquadsSearchData(BaseModel):
 
 class AdsSearchData(BaseModel):
     """Search result data for ads entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_squad_id: str | None = None
     """Parent ad squad ID"""
@@ -618,7 +618,7 @@ class AdsSearchData(BaseModel):
 
 class CreativesSearchData(BaseModel):
     """Search result data for creatives entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_account_id: str | None = None
     """Parent ad account ID"""
@@ -664,7 +664,7 @@ class CreativesSearchData(BaseModel):
 
 class MediaSearchData(BaseModel):
     """Search result data for media entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_account_id: str | None = None
     """Parent ad account ID"""
@@ -704,7 +704,7 @@ class MediaSearchData(BaseModel):
 
 class SegmentsSearchData(BaseModel):
     """Search result data for segments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_account_id: str | None = None
     """Parent ad account ID"""
@@ -740,7 +740,7 @@ class SegmentsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -752,7 +752,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
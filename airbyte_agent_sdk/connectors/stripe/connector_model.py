@@ -23,6 +23,9 @@ from airbyte_agent_sdk.schema.security import (
 from airbyte_agent_sdk.schema.base import (
     ExampleQuestions,
 )
+from airbyte_agent_sdk.schema.extensions import (
+    RateLimitConfig,
+)
 from uuid import (
     UUID,
 )
@@ -4858,7 +4861,7 @@ StripeConnectorModel: ConnectorModel = ConnectorModel(
                         },
                     },
                     record_extractor='$.data',
-                    meta_extractor={'has_more': '$.has_more'},
+                    meta_extractor={'has_more': '$.has_more', 'next_page': '$.next_page'},
                 ),
             },
             entity_schema={
@@ -21271,7 +21274,7 @@ StripeConnectorModel: ConnectorModel = ConnectorModel(
                         },
                     },
                     record_extractor='$.data',
-                    meta_extractor={'has_more': '$.has_more'},
+                    meta_extractor={'has_more': '$.has_more', 'next_page': '$.next_page'},
                 ),
             },
             entity_schema={
@@ -22776,7 +22779,7 @@ StripeConnectorModel: ConnectorModel = ConnectorModel(
                         },
                     },
                     record_extractor='$.data',
-                    meta_extractor={'has_more': '$.has_more'},
+                    meta_extractor={'has_more': '$.has_more', 'next_page': '$.next_page'},
                 ),
             },
             entity_schema={
@@ -24478,6 +24481,9 @@ StripeConnectorModel: ConnectorModel = ConnectorModel(
             },
         ),
     ],
+    rate_limit=RateLimitConfig(
+        requests=25,
+    ),
     search_field_paths={
         'charges': [
             'amount',
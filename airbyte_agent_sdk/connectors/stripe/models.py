@@ -34,7 +34,7 @@ class StripeReplicationConfig(BaseModel):
 
 class CustomerAddress(BaseModel):
     """The customer's address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     city: str | None | None = Field(default=None, description="City, district, suburb, town, or village")
     """City, district, suburb, town, or village"""
@@ -51,7 +51,7 @@ class CustomerAddress(BaseModel):
 
 class CustomerCashBalanceSettings(BaseModel):
     """A hash of settings for this cash balance"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reconciliation_mode: str | None = Field(default=None, description="The configuration for how funds that land in the customer cash balance are reconciled")
     """The configuration for how funds that land in the customer cash balance are reconciled"""
@@ -60,7 +60,7 @@ class CustomerCashBalanceSettings(BaseModel):
 
 class CustomerCashBalance(BaseModel):
     """The current funds being held by Stripe on behalf of the customer"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object", description="String representing the object's type")
     """String representing the object's type"""
@@ -77,7 +77,7 @@ class CustomerCashBalance(BaseModel):
 
 class SubscriptionPauseCollection(BaseModel):
     """If specified, payment collection for this subscription will be paused"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     behavior: str | None = Field(default=None, description="The payment collection behavior for this subscription while paused")
     """The payment collection behavior for this subscription while paused"""
@@ -86,7 +86,7 @@ class SubscriptionPauseCollection(BaseModel):
 
 class SubscriptionAutomaticTaxLiability(BaseModel):
     """The account that's liable for tax"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account: str | None | None = Field(default=None, description="The connected account being referenced when type is account")
     """The connected account being referenced when type is account"""
@@ -95,7 +95,7 @@ class SubscriptionAutomaticTaxLiability(BaseModel):
 
 class SubscriptionAutomaticTax(BaseModel):
     """Automatic tax settings for this subscription"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     disabled_reason: str | None | None = Field(default=None, description="If Stripe disabled automatic tax, this enum describes why")
     """If Stripe disabled automatic tax, this enum describes why"""
@@ -106,7 +106,7 @@ class SubscriptionAutomaticTax(BaseModel):
 
 class SubscriptionBillingCycleAnchorConfig(BaseModel):
     """The fixed values used to calculate the billing_cycle_anchor"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     day_of_month: int | None = Field(default=None, description="The day of the month of the billing_cycle_anchor")
     """The day of the month of the billing_cycle_anchor"""
@@ -121,14 +121,14 @@ class SubscriptionBillingCycleAnchorConfig(BaseModel):
 
 class SubscriptionItemsDataItemBillingThresholds(BaseModel):
     """Define thresholds at which an invoice will be sent"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     usage_gte: int | None | None = Field(default=None, description="Usage threshold that triggers the subscription to create an invoice")
     """Usage threshold that triggers the subscription to create an invoice"""
 
 class SubscriptionItemsDataItem(BaseModel):
     """Nested schema for SubscriptionItems.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Unique identifier for the object")
     """Unique identifier for the object"""
@@ -159,7 +159,7 @@ class SubscriptionItemsDataItem(BaseModel):
 
 class SubscriptionItems(BaseModel):
     """List of subscription items, each with an attached price"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object", description="String representing the object's type")
     """String representing the object's type"""
@@ -174,7 +174,7 @@ class SubscriptionItems(BaseModel):
 
 class SubscriptionBillingThresholds(BaseModel):
     """Define thresholds at which an invoice will be sent, and the subscription advanced to a new billing period"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount_gte: int | None | None = Field(default=None, description="Monetary threshold that triggers the subscription to create an invoice")
     """Monetary threshold that triggers the subscription to create an invoice"""
@@ -183,7 +183,7 @@ class SubscriptionBillingThresholds(BaseModel):
 
 class SubscriptionCancellationDetails(BaseModel):
     """Details about why this subscription was cancelled"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     comment: str | None | None = Field(default=None, description="Additional comments about why the user canceled the subscription")
     """Additional comments about why the user canceled the subscription"""
@@ -194,7 +194,7 @@ class SubscriptionCancellationDetails(BaseModel):
 
 class SubscriptionInvoiceSettingsIssuer(BaseModel):
     """The connected account that issues the invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account: str | None | None = Field(default=None, description="The connected account being referenced when type is account")
     """The connected account being referenced when type is account"""
@@ -203,7 +203,7 @@ class SubscriptionInvoiceSettingsIssuer(BaseModel):
 
 class SubscriptionInvoiceSettings(BaseModel):
     """All invoices will be billed using the specified settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_tax_ids: list[str] | None | None = Field(default=None, description="The account tax IDs associated with the subscription")
     """The account tax IDs associated with the subscription"""
@@ -212,20 +212,20 @@ class SubscriptionInvoiceSettings(BaseModel):
 
 class SubscriptionTrialSettingsEndBehavior(BaseModel):
     """Nested schema for SubscriptionTrialSettings.end_behavior"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     missing_payment_method: str | None = Field(default=None, description="Behavior when the trial ends and payment method is missing")
     """Behavior when the trial ends and payment method is missing"""
 
 class SubscriptionTrialSettings(BaseModel):
     """Settings related to subscription trials"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     end_behavior: SubscriptionTrialSettingsEndBehavior | None = Field(default=None)
 
 class SubscriptionDefaultTaxRatesItemFlatAmount(BaseModel):
     """The amount of the tax rate when the rate_type is flat_amount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Amount of the tax when the rate_type is flat_amount")
     """Amount of the tax when the rate_type is flat_amount"""
@@ -234,7 +234,7 @@ class SubscriptionDefaultTaxRatesItemFlatAmount(BaseModel):
 
 class SubscriptionDefaultTaxRatesItem(BaseModel):
     """Nested schema for Subscription.default_tax_rates_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Unique identifier for the object")
     """Unique identifier for the object"""
@@ -275,14 +275,14 @@ class SubscriptionDefaultTaxRatesItem(BaseModel):
 
 class SubscriptionBillingModeFlexible(BaseModel):
     """Configure behavior for flexible billing mode"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     proration_discounts: str | None = Field(default=None, description="Controls how invoices and invoice items display proration amounts and discount amounts")
     """Controls how invoices and invoice items display proration amounts and discount amounts"""
 
 class SubscriptionBillingMode(BaseModel):
     """Controls how prorations and invoices for subscriptions are calculated and orchestrated"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     flexible: SubscriptionBillingModeFlexible | None | None = Field(default=None, description="Configure behavior for flexible billing mode")
     """Configure behavior for flexible billing mode"""
@@ -293,7 +293,7 @@ class SubscriptionBillingMode(BaseModel):
 
 class SubscriptionPaymentSettings(BaseModel):
     """Payment settings passed on to invoices created by the subscription"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     payment_method_options: dict[str, Any] | None | None = Field(default=None, description="Payment-method-specific configuration to provide to invoices")
     """Payment-method-specific configuration to provide to invoices"""
@@ -302,7 +302,7 @@ class SubscriptionPaymentSettings(BaseModel):
 
 class Subscription(BaseModel):
     """Subscription type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -357,7 +357,7 @@ class Subscription(BaseModel):
 
 class CustomerSubscriptions(BaseModel):
     """The customer's current subscriptions, if any"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object", description="String representing the object's type")
     """String representing the object's type"""
@@ -370,7 +370,7 @@ class CustomerSubscriptions(BaseModel):
 
 class CustomerDiscountSource(BaseModel):
     """The source of the discount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     coupon: str | None | None = Field(default=None, description="The coupon that was redeemed to create this discount")
     """The coupon that was redeemed to create this discount"""
@@ -379,7 +379,7 @@ class CustomerDiscountSource(BaseModel):
 
 class CustomerDiscount(BaseModel):
     """Describes the current discount active on the customer, if there is one"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="The ID of the discount object")
     """The ID of the discount object"""
@@ -410,7 +410,7 @@ class CustomerDiscount(BaseModel):
 
 class CustomerShippingAddress(BaseModel):
     """Customer shipping address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     city: str | None | None = Field(default=None, description="City, district, suburb, town, or village")
     """City, district, suburb, town, or village"""
@@ -427,7 +427,7 @@ class CustomerShippingAddress(BaseModel):
 
 class CustomerShipping(BaseModel):
     """Mailing and shipping address for the customer"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     address: CustomerShippingAddress | None = Field(default=None, description="Customer shipping address")
     """Customer shipping address"""
@@ -438,7 +438,7 @@ class CustomerShipping(BaseModel):
 
 class CustomerSourcesDataItem(BaseModel):
     """Nested schema for CustomerSources.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Unique identifier for the object")
     """Unique identifier for the object"""
@@ -475,7 +475,7 @@ class CustomerSourcesDataItem(BaseModel):
 
 class CustomerSources(BaseModel):
     """The customer's payment sources, if any"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object", description="String representing the object's type")
     """String representing the object's type"""
@@ -488,7 +488,7 @@ class CustomerSources(BaseModel):
 
 class CustomerInvoiceSettingsCustomFieldsItem(BaseModel):
     """Nested schema for CustomerInvoiceSettings.custom_fields_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="The name of the custom field")
     """The name of the custom field"""
@@ -497,7 +497,7 @@ class CustomerInvoiceSettingsCustomFieldsItem(BaseModel):
 
 class CustomerInvoiceSettingsRenderingOptions(BaseModel):
     """Default options for invoice PDF rendering for this customer"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount_tax_display: str | None | None = Field(default=None, description="How line-item prices and amounts will be displayed with respect to tax on invoice PDFs")
     """How line-item prices and amounts will be displayed with respect to tax on invoice PDFs"""
@@ -506,7 +506,7 @@ class CustomerInvoiceSettingsRenderingOptions(BaseModel):
 
 class CustomerInvoiceSettings(BaseModel):
     """The customer's default invoice settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     custom_fields: list[CustomerInvoiceSettingsCustomFieldsItem] | None | None = Field(default=None, description="Default custom fields to be displayed on invoices for this customer")
     """Default custom fields to be displayed on invoices for this customer"""
@@ -519,7 +519,7 @@ class CustomerInvoiceSettings(BaseModel):
 
 class Customer(BaseModel):
     """Customer type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -554,7 +554,7 @@ class Customer(BaseModel):
 
 class CustomerList(BaseModel):
     """CustomerList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Customer] | None = Field(default=None)
@@ -563,7 +563,7 @@ class CustomerList(BaseModel):
 
 class CustomerCreateParamsAddress(BaseModel):
     """The customer's address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     line1: str | None = Field(default=None, description="Address line 1")
     """Address line 1"""
@@ -580,7 +580,7 @@ class CustomerCreateParamsAddress(BaseModel):
 
 class CustomerCreateParams(BaseModel):
     """CustomerCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -591,7 +591,7 @@ class CustomerCreateParams(BaseModel):
 
 class CustomerUpdateParamsAddress(BaseModel):
     """The customer's address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     line1: str | None = Field(default=None, description="Address line 1")
     """Address line 1"""
@@ -608,7 +608,7 @@ class CustomerUpdateParamsAddress(BaseModel):
 
 class CustomerUpdateParams(BaseModel):
     """CustomerUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -619,7 +619,7 @@ class CustomerUpdateParams(BaseModel):
 
 class CustomerDeletedResponse(BaseModel):
     """CustomerDeletedResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -627,7 +627,7 @@ class CustomerDeletedResponse(BaseModel):
 
 class InvoiceThresholdReasonItemReasonsItem(BaseModel):
     """Nested schema for InvoiceThresholdReason.item_reasons_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     line_item_ids: list[str] | None = Field(default=None, description="The IDs of the line items that triggered the threshold invoice")
     """The IDs of the line items that triggered the threshold invoice"""
@@ -636,7 +636,7 @@ class InvoiceThresholdReasonItemReasonsItem(BaseModel):
 
 class InvoiceThresholdReason(BaseModel):
     """If billing_reason is set to subscription_threshold this returns more information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount_gte: int | None | None = Field(default=None, description="The total invoice amount threshold boundary if it triggered the threshold invoice")
     """The total invoice amount threshold boundary if it triggered the threshold invoice"""
@@ -645,7 +645,7 @@ class InvoiceThresholdReason(BaseModel):
 
 class InvoiceTotalTaxesItem(BaseModel):
     """Nested schema for Invoice.total_taxes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="The amount of the tax")
     """The amount of the tax"""
@@ -662,7 +662,7 @@ class InvoiceTotalTaxesItem(BaseModel):
 
 class InvoiceCustomerAddress(BaseModel):
     """The customer's address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     city: str | None | None = Field(default=None, description="City, district, suburb, town, or village")
     """City, district, suburb, town, or village"""
@@ -679,7 +679,7 @@ class InvoiceCustomerAddress(BaseModel):
 
 class InvoiceShippingCostTaxesItem(BaseModel):
     """Nested schema for InvoiceShippingCost.taxes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Amount of tax applied for this rate")
     """Amount of tax applied for this rate"""
@@ -690,7 +690,7 @@ class InvoiceShippingCostTaxesItem(BaseModel):
 
 class InvoiceShippingCost(BaseModel):
     """The details of the cost of shipping"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount_subtotal: int | None = Field(default=None, description="Total shipping cost before any taxes are applied")
     """Total shipping cost before any taxes are applied"""
@@ -705,7 +705,7 @@ class InvoiceShippingCost(BaseModel):
 
 class InvoicePaymentsDataItem(BaseModel):
     """Nested schema for InvoicePayments.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Unique identifier for the object")
     """Unique identifier for the object"""
@@ -730,7 +730,7 @@ class InvoicePaymentsDataItem(BaseModel):
 
 class InvoicePayments(BaseModel):
     """Payments for this invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object", description="String representing the object's type")
     """String representing the object's type"""
@@ -743,7 +743,7 @@ class InvoicePayments(BaseModel):
 
 class InvoiceTotalPretaxCreditAmountsItem(BaseModel):
     """Nested schema for Invoice.total_pretax_credit_amounts_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="The amount of the pretax credit amount")
     """The amount of the pretax credit amount"""
@@ -756,7 +756,7 @@ class InvoiceTotalPretaxCreditAmountsItem(BaseModel):
 
 class InvoiceLastFinalizationError(BaseModel):
     """The error encountered during the last finalization attempt"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     advice_code: str | None | None = Field(default=None, description="For card errors resulting from a card issuer decline")
     """For card errors resulting from a card issuer decline"""
@@ -779,7 +779,7 @@ class InvoiceLastFinalizationError(BaseModel):
 
 class InvoiceDiscountCoupon(BaseModel):
     """Nested schema for InvoiceDiscount.coupon"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -799,7 +799,7 @@ class InvoiceDiscountCoupon(BaseModel):
 
 class InvoiceDiscount(BaseModel):
     """The discount applied to the invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -817,7 +817,7 @@ class InvoiceDiscount(BaseModel):
 
 class InvoiceCustomFieldsItem(BaseModel):
     """Nested schema for Invoice.custom_fields_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="The name of the custom field")
     """The name of the custom field"""
@@ -826,7 +826,7 @@ class InvoiceCustomFieldsItem(BaseModel):
 
 class InvoiceDefaultTaxRatesItemFlatAmount(BaseModel):
     """The amount of the tax rate when the rate_type is flat_amount"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Amount of the tax when the rate_type is flat_amount")
     """Amount of the tax when the rate_type is flat_amount"""
@@ -835,7 +835,7 @@ class InvoiceDefaultTaxRatesItemFlatAmount(BaseModel):
 
 class InvoiceDefaultTaxRatesItem(BaseModel):
     """Nested schema for Invoice.default_tax_rates_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Unique identifier for the object")
     """Unique identifier for the object"""
@@ -876,14 +876,14 @@ class InvoiceDefaultTaxRatesItem(BaseModel):
 
 class InvoiceSubscriptionDetails(BaseModel):
     """Details about the subscription that this invoice was prepared for, if any"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     metadata: dict[str, str] | None | None = Field(default=None, description="Set of key-value pairs defined as subscription metadata when the invoice is created")
     """Set of key-value pairs defined as subscription metadata when the invoice is created"""
 
 class InvoiceIssuer(BaseModel):
     """The connected account that issues the invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account: str | None | None = Field(default=None, description="The connected account being referenced when type is account")
     """The connected account being referenced when type is account"""
@@ -892,14 +892,14 @@ class InvoiceIssuer(BaseModel):
 
 class InvoiceFromInvoice(BaseModel):
     """Details of the invoice that was cloned"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     action: str | None = Field(default=None)
     invoice: str | None = Field(default=None)
 
 class InvoiceCustomerShippingAddress(BaseModel):
     """Customer shipping address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     city: str | None | None = Field(default=None, description="City, district, suburb, town, or village")
     """City, district, suburb, town, or village"""
@@ -916,7 +916,7 @@ class InvoiceCustomerShippingAddress(BaseModel):
 
 class InvoiceCustomerShipping(BaseModel):
     """The customer's shipping information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     address: InvoiceCustomerShippingAddress | None = Field(default=None, description="Customer shipping address")
     """Customer shipping address"""
@@ -927,7 +927,7 @@ class InvoiceCustomerShipping(BaseModel):
 
 class InvoiceAutomaticTaxLiability(BaseModel):
     """The account that's liable for tax"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account: str | None | None = Field(default=None, description="The connected account being referenced when type is account")
     """The connected account being referenced when type is account"""
@@ -936,7 +936,7 @@ class InvoiceAutomaticTaxLiability(BaseModel):
 
 class InvoiceAutomaticTax(BaseModel):
     """Settings and latest results for automatic tax lookup for this invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     disabled_reason: str | None | None = Field(default=None, description="If Stripe disabled automatic tax, this enum describes why")
     """If Stripe disabled automatic tax, this enum describes why"""
@@ -951,7 +951,7 @@ class InvoiceAutomaticTax(BaseModel):
 
 class InvoiceCustomerTaxIdsItem(BaseModel):
     """Nested schema for Invoice.customer_tax_ids_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type", description="The type of the tax ID")
     """The type of the tax ID"""
@@ -960,7 +960,7 @@ class InvoiceCustomerTaxIdsItem(BaseModel):
 
 class InvoiceShippingDetailsAddress(BaseModel):
     """Shipping address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     city: str | None | None = Field(default=None, description="City, district, suburb, town, or village")
     """City, district, suburb, town, or village"""
@@ -977,7 +977,7 @@ class InvoiceShippingDetailsAddress(BaseModel):
 
 class InvoiceShippingDetails(BaseModel):
     """Shipping details for the invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     address: InvoiceShippingDetailsAddress | None = Field(default=None, description="Shipping address")
     """Shipping address"""
@@ -988,7 +988,7 @@ class InvoiceShippingDetails(BaseModel):
 
 class InvoiceConfirmationSecret(BaseModel):
     """The confirmation secret associated with this invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     client_secret: str | None = Field(default=None, description="The client_secret of the payment that Stripe creates for the invoice after finalization")
     """The client_secret of the payment that Stripe creates for the invoice after finalization"""
@@ -997,7 +997,7 @@ class InvoiceConfirmationSecret(BaseModel):
 
 class InvoiceParentSubscriptionDetails(BaseModel):
     """Details about the subscription that generated this invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     metadata: dict[str, str] | None | None = Field(default=None, description="Set of key-value pairs defined as subscription metadata")
     """Set of key-value pairs defined as subscription metadata"""
@@ -1008,14 +1008,14 @@ class InvoiceParentSubscriptionDetails(BaseModel):
 
 class InvoiceParentQuoteDetails(BaseModel):
     """Details about the quote that generated this invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     quote: str | None = Field(default=None, description="The quote that generated this invoice")
     """The quote that generated this invoice"""
 
 class InvoiceParent(BaseModel):
     """The parent that generated this invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     quote_details: InvoiceParentQuoteDetails | None | None = Field(default=None, description="Details about the quote that generated this invoice")
     """Details about the quote that generated this invoice"""
@@ -1026,7 +1026,7 @@ class InvoiceParent(BaseModel):
 
 class InvoicePaymentSettings(BaseModel):
     """Configuration settings for the PaymentIntent that is generated when the invoice is finalized"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     default_mandate: str | None | None = Field(default=None, description="ID of the mandate to be used for this invoice")
     """ID of the mandate to be used for this invoice"""
@@ -1037,7 +1037,7 @@ class InvoicePaymentSettings(BaseModel):
 
 class InvoiceLinesDataItemPeriod(BaseModel):
     """The period this line_item covers"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     end: int | None = Field(default=None, description="The end of the period")
     """The end of the period"""
@@ -1046,7 +1046,7 @@ class InvoiceLinesDataItemPeriod(BaseModel):
 
 class InvoiceLinesDataItemDiscountAmountsItem(BaseModel):
     """Nested schema for InvoiceLinesDataItem.discount_amounts_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="The amount of the discount")
     """The amount of the discount"""
@@ -1055,7 +1055,7 @@ class InvoiceLinesDataItemDiscountAmountsItem(BaseModel):
 
 class InvoiceLinesDataItem(BaseModel):
     """Nested schema for InvoiceLines.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Unique identifier for the object")
     """Unique identifier for the object"""
@@ -1088,7 +1088,7 @@ class InvoiceLinesDataItem(BaseModel):
 
 class InvoiceLines(BaseModel):
     """The individual line items that make up the invoice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[InvoiceLinesDataItem] | None = Field(default=None)
@@ -1098,7 +1098,7 @@ class InvoiceLines(BaseModel):
 
 class InvoiceTotalTaxAmountsItem(BaseModel):
     """Nested schema for Invoice.total_tax_amounts_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="The amount of the tax")
     """The amount of the tax"""
@@ -1113,14 +1113,14 @@ class InvoiceTotalTaxAmountsItem(BaseModel):
 
 class InvoiceRenderingPdf(BaseModel):
     """Invoice pdf rendering options"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_size: str | None | None = Field(default=None, description="Page size of invoice pdf")
     """Page size of invoice pdf"""
 
 class InvoiceRendering(BaseModel):
     """The rendering-related settings that control how the invoice is displayed"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount_tax_display: str | None | None = Field(default=None, description="How line-item prices and amounts will be displayed with respect to tax")
     """How line-item prices and amounts will be displayed with respect to tax"""
@@ -1133,7 +1133,7 @@ class InvoiceRendering(BaseModel):
 
 class InvoiceTotalDiscountAmountsItem(BaseModel):
     """Nested schema for Invoice.total_discount_amounts_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="The amount of the discount")
     """The amount of the discount"""
@@ -1142,7 +1142,7 @@ class InvoiceTotalDiscountAmountsItem(BaseModel):
 
 class InvoiceStatusTransitions(BaseModel):
     """Status transition timestamps"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     finalized_at: int | None | None = Field(default=None, description="The time that the invoice draft was finalized")
     """The time that the invoice draft was finalized"""
@@ -1155,7 +1155,7 @@ class InvoiceStatusTransitions(BaseModel):
 
 class Invoice(BaseModel):
     """Invoice type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -1250,7 +1250,7 @@ class Invoice(BaseModel):
 
 class InvoiceList(BaseModel):
     """InvoiceList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Invoice] | None = Field(default=None)
@@ -1259,7 +1259,7 @@ class InvoiceList(BaseModel):
 
 class ChargePaymentMethodDetailsCardChecks(BaseModel):
     """Check results by Card networks on Card address and CVC"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     address_line1_check: str | None | None = Field(default=None)
     address_postal_code_check: str | None | None = Field(default=None)
@@ -1267,38 +1267,38 @@ class ChargePaymentMethodDetailsCardChecks(BaseModel):
 
 class ChargePaymentMethodDetailsCardMulticapture(BaseModel):
     """Multicapture details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     status: str | None = Field(default=None)
 
 class ChargePaymentMethodDetailsCardNetworkToken(BaseModel):
     """Network token details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     used: bool | None = Field(default=None)
 
 class ChargePaymentMethodDetailsCardIncrementalAuthorization(BaseModel):
     """Incremental authorization details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     status: str | None = Field(default=None)
 
 class ChargePaymentMethodDetailsCardExtendedAuthorization(BaseModel):
     """Extended authorization details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     status: str | None = Field(default=None)
 
 class ChargePaymentMethodDetailsCardOvercapture(BaseModel):
     """Overcapture details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     maximum_amount_capturable: int | None = Field(default=None)
     status: str | None = Field(default=None)
 
 class ChargePaymentMethodDetailsCard(BaseModel):
     """Nested schema for ChargePaymentMethodDetails.card"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount_authorized: int | None | None = Field(default=None, description="Amount authorized on the card")
     """Amount authorized on the card"""
@@ -1347,14 +1347,14 @@ class ChargePaymentMethodDetailsCard(BaseModel):
 
 class ChargePaymentMethodDetails(BaseModel):
     """Details about the payment method at the time of the transaction"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     card: ChargePaymentMethodDetailsCard | None | None = Field(default=None)
 
 class ChargeFraudDetails(BaseModel):
     """Information on fraud assessments for the charge"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     stripe_report: str | None | None = Field(default=None, description="Assessments from Stripe. If set, the value is `fraudulent`.")
     """Assessments from Stripe. If set, the value is `fraudulent`."""
@@ -1363,7 +1363,7 @@ class ChargeFraudDetails(BaseModel):
 
 class ChargeBillingDetailsAddress(BaseModel):
     """Nested schema for ChargeBillingDetails.address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     city: str | None | None = Field(default=None)
     country: str | None | None = Field(default=None)
@@ -1374,7 +1374,7 @@ class ChargeBillingDetailsAddress(BaseModel):
 
 class ChargeBillingDetails(BaseModel):
     """Billing information associated with the payment method"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     address: ChargeBillingDetailsAddress | None | None = Field(default=None)
     email: str | None | None = Field(default=None)
@@ -1384,7 +1384,7 @@ class ChargeBillingDetails(BaseModel):
 
 class ChargeOutcome(BaseModel):
     """Details about whether the payment was accepted, and why"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     advice_code: str | None | None = Field(default=None)
     network_advice_code: str | None | None = Field(default=None)
@@ -1398,7 +1398,7 @@ class ChargeOutcome(BaseModel):
 
 class ChargePresentmentDetails(BaseModel):
     """Currency presentation information for multi-currency charges"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount_authorized: int | None | None = Field(default=None, description="Amount authorized in the presentment currency")
     """Amount authorized in the presentment currency"""
@@ -1409,7 +1409,7 @@ class ChargePresentmentDetails(BaseModel):
 
 class ChargeRefunds(BaseModel):
     """A list of refunds that have been applied to the charge"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[dict[str, Any]] | None = Field(default=None)
@@ -1421,7 +1421,7 @@ class ChargeRefunds(BaseModel):
 
 class Charge(BaseModel):
     """Charge type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -1476,7 +1476,7 @@ class Charge(BaseModel):
 
 class ChargeList(BaseModel):
     """ChargeList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Charge] | None = Field(default=None)
@@ -1485,7 +1485,7 @@ class ChargeList(BaseModel):
 
 class SubscriptionList(BaseModel):
     """SubscriptionList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Subscription] | None = Field(default=None)
@@ -1494,7 +1494,7 @@ class SubscriptionList(BaseModel):
 
 class RefundNextActionDisplayDetailsEmailSent(BaseModel):
     """Contains information about the email sent to the customer"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email_sent_at: int | None = Field(default=None, description="The timestamp when the email was sent")
     """The timestamp when the email was sent"""
@@ -1503,7 +1503,7 @@ class RefundNextActionDisplayDetailsEmailSent(BaseModel):
 
 class RefundNextActionDisplayDetails(BaseModel):
     """Contains the refund details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     email_sent: RefundNextActionDisplayDetailsEmailSent | None = Field(default=None, description="Contains information about the email sent to the customer")
     """Contains information about the email sent to the customer"""
@@ -1512,7 +1512,7 @@ class RefundNextActionDisplayDetails(BaseModel):
 
 class RefundNextAction(BaseModel):
     """If the refund has a status of requires_action, this property describes what the refund needs to continue processing"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     display_details: RefundNextActionDisplayDetails | None | None = Field(default=None, description="Contains the refund details")
     """Contains the refund details"""
@@ -1521,7 +1521,7 @@ class RefundNextAction(BaseModel):
 
 class RefundDestinationDetailsBrBankTransfer(BaseModel):
     """If this is a br_bank_transfer refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The reference assigned to the refund")
     """The reference assigned to the refund"""
@@ -1530,7 +1530,7 @@ class RefundDestinationDetailsBrBankTransfer(BaseModel):
 
 class RefundDestinationDetailsUsBankTransfer(BaseModel):
     """If this is a us_bank_transfer refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The reference assigned to the refund")
     """The reference assigned to the refund"""
@@ -1539,7 +1539,7 @@ class RefundDestinationDetailsUsBankTransfer(BaseModel):
 
 class RefundDestinationDetailsBlik(BaseModel):
     """If this is a blik refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     network_decline_code: str | None | None = Field(default=None, description="For refunds declined by the network, a decline code provided by the network")
     """For refunds declined by the network, a decline code provided by the network"""
@@ -1550,7 +1550,7 @@ class RefundDestinationDetailsBlik(BaseModel):
 
 class RefundDestinationDetailsMxBankTransfer(BaseModel):
     """If this is a mx_bank_transfer refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The reference assigned to the refund")
     """The reference assigned to the refund"""
@@ -1559,7 +1559,7 @@ class RefundDestinationDetailsMxBankTransfer(BaseModel):
 
 class RefundDestinationDetailsSwish(BaseModel):
     """If this is a swish refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     network_decline_code: str | None | None = Field(default=None, description="For refunds declined by the network, a decline code provided by the network")
     """For refunds declined by the network, a decline code provided by the network"""
@@ -1570,7 +1570,7 @@ class RefundDestinationDetailsSwish(BaseModel):
 
 class RefundDestinationDetailsCard(BaseModel):
     """If this is a card refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="Value of the reference number assigned to the refund")
     """Value of the reference number assigned to the refund"""
@@ -1583,14 +1583,14 @@ class RefundDestinationDetailsCard(BaseModel):
 
 class RefundDestinationDetailsCrypto(BaseModel):
     """If this is a crypto refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The transaction hash of the refund")
     """The transaction hash of the refund"""
 
 class RefundDestinationDetailsGbBankTransfer(BaseModel):
     """If this is a gb_bank_transfer refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The reference assigned to the refund")
     """The reference assigned to the refund"""
@@ -1599,7 +1599,7 @@ class RefundDestinationDetailsGbBankTransfer(BaseModel):
 
 class RefundDestinationDetailsThBankTransfer(BaseModel):
     """If this is a th_bank_transfer refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The reference assigned to the refund")
     """The reference assigned to the refund"""
@@ -1608,7 +1608,7 @@ class RefundDestinationDetailsThBankTransfer(BaseModel):
 
 class RefundDestinationDetailsJpBankTransfer(BaseModel):
     """If this is a jp_bank_transfer refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The reference assigned to the refund")
     """The reference assigned to the refund"""
@@ -1617,7 +1617,7 @@ class RefundDestinationDetailsJpBankTransfer(BaseModel):
 
 class RefundDestinationDetailsMultibanco(BaseModel):
     """If this is a multibanco refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The reference assigned to the refund")
     """The reference assigned to the refund"""
@@ -1626,7 +1626,7 @@ class RefundDestinationDetailsMultibanco(BaseModel):
 
 class RefundDestinationDetailsMbWay(BaseModel):
     """If this is a mb_way refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The reference assigned to the refund")
     """The reference assigned to the refund"""
@@ -1635,14 +1635,14 @@ class RefundDestinationDetailsMbWay(BaseModel):
 
 class RefundDestinationDetailsPaypal(BaseModel):
     """If this is a paypal refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     network_decline_code: str | None | None = Field(default=None, description="For refunds declined by the network, a decline code provided by the network")
     """For refunds declined by the network, a decline code provided by the network"""
 
 class RefundDestinationDetailsP24(BaseModel):
     """If this is a p24 refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The reference assigned to the refund")
     """The reference assigned to the refund"""
@@ -1651,7 +1651,7 @@ class RefundDestinationDetailsP24(BaseModel):
 
 class RefundDestinationDetailsEuBankTransfer(BaseModel):
     """If this is a eu_bank_transfer refund, this hash contains the transaction specific details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     reference: str | None | None = Field(default=None, description="The reference assigned to the refund")
     """The reference assigned to the refund"""
@@ -1660,7 +1660,7 @@ class RefundDestinationDetailsEuBankTransfer(BaseModel):
 
 class RefundDestinationDetails(BaseModel):
     """Transaction-specific details for the refund"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     affirm: dict[str, Any] | None | None = Field(default=None, description="If this is a affirm refund, this hash contains the transaction specific details")
     """If this is a affirm refund, this hash contains the transaction specific details"""
@@ -1737,7 +1737,7 @@ class RefundDestinationDetails(BaseModel):
 
 class Refund(BaseModel):
     """Refund type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -1763,7 +1763,7 @@ class Refund(BaseModel):
 
 class RefundList(BaseModel):
     """RefundList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     count: int | None = Field(default=None)
@@ -1773,7 +1773,7 @@ class RefundList(BaseModel):
 
 class RefundCreateParams(BaseModel):
     """RefundCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     charge: str | None = Field(default=None)
     payment_intent: str | None = Field(default=None)
@@ -1785,21 +1785,21 @@ class RefundCreateParams(BaseModel):
 
 class ProductFeaturesItem(BaseModel):
     """Nested schema for Product.features_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="The feature name")
     """The feature name"""
 
 class ProductMarketingFeaturesItem(BaseModel):
     """Nested schema for Product.marketing_features_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None | None = Field(default=None, description="The marketing feature name. Up to 80 characters long")
     """The marketing feature name. Up to 80 characters long"""
 
 class ProductPackageDimensions(BaseModel):
     """The dimensions of this product for shipping purposes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     height: float | None = Field(default=None, description="Height, in inches")
     """Height, in inches"""
@@ -1812,7 +1812,7 @@ class ProductPackageDimensions(BaseModel):
 
 class Product(BaseModel):
     """Product type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -1838,7 +1838,7 @@ class Product(BaseModel):
 
 class ProductList(BaseModel):
     """ProductList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Product] | None = Field(default=None)
@@ -1847,7 +1847,7 @@ class ProductList(BaseModel):
 
 class ProductSearchResult(BaseModel):
     """ProductSearchResult type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Product] | None = Field(default=None)
@@ -1857,7 +1857,7 @@ class ProductSearchResult(BaseModel):
 
 class ProductCreateParamsPackageDimensions(BaseModel):
     """The dimensions of this product for shipping purposes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     height: float | None = Field(default=None, description="Height, in inches")
     """Height, in inches"""
@@ -1870,14 +1870,14 @@ class ProductCreateParamsPackageDimensions(BaseModel):
 
 class ProductCreateParamsMarketingFeaturesItem(BaseModel):
     """Nested schema for ProductCreateParams.marketing_features_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="The marketing feature name. Up to 80 characters long")
     """The marketing feature name. Up to 80 characters long"""
 
 class ProductCreateParams(BaseModel):
     """ProductCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     active: bool | None = Field(default=None)
@@ -1895,7 +1895,7 @@ class ProductCreateParams(BaseModel):
 
 class ProductUpdateParamsPackageDimensions(BaseModel):
     """The dimensions of this product for shipping purposes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     height: float | None = Field(default=None, description="Height, in inches")
     """Height, in inches"""
@@ -1908,14 +1908,14 @@ class ProductUpdateParamsPackageDimensions(BaseModel):
 
 class ProductUpdateParamsMarketingFeaturesItem(BaseModel):
     """Nested schema for ProductUpdateParams.marketing_features_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="The marketing feature name. Up to 80 characters long")
     """The marketing feature name. Up to 80 characters long"""
 
 class ProductUpdateParams(BaseModel):
     """ProductUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     active: bool | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -1933,7 +1933,7 @@ class ProductUpdateParams(BaseModel):
 
 class ProductDeletedResponse(BaseModel):
     """ProductDeletedResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -1941,7 +1941,7 @@ class ProductDeletedResponse(BaseModel):
 
 class BalancePendingItemSourceTypes(BaseModel):
     """Breakdown of balance by source types"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bank_account: int | None | None = Field(default=None, description="Amount for bank_account")
     """Amount for bank_account"""
@@ -1952,7 +1952,7 @@ class BalancePendingItemSourceTypes(BaseModel):
 
 class BalancePendingItem(BaseModel):
     """Nested schema for Balance.pending_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Balance amount in the smallest currency unit")
     """Balance amount in the smallest currency unit"""
@@ -1963,7 +1963,7 @@ class BalancePendingItem(BaseModel):
 
 class BalanceAvailableItemSourceTypes(BaseModel):
     """Breakdown of balance by source types"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bank_account: int | None | None = Field(default=None, description="Amount for bank_account")
     """Amount for bank_account"""
@@ -1974,7 +1974,7 @@ class BalanceAvailableItemSourceTypes(BaseModel):
 
 class BalanceAvailableItem(BaseModel):
     """Nested schema for Balance.available_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Balance amount in the smallest currency unit (e.g., cents)")
     """Balance amount in the smallest currency unit (e.g., cents)"""
@@ -1985,7 +1985,7 @@ class BalanceAvailableItem(BaseModel):
 
 class BalanceRefundAndDisputePrefundingAvailableItemSourceTypes(BaseModel):
     """Breakdown of balance by source types"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bank_account: int | None | None = Field(default=None, description="Amount for bank_account")
     """Amount for bank_account"""
@@ -1996,7 +1996,7 @@ class BalanceRefundAndDisputePrefundingAvailableItemSourceTypes(BaseModel):
 
 class BalanceRefundAndDisputePrefundingAvailableItem(BaseModel):
     """Nested schema for BalanceRefundAndDisputePrefunding.available_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Balance amount")
     """Balance amount"""
@@ -2007,7 +2007,7 @@ class BalanceRefundAndDisputePrefundingAvailableItem(BaseModel):
 
 class BalanceRefundAndDisputePrefundingPendingItemSourceTypes(BaseModel):
     """Breakdown of balance by source types"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bank_account: int | None | None = Field(default=None, description="Amount for bank_account")
     """Amount for bank_account"""
@@ -2018,7 +2018,7 @@ class BalanceRefundAndDisputePrefundingPendingItemSourceTypes(BaseModel):
 
 class BalanceRefundAndDisputePrefundingPendingItem(BaseModel):
     """Nested schema for BalanceRefundAndDisputePrefunding.pending_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Balance amount")
     """Balance amount"""
@@ -2029,7 +2029,7 @@ class BalanceRefundAndDisputePrefundingPendingItem(BaseModel):
 
 class BalanceRefundAndDisputePrefunding(BaseModel):
     """Funds reserved for covering future refunds or disputes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     available: list[BalanceRefundAndDisputePrefundingAvailableItem] | None = Field(default=None, description="Available funds for refunds and disputes")
     """Available funds for refunds and disputes"""
@@ -2038,7 +2038,7 @@ class BalanceRefundAndDisputePrefunding(BaseModel):
 
 class BalanceInstantAvailableItemNetAvailableItemSourceTypes(BaseModel):
     """Breakdown of balance by source types"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bank_account: int | None | None = Field(default=None, description="Amount for bank_account")
     """Amount for bank_account"""
@@ -2049,7 +2049,7 @@ class BalanceInstantAvailableItemNetAvailableItemSourceTypes(BaseModel):
 
 class BalanceInstantAvailableItemNetAvailableItem(BaseModel):
     """Nested schema for BalanceInstantAvailableItem.net_available_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Net balance amount")
     """Net balance amount"""
@@ -2060,7 +2060,7 @@ class BalanceInstantAvailableItemNetAvailableItem(BaseModel):
 
 class BalanceInstantAvailableItemSourceTypes(BaseModel):
     """Breakdown of balance by source types"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bank_account: int | None | None = Field(default=None, description="Amount for bank_account")
     """Amount for bank_account"""
@@ -2071,7 +2071,7 @@ class BalanceInstantAvailableItemSourceTypes(BaseModel):
 
 class BalanceInstantAvailableItem(BaseModel):
     """Nested schema for Balance.instant_available_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Balance amount in the smallest currency unit")
     """Balance amount in the smallest currency unit"""
@@ -2084,7 +2084,7 @@ class BalanceInstantAvailableItem(BaseModel):
 
 class BalanceIssuingAvailableItemSourceTypes(BaseModel):
     """Breakdown of balance by source types"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bank_account: int | None | None = Field(default=None, description="Amount for bank_account")
     """Amount for bank_account"""
@@ -2095,7 +2095,7 @@ class BalanceIssuingAvailableItemSourceTypes(BaseModel):
 
 class BalanceIssuingAvailableItem(BaseModel):
     """Nested schema for BalanceIssuing.available_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Balance amount")
     """Balance amount"""
@@ -2106,14 +2106,14 @@ class BalanceIssuingAvailableItem(BaseModel):
 
 class BalanceIssuing(BaseModel):
     """Funds that are available for use with Issuing cards"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     available: list[BalanceIssuingAvailableItem] | None = Field(default=None, description="Funds available for issuing")
     """Funds available for issuing"""
 
 class BalanceConnectReservedItemSourceTypes(BaseModel):
     """Breakdown of balance by source types"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     bank_account: int | None | None = Field(default=None, description="Amount for bank_account")
     """Amount for bank_account"""
@@ -2124,7 +2124,7 @@ class BalanceConnectReservedItemSourceTypes(BaseModel):
 
 class BalanceConnectReservedItem(BaseModel):
     """Nested schema for Balance.connect_reserved_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Balance amount in the smallest currency unit")
     """Balance amount in the smallest currency unit"""
@@ -2135,7 +2135,7 @@ class BalanceConnectReservedItem(BaseModel):
 
 class Balance(BaseModel):
     """Balance type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     livemode: bool | None = Field(default=None)
@@ -2148,7 +2148,7 @@ class Balance(BaseModel):
 
 class BalanceTransactionFeeDetailsItem(BaseModel):
     """Nested schema for BalanceTransaction.fee_details_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None, description="Amount of the fee, in cents")
     """Amount of the fee, in cents"""
@@ -2163,7 +2163,7 @@ class BalanceTransactionFeeDetailsItem(BaseModel):
 
 class BalanceTransaction(BaseModel):
     """BalanceTransaction type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -2184,7 +2184,7 @@ class BalanceTransaction(BaseModel):
 
 class BalanceTransactionList(BaseModel):
     """BalanceTransactionList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[BalanceTransaction] | None = Field(default=None)
@@ -2193,7 +2193,7 @@ class BalanceTransactionList(BaseModel):
 
 class PaymentIntent(BaseModel):
     """PaymentIntent type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -2217,7 +2217,7 @@ class PaymentIntent(BaseModel):
 
 class PaymentIntentList(BaseModel):
     """PaymentIntentList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[PaymentIntent] | None = Field(default=None)
@@ -2226,7 +2226,7 @@ class PaymentIntentList(BaseModel):
 
 class PaymentIntentSearchResult(BaseModel):
     """PaymentIntentSearchResult type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[PaymentIntent] | None = Field(default=None)
@@ -2236,7 +2236,7 @@ class PaymentIntentSearchResult(BaseModel):
 
 class DisputeEvidenceDetails(BaseModel):
     """Information about the evidence submission"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     due_by: int | None | None = Field(default=None, description="Date by which evidence must be submitted, measured in seconds since the Unix epoch")
     """Date by which evidence must be submitted, measured in seconds since the Unix epoch"""
@@ -2249,7 +2249,7 @@ class DisputeEvidenceDetails(BaseModel):
 
 class Dispute(BaseModel):
     """Dispute type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -2271,7 +2271,7 @@ class Dispute(BaseModel):
 
 class DisputeList(BaseModel):
     """DisputeList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Dispute] | None = Field(default=None)
@@ -2280,7 +2280,7 @@ class DisputeList(BaseModel):
 
 class PayoutTraceId(BaseModel):
     """A string that identifies this payout as part of a group"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     status: str | None = Field(default=None, description="The status of the trace ID")
     """The status of the trace ID"""
@@ -2289,7 +2289,7 @@ class PayoutTraceId(BaseModel):
 
 class Payout(BaseModel):
     """Payout type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -2322,7 +2322,7 @@ class Payout(BaseModel):
 
 class PayoutList(BaseModel):
     """PayoutList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Payout] | None = Field(default=None)
@@ -2331,7 +2331,7 @@ class PayoutList(BaseModel):
 
 class CustomerSearchResult(BaseModel):
     """CustomerSearchResult type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Customer] | None = Field(default=None)
@@ -2341,7 +2341,7 @@ class CustomerSearchResult(BaseModel):
 
 class InvoiceSearchResult(BaseModel):
     """InvoiceSearchResult type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Invoice] | None = Field(default=None)
@@ -2351,7 +2351,7 @@ class InvoiceSearchResult(BaseModel):
 
 class ChargeSearchResult(BaseModel):
     """ChargeSearchResult type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Charge] | None = Field(default=None)
@@ -2361,7 +2361,7 @@ class ChargeSearchResult(BaseModel):
 
 class SubscriptionSearchResult(BaseModel):
     """SubscriptionSearchResult type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     object_: str | None = Field(default=None, alias="object")
     data: list[Subscription] | None = Field(default=None)
@@ -2371,7 +2371,7 @@ class SubscriptionSearchResult(BaseModel):
 
 class PaymentIntentCreateParamsAutomaticPaymentMethods(BaseModel):
     """When you enable this parameter, this PaymentIntent accepts payment methods that you enable in the Dashboard and that are compatible with this PaymentIntent's other parameters"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None = Field(default=None, description="Whether this feature is enabled")
     """Whether this feature is enabled"""
@@ -2380,7 +2380,7 @@ class PaymentIntentCreateParamsAutomaticPaymentMethods(BaseModel):
 
 class PaymentIntentCreateParams(BaseModel):
     """PaymentIntentCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int
     currency: str
@@ -2396,7 +2396,7 @@ class PaymentIntentCreateParams(BaseModel):
 
 class PaymentIntentUpdateParams(BaseModel):
     """PaymentIntentUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: int | None = Field(default=None)
     currency: str | None = Field(default=None)
@@ -2410,7 +2410,7 @@ class PaymentIntentUpdateParams(BaseModel):
 
 class PaymentIntentConfirmParams(BaseModel):
     """PaymentIntentConfirmParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     payment_method: str | None = Field(default=None)
     receipt_email: str | None = Field(default=None)
@@ -2418,13 +2418,13 @@ class PaymentIntentConfirmParams(BaseModel):
 
 class PaymentIntentCancelParams(BaseModel):
     """PaymentIntentCancelParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cancellation_reason: str | None = Field(default=None)
 
 class InvoiceCreateParams(BaseModel):
     """InvoiceCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     customer: str
     auto_advance: bool | None = Field(default=None)
@@ -2438,13 +2438,13 @@ class InvoiceCreateParams(BaseModel):
 
 class InvoiceFinalizeParams(BaseModel):
     """InvoiceFinalizeParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     auto_advance: bool | None = Field(default=None)
 
 class SubscriptionCreateParamsItemsItem(BaseModel):
     """Nested schema for SubscriptionCreateParams.items_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     price: str | None = Field(default=None, description="The ID of the price object")
     """The ID of the price object"""
@@ -2453,7 +2453,7 @@ class SubscriptionCreateParamsItemsItem(BaseModel):
 
 class SubscriptionCreateParams(BaseModel):
     """SubscriptionCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     customer: str
     items: list[SubscriptionCreateParamsItemsItem] | None = Field(default=None)
@@ -2468,7 +2468,7 @@ class SubscriptionCreateParams(BaseModel):
 
 class SubscriptionUpdateParamsItemsItem(BaseModel):
     """Nested schema for SubscriptionUpdateParams.items_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None, description="Subscription item to update")
     """Subscription item to update"""
@@ -2481,7 +2481,7 @@ class SubscriptionUpdateParamsItemsItem(BaseModel):
 
 class SubscriptionUpdateParams(BaseModel):
     """SubscriptionUpdateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     cancel_at_period_end: bool | None = Field(default=None)
     collection_method: str | None = Field(default=None)
@@ -2494,7 +2494,7 @@ class SubscriptionUpdateParams(BaseModel):
 
 class PriceRecurring(BaseModel):
     """The recurring components of a price such as interval and usage_type"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     interval: str | None = Field(default=None, description="The frequency at which a subscription is billed")
     """The frequency at which a subscription is billed"""
@@ -2505,7 +2505,7 @@ class PriceRecurring(BaseModel):
 
 class PriceTransformQuantity(BaseModel):
     """Apply a transformation to the reported usage or set quantity before computing the amount billed"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     divide_by: int | None = Field(default=None, description="Divide usage by this number")
     """Divide usage by this number"""
@@ -2514,7 +2514,7 @@ class PriceTransformQuantity(BaseModel):
 
 class Price(BaseModel):
     """Price type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -2537,7 +2537,7 @@ class Price(BaseModel):
 
 class PriceCreateParamsRecurring(BaseModel):
     """The recurring components of a price"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     interval: str | None = Field(default=None, description="Specifies billing frequency")
     """Specifies billing frequency"""
@@ -2548,7 +2548,7 @@ class PriceCreateParamsRecurring(BaseModel):
 
 class PriceCreateParams(BaseModel):
     """PriceCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     currency: str
     product: str
@@ -2563,7 +2563,7 @@ class PriceCreateParams(BaseModel):
 
 class CheckoutSession(BaseModel):
     """CheckoutSession type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -2584,7 +2584,7 @@ class CheckoutSession(BaseModel):
 
 class CheckoutSessionCreateParamsLineItemsItem(BaseModel):
     """Nested schema for CheckoutSessionCreateParams.line_items_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     price: str | None = Field(default=None, description="The ID of the Price or Plan object")
     """The ID of the Price or Plan object"""
@@ -2593,7 +2593,7 @@ class CheckoutSessionCreateParamsLineItemsItem(BaseModel):
 
 class CheckoutSessionCreateParams(BaseModel):
     """CheckoutSessionCreateParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     mode: str
     success_url: str | None = Field(default=None)
@@ -2606,7 +2606,7 @@ class CheckoutSessionCreateParams(BaseModel):
 
 class PaymentMethodCard(BaseModel):
     """If this is a card PaymentMethod, this hash contains the card details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     brand: str | None | None = Field(default=None, description="Card brand")
     """Card brand"""
@@ -2625,7 +2625,7 @@ class PaymentMethodCard(BaseModel):
 
 class PaymentMethodBillingDetailsAddress(BaseModel):
     """Billing address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     city: str | None | None = Field(default=None)
     country: str | None | None = Field(default=None)
@@ -2636,7 +2636,7 @@ class PaymentMethodBillingDetailsAddress(BaseModel):
 
 class PaymentMethodBillingDetails(BaseModel):
     """Billing information associated with the PaymentMethod"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     address: PaymentMethodBillingDetailsAddress | None | None = Field(default=None, description="Billing address")
     """Billing address"""
@@ -2646,7 +2646,7 @@ class PaymentMethodBillingDetails(BaseModel):
 
 class PaymentMethod(BaseModel):
     """PaymentMethod type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     object_: str | None = Field(default=None, alias="object")
@@ -2660,7 +2660,7 @@ class PaymentMethod(BaseModel):
 
 class PaymentMethodAttachParams(BaseModel):
     """PaymentMethodAttachParams type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     customer: str
 
@@ -2669,79 +2669,79 @@ class PaymentMethodAttachParams(BaseModel):
 
 class CustomersListResultMeta(BaseModel):
     """Metadata for customers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class CustomersApiSearchResultMeta(BaseModel):
     """Metadata for customers.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class InvoicesListResultMeta(BaseModel):
     """Metadata for invoices.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class ChargesListResultMeta(BaseModel):
     """Metadata for charges.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class SubscriptionsListResultMeta(BaseModel):
     """Metadata for subscriptions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class RefundsListResultMeta(BaseModel):
     """Metadata for refunds.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class ProductsListResultMeta(BaseModel):
     """Metadata for products.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class ProductsApiSearchResultMeta(BaseModel):
     """Metadata for products.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class BalanceTransactionsListResultMeta(BaseModel):
     """Metadata for balance_transactions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class PaymentIntentsListResultMeta(BaseModel):
     """Metadata for payment_intents.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class PaymentIntentsApiSearchResultMeta(BaseModel):
     """Metadata for payment_intents.Action.API_SEARCH operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class DisputesListResultMeta(BaseModel):
     """Metadata for disputes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
 class PayoutsListResultMeta(BaseModel):
     """Metadata for payouts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     has_more: bool | None = Field(default=None)
 
@@ -2798,7 +2798,7 @@ D = TypeVar('D')
 
 class ChargesSearchData(BaseModel):
     """Search result data for charges entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     amount: int | None = None
     """Amount intended to be collected by this payment in the smallest currency unit (e.g., 100 cents for $1.00), supporting up to eight digits."""
@@ -2906,7 +2906,7 @@ class ChargesSearchData(BaseModel):
 
 class CustomersSearchData(BaseModel):
     """Search result data for customers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account_balance: int | None = None
     """Current balance value representing funds owed by or to the customer."""
@@ -2974,7 +2974,7 @@ class CustomersSearchData(BaseModel):
 
 class InvoicesSearchData(BaseModel):
     """Search result data for invoices entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account_country: str | None = None
     """The country of the business associated with this invoice, commonly used to display localized content."""
@@ -3160,7 +3160,7 @@ class InvoicesSearchData(BaseModel):
 
 class RefundsSearchData(BaseModel):
     """Search result data for refunds entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     amount: int | None = None
     """Amount refunded, in cents (the smallest currency unit)."""
@@ -3198,7 +3198,7 @@ class RefundsSearchData(BaseModel):
 
 class SubscriptionsSearchData(BaseModel):
     """Search result data for subscriptions entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     application: str | None = None
     """For Connect platforms, the application associated with the subscription."""
@@ -3308,7 +3308,7 @@ class SubscriptionsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -3320,7 +3320,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
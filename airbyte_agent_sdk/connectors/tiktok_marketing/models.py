@@ -34,7 +34,7 @@ class TiktokMarketingReplicationConfig(BaseModel):
 
 class Advertiser(BaseModel):
     """TikTok advertiser account"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     advertiser_id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -68,7 +68,7 @@ class Advertiser(BaseModel):
 
 class Campaign(BaseModel):
     """TikTok marketing campaign"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     campaign_id: str | None = Field(default=None)
     campaign_name: str | None = Field(default=None)
@@ -102,7 +102,7 @@ class Campaign(BaseModel):
 
 class AdGroup(BaseModel):
     """TikTok ad group"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     adgroup_id: str | None = Field(default=None)
     campaign_id: str | None = Field(default=None)
@@ -203,7 +203,7 @@ class AdGroup(BaseModel):
 
 class Ad(BaseModel):
     """TikTok ad"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_id: str | None = Field(default=None)
     advertiser_id: str | None = Field(default=None)
@@ -257,7 +257,7 @@ class Ad(BaseModel):
 
 class Audience(BaseModel):
     """TikTok custom audience"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     audience_id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -273,7 +273,7 @@ class Audience(BaseModel):
 
 class CreativeAssetImage(BaseModel):
     """TikTok creative asset image"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     image_id: str | None = Field(default=None)
     format: str | None = Field(default=None)
@@ -291,7 +291,7 @@ class CreativeAssetImage(BaseModel):
 
 class CreativeAssetVideo(BaseModel):
     """TikTok creative asset video"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     video_id: str | None = Field(default=None)
     video_cover_url: str | None = Field(default=None)
@@ -316,7 +316,7 @@ class CreativeAssetVideo(BaseModel):
 
 class AdvertisersReportDaily(BaseModel):
     """Daily performance report at the advertiser level"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     advertiser_id: int | None = Field(default=None)
     stat_time_day: str | None = Field(default=None)
@@ -352,7 +352,7 @@ class AdvertisersReportDaily(BaseModel):
 
 class CampaignsReportDaily(BaseModel):
     """Daily performance report at the campaign level"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     campaign_id: int | None = Field(default=None)
     stat_time_day: str | None = Field(default=None)
@@ -387,7 +387,7 @@ class CampaignsReportDaily(BaseModel):
 
 class AdGroupsReportDaily(BaseModel):
     """Daily performance report at the ad group level"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     adgroup_id: int | None = Field(default=None)
     stat_time_day: str | None = Field(default=None)
@@ -440,7 +440,7 @@ class AdGroupsReportDaily(BaseModel):
 
 class AdsReportDaily(BaseModel):
     """Daily performance report at the ad level"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ad_id: int | None = Field(default=None)
     stat_time_day: str | None = Field(default=None)
@@ -499,67 +499,67 @@ class AdsReportDaily(BaseModel):
 
 class AdvertisersListResultMeta(BaseModel):
     """Metadata for advertisers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
 class AdGroupsListResultMeta(BaseModel):
     """Metadata for ad_groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
 class AdsListResultMeta(BaseModel):
     """Metadata for ads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
 class AudiencesListResultMeta(BaseModel):
     """Metadata for audiences.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
 class CreativeAssetsImagesListResultMeta(BaseModel):
     """Metadata for creative_assets_images.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
 class CreativeAssetsVideosListResultMeta(BaseModel):
     """Metadata for creative_assets_videos.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
 class AdvertisersReportsDailyListResultMeta(BaseModel):
     """Metadata for advertisers_reports_daily.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
 class CampaignsReportsDailyListResultMeta(BaseModel):
     """Metadata for campaigns_reports_daily.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
 class AdGroupsReportsDailyListResultMeta(BaseModel):
     """Metadata for ad_groups_reports_daily.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
 class AdsReportsDailyListResultMeta(BaseModel):
     """Metadata for ads_reports_daily.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     page_info: dict[str, Any] | None = Field(default=None)
 
@@ -616,7 +616,7 @@ D = TypeVar('D')
 
 class AdvertisersSearchData(BaseModel):
     """Search result data for advertisers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     address: str | None = None
     """The physical address of the advertiser."""
@@ -680,7 +680,7 @@ class AdvertisersSearchData(BaseModel):
 
 class CampaignsSearchData(BaseModel):
     """Search result data for campaigns entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     advertiser_id: int | None = None
     """The unique identifier of the advertiser associated with the campaign"""
@@ -732,7 +732,7 @@ class CampaignsSearchData(BaseModel):
 
 class AdGroupsSearchData(BaseModel):
     """Search result data for ad_groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     adgroup_id: int | None = None
     """The unique identifier of the ad group"""
@@ -764,7 +764,7 @@ class AdGroupsSearchData(BaseModel):
 
 class AdsSearchData(BaseModel):
     """Search result data for ads entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_format: str | None = None
     """The format of the ad"""
@@ -800,7 +800,7 @@ class AdsSearchData(BaseModel):
 
 class AudiencesSearchData(BaseModel):
     """Search result data for audiences entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     audience_id: str | None = None
     """Unique identifier for the audience"""
@@ -820,7 +820,7 @@ class AudiencesSearchData(BaseModel):
 
 class CreativeAssetsImagesSearchData(BaseModel):
     """Search result data for creative_assets_images entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     create_time: str | None = None
     """The timestamp when the image was created."""
@@ -844,7 +844,7 @@ class CreativeAssetsImagesSearchData(BaseModel):
 
 class CreativeAssetsVideosSearchData(BaseModel):
     """Search result data for creative_assets_videos entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     create_time: str | None = None
     """Timestamp when the video was created."""
@@ -870,7 +870,7 @@ class CreativeAssetsVideosSearchData(BaseModel):
 
 class AdvertisersReportsDailySearchData(BaseModel):
     """Search result data for advertisers_reports_daily entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     advertiser_id: int | None = None
     """The unique identifier for the advertiser."""
@@ -938,7 +938,7 @@ class AdvertisersReportsDailySearchData(BaseModel):
 
 class CampaignsReportsDailySearchData(BaseModel):
     """Search result data for campaigns_reports_daily entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     campaign_id: int | None = None
     """The unique identifier for the campaign."""
@@ -1004,7 +1004,7 @@ class CampaignsReportsDailySearchData(BaseModel):
 
 class AdGroupsReportsDailySearchData(BaseModel):
     """Search result data for ad_groups_reports_daily entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     adgroup_id: int | None = None
     """The unique identifier for the ad group."""
@@ -1106,7 +1106,7 @@ class AdGroupsReportsDailySearchData(BaseModel):
 
 class AdsReportsDailySearchData(BaseModel):
     """Search result data for ads_reports_daily entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ad_id: int | None = None
     """The unique identifier for the ad."""
@@ -1216,7 +1216,7 @@ class AdsReportsDailySearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1228,7 +1228,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -37,7 +37,7 @@ class TwilioReplicationConfig(BaseModel):
 
 class Account(BaseModel):
     """A Twilio account"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     auth_token: str | None = Field(default=None)
     date_created: str | None = Field(default=None)
@@ -52,7 +52,7 @@ class Account(BaseModel):
 
 class AccountsList(BaseModel):
     """Paginated list of accounts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     accounts: list[Account] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -64,7 +64,7 @@ class AccountsList(BaseModel):
 
 class Call(BaseModel):
     """A Twilio call"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     sid: str | None
     date_created: str | None = Field(default=None)
@@ -96,7 +96,7 @@ class Call(BaseModel):
 
 class CallsList(BaseModel):
     """Paginated list of calls"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     calls: list[Call] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -108,7 +108,7 @@ class CallsList(BaseModel):
 
 class Message(BaseModel):
     """A Twilio message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_sid: str | None = Field(default=None)
     api_version: str | None = Field(default=None)
@@ -133,7 +133,7 @@ class Message(BaseModel):
 
 class MessagesList(BaseModel):
     """Paginated list of messages"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     messages: list[Message] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -145,7 +145,7 @@ class MessagesList(BaseModel):
 
 class IncomingPhoneNumberCapabilities(BaseModel):
     """Capabilities of this phone number"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     voice: bool | None | None = Field(default=None)
     sms: bool | None | None = Field(default=None)
@@ -154,7 +154,7 @@ class IncomingPhoneNumberCapabilities(BaseModel):
 
 class IncomingPhoneNumber(BaseModel):
     """A Twilio incoming phone number"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     sid: str | None
     account_sid: str | None = Field(default=None)
@@ -195,7 +195,7 @@ class IncomingPhoneNumber(BaseModel):
 
 class IncomingPhoneNumbersList(BaseModel):
     """Paginated list of incoming phone numbers"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     incoming_phone_numbers: list[IncomingPhoneNumber] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -207,7 +207,7 @@ class IncomingPhoneNumbersList(BaseModel):
 
 class Recording(BaseModel):
     """A Twilio recording"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_sid: str | None = Field(default=None)
     api_version: str | None = Field(default=None)
@@ -231,7 +231,7 @@ class Recording(BaseModel):
 
 class RecordingsList(BaseModel):
     """Paginated list of recordings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     recordings: list[Recording] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -243,7 +243,7 @@ class RecordingsList(BaseModel):
 
 class Conference(BaseModel):
     """A Twilio conference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_sid: str | None = Field(default=None)
     date_created: str | None = Field(default=None)
@@ -260,7 +260,7 @@ class Conference(BaseModel):
 
 class ConferencesList(BaseModel):
     """Paginated list of conferences"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     conferences: list[Conference] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -272,7 +272,7 @@ class ConferencesList(BaseModel):
 
 class UsageRecord(BaseModel):
     """A Twilio usage record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_sid: str | None = Field(default=None)
     api_version: str | None = Field(default=None)
@@ -292,7 +292,7 @@ class UsageRecord(BaseModel):
 
 class UsageRecordsList(BaseModel):
     """Paginated list of usage records"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     usage_records: list[UsageRecord] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -304,7 +304,7 @@ class UsageRecordsList(BaseModel):
 
 class Address(BaseModel):
     """A Twilio address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_sid: str | None = Field(default=None)
     city: str | None = Field(default=None)
@@ -325,7 +325,7 @@ class Address(BaseModel):
 
 class AddressesList(BaseModel):
     """Paginated list of addresses"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     addresses: list[Address] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -337,7 +337,7 @@ class AddressesList(BaseModel):
 
 class Queue(BaseModel):
     """A Twilio queue"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_sid: str | None = Field(default=None)
     average_wait_time: int | None = Field(default=None)
@@ -352,7 +352,7 @@ class Queue(BaseModel):
 
 class QueuesList(BaseModel):
     """Paginated list of queues"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     queues: list[Queue] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -364,7 +364,7 @@ class QueuesList(BaseModel):
 
 class Transcription(BaseModel):
     """A Twilio transcription"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_sid: str | None = Field(default=None)
     api_version: str | None = Field(default=None)
@@ -382,7 +382,7 @@ class Transcription(BaseModel):
 
 class TranscriptionsList(BaseModel):
     """Paginated list of transcriptions"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     transcriptions: list[Transcription] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -394,7 +394,7 @@ class TranscriptionsList(BaseModel):
 
 class OutgoingCallerId(BaseModel):
     """A Twilio outgoing caller ID"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_sid: str | None = Field(default=None)
     date_created: str | None = Field(default=None)
@@ -406,7 +406,7 @@ class OutgoingCallerId(BaseModel):
 
 class OutgoingCallerIdsList(BaseModel):
     """Paginated list of outgoing caller IDs"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     outgoing_caller_ids: list[OutgoingCallerId] | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -418,7 +418,7 @@ class OutgoingCallerIdsList(BaseModel):
 
 class MessageCreateParams(BaseModel):
     """Parameters for sending a new SMS/MMS/WhatsApp message"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     to: str | None = Field(default=None, alias="To")
     from_: str | None = Field(default=None, alias="From")
@@ -430,7 +430,7 @@ class MessageCreateParams(BaseModel):
 
 class CallCreateParams(BaseModel):
     """Parameters for placing an outbound call"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     to: str | None = Field(default=None, alias="To")
     from_: str | None = Field(default=None, alias="From")
@@ -447,7 +447,7 @@ class CallCreateParams(BaseModel):
 
 class IncomingPhoneNumberCreateParams(BaseModel):
     """Parameters for provisioning a new phone number"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     phone_number: str | None = Field(default=None, alias="PhoneNumber")
     area_code: str | None = Field(default=None, alias="AreaCode")
@@ -465,7 +465,7 @@ class IncomingPhoneNumberCreateParams(BaseModel):
 
 class AccountsListResultMeta(BaseModel):
     """Metadata for accounts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -474,7 +474,7 @@ class AccountsListResultMeta(BaseModel):
 
 class CallsListResultMeta(BaseModel):
     """Metadata for calls.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -483,7 +483,7 @@ class CallsListResultMeta(BaseModel):
 
 class MessagesListResultMeta(BaseModel):
     """Metadata for messages.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -492,7 +492,7 @@ class MessagesListResultMeta(BaseModel):
 
 class IncomingPhoneNumbersListResultMeta(BaseModel):
     """Metadata for incoming_phone_numbers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -501,7 +501,7 @@ class IncomingPhoneNumbersListResultMeta(BaseModel):
 
 class RecordingsListResultMeta(BaseModel):
     """Metadata for recordings.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -510,7 +510,7 @@ class RecordingsListResultMeta(BaseModel):
 
 class ConferencesListResultMeta(BaseModel):
     """Metadata for conferences.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -519,7 +519,7 @@ class ConferencesListResultMeta(BaseModel):
 
 class UsageRecordsListResultMeta(BaseModel):
     """Metadata for usage_records.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -528,7 +528,7 @@ class UsageRecordsListResultMeta(BaseModel):
 
 class AddressesListResultMeta(BaseModel):
     """Metadata for addresses.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -537,7 +537,7 @@ class AddressesListResultMeta(BaseModel):
 
 class QueuesListResultMeta(BaseModel):
     """Metadata for queues.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -546,7 +546,7 @@ class QueuesListResultMeta(BaseModel):
 
 class TranscriptionsListResultMeta(BaseModel):
     """Metadata for transcriptions.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -555,7 +555,7 @@ class TranscriptionsListResultMeta(BaseModel):
 
 class OutgoingCallerIdsListResultMeta(BaseModel):
     """Metadata for outgoing_caller_ids.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page_uri: str | None = Field(default=None)
     first_page_uri: str | None = Field(default=None)
@@ -615,7 +615,7 @@ D = TypeVar('D')
 
 class AccountsSearchData(BaseModel):
     """Search result data for accounts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     sid: str | None = None
     """The unique identifier for the account"""
@@ -637,7 +637,7 @@ class AccountsSearchData(BaseModel):
 
 class CallsSearchData(BaseModel):
     """Search result data for calls entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     sid: str | None = None
     """The unique identifier for the call"""
@@ -669,7 +669,7 @@ class CallsSearchData(BaseModel):
 
 class MessagesSearchData(BaseModel):
     """Search result data for messages entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     sid: str | None = None
     """The unique identifier for this message"""
@@ -705,7 +705,7 @@ class MessagesSearchData(BaseModel):
 
 class IncomingPhoneNumbersSearchData(BaseModel):
     """Search result data for incoming_phone_numbers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     sid: str | None = None
     """The SID of this phone number"""
@@ -727,7 +727,7 @@ class IncomingPhoneNumbersSearchData(BaseModel):
 
 class RecordingsSearchData(BaseModel):
     """Search result data for recordings entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     sid: str | None = None
     """The unique identifier of the recording"""
@@ -753,7 +753,7 @@ class RecordingsSearchData(BaseModel):
 
 class ConferencesSearchData(BaseModel):
     """Search result data for conferences entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     sid: str | None = None
     """The unique identifier of the conference"""
@@ -773,7 +773,7 @@ class ConferencesSearchData(BaseModel):
 
 class UsageRecordsSearchData(BaseModel):
     """Search result data for usage_records entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account_sid: str | None = None
     """The account SID associated with this usage record"""
@@ -801,7 +801,7 @@ class UsageRecordsSearchData(BaseModel):
 
 class AddressesSearchData(BaseModel):
     """Search result data for addresses entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     sid: str | None = None
     """The unique identifier of the address"""
@@ -829,7 +829,7 @@ class AddressesSearchData(BaseModel):
 
 class QueuesSearchData(BaseModel):
     """Search result data for queues entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     sid: str | None = None
     """The unique identifier for the queue"""
@@ -851,7 +851,7 @@ class QueuesSearchData(BaseModel):
 
 class TranscriptionsSearchData(BaseModel):
     """Search result data for transcriptions entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     sid: str | None = None
     """The unique identifier for the transcription"""
@@ -875,7 +875,7 @@ class TranscriptionsSearchData(BaseModel):
 
 class OutgoingCallerIdsSearchData(BaseModel):
     """Search result data for outgoing_caller_ids entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     sid: str | None = None
     """The unique identifier"""
@@ -895,7 +895,7 @@ class OutgoingCallerIdsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -907,7 +907,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -34,7 +34,7 @@ class TypeformReplicationConfig(BaseModel):
 
 class FormThankyouScreensItemLayoutAttachment(BaseModel):
     """Nested schema for FormThankyouScreensItemLayout.attachment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     href: str | None | None = Field(default=None)
@@ -42,14 +42,14 @@ class FormThankyouScreensItemLayoutAttachment(BaseModel):
 
 class FormThankyouScreensItemLayoutPropertiesFocalPoint(BaseModel):
     """Nested schema for FormThankyouScreensItemLayoutProperties.focal_point"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     x: float | None | None = Field(default=None)
     y: float | None | None = Field(default=None)
 
 class FormThankyouScreensItemLayoutProperties(BaseModel):
     """Nested schema for FormThankyouScreensItemLayout.properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     brightness: float | None | None = Field(default=None)
     description: str | None | None = Field(default=None)
@@ -57,7 +57,7 @@ class FormThankyouScreensItemLayoutProperties(BaseModel):
 
 class FormThankyouScreensItemLayout(BaseModel):
     """Nested schema for FormThankyouScreensItem.layout"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     placement: str | None | None = Field(default=None)
@@ -66,14 +66,14 @@ class FormThankyouScreensItemLayout(BaseModel):
 
 class FormThankyouScreensItemAttachment(BaseModel):
     """Nested schema for FormThankyouScreensItem.attachment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     placement: str | None | None = Field(default=None)
 
 class FormThankyouScreensItemProperties(BaseModel):
     """Nested schema for FormThankyouScreensItem.properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     show_button: bool | None | None = Field(default=None)
     share_icons: bool | None | None = Field(default=None)
@@ -83,7 +83,7 @@ class FormThankyouScreensItemProperties(BaseModel):
 
 class FormThankyouScreensItem(BaseModel):
     """Nested schema for Form.thankyou_screens_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     ref: str | None | None = Field(default=None)
@@ -94,20 +94,20 @@ class FormThankyouScreensItem(BaseModel):
 
 class FormFieldsItemAttachment(BaseModel):
     """Nested schema for FormFieldsItem.attachment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     href: str | None | None = Field(default=None)
 
 class FormFieldsItemValidations(BaseModel):
     """Nested schema for FormFieldsItem.validations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     required: bool | None | None = Field(default=None)
 
 class FormFieldsItemPropertiesChoicesItem(BaseModel):
     """Nested schema for FormFieldsItemProperties.choices_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     ref: str | None | None = Field(default=None)
@@ -115,7 +115,7 @@ class FormFieldsItemPropertiesChoicesItem(BaseModel):
 
 class FormFieldsItemProperties(BaseModel):
     """Nested schema for FormFieldsItem.properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     randomize: bool | None | None = Field(default=None)
     allow_multiple_selection: bool | None | None = Field(default=None)
@@ -125,14 +125,14 @@ class FormFieldsItemProperties(BaseModel):
 
 class FormFieldsItemLayoutPropertiesFocalPoint(BaseModel):
     """Nested schema for FormFieldsItemLayoutProperties.focal_point"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     x: float | None | None = Field(default=None)
     y: float | None | None = Field(default=None)
 
 class FormFieldsItemLayoutProperties(BaseModel):
     """Nested schema for FormFieldsItemLayout.properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     brightness: float | None | None = Field(default=None)
     description: str | None | None = Field(default=None)
@@ -140,7 +140,7 @@ class FormFieldsItemLayoutProperties(BaseModel):
 
 class FormFieldsItemLayoutAttachment(BaseModel):
     """Nested schema for FormFieldsItemLayout.attachment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     href: str | None | None = Field(default=None)
@@ -148,7 +148,7 @@ class FormFieldsItemLayoutAttachment(BaseModel):
 
 class FormFieldsItemLayout(BaseModel):
     """Nested schema for FormFieldsItem.layout"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     placement: str | None | None = Field(default=None)
@@ -157,7 +157,7 @@ class FormFieldsItemLayout(BaseModel):
 
 class FormFieldsItem(BaseModel):
     """Nested schema for Form.fields_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     title: str | None | None = Field(default=None)
@@ -170,7 +170,7 @@ class FormFieldsItem(BaseModel):
 
 class FormSettingsCuiSettings(BaseModel):
     """Nested schema for FormSettings.cui_settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     avatar: str | None | None = Field(default=None)
     is_typing_emulation_disabled: bool | None | None = Field(default=None)
@@ -178,20 +178,20 @@ class FormSettingsCuiSettings(BaseModel):
 
 class FormSettingsCapabilitiesE2eEncryption(BaseModel):
     """Nested schema for FormSettingsCapabilities.e2e_encryption"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None | None = Field(default=None)
     modifiable: bool | None | None = Field(default=None)
 
 class FormSettingsCapabilities(BaseModel):
     """Nested schema for FormSettings.capabilities"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     e2e_encryption: FormSettingsCapabilitiesE2eEncryption | None | None = Field(default=None)
 
 class FormSettingsNotificationsRespondent(BaseModel):
     """Nested schema for FormSettingsNotifications.respondent"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None | None = Field(default=None)
     recipients: list[str | None] | None | None = Field(default=None)
@@ -201,7 +201,7 @@ class FormSettingsNotificationsRespondent(BaseModel):
 
 class FormSettingsNotificationsSelf(BaseModel):
     """Nested schema for FormSettingsNotifications.self"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     enabled: bool | None | None = Field(default=None)
     recipients: list[str | None] | None | None = Field(default=None)
@@ -211,20 +211,20 @@ class FormSettingsNotificationsSelf(BaseModel):
 
 class FormSettingsNotifications(BaseModel):
     """Nested schema for FormSettings.notifications"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     self: FormSettingsNotificationsSelf | None | None = Field(default=None)
     respondent: FormSettingsNotificationsRespondent | None | None = Field(default=None)
 
 class FormSettingsMetaImage(BaseModel):
     """Nested schema for FormSettingsMeta.image"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None | None = Field(default=None)
 
 class FormSettingsMeta(BaseModel):
     """Meta information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     allow_indexing: bool | None | None = Field(default=None)
     title: str | None | None = Field(default=None)
@@ -233,7 +233,7 @@ class FormSettingsMeta(BaseModel):
 
 class FormSettings(BaseModel):
     """Settings and configurations for the form"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     language: str | None | None = Field(default=None, description="Language of the form")
     """Language of the form"""
@@ -258,42 +258,42 @@ class FormSettings(BaseModel):
 
 class FormLogicItemActionsItemConditionVarsItem(BaseModel):
     """Nested schema for FormLogicItemActionsItemCondition.vars_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     value: str | None | None = Field(default=None)
 
 class FormLogicItemActionsItemCondition(BaseModel):
     """Nested schema for FormLogicItemActionsItem.condition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     op: str | None | None = Field(default=None)
     vars: list[FormLogicItemActionsItemConditionVarsItem | None] | None | None = Field(default=None)
 
 class FormLogicItemActionsItemDetailsTarget(BaseModel):
     """Nested schema for FormLogicItemActionsItemDetails.target"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     value: str | None | None = Field(default=None)
 
 class FormLogicItemActionsItemDetailsTo(BaseModel):
     """Nested schema for FormLogicItemActionsItemDetails.to"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     value: str | None | None = Field(default=None)
 
 class FormLogicItemActionsItemDetailsValue(BaseModel):
     """Nested schema for FormLogicItemActionsItemDetails.value"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     value: str | None | None = Field(default=None)
 
 class FormLogicItemActionsItemDetails(BaseModel):
     """Nested schema for FormLogicItemActionsItem.details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     to: FormLogicItemActionsItemDetailsTo | None | None = Field(default=None)
     target: FormLogicItemActionsItemDetailsTarget | None | None = Field(default=None)
@@ -301,7 +301,7 @@ class FormLogicItemActionsItemDetails(BaseModel):
 
 class FormLogicItemActionsItem(BaseModel):
     """Nested schema for FormLogicItem.actions_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     action: str | None | None = Field(default=None)
     details: FormLogicItemActionsItemDetails | None | None = Field(default=None)
@@ -309,7 +309,7 @@ class FormLogicItemActionsItem(BaseModel):
 
 class FormLogicItem(BaseModel):
     """Nested schema for Form.logic_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     ref: str | None | None = Field(default=None)
@@ -317,28 +317,28 @@ class FormLogicItem(BaseModel):
 
 class FormSelf(BaseModel):
     """Self-referential link to this form"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None | None = Field(default=None, description="URL of this form resource")
     """URL of this form resource"""
 
 class FormWorkspace(BaseModel):
     """Workspace details where the form belongs"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None | None = Field(default=None, description="URL of the workspace")
     """URL of the workspace"""
 
 class FormWelcomeScreensItemLayoutPropertiesFocalPoint(BaseModel):
     """Nested schema for FormWelcomeScreensItemLayoutProperties.focal_point"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     x: float | None | None = Field(default=None)
     y: float | None | None = Field(default=None)
 
 class FormWelcomeScreensItemLayoutProperties(BaseModel):
     """Nested schema for FormWelcomeScreensItemLayout.properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     brightness: float | None | None = Field(default=None)
     description: str | None | None = Field(default=None)
@@ -346,7 +346,7 @@ class FormWelcomeScreensItemLayoutProperties(BaseModel):
 
 class FormWelcomeScreensItemLayoutAttachment(BaseModel):
     """Nested schema for FormWelcomeScreensItemLayout.attachment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     href: str | None | None = Field(default=None)
@@ -354,7 +354,7 @@ class FormWelcomeScreensItemLayoutAttachment(BaseModel):
 
 class FormWelcomeScreensItemLayout(BaseModel):
     """Nested schema for FormWelcomeScreensItem.layout"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     placement: str | None | None = Field(default=None)
@@ -363,7 +363,7 @@ class FormWelcomeScreensItemLayout(BaseModel):
 
 class FormWelcomeScreensItemProperties(BaseModel):
     """Nested schema for FormWelcomeScreensItem.properties"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     show_button: bool | None | None = Field(default=None)
     share_icons: bool | None | None = Field(default=None)
@@ -373,14 +373,14 @@ class FormWelcomeScreensItemProperties(BaseModel):
 
 class FormWelcomeScreensItemAttachment(BaseModel):
     """Nested schema for FormWelcomeScreensItem.attachment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None | None = Field(default=None, alias="type")
     placement: str | None | None = Field(default=None)
 
 class FormWelcomeScreensItem(BaseModel):
     """Nested schema for Form.welcome_screens_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     ref: str | None | None = Field(default=None)
@@ -391,20 +391,20 @@ class FormWelcomeScreensItem(BaseModel):
 
 class FormTheme(BaseModel):
     """Theme settings for the form"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None | None = Field(default=None, description="URL of the theme")
     """URL of the theme"""
 
 class FormLinks(BaseModel):
     """Links to related resources"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     display: str | None | None = Field(default=None)
 
 class Form(BaseModel):
     """A Typeform form with its fields, settings, and logic"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     type_: str | None = Field(default=None, alias="type")
@@ -424,7 +424,7 @@ class Form(BaseModel):
 
 class FormsList(BaseModel):
     """Paginated list of forms"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_items: int | None = Field(default=None)
     page_count: int | None = Field(default=None)
@@ -432,7 +432,7 @@ class FormsList(BaseModel):
 
 class ResponseVariablesItem(BaseModel):
     """Nested schema for Response.variables_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     key: str | None | None = Field(default=None)
     type_: str | None | None = Field(default=None, alias="type")
@@ -441,14 +441,14 @@ class ResponseVariablesItem(BaseModel):
 
 class ResponseAnswersItemChoice(BaseModel):
     """Nested schema for ResponseAnswersItem.choice"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     label: str | None | None = Field(default=None)
 
 class ResponseAnswersItemPayment(BaseModel):
     """Nested schema for ResponseAnswersItem.payment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     amount: str | None | None = Field(default=None)
     last4: str | None | None = Field(default=None)
@@ -457,14 +457,14 @@ class ResponseAnswersItemPayment(BaseModel):
 
 class ResponseAnswersItemChoices(BaseModel):
     """Nested schema for ResponseAnswersItem.choices"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ids: list[str | None] | None | None = Field(default=None)
     labels: list[str | None] | None | None = Field(default=None)
 
 class ResponseAnswersItemField(BaseModel):
     """Nested schema for ResponseAnswersItem.field"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     ref: str | None | None = Field(default=None)
@@ -472,7 +472,7 @@ class ResponseAnswersItemField(BaseModel):
 
 class ResponseAnswersItem(BaseModel):
     """Nested schema for Response.answers_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     field: ResponseAnswersItemField | None | None = Field(default=None)
     type_: str | None | None = Field(default=None, alias="type")
@@ -490,7 +490,7 @@ class ResponseAnswersItem(BaseModel):
 
 class ResponseMetadata(BaseModel):
     """Metadata related to the response"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user_agent: str | None | None = Field(default=None)
     platform: str | None | None = Field(default=None)
@@ -499,13 +499,13 @@ class ResponseMetadata(BaseModel):
 
 class ResponseCalculated(BaseModel):
     """Calculated data related to the response"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     score: int | None | None = Field(default=None)
 
 class Response(BaseModel):
     """A single form response/submission"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     response_id: str | None = Field(default=None)
     response_type: str | None = Field(default=None)
@@ -522,7 +522,7 @@ class Response(BaseModel):
 
 class ResponsesList(BaseModel):
     """Paginated list of responses"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_items: int | None = Field(default=None)
     page_count: int | None = Field(default=None)
@@ -530,7 +530,7 @@ class ResponsesList(BaseModel):
 
 class Webhook(BaseModel):
     """A webhook configured for a form"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     form_id: str | None = Field(default=None)
@@ -543,13 +543,13 @@ class Webhook(BaseModel):
 
 class WebhooksList(BaseModel):
     """List of webhooks"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     items: list[Webhook] | None = Field(default=None)
 
 class WorkspaceForms(BaseModel):
     """Information about forms in the workspace"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     count: float | None | None = Field(default=None, description="Total number of forms in this workspace")
     """Total number of forms in this workspace"""
@@ -558,14 +558,14 @@ class WorkspaceForms(BaseModel):
 
 class WorkspaceSelf(BaseModel):
     """Self-referential link"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     href: str | None | None = Field(default=None, description="URL to this workspace")
     """URL to this workspace"""
 
 class Workspace(BaseModel):
     """A workspace containing forms"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -577,7 +577,7 @@ class Workspace(BaseModel):
 
 class WorkspacesList(BaseModel):
     """Paginated list of workspaces"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_items: int | None = Field(default=None)
     page_count: int | None = Field(default=None)
@@ -585,7 +585,7 @@ class WorkspacesList(BaseModel):
 
 class Image(BaseModel):
     """An image in the account"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     file_name: str | None = Field(default=None)
@@ -599,7 +599,7 @@ class Image(BaseModel):
 
 class ThemeBackground(BaseModel):
     """Background settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     brightness: float | None | None = Field(default=None)
     href: str | None | None = Field(default=None)
@@ -607,7 +607,7 @@ class ThemeBackground(BaseModel):
 
 class ThemeColors(BaseModel):
     """Color settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     answer: str | None | None = Field(default=None, description="Color of answer text")
     """Color of answer text"""
@@ -620,21 +620,21 @@ class ThemeColors(BaseModel):
 
 class ThemeFields(BaseModel):
     """Field display settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     alignment: str | None | None = Field(default=None)
     font_size: str | None | None = Field(default=None)
 
 class ThemeScreens(BaseModel):
     """Screen display settings"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     alignment: str | None | None = Field(default=None)
     font_size: str | None | None = Field(default=None)
 
 class Theme(BaseModel):
     """A theme used for styling forms"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -651,7 +651,7 @@ class Theme(BaseModel):
 
 class ThemesList(BaseModel):
     """Paginated list of themes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_items: int | None = Field(default=None)
     page_count: int | None = Field(default=None)
@@ -662,28 +662,28 @@ class ThemesList(BaseModel):
 
 class FormsListResultMeta(BaseModel):
     """Metadata for forms.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_items: int | None = Field(default=None)
     page_count: int | None = Field(default=None)
 
 class ResponsesListResultMeta(BaseModel):
     """Metadata for responses.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_items: int | None = Field(default=None)
     page_count: int | None = Field(default=None)
 
 class WorkspacesListResultMeta(BaseModel):
     """Metadata for workspaces.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_items: int | None = Field(default=None)
     page_count: int | None = Field(default=None)
 
 class ThemesListResultMeta(BaseModel):
     """Metadata for themes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total_items: int | None = Field(default=None)
     page_count: int | None = Field(default=None)
@@ -741,7 +741,7 @@ D = TypeVar('D')
 
 class FormsSearchData(BaseModel):
     """Search result data for forms entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     links: dict[str, Any] | None = None
     """Links to related resources"""
@@ -775,7 +775,7 @@ class FormsSearchData(BaseModel):
 
 class ResponsesSearchData(BaseModel):
     """Search result data for responses entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     answers: list[Any] | None = None
     """Response data for each question in the form"""
@@ -805,7 +805,7 @@ class ResponsesSearchData(BaseModel):
 
 class WebhooksSearchData(BaseModel):
     """Search result data for webhooks entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """Timestamp when the webhook was created"""
@@ -827,7 +827,7 @@ class WebhooksSearchData(BaseModel):
 
 class WorkspacesSearchData(BaseModel):
     """Search result data for workspaces entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     account_id: str | None = None
     """Account ID associated with the workspace"""
@@ -847,7 +847,7 @@ class WorkspacesSearchData(BaseModel):
 
 class ImagesSearchData(BaseModel):
     """Search result data for images entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     avg_color: str | None = None
     """Average color of the image"""
@@ -869,7 +869,7 @@ class ImagesSearchData(BaseModel):
 
 class ThemesSearchData(BaseModel):
     """Search result data for themes entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     background: dict[str, Any] | None = None
     """Background settings for the theme"""
@@ -901,7 +901,7 @@ class ThemesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -913,7 +913,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
@@ -36,7 +36,7 @@ class WoocommerceReplicationConfig(BaseModel):
 
 class CustomerShipping(BaseModel):
     """List of shipping address data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first_name: str | None | None = Field(default=None)
     last_name: str | None | None = Field(default=None)
@@ -50,7 +50,7 @@ class CustomerShipping(BaseModel):
 
 class CustomerBilling(BaseModel):
     """List of billing address data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first_name: str | None | None = Field(default=None)
     last_name: str | None | None = Field(default=None)
@@ -66,7 +66,7 @@ class CustomerBilling(BaseModel):
 
 class CustomerMetaDataItem(BaseModel):
     """Nested schema for Customer.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -74,7 +74,7 @@ class CustomerMetaDataItem(BaseModel):
 
 class Customer(BaseModel):
     """Customer type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     date_created: str | None = Field(default=None)
@@ -94,7 +94,7 @@ class Customer(BaseModel):
 
 class OrderBilling(BaseModel):
     """Billing address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first_name: str | None | None = Field(default=None)
     last_name: str | None | None = Field(default=None)
@@ -110,7 +110,7 @@ class OrderBilling(BaseModel):
 
 class OrderFeeLinesItemTaxesItem(BaseModel):
     """Nested schema for OrderFeeLinesItem.taxes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     total: str | None | None = Field(default=None)
@@ -118,7 +118,7 @@ class OrderFeeLinesItemTaxesItem(BaseModel):
 
 class OrderFeeLinesItemMetaDataItem(BaseModel):
     """Nested schema for OrderFeeLinesItem.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -126,7 +126,7 @@ class OrderFeeLinesItemMetaDataItem(BaseModel):
 
 class OrderFeeLinesItem(BaseModel):
     """Nested schema for Order.fee_lines_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -139,7 +139,7 @@ class OrderFeeLinesItem(BaseModel):
 
 class OrderMetaDataItem(BaseModel):
     """Nested schema for Order.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -147,7 +147,7 @@ class OrderMetaDataItem(BaseModel):
 
 class OrderCouponLinesItemMetaDataItem(BaseModel):
     """Nested schema for OrderCouponLinesItem.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -155,7 +155,7 @@ class OrderCouponLinesItemMetaDataItem(BaseModel):
 
 class OrderCouponLinesItem(BaseModel):
     """Nested schema for Order.coupon_lines_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     code: str | None | None = Field(default=None)
@@ -165,7 +165,7 @@ class OrderCouponLinesItem(BaseModel):
 
 class OrderLineItemsItemMetaDataItem(BaseModel):
     """Nested schema for OrderLineItemsItem.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -175,7 +175,7 @@ class OrderLineItemsItemMetaDataItem(BaseModel):
 
 class OrderLineItemsItemTaxesItem(BaseModel):
     """Nested schema for OrderLineItemsItem.taxes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     total: str | None | None = Field(default=None)
@@ -183,14 +183,14 @@ class OrderLineItemsItemTaxesItem(BaseModel):
 
 class OrderLineItemsItemImage(BaseModel):
     """Nested schema for OrderLineItemsItem.image"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: Any | None = Field(default=None)
     src: str | None | None = Field(default=None)
 
 class OrderLineItemsItem(BaseModel):
     """Nested schema for Order.line_items_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -211,7 +211,7 @@ class OrderLineItemsItem(BaseModel):
 
 class OrderTaxLinesItemMetaDataItem(BaseModel):
     """Nested schema for OrderTaxLinesItem.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -219,7 +219,7 @@ class OrderTaxLinesItemMetaDataItem(BaseModel):
 
 class OrderTaxLinesItem(BaseModel):
     """Nested schema for Order.tax_lines_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     rate_code: str | None | None = Field(default=None)
@@ -232,7 +232,7 @@ class OrderTaxLinesItem(BaseModel):
 
 class OrderRefundsItem(BaseModel):
     """Nested schema for Order.refunds_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     reason: str | None | None = Field(default=None)
@@ -240,7 +240,7 @@ class OrderRefundsItem(BaseModel):
 
 class OrderShipping(BaseModel):
     """Shipping address"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first_name: str | None | None = Field(default=None)
     last_name: str | None | None = Field(default=None)
@@ -254,7 +254,7 @@ class OrderShipping(BaseModel):
 
 class OrderShippingLinesItemMetaDataItem(BaseModel):
     """Nested schema for OrderShippingLinesItem.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -262,7 +262,7 @@ class OrderShippingLinesItemMetaDataItem(BaseModel):
 
 class OrderShippingLinesItemTaxesItem(BaseModel):
     """Nested schema for OrderShippingLinesItem.taxes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     total: str | None | None = Field(default=None)
@@ -270,7 +270,7 @@ class OrderShippingLinesItemTaxesItem(BaseModel):
 
 class OrderShippingLinesItem(BaseModel):
     """Nested schema for Order.shipping_lines_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     method_title: str | None | None = Field(default=None)
@@ -282,7 +282,7 @@ class OrderShippingLinesItem(BaseModel):
 
 class Order(BaseModel):
     """Order type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     parent_id: int | None = Field(default=None)
@@ -333,7 +333,7 @@ class Order(BaseModel):
 
 class ProductMetaDataItem(BaseModel):
     """Nested schema for Product.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -341,7 +341,7 @@ class ProductMetaDataItem(BaseModel):
 
 class ProductDimensions(BaseModel):
     """Product dimensions"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     length: str | None | None = Field(default=None)
     width: str | None | None = Field(default=None)
@@ -349,7 +349,7 @@ class ProductDimensions(BaseModel):
 
 class ProductDownloadsItem(BaseModel):
     """Nested schema for Product.downloads_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -357,7 +357,7 @@ class ProductDownloadsItem(BaseModel):
 
 class ProductTagsItem(BaseModel):
     """Nested schema for Product.tags_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -365,7 +365,7 @@ class ProductTagsItem(BaseModel):
 
 class ProductImagesItem(BaseModel):
     """Nested schema for Product.images_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     date_created: str | None | None = Field(default=None)
@@ -378,7 +378,7 @@ class ProductImagesItem(BaseModel):
 
 class ProductAttributesItem(BaseModel):
     """Nested schema for Product.attributes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -389,7 +389,7 @@ class ProductAttributesItem(BaseModel):
 
 class ProductDefaultAttributesItem(BaseModel):
     """Nested schema for Product.default_attributes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -397,7 +397,7 @@ class ProductDefaultAttributesItem(BaseModel):
 
 class ProductCategoriesItem(BaseModel):
     """Nested schema for Product.categories_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -405,7 +405,7 @@ class ProductCategoriesItem(BaseModel):
 
 class Product(BaseModel):
     """Product type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -480,7 +480,7 @@ class Product(BaseModel):
 
 class CouponMetaDataItem(BaseModel):
     """Nested schema for Coupon.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -488,7 +488,7 @@ class CouponMetaDataItem(BaseModel):
 
 class Coupon(BaseModel):
     """Coupon type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     code: str | None = Field(default=None)
@@ -521,7 +521,7 @@ class Coupon(BaseModel):
 
 class ProductCategoryImage(BaseModel):
     """Image data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     date_created: str | None | None = Field(default=None)
@@ -534,7 +534,7 @@ class ProductCategoryImage(BaseModel):
 
 class ProductCategory(BaseModel):
     """ProductCategory type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -548,7 +548,7 @@ class ProductCategory(BaseModel):
 
 class ProductTag(BaseModel):
     """ProductTag type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -558,7 +558,7 @@ class ProductTag(BaseModel):
 
 class ProductReview(BaseModel):
     """ProductReview type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     date_created: str | None = Field(default=None)
@@ -576,7 +576,7 @@ class ProductReview(BaseModel):
 
 class ProductAttribute(BaseModel):
     """ProductAttribute type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -587,7 +587,7 @@ class ProductAttribute(BaseModel):
 
 class ProductVariationAttributesItem(BaseModel):
     """Nested schema for ProductVariation.attributes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -595,7 +595,7 @@ class ProductVariationAttributesItem(BaseModel):
 
 class ProductVariationDownloadsItem(BaseModel):
     """Nested schema for ProductVariation.downloads_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -603,7 +603,7 @@ class ProductVariationDownloadsItem(BaseModel):
 
 class ProductVariationDimensions(BaseModel):
     """Variation dimensions"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     length: str | None | None = Field(default=None)
     width: str | None | None = Field(default=None)
@@ -611,7 +611,7 @@ class ProductVariationDimensions(BaseModel):
 
 class ProductVariationMetaDataItem(BaseModel):
     """Nested schema for ProductVariation.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -619,7 +619,7 @@ class ProductVariationMetaDataItem(BaseModel):
 
 class ProductVariationImage(BaseModel):
     """Variation image data"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     date_created: str | None | None = Field(default=None)
@@ -632,7 +632,7 @@ class ProductVariationImage(BaseModel):
 
 class ProductVariation(BaseModel):
     """ProductVariation type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     date_created: str | None = Field(default=None)
@@ -681,7 +681,7 @@ class ProductVariation(BaseModel):
 
 class OrderNote(BaseModel):
     """OrderNote type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     author: str | None = Field(default=None)
@@ -692,7 +692,7 @@ class OrderNote(BaseModel):
 
 class RefundTaxLinesItem(BaseModel):
     """Nested schema for Refund.tax_lines_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     rate_code: str | None | None = Field(default=None)
@@ -704,7 +704,7 @@ class RefundTaxLinesItem(BaseModel):
 
 class RefundLineItemsItemMetaDataItem(BaseModel):
     """Nested schema for RefundLineItemsItem.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -712,7 +712,7 @@ class RefundLineItemsItemMetaDataItem(BaseModel):
 
 class RefundLineItemsItemTaxesItem(BaseModel):
     """Nested schema for RefundLineItemsItem.taxes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     total: str | None | None = Field(default=None)
@@ -720,7 +720,7 @@ class RefundLineItemsItemTaxesItem(BaseModel):
 
 class RefundLineItemsItem(BaseModel):
     """Nested schema for Refund.line_items_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -739,7 +739,7 @@ class RefundLineItemsItem(BaseModel):
 
 class RefundMetaDataItem(BaseModel):
     """Nested schema for Refund.meta_data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     key: str | None | None = Field(default=None)
@@ -747,7 +747,7 @@ class RefundMetaDataItem(BaseModel):
 
 class RefundShippingLinesItem(BaseModel):
     """Nested schema for Refund.shipping_lines_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     method_title: str | None | None = Field(default=None)
@@ -757,7 +757,7 @@ class RefundShippingLinesItem(BaseModel):
 
 class RefundFeeLinesItem(BaseModel):
     """Nested schema for Refund.fee_lines_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -768,7 +768,7 @@ class RefundFeeLinesItem(BaseModel):
 
 class Refund(BaseModel):
     """Refund type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     date_created: str | None = Field(default=None)
@@ -785,7 +785,7 @@ class Refund(BaseModel):
 
 class PaymentGateway(BaseModel):
     """PaymentGateway type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     title: str | None = Field(default=None)
@@ -805,7 +805,7 @@ class PaymentGateway(BaseModel):
 
 class ShippingMethod(BaseModel):
     """ShippingMethod type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     title: str | None = Field(default=None)
@@ -813,7 +813,7 @@ class ShippingMethod(BaseModel):
 
 class ShippingZone(BaseModel):
     """ShippingZone type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -821,7 +821,7 @@ class ShippingZone(BaseModel):
 
 class TaxRate(BaseModel):
     """TaxRate type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     country: str | None = Field(default=None)
@@ -840,7 +840,7 @@ class TaxRate(BaseModel):
 
 class TaxClass(BaseModel):
     """TaxClass type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     slug: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -850,97 +850,97 @@ class TaxClass(BaseModel):
 
 class CustomersListResultMeta(BaseModel):
     """Metadata for customers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class OrdersListResultMeta(BaseModel):
     """Metadata for orders.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ProductsListResultMeta(BaseModel):
     """Metadata for products.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class CouponsListResultMeta(BaseModel):
     """Metadata for coupons.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ProductCategoriesListResultMeta(BaseModel):
     """Metadata for product_categories.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ProductTagsListResultMeta(BaseModel):
     """Metadata for product_tags.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ProductReviewsListResultMeta(BaseModel):
     """Metadata for product_reviews.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ProductAttributesListResultMeta(BaseModel):
     """Metadata for product_attributes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ProductVariationsListResultMeta(BaseModel):
     """Metadata for product_variations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class OrderNotesListResultMeta(BaseModel):
     """Metadata for order_notes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class RefundsListResultMeta(BaseModel):
     """Metadata for refunds.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class PaymentGatewaysListResultMeta(BaseModel):
     """Metadata for payment_gateways.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ShippingMethodsListResultMeta(BaseModel):
     """Metadata for shipping_methods.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class ShippingZonesListResultMeta(BaseModel):
     """Metadata for shipping_zones.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class TaxRatesListResultMeta(BaseModel):
     """Metadata for tax_rates.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
 class TaxClassesListResultMeta(BaseModel):
     """Metadata for tax_classes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next: str | None = Field(default=None)
 
@@ -997,7 +997,7 @@ D = TypeVar('D')
 
 class CustomersSearchData(BaseModel):
     """Search result data for customers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     avatar_url: str | None = None
     """Avatar URL"""
@@ -1033,7 +1033,7 @@ class CustomersSearchData(BaseModel):
 
 class OrdersSearchData(BaseModel):
     """Search result data for orders entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     billing: dict[str, Any] | None = None
     """Billing address"""
@@ -1121,7 +1121,7 @@ class OrdersSearchData(BaseModel):
 
 class ProductsSearchData(BaseModel):
     """Search result data for products entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attributes: list[Any] | None = None
     """List of attributes"""
@@ -1255,7 +1255,7 @@ class ProductsSearchData(BaseModel):
 
 class CouponsSearchData(BaseModel):
     """Search result data for coupons entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     amount: str | None = None
     """The amount of discount"""
@@ -1315,7 +1315,7 @@ class CouponsSearchData(BaseModel):
 
 class ProductCategoriesSearchData(BaseModel):
     """Search result data for product_categories entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     count: int | None = None
     """Number of published products for the resource"""
@@ -1339,7 +1339,7 @@ class ProductCategoriesSearchData(BaseModel):
 
 class ProductTagsSearchData(BaseModel):
     """Search result data for product_tags entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     count: int | None = None
     """Number of published products"""
@@ -1355,7 +1355,7 @@ class ProductTagsSearchData(BaseModel):
 
 class ProductReviewsSearchData(BaseModel):
     """Search result data for product_reviews entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     date_created: str | None = None
     """The date the review was created"""
@@ -1381,7 +1381,7 @@ class ProductReviewsSearchData(BaseModel):
 
 class ProductAttributesSearchData(BaseModel):
     """Search result data for product_attributes entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_archives: bool | None = None
     """Enable/Disable attribute archives"""
@@ -1399,7 +1399,7 @@ class ProductAttributesSearchData(BaseModel):
 
 class ProductVariationsSearchData(BaseModel):
     """Search result data for product_variations entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attributes: list[Any] | None = None
     """List of attributes"""
@@ -1483,7 +1483,7 @@ class ProductVariationsSearchData(BaseModel):
 
 class OrderNotesSearchData(BaseModel):
     """Search result data for order_notes entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     author: str | None = None
     """Order note author"""
@@ -1499,7 +1499,7 @@ class OrderNotesSearchData(BaseModel):
 
 class RefundsSearchData(BaseModel):
     """Search result data for refunds entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     amount: str | None = None
     """Refund amount"""
@@ -1523,7 +1523,7 @@ class RefundsSearchData(BaseModel):
 
 class PaymentGatewaysSearchData(BaseModel):
     """Search result data for payment_gateways entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     description: str | None = None
     """Payment gateway description on checkout"""
@@ -1547,7 +1547,7 @@ class PaymentGatewaysSearchData(BaseModel):
 
 class ShippingMethodsSearchData(BaseModel):
     """Search result data for shipping_methods entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     description: str | None = None
     """Shipping method description"""
@@ -1559,7 +1559,7 @@ class ShippingMethodsSearchData(BaseModel):
 
 class ShippingZonesSearchData(BaseModel):
     """Search result data for shipping_zones entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Unique identifier"""
@@ -1571,7 +1571,7 @@ class ShippingZonesSearchData(BaseModel):
 
 class TaxRatesSearchData(BaseModel):
     """Search result data for tax_rates entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     cities: list[Any] | None = None
     """City names"""
@@ -1605,7 +1605,7 @@ class TaxRatesSearchData(BaseModel):
 
 class TaxClassesSearchData(BaseModel):
     """Search result data for tax_classes entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     name: str | None = None
     """Tax class name"""
@@ -1617,7 +1617,7 @@ class TaxClassesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1629,7 +1629,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
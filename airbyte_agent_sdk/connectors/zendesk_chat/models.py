@@ -34,7 +34,7 @@ class ZendeskChatReplicationConfig(BaseModel):
 
 class Account(BaseModel):
     """Zendesk Chat account information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_key: str
     status: str | None = Field(default=None)
@@ -44,7 +44,7 @@ class Account(BaseModel):
 
 class Billing(BaseModel):
     """Account billing information"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     company: str | None = Field(default=None)
     first_name: str | None = Field(default=None)
@@ -62,7 +62,7 @@ class Billing(BaseModel):
 
 class Plan(BaseModel):
     """Account plan details"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     price: float | None = Field(default=None)
@@ -95,7 +95,7 @@ class Plan(BaseModel):
 
 class Agent(BaseModel):
     """Zendesk Chat agent"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     email: str | None = Field(default=None)
@@ -115,14 +115,14 @@ class Agent(BaseModel):
 
 class AgentRoles(BaseModel):
     """Agent role flags"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     administrator: bool | None = Field(default=None)
     owner: bool | None = Field(default=None)
 
 class AgentTimeline(BaseModel):
     """Agent activity timeline entry"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     agent_id: int
     start_time: str | None = Field(default=None)
@@ -132,7 +132,7 @@ class AgentTimeline(BaseModel):
 
 class Ban(BaseModel):
     """Banned visitor"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     type_: str | None = Field(default=None, alias="type")
@@ -144,14 +144,14 @@ class Ban(BaseModel):
 
 class WebpathItem(BaseModel):
     """WebpathItem type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     from_: str | None = Field(default=None, alias="from")
     timestamp: str | None = Field(default=None)
 
 class ChatEngagement(BaseModel):
     """ChatEngagement type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     agent_id: str | None = Field(default=None)
@@ -172,7 +172,7 @@ class ChatEngagement(BaseModel):
 
 class ChatConversion(BaseModel):
     """ChatConversion type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     goal_id: int | None = Field(default=None)
@@ -182,7 +182,7 @@ class ChatConversion(BaseModel):
 
 class ChatHistoryItem(BaseModel):
     """ChatHistoryItem type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     type_: str | None = Field(default=None, alias="type")
     timestamp: str | None = Field(default=None)
@@ -201,7 +201,7 @@ class ChatHistoryItem(BaseModel):
 
 class Chat(BaseModel):
     """Chat conversation transcript"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     type_: str | None = Field(default=None, alias="type")
@@ -234,7 +234,7 @@ class Chat(BaseModel):
 
 class Visitor(BaseModel):
     """Visitor type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -244,7 +244,7 @@ class Visitor(BaseModel):
 
 class ChatSession(BaseModel):
     """ChatSession type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     browser: str | None = Field(default=None)
@@ -260,7 +260,7 @@ class ChatSession(BaseModel):
 
 class ConversionAttribution(BaseModel):
     """ConversionAttribution type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     agent_id: int | None = Field(default=None)
     agent_name: str | None = Field(default=None)
@@ -270,7 +270,7 @@ class ConversionAttribution(BaseModel):
 
 class MessageCount(BaseModel):
     """MessageCount type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     total: int | None = Field(default=None)
     agent: int | None = Field(default=None)
@@ -278,7 +278,7 @@ class MessageCount(BaseModel):
 
 class ResponseTime(BaseModel):
     """ResponseTime type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first: int | None = Field(default=None)
     avg: float | None = Field(default=None)
@@ -286,7 +286,7 @@ class ResponseTime(BaseModel):
 
 class Department(BaseModel):
     """Department type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -297,13 +297,13 @@ class Department(BaseModel):
 
 class DepartmentSettings(BaseModel):
     """DepartmentSettings type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     chat_limit: int | None = Field(default=None)
 
 class Goal(BaseModel):
     """Goal type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -316,7 +316,7 @@ class Goal(BaseModel):
 
 class Role(BaseModel):
     """Role type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -327,7 +327,7 @@ class Role(BaseModel):
 
 class RoutingSettings(BaseModel):
     """RoutingSettings type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     routing_mode: str | None = Field(default=None)
     chat_limit: dict[str, Any] | None = Field(default=None)
@@ -338,7 +338,7 @@ class RoutingSettings(BaseModel):
 
 class Shortcut(BaseModel):
     """Shortcut type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     name: str | None = Field(default=None)
@@ -351,7 +351,7 @@ class Shortcut(BaseModel):
 
 class Skill(BaseModel):
     """Skill type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -361,7 +361,7 @@ class Skill(BaseModel):
 
 class Trigger(BaseModel):
     """Trigger type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     name: str | None = Field(default=None)
@@ -378,14 +378,14 @@ class Trigger(BaseModel):
 
 class AgentTimelineListResultMeta(BaseModel):
     """Metadata for agent_timeline.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     count: int | None = Field(default=None)
 
 class ChatsListResultMeta(BaseModel):
     """Metadata for chats.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     count: int | None = Field(default=None)
@@ -443,7 +443,7 @@ D = TypeVar('D')
 
 class AgentsSearchData(BaseModel):
     """Search result data for agents entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int = None
     """Unique agent identifier"""
@@ -467,7 +467,7 @@ class AgentsSearchData(BaseModel):
 
 class ChatsSearchData(BaseModel):
     """Search result data for chats entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique chat identifier"""
@@ -491,7 +491,7 @@ class ChatsSearchData(BaseModel):
 
 class DepartmentsSearchData(BaseModel):
     """Search result data for departments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int = None
     """Department ID"""
@@ -505,7 +505,7 @@ class DepartmentsSearchData(BaseModel):
 
 class ShortcutsSearchData(BaseModel):
     """Search result data for shortcuts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int = None
     """Shortcut ID"""
@@ -519,7 +519,7 @@ class ShortcutsSearchData(BaseModel):
 
 class TriggersSearchData(BaseModel):
     """Search result data for triggers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int = None
     """Trigger ID"""
@@ -533,7 +533,7 @@ class TriggersSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -545,7 +545,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
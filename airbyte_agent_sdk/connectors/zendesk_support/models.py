@@ -39,7 +39,7 @@ ZendeskSupportAuthConfig = ZendeskSupportOauth20AuthConfig | ZendeskSupportApiTo
 
 class Ticket(BaseModel):
     """Zendesk Support ticket object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -84,7 +84,7 @@ class Ticket(BaseModel):
 
 class DeletedTicketActor(BaseModel):
     """The user who performed the deletion action"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None, description="The unique identifier of the user")
     """The unique identifier of the user"""
@@ -93,7 +93,7 @@ class DeletedTicketActor(BaseModel):
 
 class DeletedTicket(BaseModel):
     """Zendesk Support deleted ticket object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     subject: str | None = Field(default=None)
@@ -104,7 +104,7 @@ class DeletedTicket(BaseModel):
 
 class User(BaseModel):
     """Zendesk Support user object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -147,7 +147,7 @@ class User(BaseModel):
 
 class Organization(BaseModel):
     """Zendesk Support organization object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -166,7 +166,7 @@ class Organization(BaseModel):
 
 class Group(BaseModel):
     """Zendesk Support group object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -180,7 +180,7 @@ class Group(BaseModel):
 
 class TicketComment(BaseModel):
     """Zendesk Support ticket comment object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     type_: str | None = Field(default=None, alias="type")
@@ -197,7 +197,7 @@ class TicketComment(BaseModel):
 
 class Attachment(BaseModel):
     """Zendesk Support attachment object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     file_name: str | None = Field(default=None)
@@ -216,7 +216,7 @@ class Attachment(BaseModel):
 
 class TicketAudit(BaseModel):
     """Zendesk Support ticket audit object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     ticket_id: int | None = Field(default=None)
@@ -228,7 +228,7 @@ class TicketAudit(BaseModel):
 
 class TicketMetric(BaseModel):
     """Zendesk Support ticket metric object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -255,7 +255,7 @@ class TicketMetric(BaseModel):
 
 class TicketField(BaseModel):
     """Zendesk Support ticket field object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -285,7 +285,7 @@ class TicketField(BaseModel):
 
 class Brand(BaseModel):
     """Zendesk Support brand object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -306,7 +306,7 @@ class Brand(BaseModel):
 
 class View(BaseModel):
     """Zendesk Support view object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -323,7 +323,7 @@ class View(BaseModel):
 
 class Macro(BaseModel):
     """Zendesk Support macro object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -339,7 +339,7 @@ class Macro(BaseModel):
 
 class Trigger(BaseModel):
     """Zendesk Support trigger object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -356,7 +356,7 @@ class Trigger(BaseModel):
 
 class Automation(BaseModel):
     """Zendesk Support automation object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -371,14 +371,14 @@ class Automation(BaseModel):
 
 class Tag(BaseModel):
     """Zendesk Support tag object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str
     count: int | None = Field(default=None)
 
 class SatisfactionRating(BaseModel):
     """Zendesk Support satisfaction rating object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -396,7 +396,7 @@ class SatisfactionRating(BaseModel):
 
 class GroupMembership(BaseModel):
     """Zendesk Support group membership object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -408,7 +408,7 @@ class GroupMembership(BaseModel):
 
 class OrganizationMembership(BaseModel):
     """Zendesk Support organization membership object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -422,7 +422,7 @@ class OrganizationMembership(BaseModel):
 
 class SLAPolicy(BaseModel):
     """Zendesk Support SLA policy object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -436,7 +436,7 @@ class SLAPolicy(BaseModel):
 
 class TicketForm(BaseModel):
     """Zendesk Support ticket form object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -458,7 +458,7 @@ class TicketForm(BaseModel):
 
 class Article(BaseModel):
     """Help Center article object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -479,7 +479,7 @@ class Article(BaseModel):
 
 class ArticleAttachment(BaseModel):
     """Article attachment object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int
     url: str | None = Field(default=None)
@@ -494,7 +494,7 @@ class ArticleAttachment(BaseModel):
 
 class JobStatus(BaseModel):
     """Job status for bulk operations"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     url: str | None = Field(default=None)
@@ -505,7 +505,7 @@ class JobStatus(BaseModel):
 
 class TicketCreateParamsTicketComment(BaseModel):
     """An object that defines the initial comment on the ticket"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     body: str | None = Field(default=None, description="The body of the comment")
     """The body of the comment"""
@@ -516,14 +516,14 @@ class TicketCreateParamsTicketComment(BaseModel):
 
 class TicketCreateParamsTicketCustomFieldsItem(BaseModel):
     """Nested schema for TicketCreateParamsTicket.custom_fields_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     value: str | None = Field(default=None)
 
 class TicketCreateParamsTicket(BaseModel):
     """The ticket object to create"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     subject: str = Field(description="The subject of the ticket")
     """The subject of the ticket"""
@@ -558,20 +558,20 @@ class TicketCreateParamsTicket(BaseModel):
 
 class TicketCreateParams(BaseModel):
     """Parameters for creating a new ticket. The body must be wrapped in a "ticket" key."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ticket: TicketCreateParamsTicket
 
 class TicketUpdateParamsTicketCustomFieldsItem(BaseModel):
     """Nested schema for TicketUpdateParamsTicket.custom_fields_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     value: str | None = Field(default=None)
 
 class TicketUpdateParamsTicketComment(BaseModel):
     """A comment to add to the ticket"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     body: str | None = Field(default=None, description="The body of the comment")
     """The body of the comment"""
@@ -584,7 +584,7 @@ class TicketUpdateParamsTicketComment(BaseModel):
 
 class TicketUpdateParamsTicket(BaseModel):
     """The ticket fields to update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     subject: str | None = Field(default=None, description="The subject of the ticket")
     """The subject of the ticket"""
@@ -613,13 +613,13 @@ class TicketUpdateParamsTicket(BaseModel):
 
 class TicketUpdateParams(BaseModel):
     """Parameters for updating an existing ticket. The body must be wrapped in a "ticket" key."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ticket: TicketUpdateParamsTicket
 
 class TicketCommentCreateParamsTicketComment(BaseModel):
     """The comment to add to the ticket"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     body: str = Field(description="The body of the comment")
     """The body of the comment"""
@@ -632,20 +632,20 @@ class TicketCommentCreateParamsTicketComment(BaseModel):
 
 class TicketCommentCreateParamsTicket(BaseModel):
     """The ticket update containing the comment"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     comment: TicketCommentCreateParamsTicketComment = Field(description="The comment to add to the ticket")
     """The comment to add to the ticket"""
 
 class TicketCommentCreateParams(BaseModel):
     """Parameters for adding a comment to an existing ticket. Sent as a ticket update with comment."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ticket: TicketCommentCreateParamsTicket
 
 class TicketBulkUpdateParamsTicket(BaseModel):
     """The ticket fields to apply to all specified tickets"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     status: str | None = Field(default=None, description="The state to set on all tickets")
     """The state to set on all tickets"""
@@ -664,13 +664,13 @@ class TicketBulkUpdateParamsTicket(BaseModel):
 
 class TicketBulkUpdateParams(BaseModel):
     """Parameters for bulk updating multiple tickets. The body must be wrapped in a "ticket" key."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ticket: TicketBulkUpdateParamsTicket
 
 class UserCreateParamsUser(BaseModel):
     """The user object to create"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str = Field(description="The user's name")
     """The user's name"""
@@ -699,13 +699,13 @@ class UserCreateParamsUser(BaseModel):
 
 class UserCreateParams(BaseModel):
     """Parameters for creating a new user. The body must be wrapped in a "user" key."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user: UserCreateParamsUser
 
 class UserUpdateParamsUser(BaseModel):
     """The user fields to update"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None, description="The user's name")
     """The user's name"""
@@ -734,7 +734,7 @@ class UserUpdateParamsUser(BaseModel):
 
 class UserUpdateParams(BaseModel):
     """Parameters for updating an existing user. The body must be wrapped in a "user" key."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     user: UserUpdateParamsUser
 
@@ -743,7 +743,7 @@ class UserUpdateParams(BaseModel):
 
 class TicketsListResultMeta(BaseModel):
     """Metadata for tickets.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -751,7 +751,7 @@ class TicketsListResultMeta(BaseModel):
 
 class DeletedTicketsListResultMeta(BaseModel):
     """Metadata for deleted_tickets.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -759,7 +759,7 @@ class DeletedTicketsListResultMeta(BaseModel):
 
 class UsersListResultMeta(BaseModel):
     """Metadata for users.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -767,7 +767,7 @@ class UsersListResultMeta(BaseModel):
 
 class OrganizationsListResultMeta(BaseModel):
     """Metadata for organizations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -775,7 +775,7 @@ class OrganizationsListResultMeta(BaseModel):
 
 class GroupsListResultMeta(BaseModel):
     """Metadata for groups.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -783,7 +783,7 @@ class GroupsListResultMeta(BaseModel):
 
 class TicketCommentsListResultMeta(BaseModel):
     """Metadata for ticket_comments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -791,7 +791,7 @@ class TicketCommentsListResultMeta(BaseModel):
 
 class TicketAuditsListResultMeta(BaseModel):
     """Metadata for ticket_audits.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -799,7 +799,7 @@ class TicketAuditsListResultMeta(BaseModel):
 
 class TicketMetricsListResultMeta(BaseModel):
     """Metadata for ticket_metrics.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -807,7 +807,7 @@ class TicketMetricsListResultMeta(BaseModel):
 
 class TicketFieldsListResultMeta(BaseModel):
     """Metadata for ticket_fields.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -815,7 +815,7 @@ class TicketFieldsListResultMeta(BaseModel):
 
 class BrandsListResultMeta(BaseModel):
     """Metadata for brands.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -823,7 +823,7 @@ class BrandsListResultMeta(BaseModel):
 
 class ViewsListResultMeta(BaseModel):
     """Metadata for views.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -831,7 +831,7 @@ class ViewsListResultMeta(BaseModel):
 
 class MacrosListResultMeta(BaseModel):
     """Metadata for macros.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -839,7 +839,7 @@ class MacrosListResultMeta(BaseModel):
 
 class TriggersListResultMeta(BaseModel):
     """Metadata for triggers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -847,7 +847,7 @@ class TriggersListResultMeta(BaseModel):
 
 class AutomationsListResultMeta(BaseModel):
     """Metadata for automations.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -855,7 +855,7 @@ class AutomationsListResultMeta(BaseModel):
 
 class TagsListResultMeta(BaseModel):
     """Metadata for tags.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -863,7 +863,7 @@ class TagsListResultMeta(BaseModel):
 
 class SatisfactionRatingsListResultMeta(BaseModel):
     """Metadata for satisfaction_ratings.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -871,7 +871,7 @@ class SatisfactionRatingsListResultMeta(BaseModel):
 
 class GroupMembershipsListResultMeta(BaseModel):
     """Metadata for group_memberships.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -879,7 +879,7 @@ class GroupMembershipsListResultMeta(BaseModel):
 
 class OrganizationMembershipsListResultMeta(BaseModel):
     """Metadata for organization_memberships.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -887,7 +887,7 @@ class OrganizationMembershipsListResultMeta(BaseModel):
 
 class SlaPoliciesListResultMeta(BaseModel):
     """Metadata for sla_policies.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -895,7 +895,7 @@ class SlaPoliciesListResultMeta(BaseModel):
 
 class TicketFormsListResultMeta(BaseModel):
     """Metadata for ticket_forms.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -903,7 +903,7 @@ class TicketFormsListResultMeta(BaseModel):
 
 class ArticlesListResultMeta(BaseModel):
     """Metadata for articles.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -911,7 +911,7 @@ class ArticlesListResultMeta(BaseModel):
 
 class ArticleAttachmentsListResultMeta(BaseModel):
     """Metadata for article_attachments.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     previous_page: str | None = Field(default=None)
@@ -970,7 +970,7 @@ D = TypeVar('D')
 
 class BrandsSearchData(BaseModel):
     """Search result data for brands entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active: bool | None = None
     """Indicates whether the brand is set as active"""
@@ -1008,7 +1008,7 @@ class BrandsSearchData(BaseModel):
 
 class GroupsSearchData(BaseModel):
     """Search result data for groups entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """Timestamp indicating when the group was created"""
@@ -1032,7 +1032,7 @@ class GroupsSearchData(BaseModel):
 
 class OrganizationsSearchData(BaseModel):
     """Search result data for organizations entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     created_at: str | None = None
     """Timestamp when the organization was created"""
@@ -1068,7 +1068,7 @@ class OrganizationsSearchData(BaseModel):
 
 class SatisfactionRatingsSearchData(BaseModel):
     """Search result data for satisfaction_ratings entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     assignee_id: int | None = None
     """The identifier of the agent assigned to the ticket at the time the rating was submitted"""
@@ -1098,7 +1098,7 @@ class SatisfactionRatingsSearchData(BaseModel):
 
 class TagsSearchData(BaseModel):
     """Search result data for tags entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     count: int | None = None
     """The number of times this tag has been used across resources"""
@@ -1108,7 +1108,7 @@ class TagsSearchData(BaseModel):
 
 class TicketAuditsSearchData(BaseModel):
     """Search result data for ticket_audits entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attachments: list[Any] | None = None
     """Files or documents attached to the audit"""
@@ -1130,7 +1130,7 @@ class TicketAuditsSearchData(BaseModel):
 
 class TicketCommentsSearchData(BaseModel):
     """Search result data for ticket_comments entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     attachments: list[Any] | None = None
     """List of files or media attached to the comment"""
@@ -1170,7 +1170,7 @@ class TicketCommentsSearchData(BaseModel):
 
 class TicketFieldsSearchData(BaseModel):
     """Search result data for ticket_fields entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active: bool | None = None
     """Whether this field is currently available for use"""
@@ -1230,7 +1230,7 @@ class TicketFieldsSearchData(BaseModel):
 
 class TicketFormsSearchData(BaseModel):
     """Search result data for ticket_forms entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active: bool | None = None
     """Indicates if the form is set as active"""
@@ -1270,7 +1270,7 @@ class TicketFormsSearchData(BaseModel):
 
 class TicketMetricsSearchData(BaseModel):
     """Search result data for ticket_metrics entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     agent_wait_time_in_minutes: dict[str, Any] | None = None
     """Number of minutes the agent spent waiting during calendar and business hours"""
@@ -1336,7 +1336,7 @@ class TicketMetricsSearchData(BaseModel):
 
 class TicketsSearchData(BaseModel):
     """Search result data for tickets entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     allow_attachments: bool | None = None
     """Boolean indicating whether attachments are allowed on the ticket"""
@@ -1424,7 +1424,7 @@ class TicketsSearchData(BaseModel):
 
 class DeletedTicketsSearchData(BaseModel):
     """Search result data for deleted_tickets entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """The unique identifier of the deleted ticket"""
@@ -1442,7 +1442,7 @@ class DeletedTicketsSearchData(BaseModel):
 
 class UsersSearchData(BaseModel):
     """Search result data for users entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active: bool | None = None
     """Indicates if the user account is currently active"""
@@ -1528,7 +1528,7 @@ class UsersSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1540,7 +1540,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
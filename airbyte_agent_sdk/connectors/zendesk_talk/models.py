@@ -53,7 +53,7 @@ class ZendeskTalkReplicationConfig(BaseModel):
 
 class PhoneNumberCapabilities(BaseModel):
     """Phone number capabilities (sms, mms, voice)"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     sms: bool | None | None = Field(default=None)
     mms: bool | None | None = Field(default=None)
@@ -62,7 +62,7 @@ class PhoneNumberCapabilities(BaseModel):
 
 class PhoneNumber(BaseModel):
     """PhoneNumber type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     brand_id: int | None = Field(default=None)
@@ -98,7 +98,7 @@ class PhoneNumber(BaseModel):
 
 class PhoneNumbersList(BaseModel):
     """PhoneNumbersList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     phone_numbers: list[PhoneNumber] | None = Field(default=None)
     next_page: str | None = Field(default=None)
@@ -107,13 +107,13 @@ class PhoneNumbersList(BaseModel):
 
 class PhoneNumberWrapper(BaseModel):
     """PhoneNumberWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     phone_number: PhoneNumber | None = Field(default=None)
 
 class Address(BaseModel):
     """Address type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     city: str | None = Field(default=None)
@@ -127,7 +127,7 @@ class Address(BaseModel):
 
 class AddressesList(BaseModel):
     """AddressesList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     addresses: list[Address] | None = Field(default=None)
     next_page: str | None = Field(default=None)
@@ -136,13 +136,13 @@ class AddressesList(BaseModel):
 
 class AddressWrapper(BaseModel):
     """AddressWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     address: Address | None = Field(default=None)
 
 class Greeting(BaseModel):
     """Greeting type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str | None = Field(default=None)
     active: bool | None = Field(default=None)
@@ -160,7 +160,7 @@ class Greeting(BaseModel):
 
 class GreetingsList(BaseModel):
     """GreetingsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     greetings: list[Greeting] | None = Field(default=None)
     next_page: str | None = Field(default=None)
@@ -169,20 +169,20 @@ class GreetingsList(BaseModel):
 
 class GreetingWrapper(BaseModel):
     """GreetingWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     greeting: Greeting | None = Field(default=None)
 
 class GreetingCategory(BaseModel):
     """GreetingCategory type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
 
 class GreetingCategoriesList(BaseModel):
     """GreetingCategoriesList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     greeting_categories: list[GreetingCategory] | None = Field(default=None)
     next_page: str | None = Field(default=None)
@@ -191,13 +191,13 @@ class GreetingCategoriesList(BaseModel):
 
 class GreetingCategoryWrapper(BaseModel):
     """GreetingCategoryWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     greeting_category: GreetingCategory | None = Field(default=None)
 
 class IvrMenusItemRoutesItem(BaseModel):
     """Nested schema for IvrMenusItem.routes_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     action: str | None | None = Field(default=None)
@@ -209,7 +209,7 @@ class IvrMenusItemRoutesItem(BaseModel):
 
 class IvrMenusItem(BaseModel):
     """Nested schema for Ivr.menus_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None | None = Field(default=None)
     name: str | None | None = Field(default=None)
@@ -219,7 +219,7 @@ class IvrMenusItem(BaseModel):
 
 class Ivr(BaseModel):
     """Ivr type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     name: str | None = Field(default=None)
@@ -229,7 +229,7 @@ class Ivr(BaseModel):
 
 class IvrsList(BaseModel):
     """IvrsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ivrs: list[Ivr] | None = Field(default=None)
     next_page: str | None = Field(default=None)
@@ -238,13 +238,13 @@ class IvrsList(BaseModel):
 
 class IvrWrapper(BaseModel):
     """IvrWrapper type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     ivr: Ivr | None = Field(default=None)
 
 class AgentActivity(BaseModel):
     """AgentActivity type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     agent_id: int | None = Field(default=None)
     agent_state: str | None = Field(default=None)
@@ -275,7 +275,7 @@ class AgentActivity(BaseModel):
 
 class AgentsActivityList(BaseModel):
     """AgentsActivityList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     agents_activity: list[AgentActivity] | None = Field(default=None)
     next_page: str | None = Field(default=None)
@@ -284,7 +284,7 @@ class AgentsActivityList(BaseModel):
 
 class AgentsOverview(BaseModel):
     """AgentsOverview type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     average_calls_accepted: int | None = Field(default=None)
     average_calls_denied: int | None = Field(default=None)
@@ -312,13 +312,13 @@ class AgentsOverview(BaseModel):
 
 class AgentsOverviewResponse(BaseModel):
     """AgentsOverviewResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     agents_overview: AgentsOverview | None = Field(default=None)
 
 class AccountOverview(BaseModel):
     """AccountOverview type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     average_call_duration: int | None = Field(default=None)
     average_callback_wait_time: int | None = Field(default=None)
@@ -346,13 +346,13 @@ class AccountOverview(BaseModel):
 
 class AccountOverviewResponse(BaseModel):
     """AccountOverviewResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_overview: AccountOverview | None = Field(default=None)
 
 class CurrentQueueActivity(BaseModel):
     """CurrentQueueActivity type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     agents_online: int | None = Field(default=None)
     average_wait_time: int | None = Field(default=None)
@@ -365,13 +365,13 @@ class CurrentQueueActivity(BaseModel):
 
 class CurrentQueueActivityResponse(BaseModel):
     """CurrentQueueActivityResponse type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     current_queue_activity: CurrentQueueActivity | None = Field(default=None)
 
 class Call(BaseModel):
     """Call type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     agent_id: int | None = Field(default=None)
@@ -424,7 +424,7 @@ class Call(BaseModel):
 
 class CallsList(BaseModel):
     """CallsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     calls: list[Call] | None = Field(default=None)
     next_page: str | None = Field(default=None)
@@ -433,7 +433,7 @@ class CallsList(BaseModel):
 
 class CallLeg(BaseModel):
     """CallLeg type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: int | None = Field(default=None)
     type_: str | None = Field(default=None, alias="type")
@@ -463,7 +463,7 @@ class CallLeg(BaseModel):
 
 class CallLegsList(BaseModel):
     """CallLegsList type definition"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     legs: list[CallLeg] | None = Field(default=None)
     next_page: str | None = Field(default=None)
@@ -475,50 +475,50 @@ class CallLegsList(BaseModel):
 
 class PhoneNumbersListResultMeta(BaseModel):
     """Metadata for phone_numbers.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
 
 class AddressesListResultMeta(BaseModel):
     """Metadata for addresses.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
 
 class GreetingsListResultMeta(BaseModel):
     """Metadata for greetings.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
 
 class GreetingCategoriesListResultMeta(BaseModel):
     """Metadata for greeting_categories.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
 
 class IvrsListResultMeta(BaseModel):
     """Metadata for ivrs.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
 
 class AgentsActivityListResultMeta(BaseModel):
     """Metadata for agents_activity.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
 
 class CallsListResultMeta(BaseModel):
     """Metadata for calls.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     count: int | None = Field(default=None)
 
 class CallLegsListResultMeta(BaseModel):
     """Metadata for call_legs.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     next_page: str | None = Field(default=None)
     count: int | None = Field(default=None)
@@ -576,7 +576,7 @@ D = TypeVar('D')
 
 class AddressesSearchData(BaseModel):
     """Search result data for addresses entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     city: str | None = None
     """City of the address"""
@@ -600,7 +600,7 @@ class AddressesSearchData(BaseModel):
 
 class AgentsActivitySearchData(BaseModel):
     """Search result data for agents_activity entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     accepted_third_party_conferences: int | None = None
     """Accepted third party conferences"""
@@ -658,7 +658,7 @@ class AgentsActivitySearchData(BaseModel):
 
 class AgentsOverviewSearchData(BaseModel):
     """Search result data for agents_overview entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     average_accepted_transfers: int | None = None
     """Average accepted transfers"""
@@ -710,7 +710,7 @@ class AgentsOverviewSearchData(BaseModel):
 
 class GreetingCategoriesSearchData(BaseModel):
     """Search result data for greeting_categories entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """Greeting category ID"""
@@ -720,7 +720,7 @@ class GreetingCategoriesSearchData(BaseModel):
 
 class GreetingsSearchData(BaseModel):
     """Search result data for greetings entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     active: bool | None = None
     """Whether the greeting is associated with phone numbers"""
@@ -752,7 +752,7 @@ class GreetingsSearchData(BaseModel):
 
 class PhoneNumbersSearchData(BaseModel):
     """Search result data for phone_numbers entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     call_recording_consent: str | None = None
     """What call recording consent is set to"""
@@ -818,7 +818,7 @@ class PhoneNumbersSearchData(BaseModel):
 
 class CallLegsSearchData(BaseModel):
     """Search result data for call_legs entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     agent_id: int | None = None
     """Agent ID"""
@@ -874,7 +874,7 @@ class CallLegsSearchData(BaseModel):
 
 class CallsSearchData(BaseModel):
     """Search result data for calls entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     agent_id: int | None = None
     """Agent ID"""
@@ -962,7 +962,7 @@ class CallsSearchData(BaseModel):
 
 class CurrentQueueActivitySearchData(BaseModel):
     """Search result data for current_queue_activity entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     agents_online: int | None = None
     """Current number of agents online"""
@@ -982,7 +982,7 @@ class CurrentQueueActivitySearchData(BaseModel):
 
 class AccountOverviewSearchData(BaseModel):
     """Search result data for account_overview entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     average_call_duration: int | None = None
     """Average call duration"""
@@ -1034,7 +1034,7 @@ class AccountOverviewSearchData(BaseModel):
 
 class IvrsSearchData(BaseModel):
     """Search result data for ivrs entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: int | None = None
     """IVR ID"""
@@ -1052,7 +1052,7 @@ class IvrsSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1064,7 +1064,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
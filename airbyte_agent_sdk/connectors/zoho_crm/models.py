@@ -28,7 +28,7 @@ class ZohoCrmAuthConfig(BaseModel):
 
 class Owner(BaseModel):
     """Record owner reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -36,7 +36,7 @@ class Owner(BaseModel):
 
 class CreatedBy(BaseModel):
     """User who created the record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -44,7 +44,7 @@ class CreatedBy(BaseModel):
 
 class ModifiedBy(BaseModel):
     """User who last modified the record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     id: str | None = Field(default=None)
@@ -52,14 +52,14 @@ class ModifiedBy(BaseModel):
 
 class LookupRef(BaseModel):
     """Lookup reference to another record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     id: str | None = Field(default=None)
 
 class PaginationInfo(BaseModel):
     """Pagination metadata"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     per_page: int | None = Field(default=None)
     count: int | None = Field(default=None)
@@ -70,7 +70,7 @@ class PaginationInfo(BaseModel):
 
 class Lead(BaseModel):
     """Zoho CRM lead object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -105,14 +105,14 @@ class Lead(BaseModel):
 
 class LeadsList(BaseModel):
     """Paginated list of leads"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Lead] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class Contact(BaseModel):
     """Zoho CRM contact object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -147,14 +147,14 @@ class Contact(BaseModel):
 
 class ContactsList(BaseModel):
     """Paginated list of contacts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Contact] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class Account(BaseModel):
     """Zoho CRM account (company) object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -191,21 +191,21 @@ class Account(BaseModel):
 
 class AccountsList(BaseModel):
     """Paginated list of accounts"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Account] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class DealPipeline(BaseModel):
     """Sales pipeline reference"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     id: str | None = Field(default=None)
 
 class Deal(BaseModel):
     """Zoho CRM deal (opportunity) object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -230,14 +230,14 @@ class Deal(BaseModel):
 
 class DealsList(BaseModel):
     """Paginated list of deals"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Deal] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class Campaign(BaseModel):
     """Zoho CRM campaign object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -260,14 +260,14 @@ class Campaign(BaseModel):
 
 class CampaignsList(BaseModel):
     """Paginated list of campaigns"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Campaign] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class Task(BaseModel):
     """Zoho CRM task object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -290,14 +290,14 @@ class Task(BaseModel):
 
 class TasksList(BaseModel):
     """Paginated list of tasks"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Task] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class EventParticipantsItem(BaseModel):
     """Nested schema for Event.Participants_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     name: str | None = Field(default=None)
     email: str | None = Field(default=None, alias="Email")
@@ -308,7 +308,7 @@ class EventParticipantsItem(BaseModel):
 
 class Event(BaseModel):
     """Zoho CRM event (meeting/calendar) object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -331,14 +331,14 @@ class Event(BaseModel):
 
 class EventsList(BaseModel):
     """Paginated list of events"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Event] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class Call(BaseModel):
     """Zoho CRM call object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -362,14 +362,14 @@ class Call(BaseModel):
 
 class CallsList(BaseModel):
     """Paginated list of calls"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Call] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class Product(BaseModel):
     """Zoho CRM product object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -400,14 +400,14 @@ class Product(BaseModel):
 
 class ProductsList(BaseModel):
     """Paginated list of products"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Product] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class Quote(BaseModel):
     """Zoho CRM quote object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -443,14 +443,14 @@ class Quote(BaseModel):
 
 class QuotesList(BaseModel):
     """Paginated list of quotes"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Quote] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class Invoice(BaseModel):
     """Zoho CRM invoice object"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     id: str
     owner: Any | None = Field(default=None, alias="Owner")
@@ -490,14 +490,14 @@ class Invoice(BaseModel):
 
 class InvoicesList(BaseModel):
     """Paginated list of invoices"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[Invoice] | None = Field(default=None)
     info: PaginationInfo | None = Field(default=None)
 
 class WriteResponseDetail(BaseModel):
     """Details of a successfully written record"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     modified_time: str | None = Field(default=None, alias="Modified_Time")
     modified_by: Any | None = Field(default=None, alias="Modified_By")
@@ -507,7 +507,7 @@ class WriteResponseDetail(BaseModel):
 
 class WriteResponseItem(BaseModel):
     """Individual record write result"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     code: str | None = Field(default=None)
     details: WriteResponseDetail | None = Field(default=None)
@@ -516,13 +516,13 @@ class WriteResponseItem(BaseModel):
 
 class WriteResponse(BaseModel):
     """Response from a create or update operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[WriteResponseItem] | None = Field(default=None)
 
 class LeadCreateParamsDataItem(BaseModel):
     """Nested schema for LeadCreateParams.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first_name: str | None = Field(default=None, alias="First_Name", description="Lead's first name")
     """Lead's first name"""
@@ -567,13 +567,13 @@ class LeadCreateParamsDataItem(BaseModel):
 
 class LeadCreateParams(BaseModel):
     """Parameters for creating a lead. The record fields must be nested inside a data array."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[LeadCreateParamsDataItem]
 
 class LeadUpdateParamsDataItem(BaseModel):
     """Nested schema for LeadUpdateParams.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first_name: str | None = Field(default=None, alias="First_Name", description="Lead's first name")
     """Lead's first name"""
@@ -618,13 +618,13 @@ class LeadUpdateParamsDataItem(BaseModel):
 
 class LeadUpdateParams(BaseModel):
     """Parameters for updating a lead. The record fields must be nested inside a data array."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[LeadUpdateParamsDataItem]
 
 class ContactCreateParamsDataItem(BaseModel):
     """Nested schema for ContactCreateParams.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first_name: str | None = Field(default=None, alias="First_Name", description="Contact's first name")
     """Contact's first name"""
@@ -659,13 +659,13 @@ class ContactCreateParamsDataItem(BaseModel):
 
 class ContactCreateParams(BaseModel):
     """Parameters for creating a contact. The record fields must be nested inside a data array."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[ContactCreateParamsDataItem]
 
 class ContactUpdateParamsDataItem(BaseModel):
     """Nested schema for ContactUpdateParams.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     first_name: str | None = Field(default=None, alias="First_Name", description="Contact's first name")
     """Contact's first name"""
@@ -700,13 +700,13 @@ class ContactUpdateParamsDataItem(BaseModel):
 
 class ContactUpdateParams(BaseModel):
     """Parameters for updating a contact. The record fields must be nested inside a data array."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[ContactUpdateParamsDataItem]
 
 class AccountCreateParamsDataItem(BaseModel):
     """Nested schema for AccountCreateParams.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_name: str = Field(alias="Account_Name", description="Account/company name (required)")
     """Account/company name (required)"""
@@ -753,13 +753,13 @@ class AccountCreateParamsDataItem(BaseModel):
 
 class AccountCreateParams(BaseModel):
     """Parameters for creating an account. The record fields must be nested inside a data array."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[AccountCreateParamsDataItem]
 
 class AccountUpdateParamsDataItem(BaseModel):
     """Nested schema for AccountUpdateParams.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     account_name: str | None = Field(default=None, alias="Account_Name", description="Account/company name")
     """Account/company name"""
@@ -806,13 +806,13 @@ class AccountUpdateParamsDataItem(BaseModel):
 
 class AccountUpdateParams(BaseModel):
     """Parameters for updating an account. The record fields must be nested inside a data array."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[AccountUpdateParamsDataItem]
 
 class DealCreateParamsDataItem(BaseModel):
     """Nested schema for DealCreateParams.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     deal_name: str = Field(alias="Deal_Name", description="Deal name (required)")
     """Deal name (required)"""
@@ -835,13 +835,13 @@ class DealCreateParamsDataItem(BaseModel):
 
 class DealCreateParams(BaseModel):
     """Parameters for creating a deal. The record fields must be nested inside a data array."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[DealCreateParamsDataItem]
 
 class DealUpdateParamsDataItem(BaseModel):
     """Nested schema for DealUpdateParams.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     deal_name: str | None = Field(default=None, alias="Deal_Name", description="Deal name")
     """Deal name"""
@@ -864,13 +864,13 @@ class DealUpdateParamsDataItem(BaseModel):
 
 class DealUpdateParams(BaseModel):
     """Parameters for updating a deal. The record fields must be nested inside a data array."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[DealUpdateParamsDataItem]
 
 class TaskCreateParamsDataItem(BaseModel):
     """Nested schema for TaskCreateParams.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     subject: str = Field(alias="Subject", description="Subject or title of the task (required)")
     """Subject or title of the task (required)"""
@@ -887,13 +887,13 @@ class TaskCreateParamsDataItem(BaseModel):
 
 class TaskCreateParams(BaseModel):
     """Parameters for creating a task. The record fields must be nested inside a data array."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[TaskCreateParamsDataItem]
 
 class TaskUpdateParamsDataItem(BaseModel):
     """Nested schema for TaskUpdateParams.data_item"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     subject: str | None = Field(default=None, alias="Subject", description="Subject or title of the task")
     """Subject or title of the task"""
@@ -910,7 +910,7 @@ class TaskUpdateParamsDataItem(BaseModel):
 
 class TaskUpdateParams(BaseModel):
     """Parameters for updating a task. The record fields must be nested inside a data array."""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     data: list[TaskUpdateParamsDataItem]
 
@@ -919,77 +919,77 @@ class TaskUpdateParams(BaseModel):
 
 class LeadsListResultMeta(BaseModel):
     """Metadata for leads.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
 
 class ContactsListResultMeta(BaseModel):
     """Metadata for contacts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
 
 class AccountsListResultMeta(BaseModel):
     """Metadata for accounts.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
 
 class DealsListResultMeta(BaseModel):
     """Metadata for deals.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
 
 class CampaignsListResultMeta(BaseModel):
     """Metadata for campaigns.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
 
 class TasksListResultMeta(BaseModel):
     """Metadata for tasks.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
 
 class EventsListResultMeta(BaseModel):
     """Metadata for events.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
 
 class CallsListResultMeta(BaseModel):
     """Metadata for calls.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
 
 class ProductsListResultMeta(BaseModel):
     """Metadata for products.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
 
 class QuotesListResultMeta(BaseModel):
     """Metadata for quotes.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
 
 class InvoicesListResultMeta(BaseModel):
     """Metadata for invoices.Action.LIST operation"""
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     more_records: bool | None = Field(default=None)
     page: int | None = Field(default=None)
@@ -1047,7 +1047,7 @@ D = TypeVar('D')
 
 class LeadsSearchData(BaseModel):
     """Search result data for leads entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1097,7 +1097,7 @@ class LeadsSearchData(BaseModel):
 
 class ContactsSearchData(BaseModel):
     """Search result data for contacts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1137,7 +1137,7 @@ class ContactsSearchData(BaseModel):
 
 class AccountsSearchData(BaseModel):
     """Search result data for accounts entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1177,7 +1177,7 @@ class AccountsSearchData(BaseModel):
 
 class DealsSearchData(BaseModel):
     """Search result data for deals entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1207,7 +1207,7 @@ class DealsSearchData(BaseModel):
 
 class CampaignsSearchData(BaseModel):
     """Search result data for campaigns entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1241,7 +1241,7 @@ class CampaignsSearchData(BaseModel):
 
 class TasksSearchData(BaseModel):
     """Search result data for tasks entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1267,7 +1267,7 @@ class TasksSearchData(BaseModel):
 
 class EventsSearchData(BaseModel):
     """Search result data for events entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1291,7 +1291,7 @@ class EventsSearchData(BaseModel):
 
 class CallsSearchData(BaseModel):
     """Search result data for calls entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1323,7 +1323,7 @@ class CallsSearchData(BaseModel):
 
 class ProductsSearchData(BaseModel):
     """Search result data for products entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1361,7 +1361,7 @@ class ProductsSearchData(BaseModel):
 
 class QuotesSearchData(BaseModel):
     """Search result data for quotes entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1395,7 +1395,7 @@ class QuotesSearchData(BaseModel):
 
 class InvoicesSearchData(BaseModel):
     """Search result data for invoices entity."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     id: str = None
     """Unique record identifier"""
@@ -1437,7 +1437,7 @@ class InvoicesSearchData(BaseModel):
 
 class AirbyteSearchMeta(BaseModel):
     """Pagination metadata for search responses."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     has_more: bool = False
     """Whether more results are available."""
@@ -1449,7 +1449,7 @@ class AirbyteSearchMeta(BaseModel):
 
 class AirbyteSearchResult(BaseModel, Generic[D]):
     """Result from Airbyte cache search operations with typed records."""
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     data: list[D] = Field(default_factory=list)
     """List of matching records."""
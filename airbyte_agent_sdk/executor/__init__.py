@@ -1,5 +1,7 @@
 """Executor implementations for connector operations."""
 
+from airbyte_agent_sdk.concurrency_limiter import AdaptiveConcurrencyLimiter
+
 from .hosted_executor import HostedExecutor
 from .local_executor import LocalExecutor
 from .models import (
@@ -12,6 +14,7 @@ from .models import (
     InvalidParameterError,
     MissingParameterError,
 )
+from .response_cache import InMemoryResponseCache, ResponseCache, SQLiteResponseCache
 
 __all__ = [
     # Config and Result types
@@ -22,6 +25,12 @@ __all__ = [
     # Executors
     "LocalExecutor",
     "HostedExecutor",
+    # Response caches
+    "ResponseCache",
+    "InMemoryResponseCache",
+    "SQLiteResponseCache",
+    # Concurrency control
+    "AdaptiveConcurrencyLimiter",
     # Exceptions
     "ExecutorError",
     "EntityNotFoundError",
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+from collections.abc import Iterable
 from typing import Any, overload
 
 from opentelemetry import trace
 
 from airbyte_agent_sdk.cloud_utils import AirbyteCloudClient
+from airbyte_agent_sdk.constants import DEFAULT_MAX_CONNECTIONS
+from airbyte_agent_sdk.schema.extensions import RetryConfig
 
 from .models import (
     ExecutionConfig,
@@ -70,6 +74,8 @@ class HostedExecutor:
         connector_definition_id: str | None = None,
         organization_id: str | None = None,
         model: Any | None = None,
+        retry_config: RetryConfig | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
     ):
         """Initialize hosted executor.
 
@@ -84,6 +90,9 @@ class HostedExecutor:
             connector_definition_id: Connector definition ID (for lookup)
             organization_id: Optional Airbyte organization ID for multi-org request routing
             model: Optional ConnectorModel for health check operation selection
+            retry_config: Optional retry configuration for execution requests (429/5xx,
+                timeouts, network errors). If None, uses default RetryConfig.
+            max_connections: Maximum number of concurrent connections to the cloud API
 
         Raises:
             ValueError: If neither connector_id nor (workspace_name + connector_definition_id) provided
@@ -124,6 +133,8 @@ class HostedExecutor:
             client_id=airbyte_client_id,
             client_secret=airbyte_client_secret,
             organization_id=resolved_organization_id,
+            retry_config=retry_config,
+            max_connections=max_connections,
         )
 
     @overload
@@ -186,6 +197,19 @@ class HostedExecutor:
             if action is not None or params is not None:
                 raise TypeError("Cannot pass action or params when using ExecutionConfig")
             config = config_or_entity
+        return await self._execute_config(config)
+
+    async def _resolve_connector_id(self) -> str:
+        """Use the provided connector_id or look it up from workspace_name + definition_id."""
+        if self._connector_id:
+            return self._connector_id
+        return await self._cloud_client.get_connector_id(
+            workspace_name=self._workspace_name,  # type: ignore[arg-type]
+            connector_definition_id=self._connector_definition_id,  # type: ignore[arg-type]
+        )
+
+    async def _execute_config(self, config: ExecutionConfig, connector_id: str | None = None) -> ExecutionResult:
+        """Run one operation, resolving the connector unless ``connector_id`` is given."""
         tracer = trace.get_tracer("airbyte.connector-sdk.executor.hosted")
 
         with tracer.start_as_current_span("airbyte.hosted_executor.execute") as span:
@@ -204,14 +228,8 @@ class HostedExecutor:
 
             try:
                 # Use provided connector_id or look it up
-                if self._connector_id:
-                    connector_id = self._connector_id
-                else:
-                    # Look up connector by workspace_name + definition_id
-                    connector_id = await self._cloud_client.get_connector_id(
-                        workspace_name=self._workspace_name,  # type: ignore[arg-type]
-                        connector_definition_id=self._connector_definition_id,  # type: ignore[arg-type]
-                    )
+                if connector_id is None:
+                    connector_id = await self._resolve_connector_id()
 
                 span.set_attribute("connector.connector_id", connector_id)
 
@@ -237,6 +255,66 @@ class HostedExecutor:
                 span.record_exception(e)
                 raise
 
+    async def execute_batch(
+        self,
+        operations: Iterable[tuple[str, str, dict[str, Any] | None]],
+        *,
+        max_concurrency: int = 10,
+    ) -> list[ExecutionResult]:
+        """Execute multiple operations concurrently through the cloud API.
+
+        The connector is resolved and the bearer token fetched once for the whole
+        batch; the operations then share the cloud client's keepalive connections,
+        with at most ``max_concurrency`` requests in flight. Each request is retried
+        per the executor's retry_config. A failing operation does not abort the
+        batch: it is returned as a failed ExecutionResult.
+
+        Args:
+            operations: (entity, action, params) tuples
+            max_concurrency: Maximum number of operations in flight at once
+
+        Returns:
+            One ExecutionResult per operation, in the same order as operations.
+
+        Raises:
+            ValueError: If max_concurrency is below 1, or the connector lookup fails
+            AuthenticationError: If the bearer token cannot be obtained
+
+        Example:
+            results = await executor.execute_batch([
+                ("customers", "get", {"id": "cus_123"}),
+                ("invoices", "list", {"customer": "cus_123"}),
+            ])
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        configs = [ExecutionConfig(entity=entity, action=action, params=params) for entity, action, params in operations]
+        if not configs:
+            return []
+
+        tracer = trace.get_tracer("airbyte.connector-sdk.executor.hosted")
+        with tracer.start_as_current_span("airbyte.hosted_executor.execute_batch") as span:
+            span.set_attribute("batch.size", len(configs))
+            span.set_attribute("batch.max_concurrency", max_concurrency)
+
+            # Per-batch setup, so concurrent operations don't each repeat it
+            await self._cloud_client.get_bearer_token()
+            connector_id = await self._resolve_connector_id()
+            span.set_attribute("connector.connector_id", connector_id)
+
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def run(config: ExecutionConfig) -> ExecutionResult:
+                async with semaphore:
+                    try:
+                        return await self._execute_config(config, connector_id)
+                    except Exception as e:
+                        return ExecutionResult(success=False, data={}, error=str(e))
+
+            results = await asyncio.gather(*(run(config) for config in configs))
+            span.set_attribute("batch.failed", sum(not result.success for result in results))
+            return list(results)
+
     async def check(self) -> ExecutionResult:
         """Perform a health check by executing a lightweight operation.
 
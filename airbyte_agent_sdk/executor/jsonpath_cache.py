@@ -0,0 +1,70 @@
+"""Compiled JSONPath expressions for record and metadata extraction.
+
+jsonpath_ng's parser is PLY-based and costs more than the extraction itself on
+small pages, so expressions are parsed once per process and cached by their
+string. Plain field paths such as ``$.data``, ``$.paging.next.after`` and
+``$.results[*]`` additionally skip jsonpath_ng at extraction time with direct
+dict lookups.
+
+The fast path only handles inputs whose result is unambiguous (dicts all the
+way down, a list under ``[*]``) and defers to the parsed expression for
+everything else, so results are identical to
+``[m.value for m in parse(expr).find(data)]``.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any
+
+from jsonpath_ng import parse as parse_jsonpath
+
+# "$", "$.a", "$.a.b", optionally followed by "[*]"
+_SIMPLE_PATH = re.compile(r"^\$((?:\.[A-Za-z_][A-Za-z0-9_]*)*)(\[\*\])?$")
+
+
+class CompiledJSONPath:
+    """A parsed JSONPath expression with a dict-lookup fast path for simple field paths."""
+
+    __slots__ = ("expression", "_parsed", "_fields", "_wildcard")
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        # Always parse so invalid expressions fail exactly as before
+        self._parsed = parse_jsonpath(expression)
+        match = _SIMPLE_PATH.match(expression)
+        self._fields: tuple[str, ...] | None = tuple(match.group(1).split(".")[1:]) if match else None
+        self._wildcard = bool(match and match.group(2))
+
+    def find_values(self, data: Any) -> list[Any]:
+        """Return the values of all matches in document order."""
+        fields = self._fields
+        if fields is not None:
+            value = data
+            for field in fields:
+                if type(value) is not dict:
+                    break
+                if field not in value:
+                    return []
+                value = value[field]
+            else:
+                if not self._wildcard:
+                    return [value]
+                if type(value) is list:
+                    return list(value)
+        return [match.value for match in self._parsed.find(data)]
+
+    def __repr__(self) -> str:
+        return f"CompiledJSONPath({self.expression!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_jsonpath(expression: str) -> CompiledJSONPath:
+    """Return the cached compiled form of a JSONPath expression.
+
+    Raises:
+        Exception: Whatever jsonpath_ng raises for an invalid expression.
+            Failed parses are not cached.
+    """
+    return CompiledJSONPath(expression)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
 import inspect
 import json as json_module
 import logging
@@ -11,26 +12,29 @@ import os
 import re
 import time
 import uuid
-from collections.abc import AsyncIterator
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
 from datetime import datetime, timedelta, timezone
 from typing import Any, Protocol, overload
-from urllib.parse import quote
+from urllib.parse import urlsplit
 
 from jinja2 import Environment, StrictUndefined, Template
-from jsonpath_ng import parse as parse_jsonpath
 from opentelemetry import trace
 
 from airbyte_agent_sdk.auth_template import apply_auth_mapping
+from airbyte_agent_sdk.concurrency_limiter import AdaptiveConcurrencyLimiter
 from airbyte_agent_sdk.connector_model_loader import load_connector_model
 from airbyte_agent_sdk.constants import (
     DEFAULT_MAX_CONNECTIONS,
     DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
 )
-from airbyte_agent_sdk.http.exceptions import ConnectorValidationError, HTTPClientError
+from airbyte_agent_sdk.http.exceptions import AuthenticationError, HTTPClientError
 from airbyte_agent_sdk.http_client import HTTPClient, TokenRefreshCallback
-from airbyte_agent_sdk.logging import NullLogger, RequestLogger
+from airbyte_agent_sdk.logging import NullLogger, RequestLogger, StreamingRequestLogger
 from airbyte_agent_sdk.observability import ObservabilitySession
-from airbyte_agent_sdk.schema.extensions import RetryConfig
+from airbyte_agent_sdk.performance import PerformanceMonitor
+from airbyte_agent_sdk.performance.timings import OperationTimings, current_timings, start_timings, stop_timings
+from airbyte_agent_sdk.schema.extensions import PaginationConfig, RateLimitConfig, RetryConfig
 from airbyte_agent_sdk.schema.security import AuthConfigSpec
 from airbyte_agent_sdk.secrets import SecretStr
 from airbyte_agent_sdk.telemetry import SegmentTracker
@@ -44,6 +48,7 @@ from airbyte_agent_sdk.types import (
 )
 from airbyte_agent_sdk.utils import find_matching_auth_options
 
+from .jsonpath_cache import compile_jsonpath
 from .models import (
     ActionNotSupportedError,
     EntityNotFoundError,
@@ -55,6 +60,20 @@ from .models import (
     StandardExecuteResult,
     find_check_operation,
 )
+from .pagination import PageRequest, advance, next_page_from_metadata, next_page_request, resolve_pagination
+from .parent_cache import DEFAULT_PARENT_CACHE_TTL, CircularParentError, ParentKey, ParentRecordCache
+from .record_predicates import FALLBACK, FALSY_RENDERED_STRINGS, RecordPredicate, compile_record_predicate
+from .request_plan import (
+    BodyEncoding,
+    RequestPlan,
+    check_enum_param,
+    compile_path_template,
+    config_injected_query_params,
+    enum_checked_params,
+    inject_config_query_params,
+    request_body_encoding,
+)
+from .response_cache import ResponseCache
 
 _logger = logging.getLogger(__name__)
 
@@ -65,6 +84,11 @@ CHECK_STATUS_UNHEALTHY = "unhealthy"
 CHECK_STATUS_SKIPPED = "skipped"
 CHECK_STATUS_FAILED = "failed"
 
+# Read actions whose results may be served from the response cache
+_CACHEABLE_ACTIONS = frozenset({Action.GET, Action.LIST, Action.API_SEARCH})
+# Actions that invalidate cached reads of the same entity when they succeed
+_MUTATING_ACTIONS = frozenset({Action.CREATE, Action.UPDATE, Action.DELETE})
+
 
 class ParamResolutionError(Exception):
     """Raised when a path parameter cannot be resolved for entity probing.
@@ -99,6 +123,20 @@ class ParentProbeError(Exception):
         self.status_code = status_code
 
 
+def _emit_phase_spans(tracer: trace.Tracer, parent: trace.Span, timings: OperationTimings) -> None:
+    """Record each timed phase as a child span of the operation span."""
+    context = trace.set_span_in_context(parent)
+    for phase, started_at, ended_at in timings.intervals:
+        child = tracer.start_span(f"airbyte.local_executor.{phase}", context=context, start_time=timings.epoch_ns(started_at))
+        child.end(end_time=timings.epoch_ns(ended_at))
+
+
+@functools.lru_cache(maxsize=64)
+def _url_host(url: str) -> str:
+    """Host (with port) of a base URL, used as a metrics attribute."""
+    return urlsplit(url).netloc
+
+
 def _parse_iso_duration(iso_str: str) -> timedelta:
     """Parse an ISO 8601 duration string into a `timedelta`.
 
@@ -147,6 +185,7 @@ class _OperationContext:
         self.logger = executor.logger
         self.entity_index = executor._entity_index
         self.operation_index = executor._operation_index
+        self.request_plans = executor._request_plans
         # Bind helper methods
         self.build_path = executor._build_path
         self.extract_query_params = executor._extract_query_params
@@ -157,6 +196,7 @@ class _OperationContext:
         self.validate_required_body_fields = executor._validate_required_body_fields
         self.validate_enum_params = executor._validate_enum_params
         self.extract_records = executor._extract_records
+        self.filter_records = executor._filter_records
 
     @property
     def standard_handler(self) -> _StandardOperationHandler | None:
@@ -234,6 +274,17 @@ class LocalExecutor:
         config_values: dict[str, str] | None = None,
         on_token_refresh: TokenRefreshCallback = None,
         retry_config: RetryConfig | None = None,
+        coalesce_reads: bool = False,
+        response_cache: ResponseCache | None = None,
+        cache_ttls: dict[str, float] | None = None,
+        rate_limit: RateLimitConfig | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        http2: bool = False,
+        share_connection_pool: bool = False,
+        stream_logs: bool = False,
+        parent_cache_ttl: float = DEFAULT_PARENT_CACHE_TTL,
+        performance_monitor: PerformanceMonitor | None = None,
+        collect_timings: bool = False,
     ):
         """Initialize async executor.
 
@@ -257,7 +308,7 @@ class LocalExecutor:
             max_keepalive_connections: Maximum number of keepalive connections
             max_logs: Maximum number of logs to keep in memory before rotation.
                 Set to None for unlimited (not recommended for production).
-                Defaults to 10000.
+                Defaults to 10000. Ignored when stream_logs is True.
             config_values: Optional dict of config values for server variable substitution
                 (e.g., {"subdomain": "acme"} for URLs like https://{subdomain}.api.example.com).
             on_token_refresh: Optional callback function(new_tokens: dict) called when
@@ -266,6 +317,53 @@ class LocalExecutor:
             retry_config: Optional retry configuration override. If provided, overrides
                 the connector.yaml x-airbyte-retry-config. If None, uses connector.yaml
                 config or SDK defaults.
+            coalesce_reads: If True, concurrent identical GET requests (same URL, query,
+                headers and credentials) share one upstream HTTP request. Mutations are
+                never coalesced. Coalesced requests are counted in
+                ``http_client.metrics.get_stats()["coalesced_count"]``.
+            response_cache: Optional cache for get/list/api_search results from
+                ``execute()``. Entries are keyed by connector, credentials, entity,
+                action and params, and a successful create/update/delete on an entity
+                invalidates its cached reads. Hit/miss/eviction counts are available
+                from ``response_cache.get_stats()``.
+            cache_ttls: Per-entity TTL overrides in seconds, taking precedence over the
+                entity's x-airbyte-cache-ttl and the cache's default_ttl. Use 0 to
+                disable caching for an entity.
+            rate_limit: Optional client-side request quota override. If provided, overrides
+                the connector.yaml x-airbyte-rate-limit. Throttling waits are counted in
+                ``http_client.metrics.get_stats()["throttled_count"]``.
+            concurrency_limiter: Optional AIMD limit on concurrent HTTP requests, applied
+                to everything this executor sends (execute_batch, prefetched pages,
+                entity checks). Requests over the limit queue in order instead of timing
+                out on the connection pool. The current window and queue depth are
+                available from ``concurrency_limiter.get_stats()``.
+            http2: If True, negotiate HTTP/2 with APIs that support it, multiplexing
+                concurrent requests over a few connections instead of up to
+                max_connections. Requires the optional h2 package
+                (``pip install airbyte-agent-sdk[http2]``); falls back to HTTP/1.1 without it.
+            share_connection_pool: If True, borrow sockets from a process-wide connection
+                pool shared with other executors for the same API host, instead of
+                keeping a private keepalive pool per executor. Credentials stay per
+                executor, and close() only releases this executor's reference.
+            stream_logs: If True (with enable_logging), append each request log to log_file
+                as NDJSON from a background thread instead of keeping the session in
+                memory until close(). Memory and file size are bounded; see
+                StreamingRequestLogger. The NDJSON format is not read by CassetteGenerator.
+            parent_cache_ttl: Seconds to reuse the parent-entity records fetched to resolve
+                path params in check_entities(). Concurrent lookups of the same parent
+                always share one request; 0 disables reuse beyond that. Counts are
+                available from ``parent_record_cache.get_stats()``.
+            performance_monitor: Optional PerformanceMonitor receiving latency histograms
+                per connector, entity, action and host for each operation: ``operation``
+                (total), ``network`` (request sent to body received), ``json_parse``,
+                ``extraction`` (metadata and records) and ``retry_wait``. Also enables the
+                request latency histogram in ``http_client.metrics.get_stats()``. Create
+                the monitor with export_otel=True to publish through OpenTelemetry metrics.
+                None (the default) skips all timing collection.
+            collect_timings: If True, attach the seconds spent per phase (auth refresh,
+                pool wait, connect, TLS, server, download, JSON decode, extraction,
+                record_filter, retry waits) to ``ExecutionResult.timings`` and emit each
+                phase as a child span of the operation span. Off by default.
         """
         # Validate mutual exclusivity of secrets and auth_config
         if secrets is not None and auth_config is not None:
@@ -313,7 +411,9 @@ class LocalExecutor:
         self.tracker.track_connector_init(connector_version=getattr(self.model, "version", None))
 
         # Initialize logger
-        if enable_logging:
+        if enable_logging and stream_logs:
+            self.logger = StreamingRequestLogger(log_file=log_file, connector_name=self.model.name)
+        elif enable_logging:
             self.logger = RequestLogger(
                 log_file=log_file,
                 connector_name=self.model.name,
@@ -333,18 +433,27 @@ class LocalExecutor:
             max_keepalive_connections=max_keepalive_connections,
             on_token_refresh=on_token_refresh,
             retry_config=retry_config or self.model.retry_config,
+            coalesce_reads=coalesce_reads,
+            rate_limit=rate_limit or self.model.rate_limit,
+            concurrency_limiter=concurrency_limiter,
+            http2=http2,
+            share_connection_pool=share_connection_pool,
         )
+        self.concurrency_limiter = concurrency_limiter
 
         # Build O(1) lookup indexes
         self._entity_index: dict[str, EntityDefinition] = {entity.name: entity for entity in self.model.entities}
 
-        # Build O(1) operation index: (entity, action) -> endpoint
+        # Build O(1) operation index: (entity, action) -> endpoint, with each
+        # endpoint's request structure compiled once
         self._operation_index: dict[tuple[str, Action], Any] = {}
+        self._request_plans: dict[tuple[str, Action], RequestPlan] = {}
         for entity in self.model.entities:
             for action in entity.actions:
                 endpoint = entity.endpoints.get(action)
                 if endpoint:
                     self._operation_index[(entity.name, action)] = endpoint
+                    self._request_plans[(entity.name, action)] = RequestPlan.compile(endpoint)
 
         # Build O(1) scoping index: param_name -> config_key
         self._scoping_index: dict[str, str] = {s.param: (s.config_key or s.param) for s in self.model.scoping}
@@ -358,6 +467,28 @@ class LocalExecutor:
                 if rel.foreign_key not in self._global_fk_index:
                     self._global_fk_index[rel.foreign_key] = (rel.target_entity, rel.target_key)
 
+        # Compiled record_filter / record_transform templates, keyed by template source
+        self._record_filter_cache: dict[str, tuple[Template, RecordPredicate | None]] = {}
+        self._record_transform_cache: dict[tuple[tuple[str, str], ...], dict[str, Template]] = {}
+
+        self.performance_monitor = performance_monitor
+        self.collect_timings = collect_timings
+        if performance_monitor is not None:
+            self.http_client.metrics.enable_latency_histogram()
+
+        # Parent-entity records used to resolve path params, shared across check_entities() calls
+        self.parent_record_cache = ParentRecordCache(ttl=parent_cache_ttl)
+
+        # Response cache; the namespace keeps entries for different connectors/credentials apart
+        self.response_cache = response_cache
+        self._cache_ttls = dict(cache_ttls or {})
+        self._cache_namespace = (
+            f"{self.model.id}:{self.http_client.base_url}:{self.http_client._auth_identity()}" if response_cache is not None else ""
+        )
+
+        # Resolved pagination strategies, keyed by (entity, action); None means single-page
+        self._pagination_cache: dict[tuple[str, Action], PaginationConfig | None] = {}
+
         # Register operation handlers (order matters for can_handle priority)
         op_context = _OperationContext(self)
         self._operation_handlers: list[_OperationHandler] = [
@@ -644,6 +775,13 @@ class LocalExecutor:
             action = Action(config.action) if isinstance(config.action, str) else config.action
             params = self._merge_scoping_defaults(config.params or {})
 
+            cache_key, cache_ttl = self._response_cache_lookup_key(config.entity, action, params)
+            if cache_key is not None:
+                cached = await self.response_cache.aget(cache_key)
+                if cached is not None:
+                    data, meta = cached
+                    return ExecutionResult(success=True, data=data, error=None, meta=meta)
+
             # Dispatch to handler (handlers handle telemetry internally)
             handler = next((h for h in self._operation_handlers if h.can_handle(action)), None)
             if not handler:
@@ -664,11 +802,19 @@ class LocalExecutor:
             else:
                 # Standard operation: await and extract data and metadata
                 handler_result = await result
+                if cache_key is not None:
+                    await self.response_cache.aset(
+                        cache_key,
+                        self._cache_scope(config.entity),
+                        (handler_result.data, handler_result.metadata),
+                        cache_ttl,
+                    )
                 return ExecutionResult(
                     success=True,
                     data=handler_result.data,
                     error=None,
                     meta=handler_result.metadata,
+                    timings=handler_result.timings,
                 )
 
         except (
@@ -768,8 +914,7 @@ class LocalExecutor:
                 data={"entity_results": entity_results, "status": CHECK_STATUS_UNHEALTHY if entities else CHECK_STATUS_HEALTHY},
             )
 
-        parent_cache: dict[str, list[dict]] = {}
-        tasks = [self._probe_entity(name, standard_handler, parent_cache) for name in entities]
+        tasks = [self._probe_entity(name, standard_handler) for name in entities]
         entity_results = await asyncio.gather(*tasks)
 
         acceptable = {CHECK_STATUS_HEALTHY, CHECK_STATUS_SKIPPED}
@@ -792,7 +937,6 @@ class LocalExecutor:
         self,
         entity_name: str,
         standard_handler: _StandardOperationHandler,
-        parent_cache: dict[str, list[dict]],
     ) -> dict[str, Any]:
         """Probe a single entity's health by executing its list or get operation."""
         endpoint = self._operation_index.get((entity_name, Action.LIST))
@@ -840,7 +984,6 @@ class LocalExecutor:
                         entity_name,
                         endpoint,
                         standard_handler,
-                        parent_cache,
                         params_to_resolve=params_needing_resolution,
                     )
                     params.update(resolved)
@@ -880,9 +1023,9 @@ class LocalExecutor:
         entity_name: str,
         endpoint: EndpointDefinition,
         standard_handler: _StandardOperationHandler,
-        parent_cache: dict[str, list[dict]],
         depth: int = 0,
         params_to_resolve: list[str] | None = None,
+        waiter: ParentKey | None = None,
     ) -> dict[str, Any]:
         """Resolve params using scoping, config fallback, and entity relationships.
 
@@ -891,6 +1034,10 @@ class LocalExecutor:
         2. Config fallback (param name matches a config_values key)
         3. Entity relationships (from entity.relationships by foreign_key)
 
+        Parent entities needed for step 3 are fetched concurrently through
+        ``parent_record_cache``; ``waiter`` is the parent fetch this resolution
+        runs in, if any.
+
         Returns dict of {param_name: resolved_value}.
         Raises ParamResolutionError if any param cannot be resolved.
         """
@@ -907,6 +1054,10 @@ class LocalExecutor:
         target_params = params_to_resolve if params_to_resolve is not None else list(endpoint.path_params)
 
         resolved: dict[str, Any] = {}
+        # param_name -> (parent_entity, parent_key) for params read from a parent record
+        from_parents: dict[str, tuple[str, str]] = {}
+        # Raised after the parents of earlier params, so their failures take precedence
+        deferred_error: ParamResolutionError | None = None
         for param_name in target_params:
             # 1. Check scoping index
             scoping_key = self._scoping_index.get(param_name)
@@ -926,68 +1077,102 @@ class LocalExecutor:
                 # Fallback: another entity declares a relationship for this foreign key
                 parent_entity_name, parent_key = self._global_fk_index[param_name]
             else:
-                raise ParamResolutionError(f"Cannot resolve param '{param_name}' for entity '{entity_name}'")
+                deferred_error = ParamResolutionError(f"Cannot resolve param '{param_name}' for entity '{entity_name}'")
+                break
             if parent_entity_name == entity_name:
-                raise ParamResolutionError(f"Self-referential param '{param_name}' on entity '{entity_name}'")
-
-            if parent_entity_name not in parent_cache:
+                deferred_error = ParamResolutionError(f"Self-referential param '{param_name}' on entity '{entity_name}'")
+                break
+            from_parents[param_name] = (parent_entity_name, parent_key)
+
+        if from_parents:
+            scope = json_module.dumps(self.config_values, sort_keys=True, default=str)
+            parents = list(dict.fromkeys(parent_entity_name for parent_entity_name, _ in from_parents.values()))
+            fetched = await asyncio.gather(
+                *(self._get_parent_records(parent, scope, standard_handler, depth, waiter) for parent in parents),
+                return_exceptions=True,
+            )
+            records_by_parent = dict(zip(parents, fetched, strict=True))
+            for param_name, (parent_entity_name, parent_key) in from_parents.items():
+                records = records_by_parent[parent_entity_name]
+                if isinstance(records, BaseException):
+                    raise records
+                value = records[0].get(parent_key)
+                if value is None:
+                    raise ParamResolutionError(f"Parent key '{parent_key}' not found in '{parent_entity_name}' response")
+                resolved[param_name] = value
                 _logger.info(
-                    "Resolving param '%s' for entity '%s' via parent entity '%s'",
+                    "Resolved param '%s' for entity '%s' via parent entity '%s'",
                     param_name,
                     entity_name,
                     parent_entity_name,
                 )
-                parent_endpoint = self._operation_index.get((parent_entity_name, Action.LIST))
-                if parent_endpoint is None:
-                    raise ParamResolutionError(f"Parent entity '{parent_entity_name}' has no LIST operation")
-                parent_params: dict[str, Any] = {"limit": 1}
-                # Inject query param defaults for parent entity (mirrors _probe_entity logic).
-                parent_repl_constants = self._get_replication_constants()
-                for pname, pschema in parent_endpoint.query_params_schema.items():
-                    if pname not in parent_params and pschema.get("default") is not None:
-                        parent_params[pname] = _evaluate_probe_default(pschema["default"], parent_repl_constants)
-                parent_resolve_list = list(parent_endpoint.path_params)
-                parent_entity_def = self._entity_index.get(parent_entity_name)
-                if parent_entity_def:
-                    for prel in parent_entity_def.relationships:
-                        if prel.foreign_key not in parent_resolve_list and prel.foreign_key not in parent_params:
-                            parent_resolve_list.append(prel.foreign_key)
-                if parent_resolve_list:
-                    parent_resolved = await self._resolve_path_params(
-                        parent_entity_name,
-                        parent_endpoint,
-                        standard_handler,
-                        parent_cache,
-                        depth + 1,
-                        params_to_resolve=parent_resolve_list,
-                    )
-                    parent_params.update(parent_resolved)
-                try:
-                    result = await standard_handler.execute_operation(parent_entity_name, Action.LIST, parent_params)
-                except Exception as exc:
-                    raise ParentProbeError(
-                        f"Parent entity '{parent_entity_name}' probe failed: {exc}",
-                        status_code=getattr(exc, "status_code", None),
-                    ) from exc
-                records = result.data if isinstance(result.data, list) else []
-                if not records:
-                    raise ParamResolutionError(f"Parent entity '{parent_entity_name}' returned no records")
-                parent_cache[parent_entity_name] = records
-
-            record = parent_cache[parent_entity_name][0]
-            value = record.get(parent_key)
-            if value is None:
-                raise ParamResolutionError(f"Parent key '{parent_key}' not found in '{parent_entity_name}' response")
-            resolved[param_name] = value
-            _logger.info(
-                "Resolved param '%s' for entity '%s' via parent entity '%s'",
-                param_name,
-                entity_name,
-                parent_entity_name,
-            )
 
+        if deferred_error is not None:
+            raise deferred_error
         return resolved
 
+    async def _get_parent_records(
+        self,
+        parent_entity_name: str,
+        scope: str,
+        standard_handler: _StandardOperationHandler,
+        depth: int,
+        waiter: ParentKey | None,
+    ) -> list[dict[str, Any]]:
+        """Get a parent entity's records from parent_record_cache, fetching them on a miss."""
+        key: ParentKey = (parent_entity_name, scope)
+        fetch = functools.partial(self._fetch_parent_records, parent_entity_name, standard_handler, depth, key)
+        try:
+            return await self.parent_record_cache.get(key, fetch, waiter=waiter)
+        except CircularParentError as exc:
+            raise ParamResolutionError(str(exc)) from exc
+
+    async def _fetch_parent_records(
+        self,
+        parent_entity_name: str,
+        standard_handler: _StandardOperationHandler,
+        depth: int,
+        key: ParentKey,
+    ) -> list[dict[str, Any]]:
+        """List one record of a parent entity, resolving its own parent params first."""
+        _logger.info("Resolving parent entity '%s'", parent_entity_name)
+        parent_endpoint = self._operation_index.get((parent_entity_name, Action.LIST))
+        if parent_endpoint is None:
+            raise ParamResolutionError(f"Parent entity '{parent_entity_name}' has no LIST operation")
+        parent_params: dict[str, Any] = {"limit": 1}
+        # Inject query param defaults for parent entity (mirrors _probe_entity logic).
+        parent_repl_constants = self._get_replication_constants()
+        for pname, pschema in parent_endpoint.query_params_schema.items():
+            if pname not in parent_params and pschema.get("default") is not None:
+                parent_params[pname] = _evaluate_probe_default(pschema["default"], parent_repl_constants)
+        parent_resolve_list = list(parent_endpoint.path_params)
+        parent_entity_def = self._entity_index.get(parent_entity_name)
+        if parent_entity_def:
+            for prel in parent_entity_def.relationships:
+                if prel.foreign_key not in parent_resolve_list and prel.foreign_key not in parent_params:
+                    parent_resolve_list.append(prel.foreign_key)
+        if parent_resolve_list:
+            parent_resolved = await self._resolve_path_params(
+                parent_entity_name,
+                parent_endpoint,
+                standard_handler,
+                depth + 1,
+                params_to_resolve=parent_resolve_list,
+                waiter=key,
+            )
+            parent_params.update(parent_resolved)
+        try:
+            result = await standard_handler.execute_operation(parent_entity_name, Action.LIST, parent_params)
+        except Exception as exc:
+            raise ParentProbeError(
+                f"Parent entity '{parent_entity_name}' probe failed: {exc}",
+                status_code=getattr(exc, "status_code", None),
+            ) from exc
+        records = result.data if isinstance(result.data, list) else []
+        if not records:
+            raise ParamResolutionError(f"Parent entity '{parent_entity_name}' returned no records")
+        return records
+
     async def _execute_operation(
         self,
         entity: str,
@@ -1082,6 +1267,366 @@ class LocalExecutor:
 
         return extracted_results
 
+    async def execute_batch_iter(
+        self,
+        operations: Iterable[tuple[str, str | Action, dict[str, Any] | None]],
+        *,
+        max_concurrency: int | None = None,
+        cancel_on_auth_error: bool = False,
+    ) -> AsyncIterator[tuple[int, ExecutionResult]]:
+        """Execute multiple operations concurrently, yielding each result as it completes.
+
+        Unlike execute_batch(), a failing operation does not abort the batch: every
+        operation yields exactly one ``(index, ExecutionResult)``, with errors reported
+        as failed results. Results arrive in completion order; ``index`` is the
+        operation's position in ``operations``. Completed results are not retained,
+        so memory stays bounded by the operations in flight.
+
+        Args:
+            operations: (entity, action, params) tuples. Consumed lazily, so a generator
+                works for very large batches.
+            max_concurrency: Maximum number of operations running at once. None starts
+                them all immediately (the connection pool and any concurrency_limiter
+                still bound the HTTP requests).
+            cancel_on_auth_error: If True, the first 401 response cancels every operation
+                that has not finished yet; each is yielded as a failed result.
+
+        Yields:
+            (index, ExecutionResult) tuples in completion order.
+
+        Example:
+            async for index, result in executor.execute_batch_iter(
+                ("customers", "get", {"id": customer_id}) for customer_id in customer_ids
+            ):
+                if result.success:
+                    process(result.data)
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        pending_operations = enumerate(operations)
+        running: dict[asyncio.Task[ExecutionResult], int] = {}
+
+        def start_next() -> bool:
+            item = next(pending_operations, None)
+            if item is None:
+                return False
+            index, (entity, action, params) = item
+            action_name = action.value if isinstance(action, Action) else action
+            running[asyncio.ensure_future(self.execute(entity, action_name, params=params))] = index
+            return True
+
+        def fill() -> None:
+            while (max_concurrency is None or len(running) < max_concurrency) and start_next():
+                pass
+
+        fill()
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                auth_error: AuthenticationError | None = None
+                for task in sorted(done, key=running.__getitem__):
+                    index = running.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        if cancel_on_auth_error and isinstance(e, AuthenticationError) and e.status_code == 401:
+                            auth_error = auth_error or e
+                        result = ExecutionResult(success=False, data={}, error=str(e))
+                    yield index, result
+
+                if auth_error is not None:
+                    remaining = sorted(running.items(), key=lambda item: item[1])
+                    running.clear()
+                    for task, _ in remaining:
+                        task.cancel()
+                    await asyncio.gather(*(task for task, _ in remaining), return_exceptions=True)
+                    error = f"Cancelled after authentication failure: {auth_error}"
+                    for task, index in remaining:
+                        # A task may have finished before the cancellation reached it
+                        if not task.cancelled() and task.exception() is None:
+                            yield index, task.result()
+                        else:
+                            yield index, ExecutionResult(success=False, data={}, error=error)
+                    for index, _ in pending_operations:
+                        yield index, ExecutionResult(success=False, data={}, error=error)
+                    return
+
+                fill()
+        finally:
+            # The consumer stopped early: don't leave operations running
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def execute_paginated(
+        self,
+        entity: str,
+        params: dict[str, Any] | None = None,
+        *,
+        action: str | Action = Action.LIST,
+        max_pages: int | None = None,
+        max_records: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[ExecutionResult]:
+        """Execute a list operation and follow its pages.
+
+        Yields one ExecutionResult per page. The page-following strategy comes from
+        the endpoint's x-airbyte-pagination, or is inferred from its meta extractor;
+        endpoints without a recognizable strategy yield a single page.
+
+        Iteration stops when a page is empty, the has-more flag is falsy, the next
+        cursor or link is missing, the same page would be requested twice, or a
+        max_pages / max_records limit is reached. When max_records is set, the
+        page-size param is shrunk (never grown) to the number of records still needed
+        once the pages already requested are counted (never for page_number pagination,
+        where the page size fixes which records a page covers). Offsets advance by the
+        records the API returned, including those dropped by record_filter.
+
+        With prefetch > 0, pages are fetched ahead of the consumer:
+
+        - cursor / next_link: the request for page N+1 is issued as soon as page N's
+          metadata is extracted, overlapping record extraction of page N (and the
+          caller's processing of it) with the network wait for page N+1.
+        - offset / page_number: up to `prefetch` later pages are requested in
+          parallel once the first page reveals the page size.
+        - last_record: page N+1 is issued before page N is yielded.
+
+        Pages are always yielded in order. Requests issued past the last page are
+        cancelled or discarded.
+
+        Args:
+            entity: Entity name
+            params: Parameters for the first page
+            action: List-style action to paginate (default: list)
+            max_pages: Optional maximum number of pages to fetch
+            max_records: Optional maximum number of records to yield in total
+            prefetch: Number of pages to fetch ahead of the consumer (default: 0,
+                fully sequential)
+
+        Yields:
+            ExecutionResult for each page. Expected execution errors (unknown entity,
+            unsupported action, invalid params) are yielded as a single failed result.
+
+        Example:
+            async for page in executor.execute_paginated("customers", {"limit": 100}, max_records=500):
+                for record in page.data:
+                    ...
+        """
+        action = Action(action) if isinstance(action, str) else action
+        params = self._merge_scoping_defaults(dict(params or {}))
+
+        handler = next((h for h in self._operation_handlers if h.can_handle(action)), None)
+        if not isinstance(handler, _StandardOperationHandler):
+            raise ExecutorError(f"Action '{action.value}' cannot be paginated.")
+
+        pagination = self._resolve_pagination(entity, action)
+        base_url = self.http_client.base_url
+        pipelined = pagination is not None and prefetch > 0 and pagination.strategy in ("cursor", "next_link")
+        windowed = pagination is not None and prefetch > 0 and pagination.strategy in ("offset", "page_number")
+        # A smaller page changes which records a page number covers, so page_number sizes are never shrunk
+        limit_param = pagination.limit_param if pagination is not None and pagination.strategy != "page_number" else None
+
+        in_flight: deque[tuple[PageRequest, asyncio.Task[StandardExecuteResult]]] = deque()
+        seen: set[str] = set()
+        scheduled = 0
+        pages = 0
+        records_remaining = max_records
+        page_step: int | None = None
+        # Popped from in_flight but not yet counted against records_remaining
+        awaiting: PageRequest | None = None
+
+        def requested_limit(request: PageRequest) -> int | None:
+            limit = request.params.get(limit_param) if limit_param else None
+            return limit if isinstance(limit, int) and limit > 0 else None
+
+        def step_of(request: PageRequest) -> int:
+            # Servers may cap the page size below the requested limit, so the first page fixes the step
+            limit = requested_limit(request)
+            return min(page_step or 0, limit) if limit is not None else page_step or 0
+
+        def schedule(request: PageRequest) -> PageRequest | None:
+            """Start fetching a page; returns the request as sent, or None if it is not needed."""
+            nonlocal scheduled
+            if max_pages is not None and scheduled >= max_pages:
+                return None
+            if limit_param and records_remaining is not None:
+                # Records still needed once the pages already requested are consumed
+                pending = [r for r, _ in in_flight] + ([awaiting] if awaiting is not None else [])
+                needed = records_remaining - sum(requested_limit(r) or 0 for r in pending)
+                if needed <= 0 and pending:
+                    return None
+                limit = request.params.get(limit_param)
+                if isinstance(limit, int) and limit > needed > 0:
+                    seen.add(request.key())
+                    request = PageRequest(params={**request.params, limit_param: needed}, url=request.url)
+            seen.add(request.key())
+
+            on_metadata = None
+            if pipelined:
+
+                def on_metadata(meta: dict[str, Any] | None) -> None:
+                    # Only chain from the newest page; earlier pages already have a successor
+                    if in_flight and in_flight[-1][0] is not request:
+                        return
+                    next_request = next_page_from_metadata(pagination, request, meta, base_url)
+                    if next_request is not None and next_request.key() not in seen:
+                        schedule(next_request)
+
+            task = asyncio.ensure_future(handler.execute_operation(entity, action, request.params, url=request.url, on_metadata=on_metadata))
+            in_flight.append((request, task))
+            scheduled += 1
+            return request
+
+        schedule(PageRequest(params=params))
+        try:
+            while in_flight:
+                request, task = in_flight.popleft()
+                awaiting = request
+                try:
+                    result = await task
+                except (
+                    EntityNotFoundError,
+                    ActionNotSupportedError,
+                    MissingParameterError,
+                    InvalidParameterError,
+                ) as e:
+                    yield ExecutionResult(success=False, data={}, error=str(e))
+                    return
+
+                records = result.data if isinstance(result.data, list) else None
+                if pagination is None or records is None:
+                    yield ExecutionResult(success=True, data=result.data, error=None, meta=result.metadata)
+                    return
+
+                # Page positions follow what the API returned, before record_filter dropped any
+                page_records = result.unfiltered_records if result.unfiltered_records is not None else records
+
+                page_data = records
+                if records_remaining is not None:
+                    page_data = records[:records_remaining]
+                    records_remaining -= len(page_data)
+                awaiting = None
+
+                next_request = next_page_request(pagination, request, page_records, result.metadata, base_url)
+                if records_remaining == 0:
+                    next_request = None
+                if next_request is not None and not in_flight:
+                    if next_request.key() in seen:
+                        _logger.warning(f"Stopping pagination for {entity}.{action.value}: next page repeats a previous request")
+                        next_request = None
+                    elif windowed:
+                        # The first page fixes the step; later pages are requested ahead in parallel
+                        page_step = page_step or len(page_records)
+                        frontier: PageRequest | None = request
+                        while frontier is not None and len(in_flight) < prefetch:
+                            frontier = schedule(advance(pagination, frontier, step_of(frontier)))
+                    elif prefetch:
+                        # last_record depends on this page's records, so it can only run one page ahead
+                        schedule(next_request)
+                elif next_request is not None and windowed:
+                    # A short page means the end was reached; pages requested beyond it are discarded
+                    if len(page_records) < step_of(request):
+                        next_request = None
+                    else:
+                        frontier = in_flight[-1][0]
+                        while frontier is not None and len(in_flight) < prefetch:
+                            frontier = schedule(advance(pagination, frontier, step_of(frontier)))
+
+                pages += 1
+                yield ExecutionResult(success=True, data=page_data, error=None, meta=result.metadata)
+
+                if next_request is None or (max_pages is not None and pages >= max_pages):
+                    return
+                if not in_flight:
+                    schedule(next_request)
+        finally:
+            pending = [task for _, task in in_flight]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def iter_records(
+        self,
+        entity: str,
+        params: dict[str, Any] | None = None,
+        *,
+        action: str | Action = Action.LIST,
+        max_pages: int | None = None,
+        max_records: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Any]:
+        """Iterate over records across all pages of a list operation.
+
+        Thin wrapper around execute_paginated() that flattens pages into records.
+
+        Raises:
+            ExecutorError: If a page fails with an expected execution error
+                (unknown entity, unsupported action, invalid params).
+
+        Example:
+            async for customer in executor.iter_records("customers", max_records=1000, prefetch=1):
+                print(customer["id"])
+        """
+        pages = self.execute_paginated(entity, params, action=action, max_pages=max_pages, max_records=max_records, prefetch=prefetch)
+        async for page in pages:
+            if not page.success:
+                raise ExecutorError(page.error or f"Failed to list {entity}")
+            if isinstance(page.data, list):
+                for record in page.data:
+                    yield record
+            elif page.data is not None:
+                yield page.data
+
+    def _cache_ttl(self, entity: str) -> float | None:
+        """Resolve an entity's cache TTL: caller override, then x-airbyte-cache-ttl, then the cache default."""
+        if entity in self._cache_ttls:
+            return self._cache_ttls[entity]
+        entity_def = self._entity_index.get(entity)
+        if entity_def is not None and entity_def.cache_ttl is not None:
+            return entity_def.cache_ttl
+        return self.response_cache.default_ttl if self.response_cache is not None else None
+
+    def _cache_scope(self, entity: str) -> str:
+        return f"{self._cache_namespace}:{entity}"
+
+    async def _invalidate_after_mutation(self, entity: str, action: Action) -> None:
+        """Drop cached reads of ``entity`` that a create, update or delete may have made stale.
+
+        Called by the standard handler, so every entry point (execute, execute_batch,
+        execute_batch_iter, _execute_operation) invalidates on a successful mutation.
+        """
+        if action not in _MUTATING_ACTIONS:
+            return
+        if self.response_cache is not None:
+            await self.response_cache.ainvalidate(self._cache_scope(entity))
+        if action == Action.DELETE:
+            # The deleted record may be the one used to resolve child path params
+            self.parent_record_cache.invalidate(entity)
+
+    def _response_cache_lookup_key(self, entity: str, action: Action, params: dict[str, Any]) -> tuple[str | None, float]:
+        """Return (cache key, TTL) for a cacheable read, or (None, 0) if it should not be cached."""
+        if self.response_cache is None or action not in _CACHEABLE_ACTIONS:
+            return None, 0
+        ttl = self._cache_ttl(entity)
+        if not ttl or ttl <= 0:
+            return None, 0
+        try:
+            encoded_params = json_module.dumps(params, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None, 0
+        return f"{self._cache_scope(entity)}:{action.value}:{encoded_params}", ttl
+
+    def _resolve_pagination(self, entity: str, action: Action) -> PaginationConfig | None:
+        """Return the cached pagination strategy for an operation."""
+        key = (entity, action)
+        if key not in self._pagination_cache:
+            endpoint = self._operation_index.get(key)
+            self._pagination_cache[key] = resolve_pagination(endpoint) if endpoint is not None else None
+        return self._pagination_cache[key]
+
     def _merge_scoping_defaults(self, params: dict[str, Any]) -> dict[str, Any]:
         """Merge declared `x-airbyte-scoping` values into `params`.
 
@@ -1119,24 +1664,7 @@ class LocalExecutor:
         Raises:
             MissingParameterError: If required path parameter is missing
         """
-        placeholders = re.findall(r"\{(\w+)\}", path_template)
-
-        path = path_template
-        for placeholder in placeholders:
-            if placeholder not in params:
-                raise MissingParameterError(
-                    f"Missing required path parameter '{placeholder}' for path '{path_template}'. Provided parameters: {list(params.keys())}"
-                )
-
-            # Validate parameter value is not None or empty string
-            value = params[placeholder]
-            if value is None or (isinstance(value, str) and value.strip() == ""):
-                raise InvalidParameterError(f"Path parameter '{placeholder}' cannot be None or empty string")
-
-            encoded_value = quote(str(value), safe="")
-            path = path.replace(f"{{{placeholder}}}", encoded_value)
-
-        return path
+        return compile_path_template(path_template).render(params)
 
     def _extract_query_params(
         self,
@@ -1155,24 +1683,7 @@ class LocalExecutor:
             Dictionary of query parameters
         """
         result = {key: value for key, value in params.items() if key in allowed_params}
-        if query_params_schema:
-            for param_name in allowed_params:
-                if param_name not in result and param_name in query_params_schema:
-                    schema = query_params_schema[param_name]
-                    config_inject = schema.get("config_inject")
-                    if config_inject:
-                        source_key = config_inject["source"]
-                        source_value = self.config_values.get(source_key)
-                        if source_value is not None:
-                            value_map = config_inject.get("map")
-                            if value_map:
-                                mapped = value_map.get(source_value)
-                                if mapped is None:
-                                    mapped = value_map.get(source_value.upper())
-                                if mapped is not None:
-                                    result[param_name] = mapped
-                            else:
-                                result[param_name] = source_value
+        inject_config_query_params(result, config_injected_query_params(allowed_params, query_params_schema), self.config_values)
         return result
 
     def _extract_body(self, allowed_fields: list[str], params: dict[str, Any]) -> dict[str, Any]:
@@ -1536,20 +2047,19 @@ class LocalExecutor:
         Returns:
             Dict with 'json' and/or 'data' keys for http_client.request()
         """
+        return self._encode_request_body(endpoint, body, request_body_encoding(endpoint))
+
+    def _encode_request_body(self, endpoint: EndpointDefinition, body: dict[str, Any] | None, encoding: BodyEncoding | None) -> dict[str, Any]:
+        """Encode a request body as json/data/content kwargs for http_client.request()."""
         if not body:
             return {}
-
-        is_graphql = endpoint.graphql_body is not None
-
-        if is_graphql or endpoint.content_type.value == "application/json":
+        if encoding == "json":
             return {"json": body}
-        elif endpoint.content_type.value == "application/x-www-form-urlencoded":
+        if encoding == "form":
             # Flatten nested structures for form encoding
-            flattened_body = self._flatten_form_data(body)
-            return {"data": flattened_body}
-        elif endpoint.content_type.value == "multipart/related":
+            return {"data": self._flatten_form_data(body)}
+        if encoding == "multipart":
             return self._build_multipart_related(endpoint, body)
-
         return {}
 
     def _process_graphql_fields(self, query: str, graphql_config: dict[str, Any], params: dict[str, Any]) -> str:
@@ -1796,6 +2306,7 @@ class LocalExecutor:
         response_data: Any,
         endpoint: EndpointDefinition,
         config: dict[str, Any] | None = None,
+        apply_record_filter: bool = True,
     ) -> dict[str, Any] | list[dict[str, Any]] | None:
         """Extract records from response using record extractor, transform, and filter.
 
@@ -1819,6 +2330,8 @@ class LocalExecutor:
             response_data: Full API response (can be dict, list, primitive, or None)
             endpoint: Endpoint with optional record extractor, record filter, and action
             config: Connector config available to the Jinja filter as `config`
+            apply_record_filter: If False, skip record_filter so the caller can
+                apply it with `_filter_records` and keep the unfiltered page
 
         Returns:
             - Extracted data if extractor configured and path found
@@ -1839,9 +2352,8 @@ class LocalExecutor:
         is_array_action = action in (Action.LIST, Action.API_SEARCH)
 
         try:
-            # Parse and apply JSONPath expression
-            jsonpath_expr = parse_jsonpath(extractor)
-            matches = [match.value for match in jsonpath_expr.find(response_data)]
+            # Apply JSONPath expression (parsed once per expression and cached)
+            matches = compile_jsonpath(extractor).find_values(response_data)
 
             if not matches:
                 # Path not found - return empty based on action
@@ -1883,19 +2395,40 @@ class LocalExecutor:
         if isinstance(record_transform, dict) and record_transform and result is not None:
             result = self._apply_record_transform(result, record_transform, config or {})
 
-        # Apply record_filter (Jinja expression) on list/api_search actions.
         # Intentionally outside the try/except above: a failing record_filter is
         # a connector configuration bug, and for privacy-critical filters silent
         # recovery would leak records. Let the exception propagate.
-        record_filter = getattr(endpoint, "record_filter", None)
-        if is_array_action and isinstance(record_filter, str) and record_filter and result is not None:
-            result = self._apply_record_filter(result, record_filter, config or {})
-
+        if apply_record_filter:
+            result = self._filter_records(result, endpoint, config)
         return result
 
+    def _filter_records(
+        self,
+        records: Any,
+        endpoint: EndpointDefinition,
+        config: dict[str, Any] | None = None,
+    ) -> Any:
+        """Apply the endpoint's record_filter (Jinja expression) on list/api_search actions.
+
+        Like `_extract_records`, only filters records produced by a record
+        extractor. Returns `records` itself when no filter applies.
+        """
+        record_filter = getattr(endpoint, "record_filter", None)
+        if not endpoint.record_extractor or endpoint.action not in (Action.LIST, Action.API_SEARCH):
+            return records
+        if not isinstance(record_filter, str) or not record_filter or records is None:
+            return records
+        timings = current_timings()
+        if timings is not None:
+            filter_started_at = time.perf_counter()
+        records = self._apply_record_filter(records, record_filter, config or {})
+        if timings is not None:
+            timings.add("record_filter", filter_started_at, time.perf_counter())
+        return records
+
     # Strings that a rendered Jinja expression should resolve to a boolean False.
-    # Mirrors Airbyte declarative CDK's InterpolatedBoolean.FALSY_STRINGS.
-    _FALSY_RENDERED_STRINGS = frozenset({"False", "false", "0", "None", "none", "null", ""})
+    # Shared with the fast record predicates so both paths coerce identically.
+    _FALSY_RENDERED_STRINGS = FALSY_RENDERED_STRINGS
 
     # Shared Jinja environment for record_filter evaluation. `Environment` is
     # thread-safe for rendering, so a single module-level instance avoids the
@@ -1936,9 +2469,10 @@ class LocalExecutor:
         input container type: a list stays a list; a single-dict result
         becomes either the same dict (kept) or an empty list (dropped).
 
-        The Jinja template is compiled **once per call** and reused across
-        every record in the batch — compiling per-record would add an O(N)
-        grammar-parse + AST-compile overhead on large list responses.
+        The Jinja template is compiled once per executor and cached (see
+        ``_compile_record_filter``). Simple field predicates such as
+        ``{{ not record.isPrivate }}`` are evaluated directly in Python; records
+        the fast path cannot decide are rendered through Jinja as usual.
 
         Evaluation errors (e.g. missing fields under ``StrictUndefined``,
         invalid template syntax) are intentionally propagated — for
@@ -1948,7 +2482,14 @@ class LocalExecutor:
         (e.g. ``{{ not record.get('isPrivate', false) }}``) when the
         upstream API may omit the field.
         """
-        template = self._RECORD_FILTER_ENV.from_string(condition)
+        template, predicate = self._compile_record_filter(condition)
+
+        def keep(record: dict[str, Any]) -> bool:
+            if predicate is not None:
+                decision = predicate(record)
+                if decision is not FALLBACK:
+                    return decision
+            return self._evaluate_compiled_record_filter(template, record, config)
 
         if isinstance(records, list):
             filtered: list[dict[str, Any]] = []
@@ -1957,12 +2498,12 @@ class LocalExecutor:
                     # Non-dict items can't be filtered by field — keep them.
                     filtered.append(record)
                     continue
-                if self._evaluate_compiled_record_filter(template, record, config):
+                if keep(record):
                     filtered.append(record)
             return filtered
 
         if isinstance(records, dict):
-            if self._evaluate_compiled_record_filter(template, records, config):
+            if keep(records):
                 return records
             # Dropped: return an empty list so downstream list-action consumers
             # still see an iterable.
@@ -1971,6 +2512,23 @@ class LocalExecutor:
         # Unknown shape — return unchanged.
         return records
 
+    def _compile_record_filter(self, condition: str) -> tuple[Template, RecordPredicate | None]:
+        """Return the cached Jinja template and fast predicate for a record filter."""
+        cached = self._record_filter_cache.get(condition)
+        if cached is None:
+            cached = (self._RECORD_FILTER_ENV.from_string(condition), compile_record_predicate(condition))
+            self._record_filter_cache[condition] = cached
+        return cached
+
+    def _compile_record_transform(self, transform: dict[str, str]) -> dict[str, Template]:
+        """Return the cached compiled templates for a record transform mapping."""
+        key = tuple(transform.items())
+        compiled = self._record_transform_cache.get(key)
+        if compiled is None:
+            compiled = {field_name: self._RECORD_TRANSFORM_ENV.from_string(template) for field_name, template in transform.items()}
+            self._record_transform_cache[key] = compiled
+        return compiled
+
     def _apply_record_transform(
         self,
         records: dict[str, Any] | list[dict[str, Any]],
@@ -1978,7 +2536,7 @@ class LocalExecutor:
         config: dict[str, Any],
     ) -> dict[str, Any] | list[dict[str, Any]]:
         """Reshape extracted records via a per-field Jinja mapping."""
-        compiled = {field_name: self._RECORD_TRANSFORM_ENV.from_string(template) for field_name, template in transform.items()}
+        compiled = self._compile_record_transform(transform)
 
         def transform_record(record: Any) -> dict[str, Any]:
             record_context = record if isinstance(record, dict) else {"value": record}
@@ -2049,8 +2607,7 @@ class LocalExecutor:
                     extracted_meta[field_name] = self._get_header_value(response_headers, header_name)
                 else:
                     # JSONPath body extraction
-                    jsonpath_expr = parse_jsonpath(extractor_expr)
-                    matches = [match.value for match in jsonpath_expr.find(response_data)]
+                    matches = compile_jsonpath(extractor_expr).find_values(response_data)
 
                     if matches:
                         # Return first match (most common case)
@@ -2180,40 +2737,21 @@ class LocalExecutor:
                 array/scalar contract.
         """
 
-        def check(name: str, schema: dict[str, Any], value: Any) -> None:
-            if not isinstance(schema, dict):
-                return
-            enum_values = schema.get("enum")
-            raw_items = schema.get("items")
-            items = raw_items if isinstance(raw_items, dict) else None
-            items_enum = items.get("enum") if items else None
-
-            if enum_values and value not in enum_values:
-                raise ConnectorValidationError(f"Invalid value {value!r} for parameter {name!r}; expected one of: {enum_values}")
-
-            if items_enum:
-                if isinstance(value, list):
-                    bad = [v for v in value if v not in items_enum]
-                    if bad:
-                        raise ConnectorValidationError(f"Invalid value(s) {bad!r} for parameter {name!r}; expected each element in: {items_enum}")
-                elif schema.get("type") == "array":
-                    raise ConnectorValidationError(f"Parameter {name!r} expects an array of values from {items_enum}; got scalar {value!r}")
-            elif schema.get("type") == "array" and value is not None and not isinstance(value, list):
-                # Array contract violated regardless of whether items carry an enum.
-                raise ConnectorValidationError(f"Parameter {name!r} expects an array; got scalar {value!r}")
-
-        for name, schema in (endpoint.query_params_schema or {}).items():
+        for name, schema in enum_checked_params(endpoint):
             if name in params:
-                check(name, schema, params[name])
-
-        # Top-level request body properties only — nested object validation
-        # is intentionally out of scope for this phase.
-        request_schema = endpoint.request_schema or {}
-        properties = request_schema.get("properties") if isinstance(request_schema, dict) else None
-        if isinstance(properties, dict):
-            for name, schema in properties.items():
-                if name in params:
-                    check(name, schema, params[name])
+                check_enum_param(name, schema, params[name])
+
+    def _record_operation_timings(self, entity: str, action: Action, duration: float, phases: dict[str, float]) -> None:
+        """Record an operation's total and per-phase durations in the performance monitor."""
+        attributes = {
+            "connector": self.model.name,
+            "entity": entity,
+            "action": action.value,
+            "host": _url_host(self.http_client.base_url),
+        }
+        self.performance_monitor.record("operation", duration, attributes)
+        for phase, seconds in phases.items():
+            self.performance_monitor.record(phase, seconds, attributes)
 
     async def close(self):
         """Close async HTTP client and logger."""
@@ -2253,8 +2791,28 @@ class _StandardOperationHandler:
             Action.AUTHORIZE,
         }
 
-    async def execute_operation(self, entity: str, action: Action, params: dict[str, Any]) -> StandardExecuteResult:
-        """Execute standard REST operation with full telemetry and error handling."""
+    async def execute_operation(
+        self,
+        entity: str,
+        action: Action,
+        params: dict[str, Any],
+        *,
+        url: str | None = None,
+        on_metadata: Callable[[dict[str, Any] | None], None] | None = None,
+    ) -> StandardExecuteResult:
+        """Execute standard REST operation with full telemetry and error handling.
+
+        Args:
+            entity: Entity name
+            action: Action to execute
+            params: Operation parameters
+            url: Optional full URL to request instead of the endpoint path. Used
+                when following next-page links; query params are not re-applied
+                because the link already carries them.
+            on_metadata: Optional callback invoked with the extracted metadata
+                before records are extracted. Used by execute_paginated() to issue
+                the next page request while this page is still being processed.
+        """
         tracer = trace.get_tracer("airbyte.connector-sdk.executor.local")
 
         with tracer.start_as_current_span("airbyte.local_executor.execute_operation") as span:
@@ -2273,6 +2831,15 @@ class _StandardOperationHandler:
             error_type = None
             status_code = None
 
+            # Per-phase timings, only collected when requested or for a performance monitor
+            monitor = self.ctx.executor.performance_monitor
+            collect_timings = self.ctx.executor.collect_timings
+            timings = timings_token = None
+            result = None
+            if monitor is not None or collect_timings:
+                timings, timings_token = start_timings()
+                started_at = time.perf_counter()
+
             try:
                 # O(1) entity lookup
                 entity_def = self.ctx.entity_index.get(entity)
@@ -2291,33 +2858,36 @@ class _StandardOperationHandler:
                 endpoint = self.ctx.operation_index.get((entity, action))
                 if not endpoint:
                     raise ExecutorError(f"No endpoint defined for {entity}.{action.value}. This is a configuration error.")
+                plan = self.ctx.request_plans[(entity, action)]
 
                 # Validate enum-constrained params before any HTTP traffic.
                 # ConnectorValidationError must propagate — do NOT add it to
                 # the logic-error catch list at _execute_operation.
-                self.ctx.validate_enum_params(endpoint, params)
+                plan.validate_enum_params(params)
 
                 # Validate required body fields for CREATE/UPDATE operations
                 self.ctx.validate_required_body_fields(endpoint, params, action, entity)
 
-                # Build request parameters
-                # Use path_override if available, otherwise use the OpenAPI path
-                actual_path = endpoint.path_override.path if endpoint.path_override else endpoint.path
-                path = self.ctx.build_path(actual_path, params)
-                query_params = self.ctx.extract_query_params(endpoint.query_params, params, endpoint.query_params_schema)
+                # Build request parameters (the plan's path honours path_override)
+                if url is not None:
+                    path = url
+                    query_params = {}
+                else:
+                    path = plan.build_path(params)
+                    query_params = plan.extract_query_params(params, self.ctx.executor.config_values)
 
                 # Serialize deepObject parameters to bracket notation
-                if endpoint.deep_object_params:
-                    query_params = self.ctx.executor._serialize_deep_object_params(query_params, endpoint.deep_object_params)
+                if query_params and plan.deep_object_params:
+                    query_params = self.ctx.executor._serialize_deep_object_params(query_params, plan.deep_object_params)
 
                 # Build request body (GraphQL or standard)
-                body = self.ctx.build_request_body(endpoint, params)
+                body = self.ctx.build_request_body(endpoint, params) if endpoint.graphql_body else plan.build_body(params)
 
                 # Determine request format (json/data/content parameters)
-                request_kwargs = self.ctx.determine_request_format(endpoint, body)
+                request_kwargs = self.ctx.executor._encode_request_body(endpoint, body, plan.body_encoding)
 
                 # Extract header parameters from OpenAPI operation (pass body to add Content-Type)
-                header_params = self.ctx.extract_header_params(endpoint, params, body)
+                header_params = plan.extract_header_params(params, body)
 
                 # Merge headers from request_kwargs (e.g., multipart/related boundary)
                 extra_headers = request_kwargs.pop("headers", None)
@@ -2334,15 +2904,34 @@ class _StandardOperationHandler:
                     content=request_kwargs.get("content"),
                     headers=header_params if header_params else None,
                 )
+                # The server accepted the request, so a mutation has been applied
+                await self.ctx.executor._invalidate_after_mutation(entity, action)
 
                 # Apply x-airbyte-response-error-check for HTTP 200 application-level errors
                 LocalExecutor._apply_response_error_check(self.ctx.executor.model, response_data)
 
                 # Extract metadata from original response (before record extraction)
+                if timings is not None:
+                    extraction_started_at = time.perf_counter()
                 metadata = self.ctx.executor._extract_metadata(response_data, response_headers, endpoint)
+                if timings is not None:
+                    timings.add("extraction", extraction_started_at, time.perf_counter())
+                if on_metadata is not None:
+                    on_metadata(metadata)
+                    # Let a request scheduled by the callback go out before record extraction
+                    await asyncio.sleep(0)
 
                 # Extract records if extractor configured
-                response = self.ctx.extract_records(response_data, endpoint, self.ctx.executor.config_values)
+                if timings is not None:
+                    extraction_started_at = time.perf_counter()
+                response = self.ctx.extract_records(response_data, endpoint, self.ctx.executor.config_values, apply_record_filter=False)
+                unfiltered_records = None
+                filtered = self.ctx.filter_records(response, endpoint, self.ctx.executor.config_values)
+                if filtered is not response:
+                    unfiltered_records = response
+                    response = filtered
+                if timings is not None:
+                    timings.add("extraction", extraction_started_at, time.perf_counter())
 
                 # Assume success with 200 status code if no exception raised
                 status_code = 200
@@ -2352,7 +2941,8 @@ class _StandardOperationHandler:
                 span.set_attribute("http.status_code", status_code)
 
                 # Return StandardExecuteResult with data and metadata
-                return StandardExecuteResult(data=response, metadata=metadata)
+                result = StandardExecuteResult(data=response, metadata=metadata, unfiltered_records=unfiltered_records)
+                return result
 
             except (EntityNotFoundError, ActionNotSupportedError) as e:
                 # Validation errors - record in span
@@ -2386,6 +2976,15 @@ class _StandardOperationHandler:
                     timing_ms=timing_ms,
                     error_type=error_type,
                 )
+                if timings_token is not None:
+                    stop_timings(timings_token)
+                    ended_at = time.perf_counter()
+                    if monitor is not None:
+                        self.ctx.executor._record_operation_timings(entity, action, ended_at - started_at, timings.phases)
+                    if collect_timings:
+                        _emit_phase_spans(tracer, span, timings)
+                        if result is not None:
+                            result.timings = {"total": ended_at - started_at, **timings.phases}
 
 
 class _DownloadOperationHandler:
@@ -2437,13 +3036,13 @@ class _DownloadOperationHandler:
                     )
 
                 # Common setup for both download modes
-                actual_path = operation.path_override.path if operation.path_override else operation.path
-                path = self.ctx.build_path(actual_path, params)
-                query_params = self.ctx.extract_query_params(operation.query_params, params, operation.query_params_schema)
+                plan = self.ctx.request_plans[(entity, action)]
+                path = plan.build_path(params)
+                query_params = plan.extract_query_params(params, self.ctx.executor.config_values)
 
                 # Serialize deepObject parameters to bracket notation
-                if operation.deep_object_params:
-                    query_params = self.ctx.executor._serialize_deep_object_params(query_params, operation.deep_object_params)
+                if plan.deep_object_params:
+                    query_params = self.ctx.executor._serialize_deep_object_params(query_params, plan.deep_object_params)
 
                 # Prepare headers (with optional Range support)
                 range_header = params.get("range_header")
@@ -2541,11 +3140,19 @@ class _DownloadOperationHandler:
                 span.set_attribute("connector.success", True)
                 span.set_attribute("http.status_code", status_code)
 
-                # Stream file chunks
+                # Stream file chunks as they arrive. Closing the chunk iterator
+                # explicitly releases the pooled connection even when the
+                # caller stops consuming before the end of the body.
                 default_chunk_size = 8 * 1024 * 1024  # 8 MB
-                async for chunk in file_response.aiter_bytes(chunk_size=default_chunk_size):
-                    self.ctx.logger.log_chunk_fetch(chunk)
-                    yield chunk
+                chunks = file_response.aiter_bytes(chunk_size=default_chunk_size)
+                try:
+                    async for chunk in chunks:
+                        self.ctx.logger.log_chunk_fetch(chunk)
+                        yield chunk
+                finally:
+                    aclose = getattr(chunks, "aclose", None)
+                    if aclose is not None:
+                        await aclose()
 
             except (EntityNotFoundError, ActionNotSupportedError) as e:
                 # Validation errors - record in span
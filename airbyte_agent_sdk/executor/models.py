@@ -50,6 +50,9 @@ class StandardExecuteResult:
     Args:
         data: Response data from the operation
         metadata: Optional metadata extracted from response (e.g., pagination info)
+        timings: Seconds per phase, when the executor collects timings
+        unfiltered_records: Records of a list page before record_filter dropped
+            any, when the endpoint declares one; pagination advances by these
 
     Example:
         result = StandardExecuteResult(
@@ -60,6 +63,8 @@ class StandardExecuteResult:
 
     data: dict[str, Any]
     metadata: dict[str, Any] | None = None
+    timings: dict[str, float] | None = None
+    unfiltered_records: list[Any] | None = None
 
 
 @dataclass
@@ -76,6 +81,9 @@ class ExecutionResult:
             - AsyncIterator[bytes] for download operations (streaming file content)
         error: Error message if success=False, None otherwise
         meta: Optional metadata extracted from response (e.g., pagination info)
+        timings: Seconds spent per phase of the operation (``total``, ``network``,
+            ``json_parse``, ``extraction``, ...; see airbyte_agent_sdk.performance.timings).
+            Only set when the executor was created with collect_timings=True.
 
     Example (Success - Standard):
         result = ExecutionResult(
@@ -105,6 +113,7 @@ class ExecutionResult:
     data: dict[str, Any] | AsyncIterator[bytes]
     error: str | None = None
     meta: dict[str, Any] | None = None
+    timings: dict[str, float] | None = None
 
 
 @dataclass
@@ -0,0 +1,247 @@
+"""Auto-pagination support for list operations.
+
+Resolves the page-following strategy for an endpoint and computes the request
+for the next page from the previous page's records and extracted metadata.
+
+The strategy comes from ``x-airbyte-pagination`` when declared. Otherwise it is
+inferred from ``x-airbyte-meta-extractor`` and the endpoint's query parameters,
+which covers the common shapes used by existing connector definitions:
+
+- ``@link.next`` / ``next_page_url`` style fields -> follow the URL (next_link)
+- ``next_cursor`` + ``cursor`` query param -> send the cursor back (cursor)
+- ``has_more`` + ``starting_after`` query param -> last record id (last_record)
+- ``has_more`` + ``offset`` / ``page`` query param -> advance position
+- ``total_pages`` + ``page`` query param -> advance page number (page_number)
+
+Only fields named like a cursor (``next``, ``cursor`` or ``token`` in the
+field name or its JSONPath) are sent back as cursors. A bare ``page`` or
+``offset`` field reports the current position, and echoing it would request
+the same page again; so does a cursor-named field read from the request's own
+integer param (``next_offset: $.startAt``), which becomes offset pagination
+that stops at the ``total`` record count. Positions are only advanced
+arithmetically for integer-typed params; a string ``page`` param is an opaque
+cursor.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urljoin
+
+from airbyte_agent_sdk.schema.extensions import PaginationConfig
+from airbyte_agent_sdk.types import EndpointDefinition
+
+_HAS_MORE_FIELDS = frozenset({"hasmore", "hasnext", "hasnextpage", "more", "moreavailable", "morerecords"})
+_TOTAL_PAGES_FIELDS = frozenset({"totalpages", "pagecount", "numpages"})
+_TOTAL_RECORDS_FIELDS = frozenset({"total", "totalcount", "totalresults", "totalrecords", "totalsize"})
+_CURSOR_MARKERS = ("next", "cursor", "token")
+_LIMIT_PARAMS = frozenset({"limit", "pagesize", "perpage", "maxresults", "count", "size", "pagelimit"})
+_CURSOR_PARAMS = ("cursor", "after", "pagetoken", "nextpagetoken", "continuationtoken", "startcursor", "pagecursor")
+_OFFSET_PARAMS = ("offset", "skip", "start")
+_PAGE_NUMBER_PARAMS = ("page", "pagenumber", "pagenum")
+_LAST_RECORD_PARAMS = ("startingafter",)
+
+
+@dataclass
+class PageRequest:
+    """Parameters for fetching the next page.
+
+    When ``url`` is set it is requested as-is (it already carries the page
+    position) and ``params`` is only used to keep pagination state.
+    """
+
+    params: dict[str, Any]
+    url: str | None = None
+
+    def key(self) -> str:
+        """Stable identity of this request, used to detect pagination loops."""
+        return self.url or json.dumps(self.params, sort_keys=True, default=str)
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def _find_param(normalized_params: dict[str, str], candidates: tuple[str, ...]) -> str | None:
+    for candidate in candidates:
+        if candidate in normalized_params:
+            return normalized_params[candidate]
+    return None
+
+
+def _is_integer_param(endpoint: EndpointDefinition, param: str) -> bool:
+    schema = endpoint.query_params_schema.get(param) or ((endpoint.request_schema or {}).get("properties") or {}).get(param) or {}
+    types = schema.get("type")
+    return bool({"integer", "number"} & set(types if isinstance(types, list) else [types]))
+
+
+def resolve_pagination(endpoint: EndpointDefinition) -> PaginationConfig | None:
+    """Return the pagination strategy for an endpoint, or None if it is single-page.
+
+    Explicit ``x-airbyte-pagination`` always wins. Endpoints marked with
+    ``x-airbyte-no-pagination`` never paginate. Otherwise a strategy is inferred
+    from the meta extractor; if nothing matches, the endpoint is treated as
+    single-page rather than guessing.
+    """
+    if endpoint.no_pagination:
+        return None
+    if endpoint.pagination is not None:
+        return endpoint.pagination
+
+    meta = endpoint.meta_extractor or {}
+    if not meta:
+        return None
+
+    # Cursors may travel as query params (GET) or body fields (POST search endpoints)
+    normalized_params = {_normalize(p): p for p in [*endpoint.body_fields, *endpoint.query_params]}
+    limit_param = next((p for n, p in normalized_params.items() if n in _LIMIT_PARAMS), None)
+    has_more_field = next((f for f in meta if _normalize(f) in _HAS_MORE_FIELDS), None)
+    total_pages_field = next((f for f in meta if _normalize(f) in _TOTAL_PAGES_FIELDS), None)
+    total_records_field = next((f for f in meta if _normalize(f) in _TOTAL_RECORDS_FIELDS), None)
+
+    def position_param(candidates: tuple[str, ...]) -> str | None:
+        # Offsets and page numbers are advanced arithmetically, which only makes sense for integers
+        param = _find_param(normalized_params, candidates)
+        return param if param is not None and _is_integer_param(endpoint, param) else None
+
+    # RFC 5988 Link headers always carry a full URL
+    for field_name, expr in meta.items():
+        if expr.startswith("@link."):
+            return PaginationConfig(strategy="next_link", next_field=field_name, has_more_field=has_more_field, limit_param=limit_param)
+
+    for field_name, expr in meta.items():
+        if field_name == has_more_field:
+            continue
+        normalized = _normalize(field_name)
+        # The field name, or the path it is read from ($.paging.cursors.after)
+        if not any(marker in normalized or marker in expr.lower() for marker in _CURSOR_MARKERS):
+            continue
+
+        # next_cursor -> cursor, nextPageToken -> pageToken, $.paging.cursors.after -> after
+        suffix = normalized[4:] if normalized.startswith("next") and len(normalized) > 4 else normalized
+        leaf = _normalize(expr.rsplit(".", 1)[-1]) if not expr.startswith("@") else normalized
+        param = _find_param(normalized_params, (normalized, suffix, leaf))
+        if param is None and ("cursor" in normalized or "token" in normalized):
+            param = _find_param(normalized_params, _CURSOR_PARAMS)
+        if param is not None and leaf == _normalize(param) and _is_integer_param(endpoint, param):
+            # Read back from the request's own position param (next_offset: $.startAt): an echo, not a cursor
+            return PaginationConfig(
+                strategy="page_number" if leaf in _PAGE_NUMBER_PARAMS else "offset",
+                param=param,
+                has_more_field=has_more_field,
+                total_records_field=total_records_field,
+                limit_param=limit_param,
+            )
+        if param is not None:
+            return PaginationConfig(
+                strategy="cursor",
+                param=param,
+                next_field=field_name,
+                has_more_field=has_more_field,
+                limit_param=limit_param,
+            )
+        # A "next" field with no matching param is a URL (next_page_url, nextRecordsUrl, next)
+        return PaginationConfig(strategy="next_link", next_field=field_name, has_more_field=has_more_field, limit_param=limit_param)
+
+    if has_more_field is None:
+        if total_pages_field is not None and (param := position_param(_PAGE_NUMBER_PARAMS)):
+            return PaginationConfig(strategy="page_number", param=param, total_pages_field=total_pages_field, limit_param=limit_param)
+        return None
+
+    if param := _find_param(normalized_params, _LAST_RECORD_PARAMS):
+        return PaginationConfig(strategy="last_record", param=param, has_more_field=has_more_field, limit_param=limit_param)
+    if param := position_param(_OFFSET_PARAMS):
+        return PaginationConfig(strategy="offset", param=param, has_more_field=has_more_field, limit_param=limit_param)
+    if param := position_param(_PAGE_NUMBER_PARAMS):
+        return PaginationConfig(strategy="page_number", param=param, has_more_field=has_more_field, limit_param=limit_param)
+    return None
+
+
+def next_page_from_metadata(
+    config: PaginationConfig,
+    current: PageRequest,
+    meta: dict[str, Any] | None,
+    base_url: str,
+) -> PageRequest | None:
+    """Compute the next request for cursor and next_link strategies from metadata alone.
+
+    This only needs the response envelope, so it can run before records are
+    extracted - which is what lets the executor start fetching the next page
+    while the current one is still being processed.
+    """
+    meta = meta or {}
+    if config.has_more_field is not None and not meta.get(config.has_more_field):
+        return None
+
+    value = meta.get(config.next_field) if config.next_field else None
+    if value is None or value == "":
+        return None
+    # Some APIs return a full URL in a field named like a cursor
+    if isinstance(value, str) and value.startswith(("http://", "https://")):
+        return PageRequest(params=current.params, url=value)
+    if config.strategy == "next_link":
+        if isinstance(value, str) and value.startswith("/"):
+            return PageRequest(params=current.params, url=urljoin(f"{base_url}/", value))
+        return None
+    return PageRequest(params={**current.params, config.param: value})
+
+
+def advance(config: PaginationConfig, current: PageRequest, step: int) -> PageRequest:
+    """Move an offset or page_number request forward without waiting for its response.
+
+    Args:
+        config: Pagination config with an offset or page_number strategy
+        current: Request to advance from
+        step: Records per page (offset strategy); ignored for page_number
+    """
+    if config.strategy == "offset":
+        position = current.params.get(config.param, config.start if config.start is not None else 0)
+        return PageRequest(params={**current.params, config.param: int(position) + step})
+    position = current.params.get(config.param, config.start if config.start is not None else 1)
+    return PageRequest(params={**current.params, config.param: int(position) + 1})
+
+
+def next_page_request(
+    config: PaginationConfig,
+    current: PageRequest,
+    records: list[Any],
+    meta: dict[str, Any] | None,
+    base_url: str,
+) -> PageRequest | None:
+    """Compute the request for the page after ``current``.
+
+    Returns None when there are no more pages: the page was empty, the
+    has-more flag is falsy, or the next cursor/link is missing.
+    """
+    if not records:
+        return None
+
+    if config.strategy in ("cursor", "next_link"):
+        return next_page_from_metadata(config, current, meta, base_url)
+
+    if config.has_more_field is not None and not (meta or {}).get(config.has_more_field):
+        return None
+
+    if config.strategy == "page_number" and config.total_pages_field is not None:
+        total_pages = (meta or {}).get(config.total_pages_field)
+        position = current.params.get(config.param, config.start if config.start is not None else 1)
+        if isinstance(total_pages, int) and int(position) >= total_pages:
+            return None
+
+    if config.strategy == "offset" and config.total_records_field is not None:
+        total = (meta or {}).get(config.total_records_field)
+        position = current.params.get(config.param, config.start if config.start is not None else 0)
+        if isinstance(total, int) and int(position) + len(records) >= total:
+            return None
+
+    if config.strategy == "last_record":
+        last = records[-1]
+        value = last.get(config.record_field) if isinstance(last, dict) else None
+        if value is None:
+            return None
+        return PageRequest(params={**current.params, config.param: value})
+
+    return advance(config, current, len(records))
@@ -0,0 +1,150 @@
+"""Cache of parent-entity records used to resolve path params.
+
+Entity checks fill foreign-key path params (e.g. a Jira issue's
+``project_id``) by listing one record of the parent entity. The
+``ParentRecordCache`` keeps those records on the executor instead of per
+``check_entities`` call:
+
+- entries are keyed by parent entity and the config (scoping) values in
+  effect, and expire after ``ttl`` seconds;
+- concurrent lookups for the same key share one in-flight fetch; a failed
+  fetch is not cached, so the next lookup retries it;
+- a fetch that (directly or through other fetches) waits on itself raises
+  ``CircularParentError`` instead of deadlocking;
+- every lookup gets its own copy of the records, so a caller mutating them
+  doesn't change what the cache or other callers see.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+ParentKey = tuple[str, str]
+"""(parent entity name, serialized scoping values)."""
+
+DEFAULT_PARENT_CACHE_TTL = 300.0
+"""Default lifetime in seconds of a cached parent record list."""
+
+
+class CircularParentError(Exception):
+    """Raised when resolving a parent entity requires that same parent."""
+
+
+class ParentRecordCache:
+    """TTL cache of parent-entity records with single-flight fetches.
+
+    Args:
+        ttl: Seconds a fetched record list is reused. 0 keeps nothing beyond
+            the in-flight fetch, so only concurrent lookups share a request.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_PARENT_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: dict[ParentKey, tuple[float, list[dict[str, Any]]]] = {}
+        self._flights: dict[ParentKey, asyncio.Task[list[dict[str, Any]]]] = {}
+        # Fetches waiting on other fetches, for cycle detection
+        self._waits: dict[ParentKey, set[ParentKey]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.joined = 0
+        self.fetch_failures = 0
+
+    async def get(
+        self,
+        key: ParentKey,
+        fetch: Callable[[], Awaitable[list[dict[str, Any]]]],
+        waiter: ParentKey | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return a copy of the cached records for ``key``, fetching them at most once at a time.
+
+        Args:
+            key: Parent entity and scoping values.
+            fetch: Coroutine function returning the parent's records.
+            waiter: Key of the fetch making this lookup, if any.
+
+        Raises:
+            CircularParentError: If ``key``'s fetch is (transitively) waiting on ``waiter``.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            del self._entries[key]
+
+        if waiter is not None and (waiter == key or self._is_waiting_on(key, waiter)):
+            raise CircularParentError(f"Parent entity '{key[0]}' depends on itself")
+
+        flight = self._flights.get(key)
+        if flight is None:
+            self.misses += 1
+            flight = asyncio.ensure_future(self._run_fetch(key, fetch))
+            self._flights[key] = flight
+        else:
+            self.joined += 1
+
+        if waiter is None:
+            # Shielded: a cancelled caller must not cancel the fetch others wait on
+            return copy.deepcopy(await asyncio.shield(flight))
+        self._waits.setdefault(waiter, set()).add(key)
+        try:
+            return copy.deepcopy(await asyncio.shield(flight))
+        finally:
+            waiting = self._waits.get(waiter)
+            if waiting is not None:
+                waiting.discard(key)
+                if not waiting:
+                    del self._waits[waiter]
+
+    async def _run_fetch(self, key: ParentKey, fetch: Callable[[], Awaitable[list[dict[str, Any]]]]) -> list[dict[str, Any]]:
+        try:
+            records = await fetch()
+        except BaseException:
+            self.fetch_failures += 1
+            raise
+        finally:
+            del self._flights[key]
+        if self.ttl > 0:
+            self._entries[key] = (time.monotonic() + self.ttl, records)
+        return records
+
+    def _is_waiting_on(self, key: ParentKey, target: ParentKey) -> bool:
+        """Whether the fetch for ``key`` is transitively waiting on ``target``'s fetch."""
+        pending = [key]
+        seen: set[ParentKey] = set()
+        while pending:
+            current = pending.pop()
+            for dependency in self._waits.get(current, ()):
+                if dependency == target:
+                    return True
+                if dependency not in seen:
+                    seen.add(dependency)
+                    pending.append(dependency)
+        return False
+
+    def invalidate(self, entity: str) -> int:
+        """Drop cached records of ``entity`` for all scoping values. Returns the number removed."""
+        keys = [key for key in self._entries if key[0] == entity]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all cached records (in-flight fetches are unaffected)."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "joined": self.joined,
+            "fetch_failures": self.fetch_failures,
+            "entries": len(self._entries),
+            "in_flight": len(self._flights),
+        }
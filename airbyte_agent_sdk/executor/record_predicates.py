@@ -0,0 +1,108 @@
+"""Fast evaluation of simple `x-airbyte-record-filter` expressions.
+
+Most record filters are a single, optionally negated, field lookup such as
+``{{ not record.isPrivate }}`` or ``{{ record.get('active', true) }}``.
+Rendering those through Jinja costs a template render plus string coercion per
+record. ``compile_record_predicate`` recognizes these shapes and returns a
+plain-Python evaluator with the same truthiness as the rendered template.
+
+Whenever a record falls outside what the evaluator can answer with certainty
+(missing key, non-dict intermediate value, key shadowed by a ``dict`` method),
+it returns ``FALLBACK`` and the caller renders the Jinja template for that
+record instead, so StrictUndefined errors surface exactly as before.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+FALLBACK = object()
+"""Sentinel returned by a compiled predicate when the record needs Jinja evaluation."""
+
+# Strings that a rendered Jinja expression should resolve to a boolean False.
+# Mirrors Airbyte declarative CDK's InterpolatedBoolean.FALSY_STRINGS.
+FALSY_RENDERED_STRINGS = frozenset({"False", "false", "0", "None", "none", "null", ""})
+
+# Jinja resolves `record.x` via getattr() before item lookup, so keys that are
+# also dict attributes resolve to bound methods rather than values.
+_DICT_ATTRIBUTES = frozenset(dir(dict))
+
+_ATTR_CHAIN = re.compile(r"^\{\{\s*(not\s+)?record((?:\.[A-Za-z_][A-Za-z0-9_]*)+)\s*\}\}$")
+_GET_CALL = re.compile(r"""^\{\{\s*(not\s+)?record\.get\(\s*(['"])([^'"\\]+)\2\s*(?:,\s*([^()]*?)\s*)?\)\s*\}\}$""")
+
+_LITERALS: dict[str, Any] = {
+    "true": True,
+    "True": True,
+    "false": False,
+    "False": False,
+    "none": None,
+    "None": None,
+}
+_NUMBER = re.compile(r"^-?\d+(\.\d+)?$")
+_STRING = re.compile(r"""^(['"])([^'"\\]*)\1$""")
+
+RecordPredicate = Callable[[dict[str, Any]], Any]
+
+
+def _parse_literal(text: str) -> tuple[bool, Any]:
+    """Parse a Jinja literal default. Returns (ok, value)."""
+    if text in _LITERALS:
+        return True, _LITERALS[text]
+    if _NUMBER.match(text):
+        return True, float(text) if "." in text else int(text)
+    if match := _STRING.match(text):
+        return True, match.group(2)
+    return False, None
+
+
+def _truthy(value: Any, negate: bool) -> bool:
+    if negate:
+        return not value
+    # `{{ record.x }}` renders str(value), which is then checked against the falsy strings
+    return str(value).strip() not in FALSY_RENDERED_STRINGS
+
+
+def compile_record_predicate(condition: str) -> RecordPredicate | None:
+    """Compile a record filter into a Python predicate, or None if it needs Jinja.
+
+    The returned callable takes a record dict and returns True/False, or
+    ``FALLBACK`` if the record must be evaluated by the Jinja template.
+    """
+    condition = condition.strip()
+
+    if match := _ATTR_CHAIN.match(condition):
+        negate = match.group(1) is not None
+        path = tuple(match.group(2).split(".")[1:])
+        if path[0] == "get" or any(name in _DICT_ATTRIBUTES for name in path):
+            return None
+
+        def evaluate_path(record: dict[str, Any]) -> Any:
+            value: Any = record
+            for name in path:
+                if type(value) is not dict or name not in value:
+                    return FALLBACK
+                value = value[name]
+            return _truthy(value, negate)
+
+        return evaluate_path
+
+    if match := _GET_CALL.match(condition):
+        negate = match.group(1) is not None
+        key = match.group(3)
+        default_text = match.group(4)
+        default: Any = None
+        if default_text is not None:
+            ok, default = _parse_literal(default_text)
+            if not ok:
+                return None
+
+        def evaluate_get(record: dict[str, Any]) -> Any:
+            if type(record) is not dict:
+                return FALLBACK
+            return _truthy(record.get(key, default), negate)
+
+        return evaluate_get
+
+    return None
@@ -0,0 +1,267 @@
+"""Per-endpoint request plans.
+
+An endpoint's request shape (path template, allowed query/header/body params,
+deepObject params, defaults, body encoding, enum-constrained params) is static
+connector metadata. ``RequestPlan.compile`` derives it once per
+``(entity, action)`` when the executor indexes its operations, so building a
+request only fills in the caller's values:
+
+- the path template is pre-split into literal segments and placeholder names;
+- allowed param names are frozensets, and only the query params that declare
+  ``config_inject`` are revisited per call (config values can change at
+  runtime, e.g. after a token refresh extracts an instance URL, so they are
+  read per call rather than baked in);
+- header defaults and the body encoding are resolved up front;
+- enum validation only visits params whose schema can reject a value.
+
+Plans produce exactly the requests the generic ``LocalExecutor`` helpers do.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Literal
+from urllib.parse import quote
+
+from airbyte_agent_sdk.http.exceptions import ConnectorValidationError
+from airbyte_agent_sdk.types import ContentType, EndpointDefinition
+
+from .models import InvalidParameterError, MissingParameterError
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+BodyEncoding = Literal["json", "form", "multipart"]
+
+
+@dataclass(frozen=True)
+class PathTemplate:
+    """A path template split into literal segments around ``{param}`` placeholders."""
+
+    template: str
+    # Alternating literal / placeholder name, starting and ending with a literal
+    parts: tuple[str, ...]
+    # Placeholder names in order of first appearance
+    params: tuple[str, ...]
+
+    def render(self, params: Mapping[str, Any]) -> str:
+        """Fill in URL-encoded placeholder values.
+
+        Raises:
+            MissingParameterError: If a placeholder has no value in params
+            InvalidParameterError: If a placeholder value is None or blank
+        """
+        if not self.params:
+            return self.template
+        encoded: dict[str, str] = {}
+        for name in self.params:
+            if name not in params:
+                raise MissingParameterError(
+                    f"Missing required path parameter '{name}' for path '{self.template}'. Provided parameters: {list(params.keys())}"
+                )
+            value = params[name]
+            if value is None or (isinstance(value, str) and value.strip() == ""):
+                raise InvalidParameterError(f"Path parameter '{name}' cannot be None or empty string")
+            encoded[name] = quote(str(value), safe="")
+        parts = self.parts
+        return "".join(part if index % 2 == 0 else encoded[part] for index, part in enumerate(parts))
+
+
+@lru_cache(maxsize=1024)
+def compile_path_template(template: str) -> PathTemplate:
+    """Split a path template such as ``/v1/customers/{id}`` (cached per template)."""
+    parts = tuple(_PLACEHOLDER.split(template))
+    return PathTemplate(template=template, parts=parts, params=tuple(dict.fromkeys(parts[1::2])))
+
+
+def check_enum_param(name: str, schema: Any, value: Any) -> None:
+    """Validate one param value against its schema's ``enum`` / ``items.enum`` / array type.
+
+    Raises:
+        ConnectorValidationError: If the value violates the enum or the array/scalar contract
+    """
+    if not isinstance(schema, dict):
+        return
+    enum_values = schema.get("enum")
+    raw_items = schema.get("items")
+    items = raw_items if isinstance(raw_items, dict) else None
+    items_enum = items.get("enum") if items else None
+
+    if enum_values and value not in enum_values:
+        raise ConnectorValidationError(f"Invalid value {value!r} for parameter {name!r}; expected one of: {enum_values}")
+
+    if items_enum:
+        if isinstance(value, list):
+            bad = [v for v in value if v not in items_enum]
+            if bad:
+                raise ConnectorValidationError(f"Invalid value(s) {bad!r} for parameter {name!r}; expected each element in: {items_enum}")
+        elif schema.get("type") == "array":
+            raise ConnectorValidationError(f"Parameter {name!r} expects an array of values from {items_enum}; got scalar {value!r}")
+    elif schema.get("type") == "array" and value is not None and not isinstance(value, list):
+        # Array contract violated regardless of whether items carry an enum.
+        raise ConnectorValidationError(f"Parameter {name!r} expects an array; got scalar {value!r}")
+
+
+def _can_reject(schema: Any) -> bool:
+    """Whether check_enum_param can ever raise for this schema."""
+    if not isinstance(schema, dict):
+        return False
+    items = schema.get("items")
+    return bool(schema.get("enum")) or bool(isinstance(items, dict) and items.get("enum")) or schema.get("type") == "array"
+
+
+def enum_checked_params(endpoint: EndpointDefinition) -> tuple[tuple[str, dict[str, Any]], ...]:
+    """(name, schema) pairs validated by check_enum_param, in validation order.
+
+    Query params first, then top-level request body properties (nested object
+    validation is out of scope).
+    """
+    checks = [(name, schema) for name, schema in (endpoint.query_params_schema or {}).items() if _can_reject(schema)]
+    request_schema = endpoint.request_schema or {}
+    properties = request_schema.get("properties") if isinstance(request_schema, dict) else None
+    if isinstance(properties, dict):
+        checks.extend((name, schema) for name, schema in properties.items() if _can_reject(schema))
+    return tuple(checks)
+
+
+def inject_config_query_params(
+    result: dict[str, Any],
+    injected: tuple[tuple[str, Mapping[str, Any]], ...],
+    config_values: Mapping[str, Any],
+) -> None:
+    """Fill query params declaring ``config_inject`` from config values, unless already set."""
+    for param_name, config_inject in injected:
+        if param_name in result:
+            continue
+        source_value = config_values.get(config_inject["source"])
+        if source_value is None:
+            continue
+        value_map = config_inject.get("map")
+        if value_map:
+            mapped = value_map.get(source_value)
+            if mapped is None:
+                mapped = value_map.get(source_value.upper())
+            if mapped is not None:
+                result[param_name] = mapped
+        else:
+            result[param_name] = source_value
+
+
+def config_injected_query_params(
+    allowed_params: list[str],
+    query_params_schema: Mapping[str, Mapping[str, Any]] | None,
+) -> tuple[tuple[str, Mapping[str, Any]], ...]:
+    """(param, config_inject) pairs for allowed query params that declare ``config_inject``."""
+    if not query_params_schema:
+        return ()
+    injected = []
+    for param_name in allowed_params:
+        schema = query_params_schema.get(param_name)
+        if schema and schema.get("config_inject"):
+            injected.append((param_name, schema["config_inject"]))
+    return tuple(injected)
+
+
+def request_body_encoding(endpoint: EndpointDefinition) -> BodyEncoding | None:
+    """How a request body is sent, or None if the content type has no encoder."""
+    if endpoint.graphql_body is not None or endpoint.content_type == ContentType.JSON:
+        # GraphQL always uses JSON, regardless of content_type
+        return "json"
+    if endpoint.content_type == ContentType.FORM_URLENCODED:
+        return "form"
+    if endpoint.content_type == ContentType.MULTIPART_RELATED:
+        return "multipart"
+    return None
+
+
+@dataclass(frozen=True)
+class RequestPlan:
+    """Precompiled request shape for one endpoint."""
+
+    endpoint: EndpointDefinition
+    path: PathTemplate
+    query_params: frozenset[str]
+    config_injected_query_params: tuple[tuple[str, Mapping[str, Any]], ...]
+    deep_object_params: frozenset[str]
+    header_params: tuple[str, ...]
+    header_defaults: Mapping[str, str]
+    content_type_header: str
+    body_fields: frozenset[str]
+    body_defaults: Mapping[str, Any]
+    body_encoding: BodyEncoding | None
+    enum_checks: tuple[tuple[str, dict[str, Any]], ...]
+
+    @classmethod
+    def compile(cls, endpoint: EndpointDefinition) -> RequestPlan:
+        """Derive the request plan for an endpoint."""
+        path_template = endpoint.path_override.path if endpoint.path_override else endpoint.path
+
+        header_defaults: dict[str, str] = {}
+        for header_name in endpoint.header_params:
+            if header_name in endpoint.header_params_schema:
+                default_value = endpoint.header_params_schema[header_name].get("default")
+                if default_value is not None:
+                    header_defaults[header_name] = str(default_value)
+
+        return cls(
+            endpoint=endpoint,
+            path=compile_path_template(path_template),
+            query_params=frozenset(endpoint.query_params),
+            config_injected_query_params=config_injected_query_params(endpoint.query_params, endpoint.query_params_schema),
+            deep_object_params=frozenset(endpoint.deep_object_params),
+            header_params=tuple(endpoint.header_params),
+            header_defaults=header_defaults,
+            content_type_header=endpoint.content_type.value,
+            body_fields=frozenset(endpoint.body_fields),
+            body_defaults=endpoint.request_body_defaults,
+            body_encoding=request_body_encoding(endpoint),
+            enum_checks=enum_checked_params(endpoint),
+        )
+
+    def validate_enum_params(self, params: Mapping[str, Any]) -> None:
+        """Reject enum-constrained params with values outside the schema (see check_enum_param)."""
+        for name, schema in self.enum_checks:
+            if name in params:
+                check_enum_param(name, schema, params[name])
+
+    def build_path(self, params: Mapping[str, Any]) -> str:
+        return self.path.render(params)
+
+    def extract_query_params(self, params: Mapping[str, Any], config_values: Mapping[str, Any]) -> dict[str, Any]:
+        """Allowed query params from params, plus config-injected values."""
+        allowed = self.query_params
+        result = {key: value for key, value in params.items() if key in allowed}
+        if self.config_injected_query_params:
+            inject_config_query_params(result, self.config_injected_query_params, config_values)
+        return result
+
+    def extract_body(self, params: Mapping[str, Any]) -> dict[str, Any]:
+        """Allowed body fields from params, without None values."""
+        allowed = self.body_fields
+        return {key: value for key, value in params.items() if key in allowed and value is not None}
+
+    def build_body(self, params: Mapping[str, Any]) -> dict[str, Any] | None:
+        """Non-GraphQL request body: schema defaults overridden by the caller's body fields."""
+        if self.body_fields:
+            body = dict(self.body_defaults)
+            body.update(self.extract_body(params))
+            return body if body else None
+        if self.body_defaults:
+            return dict(self.body_defaults)
+        return None
+
+    def extract_header_params(self, params: Mapping[str, Any], body: dict[str, Any] | None) -> dict[str, str]:
+        """Header params from params or schema defaults, plus Content-Type when there is a body."""
+        headers: dict[str, str] = {}
+        for header_name in self.header_params:
+            if header_name in params and params[header_name] is not None:
+                headers[header_name] = str(params[header_name])
+            elif header_name in self.header_defaults:
+                headers[header_name] = self.header_defaults[header_name]
+
+        # Spec-declared Content-Type header params (e.g. application/vnd.spCampaign.v3+json) win
+        if body is not None and "Content-Type" not in headers:
+            headers["Content-Type"] = self.content_type_header
+        return headers
@@ -0,0 +1,377 @@
+"""Response caches for read operations in LocalExecutor.
+
+A cache stores the ``(data, meta)`` result of ``get``, ``list`` and
+``api_search`` operations for a per-entity TTL. Entries are grouped by a scope
+(connector + credentials + entity) so a successful mutation can drop every
+cached read of that entity at once.
+
+Values are stored as JSON (they are API responses), so each hit hands the
+caller a fresh copy, the entry size used for eviction is the real serialized
+size, and reading an entry never executes code. Values that are not
+JSON-serializable are not cached.
+
+Two backends are provided:
+
+- ``InMemoryResponseCache``: process-local LRU bounded by total bytes.
+- ``SQLiteResponseCache``: a file shared across processes, bounded by total
+  bytes with least-recently-used eviction. Its I/O runs on a dedicated
+  thread when used through the async methods, which the executor does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+"""Default size bound for InMemoryResponseCache (64 MiB)."""
+
+DEFAULT_SQLITE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+"""Default size bound for SQLiteResponseCache (256 MiB)."""
+
+
+class ResponseCache(ABC):
+    """Base class for executor response caches.
+
+    Args:
+        default_ttl: TTL in seconds for entities that declare none
+            (no ``x-airbyte-cache-ttl`` and no caller override). None means
+            such entities are not cached.
+    """
+
+    def __init__(self, default_ttl: float | None = None):
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None on a miss or expired entry."""
+        payload = self._get_payload(key)
+        if payload is None:
+            self.misses += 1
+            return None
+        try:
+            value = json.loads(payload)
+        except ValueError as e:
+            logger.debug(f"Dropping unreadable response cache entry: {e}")
+            self._delete(key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: str, scope: str, value: Any, ttl: float) -> None:
+        """Cache ``value`` under ``key`` for ``ttl`` seconds.
+
+        Values that are not JSON-serializable are silently not cached.
+        """
+        if ttl <= 0:
+            return
+        try:
+            payload = json.dumps(value, separators=(",", ":")).encode()
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching non-JSON response: {e}")
+            return
+        self._put_payload(key, scope, payload, ttl)
+
+    def invalidate(self, scope: str) -> int:
+        """Drop every entry in ``scope``. Returns the number of entries removed."""
+        removed = self._delete_scope(scope)
+        self.invalidations += removed
+        return removed
+
+    # Async variants used by the executor. Backends that do blocking I/O
+    # override these to keep it off the event loop.
+
+    async def aget(self, key: str) -> Any | None:
+        """Async ``get``."""
+        return self.get(key)
+
+    async def aset(self, key: str, scope: str, value: Any, ttl: float) -> None:
+        """Async ``set``."""
+        self.set(key, scope, value, ttl)
+
+    async def ainvalidate(self, scope: str) -> int:
+        """Async ``invalidate``."""
+        return self.invalidate(scope)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        pass
+
+    @abstractmethod
+    def _get_payload(self, key: str) -> bytes | None:
+        """Return the stored bytes for a live entry, removing it if expired."""
+        pass
+
+    @abstractmethod
+    def _put_payload(self, key: str, scope: str, payload: bytes, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def _delete_scope(self, scope: str) -> int:
+        pass
+
+    @abstractmethod
+    def _usage(self) -> tuple[int, int]:
+        """Return (entry count, total payload bytes)."""
+        pass
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics as a dictionary."""
+        entries, size = self._usage()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+
+@dataclass
+class _MemoryEntry:
+    scope: str
+    expires_at: float
+    payload: bytes
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Process-local LRU response cache bounded by total payload bytes.
+
+    Args:
+        max_bytes: Upper bound on the sum of stored payload sizes. Least recently
+            used entries are evicted to stay under it; a single value larger
+            than the bound is not cached.
+        default_ttl: See ``ResponseCache``.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_CACHE_MAX_BYTES, default_ttl: float | None = None):
+        super().__init__(default_ttl=default_ttl)
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._scopes: dict[str, set[str]] = {}
+        self._size = 0
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._scopes.clear()
+        self._size = 0
+
+    def _get_payload(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._delete(key)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry.payload
+
+    def _put_payload(self, key: str, scope: str, payload: bytes, ttl: float) -> None:
+        self._delete(key)
+        if len(payload) > self.max_bytes:
+            return
+        self._entries[key] = _MemoryEntry(scope=scope, expires_at=time.monotonic() + ttl, payload=payload)
+        self._scopes.setdefault(scope, set()).add(key)
+        self._size += len(payload)
+        while self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._delete(oldest)
+            self.evictions += 1
+
+    def _delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= len(entry.payload)
+        keys = self._scopes.get(entry.scope)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._scopes[entry.scope]
+
+    def _delete_scope(self, scope: str) -> int:
+        keys = self._scopes.pop(scope, set())
+        for key in keys:
+            entry = self._entries.pop(key)
+            self._size -= len(entry.payload)
+        return len(keys)
+
+    def _usage(self) -> tuple[int, int]:
+        return len(self._entries), self._size
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Response cache persisted in a SQLite file, shareable across processes.
+
+    Expiry uses wall-clock time so entries stay valid across restarts. The
+    entry count and total size are kept up to date by triggers, so checking
+    the size bound does not scan the table and stays correct when several
+    processes write to the same file.
+
+    The async methods (``aget``, ``aset``, ``ainvalidate``) run the database
+    work, including JSON encoding and decoding, on a dedicated thread.
+
+    Args:
+        path: Database file; parent directories are created as needed.
+        max_bytes: Upper bound on the sum of stored payload sizes, enforced by
+            evicting expired, then least recently used entries after each write.
+        default_ttl: See ``ResponseCache``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = DEFAULT_SQLITE_CACHE_MAX_BYTES,
+        default_ttl: float | None = None,
+    ):
+        super().__init__(default_ttl=default_ttl)
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="airbyte-response-cache")
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, scope TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "last_access REAL NOT NULL, size INTEGER NOT NULL, payload BLOB NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS response_cache_scope ON response_cache (scope)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS response_cache_last_access ON response_cache (last_access)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS response_cache_expires_at ON response_cache (expires_at)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache_usage (id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL, size INTEGER NOT NULL)"
+            )
+            # Counts existing rows once, for files written before the usage table existed
+            self._conn.execute("INSERT OR IGNORE INTO response_cache_usage SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM response_cache")
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS response_cache_insert AFTER INSERT ON response_cache BEGIN "
+                "UPDATE response_cache_usage SET entries = entries + 1, size = size + NEW.size WHERE id = 0; END"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS response_cache_delete AFTER DELETE ON response_cache BEGIN "
+                "UPDATE response_cache_usage SET entries = entries - 1, size = size - OLD.size WHERE id = 0; END"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS response_cache_update AFTER UPDATE OF size ON response_cache BEGIN "
+                "UPDATE response_cache_usage SET size = size - OLD.size + NEW.size WHERE id = 0; END"
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    async def _run(self, fn: Any, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._io, fn, *args)
+
+    async def aget(self, key: str) -> Any | None:
+        return await self._run(self.get, key)
+
+    async def aset(self, key: str, scope: str, value: Any, ttl: float) -> None:
+        await self._run(self.set, key, scope, value, ttl)
+
+    async def ainvalidate(self, scope: str) -> int:
+        return await self._run(self.invalidate, scope)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._io.shutdown(wait=True)
+        with self._lock:
+            self._conn.close()
+
+    def _get_payload(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT expires_at, payload FROM response_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[0] <= now:
+                self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                self.expirations += 1
+                return None
+            self._conn.execute("UPDATE response_cache SET last_access = ? WHERE key = ?", (now, key))
+            return row[1]
+
+    def _put_payload(self, key: str, scope: str, payload: bytes, ttl: float) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO response_cache (key, scope, expires_at, last_access, size, payload) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET scope = excluded.scope, expires_at = excluded.expires_at, "
+                "last_access = excluded.last_access, size = excluded.size, payload = excluded.payload",
+                (key, scope, now + ttl, now, len(payload), payload),
+            )
+            self._enforce_size_limit(now)
+
+    def _total_size(self) -> int:
+        row = self._conn.execute("SELECT size FROM response_cache_usage WHERE id = 0").fetchone()
+        return row[0] if row else 0
+
+    def _enforce_size_limit(self, now: float) -> None:
+        total = self._total_size()
+        if total <= self.max_bytes:
+            return
+        # Expired entries go first, then least recently used
+        expired = self._conn.execute("DELETE FROM response_cache WHERE expires_at <= ?", (now,)).rowcount
+        self.expirations += expired
+        if expired:
+            total = self._total_size()
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM response_cache ORDER BY last_access"):
+            victims.append((key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._conn.executemany("DELETE FROM response_cache WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+
+    def _delete_scope(self, scope: str) -> int:
+        with self._lock:
+            return self._conn.execute("DELETE FROM response_cache WHERE scope = ?", (scope,)).rowcount
+
+    def _usage(self) -> tuple[int, int]:
+        with self._lock:
+            row = self._conn.execute("SELECT entries, size FROM response_cache_usage WHERE id = 0").fetchone()
+        return (row[0], row[1]) if row else (0, 0)
@@ -191,6 +191,38 @@ Example:
     ```
 """
 
+AIRBYTE_CACHE_TTL = "x-airbyte-cache-ttl"
+"""
+Extension: x-airbyte-cache-ttl
+Location: Schema object (in components.schemas)
+Type: integer (seconds, >= 0)
+Required: No
+
+Description:
+    How long `get`, `list` and `api_search` responses for this entity may be
+    served from the executor's response cache. Only takes effect when a
+    `LocalExecutor` is created with a `response_cache`. A value of 0 disables
+    caching for the entity. When specified, the EntityDefinition.cache_ttl
+    field will be populated with this value.
+
+    Like x-airbyte-stream-name, this is an entity-level property placed on the
+    Schema object alongside x-airbyte-entity-name. Callers can override it per
+    entity with `LocalExecutor(cache_ttls={...})`.
+
+Example:
+    ```yaml
+    components:
+      schemas:
+        Product:
+          type: object
+          x-airbyte-entity-name: products
+          x-airbyte-cache-ttl: 300
+          properties:
+            id:
+              type: string
+    ```
+"""
+
 AIRBYTE_TOKEN_PATH = "x-airbyte-token-path"
 """
 Extension: x-airbyte-token-path
@@ -446,6 +478,50 @@ Behavior:
     - Extraction happens before record extraction to access full response envelope
 """
 
+AIRBYTE_PAGINATION = "x-airbyte-pagination"
+"""
+Extension: x-airbyte-pagination
+Location: Operation object (on list / api_search operations)
+Type: PaginationConfig
+Required: No
+
+Description:
+    Declares how the executor follows pages for `LocalExecutor.execute_paginated`
+    and `LocalExecutor.iter_records`. Field references (`next_field`,
+    `has_more_field`, `total_pages_field`, `total_records_field`) name keys
+    of the operation's x-airbyte-meta-extractor.
+
+    When omitted, the executor infers a strategy from the meta extractor: an
+    `@link.*` or URL-valued field is followed as a next link, and a field named
+    like a cursor (containing `next`, `cursor` or `token`) whose suffix matches
+    a query parameter becomes a cursor. A has-more flag combined with a
+    `starting_after`, offset or page parameter uses the last record's `id`,
+    an offset or a page number; a total-pages field with a page parameter
+    uses page numbers. Offsets and page numbers are only inferred for
+    integer-typed parameters. Fields that merely echo the current position
+    (e.g. `page: $.info.page`, or `next_offset: $.startAt` read from the
+    request's own `startAt` param, which pages by offset up to `total`) are
+    never sent back as cursors, so APIs that return an opaque cursor under a
+    positional name (Airtable's `offset`) must declare this extension.
+
+Example:
+    ```yaml
+    paths:
+      /v1/customers:
+        get:
+          x-airbyte-entity: customers
+          x-airbyte-action: list
+          x-airbyte-record-extractor: $.data
+          x-airbyte-meta-extractor:
+            has_more: $.has_more
+          x-airbyte-pagination:
+            strategy: last_record
+            param: starting_after
+            has_more_field: has_more
+            limit_param: limit
+    ```
+"""
+
 AIRBYTE_FILE_URL = "x-airbyte-file-url"
 """Operation extension naming the metadata-response field that contains the
 download URL. See `AIRBYTE_FILE_URL_DOC` for the full contract."""
@@ -699,12 +775,14 @@ def get_all_extension_names() -> list[str]:
         AIRBYTE_ACTION,
         AIRBYTE_ENTITY_NAME,
         AIRBYTE_STREAM_NAME,
+        AIRBYTE_CACHE_TTL,
         AIRBYTE_TOKEN_PATH,
         AIRBYTE_BODY_TYPE,
         AIRBYTE_PATH_OVERRIDE,
         AIRBYTE_RECORD_EXTRACTOR,
         AIRBYTE_RECORD_TRANSFORM,
         AIRBYTE_META_EXTRACTOR,
+        AIRBYTE_PAGINATION,
         AIRBYTE_FILE_URL,
         AIRBYTE_TOKEN_EXTRACT,
         AIRBYTE_ENTITY_RELATIONSHIPS,
@@ -754,6 +832,12 @@ EXTENSION_REGISTRY = {
         "required": False,
         "description": "Maps entity to Airbyte stream for cache lookup",
     },
+    AIRBYTE_CACHE_TTL: {
+        "location": "schema",
+        "type": "integer",
+        "required": False,
+        "description": "Seconds that read responses for the entity may be served from the response cache",
+    },
     AIRBYTE_TOKEN_PATH: {
         "location": "securityScheme",
         "type": "string",
@@ -796,6 +880,14 @@ EXTENSION_REGISTRY = {
             "Dictionary mapping field names to JSONPath expressions for extracting metadata (pagination, request IDs, etc.) from response envelopes"
         ),
     },
+    AIRBYTE_PAGINATION: {
+        "location": "operation",
+        "type": "PaginationConfig",
+        "model": "PaginationConfig",
+        "required": False,
+        "validation": "strict",
+        "description": "Page-following strategy (cursor, next link, offset, page number, or last record) for list operations",
+    },
     AIRBYTE_FILE_URL: {
         "location": "operation",
         "type": "string",
@@ -16,7 +16,7 @@ from airbyte_agent_sdk.http.exceptions import (
     TimeoutError,
 )
 from airbyte_agent_sdk.http.protocols import HTTPClientProtocol, HTTPResponseProtocol
-from airbyte_agent_sdk.http.response import HTTPResponse
+from airbyte_agent_sdk.http.response import HTTPResponse, StreamingHTTPResponse
 
 __all__ = [
     # Configuration
@@ -28,6 +28,7 @@ __all__ = [
     "HTTPResponseProtocol",
     # Response
     "HTTPResponse",
+    "StreamingHTTPResponse",
     # Exceptions
     "HTTPClientError",
     "HTTPStatusError",
@@ -1,9 +1,14 @@
 """HTTPX adapter implementing the HTTP client protocol."""
 
+import importlib.util
+import logging
+import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
+from airbyte_agent_sdk.http.adapters.transport_registry import borrow_transport
 from airbyte_agent_sdk.http.config import ClientConfig, ConnectionLimits, TimeoutConfig
 from airbyte_agent_sdk.http.exceptions import (
     AuthenticationError,
@@ -14,7 +19,58 @@ from airbyte_agent_sdk.http.exceptions import (
     TimeoutError,
 )
 from airbyte_agent_sdk.http.protocols import HTTPResponseProtocol
-from airbyte_agent_sdk.http.response import HTTPResponse
+from airbyte_agent_sdk.http.response import HTTPResponse, StreamingHTTPResponse
+from airbyte_agent_sdk.performance.timings import OperationTimings, current_timings
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """Whether the optional h2 package httpx needs for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+# httpcore trace event names -> timing phases
+_TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix_socket": "connect",
+    "send_connection_init": "connect",
+    "receive_remote_settings": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "server",
+    "receive_response_body": "download",
+}
+
+
+class _PhaseTrace:
+    """httpcore ``trace`` extension adding connection-level phases to an operation's timings.
+
+    Time until the first trace event (a new connection being opened, or the
+    request being written to a pooled one) is recorded as ``pool_wait``.
+    """
+
+    def __init__(self, timings: OperationTimings) -> None:
+        self._timings = timings
+        self._created_at: float | None = time.perf_counter()
+        self._started: dict[str, float] = {}
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if self._created_at is not None:
+            self._timings.add("pool_wait", self._created_at, now)
+            self._created_at = None
+        step, _, stage = event_name.rpartition(".")
+        phase = _TRACE_PHASES.get(step.rpartition(".")[2])
+        if phase is None:
+            return
+        if stage == "started":
+            self._started[step] = now
+        else:
+            started_at = self._started.pop(step, None)
+            if started_at is not None:
+                self._timings.add(phase, started_at, now)
 
 
 class HTTPXClient:
@@ -43,11 +99,26 @@ class HTTPXClient:
         limits = self._convert_limits(self.config.limits)  # type: ignore
         timeout = self._convert_timeout(self.config.timeout)  # type: ignore
 
+        http2 = self.config.http2
+        if http2 and not _http2_available():
+            logger.warning("HTTP/2 was requested but the 'h2' package is not installed; falling back to HTTP/1.1")
+            http2 = False
+
+        if self.config.shared_pool_key is not None:
+            # Limits and HTTP version live on the shared transport
+            return httpx.AsyncClient(
+                base_url=self.config.base_url or "",
+                timeout=timeout,
+                follow_redirects=self.config.follow_redirects,
+                transport=borrow_transport(self.config.shared_pool_key, http2=http2, limits=limits),
+            )
+
         return httpx.AsyncClient(
             base_url=self.config.base_url or "",
             timeout=timeout,
             limits=limits,
             follow_redirects=self.config.follow_redirects,
+            http2=http2,
         )
 
     def _convert_limits(self, limits: ConnectionLimits) -> httpx.Limits:
@@ -96,6 +167,40 @@ class HTTPXClient:
             _original_response=httpx_response,
         )
 
+    def _convert_streaming_response(self, httpx_response: httpx.Response) -> StreamingHTTPResponse:
+        """Convert an unread httpx.Response to an SDK StreamingHTTPResponse.
+
+        Args:
+            httpx_response: The httpx response object, opened with `stream=True`
+
+        Returns:
+            StreamingHTTPResponse that pulls the body from the open connection
+        """
+
+        async def byte_stream(chunk_size: int) -> AsyncIterator[bytes]:
+            try:
+                async for chunk in httpx_response.aiter_bytes(chunk_size=chunk_size):
+                    yield chunk
+            except httpx.TimeoutException as e:
+                raise TimeoutError(
+                    message=f"Timed out reading response body: {e}",
+                    timeout_type=None,
+                    original_error=e,
+                ) from e
+            except (httpx.ConnectError, httpx.NetworkError) as e:
+                raise NetworkError(
+                    message=f"Network error while reading response body: {e}",
+                    original_error=e,
+                ) from e
+
+        return StreamingHTTPResponse(
+            status_code=httpx_response.status_code,
+            headers=dict(httpx_response.headers),
+            byte_stream=byte_stream,
+            close=httpx_response.aclose,
+            _original_response=httpx_response,
+        )
+
     async def request(
         self,
         method: str,
@@ -116,10 +221,14 @@ class HTTPXClient:
             json: JSON data to send in the request body
             data: Form data or raw string to send in the request body
             headers: HTTP headers to include in the request
-            **kwargs: Additional httpx-specific parameters
+            **kwargs: Additional httpx-specific parameters. Pass `stream=True` to
+                return as soon as the response headers arrive and read the body
+                lazily instead of buffering it.
 
         Returns:
-            HTTPResponse with the response data.
+            HTTPResponse with the response data, or a StreamingHTTPResponse
+            when `stream=True`. Streaming responses hold a pooled connection
+            until their body is fully iterated or they are closed.
 
         Raises:
             HTTPStatusError: For 4xx or 5xx HTTP status codes
@@ -131,20 +240,48 @@ class HTTPXClient:
         if self._client is None:
             self._client = self._create_client()
 
-        # Remove stream parameter (handled at the SDK layer, not by httpx)
-        kwargs.pop("stream", None)
+        stream = bool(kwargs.pop("stream", False))
+
+        timings = current_timings()
+        if timings is not None:
+            kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": _PhaseTrace(timings)}
 
         try:
-            # Execute the request
-            httpx_response = await self._client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                data=data,
-                headers=headers,
-                **kwargs,
-            )
+            if stream:
+                # Send without reading the body so large downloads are never
+                # buffered in memory. The connection stays checked out of the
+                # pool until the StreamingHTTPResponse is drained or closed.
+                httpx_request = self._client.build_request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    data=data,
+                    headers=headers,
+                    **kwargs,
+                )
+                httpx_response = await self._client.send(httpx_request, stream=True)
+
+                if httpx_response.status_code < 400:
+                    return self._convert_streaming_response(httpx_response)
+
+                # Error bodies are small; buffer them so the error handling
+                # below can inspect the payload, then release the connection.
+                try:
+                    await httpx_response.aread()
+                finally:
+                    await httpx_response.aclose()
+            else:
+                # Execute the request
+                httpx_response = await self._client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    data=data,
+                    headers=headers,
+                    **kwargs,
+                )
 
             # Convert to SDK response
             response = self._convert_response(httpx_response)
@@ -0,0 +1,94 @@
+"""Process-wide registry of shared httpx connection pools.
+
+By default every HTTPXClient owns an ``httpx.AsyncClient`` with its own
+connection pool, so N executors talking to the same API keep N keepalive pools
+and perform N sets of TLS handshakes. Clients configured with a
+``shared_pool_key`` instead borrow an ``httpx.AsyncHTTPTransport`` from this
+registry. The transport holds only sockets; headers, auth and cookies stay on
+each client.
+
+Pools are keyed by the pool key, HTTP version and connection limits, and are
+scoped to the event loop they were created on (httpx connections cannot move
+between loops). Each borrower holds a reference; the pool is closed when the
+last borrower closes its client.
+
+The limits apply to the shared pool as a whole. Over HTTP/1.1 each request
+still needs its own connection, so sharing pays off when many clients send
+few concurrent requests each; for bursts of concurrency against one host,
+combine it with HTTP/2.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from dataclasses import dataclass
+
+import httpx
+
+_PoolKey = tuple[str, bool, int | None, int | None]
+
+
+@dataclass
+class _PoolEntry:
+    transport: httpx.AsyncHTTPTransport
+    references: int = 0
+
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_PoolKey, _PoolEntry]] = weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """A borrower's handle on a shared transport; closing it returns the reference."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, key: _PoolKey, transport: httpx.AsyncHTTPTransport) -> None:
+        self._loop = loop
+        self._key = key
+        self._transport = transport
+        self._closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        with _pools_lock:
+            pools = _pools.get(self._loop, {})
+            entry = pools.get(self._key)
+            if entry is None or entry.transport is not self._transport:
+                return
+            entry.references -= 1
+            if entry.references > 0:
+                return
+            del pools[self._key]
+        await self._transport.aclose()
+
+
+def borrow_transport(pool_key: str, *, http2: bool, limits: httpx.Limits) -> httpx.AsyncBaseTransport:
+    """Borrow the shared transport for ``pool_key`` on the running event loop.
+
+    The returned transport must be closed (directly or by closing the
+    ``httpx.AsyncClient`` it is mounted on) to release the reference.
+    """
+    loop = asyncio.get_running_loop()
+    key: _PoolKey = (pool_key, http2, limits.max_connections, limits.max_keepalive_connections)
+    with _pools_lock:
+        pools = _pools.setdefault(loop, {})
+        entry = pools.get(key)
+        if entry is None:
+            entry = _PoolEntry(transport=httpx.AsyncHTTPTransport(http2=http2, limits=limits))
+            pools[key] = entry
+        entry.references += 1
+        return _BorrowedTransport(loop, key, entry.transport)
+
+
+def get_shared_pool_stats() -> list[dict[str, object]]:
+    """Describe the shared pools on the running event loop (key, HTTP version, borrowers)."""
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        pools = dict(_pools.get(loop, {}))
+    return [{"pool_key": key[0], "http2": key[1], "max_connections": key[2], "borrowers": entry.references} for key, entry in pools.items()]
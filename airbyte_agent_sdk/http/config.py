@@ -90,6 +90,22 @@ class ClientConfig:
     follow_redirects: bool = True
     """Whether to automatically follow HTTP redirects."""
 
+    http2: bool = False
+    """Whether to negotiate HTTP/2 with servers that support it.
+
+    Concurrent requests to the same host are multiplexed over a single
+    connection instead of opening one connection per request. Requires the
+    optional ``h2`` package (``pip install airbyte-agent-sdk[http2]``); without
+    it the client falls back to HTTP/1.1 and logs a warning."""
+
+    shared_pool_key: str | None = None
+    """Opt into a process-wide shared connection pool.
+
+    Clients with the same key, HTTP version and connection limits, running on
+    the same event loop, borrow one reference-counted pool of sockets (and TLS
+    sessions). Headers and auth stay per client. The pool is closed when the
+    last client using it is closed. None gives the client a private pool."""
+
     def __post_init__(self) -> None:
         """Set default values for None fields."""
         if self.timeout is None:
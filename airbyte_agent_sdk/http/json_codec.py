@@ -0,0 +1,88 @@
+"""JSON decoding for response bodies.
+
+Parses straight from the response bytes with the fastest available backend:
+orjson, then msgspec, then the standard library. Neither orjson nor msgspec is
+a dependency of the SDK; they are picked up when installed.
+
+The fast backends are stricter than ``json.loads`` in a few corners (NaN and
+Infinity literals, invalid UTF-8, a leading BOM). When a fast backend rejects a
+body, it is re-parsed with the historical
+``json.loads(content.decode("utf-8", errors="replace"))`` path, so the set of
+accepted bodies and the parsed values are unchanged. Bodies containing a run of
+20+ digits skip the fast backend entirely, because integers beyond the 64-bit
+range would otherwise be decoded as floats instead of exact Python ints. The
+check does not look at JSON syntax, so long digit strings inside string values
+(numeric IDs, phone numbers, card fingerprints) also send a body to the
+standard library parser; the result is the same, only slower.
+"""
+
+from __future__ import annotations
+
+import json as json_module
+from collections.abc import Callable
+from typing import Any
+
+
+def _select_backend() -> tuple[str, Callable[[bytes], Any] | None]:
+    try:
+        import orjson  # type: ignore[import-not-found]
+
+        return "orjson", orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec  # type: ignore[import-not-found]
+
+        return "msgspec", msgspec.json.decode
+    except ImportError:
+        pass
+    return "json", None
+
+
+JSON_BACKEND, _fast_loads = _select_backend()
+"""Name of the JSON backend in use: "orjson", "msgspec", or "json"."""
+
+
+# Any integer literal beyond the uint64 range has at least 20 digits. Mapping all
+# digits to "0" and searching for a run is a pair of C-level passes over the body;
+# a regex search for the run is over ten times slower on number-heavy bodies.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_WIDE_INTEGER_RUN = b"0" * 20
+# Bodies are scanned in windows so the translated copy never exceeds one window.
+# Windows overlap by one digit less than a run, so a run across a boundary is
+# always whole in one of them.
+_SCAN_WINDOW = 64 * 1024
+_SCAN_STEP = _SCAN_WINDOW - (len(_WIDE_INTEGER_RUN) - 1)
+
+
+def _may_contain_wide_integer(content: bytes) -> bool:
+    if len(content) <= _SCAN_WINDOW:
+        return _WIDE_INTEGER_RUN in content.translate(_DIGITS_TO_ZERO)
+    for start in range(0, len(content), _SCAN_STEP):
+        if _WIDE_INTEGER_RUN in content[start : start + _SCAN_WINDOW].translate(_DIGITS_TO_ZERO):
+            return True
+    return False
+
+
+def is_blank(content: bytes) -> bool:
+    """Return True for an empty or whitespace-only body, without decoding it."""
+    return not content or content.isspace()
+
+
+def loads_json(content: bytes) -> Any:
+    """Parse a JSON document from bytes.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    if _fast_loads is not None and not _may_contain_wide_integer(content):
+        try:
+            return _fast_loads(content)
+        except Exception:
+            # Fall through to the stdlib parser, which is the source of truth
+            # for what is accepted (and produces the error message).
+            pass
+    try:
+        return json_module.loads(content.decode("utf-8", errors="replace"))
+    except json_module.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in response: {e}") from e
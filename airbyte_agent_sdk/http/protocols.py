@@ -40,6 +40,14 @@ class HTTPResponseProtocol(Protocol):
         """
         ...
 
+    async def aread(self) -> bytes:
+        """Get the raw response body.
+
+        Returns:
+            The response body as bytes.
+        """
+        ...
+
     def raise_for_status(self) -> None:
         """Raise an exception if the response status indicates an error.
 
@@ -77,7 +85,10 @@ class HTTPClientProtocol(Protocol):
             json: JSON data to send in the request body
             data: Form data or raw string to send in the request body
             headers: HTTP headers to include in the request
-            **kwargs: Additional client-specific parameters (e.g., content for raw bytes)
+            **kwargs: Additional client-specific parameters (e.g., content for raw bytes).
+                Implementations should honor `stream=True` by returning once the
+                response headers arrive and exposing the body through an async
+                `aiter_bytes(chunk_size=...)` that reads from the network lazily.
 
         Returns:
             An HTTPResponseProtocol implementation with the response data.
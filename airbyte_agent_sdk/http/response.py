@@ -1,9 +1,10 @@
 """HTTP response wrapper providing a consistent interface across HTTP clients."""
 
-import json as json_module
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
+from airbyte_agent_sdk.http.json_codec import loads_json
+
 
 class HTTPResponse:
     """Wrapper for HTTP responses that provides a consistent interface.
@@ -66,10 +67,8 @@ class HTTPResponse:
         """
         if not self._json_parsed:
             try:
-                text = await self.text()
-                self._json_cache = json_module.loads(text)
-            except json_module.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON in response: {e}") from e
+                # Parse straight from bytes; no intermediate str copy of the body
+                self._json_cache = loads_json(self._content)
             finally:
                 self._json_parsed = True
         return self._json_cache
@@ -104,6 +103,22 @@ class HTTPResponse:
         for offset in range(0, len(data), chunk_size):
             yield data[offset : offset + chunk_size]
 
+    async def aread(self) -> bytes:
+        """Get the full response body as bytes.
+
+        Returns:
+            The raw response body.
+        """
+        return self._content
+
+    async def aclose(self) -> None:
+        """Release any resources held by the response.
+
+        Buffered responses hold no connection, so this is a no-op. Streaming
+        responses override it to return the connection to the pool.
+        """
+        return None
+
     @property
     def original_response(self) -> Any | None:
         """Get the original response object from the underlying HTTP client.
@@ -116,3 +131,119 @@ class HTTPResponse:
     def __repr__(self) -> str:
         """String representation of the response."""
         return f"HTTPResponse(status_code={self.status_code})"
+
+
+class StreamingHTTPResponse(HTTPResponse):
+    """HTTP response whose body is read lazily from the open connection.
+
+    Returned by adapters when a request is made with `stream=True`. The status
+    code and headers are available immediately; the body is pulled from the
+    network as `aiter_bytes()` is consumed, so memory stays bounded by the
+    chunk size regardless of the total download size.
+
+    The underlying connection is released when the body has been fully
+    iterated, when the iterator is closed early (e.g. the consumer breaks out
+    of an `async for`), or when `aclose()` is called explicitly.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: dict[str, str],
+        byte_stream: Callable[[int], AsyncIterator[bytes]],
+        close: Callable[[], Awaitable[None]],
+        _original_response: Any | None = None,
+    ) -> None:
+        """Initialize a streaming HTTP response wrapper.
+
+        Args:
+            status_code: The HTTP status code (e.g., 200, 206)
+            headers: Response headers as a dictionary
+            byte_stream: Callable that takes a chunk size and returns an async
+                iterator over the raw response body
+            close: Coroutine function that releases the underlying connection
+            _original_response: Optional original response object from the underlying client
+        """
+        super().__init__(
+            status_code=status_code,
+            headers=headers,
+            content=b"",
+            _original_response=_original_response,
+        )
+        self._byte_stream = byte_stream
+        self._close = close
+        self._consumed = False
+        self._closed = False
+
+    async def aiter_bytes(self, chunk_size: int = 8 * 1024 * 1024) -> AsyncIterator[bytes]:
+        """Yield the response body in chunks as they arrive from the network.
+
+        Args:
+            chunk_size: Maximum size of each chunk in bytes (default 8 MB).
+
+        Yields:
+            Chunks of the response body as bytes.
+
+        A body already buffered by `aread()` is replayed from memory.
+
+        Raises:
+            RuntimeError: If the response has been closed (by `aclose()` or a
+                previous full iteration) without buffering the body.
+        """
+        if self._consumed:
+            # Body was buffered by aread(); replay it from memory.
+            async for chunk in super().aiter_bytes(chunk_size=chunk_size):
+                yield chunk
+            return
+        if self._closed:
+            raise RuntimeError("Cannot iterate a streaming response after it has been closed")
+
+        try:
+            async for chunk in self._byte_stream(chunk_size):
+                yield chunk
+        finally:
+            await self.aclose()
+
+    async def aread(self) -> bytes:
+        """Read the remaining body into memory and release the connection.
+
+        Returns:
+            The raw response body.
+        """
+        if not self._consumed:
+            chunks = [chunk async for chunk in self.aiter_bytes()]
+            self._content = b"".join(chunks)
+            self._consumed = True
+        return self._content
+
+    async def text(self) -> str:
+        """Read the body and decode it as text.
+
+        Returns:
+            The response body decoded as a string.
+        """
+        await self.aread()
+        return await super().text()
+
+    async def json(self) -> Any:
+        """Read the body and parse it as JSON.
+
+        Returns:
+            The parsed JSON data (dict, list, or primitive).
+
+        Raises:
+            ValueError: If the response body is not valid JSON.
+        """
+        await self.aread()
+        return await super().json()
+
+    async def aclose(self) -> None:
+        """Release the underlying connection. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        await self._close()
+
+    def __repr__(self) -> str:
+        """String representation of the response."""
+        return f"StreamingHTTPResponse(status_code={self.status_code})"
@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import functools
+import hashlib
+import json as json_module
 import logging
 import random
 import time
 from collections import defaultdict
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
 from datetime import datetime
 from typing import Any
+from urllib.parse import urlsplit
 
+from airbyte_agent_sdk.concurrency_limiter import AdaptiveConcurrencyLimiter
 from airbyte_agent_sdk.constants import (
     DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_MAX_CONNECTIONS,
@@ -30,10 +36,15 @@ from airbyte_agent_sdk.http import (
     TimeoutError,
 )
 from airbyte_agent_sdk.http.adapters import HTTPXClient
-from airbyte_agent_sdk.schema.extensions import RetryConfig
+from airbyte_agent_sdk.http.json_codec import is_blank
+from airbyte_agent_sdk.performance.histogram import LatencyHistogram
+from airbyte_agent_sdk.performance.timings import current_timings
+from airbyte_agent_sdk.rate_limiter import get_rate_limiter
+from airbyte_agent_sdk.schema.extensions import RateLimitConfig, RetryConfig
 from airbyte_agent_sdk.secrets import SecretStr
+from airbyte_agent_sdk.token_manager import TokenGrant, TokenManager
 
-from .auth_strategies import AuthStrategyFactory
+from .auth_strategies import AuthStrategyFactory, TokenRefreshResult, extract_secret_value
 from .logging import NullLogger
 from .types import AuthConfig, AuthType
 
@@ -43,6 +54,73 @@ _logger = logging.getLogger(__name__)
 # Supports both sync and async callbacks for flexibility
 TokenRefreshCallback = Callable[[dict[str, str]], None] | Callable[[dict[str, str]], Awaitable[None]] | None
 
+# Idempotent reads that may share one upstream request when coalescing is enabled
+_COALESCABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+def _error_headers(error: Exception) -> dict[str, str]:
+    """Response headers attached to an HTTP error, or an empty dict."""
+    response = getattr(error, "response", None)
+    return dict(response.headers) if response is not None else {}
+
+
+def retry_after_seconds(retry_config: RetryConfig, response_headers: Mapping[str, str]) -> float | None:
+    """Parse the configured Retry-After header into seconds, or None if absent/invalid."""
+    header_name = retry_config.retry_after_header
+    header_value = response_headers.get(header_name) or response_headers.get(header_name.lower())
+    if not header_value:
+        return None
+    try:
+        value = float(header_value)
+    except (ValueError, TypeError):
+        return None
+    if retry_config.retry_after_format == "milliseconds":
+        return value / 1000.0
+    if retry_config.retry_after_format == "unix_timestamp":
+        return max(0.0, value - time.time())
+    return value
+
+
+def retry_delay(retry_config: RetryConfig, attempt: int, response_headers: Mapping[str, str]) -> float:
+    """Calculate delay before the next retry attempt.
+
+    Prefers Retry-After header if present, otherwise uses exponential backoff
+    with optional jitter.
+
+    Args:
+        retry_config: Retry configuration
+        attempt: The current attempt number (0-indexed)
+        response_headers: Response headers from the failed request
+
+    Returns:
+        Delay in seconds before the next retry
+    """
+    # Try Retry-After header first
+    retry_after = retry_after_seconds(retry_config, response_headers)
+    if retry_after is not None:
+        return min(retry_after, retry_config.max_delay_seconds)
+
+    # Exponential backoff: initial_delay * (base ^ attempt)
+    delay = retry_config.initial_delay_seconds * (retry_config.exponential_base**attempt)
+    delay = min(delay, retry_config.max_delay_seconds)
+
+    # Apply full jitter to prevent thundering herd
+    # See: https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+    if retry_config.jitter:
+        delay = random.random() * delay
+
+    return delay
+
+
+class _InFlightRequest:
+    """An upstream request shared by every concurrent caller with the same key."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
 
 class HTTPMetrics:
     """Metrics collector for HTTP requests."""
@@ -56,6 +134,18 @@ class HTTPMetrics:
         # Retry metrics
         self.retry_count = 0
         self.total_retry_delay = 0.0
+        # Request coalescing metrics
+        self.coalesced_count = 0
+        # Client-side rate limiting metrics
+        self.throttled_count = 0
+        self.total_throttle_delay = 0.0
+        # Request duration distribution, off unless enabled
+        self.latency: LatencyHistogram | None = None
+
+    def enable_latency_histogram(self):
+        """Keep a histogram of request durations, reported as ``latency`` (with p50/p95/p99) by get_stats()."""
+        if self.latency is None:
+            self.latency = LatencyHistogram()
 
     def record_request(self, duration: float, status_code: int, success: bool):
         """Record a request metric.
@@ -70,6 +160,8 @@ class HTTPMetrics:
         self.status_counts[status_code] += 1
         if not success:
             self.error_count += 1
+        if self.latency is not None:
+            self.latency.record(duration)
 
     def record_retry(self, delay: float):
         """Record a retry attempt.
@@ -80,6 +172,19 @@ class HTTPMetrics:
         self.retry_count += 1
         self.total_retry_delay += delay
 
+    def record_throttle(self, delay: float):
+        """Record a request held back by the client-side rate limiter.
+
+        Args:
+            delay: Seconds the request waited before being sent
+        """
+        self.throttled_count += 1
+        self.total_throttle_delay += delay
+
+    def record_coalesced(self):
+        """Record a request served by joining an identical in-flight request."""
+        self.coalesced_count += 1
+
     @property
     def avg_duration(self) -> float:
         """Get average request duration."""
@@ -89,7 +194,7 @@ class HTTPMetrics:
 
     def get_stats(self) -> dict[str, Any]:
         """Get metrics as dictionary."""
-        return {
+        stats = {
             "request_count": self.request_count,
             "error_count": self.error_count,
             "avg_duration": self.avg_duration,
@@ -97,7 +202,13 @@ class HTTPMetrics:
             "status_counts": dict(self.status_counts),
             "retry_count": self.retry_count,
             "total_retry_delay": self.total_retry_delay,
+            "coalesced_count": self.coalesced_count,
+            "throttled_count": self.throttled_count,
+            "total_throttle_delay": self.total_throttle_delay,
         }
+        if self.latency is not None:
+            stats["latency"] = self.latency.get_stats()
+        return stats
 
 
 class HTTPClient:
@@ -118,6 +229,11 @@ class HTTPClient:
         read_timeout: float | None = None,
         on_token_refresh: TokenRefreshCallback = None,
         retry_config: RetryConfig | None = None,
+        coalesce_reads: bool = False,
+        rate_limit: RateLimitConfig | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        http2: bool = False,
+        share_connection_pool: bool = False,
     ):
         """Initialize async HTTP client.
 
@@ -139,6 +255,26 @@ class HTTPClient:
                 Called when tokens are refreshed. Use to persist updated tokens.
             retry_config: Optional retry configuration for transient errors.
                 If None, uses default RetryConfig with sensible defaults.
+            coalesce_reads: If True, concurrent identical GET/HEAD requests share a single
+                upstream request and each caller receives its own copy of the result.
+                Requests with a body and streaming requests are never coalesced.
+            rate_limit: Optional client-side request quota. Requests wait on a token
+                bucket shared by all clients with the same base URL and credentials,
+                which is kept in sync with the API's rate-limit response headers.
+                Without a quota, a 429's Retry-After still pauses the shared bucket.
+            concurrency_limiter: Optional adaptive limit on requests in flight. Requests
+                over the limit queue instead of waiting on the connection pool; the
+                limit grows while responses are healthy and backs off on 429/503,
+                timeouts and rising latency. It may be shared between clients; each client
+                also keeps at most max_connections of its own requests in flight.
+            http2: If True, negotiate HTTP/2 so concurrent requests share a connection.
+                Requires the optional h2 package; falls back to HTTP/1.1 without it.
+                Ignored when a custom client is passed.
+            share_connection_pool: If True, borrow sockets from a process-wide pool shared
+                with every other client for the same scheme/host/port (and the same
+                HTTP version and limits), instead of opening a private pool. Auth stays
+                per client; close() only releases this client's reference.
+                Ignored when a custom client is passed.
         """
         # Store original base_url template for re-rendering after token extraction
         self._base_url_template = base_url.rstrip("/")
@@ -158,9 +294,20 @@ class HTTPClient:
         self.metrics = HTTPMetrics()
         self.on_token_refresh: TokenRefreshCallback = on_token_refresh
         self.retry_config = retry_config or RetryConfig()
-
-        # Auth error handling with refresh lock (for strategies that support refresh)
+        self.coalesce_reads = coalesce_reads
+        self._in_flight: dict[str, _InFlightRequest] = {}
+        self.rate_limiter = get_rate_limiter(f"{self._base_url_template}|{self._auth_identity()}", rate_limit)
+        self.concurrency_limiter = concurrency_limiter
+        # This client's own cap on requests through the limiter, which may be shared
+        self._connection_slots = asyncio.Semaphore(max_connections) if concurrency_limiter is not None else None
+
+        # Lock guarding proactive credential initialization
         self._refresh_lock = asyncio.Lock()
+        # Single-flight token refresh with background renewal (for strategies that support refresh)
+        self.token_manager = TokenManager(self._fetch_token, on_renewed=self._on_token_renewed, name="access token")
+        access_token = secrets.get("access_token")
+        if access_token is not None:
+            self.token_manager.seed(extract_secret_value(access_token))
         # Track whether proactive credential initialization has been performed
         self._credentials_initialized = False
 
@@ -191,6 +338,8 @@ class HTTPClient:
                     write=timeout,
                     pool=timeout,
                 ),
+                http2=http2,
+                shared_pool_key=self._pool_origin() if share_connection_pool else None,
             )
             client = HTTPXClient(config=config)
 
@@ -277,6 +426,17 @@ class HTTPClient:
         if self._credentials_initialized:
             return
 
+        timings = current_timings()
+        if timings is not None:
+            started_at = time.perf_counter()
+        try:
+            await self._initialize_credentials()
+        finally:
+            if timings is not None:
+                timings.add("auth_refresh", started_at, time.perf_counter())
+
+    async def _initialize_credentials(self) -> None:
+        """Acquire initial credentials once (see _ensure_auth_initialized)."""
         async with self._refresh_lock:
             # Double-check after acquiring lock (another request may have initialized)
             if self._credentials_initialized:
@@ -292,34 +452,59 @@ class HTTPClient:
             )
 
             if result:
-                # Notify callback if provided (for persistence)
-                if self.on_token_refresh is not None:
-                    try:
-                        # Build callback data with both tokens and extracted values
-                        callback_data = dict(result.tokens)
-                        if result.extracted_values:
-                            callback_data.update(result.extracted_values)
-
-                        # Support both sync and async callbacks
-                        callback_result = self.on_token_refresh(callback_data)
-                        if callback_result is not None and hasattr(callback_result, "__await__"):
-                            await callback_result
-                    except Exception as callback_error:
-                        self.logger.log_error(
-                            request_id=None,
-                            error=(f"Token refresh callback failed during initialization: {callback_error!s}"),
-                            status_code=None,
-                        )
-
-                # Update secrets with new tokens (in-memory)
-                self.secrets.update(result.tokens)
-
-                # Update config_values and re-render base_url with extracted values
-                if result.extracted_values:
-                    self._apply_token_extract(result.extracted_values)
+                await self._apply_refresh_result(result, callback_error_context=" during initialization")
+                access_token = result.tokens.get("access_token")
+                if access_token:
+                    self.token_manager.seed(str(access_token), result.expires_in)
 
             self._credentials_initialized = True
 
+    async def _apply_refresh_result(self, result: TokenRefreshResult, callback_error_context: str = "") -> None:
+        """Persist refreshed credentials: notify the callback, update secrets and base_url."""
+        # Notify callback if provided (for persistence)
+        # Include both tokens AND extracted values for full persistence
+        if self.on_token_refresh is not None:
+            try:
+                # Build callback data with both tokens and extracted values
+                callback_data = dict(result.tokens)
+                if result.extracted_values:
+                    callback_data.update(result.extracted_values)
+
+                # Support both sync and async callbacks
+                callback_result = self.on_token_refresh(callback_data)
+                if callback_result is not None and hasattr(callback_result, "__await__"):
+                    await callback_result
+            except Exception as callback_error:
+                self.logger.log_error(
+                    request_id=None,
+                    error=f"Token refresh callback failed{callback_error_context}: {callback_error!s}",
+                    status_code=None,
+                )
+
+        # Update secrets with new tokens (in-memory)
+        self.secrets.update(result.tokens)
+
+        # Update config_values and re-render base_url with extracted values
+        if result.extracted_values:
+            self._apply_token_extract(result.extracted_values)
+
+    async def _fetch_token(self, status_code: int = 401) -> TokenGrant | None:
+        """Refresh credentials through the auth strategy (TokenManager fetch function)."""
+        strategy = AuthStrategyFactory.get_strategy(self.auth_config.type)
+        result = await strategy.handle_auth_error(
+            status_code=status_code,
+            config=self.auth_config.config,
+            secrets=self.secrets,
+            config_values=self.config_values,
+            http_client=None,  # Let strategy create its own client
+        )
+        if not result:
+            return None
+        return TokenGrant(value=str(result.tokens.get("access_token", "")), expires_in=result.expires_in, payload=result)
+
+    async def _on_token_renewed(self, grant: TokenGrant) -> None:
+        await self._apply_refresh_result(grant.payload)
+
     def _apply_token_extract(self, extracted_values: dict[str, str]) -> None:
         """Apply extracted token values to config_values and re-render base_url.
 
@@ -373,46 +558,18 @@ class HTTPClient:
 
         return False
 
-    def _calculate_delay(self, attempt: int, response_headers: dict[str, str]) -> float:
-        """Calculate delay before the next retry attempt.
-
-        Prefers Retry-After header if present, otherwise uses exponential backoff
-        with optional jitter.
+    def _pool_origin(self) -> str:
+        """scheme://host[:port] of the base URL, used to key shared connection pools."""
+        parts = urlsplit(self.base_url)
+        return f"{parts.scheme}://{parts.netloc}"
 
-        Args:
-            attempt: The current attempt number (0-indexed)
-            response_headers: Response headers from the failed request
-
-        Returns:
-            Delay in seconds before the next retry
-        """
-        # Try Retry-After header first
-        header_name = self.retry_config.retry_after_header
-        header_value = response_headers.get(header_name) or response_headers.get(header_name.lower())
+    def _retry_after_seconds(self, response_headers: dict[str, str]) -> float | None:
+        """Parse the configured Retry-After header into seconds, or None if absent/invalid."""
+        return retry_after_seconds(self.retry_config, response_headers)
 
-        if header_value:
-            try:
-                value = float(header_value)
-                if self.retry_config.retry_after_format == "milliseconds":
-                    delay = value / 1000.0
-                elif self.retry_config.retry_after_format == "unix_timestamp":
-                    delay = max(0.0, value - time.time())
-                else:
-                    delay = value
-                return min(delay, self.retry_config.max_delay_seconds)
-            except (ValueError, TypeError):
-                pass  # Fall through to exponential backoff
-
-        # Exponential backoff: initial_delay * (base ^ attempt)
-        delay = self.retry_config.initial_delay_seconds * (self.retry_config.exponential_base**attempt)
-        delay = min(delay, self.retry_config.max_delay_seconds)
-
-        # Apply full jitter to prevent thundering herd
-        # See: https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
-        if self.retry_config.jitter:
-            delay = random.random() * delay
-
-        return delay
+    def _calculate_delay(self, attempt: int, response_headers: dict[str, str]) -> float:
+        """Calculate delay before the next retry attempt (see retry_delay)."""
+        return retry_delay(self.retry_config, attempt, response_headers)
 
     async def _execute_request(
         self,
@@ -425,10 +582,13 @@ class HTTPClient:
         *,
         content: bytes | None = None,
         stream: bool = False,
+        _auth_retry_attempted: bool = False,
     ) -> tuple[dict[str, Any], dict[str, str]]:
         """Execute a single HTTP request attempt (no retries).
 
-        This is the core request logic, separated from retry handling.
+        This is the core request logic, separated from retry handling. An auth
+        error triggers one credential refresh and retry, unless this attempt is
+        already that retry.
 
         Returns:
             Tuple of (response_data, response_headers) for non-streaming requests.
@@ -436,6 +596,9 @@ class HTTPClient:
         """
         # Ensure auth credentials are initialized (proactive refresh if needed)
         await self._ensure_auth_initialized()
+        # Wait for a refresh if the access token is known to have expired
+        if self.token_manager.value is not None:
+            await self.token_manager.get()
 
         # Check if path is a full URL (for CDN/external URLs)
         is_external_url = path.startswith(("http://", "https://")) and not path.startswith(self.base_url)
@@ -446,6 +609,18 @@ class HTTPClient:
         if not is_external_url:
             request_headers = self._inject_auth(request_headers)
 
+        # Wait for the shared rate limiter (pre-signed/CDN URLs don't count against the API quota)
+        if not is_external_url:
+            throttle_delay = await self.rate_limiter.acquire()
+            if throttle_delay > 0:
+                self.metrics.record_throttle(throttle_delay)
+
+        # Take a concurrency slot; it is returned once the response (or error) is in
+        slot_started_at = None
+        if self.concurrency_limiter is not None and not is_external_url:
+            slot_started_at = await self._acquire_slot()
+        overloaded = False
+
         # Log request start
         request_id = self.logger.log_request(
             method=method.upper(),
@@ -460,6 +635,11 @@ class HTTPClient:
         start_time = datetime.now()
         success = False
         status_code = 0
+        # Phase timings for the calling operation, when it collects them
+        timings = current_timings()
+        received_at = None
+        if timings is not None:
+            sent_at = time.perf_counter()
 
         try:
             # Make async request through HTTP client protocol
@@ -475,6 +655,8 @@ class HTTPClient:
             )
 
             status_code = response.status_code
+            if not is_external_url:
+                self.rate_limiter.observe(response.headers)
 
             # Streaming path: return response without reading body
             if stream:
@@ -491,9 +673,13 @@ class HTTPClient:
             content_type = response.headers.get("content-type", "")
 
             try:
-                response_text = await response.text()
-
-                if not response_text.strip():
+                # Check for an empty body on the raw bytes; json() parses from bytes too,
+                # so the body is never held as bytes, str and parsed tree at once.
+                body_bytes = await response.aread()
+                if timings is not None:
+                    received_at = time.perf_counter()
+                    timings.add("network", sent_at, received_at)
+                if is_blank(body_bytes):
                     response_data = {}
                 elif "application/json" in content_type or "+json" in content_type or not content_type:
                     response_data = await response.json()
@@ -520,6 +706,8 @@ class HTTPClient:
                 )
                 raise HTTPClientError(error_msg)
 
+            if timings is not None:
+                timings.add("json_parse", received_at, time.perf_counter())
             success = True
             self.logger.log_response(
                 request_id=request_id,
@@ -532,6 +720,16 @@ class HTTPClient:
         except AuthenticationError as e:
             # Auth error (401, 403) - handle token refresh
             status_code = e.status_code if hasattr(e, "status_code") else 401
+            if timings is not None:
+                # The retry after a refresh records its own network time
+                received_at = time.perf_counter()
+                timings.add("network", sent_at, received_at)
+            # The refresh retries through _execute_request, which takes its own slot
+            if slot_started_at is not None:
+                self._release_slot(slot_started_at, ok=False)
+                slot_started_at = None
+            if _auth_retry_attempted:
+                raise  # Already retried with a refreshed credential
             result = await self._handle_auth_error(e, request_id, method, path, params, json, data, headers, content, stream)
             if result is not None:
                 return result  # Token refresh succeeded, return the retry result
@@ -540,6 +738,12 @@ class HTTPClient:
         except (RateLimitError, HTTPStatusError, TimeoutError, NetworkError) as e:
             # These may be retried by the caller
             status_code = getattr(e, "status_code", 0) or 0
+            if not is_external_url and isinstance(e, HTTPStatusError):
+                error_headers = _error_headers(e)
+                retry_after = self._retry_after_seconds(error_headers) if isinstance(e, RateLimitError) else None
+                self.rate_limiter.observe(error_headers, retry_after=retry_after)
+            if self.concurrency_limiter is not None:
+                overloaded = isinstance(e, TimeoutError) or status_code in self.concurrency_limiter.overload_status_codes
             self.logger.log_error(request_id=request_id, error=str(e), status_code=status_code or None)
             raise
 
@@ -563,6 +767,28 @@ class HTTPClient:
         finally:
             duration = (datetime.now() - start_time).total_seconds()
             self.metrics.record_request(duration, status_code, success)
+            if timings is not None and received_at is None:
+                # Streamed, failed or errored before the body was read
+                timings.add("network", sent_at, time.perf_counter())
+            if slot_started_at is not None:
+                self._release_slot(slot_started_at, ok=success, overloaded=overloaded)
+
+    async def _acquire_slot(self) -> float:
+        """Take one of this client's connection slots, then a concurrency limiter slot.
+
+        Requests over max_connections wait here rather than on the connection pool,
+        and the limiter only sees (and grows its window for) requests that can be sent.
+        """
+        await self._connection_slots.acquire()
+        try:
+            return await self.concurrency_limiter.acquire()
+        except BaseException:
+            self._connection_slots.release()
+            raise
+
+    def _release_slot(self, started_at: float, *, ok: bool, overloaded: bool = False) -> None:
+        self.concurrency_limiter.release(started_at, ok=ok, overloaded=overloaded)
+        self._connection_slots.release()
 
     async def _handle_auth_error(
         self,
@@ -583,69 +809,36 @@ class HTTPClient:
         """
         status_code = error.status_code if hasattr(error, "status_code") else 401
 
-        async with self._refresh_lock:
-            current_token = self.secrets.get("access_token")
-            strategy = AuthStrategyFactory.get_strategy(self.auth_config.type)
+        current_token = self.secrets.get("access_token")
 
-            # Try to refresh credentials
-            try:
-                result = await strategy.handle_auth_error(
-                    status_code=status_code,
-                    config=self.auth_config.config,
-                    secrets=self.secrets,
-                    config_values=self.config_values,
-                    http_client=None,  # Let strategy create its own client
-                )
-            except Exception as refresh_error:
-                self.logger.log_error(
-                    request_id=request_id,
-                    error=f"Credential refresh failed: {str(refresh_error)}",
-                    status_code=status_code,
-                )
-                result = None
+        # Concurrent 401s share one refresh; a caller whose token was already
+        # replaced by another refresh just retries with the new one
+        try:
+            await self.token_manager.refresh(
+                stale=extract_secret_value(current_token) if current_token is not None else None,
+                fetch=functools.partial(self._fetch_token, status_code),
+            )
+        except Exception as refresh_error:
+            self.logger.log_error(
+                request_id=request_id,
+                error=f"Credential refresh failed: {str(refresh_error)}",
+                status_code=status_code,
+            )
 
-            # If refresh succeeded, update tokens and retry
-            if result:
-                # Notify callback if provided (for persistence)
-                # Include both tokens AND extracted values for full persistence
-                if self.on_token_refresh is not None:
-                    try:
-                        # Build callback data with both tokens and extracted values
-                        callback_data = dict(result.tokens)
-                        if result.extracted_values:
-                            callback_data.update(result.extracted_values)
-
-                        # Support both sync and async callbacks
-                        callback_result = self.on_token_refresh(callback_data)
-                        if callback_result is not None and hasattr(callback_result, "__await__"):
-                            await callback_result
-                    except Exception as callback_error:
-                        self.logger.log_error(
-                            request_id=request_id,
-                            error=f"Token refresh callback failed: {str(callback_error)}",
-                            status_code=status_code,
-                        )
-
-                # Update secrets with new tokens (in-memory)
-                self.secrets.update(result.tokens)
-
-                # Update config_values and re-render base_url with extracted values
-                if result.extracted_values:
-                    self._apply_token_extract(result.extracted_values)
-
-                if self.secrets.get("access_token") != current_token:
-                    # Retry with new token - this will go through full retry logic
-                    # Any errors from this retry will propagate to the caller
-                    return await self.request(
-                        method=method,
-                        path=path,
-                        params=params,
-                        json=json,
-                        data=data,
-                        headers=headers,
-                        content=content,
-                        stream=stream,
-                    )
+        if self.secrets.get("access_token") != current_token:
+            # Retry with new token - this will go through full retry logic
+            # Any errors from this retry will propagate to the caller
+            return await self._request_with_retries(
+                method=method,
+                path=path,
+                params=params,
+                json=json,
+                data=data,
+                headers=headers,
+                content=content,
+                stream=stream,
+                _auth_retry_attempted=True,
+            )
 
         # Refresh failed or token didn't change, log and let original error propagate
         self.logger.log_error(request_id=request_id, error=str(error), status_code=status_code)
@@ -674,6 +867,8 @@ class HTTPClient:
             headers: Additional headers
             content: Raw bytes body for multipart/related uploads
             stream: If True, do not eagerly read the body (useful for downloads)
+            _auth_retry_attempted: Internal; set on the retry after a credential
+                refresh so a second auth error is raised instead of refreshing again
 
         Returns:
             Tuple of (response_data, response_headers):
@@ -688,26 +883,133 @@ class HTTPClient:
             NetworkError: If network error occurs (after all retries if configured)
             HTTPClientError: For other client errors
         """
+        if self.coalesce_reads and not stream and json is None and data is None and content is None:
+            key = self._coalescing_key(method, path, params, headers)
+            if key is not None:
+                return await self._coalesced_request(
+                    key,
+                    lambda: self._request_with_retries(method, path, params, headers=headers, _auth_retry_attempted=_auth_retry_attempted),
+                )
+        return await self._request_with_retries(
+            method, path, params, json, data, headers, content=content, stream=stream, _auth_retry_attempted=_auth_retry_attempted
+        )
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        content: bytes | None = None,
+        stream: bool = False,
+        _auth_retry_attempted: bool = False,
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Make a request with automatic retries, bypassing request coalescing."""
         for attempt in range(self.retry_config.max_attempts):
             try:
-                return await self._execute_request(method, path, params, json, data, headers, content=content, stream=stream)
+                return await self._execute_request(
+                    method, path, params, json, data, headers, content=content, stream=stream, _auth_retry_attempted=_auth_retry_attempted
+                )
             except (RateLimitError, HTTPStatusError, TimeoutError, NetworkError) as e:
                 status_code = getattr(e, "status_code", None)
-                headers_from_error = getattr(e, "headers", {}) or {}
+                headers_from_error = _error_headers(e)
 
                 if not self._should_retry(e, status_code, attempt):
                     raise
 
                 delay = self._calculate_delay(attempt, headers_from_error)
                 self.metrics.record_retry(delay)
+                timings = current_timings()
+                if timings is not None:
+                    slept_at = time.perf_counter()
                 await asyncio.sleep(delay)
+                if timings is not None:
+                    timings.add("retry_wait", slept_at, time.perf_counter())
             # AuthenticationError, HTTPClientError, and other exceptions propagate immediately
 
         # Should not reach here, but just in case
         raise HTTPClientError("Exhausted all retry attempts")
 
+    def _auth_identity(self) -> str:
+        """Fingerprint of the current credentials, so requests made with different tokens never share a response."""
+        digest = hashlib.sha256()
+        for name in sorted(self.secrets):
+            value = self.secrets[name]
+            raw = value.get_secret_value() if isinstance(value, SecretStr) else str(value)
+            digest.update(name.encode())
+            digest.update(b"\0")
+            digest.update(raw.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _coalescing_key(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> str | None:
+        """Build the coalescing key for a request, or None if it must not be coalesced."""
+        method = method.upper()
+        if method not in _COALESCABLE_METHODS:
+            return None
+        url = path if path.startswith(("http://", "https://")) else f"{self.base_url}{path}"
+        try:
+            return json_module.dumps(
+                [method, url, params or {}, headers or {}, self._auth_identity()],
+                sort_keys=True,
+                default=str,
+            )
+        except (TypeError, ValueError):
+            # Unorderable or unserializable params - send the request on its own
+            return None
+
+    async def _coalesced_request(
+        self,
+        key: str,
+        send: Callable[[], Awaitable[tuple[dict[str, Any], dict[str, str]]]],
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Run ``send`` once for all concurrent callers with the same key.
+
+        The first caller starts the upstream request; later callers join it and
+        receive the same result (or the same exception). Callers may mutate what
+        they get back, so every caller but the last to resume takes a deep copy
+        as soon as it resumes, before any caller can run on; the last one takes
+        the original, so a request nobody joined is never copied. The flight is
+        forgotten as soon as it completes, so this never serves stale data. If
+        every waiter is cancelled, the upstream request is cancelled too.
+        """
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = _InFlightRequest(asyncio.ensure_future(send()))
+            self._in_flight[key] = flight
+            flight.task.add_done_callback(lambda _task: self._forget_flight(key, flight))
+        else:
+            self.metrics.record_coalesced()
+
+        flight.waiters += 1
+        try:
+            response_data, response_headers = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+        if flight.waiters:
+            # Callers still waiting will read the original after this one has run on
+            return copy.deepcopy(response_data), dict(response_headers)
+        return response_data, response_headers
+
+    def _forget_flight(self, key: str, flight: _InFlightRequest) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
     async def close(self):
         """Close the async HTTP client."""
+        await self.token_manager.aclose()
         await self.client.aclose()
 
     async def __aenter__(self):
@@ -1,10 +1,12 @@
 """Request/response logging for Airbyte SDK."""
 
 from .logger import NullLogger, RequestLogger
+from .streaming import StreamingRequestLogger
 from .types import LogSession, RequestLog
 
 __all__ = [
     "RequestLogger",
+    "StreamingRequestLogger",
     "NullLogger",
     "RequestLog",
     "LogSession",
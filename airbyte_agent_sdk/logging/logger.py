@@ -37,8 +37,10 @@ def _redact_body(body: Any) -> Any:
 class RequestLogger:
     """Captures HTTP request/response interactions to a JSON file.
 
-    Implements bounded logging with automatic rotation and flush-before-discard
-    to prevent unbounded memory growth in long-running processes.
+    The whole session is kept in memory and written as one JSON document by
+    save(). max_logs bounds the active buffer, but rotated logs are retained
+    until save() so the file stays complete. For long-running processes use
+    StreamingRequestLogger, which appends records to disk as they complete.
     """
 
     def __init__(
@@ -52,9 +54,8 @@ class RequestLogger:
         Args:
             log_file: Path to write logs. If None, generates timestamped filename.
             connector_name: Name of the connector being logged.
-            max_logs: Maximum number of logs to keep in memory before rotation.
-                Set to None for unlimited (not recommended for production).
-                Defaults to 10000.
+            max_logs: Maximum number of logs to keep in the active buffer before
+                rotation. Set to None for no rotation. Defaults to 10000.
         """
         if log_file is None:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
@@ -99,6 +100,11 @@ class RequestLogger:
             # Remove rotated logs from active buffer
             self.session.logs = self.session.logs[num_to_rotate:]
 
+    def _record(self, log_entry: RequestLog) -> None:
+        """Store a completed request log."""
+        self.session.logs.append(log_entry)
+        self._rotate_logs_if_needed()
+
     def log_request(
         self,
         method: str,
@@ -179,8 +185,7 @@ class RequestLogger:
             timing_ms=timing_ms,
         )
 
-        self.session.logs.append(log_entry)
-        self._rotate_logs_if_needed()
+        self._record(log_entry)
 
     def log_error(
         self,
@@ -213,8 +218,7 @@ class RequestLogger:
             error=DataRedactor.redact_string(error),
         )
 
-        self.session.logs.append(log_entry)
-        self._rotate_logs_if_needed()
+        self._record(log_entry)
 
     def log_chunk_fetch(self, chunk: bytes) -> None:
         """Log a chunk from streaming response.
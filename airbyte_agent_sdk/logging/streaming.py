@@ -0,0 +1,229 @@
+"""Streaming request/response logging to rotating NDJSON files.
+
+``StreamingRequestLogger`` is a drop-in RequestLogger for long-running
+processes. Completed request logs are handed to a background writer thread
+through a bounded queue and appended to disk one JSON object per line, so
+memory use is capped by the queue size rather than the session length:
+
+- if the writer falls behind and the queue is full, new records are dropped
+  (and counted) instead of blocking requests;
+- the file is rotated when it would exceed ``max_file_bytes``, keeping
+  ``backup_count`` older files (``session.ndjson.1``, ``.2``, ...);
+- bodies can be skipped, sampled, or capped in size; skipped and oversized
+  bodies are never redacted or serialized, and parsed JSON bodies are
+  measured with a walk that stops once the cap is passed;
+- streamed download chunks are counted, not stored.
+
+Every file starts with a ``{"type": "session", ...}`` record, followed by
+``{"type": "request", ...}`` records in the RequestLog schema. close()
+appends a ``{"type": "session_end", ...}`` record with the session counters.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import random
+import threading
+import time
+from typing import Any, Dict
+
+from airbyte_agent_sdk.translation._output import _json_size, _LimitExceeded
+
+from .logger import RequestLogger
+from .types import RequestLog
+
+_STOP = object()
+
+
+class StreamingRequestLogger(RequestLogger):
+    """Appends request logs to a rotating NDJSON file from a background thread.
+
+    Args:
+        log_file: Path to write logs. If None, generates a timestamped filename.
+        connector_name: Name of the connector being logged.
+        max_queue_size: Maximum number of records waiting to be written. Records
+            logged while the queue is full are dropped.
+        max_file_bytes: Size at which the log file is rotated. None disables rotation.
+        backup_count: Number of rotated files to keep. 0 truncates the file on rotation.
+        include_bodies: If False, request and response bodies are not logged.
+        body_sample_rate: Fraction of requests (0.0-1.0) whose bodies are logged.
+        max_body_bytes: Request and response bodies whose raw or JSON-serialized size
+            exceeds this are replaced by an ``{"_omitted": true, ...}`` marker. None
+            logs them in full.
+    """
+
+    def __init__(
+        self,
+        log_file: str | None = None,
+        connector_name: str | None = None,
+        max_queue_size: int = 1000,
+        max_file_bytes: int | None = 50 * 1024 * 1024,
+        backup_count: int = 5,
+        include_bodies: bool = True,
+        body_sample_rate: float = 1.0,
+        max_body_bytes: int | None = 1024 * 1024,
+    ):
+        if log_file is None:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            log_file = f".logs/session_{timestamp}.ndjson"
+        if not 0.0 <= body_sample_rate <= 1.0:
+            raise ValueError("body_sample_rate must be between 0.0 and 1.0")
+        super().__init__(log_file=log_file, connector_name=connector_name, max_logs=None)
+
+        self.max_file_bytes = max_file_bytes
+        self.backup_count = backup_count
+        self.include_bodies = include_bodies
+        self.body_sample_rate = body_sample_rate
+        self.max_body_bytes = max_body_bytes
+
+        self.records_written = 0
+        self.records_dropped = 0
+        self.bytes_written = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self.chunk_count = 0
+        self.chunk_bytes = 0
+
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue_size)
+        self._file_bytes = self.log_file.stat().st_size if self.log_file.exists() else 0
+        self._file = open(self.log_file, "a", encoding="utf-8")
+        self._closed = False
+        self._write_line(self._session_record())
+        self._writer = threading.Thread(target=self._run, name=f"request-log-writer-{self.session.session_id[:8]}", daemon=True)
+        self._writer.start()
+
+    def _keep_bodies(self) -> bool:
+        return self.include_bodies and (self.body_sample_rate >= 1.0 or random.random() < self.body_sample_rate)
+
+    def _cap_body(self, body: Any) -> Any:
+        """Replace a body over ``max_body_bytes`` with a marker, before it is redacted or queued."""
+        if self.max_body_bytes is None or body is None:
+            return body
+        if isinstance(body, (bytes, str)):
+            return {"_omitted": True, "_size": len(body)} if len(body) > self.max_body_bytes else body
+        try:
+            # Parsed JSON: measuring stops as soon as the cap is passed
+            _json_size(body, self.max_body_bytes, set())
+        except _LimitExceeded:
+            return {"_omitted": True, "_size_exceeds": self.max_body_bytes}
+        except (TypeError, ValueError):
+            pass  # Not JSON-shaped; logged as the base logger would
+        return body
+
+    def log_request(
+        self,
+        method: str,
+        url: str,
+        path: str,
+        headers: Dict[str, str] | None = None,
+        params: Dict[str, Any] | None = None,
+        body: Any | None = None,
+    ) -> str:
+        """Log the start of an HTTP request, deciding whether its bodies are kept."""
+        keep_bodies = self._keep_bodies()
+        request_id = super().log_request(method, url, path, headers=headers, params=params, body=self._cap_body(body) if keep_bodies else None)
+        self._active_requests[request_id]["keep_bodies"] = keep_bodies
+        return request_id
+
+    def log_response(
+        self,
+        request_id: str,
+        status_code: int,
+        response_body: Any | None = None,
+        response_headers: Dict[str, str] | None = None,
+    ) -> None:
+        """Log a successful HTTP response."""
+        request_data = self._active_requests.get(request_id)
+        if request_data is not None and not request_data["keep_bodies"]:
+            response_body = None
+        super().log_response(request_id, status_code, self._cap_body(response_body), response_headers)
+
+    def _record(self, log_entry: RequestLog) -> None:
+        """Queue a completed request log for the writer thread."""
+        try:
+            self._queue.put_nowait(log_entry)
+        except queue.Full:
+            self.records_dropped += 1
+
+    def log_chunk_fetch(self, chunk: bytes) -> None:
+        """Count a chunk from a streaming response (chunk contents are not logged)."""
+        self.chunk_count += 1
+        self.chunk_bytes += len(chunk)
+
+    def _session_record(self) -> dict[str, Any]:
+        return {
+            "type": "session",
+            "session_id": self.session.session_id,
+            "connector_name": self.session.connector_name,
+            "started_at": self.session.started_at.isoformat(),
+        }
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._write_line({"type": "request", **item.model_dump(mode="json")})
+                self.records_written += 1
+                if self._queue.empty():
+                    # Batch writes while busy; flush once the backlog is drained
+                    self._file.flush()
+            except Exception:
+                self.write_errors += 1
+            finally:
+                self._queue.task_done()
+
+    def _write_line(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, default=str) + "\n"
+        size = len(line.encode("utf-8"))
+        if self.max_file_bytes is not None and self._file_bytes > 0 and self._file_bytes + size > self.max_file_bytes:
+            self._rotate()
+        self._file.write(line)
+        self._file_bytes += size
+        self.bytes_written += size
+
+    def _rotate(self) -> None:
+        """Shift log_file -> log_file.1 -> ... -> log_file.<backup_count> and start a new file."""
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self.log_file.with_name(f"{self.log_file.name}.{index}")
+                if source.exists():
+                    source.replace(self.log_file.with_name(f"{self.log_file.name}.{index + 1}"))
+            self.log_file.replace(self.log_file.with_name(f"{self.log_file.name}.1"))
+        self._file = open(self.log_file, "w", encoding="utf-8")
+        self._file_bytes = 0
+        self.rotations += 1
+        self._write_line(self._session_record())
+
+    def save(self) -> None:
+        """Wait until queued records are written and flush the file."""
+        if self._closed:
+            return
+        self._queue.join()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write remaining records, append the session summary and close the file."""
+        if self._closed:
+            return
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._closed = True
+        self._write_line({"type": "session_end", **self.get_stats()})
+        self._file.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get writer statistics as a dictionary."""
+        return {
+            "records_written": self.records_written,
+            "records_dropped": self.records_dropped,
+            "bytes_written": self.bytes_written,
+            "rotations": self.rotations,
+            "write_errors": self.write_errors,
+            "queue_depth": self._queue.qsize(),
+            "chunk_count": self.chunk_count,
+            "chunk_bytes": self.chunk_bytes,
+        }
@@ -18,6 +18,7 @@ Explicit exclusions (out of scope for this module):
   boundaries, not the construction sites.
 """
 
+import functools
 import re
 from collections.abc import Collection, Mapping
 from typing import Any
@@ -126,6 +127,12 @@ _VALUE_PATTERN_SOURCES: list[tuple[str, str]] = [
 
 VALUE_PATTERNS: list[re.Pattern[str]] = [re.compile(src) for src, _doc in _VALUE_PATTERN_SOURCES]
 
+# All value patterns as one alternation, used as a prefilter: a string with no
+# match is returned after a single scan instead of one `sub` per pattern.
+# Strings that do match still go through VALUE_PATTERNS in order, so
+# overlapping matches (e.g. a Stripe key inside a JWT) redact exactly as before.
+_ANY_VALUE_PATTERN: re.Pattern[str] = re.compile("|".join(f"(?:{src})" for src, _doc in _VALUE_PATTERN_SOURCES))
+
 # Generic high-entropy pattern — only used when `aggressive=True`
 # (cassette recording path).  False-positive rate is too high for
 # telemetry / logging.
@@ -135,6 +142,35 @@ _MAX_DEPTH = 32
 _REDACTION_MARKER = "***REDACTED***"
 
 
+# Key-name decisions are cached: the same few hundred header, param and JSON
+# field names recur across every request, response and telemetry event.
+# The deny-lists are treated as fixed once the module is imported.
+@functools.lru_cache(maxsize=4096)
+def _is_sensitive_header(key: str) -> bool:
+    lowered = key.lower()
+    return any(pattern in lowered for pattern in SENSITIVE_HEADER_PATTERNS)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_sensitive_param(key: str) -> bool:
+    lowered = key.lower()
+    return any(pattern in lowered for pattern in SENSITIVE_PARAM_PATTERNS)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_recursive_key_name(key: str) -> bool:
+    return key.lower() in RECURSIVE_KEY_NAMES
+
+
+def _redact_value(value: str, aggressive: bool) -> str:
+    if _ANY_VALUE_PATTERN.search(value) is not None:
+        for pattern in VALUE_PATTERNS:
+            value = pattern.sub(_REDACTION_MARKER, value)
+    if aggressive:
+        value = _AGGRESSIVE_PATTERN.sub(_REDACTION_MARKER, value)
+    return value
+
+
 class DataRedactor:
     """Canonical redaction helpers for the Airbyte Agent SDK.
 
@@ -152,7 +188,7 @@ class DataRedactor:
         """Redact sensitive headers by key-name substring match."""
         redacted: dict[str, str] = {}
         for key, value in headers.items():
-            if any(pattern in key.lower() for pattern in SENSITIVE_HEADER_PATTERNS):
+            if _is_sensitive_header(key):
                 redacted[key] = marker
             else:
                 redacted[key] = value
@@ -163,7 +199,7 @@ class DataRedactor:
         """Redact sensitive parameters by key-name substring match."""
         redacted: dict[str, Any] = {}
         for key, value in params.items():
-            if any(pattern in key.lower() for pattern in SENSITIVE_PARAM_PATTERNS):
+            if _is_sensitive_param(key):
                 redacted[key] = _REDACTION_MARKER
             else:
                 redacted[key] = value
@@ -186,7 +222,7 @@ class DataRedactor:
             params = parse_qs(parsed.query)
             redacted_params: dict[str, list[str]] = {}
             for key, values in params.items():
-                if any(pattern in key.lower() for pattern in SENSITIVE_PARAM_PATTERNS):
+                if _is_sensitive_param(key):
                     redacted_params[key] = [_REDACTION_MARKER] * len(values)
                 else:
                     redacted_params[key] = values
@@ -198,7 +234,7 @@ class DataRedactor:
             frag_params = parse_qs(parsed.fragment)
             redacted_frag: dict[str, list[str]] = {}
             for key, values in frag_params.items():
-                if any(pattern in key.lower() for pattern in SENSITIVE_PARAM_PATTERNS):
+                if _is_sensitive_param(key):
                     redacted_frag[key] = [_REDACTION_MARKER] * len(values)
                 else:
                     redacted_frag[key] = values
@@ -234,11 +270,7 @@ class DataRedactor:
         """
         if not isinstance(value, str):
             return value
-        for pattern in VALUE_PATTERNS:
-            value = pattern.sub(_REDACTION_MARKER, value)
-        if aggressive:
-            value = _AGGRESSIVE_PATTERN.sub(_REDACTION_MARKER, value)
-        return value
+        return _redact_value(value, aggressive)
 
     @staticmethod
     def redact_string(text: Any, *, aggressive: bool = False) -> Any:
@@ -269,7 +301,12 @@ class DataRedactor:
           `{"__redacted__": "max_depth_exceeded"}` for the subtree.
         """
         if key_names is None:
-            key_names = RECURSIVE_KEY_NAMES
+            is_sensitive_key = _is_recursive_key_name
+        else:
+            names = frozenset(key_names)
+
+            def is_sensitive_key(key: str) -> bool:
+                return key.lower() in names
 
         seen: set[int] = set()
 
@@ -277,6 +314,13 @@ class DataRedactor:
             if depth > _MAX_DEPTH:
                 return {"__redacted__": "max_depth_exceeded"}
 
+            if isinstance(obj, str):
+                return _redact_value(obj, aggressive)
+
+            # Only containers can form reference cycles
+            if not isinstance(obj, (dict, list, tuple)):
+                return obj
+
             obj_id = id(obj)
             if obj_id in seen:
                 return _REDACTION_MARKER
@@ -286,19 +330,13 @@ class DataRedactor:
                 if isinstance(obj, dict):
                     result: dict[str, Any] = {}
                     for k, v in obj.items():
-                        if isinstance(k, str) and k.lower() in key_names:
+                        if isinstance(k, str) and is_sensitive_key(k):
                             result[k] = _REDACTION_MARKER
                         else:
                             result[k] = _redact(v, depth + 1)
                     return result
 
-                if isinstance(obj, (list, tuple)):
-                    return [_redact(item, depth + 1) for item in obj]
-
-                if isinstance(obj, str):
-                    return DataRedactor.redact_value(obj, aggressive=aggressive)
-
-                return obj
+                return [_redact(item, depth + 1) for item in obj]
             finally:
                 seen.discard(obj_id)
 
@@ -1,7 +1,9 @@
 """Shared session context for both logging and telemetry."""
 
 import logging
+import threading
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any, Dict
 
@@ -9,22 +11,100 @@ from airbyte_agent_sdk.observability.config import SDKConfig, load_config
 
 logger = logging.getLogger(__name__)
 
-# Cache the config at module level to avoid repeated reads
-_cached_config: SDKConfig | None = None
+
+class SessionMetadataProvider:
+    """Process-wide source of the metadata shared by every ObservabilitySession.
+
+    The SDK config file is read at most once per process, on first use. The public
+    IP lookup runs at most once per process on a daemon thread, so creating a
+    session never waits on the network; ``public_ip`` is None until it completes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._config: SDKConfig | None = None
+        self._public_ip: str | None = None
+        self._ip_lookup_started = False
+        self._ip_resolved = threading.Event()
+        self._ip_callbacks: list[Callable[[str | None], None]] = []
+
+    @property
+    def config(self) -> SDKConfig:
+        """The SDK config, loaded from disk on first access."""
+        if self._config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config = load_config()
+        return self._config
+
+    @property
+    def public_ip(self) -> str | None:
+        """The public IP if the lookup has completed, otherwise None. Never blocks."""
+        return self._public_ip
+
+    def start_public_ip_lookup(self) -> None:
+        """Start the background public IP lookup if it has not been started yet."""
+        with self._lock:
+            if self._ip_lookup_started:
+                return
+            self._ip_lookup_started = True
+        threading.Thread(target=self._resolve_public_ip, name="airbyte-sdk-public-ip", daemon=True).start()
+
+    def when_public_ip_resolved(self, callback: Callable[[str | None], None]) -> None:
+        """Call ``callback(public_ip)`` once the lookup has finished.
+
+        Runs immediately in the calling thread if the lookup already finished or
+        was never started; otherwise on the lookup thread when it completes.
+        """
+        with self._lock:
+            if self._ip_lookup_started and not self._ip_resolved.is_set():
+                self._ip_callbacks.append(callback)
+                return
+        callback(self._public_ip)
+
+    def wait_for_public_ip(self, timeout: float | None = None) -> str | None:
+        """Block until the lookup finishes (or ``timeout`` elapses) and return the IP."""
+        if self._ip_lookup_started:
+            self._ip_resolved.wait(timeout)
+        return self._public_ip
+
+    def _resolve_public_ip(self) -> None:
+        public_ip = get_public_ip()
+        with self._lock:
+            self._public_ip = public_ip
+            self._ip_resolved.set()
+            callbacks, self._ip_callbacks = self._ip_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(public_ip)
+            except Exception as e:
+                logger.debug(f"Session metadata callback failed: {e}")
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._config = None
+            self._public_ip = None
+            self._ip_lookup_started = False
+            self._ip_resolved = threading.Event()
+            self._ip_callbacks = []
+
+
+_session_metadata = SessionMetadataProvider()
+
+
+def get_session_metadata() -> SessionMetadataProvider:
+    """Return the process-wide session metadata provider."""
+    return _session_metadata
 
 
 def _get_config() -> SDKConfig:
     """Get cached SDK config or load from file."""
-    global _cached_config
-    if _cached_config is None:
-        _cached_config = load_config()
-    return _cached_config
+    return _session_metadata.config
 
 
 def _clear_config_cache() -> None:
-    """Clear the cached config. Used for testing."""
-    global _cached_config
-    _cached_config = None
+    """Clear the cached config and public IP. Used for testing."""
+    _session_metadata._reset()
 
 
 def get_persistent_user_id() -> str:
@@ -74,7 +154,11 @@ def get_is_internal_user() -> bool:
 
 
 class ObservabilitySession:
-    """Shared session context for both logging and telemetry."""
+    """Shared session context for both logging and telemetry.
+
+    Construction does no I/O: user and network metadata come from the
+    process-wide SessionMetadataProvider when first read.
+    """
 
     def __init__(
         self,
@@ -84,7 +168,6 @@ class ObservabilitySession:
         session_id: str | None = None,
     ):
         self.session_id = session_id or str(uuid.uuid4())
-        self.user_id = get_persistent_user_id()
         self.connector_name = connector_name
         self.connector_version = connector_version
         self.execution_context = execution_context
@@ -94,8 +177,24 @@ class ObservabilitySession:
         # Avoid circular import: telemetry/__init__ imports tracker which imports ObservabilitySession
         from airbyte_agent_sdk.telemetry.config import TelemetryConfig
 
-        self.public_ip = get_public_ip() if TelemetryConfig.is_enabled() else None
-        self.is_internal_user = get_is_internal_user()
+        self._telemetry_enabled = TelemetryConfig.is_enabled()
+        if self._telemetry_enabled:
+            _session_metadata.start_public_ip_lookup()
+
+    @property
+    def user_id(self) -> str:
+        """Persistent anonymous user ID (config is read once per process)."""
+        return get_persistent_user_id()
+
+    @property
+    def is_internal_user(self) -> bool:
+        """Whether this is an internal Airbyte user (config is read once per process)."""
+        return get_is_internal_user()
+
+    @property
+    def public_ip(self) -> str | None:
+        """Public IP once the background lookup has completed; None before that or with telemetry disabled."""
+        return _session_metadata.public_ip if self._telemetry_enabled else None
 
     def increment_operations(self):
         """Increment the operation counter."""
@@ -1,6 +1,8 @@
 """Performance monitoring and instrumentation for async operations."""
 
+from .histogram import LatencyHistogram
 from .instrumentation import instrument
 from .metrics import PerformanceMonitor
+from .timings import OperationTimings, current_timings
 
-__all__ = ["instrument", "PerformanceMonitor"]
+__all__ = ["instrument", "LatencyHistogram", "OperationTimings", "PerformanceMonitor", "current_timings"]
@@ -0,0 +1,88 @@
+"""Fixed-bucket latency histogram."""
+
+from __future__ import annotations
+
+import math
+
+# Buckets grow geometrically by 2**(1/8) (~9%) from 1 microsecond, so any
+# percentile is reported within ~5% of the true value. 256 buckets reach
+# ~4.5 hours; slower values land in the last bucket.
+_MIN_VALUE = 1e-6
+_BUCKETS_PER_OCTAVE = 8
+_BUCKET_COUNT = 256
+
+
+class LatencyHistogram:
+    """Records durations (seconds) into log-spaced buckets for percentile queries.
+
+    Recording is O(1) and memory is fixed regardless of how many values are
+    recorded. Exact count, sum, min and max are kept alongside the buckets.
+    """
+
+    __slots__ = ("count", "total", "min", "max", "_buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._buckets = [0] * _BUCKET_COUNT
+
+    @staticmethod
+    def _bucket(value: float) -> int:
+        if value <= _MIN_VALUE:
+            return 0
+        return min(int(math.log2(value / _MIN_VALUE) * _BUCKETS_PER_OCTAVE) + 1, _BUCKET_COUNT - 1)
+
+    @staticmethod
+    def _bucket_midpoint(index: int) -> float:
+        if index == 0:
+            return _MIN_VALUE
+        # Geometric middle of [lower, upper)
+        return _MIN_VALUE * 2 ** ((index - 0.5) / _BUCKETS_PER_OCTAVE)
+
+    def record(self, value: float) -> None:
+        """Record one duration in seconds."""
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self._buckets[self._bucket(value)] += 1
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's values to this one."""
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        buckets = self._buckets
+        for index, bucket_count in enumerate(other._buckets):
+            if bucket_count:
+                buckets[index] += bucket_count
+
+    def percentile(self, percent: float) -> float:
+        """Approximate value below which ``percent`` (0-100) of recorded values fall."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index, bucket_count in enumerate(self._buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min(max(self._bucket_midpoint(index), self.min), self.max)
+        return self.max
+
+    def get_stats(self) -> dict[str, float]:
+        """Get count, total, mean, min, max and p50/p95/p99 as a dictionary."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
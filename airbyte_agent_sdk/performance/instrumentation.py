@@ -5,17 +5,21 @@ import logging
 import time
 from typing import Any, Callable, TypeVar
 
+from .metrics import PerformanceMonitor
+
 # Type variable for generic function decoration
 F = TypeVar("F", bound=Callable[..., Any])
 
 logger = logging.getLogger(__name__)
 
 
-def instrument(metric_name: str) -> Callable[[F], F]:
+def instrument(metric_name: str, monitor: PerformanceMonitor | None = None) -> Callable[[F], F]:
     """Decorator to instrument async functions with performance tracking.
 
     Args:
         metric_name: Name of the metric to track
+        monitor: Optional PerformanceMonitor that records each call's duration
+            (successful or not) under metric_name
 
     Returns:
         Decorator function
@@ -29,7 +33,7 @@ def instrument(metric_name: str) -> Callable[[F], F]:
     def decorator(func: F) -> F:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             success = True
             error = None
 
@@ -43,8 +47,10 @@ def instrument(metric_name: str) -> Callable[[F], F]:
                 raise
 
             finally:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 duration_ms = duration * 1000
+                if monitor is not None:
+                    monitor.record(metric_name, duration)
 
                 # Log performance metrics
                 if success:
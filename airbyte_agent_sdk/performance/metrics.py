@@ -2,92 +2,136 @@
 
 import time
 from contextlib import asynccontextmanager
-from typing import Dict
+from typing import Any, Dict, Mapping
+
+from opentelemetry import metrics
+
+from .histogram import LatencyHistogram
+
+_SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
 
 
 class PerformanceMonitor:
-    """Monitor and track performance metrics for operations."""
+    """Monitor and track performance metrics for operations.
 
-    def __init__(self):
-        """Initialize performance monitor."""
-        self._metrics: Dict[str, Dict[str, float]] = {}
+    Each metric is kept per distinct set of attributes (e.g. connector, entity,
+    action, host) as a latency histogram, so stats include p50/p95/p99.
+
+    Args:
+        export_otel: If True, also record every value to an OpenTelemetry
+            histogram named ``<otel_prefix>.<metric_name>`` (unit ``s``) through
+            the global MeterProvider. Without a configured provider the
+            OpenTelemetry API discards the values.
+        otel_prefix: Prefix for exported instrument names.
+    """
 
-    def record(self, metric_name: str, duration: float):
+    def __init__(self, export_otel: bool = False, otel_prefix: str = "airbyte.connector"):
+        """Initialize performance monitor."""
+        self._metrics: Dict[_SeriesKey, LatencyHistogram] = {}
+        self.otel_prefix = otel_prefix
+        self._meter = None
+        self._instruments: Dict[str, Any] = {}
+        if export_otel:
+            self._meter = metrics.get_meter("airbyte.connector-sdk.performance")
+
+    @staticmethod
+    def _series_key(metric_name: str, attributes: Mapping[str, str] | None) -> _SeriesKey:
+        return metric_name, tuple(sorted(attributes.items())) if attributes else ()
+
+    def record(self, metric_name: str, duration: float, attributes: Mapping[str, str] | None = None):
         """Record a metric.
 
         Args:
             metric_name: Name of the metric
             duration: Duration in seconds
+            attributes: Optional attributes identifying the series (e.g. entity, action)
         """
-        if metric_name not in self._metrics:
-            self._metrics[metric_name] = {
-                "count": 0,
-                "total": 0.0,
-                "min": float("inf"),
-                "max": 0.0,
-            }
-
-        metrics = self._metrics[metric_name]
-        metrics["count"] += 1
-        metrics["total"] += duration
-        metrics["min"] = min(metrics["min"], duration)
-        metrics["max"] = max(metrics["max"], duration)
-
-    def get_stats(self, metric_name: str) -> Dict[str, float] | None:
+        key = self._series_key(metric_name, attributes)
+        histogram = self._metrics.get(key)
+        if histogram is None:
+            histogram = self._metrics[key] = LatencyHistogram()
+        histogram.record(duration)
+
+        if self._meter is not None:
+            instrument = self._instruments.get(metric_name)
+            if instrument is None:
+                instrument = self._instruments[metric_name] = self._meter.create_histogram(
+                    f"{self.otel_prefix}.{metric_name}", unit="s", description=f"Duration of {metric_name}"
+                )
+            instrument.record(duration, attributes=dict(attributes) if attributes else None)
+
+    def get_stats(self, metric_name: str, attributes: Mapping[str, str] | None = None) -> Dict[str, float] | None:
         """Get statistics for a metric.
 
         Args:
             metric_name: Name of the metric
+            attributes: Attributes of the series; None for the series recorded without attributes
 
         Returns:
-            Dictionary with count, total, mean, min, max or None if metric not found
+            Dictionary with count, total, mean, min, max, p50, p95, p99 or None if metric not found
         """
-        if metric_name not in self._metrics:
+        histogram = self._metrics.get(self._series_key(metric_name, attributes))
+        if histogram is None:
             return None
+        return histogram.get_stats()
+
+    def get_merged_stats(self, metric_name: str, **attributes: str) -> Dict[str, float] | None:
+        """Get statistics for a metric across every series matching the given attributes.
 
-        metrics = self._metrics[metric_name]
-        return {
-            "count": metrics["count"],
-            "total": metrics["total"],
-            "mean": metrics["total"] / metrics["count"] if metrics["count"] > 0 else 0.0,
-            "min": metrics["min"] if metrics["min"] != float("inf") else 0.0,
-            "max": metrics["max"],
-        }
+        Example:
+            monitor.get_merged_stats("network", entity="customers")
+        """
+        merged = None
+        for (name, series_attributes), histogram in self._metrics.items():
+            if name != metric_name:
+                continue
+            series = dict(series_attributes)
+            if any(series.get(key) != value for key, value in attributes.items()):
+                continue
+            if merged is None:
+                merged = LatencyHistogram()
+            merged.merge(histogram)
+        return merged.get_stats() if merged is not None else None
 
     def get_all_stats(self) -> Dict[str, Dict[str, float]]:
         """Get statistics for all metrics.
 
         Returns:
-            Dictionary mapping metric names to their statistics
+            Dictionary mapping series names (``name`` or ``name{key=value,...}``) to their statistics
         """
-        return {name: self.get_stats(name) for name in self._metrics.keys()}
+        stats = {}
+        for (name, attributes), histogram in self._metrics.items():
+            label = name if not attributes else name + "{" + ",".join(f"{key}={value}" for key, value in attributes) + "}"
+            stats[label] = histogram.get_stats()
+        return stats
 
     def reset(self, metric_name: str | None = None):
         """Reset metrics.
 
         Args:
-            metric_name: Specific metric to reset, or None to reset all
+            metric_name: Specific metric to reset (all its series), or None to reset all
         """
         if metric_name:
-            if metric_name in self._metrics:
-                del self._metrics[metric_name]
+            for key in [key for key in self._metrics if key[0] == metric_name]:
+                del self._metrics[key]
         else:
             self._metrics.clear()
 
     @asynccontextmanager
-    async def track(self, metric_name: str):
+    async def track(self, metric_name: str, attributes: Mapping[str, str] | None = None):
         """Context manager for tracking operation duration.
 
         Args:
             metric_name: Name of the metric to track
+            attributes: Optional attributes identifying the series
 
         Example:
             async with monitor.track("api_call"):
                 result = await some_async_operation()
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             yield
         finally:
-            duration = time.time() - start_time
-            self.record(metric_name, duration)
+            duration = time.perf_counter() - start_time
+            self.record(metric_name, duration, attributes)
@@ -0,0 +1,79 @@
+"""Per-operation phase timings.
+
+An executor that wants a breakdown of where an operation spent its time
+starts an ``OperationTimings`` for it with ``start_timings()``. Code further
+down the call path (the HTTP client, retry loop, record extraction) looks it
+up with ``current_timings()`` and adds each interval spent in a phase. When
+nothing was started, ``current_timings()`` returns None and callers skip
+their clock reads, so the cost when disabled is one context-variable lookup.
+
+Phases recorded by the SDK (seconds):
+
+- ``auth_refresh``: waiting for credentials to be acquired or refreshed
+- ``network``: one HTTP exchange, from sending the request to having the
+  body; with the default httpx client it is broken down further into
+  ``pool_wait``, ``connect``, ``tls``, ``send``, ``server`` (request sent to
+  response headers) and ``download``
+- ``json_parse``: decoding the response body
+- ``extraction``: metadata and record extraction, including ``record_filter``
+- ``retry_wait``: sleeping between retry attempts
+
+The active timings follow asyncio tasks created while they are active; a
+background task that outlives its operation should call ``clear_timings()``.
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar, Token
+
+_current: ContextVar[OperationTimings | None] = ContextVar("airbyte_operation_timings", default=None)
+
+
+class OperationTimings:
+    """Time spent per phase of one operation.
+
+    Attributes:
+        phases: Total seconds per phase; repeated phases (e.g. several
+            requests or retries) accumulate.
+        intervals: Every recorded ``(phase, started_at, ended_at)``, in
+            ``time.perf_counter()`` seconds.
+    """
+
+    __slots__ = ("phases", "intervals", "_epoch_ns", "_perf_at_epoch")
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self.intervals: list[tuple[str, float, float]] = []
+        self._epoch_ns = time.time_ns()
+        self._perf_at_epoch = time.perf_counter()
+
+    def add(self, phase: str, started_at: float, ended_at: float) -> None:
+        """Record time spent in ``phase`` between two ``time.perf_counter()`` readings."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + (ended_at - started_at)
+        self.intervals.append((phase, started_at, ended_at))
+
+    def epoch_ns(self, perf_counter_value: float) -> int:
+        """Convert a ``time.perf_counter()`` reading to wall-clock nanoseconds (e.g. for span timestamps)."""
+        return self._epoch_ns + int((perf_counter_value - self._perf_at_epoch) * 1e9)
+
+
+def current_timings() -> OperationTimings | None:
+    """The timings of the operation running in this context, if any are being collected."""
+    return _current.get()
+
+
+def start_timings() -> tuple[OperationTimings, Token[OperationTimings | None]]:
+    """Start collecting timings in this context. Pass the token to ``stop_timings``."""
+    timings = OperationTimings()
+    return timings, _current.set(timings)
+
+
+def stop_timings(token: Token[OperationTimings | None]) -> None:
+    """Stop collecting the timings started with ``token``."""
+    _current.reset(token)
+
+
+def clear_timings() -> None:
+    """Stop adding to any operation's timings in this context."""
+    _current.set(None)
@@ -0,0 +1,153 @@
+"""Client-side rate limiting shared by HTTP clients.
+
+Each limiter is a token bucket implemented as GCRA (generic cell rate
+algorithm): it keeps a single "theoretical arrival time" instead of a token
+count, so admitting a request is O(1), needs no background refill, and hands out
+waits in arrival order. Limiters are shared process-wide by key (base URL +
+credentials), so every client talking to the same account draws from one quota.
+
+Server feedback adjusts the bucket after each response:
+
+- a remaining-requests header caps how many requests may go out immediately,
+- a remaining count of zero, or a 429, pauses the bucket until the window
+  resets or Retry-After elapses, for every client sharing it.
+
+Limiters without a RateLimitConfig never delay requests, but still honour
+429 pauses so concurrent requests stop hammering a throttled API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Mapping
+
+from airbyte_agent_sdk.schema.extensions import RateLimitConfig
+
+
+class RateLimiter:
+    """Token bucket with response-header feedback.
+
+    Thread-safe and not bound to an event loop, so one limiter can be shared by
+    clients running on different loops.
+    """
+
+    def __init__(self, config: RateLimitConfig | None = None):
+        self._lock = threading.Lock()
+        self._tat = 0.0  # theoretical arrival time of the next request (monotonic)
+        self._paused_until = 0.0
+        self.configure(config)
+
+    def configure(self, config: RateLimitConfig | None) -> None:
+        """Set the quota. Passing None removes the quota but keeps 429 pauses."""
+        with self._lock:
+            self.config = config
+            if config is None:
+                self._interval = 0.0
+                self._tolerance = 0.0
+            else:
+                self._interval = config.period_seconds / config.requests
+                self._tolerance = ((config.burst or config.requests) - 1) * self._interval
+
+    def _reserve(self) -> float:
+        """Claim the next slot and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._paused_until)
+            if self._interval == 0.0:
+                return start - now
+            tat = max(self._tat, start)
+            self._tat = tat + self._interval
+            return max(tat - self._tolerance, start) - now
+
+    async def acquire(self) -> float:
+        """Wait until a request may be sent. Returns the seconds spent waiting."""
+        waited = 0.0
+        delay = self._reserve()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+            # A 429 seen while we slept may have paused the bucket further
+            delay = self._paused_until - time.monotonic()
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Hold all requests for ``seconds`` from now."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def observe(self, headers: Mapping[str, str], retry_after: float | None = None) -> None:
+        """Update the bucket from a response.
+
+        Args:
+            headers: Response headers
+            retry_after: Seconds from a 429's Retry-After, if the response was throttled
+        """
+        if retry_after is not None:
+            self.pause(retry_after)
+
+        config = self.config
+        if config is None or not (config.remaining_header or config.usage_header):
+            return
+        lowered = {key.lower(): value for key, value in headers.items()}
+        remaining = self._parse_remaining(config, lowered)
+        if remaining is None:
+            return
+
+        if remaining <= 0:
+            reset = self._parse_reset(config, lowered)
+            self.pause(reset if reset is not None else self._interval)
+            return
+        with self._lock:
+            # Allow at most `remaining` more requests before the normal refill rate applies
+            self._tat = max(self._tat, time.monotonic() + self._tolerance - (remaining - 1) * self._interval)
+
+    @staticmethod
+    def _parse_remaining(config: RateLimitConfig, headers: dict[str, str]) -> float | None:
+        try:
+            if config.remaining_header and config.remaining_header.lower() in headers:
+                return float(headers[config.remaining_header.lower()])
+            if config.usage_header and config.usage_header.lower() in headers:
+                used, limit = headers[config.usage_header.lower()].split("/", 1)
+                return float(limit) - float(used)
+        except ValueError:
+            pass
+        return None
+
+    @staticmethod
+    def _parse_reset(config: RateLimitConfig, headers: dict[str, str]) -> float | None:
+        if not config.reset_header or config.reset_header.lower() not in headers:
+            return None
+        try:
+            value = float(headers[config.reset_header.lower()])
+        except ValueError:
+            return None
+        if config.reset_format == "milliseconds":
+            return value / 1000.0
+        if config.reset_format == "unix_timestamp":
+            return max(0.0, value - time.time())
+        return value
+
+
+_limiters: weakref.WeakValueDictionary[str, RateLimiter] = weakref.WeakValueDictionary()
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, config: RateLimitConfig | None = None) -> RateLimiter:
+    """Return the shared limiter for ``key``, creating it if needed.
+
+    The first config registered for a key wins; a later config only applies if
+    the existing limiter had none. Limiters are dropped once no client holds them.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(config)
+            _limiters[key] = limiter
+        elif limiter.config is None and config is not None:
+            limiter.configure(config)
+        return limiter
@@ -26,7 +26,7 @@ from .components import (
     Schema,
 )
 from .connector import ExternalDocs, OpenAPIConnector, Tag
-from .extensions import EntityRelationshipConfig, RetryConfig, ScopingParamConfig
+from .extensions import EntityRelationshipConfig, PaginationConfig, RateLimitConfig, RetryConfig, ScopingParamConfig
 from .operations import Operation, PathItem
 from .security import (
     AuthConfigFieldSpec,
@@ -68,6 +68,8 @@ __all__ = [
     "Operation",
     # Extension models
     "RetryConfig",
+    "RateLimitConfig",
+    "PaginationConfig",
     "EntityRelationshipConfig",
     "ScopingParamConfig",
 ]
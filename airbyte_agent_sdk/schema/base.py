@@ -13,7 +13,14 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic_core import Url
 
-from airbyte_agent_sdk.schema.extensions import CacheConfig, EntityRelationshipConfig, ReplicationConfig, RetryConfig, ScopingParamConfig
+from airbyte_agent_sdk.schema.extensions import (
+    CacheConfig,
+    EntityRelationshipConfig,
+    RateLimitConfig,
+    ReplicationConfig,
+    RetryConfig,
+    ScopingParamConfig,
+)
 
 
 class ExampleQuestions(BaseModel):
@@ -148,6 +155,7 @@ class Info(BaseModel):
     - x-airbyte-connector-definition-id: UUID of the connector (Airbyte extension)
     - x-airbyte-external-documentation-urls: List of external documentation URLs (Airbyte extension)
     - x-airbyte-retry-config: Retry configuration for transient errors (Airbyte extension)
+    - x-airbyte-rate-limit: Client-side request quota and rate-limit header feedback (Airbyte extension)
     - x-airbyte-example-questions: Example questions for AI connector README (Airbyte extension)
     - x-airbyte-auth-tooltip: Short, non-technical multiline string shown to end users in the embedded widget to describe how to authenticate the connector (Airbyte extension)
     - x-airbyte-context-store: Cache configuration for field mapping between API and cache schemas (Airbyte extension)
@@ -185,6 +193,7 @@ class Info(BaseModel):
     x_airbyte_connector_definition_id: UUID | None = Field(None, alias="x-airbyte-connector-definition-id")
     x_airbyte_external_documentation_urls: list[DocUrl] = Field(..., alias="x-airbyte-external-documentation-urls")
     x_airbyte_retry_config: RetryConfig | None = Field(None, alias="x-airbyte-retry-config")
+    x_airbyte_rate_limit: RateLimitConfig | None = Field(None, alias="x-airbyte-rate-limit")
     x_airbyte_example_questions: ExampleQuestions | None = Field(None, alias="x-airbyte-example-questions")
     x_airbyte_auth_tooltip: str | dict[str, str] | None = Field(
         default=None,
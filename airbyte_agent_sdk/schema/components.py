@@ -87,6 +87,7 @@ class Schema(BaseModel):
     x_airbyte_entity_name: str | None = Field(None, alias="x-airbyte-entity-name")
     x_airbyte_stream_name: str | None = Field(None, alias="x-airbyte-stream-name")
     x_airbyte_ai_hints: AiHints | None = Field(None, alias="x-airbyte-ai-hints")
+    x_airbyte_cache_ttl: int | None = Field(None, alias="x-airbyte-cache-ttl", ge=0)
 
 
 class Parameter(BaseModel):
@@ -3,6 +3,8 @@ Extension models for connector configuration.
 
 Provides Pydantic models for OpenAPI x-airbyte-* extensions:
 - RetryConfig: retry strategy with exponential backoff
+- RateLimitConfig: client-side request quota and rate-limit header feedback
+- PaginationConfig: page-following strategy for list operations
 - CacheConfig / CacheEntityConfig / CacheFieldConfig: cache mapping for api_search
 - ReplicationConfig: replication settings for MULTI mode connectors
 - EntityRelationshipConfig: entity relationship declarations
@@ -53,6 +55,126 @@ class RetryConfig(BaseModel):
     retry_after_format: Literal["seconds", "milliseconds", "unix_timestamp"] = "seconds"
 
 
+class RateLimitConfig(BaseModel):
+    """
+    Client-side request quota for a connector.
+
+    Requests are admitted by a token bucket that refills at ``requests`` per
+    ``period_seconds`` and holds up to ``burst`` tokens (default: ``requests``).
+    The bucket is shared by every client using the same base URL and
+    credentials, so concurrent executors and batches stay under the quota
+    together. Response headers keep it in sync with the server's view:
+
+    - ``remaining_header``: requests left in the current window. The bucket never
+      holds more tokens than this, and a value of 0 pauses it until the reset.
+    - ``reset_header`` / ``reset_format``: when the window resets.
+    - ``usage_header``: a ``used/limit`` pair (e.g. Shopify's call limit header),
+      treated as ``limit - used`` remaining.
+
+    A 429 response always pauses the shared bucket for its Retry-After delay.
+
+    Can be specified at the connector level via x-airbyte-rate-limit in the
+    OpenAPI spec's info section.
+
+    Example YAML usage:
+        info:
+          title: My API
+          x-airbyte-rate-limit:
+            requests: 110
+            period_seconds: 10
+            remaining_header: X-HubSpot-RateLimit-Remaining
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    requests: int = Field(..., gt=0, description="Requests allowed per period")
+    period_seconds: float = Field(1.0, gt=0, description="Length of the quota period in seconds")
+    burst: int | None = Field(None, gt=0, description="Bucket capacity; defaults to `requests`")
+
+    # Header feedback
+    remaining_header: str | None = Field(None, description="Response header with the requests remaining in the current window")
+    reset_header: str | None = Field(None, description="Response header with the time the current window resets")
+    reset_format: Literal["seconds", "milliseconds", "unix_timestamp"] = Field(
+        "seconds", description="Format of `reset_header`: delay in seconds or milliseconds, or a unix timestamp"
+    )
+    usage_header: str | None = Field(None, description="Response header with a `used/limit` pair, e.g. X-Shopify-Shop-Api-Call-Limit")
+
+
+class PaginationConfig(BaseModel):
+    """
+    Configuration for following pages of a list operation.
+
+    Declared per operation via x-airbyte-pagination. Field names such as
+    `next_field` and `has_more_field` refer to keys of the operation's
+    x-airbyte-meta-extractor, so pagination state is read from the same
+    metadata that ExecutionResult.meta exposes.
+
+    Strategies:
+    - cursor: send the value of `next_field` back as the `param` query param
+    - next_link: request the URL found in `next_field` as-is
+    - offset: advance `param` by the number of records returned, stopping once
+      the total reported by `total_records_field` is reached when one is declared
+    - page_number: advance `param` by one page at a time, stopping after
+      the page reported by `total_pages_field` when one is declared
+    - last_record: send `record_field` of the last record as `param`
+      (e.g. Stripe's `starting_after`)
+
+    Example YAML usage:
+        get:
+          x-airbyte-meta-extractor:
+            next_cursor: $.response_metadata.next_cursor
+          x-airbyte-pagination:
+            strategy: cursor
+            param: cursor
+            next_field: next_cursor
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    strategy: Literal["cursor", "next_link", "offset", "page_number", "last_record"]
+    param: str | None = Field(
+        default=None,
+        description="Query parameter that carries the page position (cursor, offset, page number, or last-record key)",
+    )
+    next_field: str | None = Field(
+        default=None,
+        description="Meta-extractor field holding the next cursor or next-page URL",
+    )
+    has_more_field: str | None = Field(
+        default=None,
+        description="Meta-extractor field holding a has-more flag; pagination stops when it is falsy",
+    )
+    total_pages_field: str | None = Field(
+        default=None,
+        description="Meta-extractor field holding the total page count (page_number strategy); pagination stops after that page",
+    )
+    total_records_field: str | None = Field(
+        default=None,
+        description="Meta-extractor field holding the total record count (offset strategy); pagination stops once it is reached",
+    )
+    record_field: str = Field(
+        default="id",
+        description="Record field used as the cursor for the last_record strategy",
+    )
+    limit_param: str | None = Field(
+        default=None,
+        description="Query parameter that controls page size",
+    )
+    start: int | None = Field(
+        default=None,
+        description="Initial value for offset (default 0) or page_number (default 1) strategies",
+    )
+
+    @model_validator(mode="after")
+    def validate_strategy_fields(self) -> "PaginationConfig":
+        """Validate that each strategy declares the fields it needs."""
+        if self.strategy in ("cursor", "offset", "page_number", "last_record") and not self.param:
+            raise ValueError(f"x-airbyte-pagination strategy '{self.strategy}' requires 'param'")
+        if self.strategy in ("cursor", "next_link") and not self.next_field:
+            raise ValueError(f"x-airbyte-pagination strategy '{self.strategy}' requires 'next_field'")
+        return self
+
+
 class CacheFieldProperty(BaseModel):
     """
     Nested property definition for object-type cache fields.
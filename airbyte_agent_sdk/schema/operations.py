@@ -12,6 +12,7 @@ from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from ..extensions import AIRBYTE_FILE_URL_DESCRIPTION, ActionTypeLiteral
 from .components import AiHints, Parameter, PathOverrideConfig, RequestBody, Response
+from .extensions import PaginationConfig
 from .security import SecurityRequirement
 
 
@@ -127,6 +128,16 @@ class Operation(BaseModel):
             "Empty strings are treated as missing and will fail validation."
         ),
     )
+    x_airbyte_pagination: PaginationConfig | None = Field(
+        None,
+        alias="x-airbyte-pagination",
+        description=(
+            "Page-following strategy for list operations. References fields declared in "
+            "x-airbyte-meta-extractor (next cursor, next link, has-more flag) and the query "
+            "parameter that carries the page position. When omitted, the executor infers a "
+            "strategy from the meta extractor and query parameters where it can."
+        ),
+    )
     x_airbyte_preferred_for_check: bool | None = Field(
         None,
         alias="x-airbyte-preferred-for-check",
@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 
 from airbyte_agent_sdk.observability import ObservabilitySession
 from airbyte_agent_sdk.observability.redactor import DataRedactor
+from airbyte_agent_sdk.observability.session import get_session_metadata
 
 from .config import SEGMENT_WRITE_KEY, TelemetryConfig, TelemetryMode
 from .events import ConnectorInitEvent, OperationEvent, SessionEndEvent
@@ -51,18 +52,31 @@ class SegmentTracker:
         self,
         connector_version: str | None = None,
     ) -> None:
-        """Track connector initialization."""
+        """Track connector initialization.
+
+        The event is sent once the process-wide public IP lookup finishes, from the
+        lookup thread if it is still running, so this never blocks the caller.
+        """
         if not self.enabled or not self._analytics:
             return
 
+        timestamp = datetime.now(UTC)
+        get_session_metadata().when_public_ip_resolved(lambda public_ip: self._send_connector_init(timestamp, public_ip, connector_version))
+
+    def _send_connector_init(
+        self,
+        timestamp: datetime,
+        public_ip: str | None,
+        connector_version: str | None,
+    ) -> None:
         try:
             event = ConnectorInitEvent(
-                timestamp=datetime.now(UTC),
+                timestamp=timestamp,
                 session_id=self.session.session_id,
                 user_id=self.session.user_id,
                 execution_context=self.session.execution_context,
                 is_internal_user=self.session.is_internal_user,
-                public_ip=self.session.public_ip,
+                public_ip=public_ip,
                 connector_name=self.session.connector_name,
                 connector_version=connector_version,
                 python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
@@ -0,0 +1,248 @@
+"""Single-flight access token management with proactive renewal.
+
+A ``TokenManager`` owns one credential's current access token and how to get a
+new one. It is used by HTTPClient for refreshable auth strategies (OAuth2) and
+by AirbyteCloudClient for its application token.
+
+- Concurrent refreshes collapse into one: callers that need a new token while
+  a refresh is running wait for that refresh instead of starting their own.
+  A caller reporting a token as stale (e.g. after a 401) gets the current one
+  without a refresh if it has already been replaced.
+- When the token's lifetime is known, it is renewed in the background
+  ``renew_before`` seconds before it expires, so request paths only block on
+  a refresh when the token is missing or already expired. Renewal stops once
+  the token has gone unused for ``idle_timeout`` seconds; the next ``get()``
+  after expiry then refreshes on demand.
+- Refresh counts and latency are available from ``get_stats()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from airbyte_agent_sdk.performance.timings import clear_timings, current_timings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenGrant:
+    """A token returned by a TokenManager fetch function.
+
+    Attributes:
+        value: The access token
+        expires_in: Lifetime in seconds from now, if the issuer reported one
+        payload: Anything else the owner needs when the token is renewed
+            (e.g. the full OAuth2 refresh result)
+    """
+
+    value: str
+    expires_in: float | None = None
+    payload: Any = None
+
+
+TokenFetcher = Callable[[], Awaitable[TokenGrant | None]]
+RenewalCallback = Callable[[TokenGrant], Awaitable[None] | None]
+
+
+class TokenManager:
+    """Caches an access token and refreshes it at most once at a time.
+
+    Args:
+        fetch: Coroutine function returning a new TokenGrant, or None when the
+            credential cannot be refreshed. Exceptions propagate to every caller
+            waiting on that refresh.
+        on_renewed: Optional callback (sync or async) run after each successful
+            refresh, before waiting callers resume.
+        renew_before: Seconds before expiry at which the token is renewed in the
+            background.
+        expiry_margin: Seconds before expiry after which the token is treated as
+            expired and callers wait for a refresh.
+        idle_timeout: Seconds without a ``get()`` or ``refresh()`` call after
+            which background renewal stops. None renews for as long as the
+            event loop runs.
+        name: Label used in log messages.
+    """
+
+    def __init__(
+        self,
+        fetch: TokenFetcher,
+        *,
+        on_renewed: RenewalCallback | None = None,
+        renew_before: float = 120.0,
+        expiry_margin: float = 60.0,
+        idle_timeout: float | None = 900.0,
+        name: str = "token",
+    ):
+        self._fetch = fetch
+        self._on_renewed = on_renewed
+        self.renew_before = renew_before
+        self.expiry_margin = expiry_margin
+        self.idle_timeout = idle_timeout
+        self.name = name
+        self._value: str | None = None
+        self._expires_at: float | None = None
+        self._flight: asyncio.Task[str | None] | None = None
+        # The renewal waiting for its time, and the one (if any) refreshing right now
+        self._renewal: asyncio.Task[None] | None = None
+        self._renewing: asyncio.Task[None] | None = None
+        self._last_used = time.monotonic()
+
+        self.refresh_count = 0
+        self.refresh_failures = 0
+        self.background_refreshes = 0
+        self.joined_refreshes = 0
+        self.total_refresh_time = 0.0
+        self.last_refresh_time: float | None = None
+
+    @property
+    def value(self) -> str | None:
+        """The current token, without checking its expiry."""
+        return self._value
+
+    def _expired(self) -> bool:
+        return self._expires_at is not None and time.time() >= self._expires_at - self.expiry_margin
+
+    def seed(self, value: str | None, expires_in: float | None = None) -> None:
+        """Set the current token without fetching (e.g. one supplied by the caller)."""
+        self._value = value
+        self._expires_at = time.time() + expires_in if value and expires_in is not None else None
+        self._schedule_renewal()
+
+    async def get(self) -> str | None:
+        """Return a usable token, refreshing only if it is missing or expired."""
+        self._last_used = time.monotonic()
+        if self._value is not None and not self._expired():
+            return self._value
+        return await self.refresh()
+
+    async def refresh(self, stale: str | None = None, fetch: TokenFetcher | None = None) -> str | None:
+        """Refresh the token, joining a refresh that is already running.
+
+        Args:
+            stale: The token the caller found invalid. If the current token is
+                already a different one, it is returned without refreshing.
+            fetch: Fetch function to use if this call starts the refresh.
+
+        Returns:
+            The new token, or None if the credential cannot be refreshed.
+        """
+        self._last_used = time.monotonic()
+        return await self._join_refresh(stale, fetch)
+
+    async def _join_refresh(self, stale: str | None = None, fetch: TokenFetcher | None = None) -> str | None:
+        if stale is not None and self._value is not None and self._value != stale:
+            return self._value
+        if self._flight is None or not _on_running_loop(self._flight):
+            # A refresh started on another (e.g. already closed) event loop can't be awaited here
+            self._flight = asyncio.ensure_future(self._run_refresh(fetch or self._fetch))
+        else:
+            self.joined_refreshes += 1
+        timings = current_timings()
+        if timings is not None:
+            started_at = time.perf_counter()
+        try:
+            # Shielded: a cancelled caller must not cancel the refresh others wait on
+            return await asyncio.shield(self._flight)
+        finally:
+            if timings is not None:
+                timings.add("auth_refresh", started_at, time.perf_counter())
+
+    async def _run_refresh(self, fetch: TokenFetcher) -> str | None:
+        started = time.perf_counter()
+        try:
+            grant = await fetch()
+            if grant is not None:
+                self._value = grant.value
+                self._expires_at = time.time() + grant.expires_in if grant.expires_in is not None else None
+                if self._on_renewed is not None:
+                    result = self._on_renewed(grant)
+                    if inspect.isawaitable(result):
+                        await result
+                self._schedule_renewal()
+            return self._value if grant is not None else None
+        except Exception:
+            self.refresh_failures += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.refresh_count += 1
+            self.total_refresh_time += elapsed
+            self.last_refresh_time = elapsed
+            self._flight = None
+
+    def _schedule_renewal(self) -> None:
+        # A renewal running its refresh has moved to _renewing, so the refresh it
+        # awaits (which calls this) never cancels it
+        renewal, self._renewal = self._renewal, None
+        if renewal is not None and _on_running_loop(renewal):
+            renewal.cancel()
+        if self._expires_at is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Seeded outside an event loop; the first get() after expiry refreshes instead
+            return
+        delay = max(0.0, self._expires_at - self.renew_before - time.time())
+        self._renewal = loop.create_task(self._renew_after(delay))
+
+    async def _renew_after(self, delay: float) -> None:
+        # Scheduled from within some operation; the renewal is not part of it
+        clear_timings()
+        await asyncio.sleep(delay)
+        task = asyncio.current_task()
+        if self._renewal is task:
+            self._renewal = None
+        if self.idle_timeout is not None and time.monotonic() - self._last_used > self.idle_timeout:
+            logger.debug("Not renewing idle %s", self.name)
+            return
+        self._renewing = task
+        self.background_refreshes += 1
+        try:
+            await self._join_refresh()
+        except Exception as e:
+            # The token is still valid until its expiry; a request will retry the refresh then
+            logger.warning("Background %s renewal failed: %s", self.name, e)
+        finally:
+            if self._renewing is task:
+                self._renewing = None
+
+    async def aclose(self) -> None:
+        """Stop background renewal and cancel a refresh in progress."""
+        tasks = [task for task in (self._renewal, self._renewing, self._flight) if task is not None and _on_running_loop(task)]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._renewal = None
+        self._renewing = None
+        self._flight = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get refresh statistics as a dictionary."""
+        return {
+            "refresh_count": self.refresh_count,
+            "refresh_failures": self.refresh_failures,
+            "background_refreshes": self.background_refreshes,
+            "joined_refreshes": self.joined_refreshes,
+            "total_refresh_time": self.total_refresh_time,
+            "avg_refresh_time": self.total_refresh_time / self.refresh_count if self.refresh_count else 0.0,
+            "last_refresh_time": self.last_refresh_time,
+            "expires_in": self._expires_at - time.time() if self._expires_at is not None else None,
+        }
+
+
+def _on_running_loop(task: asyncio.Task[Any]) -> bool:
+    """Whether ``task`` is unfinished and belongs to the running event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return not task.done() and task.get_loop() is loop
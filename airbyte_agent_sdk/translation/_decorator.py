@@ -181,8 +181,9 @@ def translate_exceptions(
             "mcp"`. Defaults to None → auto-detect by attempting each
             framework's canonical import in order. Explicit always wins.
         max_output_chars: Maximum serialized output size (`json.dumps`,
-            `default=str`). Excess raises the framework's signal asking the
-            LLM to narrow the query. Set to `None` or `0` to disable.
+            `default=str`; pydantic models count as their fields' JSON).
+            Excess raises the framework's signal asking the LLM to narrow
+            the query. Set to `None` or `0` to disable.
         internal_retries: How many transient runtime failures (429/5xx,
             network, timeout) to retry silently before surfacing. Default 0.
         should_internal_retry: Optional predicate `(error, args, kwargs) ->
@@ -14,14 +14,20 @@ decorator catches and routes through the active framework strategy. The
 sentinel is module-private and never escapes the public boundary.
 
 Error message wording follows backend `util.py:117-123` (more informative
-than the template variant).
+than the template variant), except that it reports the limit rather than the
+exact size: measuring stops as soon as the limit is passed, so rejecting a
+multi-megabyte result costs no more than measuring `max_chars` characters.
 """
 
 from __future__ import annotations
 
-import json
+import math
+from collections.abc import Iterable, Iterator
+from json.encoder import encode_basestring_ascii
 from typing import Any
 
+from pydantic import BaseModel
+
 
 class _OutputTooLargeSignal(Exception):
     """Internal sentinel raised by `_check_output_size` when output exceeds limit.
@@ -38,13 +44,193 @@ class _OutputTooLargeSignal(Exception):
 
 DEFAULT_MAX_OUTPUT_CHARS = 100_000  # ~100KB default, configurable per-tool
 
+_PREVIEW_CHARS = 500
+
+
+class _LimitExceeded(Exception):
+    """Raised by `_json_size` once a value is known to exceed its budget."""
+
+
+def _float_repr(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == math.inf:
+        return "Infinity"
+    if value == -math.inf:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _key_str(key: Any) -> str:
+    """Dict key as `json.dumps` writes it (before quoting)."""
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return _float_repr(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _model_items(model: BaseModel) -> Iterator[tuple[str, Any]]:
+    """A pydantic model's field values (and extras) without calling `model_dump()`."""
+    for name in type(model).model_fields:
+        yield name, getattr(model, name)
+    if model.__pydantic_extra__:
+        yield from model.__pydantic_extra__.items()
+
+
+def _json_size(value: Any, budget: int, path: set[int]) -> int:
+    """Length of `json.dumps(value, default=str)`, computed without building it.
+
+    Lengths of the pieces `json.dumps` would emit (same separators, escaping,
+    number formatting and `default=str` fallback) are added up depth-first,
+    and `_LimitExceeded` is raised as soon as they pass `budget`, so the work
+    is bounded by the budget rather than by the size of `value`.
+
+    Pydantic models are measured as the JSON object of their fields — what
+    frameworks send to the model — instead of `json.dumps`'s `str(model)`.
+
+    Raises:
+        _LimitExceeded: If the serialized size exceeds `budget`.
+        TypeError: For dict keys `json.dumps` rejects.
+        ValueError: For circular references.
+    """
+    kind = type(value)
+    if kind is str:
+        if len(value) + 2 > budget:  # escaping never shortens a string
+            raise _LimitExceeded
+        size = len(encode_basestring_ascii(value))
+    elif value is None or value is True:
+        size = 4
+    elif value is False:
+        size = 5
+    elif kind is int:
+        size = len(int.__repr__(value))
+    elif kind is float:
+        size = len(_float_repr(value))
+    elif kind is list or kind is tuple or kind is dict or isinstance(value, (list, tuple, dict, BaseModel)):
+        if budget < 2:
+            raise _LimitExceeded
+        if isinstance(value, (list, tuple)):
+            if not value:
+                return 2
+            items: Iterable[Any] = value
+            pairs = False
+        else:
+            if isinstance(value, dict):
+                if not value:
+                    return 2
+                items = value.items()
+            else:
+                items = _model_items(value)
+            pairs = True
+        marker = id(value)
+        if marker in path:
+            raise ValueError("Circular reference detected")
+        path.add(marker)
+        size = 0  # each item adds 2: the brackets for the first, ", " before the rest
+        for item in items:
+            size += 2
+            if pairs:
+                key, item = item
+                if type(key) is not str:
+                    key = _key_str(key)
+                if len(key) + 4 > budget - size:
+                    raise _LimitExceeded
+                size += len(encode_basestring_ascii(key)) + 2  # quoted key and ": "
+            # Common scalars inline; strings only once they can't be huge
+            kind = type(item)
+            if kind is str and len(item) < budget:
+                size += len(encode_basestring_ascii(item))
+            elif kind is int:
+                size += len(int.__repr__(item))
+            elif item is None or item is True:
+                size += 4
+            else:
+                size += _json_size(item, budget - size, path)
+            if size > budget:
+                raise _LimitExceeded
+        path.discard(marker)
+        if size == 0:  # model without fields
+            size = 2
+    elif isinstance(value, str):
+        return _json_size(str.__str__(value), budget, path)
+    elif isinstance(value, int):
+        size = len(int.__repr__(value))
+    elif isinstance(value, float):
+        size = len(_float_repr(value))
+    else:
+        return _json_size(str(value), budget, path)
+    if size > budget:
+        raise _LimitExceeded
+    return size
+
+
+def _iter_json(value: Any) -> Iterator[str]:
+    """Lazily yield the text `_json_size` measures, for the error preview.
+
+    Long strings are cut to the preview length, so consuming the first
+    `_PREVIEW_CHARS` characters costs O(`_PREVIEW_CHARS`).
+    """
+    if isinstance(value, str):
+        yield encode_basestring_ascii(value[:_PREVIEW_CHARS])
+    elif value is None:
+        yield "null"
+    elif value is True:
+        yield "true"
+    elif value is False:
+        yield "false"
+    elif isinstance(value, int):
+        yield int.__repr__(value)
+    elif isinstance(value, float):
+        yield _float_repr(value)
+    elif isinstance(value, (list, tuple)):
+        yield "["
+        for index, item in enumerate(value):
+            if index:
+                yield ", "
+            yield from _iter_json(item)
+        yield "]"
+    elif isinstance(value, (dict, BaseModel)):
+        yield "{"
+        for index, (key, item) in enumerate(value.items() if isinstance(value, dict) else _model_items(value)):
+            if index:
+                yield ", "
+            yield encode_basestring_ascii(_key_str(key)[:_PREVIEW_CHARS])
+            yield ": "
+            yield from _iter_json(item)
+        yield "}"
+    else:
+        yield from _iter_json(str(value))
+
+
+def _preview(value: Any) -> str:
+    chunks: list[str] = []
+    length = 0
+    for chunk in _iter_json(value):
+        chunks.append(chunk)
+        length += len(chunk)
+        if length > _PREVIEW_CHARS:
+            return "".join(chunks)[:_PREVIEW_CHARS] + "..."
+    return "".join(chunks)
+
 
 def _check_output_size(result: Any, max_chars: int | None, tool_name: str) -> Any:
     """Return `result` if it fits within `max_chars`; otherwise raise the sentinel.
 
+    The size is measured incrementally (see `_json_size`) and measuring
+    stops at the limit, so an oversized result costs O(max_chars) to reject.
+
     Args:
-        result: Tool result. May be any JSON-serializable shape (or anything
-            that `json.dumps(..., default=str)` can stringify).
+        result: Tool result. May be any JSON-serializable shape, a pydantic
+            model, or anything that `json.dumps(..., default=str)` can stringify.
         max_chars: Maximum serialized character length. `None` or `<= 0`
             disables size limiting.
         tool_name: Human-readable tool name for the error message.
@@ -61,16 +247,14 @@ def _check_output_size(result: Any, max_chars: int | None, tool_name: str) -> An
         return result
 
     try:
-        serialized = json.dumps(result, default=str)
-    except (TypeError, ValueError):
-        return result  # Can't serialize, let it through
-
-    if len(serialized) > max_chars:
-        truncated_preview = serialized[:500] + "..." if len(serialized) > 500 else serialized
+        _json_size(result, max_chars, set())
+    except _LimitExceeded:
         raise _OutputTooLargeSignal(
-            f"Tool '{tool_name}' output too large ({len(serialized):,} chars, limit {max_chars:,}). "
+            f"Tool '{tool_name}' output too large (over the {max_chars:,} char limit). "
             f"Please narrow your query by: adding filters via 'params', reducing the 'limit', "
-            f"or (for search actions only) passing a 'fields' list for server-side projection. Preview: {truncated_preview}"
-        )
+            f"or (for search actions only) passing a 'fields' list for server-side projection. Preview: {_preview(result)}"
+        ) from None
+    except (TypeError, ValueError, RecursionError):
+        return result  # Can't serialize, let it through
 
     return result
@@ -12,7 +12,7 @@ from airbyte_agent_sdk.constants import OPENAPI_DEFAULT_VERSION
 from airbyte_agent_sdk.extensions import AIRBYTE_FILE_URL_DESCRIPTION
 from airbyte_agent_sdk.schema.base import ResponseErrorCheck
 from airbyte_agent_sdk.schema.components import PathOverrideConfig
-from airbyte_agent_sdk.schema.extensions import EntityRelationshipConfig, RetryConfig, ScopingParamConfig
+from airbyte_agent_sdk.schema.extensions import EntityRelationshipConfig, PaginationConfig, RateLimitConfig, RetryConfig, ScopingParamConfig
 from airbyte_agent_sdk.schema.security import AuthConfigSpec
 
 
@@ -327,6 +327,12 @@ class EndpointDefinition(BaseModel):
         ),
     )
 
+    # Pagination strategy (Airbyte extension)
+    pagination: PaginationConfig | None = Field(
+        None,
+        description="Page-following strategy from x-airbyte-pagination. When None, the executor infers one from meta_extractor.",
+    )
+
     # Health check support (Airbyte extension)
     preferred_for_check: bool = Field(
         False,
@@ -358,6 +364,10 @@ class EntityDefinition(BaseModel):
         default=None,
         description="Airbyte stream name for cache lookup (from x-airbyte-stream-name schema extension)",
     )
+    cache_ttl: int | None = Field(
+        default=None,
+        description="Seconds read responses may be served from the response cache (from x-airbyte-cache-ttl schema extension)",
+    )
     actions: list[Action]
     endpoints: dict[Action, EndpointDefinition]
     entity_schema: dict[str, Any] | None = Field(default=None, alias="schema")
@@ -384,6 +394,7 @@ class ConnectorModel(BaseModel):
     entities: list[EntityDefinition]
     openapi_spec: Any | None = None  # Optional reference to OpenAPIConnector
     retry_config: RetryConfig | None = None  # Optional retry configuration
+    rate_limit: RateLimitConfig | None = None  # Optional client-side request quota
     search_field_paths: dict[str, list[str]] | None = None
     example_questions: Any | None = None  # ExampleQuestions from x-airbyte-example-questions
     scoping: list[ScopingParamConfig] = Field(
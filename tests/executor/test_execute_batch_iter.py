@@ -0,0 +1,108 @@
+"""Tests for LocalExecutor.execute_batch_iter failure isolation, laziness and cancellation."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from airbyte_agent_sdk.connectors.stripe.connector_model import StripeConnectorModel
+from airbyte_agent_sdk.executor import LocalExecutor
+
+
+class _CustomersApi:
+    """Customer lookups whose id picks the response: ``missing`` 404s, ``revoked`` 401s, ``slow`` hangs."""
+
+    def __init__(self) -> None:
+        self.requested: list[str] = []
+        self.cancelled: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        customer_id = request.url.path.rsplit("/", 1)[-1]
+        self.requested.append(customer_id)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(10 if customer_id.startswith("slow") else 0.01)
+        except asyncio.CancelledError:
+            self.cancelled.append(customer_id)
+            raise
+        finally:
+            self.in_flight -= 1
+        if customer_id == "missing":
+            return httpx.Response(404, json={"error": {"message": "No such customer"}})
+        if customer_id == "revoked":
+            return httpx.Response(401, json={"error": {"message": "Invalid API key"}})
+        return httpx.Response(200, json={"id": customer_id, "object": "customer"})
+
+
+def _executor(api: _CustomersApi) -> LocalExecutor:
+    executor = LocalExecutor(model=StripeConnectorModel, secrets={"api_key": "sk_test"})
+    executor.http_client.client._client = httpx.AsyncClient(transport=httpx.MockTransport(api))
+    return executor
+
+
+def _gets(*customer_ids: str) -> list[tuple[str, str, dict]]:
+    return [("customers", "get", {"id": customer_id}) for customer_id in customer_ids]
+
+
+@pytest.mark.asyncio
+async def test_failed_operation_yields_one_failed_result_while_the_rest_complete():
+    api = _CustomersApi()
+
+    results = dict([item async for item in _executor(api).execute_batch_iter(_gets("cus_1", "missing", "cus_3"))])
+
+    assert sorted(results) == [0, 1, 2]
+    assert not results[1].success and results[1].error
+    assert results[0].success and results[0].data["id"] == "cus_1"
+    assert results[2].success and results[2].data["id"] == "cus_3"
+
+
+@pytest.mark.asyncio
+async def test_auth_error_fails_the_unfinished_operations():
+    api = _CustomersApi()
+    operations = _gets("slow", "revoked", "cus_3", "cus_4")
+
+    results = dict([item async for item in _executor(api).execute_batch_iter(operations, max_concurrency=2, cancel_on_auth_error=True)])
+
+    assert sorted(results) == [0, 1, 2, 3]
+    assert not any(result.success for result in results.values())
+    for index in (0, 2, 3):
+        assert results[index].error.startswith("Cancelled after authentication failure")
+    assert api.cancelled == ["slow"]
+    assert "cus_3" not in api.requested and "cus_4" not in api.requested
+
+
+@pytest.mark.asyncio
+async def test_generator_input_is_consumed_lazily():
+    api = _CustomersApi()
+    pulled: list[int] = []
+
+    def operations():
+        for i in range(10):
+            pulled.append(i)
+            yield ("customers", "get", {"id": f"cus_{i}"})
+
+    received = 0
+    async for _, result in _executor(api).execute_batch_iter(operations(), max_concurrency=2):
+        assert result.success
+        # Nothing past the running operations and this result has been taken
+        assert len(pulled) <= received + 2
+        received += 1
+
+    assert received == 10
+    assert api.peak_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_closing_the_iterator_early_cancels_running_operations():
+    api = _CustomersApi()
+    batch = _executor(api).execute_batch_iter(_gets("slow_1", "cus_2", "slow_3", "slow_4"))
+
+    index, result = await batch.__anext__()
+    await batch.aclose()
+
+    assert index == 1 and result.success
+    assert sorted(api.cancelled) == ["slow_1", "slow_3", "slow_4"]
+    assert api.in_flight == 0
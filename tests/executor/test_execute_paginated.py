@@ -0,0 +1,73 @@
+"""Tests for LocalExecutor.execute_paginated page following."""
+
+import copy
+
+import httpx
+import pytest
+
+from airbyte_agent_sdk.connectors.stripe.connector_model import StripeConnectorModel
+from airbyte_agent_sdk.executor import LocalExecutor
+from airbyte_agent_sdk.schema import PaginationConfig
+from airbyte_agent_sdk.types import Action
+
+TOTAL_RECORDS = 47
+SERVER_PAGE_CAP = 10
+
+
+class _OffsetApi(httpx.AsyncBaseTransport):
+    """Offset-paginated list that caps page size like most real APIs."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict[str, str]] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(dict(request.url.params))
+        offset = int(request.url.params.get("offset", "0"))
+        limit = min(int(request.url.params.get("limit", str(SERVER_PAGE_CAP))), SERVER_PAGE_CAP)
+        rows = [{"id": str(i), "keep": i % 3 != 0} for i in range(offset, min(offset + limit, TOTAL_RECORDS))]
+        return httpx.Response(200, json={"data": rows, "has_more": offset + limit < TOTAL_RECORDS})
+
+
+def _executor(api: _OffsetApi, record_filter: str | None = None) -> LocalExecutor:
+    model = copy.deepcopy(StripeConnectorModel)
+    endpoint = next(e for e in model.entities if e.name == "customers").endpoints[Action.LIST]
+    endpoint.pagination = PaginationConfig(strategy="offset", param="offset", has_more_field="has_more", limit_param="limit")
+    endpoint.query_params.append("offset")
+    endpoint.record_filter = record_filter
+    executor = LocalExecutor(model=model, secrets={"api_key": "sk_test"})
+    executor.http_client.client._client = httpx.AsyncClient(transport=api)
+    return executor
+
+
+async def _ids(executor: LocalExecutor, params: dict, **kwargs) -> list[int]:
+    return [int(record["id"]) async for record in executor.iter_records("customers", params, **kwargs)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+async def test_offset_advances_by_unfiltered_page_size(prefetch):
+    api = _OffsetApi()
+    ids = await _ids(_executor(api, "{{ record.keep }}"), {"limit": 100}, prefetch=prefetch)
+
+    assert ids == [i for i in range(TOTAL_RECORDS) if i % 3 != 0]
+    offsets = [int(r.get("offset", "0")) for r in api.requests]
+    assert offsets[:5] == [0, 10, 20, 30, 40]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+async def test_max_records_with_filter_and_prefetch(prefetch):
+    api = _OffsetApi()
+    ids = await _ids(_executor(api, "{{ record.keep }}"), {"limit": 100}, prefetch=prefetch, max_records=12)
+
+    assert ids == [i for i in range(TOTAL_RECORDS) if i % 3 != 0][:12]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+async def test_prefetched_pages_request_only_the_records_still_needed(prefetch):
+    api = _OffsetApi()
+    ids = await _ids(_executor(api), {"limit": 8}, prefetch=prefetch, max_records=20)
+
+    assert ids == list(range(20))
+    assert [(r.get("offset"), r["limit"]) for r in api.requests] == [(None, "8"), ("8", "8"), ("16", "4")]
@@ -0,0 +1,157 @@
+"""Tests for pagination strategy inference and next-page computation."""
+
+import httpx
+import pytest
+
+from airbyte_agent_sdk.connectors.airtable.connector_model import AirtableConnectorModel
+from airbyte_agent_sdk.connectors.facebook_marketing.connector_model import FacebookMarketingConnectorModel
+from airbyte_agent_sdk.connectors.jira.connector_model import JiraConnectorModel
+from airbyte_agent_sdk.connectors.paypal_transaction.connector_model import PaypalTransactionConnectorModel
+from airbyte_agent_sdk.connectors.stripe.connector_model import StripeConnectorModel
+from airbyte_agent_sdk.connectors.zoho_crm.connector_model import ZohoCrmConnectorModel
+from airbyte_agent_sdk.executor import LocalExecutor
+from airbyte_agent_sdk.executor.pagination import PageRequest, next_page_request, resolve_pagination
+from airbyte_agent_sdk.types import Action, ConnectorModel
+
+BASE_URL = "https://api.example.com"
+
+
+def _list_endpoint(model: ConnectorModel, entity: str, action: Action = Action.LIST):
+    return next(e for e in model.entities if e.name == entity).endpoints[action]
+
+
+@pytest.mark.parametrize("entity", ["contacts", "deals", "leads"])
+def test_zoho_crm_current_page_field_is_not_a_cursor(entity):
+    # Zoho reports the current page in $.info.page next to a more_records flag
+    config = resolve_pagination(_list_endpoint(ZohoCrmConnectorModel, entity))
+
+    assert config is not None
+    assert config.strategy == "page_number"
+    assert config.param == "page"
+    assert config.has_more_field == "more_records"
+
+
+def test_zoho_crm_pages_advance_until_more_records_is_false():
+    config = resolve_pagination(_list_endpoint(ZohoCrmConnectorModel, "contacts"))
+    records = [{"id": "1"}]
+
+    first = PageRequest(params={"per_page": 1})
+    second = next_page_request(config, first, records, {"page": 1, "more_records": True}, BASE_URL)
+    assert second is not None
+    assert second.params["page"] == 2
+    assert second.key() != first.key()
+
+    third = next_page_request(config, second, records, {"page": 2, "more_records": True}, BASE_URL)
+    assert third is not None
+    assert third.params["page"] == 3
+
+    assert next_page_request(config, third, records, {"page": 3, "more_records": False}, BASE_URL) is None
+
+
+@pytest.mark.parametrize("entity", ["customers", "products", "payment_intents"])
+def test_stripe_search_string_page_param_is_a_cursor(entity):
+    # Stripe's search `page` param is an opaque token taken from $.next_page
+    config = resolve_pagination(_list_endpoint(StripeConnectorModel, entity, Action.API_SEARCH))
+
+    assert config is not None
+    assert config.strategy == "cursor"
+    assert config.param == "page"
+    assert config.next_field == "next_page"
+    assert config.has_more_field == "has_more"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [0, 2])
+async def test_stripe_search_sends_next_page_tokens(prefetch):
+    tokens = {None: "tok_2", "tok_2": "tok_3", "tok_3": None}
+    requests: list[str | None] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = request.url.params.get("page")
+        requests.append(page)
+        if page not in tokens:
+            return httpx.Response(400, json={"error": {"message": f"Invalid page: {page}"}})
+        next_page = tokens[page]
+        return httpx.Response(200, json={"data": [{"id": f"cus_{page}"}], "has_more": next_page is not None, "next_page": next_page})
+
+    executor = LocalExecutor(model=StripeConnectorModel, secrets={"api_key": "sk_test"})
+    executor.http_client.client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ids = [r["id"] async for r in executor.iter_records("customers", {"query": "email:'a@b.c'"}, action="api_search", prefetch=prefetch)]
+
+    assert ids == ["cus_None", "cus_tok_2", "cus_tok_3"]
+    assert requests == [None, "tok_2", "tok_3"]
+
+
+def test_jira_offset_echo_is_not_a_cursor():
+    # Jira reads next_offset from $.startAt, the offset of the page just returned
+    config = resolve_pagination(_list_endpoint(JiraConnectorModel, "issue_comments"))
+
+    assert config is not None
+    assert config.strategy == "offset"
+    assert config.param == "startAt"
+    assert config.total_records_field == "total"
+    assert config.limit_param == "maxResults"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("entity, records_key", [("issue_comments", "comments"), ("issue_worklogs", "worklogs")])
+async def test_jira_pages_advance_by_offset_until_total(entity, records_key):
+    requests: list[dict[str, str]] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        start, size = int(request.url.params.get("startAt", "0")), int(request.url.params["maxResults"])
+        rows = [{"id": str(i)} for i in range(start, min(start + size, 5))]
+        return httpx.Response(200, json={"startAt": start, "maxResults": size, "total": 5, records_key: rows})
+
+    executor = LocalExecutor(model=JiraConnectorModel, secrets={"username": "u", "password": "p"}, config_values={"subdomain": "x"})
+    executor.http_client.client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ids = [r["id"] async for r in executor.iter_records(entity, {"issueIdOrKey": "PROJ-1", "maxResults": 2})]
+
+    assert ids == ["0", "1", "2", "3", "4"]
+    assert [r.get("startAt") for r in requests] == [None, "2", "4"]
+
+
+def test_paypal_transactions_page_field_is_not_a_cursor():
+    # PayPal echoes the requested page in $.page and reports total_pages
+    config = resolve_pagination(_list_endpoint(PaypalTransactionConnectorModel, "transactions"))
+
+    assert config is not None
+    assert config.strategy == "page_number"
+    assert config.param == "page"
+    assert config.total_pages_field == "total_pages"
+
+
+def test_paypal_transactions_stop_after_total_pages():
+    config = resolve_pagination(_list_endpoint(PaypalTransactionConnectorModel, "transactions"))
+    records = [{"transaction_info": {}}]
+
+    first = PageRequest(params={"start_date": "2024-01-01T00:00:00Z"})
+    second = next_page_request(config, first, records, {"page": 1, "total_pages": 2}, BASE_URL)
+    assert second is not None
+    assert second.params["page"] == 2
+
+    assert next_page_request(config, second, records, {"page": 2, "total_pages": 2}, BASE_URL) is None
+
+
+def test_cursor_named_by_jsonpath_is_still_a_cursor():
+    # Facebook's cursor field is "after", read from $.paging.cursors.after
+    config = resolve_pagination(_list_endpoint(FacebookMarketingConnectorModel, "campaigns"))
+
+    assert config is not None
+    assert config.strategy == "cursor"
+    assert config.param == "after"
+    assert config.next_field == "after"
+
+
+def test_airtable_declares_its_offset_cursor():
+    config = resolve_pagination(_list_endpoint(AirtableConnectorModel, "records"))
+
+    assert config is not None
+    assert config.strategy == "cursor"
+    assert config.param == "offset"
+    assert config.next_field == "offset"
+
+    next_request = next_page_request(config, PageRequest(params={}), [{"id": "rec1"}], {"offset": "itr1/rec1"}, BASE_URL)
+    assert next_request is not None
+    assert next_request.params["offset"] == "itr1/rec1"
@@ -0,0 +1,109 @@
+"""Tests for ParentRecordCache single-flight fetches, expiry and cycle detection."""
+
+import asyncio
+
+import pytest
+
+from airbyte_agent_sdk.executor.parent_cache import CircularParentError, ParentRecordCache
+
+PROJECTS = ("projects", "{}")
+ISSUES = ("issues", "{}")
+
+
+def _counting_fetch(*outcomes, delay: float = 0.01):
+    """Fetch returning (or raising) ``outcomes`` in order, then one project record."""
+    calls: list[int] = []
+
+    async def fetch() -> list[dict]:
+        calls.append(len(calls))
+        await asyncio.sleep(delay)
+        if len(calls) <= len(outcomes):
+            outcome = outcomes[len(calls) - 1]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return [{"id": "10000", "tags": ["a"]}]
+
+    return fetch, calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_fetch():
+    cache = ParentRecordCache()
+    fetch, calls = _counting_fetch()
+
+    results = await asyncio.gather(*(cache.get(PROJECTS, fetch) for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(records == [{"id": "10000", "tags": ["a"]}] for records in results)
+    assert cache.get_stats() == {"hits": 0, "misses": 1, "joined": 4, "fetch_failures": 0, "entries": 1, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_callers_get_their_own_copy_of_the_records():
+    cache = ParentRecordCache()
+    fetch, _ = _counting_fetch()
+
+    first, second = await asyncio.gather(cache.get(PROJECTS, fetch), cache.get(PROJECTS, fetch))
+    first.clear()
+    second[0]["tags"].append("b")
+
+    assert await cache.get(PROJECTS, fetch) == [{"id": "10000", "tags": ["a"]}]
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached():
+    cache = ParentRecordCache()
+    fetch, calls = _counting_fetch(RuntimeError("upstream unavailable"))
+
+    results = await asyncio.gather(cache.get(PROJECTS, fetch), cache.get(PROJECTS, fetch), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    assert await cache.get(PROJECTS, fetch) == [{"id": "10000", "tags": ["a"]}]
+    assert len(calls) == 2
+    assert cache.fetch_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_the_ttl():
+    cache = ParentRecordCache(ttl=0.05)
+    fetch, calls = _counting_fetch(delay=0)
+
+    await cache.get(PROJECTS, fetch)
+    await cache.get(PROJECTS, fetch)
+    assert len(calls) == 1
+
+    await asyncio.sleep(0.06)
+    await cache.get(PROJECTS, fetch)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_only_shares_the_in_flight_fetch():
+    cache = ParentRecordCache(ttl=0)
+    fetch, calls = _counting_fetch()
+
+    await asyncio.gather(cache.get(PROJECTS, fetch), cache.get(PROJECTS, fetch))
+    await cache.get(PROJECTS, fetch)
+
+    assert len(calls) == 2
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_waiting_on_itself_raises_instead_of_deadlocking():
+    cache = ParentRecordCache()
+
+    async def fetch_projects() -> list[dict]:
+        return await cache.get(ISSUES, fetch_issues, waiter=PROJECTS)
+
+    async def fetch_issues() -> list[dict]:
+        return await cache.get(PROJECTS, fetch_projects, waiter=ISSUES)
+
+    with pytest.raises(CircularParentError, match="projects"):
+        await asyncio.wait_for(cache.get(PROJECTS, fetch_projects), 1)
+    with pytest.raises(CircularParentError):
+        await cache.get(PROJECTS, fetch_projects, waiter=PROJECTS)
+    assert cache.get_stats()["entries"] == 0
+    assert cache.get_stats()["in_flight"] == 0
@@ -0,0 +1,164 @@
+"""Tests for the executor response caches."""
+
+import pickle
+import sqlite3
+import threading
+
+import httpx
+import pytest
+
+from airbyte_agent_sdk.connectors.stripe.connector_model import StripeConnectorModel
+from airbyte_agent_sdk.executor import InMemoryResponseCache, LocalExecutor, SQLiteResponseCache
+
+
+_unpickled = []
+
+
+def _record_unpickling() -> None:
+    _unpickled.append(True)
+
+
+def _table_usage(path) -> tuple[int, int]:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache").fetchone()
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    cache = SQLiteResponseCache(tmp_path / "cache.db", max_bytes=2_000)
+    yield cache
+    cache.close()
+
+
+@pytest.mark.parametrize("make_cache", [InMemoryResponseCache, lambda: SQLiteResponseCache(":memory:")])
+def test_values_round_trip_as_json_copies(make_cache):
+    cache = make_cache()
+    value = ({"id": "cus_1", "tags": ["a"]}, {"has_more": False})
+    cache.set("k", "scope", value, ttl=60)
+
+    first, second = cache.get("k"), cache.get("k")
+    data, meta = first
+    assert data == {"id": "cus_1", "tags": ["a"]}
+    assert meta == {"has_more": False}
+    assert first is not second
+
+
+def test_non_json_values_are_not_cached(sqlite_cache):
+    sqlite_cache.set("k", "scope", ({"at": object()}, None), ttl=60)
+
+    assert sqlite_cache.get("k") is None
+
+
+def test_pickled_entries_are_never_loaded(sqlite_cache):
+    class Exploit:
+        def __reduce__(self):
+            return (_record_unpickling, ())
+
+    payload = pickle.dumps(Exploit())
+    sqlite_cache._conn.execute(
+        "INSERT INTO response_cache (key, scope, expires_at, last_access, size, payload) VALUES ('k', 's', 1e12, 0, ?, ?)",
+        (len(payload), payload),
+    )
+
+    assert sqlite_cache.get("k") is None
+    assert not _unpickled
+    assert sqlite_cache.get_stats()["entries"] == 0
+
+
+def test_running_size_matches_table_across_writes_and_evictions(sqlite_cache):
+    for i in range(50):
+        sqlite_cache.set(f"k{i % 20}", f"s{i % 3}", {"i": i, "pad": "x" * (i * 3)}, ttl=60)
+        stats = sqlite_cache.get_stats()
+        assert (stats["entries"], stats["size_bytes"]) == _table_usage(sqlite_cache.path)
+        assert stats["size_bytes"] <= sqlite_cache.max_bytes
+
+    assert sqlite_cache.get_stats()["evictions"] > 0
+    sqlite_cache.invalidate("s1")
+    stats = sqlite_cache.get_stats()
+    assert (stats["entries"], stats["size_bytes"]) == _table_usage(sqlite_cache.path)
+
+
+def test_size_is_shared_between_processes_using_the_same_file(tmp_path):
+    path = tmp_path / "cache.db"
+    writer, reader = SQLiteResponseCache(path), SQLiteResponseCache(path)
+    try:
+        writer.set("k", "scope", {"id": 1}, ttl=60)
+        assert reader.get_stats()["entries"] == 1
+        assert reader.get("k") == {"id": 1}
+        reader.invalidate("scope")
+        assert writer.get_stats()["size_bytes"] == 0
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_existing_file_without_usage_table_is_counted_once(tmp_path):
+    path = tmp_path / "cache.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE response_cache (key TEXT PRIMARY KEY, scope TEXT NOT NULL, expires_at REAL NOT NULL, "
+            "last_access REAL NOT NULL, size INTEGER NOT NULL, payload BLOB NOT NULL)"
+        )
+        conn.execute("INSERT INTO response_cache VALUES ('old', 's', 1e12, 0, 7, '{\"a\":1}')")
+
+    cache = SQLiteResponseCache(path)
+    try:
+        assert cache.get_stats()["entries"] == 1
+        assert cache.get_stats()["size_bytes"] == 7
+        assert cache.get("old") == {"a": 1}
+    finally:
+        cache.close()
+
+
+@pytest.mark.asyncio
+async def test_async_methods_run_off_the_event_loop_thread(sqlite_cache):
+    loop_thread = threading.get_ident()
+    threads = []
+    original = sqlite_cache._get_payload
+
+    def recording_get_payload(key):
+        threads.append(threading.get_ident())
+        return original(key)
+
+    sqlite_cache._get_payload = recording_get_payload
+
+    await sqlite_cache.aset("k", "scope", [{"id": 1}, None], ttl=60)
+    assert await sqlite_cache.aget("k") == [{"id": 1}, None]
+    assert await sqlite_cache.ainvalidate("scope") == 1
+    assert threads and loop_thread not in threads
+
+
+def _counting_stripe_executor(requests: list[str]) -> LocalExecutor:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(f"{request.method} {request.url.path}")
+        if request.method == "GET":
+            return httpx.Response(200, json={"data": [{"id": "cus_1"}], "has_more": False})
+        return httpx.Response(200, json={"id": "cus_2", "deleted": request.method == "DELETE"})
+
+    executor = LocalExecutor(model=StripeConnectorModel, secrets={"api_key": "sk_test"}, response_cache=InMemoryResponseCache(default_ttl=60))
+    executor.http_client.client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return executor
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda executor: executor.execute("customers", action="create", params={"email": "a@example.com"}),
+        lambda executor: executor.execute_batch([("customers", "create", {"email": "a@example.com"})]),
+        lambda executor: executor._execute_operation("customers", "update", {"id": "cus_1", "name": "A"}),
+        lambda executor: executor._execute_operation("customers", "delete", {"id": "cus_1"}),
+    ],
+    ids=["execute", "execute_batch", "execute_operation_update", "execute_operation_delete"],
+)
+async def test_mutations_from_every_entry_point_invalidate_cached_reads(mutate):
+    requests: list[str] = []
+    executor = _counting_stripe_executor(requests)
+
+    await executor.execute("customers", action="list", params={"limit": 1})
+    await executor.execute("customers", action="list", params={"limit": 1})
+    assert requests.count("GET /v1/customers") == 1
+
+    await mutate(executor)
+    await executor.execute("customers", action="list", params={"limit": 1})
+    assert requests.count("GET /v1/customers") == 2
@@ -0,0 +1,80 @@
+"""Tests for AirbyteCloudClient connector execution retries."""
+
+import httpx
+import pytest
+
+from airbyte_agent_sdk.cloud_utils import AirbyteCloudClient
+from airbyte_agent_sdk.http.exceptions import HTTPStatusError, RateLimitError
+from airbyte_agent_sdk.schema.extensions import RetryConfig
+
+
+def _client(*outcomes):
+    """Client whose execute endpoint returns or raises ``outcomes`` in order, then succeeds."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) <= len(outcomes):
+            outcome = outcomes[len(requests) - 1]
+            if isinstance(outcome, type) and issubclass(outcome, Exception):
+                raise outcome("failed", request=request)
+            return outcome
+        return httpx.Response(200, json={"result": "ok"})
+
+    client = AirbyteCloudClient("client-id", "client-secret", retry_config=RetryConfig(initial_delay_seconds=0.0, jitter=False))
+    client.token_manager.seed("token")
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, requests
+
+
+async def _execute(client: AirbyteCloudClient, action: str):
+    return await client.execute_connector("connector-1", "customers", action, {"email": "a@example.com"})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [httpx.ReadTimeout, httpx.ReadError])
+async def test_reads_are_retried_after_timeouts_and_network_errors(error):
+    client, requests = _client(error)
+
+    assert await _execute(client, "list") == {"result": "ok"}
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [httpx.ReadTimeout, httpx.ReadError])
+async def test_writes_are_not_resent_after_they_may_have_been_processed(error):
+    client, requests = _client(error)
+
+    with pytest.raises(error):
+        await _execute(client, "create")
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_are_not_resent_after_a_server_error():
+    client, requests = _client(httpx.Response(500), httpx.Response(503))
+
+    with pytest.raises(HTTPStatusError):
+        await _execute(client, "update")
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "outcome",
+    [httpx.ConnectError, httpx.ConnectTimeout, httpx.Response(429), httpx.Response(503, headers={"Retry-After": "0"})],
+)
+async def test_writes_are_retried_when_the_server_did_not_process_them(outcome):
+    client, requests = _client(outcome)
+
+    assert await _execute(client, "create") == {"result": "ok"}
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_write_retries_still_stop_after_max_attempts():
+    client, requests = _client(*[httpx.Response(429)] * 5)
+
+    with pytest.raises(RateLimitError):
+        await _execute(client, "delete")
+    assert len(requests) == 3
@@ -0,0 +1,119 @@
+"""Tests for AdaptiveConcurrencyLimiter slot hand-off and AIMD adjustments."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from airbyte_agent_sdk.concurrency_limiter import AdaptiveConcurrencyLimiter
+from airbyte_agent_sdk.connectors.stripe.connector_model import StripeConnectorModel
+from airbyte_agent_sdk.executor import LocalExecutor
+
+
+@pytest.mark.asyncio
+async def test_slot_granted_to_a_cancelled_waiter_is_passed_on():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    started_at = await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 2
+
+    # Hand the slot to the first waiter, then cancel it before it resumes
+    limiter.release(started_at, ok=True)
+    first.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await asyncio.wait_for(second, 1)
+    assert limiter.in_flight == 1
+    assert limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_waiter_leaves_the_queue():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    started_at = await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release(started_at, ok=True)
+
+    assert limiter.queue_depth == 0
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_only_while_the_window_is_full_and_stops_at_max_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+
+    # A single request at a time never fills the window
+    for _ in range(10):
+        limiter.release(await limiter.acquire(), ok=True)
+    assert limiter.limit == 2
+
+    for _ in range(20):
+        slots = [await limiter.acquire() for _ in range(limiter.limit)]
+        for started_at in slots:
+            limiter.release(started_at, ok=True)
+
+    assert limiter.limit == 3
+    assert limiter.increases == 1
+
+
+@pytest.mark.asyncio
+async def test_limit_backs_off_once_per_window_and_not_below_min_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2)
+    slots = [await limiter.acquire() for _ in range(8)]
+
+    # Every request in the window was sent before the first decrease
+    for started_at in slots:
+        limiter.release(started_at, ok=False, overloaded=True)
+    assert limiter.limit == 4
+    assert limiter.decreases == 1
+
+    for _ in range(2):
+        limiter.release(await limiter.acquire(), ok=False, overloaded=True)
+    assert limiter.limit == 2
+    assert limiter.decreases == 3
+
+
+@pytest.mark.asyncio
+async def test_shared_limiter_is_not_capped_by_a_client():
+    limiter = AdaptiveConcurrencyLimiter()
+    executors = [
+        LocalExecutor(
+            model=StripeConnectorModel,
+            secrets={"api_key": "sk_test"},
+            concurrency_limiter=limiter,
+            max_connections=n,
+            max_keepalive_connections=n,
+        )
+        for n in (2, 50)
+    ]
+    assert limiter.max_limit is None
+
+    # The first client never has more than its own max_connections in flight
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"data": []})
+
+    http_client = executors[0].http_client
+    http_client.client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    start = time.monotonic()
+    await asyncio.gather(*(http_client.request("GET", "/v1/customers") for _ in range(6)))
+
+    assert peak == 2
+    assert time.monotonic() - start >= 0.03
+    assert limiter.in_flight == 0
@@ -0,0 +1,55 @@
+"""Tests for coalescing of concurrent identical GET requests."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from airbyte_agent_sdk.connectors.stripe.connector_model import StripeConnectorModel
+from airbyte_agent_sdk.executor import LocalExecutor
+
+
+def _http_client(requests: list[str]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "cus_1", "metadata": {"tier": "gold"}})
+
+    executor = LocalExecutor(model=StripeConnectorModel, secrets={"api_key": "sk_test"}, coalesce_reads=True)
+    executor.http_client.client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return executor.http_client
+
+
+@pytest.mark.asyncio
+async def test_callers_get_independent_copies_even_if_one_mutates_first():
+    requests: list[str] = []
+    http_client = _http_client(requests)
+
+    async def mutate():
+        data, _ = await http_client.request("GET", "/v1/customers/cus_1")
+        data["metadata"]["tier"] = "mutated"
+        return data
+
+    async def read():
+        data, _ = await http_client.request("GET", "/v1/customers/cus_1")
+        return data
+
+    # The first caller starts the flight and resumes first
+    mutated, *others = await asyncio.gather(mutate(), read(), read())
+
+    assert len(requests) == 1
+    assert mutated["metadata"]["tier"] == "mutated"
+    assert [data["metadata"]["tier"] for data in others] == ["gold", "gold"]
+    assert others[0] is not others[1]
+
+
+@pytest.mark.asyncio
+async def test_uncontended_request_is_not_copied():
+    requests: list[str] = []
+    http_client = _http_client(requests)
+
+    first, _ = await http_client.request("GET", "/v1/customers/cus_1")
+    second, _ = await http_client.request("GET", "/v1/customers/cus_1")
+
+    assert len(requests) == 2
+    assert first is not second
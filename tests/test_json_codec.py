@@ -0,0 +1,36 @@
+"""Tests for response-body JSON decoding."""
+
+import tracemalloc
+
+import pytest
+
+from airbyte_agent_sdk.http import json_codec
+from airbyte_agent_sdk.http.json_codec import _SCAN_STEP, _SCAN_WINDOW, _may_contain_wide_integer, loads_json
+
+
+@pytest.mark.parametrize("offset", [0, _SCAN_STEP - 10, _SCAN_STEP - 1, _SCAN_WINDOW - 20, _SCAN_WINDOW - 10, 3 * _SCAN_STEP + 5])
+def test_wide_integer_found_at_any_offset(offset):
+    body = b" " * offset + b"1" * 20 + b" " * _SCAN_WINDOW
+
+    assert _may_contain_wide_integer(body)
+    assert not _may_contain_wide_integer(body.replace(b"1" * 20, b"1" * 19))
+
+
+def test_scan_does_not_copy_the_body():
+    body = b"[" + b"123456789," * 500_000 + b"0]"
+
+    tracemalloc.start()
+    try:
+        assert not _may_contain_wide_integer(body)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 4 * _SCAN_WINDOW
+
+
+def test_wide_integers_stay_exact(monkeypatch):
+    # Whatever backend is installed, 2**64 must not come back as a float
+    monkeypatch.setattr(json_codec, "_fast_loads", lambda content: {"id": float(2**64)})
+
+    assert loads_json(b'{"id": 18446744073709551616}') == {"id": 2**64}
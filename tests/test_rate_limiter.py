@@ -0,0 +1,22 @@
+"""Tests for connector rate-limit declarations and header feedback."""
+
+import time
+
+from airbyte_agent_sdk.connectors.hubspot.connector_model import HubspotConnectorModel
+from airbyte_agent_sdk.connectors.stripe.connector_model import StripeConnectorModel
+from airbyte_agent_sdk.rate_limiter import RateLimiter
+
+
+def test_stripe_quota_fits_test_mode_keys():
+    rate_limit = StripeConnectorModel.rate_limit
+
+    assert rate_limit is not None
+    assert rate_limit.requests / rate_limit.period_seconds <= 25
+
+
+def test_hubspot_exhausted_window_pauses_for_the_reported_interval():
+    limiter = RateLimiter(HubspotConnectorModel.rate_limit)
+
+    limiter.observe({"X-HubSpot-RateLimit-Remaining": "0", "X-HubSpot-RateLimit-Interval-Milliseconds": "2000"})
+
+    assert 1.9 < limiter._paused_until - time.monotonic() <= 2.0
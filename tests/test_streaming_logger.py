@@ -0,0 +1,78 @@
+"""Tests for StreamingRequestLogger body caps, dropping and rotation."""
+
+import json
+import threading
+
+from airbyte_agent_sdk.logging import StreamingRequestLogger
+
+
+def _lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _log(logger: StreamingRequestLogger, response_body, request_body=None) -> None:
+    request_id = logger.log_request("POST", "https://api.example.com/v1/items", "/v1/items", body=request_body)
+    logger.log_response(request_id, 200, response_body)
+
+
+def test_oversized_json_bodies_are_replaced_before_queueing(tmp_path):
+    logger = StreamingRequestLogger(str(tmp_path / "log.ndjson"), max_body_bytes=1_000)
+    small = {"data": [{"id": "1"}]}
+    large = {"data": [{"id": str(i), "name": "x" * 50} for i in range(1_000)]}
+
+    _log(logger, small)
+    _log(logger, large, request_body=[{"name": "y" * 2_000}])
+    _log(logger, "z" * 2_000)
+    logger.close()
+
+    requests = [line for line in _lines(tmp_path / "log.ndjson") if line["type"] == "request"]
+    assert requests[0]["response_body"] == small
+    assert requests[1]["response_body"] == {"_omitted": True, "_size_exceeds": 1_000}
+    assert requests[1]["body"] == {"_omitted": True, "_size_exceeds": 1_000}
+    assert requests[2]["response_body"] == {"_omitted": True, "_size": 2_000}
+
+
+def test_records_are_dropped_and_counted_while_the_queue_is_full(tmp_path):
+    logger = StreamingRequestLogger(str(tmp_path / "log.ndjson"), max_queue_size=1)
+    release = threading.Event()
+    writing = threading.Event()
+    write_line = logger._write_line
+
+    def blocking_write_line(record):
+        writing.set()
+        release.wait(5)
+        write_line(record)
+
+    logger._write_line = blocking_write_line
+    _log(logger, {"n": 1})  # taken by the writer, which blocks
+    assert writing.wait(5)
+    _log(logger, {"n": 2})  # fills the queue
+    _log(logger, {"n": 3})  # dropped
+    release.set()
+    logger._write_line = write_line
+    logger.close()
+
+    lines = _lines(tmp_path / "log.ndjson")
+    assert [line["response_body"] for line in lines if line["type"] == "request"] == [{"n": 1}, {"n": 2}]
+    assert lines[-1]["type"] == "session_end"
+    assert lines[-1]["records_dropped"] == 1
+    assert lines[-1]["records_written"] == 2
+
+
+def test_file_is_rotated_and_backups_are_bounded(tmp_path):
+    path = tmp_path / "log.ndjson"
+    logger = StreamingRequestLogger(str(path), max_file_bytes=2_000, backup_count=2)
+    for i in range(40):
+        _log(logger, {"i": i, "pad": "p" * 100})
+    logger.close()
+
+    files = [path, tmp_path / "log.ndjson.1", tmp_path / "log.ndjson.2"]
+    assert logger.rotations > 2
+    assert all(f.exists() for f in files)
+    assert not (tmp_path / "log.ndjson.3").exists()
+    for f in files:
+        assert f.stat().st_size <= 2_000
+        assert _lines(f)[0]["type"] == "session"
+    # The newest records survive rotation, in order
+    written = [line["response_body"]["i"] for f in reversed(files) for line in _lines(f) if line["type"] == "request"]
+    assert written == list(range(40 - len(written), 40))
@@ -0,0 +1,101 @@
+"""Tests for TokenManager refresh and background renewal."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from airbyte_agent_sdk.connectors.stripe.connector_model import StripeConnectorModel
+from airbyte_agent_sdk.executor import LocalExecutor
+from airbyte_agent_sdk.http import AuthenticationError
+from airbyte_agent_sdk.token_manager import TokenGrant, TokenManager
+
+
+def _counting_fetch(expires_in: float | None, delay: float = 0.0):
+    grants: list[str] = []
+
+    async def fetch() -> TokenGrant:
+        await asyncio.sleep(delay)
+        grants.append(f"token-{len(grants) + 1}")
+        return TokenGrant(grants[-1], expires_in=expires_in)
+
+    return fetch, grants
+
+
+@pytest.mark.asyncio
+async def test_background_renewal_is_not_cancelled_by_its_own_refresh():
+    fetch, grants = _counting_fetch(expires_in=0.3, delay=0.02)
+    manager = TokenManager(fetch, renew_before=0.25, expiry_margin=0.0)
+    try:
+        await manager.get()
+        first_renewal = manager._renewal
+        await asyncio.sleep(0.1)
+
+        assert grants == ["token-1", "token-2"]
+        assert first_renewal.done() and not first_renewal.cancelled()
+        assert manager._renewal is not None and manager._renewal is not first_renewal
+    finally:
+        await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_renewal_stops_once_the_token_goes_unused():
+    fetch, grants = _counting_fetch(expires_in=0.1)
+    manager = TokenManager(fetch, renew_before=0.08, expiry_margin=0.0, idle_timeout=0.1)
+    try:
+        await manager.get()
+        await asyncio.sleep(0.4)
+        renewed = len(grants)
+        await asyncio.sleep(0.2)
+
+        assert 1 < renewed < 10
+        assert len(grants) == renewed
+        assert manager._renewal is None
+
+        # The next get() after expiry refreshes on demand
+        assert await manager.get() == f"token-{renewed + 1}"
+    finally:
+        await manager.aclose()
+
+
+def test_manager_survives_its_event_loop_closing():
+    fetch, grants = _counting_fetch(expires_in=3600)
+    manager = TokenManager(fetch)
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(manager.get())
+    loop.close()
+
+    async def refresh_on_new_loop():
+        try:
+            return await manager.refresh()
+        finally:
+            await manager.aclose()
+
+    assert asyncio.run(refresh_on_new_loop()) == "token-2"
+
+
+@pytest.mark.asyncio
+async def test_auth_error_is_retried_once_after_a_refresh():
+    requests: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.headers["Authorization"])
+        return httpx.Response(401, json={"error": "invalid token"})
+
+    executor = LocalExecutor(model=StripeConnectorModel, secrets={"api_key": "sk_test"})
+    http_client = executor.http_client
+    http_client.client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    refreshes = []
+
+    async def handle_auth_error(error, *args, **kwargs):
+        refreshes.append(error)
+        return await http_client._request_with_retries("GET", "/v1/customers", _auth_retry_attempted=True)
+
+    http_client._handle_auth_error = handle_auth_error
+
+    with pytest.raises(AuthenticationError):
+        await http_client.request("GET", "/v1/customers")
+
+    assert len(refreshes) == 1
+    assert len(requests) == 2